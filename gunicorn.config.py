@@ -113,6 +113,17 @@ def on_starting(server):
 
 def when_ready(server):
     server.log.info("Server is ready. Spawning workers")
+    try:
+        from mcpgateway.config import settings
+    except ImportError:
+        return
+    # Without Redis or a shared bucket file, every worker keeps its own tool rate limit buckets
+    if settings.tool_rate_limit_enabled and settings.cache_type != "redis" and not settings.tool_rate_limit_shared_file and server.cfg.workers > 1:
+        server.log.warning(
+            "TOOL_RATE_LIMIT_ENABLED without CACHE_TYPE=redis or TOOL_RATE_LIMIT_SHARED_FILE: limits apply per worker, so %s workers allow up to %sx the configured rate",
+            server.cfg.workers,
+            server.cfg.workers,
+        )
 
 
 def post_fork(server, worker):
@@ -63,6 +63,8 @@ from mcpgateway import version as version_module
 from mcpgateway.auth import get_current_user, get_user_team_roles
 from mcpgateway.cache.a2a_stats_cache import a2a_stats_cache
 from mcpgateway.cache.global_config_cache import global_config_cache
+from mcpgateway.cache.permission_cache import permission_cache
+from mcpgateway.cache.resource_cache import resource_cache
 from mcpgateway.common.models import LogLevel
 from mcpgateway.common.validators import SecurityValidator
 from mcpgateway.config import settings, UI_HIDABLE_HEADER_ITEMS, UI_HIDABLE_SECTIONS, UI_HIDE_SECTION_ALIASES
@@ -149,9 +151,10 @@ from mcpgateway.utils.orjson_response import ORJSONResponse
 from mcpgateway.utils.pagination import paginate_query
 from mcpgateway.utils.passthrough_headers import PassthroughHeadersError
 from mcpgateway.utils.retry_manager import ResilientHttpClient
+from mcpgateway.utils.search_index import search_match
 from mcpgateway.utils.security_cookies import clear_auth_cookie, CookieTooLargeError, set_auth_cookie
 from mcpgateway.utils.services_auth import decode_auth
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr
 from mcpgateway.utils.validate_signature import sign_data
 from mcpgateway.utils.verify_credentials import verify_jwt_token_cached
 
@@ -999,6 +1002,40 @@ def _like_contains(column, value: str):
     return column.like("%" + _escape_like(value) + "%", escape="\\")
 
 
+def _apply_entity_search(query, db: Session, model, search_query: str, like_conditions: list, prefix_columns: list, name_column):
+    """Filter and order an admin search query by relevance to *search_query*.
+
+    Uses the full-text index (see :mod:`mcpgateway.utils.search_index`) when
+    the database has one for ``model``: rows matching every search term as a
+    prefix, plus an exact ID match, ranked by bm25/``ts_rank``. Otherwise falls
+    back to the caller's ``LIKE`` conditions, ordering names that start with
+    the query first.
+
+    Args:
+        query: SELECT over ``model`` with access and tag filters applied.
+        db: Database session.
+        model: ORM model being searched.
+        search_query: Normalized (lowercased, stripped) search string.
+        like_conditions: ``LIKE`` fallback conditions, OR-ed together.
+        prefix_columns: Lowercased name expressions ranked first on a prefix match (fallback only).
+        name_column: Lowercased name expression used as the final tie-breaker.
+
+    Returns:
+        The filtered and ordered query.
+    """
+    if not search_query:
+        return query.order_by(name_column)
+
+    match = search_match(db, model.__tablename__, search_query)
+    if match is not None:
+        id_match = func.lower(model.id) == search_query
+        query = query.outerjoin(match, match.c.id == model.id).where(or_(match.c.id.is_not(None), id_match))
+        return query.order_by(case((id_match, 0), else_=1), coalesce(match.c.rank, 0.0), name_column)
+
+    query = query.where(or_(*like_conditions))
+    return query.order_by(case(*((column.startswith(search_query), 1) for column in prefix_columns), else_=2), name_column)
+
+
 async def _get_user_team_ids(user: dict, db: Session) -> list:
     """Return team IDs for the authenticated user.
 
@@ -1223,12 +1260,11 @@ def _parse_tag_filter_groups(tags: Optional[str]) -> list[list[str]]:
     return groups
 
 
-def _apply_tag_filter_groups(query: Any, db: Session, column: Any, tag_groups: list[list[str]]) -> Any:
+def _apply_tag_filter_groups(query: Any, column: Any, tag_groups: list[list[str]]) -> Any:
     """Apply parsed tag filter groups to a SQLAlchemy query.
 
     Args:
         query (Any): SQLAlchemy ``select`` query to update.
-        db (Session): Database session.
         column (Any): SQLAlchemy model column containing tags.
         tag_groups (list[list[str]]): Parsed OR-of-AND tag groups.
 
@@ -1242,7 +1278,7 @@ def _apply_tag_filter_groups(query: Any, db: Session, column: Any, tag_groups: l
     for group in tag_groups:
         # Single term group => OR semantics (term exists)
         # Multi-term group => AND semantics (all terms exist)
-        group_exprs.append(json_contains_tag_expr(db, column, group, match_any=len(group) == 1))
+        group_exprs.append(entity_tag_expr(column, group, match_any=len(group) == 1))
 
     if len(group_exprs) == 1:
         return query.where(group_exprs[0])
@@ -1677,6 +1713,148 @@ async def get_a2a_stats_cache_stats(
     return a2a_stats_cache.stats()
 
 
+# ===================================
+# Permission Decision Cache Endpoints
+# ===================================
+
+
+@admin_router.post("/cache/permissions/invalidate")
+@require_permission("admin.system_config", allow_admin_bypass=False)
+@rate_limit(requests_per_minute=10)
+async def invalidate_permission_cache(
+    _user=Depends(get_current_user_with_permissions),
+    _db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Invalidate all cached RBAC permission decisions.
+
+    Role changes made through the API invalidate affected decisions
+    automatically. Use this after editing roles or assignments directly in
+    the database, or when changes must propagate immediately.
+
+    Args:
+        _user: Authenticated user
+        _db: Database session for permission checks.
+
+    Returns:
+        Dict with invalidation status and cache statistics
+
+    Examples:
+        >>> from mcpgateway.admin import invalidate_permission_cache
+        >>> invalidate_permission_cache.__name__
+        'invalidate_permission_cache'
+        >>> import inspect
+        >>> inspect.iscoroutinefunction(invalidate_permission_cache)
+        True
+    """
+    await permission_cache.invalidate_all()
+    stats = permission_cache.stats()
+    return {
+        "status": "invalidated",
+        "message": "Permission decision cache invalidated successfully",
+        "cache_stats": stats,
+    }
+
+
+@admin_router.get("/cache/permissions/stats")
+@require_permission("admin.system_config", allow_admin_bypass=False)
+@rate_limit(requests_per_minute=30)
+async def get_permission_cache_stats(
+    _user=Depends(get_current_user_with_permissions),
+    _db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Get permission decision cache statistics.
+
+    Returns L1/L2 hit/miss counts, hit rates, size, evictions and TTL.
+
+    Args:
+        _user: Authenticated user
+        _db: Database session for permission checks.
+
+    Returns:
+        Dict with cache statistics
+
+    Examples:
+        >>> from mcpgateway.admin import get_permission_cache_stats
+        >>> get_permission_cache_stats.__name__
+        'get_permission_cache_stats'
+        >>> import inspect
+        >>> inspect.iscoroutinefunction(get_permission_cache_stats)
+        True
+    """
+    return permission_cache.stats()
+
+
+# ===================================
+# Resource Content Cache Endpoints
+# ===================================
+
+
+@admin_router.post("/cache/resources/invalidate")
+@require_permission("admin.system_config", allow_admin_bypass=False)
+@rate_limit(requests_per_minute=10)
+async def invalidate_resource_content_cache(
+    _user=Depends(get_current_user_with_permissions),
+    _db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Invalidate all cached upstream resource content.
+
+    Upstream notifications, gateway refreshes and resource updates
+    invalidate affected entries automatically. Use this when an upstream
+    server changed content without notifying the gateway.
+
+    Args:
+        _user: Authenticated user
+        _db: Database session for permission checks.
+
+    Returns:
+        Dict with invalidation status and cache statistics
+
+    Examples:
+        >>> from mcpgateway.admin import invalidate_resource_content_cache
+        >>> invalidate_resource_content_cache.__name__
+        'invalidate_resource_content_cache'
+        >>> import inspect
+        >>> inspect.iscoroutinefunction(invalidate_resource_content_cache)
+        True
+    """
+    await resource_cache.invalidate_shared()
+    stats = resource_cache.stats()
+    return {
+        "status": "invalidated",
+        "message": "Resource content cache invalidated successfully",
+        "cache_stats": stats,
+    }
+
+
+@admin_router.get("/cache/resources/stats")
+@require_permission("admin.system_config", allow_admin_bypass=False)
+@rate_limit(requests_per_minute=30)
+async def get_resource_content_cache_stats(
+    _user=Depends(get_current_user_with_permissions),
+    _db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Get resource content cache statistics for this worker.
+
+    Returns hit/miss counts, hit rate, entry count, bytes used, evictions and limits.
+
+    Args:
+        _user: Authenticated user
+        _db: Database session for permission checks.
+
+    Returns:
+        Dict with cache statistics
+
+    Examples:
+        >>> from mcpgateway.admin import get_resource_content_cache_stats
+        >>> get_resource_content_cache_stats.__name__
+        'get_resource_content_cache_stats'
+        >>> import inspect
+        >>> inspect.iscoroutinefunction(get_resource_content_cache_stats)
+        True
+    """
+    return {"enabled": settings.resource_cache_enabled, **resource_cache.stats()}
+
+
 @admin_router.get("/mcp-pool/metrics")
 @require_permission("admin.system_config", allow_admin_bypass=False)
 @rate_limit(requests_per_minute=60)
@@ -1849,8 +2027,10 @@ async def get_configuration_settings(
             "tool_timeout": settings.tool_timeout,
             "tool_rate_limit": settings.tool_rate_limit,
             "tool_concurrent_limit": settings.tool_concurrent_limit,
+            "resource_cache_enabled": settings.resource_cache_enabled,
             "resource_cache_size": settings.resource_cache_size,
             "resource_cache_ttl": settings.resource_cache_ttl,
+            "resource_cache_max_bytes": settings.resource_cache_max_bytes,
             "max_resource_size": settings.max_resource_size,
         },
         "CORS Settings": {
@@ -2041,7 +2221,7 @@ async def admin_servers_partial_html(
             )
         )
 
-    query = _apply_tag_filter_groups(query, db, DbServer.tags, tag_groups)
+    query = _apply_tag_filter_groups(query, DbServer.tags, tag_groups)
 
     # Apply pagination ordering for cursor support
     query = query.order_by(desc(DbServer.created_at), desc(DbServer.id))
@@ -7569,7 +7749,7 @@ async def admin_tools_partial_html(
             )
         )
 
-    query = _apply_tag_filter_groups(query, db, DbTool.tags, tag_groups)
+    query = _apply_tag_filter_groups(query, DbTool.tags, tag_groups)
 
     # Apply sorting: alphabetical by URL, then name, then ID (for UI display)
     # Different from JSON endpoint which uses created_at DESC
@@ -7973,34 +8153,26 @@ async def admin_search_tools(
             access_conditions.append(and_(DbTool.team_id.in_(team_ids), DbTool.visibility.in_(["team", "public"])))
         query = query.where(or_(*access_conditions))
 
-    # Add search conditions - search in display fields and description
+    query = _apply_tag_filter_groups(query, DbTool.tags, tag_groups)
+
+    # Search display fields and description, ranked by relevance
     # Using the same priority as display: displayName -> customName -> original_name
-    if search_query:
-        search_conditions = [
+    query = _apply_entity_search(
+        query,
+        db,
+        DbTool,
+        search_query,
+        like_conditions=[
             _like_contains(func.lower(DbTool.id), search_query),
             _like_contains(func.lower(DbTool.original_name), search_query),
             _like_contains(func.lower(coalesce(DbTool.display_name, "")), search_query),
             _like_contains(func.lower(coalesce(DbTool.custom_name, "")), search_query),
             _like_contains(func.lower(coalesce(DbTool.description, "")), search_query),
             _like_contains(func.lower(coalesce(DbTool.url, "")), search_query),
-        ]
-        query = query.where(or_(*search_conditions))
-
-    query = _apply_tag_filter_groups(query, db, DbTool.tags, tag_groups)
-
-    # Order by relevance - prioritize matches at start of names
-    if search_query:
-        query = query.order_by(
-            case(
-                (func.lower(DbTool.original_name).startswith(search_query), 1),
-                (func.lower(coalesce(DbTool.custom_name, "")).startswith(search_query), 1),
-                (func.lower(coalesce(DbTool.display_name, "")).startswith(search_query), 1),
-                else_=2,
-            ),
-            func.lower(DbTool.original_name),
-        )
-    else:
-        query = query.order_by(func.lower(DbTool.original_name))
+        ],
+        prefix_columns=[func.lower(DbTool.original_name), func.lower(coalesce(DbTool.custom_name, "")), func.lower(coalesce(DbTool.display_name, ""))],
+        name_column=func.lower(DbTool.original_name),
+    )
     query = query.limit(limit)
 
     # Execute query
@@ -8129,7 +8301,7 @@ async def admin_prompts_partial_html(
             )
         )
 
-    query = _apply_tag_filter_groups(query, db, DbPrompt.tags, tag_groups)
+    query = _apply_tag_filter_groups(query, DbPrompt.tags, tag_groups)
 
     # Apply pagination ordering for cursor support
     query = query.order_by(desc(DbPrompt.created_at), desc(DbPrompt.id))
@@ -8337,7 +8509,7 @@ async def admin_gateways_partial_html(
             )
         )
 
-    query = _apply_tag_filter_groups(query, db, DbGateway.tags, tag_groups)
+    query = _apply_tag_filter_groups(query, DbGateway.tags, tag_groups)
 
     # Apply pagination ordering for cursor support
     query = query.order_by(desc(DbGateway.created_at), desc(DbGateway.id))
@@ -8561,28 +8733,22 @@ async def admin_search_gateways(
             access_conditions.append(and_(DbGateway.team_id.in_(team_ids), DbGateway.visibility.in_(["team", "public"])))
         query = query.where(or_(*access_conditions))
 
-    if search_query:
-        search_conditions = [
+    query = _apply_tag_filter_groups(query, DbGateway.tags, tag_groups)
+
+    query = _apply_entity_search(
+        query,
+        db,
+        DbGateway,
+        search_query,
+        like_conditions=[
             _like_contains(func.lower(DbGateway.id), search_query),
             _like_contains(func.lower(DbGateway.name), search_query),
             _like_contains(func.lower(coalesce(DbGateway.url, "")), search_query),
             _like_contains(func.lower(coalesce(DbGateway.description, "")), search_query),
-        ]
-        query = query.where(or_(*search_conditions))
-
-    query = _apply_tag_filter_groups(query, db, DbGateway.tags, tag_groups)
-
-    if search_query:
-        query = query.order_by(
-            case(
-                (func.lower(DbGateway.name).startswith(search_query), 1),
-                (func.lower(coalesce(DbGateway.url, "")).startswith(search_query), 1),
-                else_=2,
-            ),
-            func.lower(DbGateway.name),
-        )
-    else:
-        query = query.order_by(func.lower(DbGateway.name))
+        ],
+        prefix_columns=[func.lower(DbGateway.name), func.lower(coalesce(DbGateway.url, ""))],
+        name_column=func.lower(DbGateway.name),
+    )
     query = query.limit(limit)
 
     results = db.execute(query).all()
@@ -8733,26 +8899,21 @@ async def admin_search_servers(
         access_conditions.append(DbServer.visibility == "public")
         query = query.where(or_(*access_conditions))
 
-    if search_query:
-        search_conditions = [
+    query = _apply_tag_filter_groups(query, DbServer.tags, tag_groups)
+
+    query = _apply_entity_search(
+        query,
+        db,
+        DbServer,
+        search_query,
+        like_conditions=[
             _like_contains(func.lower(DbServer.id), search_query),
             _like_contains(func.lower(DbServer.name), search_query),
             _like_contains(func.lower(coalesce(DbServer.description, "")), search_query),
-        ]
-        query = query.where(or_(*search_conditions))
-
-    query = _apply_tag_filter_groups(query, db, DbServer.tags, tag_groups)
-
-    if search_query:
-        query = query.order_by(
-            case(
-                (func.lower(DbServer.name).startswith(search_query), 1),
-                else_=2,
-            ),
-            func.lower(DbServer.name),
-        )
-    else:
-        query = query.order_by(func.lower(DbServer.name))
+        ],
+        prefix_columns=[func.lower(DbServer.name)],
+        name_column=func.lower(DbServer.name),
+    )
     query = query.limit(limit)
 
     results = db.execute(query).all()
@@ -8887,7 +9048,7 @@ async def admin_resources_partial_html(
             )
         )
 
-    query = _apply_tag_filter_groups(query, db, DbResource.tags, tag_groups)
+    query = _apply_tag_filter_groups(query, DbResource.tags, tag_groups)
 
     # Add sorting for consistent pagination
     query = query.order_by(desc(DbResource.created_at), desc(DbResource.id))
@@ -9248,27 +9409,22 @@ async def admin_search_resources(
         access_conditions.append(DbResource.visibility == "public")
         query = query.where(or_(*access_conditions))
 
-    if search_query:
-        search_conditions = [
+    query = _apply_tag_filter_groups(query, DbResource.tags, tag_groups)
+
+    query = _apply_entity_search(
+        query,
+        db,
+        DbResource,
+        search_query,
+        like_conditions=[
             _like_contains(func.lower(DbResource.id), search_query),
             _like_contains(func.lower(DbResource.name), search_query),
             _like_contains(func.lower(coalesce(DbResource.uri, "")), search_query),
             _like_contains(func.lower(coalesce(DbResource.description, "")), search_query),
-        ]
-        query = query.where(or_(*search_conditions))
-
-    query = _apply_tag_filter_groups(query, db, DbResource.tags, tag_groups)
-
-    if search_query:
-        query = query.order_by(
-            case(
-                (func.lower(DbResource.name).startswith(search_query), 1),
-                else_=2,
-            ),
-            func.lower(DbResource.name),
-        )
-    else:
-        query = query.order_by(func.lower(DbResource.name))
+        ],
+        prefix_columns=[func.lower(DbResource.name)],
+        name_column=func.lower(DbResource.name),
+    )
     query = query.limit(limit)
 
     results = db.execute(query).all()
@@ -9368,28 +9524,22 @@ async def admin_search_prompts(
         access_conditions.append(DbPrompt.visibility == "public")
         query = query.where(or_(*access_conditions))
 
-    if search_query:
-        search_conditions = [
+    query = _apply_tag_filter_groups(query, DbPrompt.tags, tag_groups)
+
+    query = _apply_entity_search(
+        query,
+        db,
+        DbPrompt,
+        search_query,
+        like_conditions=[
             _like_contains(func.lower(DbPrompt.id), search_query),
             _like_contains(func.lower(DbPrompt.original_name), search_query),
             _like_contains(func.lower(coalesce(DbPrompt.display_name, "")), search_query),
             _like_contains(func.lower(coalesce(DbPrompt.description, "")), search_query),
-        ]
-        query = query.where(or_(*search_conditions))
-
-    query = _apply_tag_filter_groups(query, db, DbPrompt.tags, tag_groups)
-
-    if search_query:
-        query = query.order_by(
-            case(
-                (func.lower(DbPrompt.original_name).startswith(search_query), 1),
-                (func.lower(coalesce(DbPrompt.display_name, "")).startswith(search_query), 1),
-                else_=2,
-            ),
-            func.lower(DbPrompt.original_name),
-        )
-    else:
-        query = query.order_by(func.lower(DbPrompt.original_name))
+        ],
+        prefix_columns=[func.lower(DbPrompt.original_name), func.lower(coalesce(DbPrompt.display_name, ""))],
+        name_column=func.lower(DbPrompt.original_name),
+    )
     query = query.limit(limit)
 
     results = db.execute(query).all()
@@ -9756,7 +9906,7 @@ async def admin_a2a_partial_html(
             )
         )
 
-    query = _apply_tag_filter_groups(query, db, DbA2AAgent.tags, tag_groups)
+    query = _apply_tag_filter_groups(query, DbA2AAgent.tags, tag_groups)
 
     # Apply pagination ordering for cursor support
     query = query.order_by(desc(DbA2AAgent.created_at), desc(DbA2AAgent.id))
@@ -9997,28 +10147,22 @@ async def admin_search_a2a_agents(
             access_conditions.append(and_(DbA2AAgent.team_id.in_(team_ids), DbA2AAgent.visibility.in_(["team", "public"])))
         query = query.where(or_(*access_conditions))
 
-    if search_query:
-        search_conditions = [
+    query = _apply_tag_filter_groups(query, DbA2AAgent.tags, tag_groups)
+
+    query = _apply_entity_search(
+        query,
+        db,
+        DbA2AAgent,
+        search_query,
+        like_conditions=[
             _like_contains(func.lower(DbA2AAgent.id), search_query),
             _like_contains(func.lower(DbA2AAgent.name), search_query),
             _like_contains(func.lower(coalesce(DbA2AAgent.endpoint_url, "")), search_query),
             _like_contains(func.lower(coalesce(DbA2AAgent.description, "")), search_query),
-        ]
-        query = query.where(or_(*search_conditions))
-
-    query = _apply_tag_filter_groups(query, db, DbA2AAgent.tags, tag_groups)
-
-    if search_query:
-        query = query.order_by(
-            case(
-                (func.lower(DbA2AAgent.name).startswith(search_query), 1),
-                (func.lower(coalesce(DbA2AAgent.endpoint_url, "")).startswith(search_query), 1),
-                else_=2,
-            ),
-            func.lower(DbA2AAgent.name),
-        )
-    else:
-        query = query.order_by(func.lower(DbA2AAgent.name))
+        ],
+        prefix_columns=[func.lower(DbA2AAgent.name), func.lower(coalesce(DbA2AAgent.endpoint_url, ""))],
+        name_column=func.lower(DbA2AAgent.name),
+    )
     query = query.limit(limit)
 
     results = db.execute(query).all()
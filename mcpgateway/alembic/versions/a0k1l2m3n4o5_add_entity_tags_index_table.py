@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Add entity_tags index table
+
+Revision ID: a0k1l2m3n4o5
+Revises: z9j0k1l2m3n4
+Create Date: 2026-03-16 10:00:00.000000
+
+Normalized (entity_type, entity_id, tag) index of the tags JSON columns of
+tools, resources, prompts, servers, gateways and A2A agents. Tag listings
+become a GROUP BY and tag filters an indexed lookup instead of scanning and
+parsing every tags column. Existing tags are backfilled.
+"""
+
+# Standard
+from typing import Any, Dict, List, Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a0k1l2m3n4o5"
+down_revision: Union[str, Sequence[str], None] = "z9j0k1l2m3n4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAGGED_TABLES = ("tools", "resources", "prompts", "servers", "gateways", "a2a_agents")
+BATCH_SIZE = 1000
+
+
+def _entity_tag_rows(entity_type: str, entity_id: str, tags: Any) -> List[Dict[str, str]]:
+    """Build the entity_tags rows of one entity (mirrors mcpgateway.db.tag_ids).
+
+    Args:
+        entity_type: Table name of the entity.
+        entity_id: Entity ID.
+        tags: Value of the entity's tags column (strings or {"id", "label"} dicts).
+
+    Returns:
+        List[Dict[str, str]]: Distinct rows to insert.
+    """
+    seen: List[str] = []
+    for tag in tags if isinstance(tags, list) else []:
+        tag_id = (tag.get("id") or tag.get("label")) if isinstance(tag, dict) else tag
+        if tag_id and isinstance(tag_id, str) and len(tag_id) <= 255 and tag_id not in seen:
+            seen.append(tag_id)
+    return [{"entity_type": entity_type, "entity_id": entity_id, "tag": tag} for tag in seen]
+
+
+def upgrade() -> None:
+    """Create the entity_tags table and backfill it from the tags columns."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "entity_tags" in inspector.get_table_names():
+        return
+
+    entity_tags = op.create_table(
+        "entity_tags",
+        sa.Column("entity_type", sa.String(32), primary_key=True),
+        sa.Column("entity_id", sa.String(36), primary_key=True),
+        sa.Column("tag", sa.String(255), primary_key=True),
+    )
+    op.create_index("idx_entity_tags_type_tag", "entity_tags", ["entity_type", "tag", "entity_id"])
+
+    existing_tables = set(inspector.get_table_names())
+    for entity_type in TAGGED_TABLES:
+        if entity_type not in existing_tables or "tags" not in {col["name"] for col in inspector.get_columns(entity_type)}:
+            continue
+        entities = sa.table(entity_type, sa.column("id", sa.String(36)), sa.column("tags", sa.JSON()))
+        rows: List[Dict[str, str]] = []
+        for entity_id, tags in bind.execute(sa.select(entities.c.id, entities.c.tags).where(entities.c.tags.isnot(None))).all():
+            rows.extend(_entity_tag_rows(entity_type, entity_id, tags))
+            if len(rows) >= BATCH_SIZE:
+                op.bulk_insert(entity_tags, rows)
+                rows = []
+        if rows:
+            op.bulk_insert(entity_tags, rows)
+
+
+def downgrade() -> None:
+    """Drop the entity_tags table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "entity_tags" not in inspector.get_table_names():
+        return
+
+    op.drop_index("idx_entity_tags_type_tag", table_name="entity_tags")
+    op.drop_table("entity_tags")
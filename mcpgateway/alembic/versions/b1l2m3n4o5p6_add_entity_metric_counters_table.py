@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Add entity_metric_counters table
+
+Revision ID: b1l2m3n4o5p6
+Revises: a0k1l2m3n4o5
+Create Date: 2026-03-23 10:00:00.000000
+
+Running per-entity metric counters (count, successes, min/max/sum of response
+times, last execution) for tools, resources, prompts, servers and A2A agents,
+so list views with include_metrics read one joined row per entity instead of
+aggregating the raw metrics tables. Counters are backfilled from the raw
+metrics plus the hourly rollups of the hours before each entity's oldest raw
+metric (raw rows of those hours may already have been deleted).
+"""
+
+# Standard
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b1l2m3n4o5p6"
+down_revision: Union[str, Sequence[str], None] = "a0k1l2m3n4o5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (entity_type, raw metrics table, hourly rollup table, entity id column)
+METRIC_SOURCES = (
+    ("tools", "tool_metrics", "tool_metrics_hourly", "tool_id"),
+    ("resources", "resource_metrics", "resource_metrics_hourly", "resource_id"),
+    ("prompts", "prompt_metrics", "prompt_metrics_hourly", "prompt_id"),
+    ("servers", "server_metrics", "server_metrics_hourly", "server_id"),
+    ("a2a_agents", "a2a_agent_metrics", "a2a_agent_metrics_hourly", "a2a_agent_id"),
+)
+BATCH_SIZE = 1000
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a timestamp to naive UTC so database values compare safely.
+
+    Args:
+        value: Timestamp as returned by the driver (naive or aware).
+
+    Returns:
+        Optional[datetime]: Naive UTC timestamp, or None.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _merge(counter: Dict[str, Any], count: int, success: int, min_rt: Optional[float], max_rt: Optional[float], sum_rt: float, last: Optional[datetime]) -> None:
+    """Add aggregated metrics to a counter row in place.
+
+    Args:
+        counter: Counter row being built.
+        count: Number of executions.
+        success: Number of successful executions.
+        min_rt: Minimum response time.
+        max_rt: Maximum response time.
+        sum_rt: Sum of response times.
+        last: Latest execution time.
+    """
+    counter["total_count"] += count
+    counter["success_count"] += success
+    counter["sum_response_time"] += sum_rt
+    if min_rt is not None and (counter["min_response_time"] is None or min_rt < counter["min_response_time"]):
+        counter["min_response_time"] = min_rt
+    if max_rt is not None and (counter["max_response_time"] is None or max_rt > counter["max_response_time"]):
+        counter["max_response_time"] = max_rt
+    if last is not None and (counter["last_execution_time"] is None or last > counter["last_execution_time"]):
+        counter["last_execution_time"] = last
+
+
+def _backfill_rows(bind: Any, existing_tables: set, entity_type: str, raw_name: str, hourly_name: str, id_col: str) -> List[Dict[str, Any]]:
+    """Compute the counter rows of one entity type from raw metrics and rollups.
+
+    Args:
+        bind: Migration connection.
+        existing_tables: Tables present in the database.
+        entity_type: Table name of the entities.
+        raw_name: Raw metrics table.
+        hourly_name: Hourly rollup table.
+        id_col: Entity id column of both metric tables.
+
+    Returns:
+        List[Dict[str, Any]]: entity_metric_counters rows.
+    """
+    counters: Dict[str, Dict[str, Any]] = {}
+    first_raw: Dict[str, datetime] = {}
+
+    def counter(entity_id: str) -> Dict[str, Any]:
+        """Get or create the counter row of an entity.
+
+        Args:
+            entity_id: Entity ID.
+
+        Returns:
+            Dict[str, Any]: Counter row.
+        """
+        if entity_id not in counters:
+            counters[entity_id] = {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "total_count": 0,
+                "success_count": 0,
+                "min_response_time": None,
+                "max_response_time": None,
+                "sum_response_time": 0.0,
+                "last_execution_time": None,
+            }
+        return counters[entity_id]
+
+    if raw_name in existing_tables:
+        raw = sa.table(raw_name, sa.column(id_col, sa.String(36)), sa.column("timestamp", sa.DateTime(timezone=True)), sa.column("response_time", sa.Float()), sa.column("is_success", sa.Boolean()))
+        entity_id = raw.c[id_col]
+        stmt = sa.select(
+            entity_id,
+            sa.func.count(),
+            sa.func.sum(sa.case((raw.c.is_success.is_(True), 1), else_=0)),
+            sa.func.min(raw.c.response_time),
+            sa.func.max(raw.c.response_time),
+            sa.func.sum(raw.c.response_time),
+            sa.func.max(raw.c.timestamp),
+            sa.func.min(raw.c.timestamp),
+        ).group_by(entity_id)
+        for eid, count, success, min_rt, max_rt, sum_rt, last, first in bind.execute(stmt):
+            if eid is None:
+                continue
+            _merge(counter(eid), count or 0, success or 0, min_rt, max_rt, sum_rt or 0.0, last)
+            if first is not None:
+                first_raw[eid] = _naive_utc(first)
+
+    if hourly_name in existing_tables:
+        hourly = sa.table(
+            hourly_name,
+            sa.column(id_col, sa.String(36)),
+            sa.column("hour_start", sa.DateTime(timezone=True)),
+            sa.column("total_count", sa.Integer()),
+            sa.column("success_count", sa.Integer()),
+            sa.column("min_response_time", sa.Float()),
+            sa.column("max_response_time", sa.Float()),
+            sa.column("avg_response_time", sa.Float()),
+        )
+        stmt = sa.select(
+            hourly.c[id_col], hourly.c.hour_start, hourly.c.total_count, hourly.c.success_count, hourly.c.min_response_time, hourly.c.max_response_time, hourly.c.avg_response_time
+        ).where(hourly.c[id_col].isnot(None))
+        for eid, hour_start, count, success, min_rt, max_rt, avg_rt in bind.execute(stmt):
+            # Only hours that end before the oldest raw metric: the raw rows already cover the rest
+            first = first_raw.get(eid)
+            if first is not None and _naive_utc(hour_start) + timedelta(hours=1) > first:
+                continue
+            _merge(counter(eid), count or 0, success or 0, min_rt, max_rt, (avg_rt or 0.0) * (count or 0), hour_start)
+
+    return [row for row in counters.values() if row["total_count"] > 0]
+
+
+def upgrade() -> None:
+    """Create the entity_metric_counters table and backfill it."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "entity_metric_counters" in inspector.get_table_names():
+        return
+
+    counters = op.create_table(
+        "entity_metric_counters",
+        sa.Column("entity_type", sa.String(32), primary_key=True),
+        sa.Column("entity_id", sa.String(36), primary_key=True),
+        sa.Column("total_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("success_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("min_response_time", sa.Float(), nullable=True),
+        sa.Column("max_response_time", sa.Float(), nullable=True),
+        sa.Column("sum_response_time", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("last_execution_time", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    existing_tables = set(inspector.get_table_names())
+    for entity_type, raw_name, hourly_name, id_col in METRIC_SOURCES:
+        rows = _backfill_rows(bind, existing_tables, entity_type, raw_name, hourly_name, id_col)
+        for start in range(0, len(rows), BATCH_SIZE):
+            op.bulk_insert(counters, rows[start : start + BATCH_SIZE])
+
+
+def downgrade() -> None:
+    """Drop the entity_metric_counters table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "entity_metric_counters" not in inspector.get_table_names():
+        return
+
+    op.drop_table("entity_metric_counters")
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Add full-text search index for tools, resources, prompts, servers and gateways
+
+Revision ID: y8i9j0k1l2m3
+Revises: x7h8i9j0k1l2
+Create Date: 2026-03-02 10:00:00.000000
+
+SQLite gets FTS5 tables maintained by triggers (backfilled from existing
+rows); PostgreSQL gets GIN indexes on weighted tsvector expressions. Other
+dialects are left unchanged and keep using LIKE search.
+"""
+
+# Standard
+from typing import Sequence, Union
+
+# Third-Party
+from alembic import op
+
+# First-Party
+from mcpgateway.utils.search_index import create_search_index, drop_search_index
+
+# revision identifiers, used by Alembic.
+revision: str = "y8i9j0k1l2m3"
+down_revision: Union[str, Sequence[str], None] = "x7h8i9j0k1l2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the search index objects for existing entity tables."""
+    bind = op.get_bind()
+    if bind.dialect.name not in ("sqlite", "postgresql"):
+        return
+
+    create_search_index(bind)
+
+
+def downgrade() -> None:
+    """Drop the search index objects."""
+    bind = op.get_bind()
+    if bind.dialect.name not in ("sqlite", "postgresql"):
+        return
+
+    drop_search_index(bind)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Add token_usage_rollups table
+
+Revision ID: z9j0k1l2m3n4
+Revises: y8i9j0k1l2m3
+Create Date: 2026-03-09 10:00:00.000000
+
+Per-minute API token usage counters written in batches by
+TokenUsageRollupService; usage statistics are computed from this table
+instead of scanning token_usage_logs. Existing token_usage_logs rows are
+aggregated into the new table so historical usage stays in the stats.
+"""
+
+# Standard
+import bisect
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "z9j0k1l2m3n4"
+down_revision: Union[str, Sequence[str], None] = "y8i9j0k1l2m3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LATENCY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 5000)
+LATENCY_BUCKET_COLUMNS = ("latency_le_10ms", "latency_le_50ms", "latency_le_100ms", "latency_le_250ms", "latency_le_500ms", "latency_le_1000ms", "latency_le_5000ms", "latency_gt_5000ms")
+COUNTER_COLUMNS = ("request_count", "status_2xx", "status_3xx", "status_4xx", "status_5xx", "blocked_count", "latency_count") + LATENCY_BUCKET_COLUMNS
+BATCH_SIZE = 1000
+
+
+def _minute_start(timestamp: datetime) -> datetime:
+    """Truncate a raw log timestamp to the start of its minute in UTC.
+
+    Args:
+        timestamp: Timestamp as returned by the driver (naive UTC or aware).
+
+    Returns:
+        datetime: Aware UTC start of the minute.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc).replace(second=0, microsecond=0)
+
+
+def _backfill_rows(bind: Any) -> List[Dict[str, Any]]:
+    """Aggregate existing token_usage_logs rows into per-minute rollup rows.
+
+    Counts the same way as TokenUsageRollupService.record: status classes for
+    2xx-5xx, latency only for positive response times.
+
+    Args:
+        bind: Migration connection.
+
+    Returns:
+        List[Dict[str, Any]]: token_usage_rollups rows.
+    """
+    logs = sa.table(
+        "token_usage_logs",
+        sa.column("token_jti", sa.String(36)),
+        sa.column("user_email", sa.String(255)),
+        sa.column("timestamp", sa.DateTime(timezone=True)),
+        sa.column("endpoint", sa.String(255)),
+        sa.column("status_code", sa.Integer()),
+        sa.column("response_time_ms", sa.Integer()),
+        sa.column("blocked", sa.Boolean()),
+    )
+    stmt = sa.select(logs.c.token_jti, logs.c.user_email, logs.c.timestamp, logs.c.endpoint, logs.c.status_code, logs.c.response_time_ms, logs.c.blocked)
+
+    rows: Dict[Tuple[str, str, str, datetime], Dict[str, Any]] = {}
+    for jti, email, timestamp, endpoint, status_code, response_time_ms, blocked in bind.execution_options(stream_results=True).execute(stmt):
+        if not jti or not email or timestamp is None:
+            continue
+        key = (jti, email, (endpoint or "")[:255], _minute_start(timestamp))
+        row = rows.get(key)
+        if row is None:
+            row = rows[key] = {
+                "token_jti": key[0],
+                "user_email": key[1],
+                "endpoint": key[2],
+                "minute_start": key[3],
+                **{column: 0 for column in COUNTER_COLUMNS},
+                "latency_sum_ms": 0,
+                "latency_max_ms": 0,
+            }
+        row["request_count"] += 1
+        if status_code and 200 <= status_code < 600:
+            row[f"status_{status_code // 100}xx"] += 1
+        if blocked:
+            row["blocked_count"] += 1
+        if response_time_ms and response_time_ms > 0:
+            row["latency_count"] += 1
+            row["latency_sum_ms"] += response_time_ms
+            row["latency_max_ms"] = max(row["latency_max_ms"], response_time_ms)
+            row[LATENCY_BUCKET_COLUMNS[bisect.bisect_left(LATENCY_BUCKETS_MS, response_time_ms)]] += 1
+    return list(rows.values())
+
+
+def upgrade() -> None:
+    """Create the token_usage_rollups table and backfill it from token_usage_logs."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "token_usage_rollups" in inspector.get_table_names():
+        return
+
+    rollups = op.create_table(
+        "token_usage_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("token_jti", sa.String(36), nullable=False),
+        sa.Column("user_email", sa.String(255), nullable=False),
+        sa.Column("endpoint", sa.String(255), nullable=False, server_default=""),
+        sa.Column("minute_start", sa.DateTime(timezone=True), nullable=False),
+        *[sa.Column(name, sa.Integer(), nullable=False, server_default="0") for name in COUNTER_COLUMNS],
+        sa.Column("latency_sum_ms", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("latency_max_ms", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("idx_token_usage_rollups_user_email_minute", "token_usage_rollups", ["user_email", "minute_start"])
+    op.create_index("idx_token_usage_rollups_token_jti_minute", "token_usage_rollups", ["token_jti", "minute_start"])
+
+    if "token_usage_logs" in inspector.get_table_names():
+        rows = _backfill_rows(bind)
+        for start in range(0, len(rows), BATCH_SIZE):
+            op.bulk_insert(rollups, rows[start : start + BATCH_SIZE])
+
+
+def downgrade() -> None:
+    """Drop the token_usage_rollups table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "token_usage_rollups" not in inspector.get_table_names():
+        return
+
+    op.drop_index("idx_token_usage_rollups_token_jti_minute", table_name="token_usage_rollups")
+    op.drop_index("idx_token_usage_rollups_user_email_minute", table_name="token_usage_rollups")
+    op.drop_table("token_usage_rollups")
@@ -27,7 +27,7 @@ from starlette.requests import Request
 
 # First-Party
 from mcpgateway.config import settings
-from mcpgateway.db import EmailUser, fresh_db_session, SessionLocal
+from mcpgateway.db import async_db_available, EmailUser, fresh_db_session, SessionLocal
 from mcpgateway.plugins.framework import get_plugin_manager, GlobalContext, HttpAuthResolveUserPayload, HttpHeaderPayload, HttpHookType, PluginViolationError
 from mcpgateway.utils.correlation_id import get_correlation_id
 from mcpgateway.utils.verify_credentials import verify_jwt_token_cached
@@ -726,18 +726,7 @@ def _get_auth_context_batched_sync(email: str, jti: Optional[str] = None) -> Dic
 
         if user:
             # Detach user data as dict (session will close)
-            result["user"] = {
-                "email": user.email,
-                "password_hash": user.password_hash,
-                "full_name": user.full_name,
-                "is_admin": user.is_admin,
-                "is_active": user.is_active,
-                "auth_provider": user.auth_provider,
-                "password_change_required": user.password_change_required,
-                "email_verified_at": user.email_verified_at,
-                "created_at": user.created_at,
-                "updated_at": user.updated_at,
-            }
+            result["user"] = _user_to_auth_dict(user)
 
             # Query 2: Get personal team (only if user exists)
             team_result = db.execute(
@@ -769,6 +758,88 @@ def _get_auth_context_batched_sync(email: str, jti: Optional[str] = None) -> Dic
         return result
 
 
+async def _get_auth_context_batched_async(email: str, jti: Optional[str] = None) -> Dict[str, Any]:
+    """Async variant of _get_auth_context_batched_sync running on the async engine.
+
+    Used instead of the thread-pool offload when DB_ASYNC_ENABLED is set, so the
+    lookup neither blocks the event loop nor occupies a worker thread.
+
+    Args:
+        email: User email address
+        jti: JWT ID for revocation check (optional)
+
+    Returns:
+        Dict with the same keys as _get_auth_context_batched_sync.
+    """
+    # Third-Party
+    from sqlalchemy import select  # pylint: disable=import-outside-toplevel
+
+    # First-Party
+    from mcpgateway.db import EmailTeam, EmailTeamMember, fresh_async_db_session, TokenRevocation  # pylint: disable=import-outside-toplevel
+
+    result: Dict[str, Any] = {
+        "user": None,
+        "personal_team_id": None,
+        "is_token_revoked": False,  # nosec B105 - boolean flag, not a password
+        "team_ids": [],
+    }
+
+    async with fresh_async_db_session() as db:
+        user = (await db.execute(select(EmailUser).where(EmailUser.email == email))).scalar_one_or_none()
+
+        if user:
+            result["user"] = _user_to_auth_dict(user)
+
+            personal_team_id = (
+                await db.execute(
+                    select(EmailTeam.id)
+                    .join(EmailTeamMember)
+                    .where(
+                        EmailTeamMember.user_email == email,
+                        EmailTeam.is_personal.is_(True),
+                    )
+                )
+            ).scalar_one_or_none()
+            result["personal_team_id"] = personal_team_id
+
+            team_ids_result = await db.execute(
+                select(EmailTeamMember.team_id).where(
+                    EmailTeamMember.user_email == email,
+                    EmailTeamMember.is_active.is_(True),
+                )
+            )
+            result["team_ids"] = [row[0] for row in team_ids_result.all()]
+
+        if jti:
+            revoked = (await db.execute(select(TokenRevocation.jti).where(TokenRevocation.jti == jti))).scalar_one_or_none()
+            result["is_token_revoked"] = revoked is not None
+
+    return result
+
+
+def _user_to_auth_dict(user: EmailUser) -> Dict[str, Any]:
+    """Detach the user fields needed for auth context into a plain dict.
+
+    Args:
+        user: EmailUser ORM instance
+
+    Returns:
+        Dict with the cached user fields (see _user_from_cached_dict)
+    """
+    return {
+        "email": user.email,
+        "password_hash": user.password_hash,
+        "full_name": user.full_name,
+        "is_admin": user.is_admin,
+        "is_active": user.is_active,
+        "auth_provider": user.auth_provider,
+        "password_change_required": user.password_change_required,
+        "email_verified_at": user.email_verified_at,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
+
+
 def _user_from_cached_dict(user_dict: Dict[str, Any]) -> EmailUser:
     """Create EmailUser instance from cached dict.
 
@@ -1102,7 +1173,10 @@ async def get_current_user(
         # === BATCHED QUERIES: Single DB call for user + team + revocation ===
         if settings.auth_cache_batch_queries:
             try:
-                auth_ctx = await asyncio.to_thread(_get_auth_context_batched_sync, email, jti)
+                if async_db_available():
+                    auth_ctx = await _get_auth_context_batched_async(email, jti)
+                else:
+                    auth_ctx = await asyncio.to_thread(_get_auth_context_batched_sync, email, jti)
 
                 # Check revocation
                 if auth_ctx.get("is_token_revoked"):
@@ -51,6 +51,7 @@ from sqlalchemy.orm import Session
 from mcpgateway.config import settings
 from mcpgateway.db import A2AAgent, Base, EmailTeam, EmailUser, Gateway, Prompt, Resource, Server, Tool
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.utils.search_index import create_search_index
 
 # Migration lock to prevent concurrent migrations from multiple workers
 _MIGRATION_LOCK_PATH = os.path.join(tempfile.gettempdir(), "mcpgateway_migration.lock")
@@ -592,6 +593,8 @@ async def main() -> None:
                         logger.info("Applied MariaDB compatibility modifications")
 
                     Base.metadata.create_all(bind=conn)
+                    # Full-text search objects are raw DDL, not part of the ORM metadata
+                    create_search_index(conn)
                     command.stamp(cfg, "head")
                 else:
                     versions: list[str] = []
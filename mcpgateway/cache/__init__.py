@@ -12,6 +12,9 @@ Provides caching components for the MCP Gateway including:
 - Auth caching for user, team, and token revocation data
 - Registry caching for tools, prompts, resources, agents, servers, gateways
 - Admin stats caching for dashboard statistics
+- Permission decision caching for RBAC checks
+- Verified JWT payload caching
+- Tool result caching for read-only and idempotent tools
 
 Note: Imports are lazy to avoid circular dependencies with services.
 """
@@ -28,12 +31,18 @@ __all__ = [
     "CachedAuthContext",
     "GlobalConfigCache",
     "global_config_cache",
+    "JWTVerifyCache",
+    "jwt_verify_cache",
     "MetricsCache",
     "metrics_cache",
+    "PermissionDecisionCache",
+    "permission_cache",
     "RegistryCache",
     "registry_cache",
     "ToolLookupCache",
     "tool_lookup_cache",
+    "ToolResultCache",
+    "tool_result_cache",
     "ResourceCache",
     "SessionRegistry",
 ]
@@ -47,9 +56,12 @@ if TYPE_CHECKING:
     from mcpgateway.cache.admin_stats_cache import AdminStatsCache, admin_stats_cache
     from mcpgateway.cache.auth_cache import AuthCache, auth_cache, CachedAuthContext
     from mcpgateway.cache.global_config_cache import GlobalConfigCache, global_config_cache
+    from mcpgateway.cache.jwt_verify_cache import JWTVerifyCache, jwt_verify_cache
     from mcpgateway.cache.metrics_cache import MetricsCache, metrics_cache
+    from mcpgateway.cache.permission_cache import PermissionDecisionCache, permission_cache
     from mcpgateway.cache.registry_cache import RegistryCache, registry_cache
     from mcpgateway.cache.tool_lookup_cache import ToolLookupCache, tool_lookup_cache
+    from mcpgateway.cache.tool_result_cache import ToolResultCache, tool_result_cache
     from mcpgateway.cache.resource_cache import ResourceCache
     from mcpgateway.cache.session_registry import SessionRegistry
 
@@ -87,10 +99,18 @@ def __getattr__(name: str):
         from mcpgateway.cache.global_config_cache import GlobalConfigCache, global_config_cache
 
         return global_config_cache if name == "global_config_cache" else GlobalConfigCache
+    if name in ("JWTVerifyCache", "jwt_verify_cache"):
+        from mcpgateway.cache.jwt_verify_cache import JWTVerifyCache, jwt_verify_cache
+
+        return jwt_verify_cache if name == "jwt_verify_cache" else JWTVerifyCache
     if name in ("MetricsCache", "metrics_cache"):
         from mcpgateway.cache.metrics_cache import MetricsCache, metrics_cache
 
         return metrics_cache if name == "metrics_cache" else MetricsCache
+    if name in ("PermissionDecisionCache", "permission_cache"):
+        from mcpgateway.cache.permission_cache import PermissionDecisionCache, permission_cache
+
+        return permission_cache if name == "permission_cache" else PermissionDecisionCache
     if name in ("RegistryCache", "registry_cache"):
         from mcpgateway.cache.registry_cache import RegistryCache, registry_cache
 
@@ -99,6 +119,10 @@ def __getattr__(name: str):
         from mcpgateway.cache.tool_lookup_cache import ToolLookupCache, tool_lookup_cache
 
         return tool_lookup_cache if name == "tool_lookup_cache" else ToolLookupCache
+    if name in ("ToolResultCache", "tool_result_cache"):
+        from mcpgateway.cache.tool_result_cache import ToolResultCache, tool_result_cache
+
+        return tool_result_cache if name == "tool_result_cache" else ToolResultCache
     if name == "ResourceCache":
         from mcpgateway.cache.resource_cache import ResourceCache
 
@@ -36,6 +36,10 @@ import threading
 import time
 from typing import Any, Dict, List, Optional, Set
 
+# First-Party
+from mcpgateway.cache.jwt_verify_cache import jwt_verify_cache
+from mcpgateway.cache.permission_cache import permission_cache
+
 logger = logging.getLogger(__name__)
 
 # Sentinel value to represent "user is not a member" in Redis cache
@@ -420,6 +424,9 @@ class AuthCache:
             except Exception as e:
                 logger.warning(f"AuthCache Redis invalidate_user failed: {e}")
 
+        # Admin flag changes alter permission decisions
+        await permission_cache.invalidate_user(email)
+
     async def invalidate_revocation(self, jti: str) -> None:
         """Invalidate cache for a revoked token.
 
@@ -445,6 +452,9 @@ class AuthCache:
             for key in keys_to_remove:
                 self._context_cache.pop(key, None)
 
+        # Drop verified payloads so the token is not reused from the JWT cache
+        jwt_verify_cache.evict_jti(jti)
+
         # Update Redis
         redis = await self._get_redis_client()
         if redis:
@@ -635,6 +645,8 @@ class AuthCache:
             except Exception as e:
                 logger.warning(f"AuthCache Redis invalidate_user_role failed: {e}")
 
+        await permission_cache.invalidate_user(email)
+
     async def invalidate_team_roles(self, team_id: str) -> None:
         """Invalidate all cached roles for a team.
 
@@ -669,6 +681,8 @@ class AuthCache:
             except Exception as e:
                 logger.warning(f"AuthCache Redis invalidate_team_roles failed: {e}")
 
+        await permission_cache.invalidate_team(team_id)
+
     async def get_user_teams(self, cache_key: str) -> Optional[List[str]]:
         """Get cached team IDs for a user.
 
@@ -1004,6 +1018,9 @@ class AuthCache:
             except Exception as e:
                 logger.warning(f"AuthCache Redis invalidate_team_membership failed: {e}")
 
+        # Team fallback permissions (teams.*) depend on membership
+        await permission_cache.invalidate_user(user_email)
+
     async def is_token_revoked(self, jti: str) -> Optional[bool]:
         """Check if a token is revoked (cached check only).
 
@@ -1027,11 +1044,14 @@ class AuthCache:
 
         # Fast local check
         if jti in self._revoked_jtis:
+            jwt_verify_cache.evict_jti(jti)
             return True
 
         # Check L1 in-memory revocation cache
         entry = self._revocation_cache.get(jti)
         if entry and not entry.is_expired():
+            if entry.value:
+                jwt_verify_cache.evict_jti(jti)
             return entry.value
 
         # Check L2 Redis
@@ -1048,6 +1068,7 @@ class AuthCache:
                             value=True,
                             expiry=time.time() + self._revocation_ttl,
                         )
+                    jwt_verify_cache.evict_jti(jti)
                     return True
 
                 # Check individual revocation key
@@ -1059,6 +1080,7 @@ class AuthCache:
                             value=True,
                             expiry=time.time() + self._revocation_ttl,
                         )
+                    jwt_verify_cache.evict_jti(jti)
                     return True
             except Exception as e:
                 logger.warning(f"AuthCache Redis is_token_revoked failed: {e}")
@@ -1100,6 +1122,8 @@ class AuthCache:
 
             with self._lock:
                 self._revoked_jtis.update(jtis)
+            for jti in jtis:
+                jwt_verify_cache.evict_jti(jti)
 
             # Also sync to Redis
             redis = await self._get_redis_client()
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Verified JWT payload cache.
+
+``verify_jwt_token_cached`` only memoizes on ``request.state``, so every
+request pays for a full signature verification. That is cheap for HS256 but
+costs a public-key operation for RS256/ES256. This per-worker cache keeps the
+decoded payload of tokens that already passed verification, keyed by a
+SHA-256 digest of the token (the raw token is never stored as a key).
+
+Security Considerations:
+    - An entry never outlives the token's ``exp`` claim
+    - Revoked JTIs are evicted as soon as ``AuthCache`` learns about them
+    - The cache is cleared with ``clear_jwt_caches()`` when JWT settings change
+    - Only successful verifications are cached; failures always re-verify
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Verified payload with expiry timestamp."""
+
+    value: Dict[str, Any]
+    expiry: float
+
+    def is_expired(self) -> bool:
+        """Return True if the cache entry has expired.
+
+        Returns:
+            True if expired, otherwise False.
+
+        Examples:
+            >>> from unittest.mock import patch
+            >>> with patch("time.time", return_value=1000):
+            ...     CacheEntry(value={}, expiry=999).is_expired()
+            True
+        """
+        return time.time() >= self.expiry
+
+
+def token_digest(token: str) -> str:
+    """Return the cache key for a token.
+
+    Args:
+        token: Raw JWT string.
+
+    Returns:
+        Hex SHA-256 digest of the token.
+
+    Examples:
+        >>> len(token_digest("a.b.c"))
+        64
+        >>> token_digest("a.b.c") == token_digest("a.b.c")
+        True
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class JWTVerifyCache:
+    """Bounded LRU cache of verified JWT payloads.
+
+    Examples:
+        >>> cache = JWTVerifyCache(ttl=60, max_size=10, enabled=True)
+        >>> cache.set("a.b.c", {"sub": "alice", "jti": "j1"})
+        >>> cache.get("a.b.c")["sub"]
+        'alice'
+        >>> cache.evict_jti("j1")
+        1
+        >>> cache.get("a.b.c") is None
+        True
+    """
+
+    def __init__(self, ttl: Optional[int] = None, max_size: Optional[int] = None, enabled: Optional[bool] = None) -> None:
+        """Initialize cache settings and in-memory structures.
+
+        Args:
+            ttl: Upper bound on entry lifetime in seconds (default: from settings or 300)
+            max_size: Maximum cached tokens (default: from settings or 10000)
+            enabled: Whether caching is enabled (default: from settings or True)
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._enabled = enabled if enabled is not None else getattr(settings, "jwt_verify_cache_enabled", True)
+            self._ttl_seconds = ttl or getattr(settings, "jwt_verify_cache_ttl", 300)
+            self._maxsize = max_size or getattr(settings, "jwt_verify_cache_max_size", 10000)
+        except ImportError:
+            self._enabled = enabled if enabled is not None else True
+            self._ttl_seconds = ttl or 300
+            self._maxsize = max_size or 10000
+
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # jti -> digests of cached tokens carrying it, for revocation eviction
+        self._jti_index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
+        self._revocation_evictions = 0
+
+        logger.info("JWTVerifyCache initialized: enabled=%s max_size=%s ttl=%ss", self._enabled, self._maxsize, self._ttl_seconds)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache is enabled.
+
+        Returns:
+            True if enabled, otherwise False.
+        """
+        return self._enabled
+
+    def _drop(self, digest: str) -> None:
+        """Remove an entry and its JTI index reference (caller holds the lock).
+
+        Args:
+            digest: Token digest to drop.
+        """
+        entry = self._cache.pop(digest, None)
+        if entry is None:
+            return
+        jti = entry.value.get("jti")
+        if jti is not None:
+            digests = self._jti_index.get(jti)
+            if digests is not None:
+                digests.discard(digest)
+                if not digests:
+                    self._jti_index.pop(jti, None)
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the verified payload for ``token``, if cached.
+
+        Args:
+            token: Raw JWT string.
+
+        Returns:
+            Shallow copy of the cached payload, or None on a miss.
+        """
+        if not self._enabled:
+            return None
+
+        digest = token_digest(token)
+        with self._lock:
+            entry = self._cache.get(digest)
+            if entry is not None and not entry.is_expired():
+                self._cache.move_to_end(digest)
+                self._hit_count += 1
+                return dict(entry.value)
+            if entry is not None:
+                self._drop(digest)
+            self._miss_count += 1
+        return None
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache a payload that has just passed verification.
+
+        The entry expires at ``min(now + ttl, exp)``; tokens that are already
+        expired are not cached.
+
+        Args:
+            token: Raw JWT string.
+            payload: Verified claims.
+
+        Examples:
+            >>> import time
+            >>> cache = JWTVerifyCache(ttl=300, max_size=10, enabled=True)
+            >>> cache.set("t", {"sub": "a", "exp": int(time.time()) + 5})
+            >>> 0 < cache._cache[token_digest("t")].expiry - time.time() <= 5
+            True
+            >>> cache.set("old", {"sub": "a", "exp": int(time.time()) - 1})
+            >>> cache.get("old") is None
+            True
+        """
+        if not self._enabled:
+            return
+
+        now = time.time()
+        expiry = now + self._ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expiry = min(expiry, float(exp))
+        if expiry <= now:
+            return
+
+        digest = token_digest(token)
+        jti = payload.get("jti")
+        with self._lock:
+            if digest in self._cache:
+                self._drop(digest)
+            elif len(self._cache) >= self._maxsize:
+                oldest = next(iter(self._cache))
+                self._drop(oldest)
+                self._eviction_count += 1
+            self._cache[digest] = CacheEntry(value=dict(payload), expiry=expiry)
+            if jti is not None:
+                self._jti_index.setdefault(jti, set()).add(digest)
+
+    def evict_jti(self, jti: str) -> int:
+        """Drop every cached token carrying ``jti`` (token revoked).
+
+        Args:
+            jti: Revoked JWT ID.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            digests = self._jti_index.pop(jti, None)
+            if not digests:
+                return 0
+            for digest in digests:
+                self._cache.pop(digest, None)
+            self._revocation_evictions += len(digests)
+            return len(digests)
+
+    def clear(self) -> None:
+        """Drop all cached payloads.
+
+        Examples:
+            >>> cache = JWTVerifyCache(enabled=True)
+            >>> cache.set("t", {"sub": "a"})
+            >>> cache.clear()
+            >>> cache.stats()["size"]
+            0
+        """
+        with self._lock:
+            self._cache.clear()
+            self._jti_index.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache hit/miss statistics and configuration.
+
+        Returns:
+            Cache stats and settings.
+        """
+        total = self._hit_count + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": self._hit_count / total if total > 0 else 0.0,
+            "size": len(self._cache),
+            "max_size": self._maxsize,
+            "eviction_count": self._eviction_count,
+            "revocation_evictions": self._revocation_evictions,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
+        self._revocation_evictions = 0
+
+
+jwt_verify_cache = JWTVerifyCache()
@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+"""Permission decision cache with L1 memory + L2 Redis.
+
+``PermissionService`` instances are created per request, so their own
+permission/role caches only live for a single request. This process-wide
+cache remembers the final allow/deny decision for (user, permission, team
+scope) so repeated ``require_permission`` checks skip the role queries.
+
+Entries are invalidated when roles change (``AuthCache.invalidate_user_role``
+/ ``invalidate_team_roles`` and ``RoleService`` assignments) and across
+workers through the ``mcpgw:cache:invalidate`` channel handled by
+``CacheInvalidationSubscriber``.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Scope marker for team-independent checks and for any-team checks
+GLOBAL_SCOPE = "__global__"
+ANY_TEAM_SCOPE = "__anyteam__"
+
+_INVALIDATION_CHANNEL = "mcpgw:cache:invalidate"
+
+
+@dataclass
+class CacheEntry:
+    """Cached permission decision with expiry timestamp."""
+
+    value: bool
+    expiry: float
+
+    def is_expired(self) -> bool:
+        """Return True if the cache entry has expired.
+
+        Returns:
+            True if expired, otherwise False.
+
+        Examples:
+            >>> from unittest.mock import patch
+            >>> with patch("time.time", return_value=1000):
+            ...     CacheEntry(value=True, expiry=999).is_expired()
+            True
+        """
+        return time.time() >= self.expiry
+
+
+def decision_scope(team_id: Optional[str], check_any_team: bool = False) -> str:
+    """Return the team scope component of a decision cache key.
+
+    Args:
+        team_id: Team context of the check.
+        check_any_team: Whether the check spans all of the user's teams.
+
+    Returns:
+        Scope string used in cache keys.
+
+    Examples:
+        >>> decision_scope(None)
+        '__global__'
+        >>> decision_scope("team-1")
+        'team-1'
+        >>> decision_scope(None, check_any_team=True)
+        '__anyteam__'
+    """
+    if check_any_team:
+        return ANY_TEAM_SCOPE
+    return team_id or GLOBAL_SCOPE
+
+
+class PermissionDecisionCache:
+    """Two-tier cache for RBAC permission decisions.
+
+    L1: in-memory LRU/TTL per worker, bounded by ``permission_cache_max_size``.
+    L2: Redis (optional, shared across workers when ``cache_type=redis``).
+
+    Keys are ``(user_email, permission, scope, admin_bypass)``; values are the
+    boolean decision. Only decisions that do not depend on per-call audit
+    logging are cached (see ``PermissionService.check_permission``).
+    """
+
+    def __init__(self, ttl: Optional[int] = None, max_size: Optional[int] = None, enabled: Optional[bool] = None) -> None:
+        """Initialize cache settings and in-memory structures.
+
+        Args:
+            ttl: Decision TTL in seconds (default: from settings or 60)
+            max_size: Maximum L1 entries (default: from settings or 10000)
+            enabled: Whether caching is enabled (default: from settings or True)
+
+        Examples:
+            >>> cache = PermissionDecisionCache(ttl=30, max_size=100, enabled=True)
+            >>> (cache.enabled, cache.stats()["l1_maxsize"])
+            (True, 100)
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._enabled = enabled if enabled is not None else getattr(settings, "permission_cache_enabled", True)
+            self._ttl_seconds = ttl or getattr(settings, "permission_cache_ttl", 60)
+            self._l1_maxsize = max_size or getattr(settings, "permission_cache_max_size", 10000)
+            self._l2_enabled = getattr(settings, "permission_cache_l2_enabled", True) and settings.cache_type == "redis"
+            self._cache_prefix = getattr(settings, "cache_prefix", "mcpgw:")
+        except ImportError:
+            self._enabled = enabled if enabled is not None else True
+            self._ttl_seconds = ttl or 60
+            self._l1_maxsize = max_size or 10000
+            self._l2_enabled = False
+            self._cache_prefix = "mcpgw:"
+
+        self._cache: "OrderedDict[Tuple[str, str, str, bool], CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._redis_checked = False
+        self._redis_available = False
+
+        self._l1_hit_count = 0
+        self._l1_miss_count = 0
+        self._l2_hit_count = 0
+        self._l2_miss_count = 0
+        self._eviction_count = 0
+        self._invalidation_count = 0
+
+        # Bumped on every invalidation so a decision computed before a role
+        # change is not stored after it (see ``set``)
+        self._generation = 0
+
+        logger.info("PermissionDecisionCache initialized: enabled=%s l1_max=%s ttl=%ss l2_enabled=%s", self._enabled, self._l1_maxsize, self._ttl_seconds, self._l2_enabled)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache is enabled.
+
+        Returns:
+            True if enabled, otherwise False.
+        """
+        return self._enabled
+
+    @property
+    def generation(self) -> int:
+        """Return the current invalidation generation.
+
+        Capture it before computing a decision and pass it to ``set``.
+
+        Returns:
+            Invalidation generation counter.
+        """
+        return self._generation
+
+    def _redis_key(self, key: Tuple[str, str, str, bool]) -> str:
+        """Build the Redis key for a decision.
+
+        The user and scope lead the key so invalidation can match by pattern.
+
+        Args:
+            key: Decision key tuple.
+
+        Returns:
+            Redis key for the decision.
+
+        Examples:
+            >>> cache = PermissionDecisionCache(enabled=True)
+            >>> cache._redis_key(("a@example.com", "tools.read", "team-1", True))
+            'mcpgw:perm:a@example.com:team-1:tools.read:1'
+        """
+        email, permission, scope, admin_bypass = key
+        return f"{self._cache_prefix}perm:{email}:{scope}:{permission}:{int(admin_bypass)}"
+
+    async def _get_redis_client(self):
+        """Return a Redis client if L2 is enabled and available.
+
+        Returns:
+            Redis client instance or None.
+        """
+        if not self._l2_enabled:
+            return None
+        try:
+            # First-Party
+            from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+            client = await get_redis_client()
+            if client and not self._redis_checked:
+                self._redis_checked = True
+                self._redis_available = True
+            return client
+        except Exception:
+            if not self._redis_checked:
+                self._redis_checked = True
+                self._redis_available = False
+            return None
+
+    def _get_l1(self, key: Tuple[str, str, str, bool]) -> Optional[bool]:
+        """Fetch a decision from L1 if present and not expired.
+
+        Args:
+            key: Decision key tuple.
+
+        Returns:
+            Cached decision or None.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and not entry.is_expired():
+                self._cache.move_to_end(key)
+                self._l1_hit_count += 1
+                return entry.value
+            if entry:
+                self._cache.pop(key, None)
+            self._l1_miss_count += 1
+        return None
+
+    def _set_l1(self, key: Tuple[str, str, str, bool], value: bool) -> None:
+        """Store a decision in L1, evicting the least recently used entry when full.
+
+        Args:
+            key: Decision key tuple.
+            value: Decision to cache.
+        """
+        with self._lock:
+            if key in self._cache:
+                self._cache.pop(key, None)
+            elif len(self._cache) >= self._l1_maxsize:
+                self._cache.popitem(last=False)
+                self._eviction_count += 1
+            self._cache[key] = CacheEntry(value=value, expiry=time.time() + self._ttl_seconds)
+
+    async def get(self, user_email: str, permission: str, scope: str, admin_bypass: bool = True) -> Optional[bool]:
+        """Get a cached decision, checking L1 then L2.
+
+        Args:
+            user_email: User the check is for.
+            permission: Permission being checked.
+            scope: Team scope from ``decision_scope``.
+            admin_bypass: Whether the check allowed the admin bypass.
+
+        Returns:
+            Cached decision, or None on a miss.
+
+        Examples:
+            >>> import asyncio
+            >>> cache = PermissionDecisionCache(enabled=True)
+            >>> cache._l2_enabled = False
+            >>> asyncio.run(cache.get("a@example.com", "tools.read", "__global__")) is None
+            True
+            >>> asyncio.run(cache.set("a@example.com", "tools.read", "__global__", True, False))
+            >>> asyncio.run(cache.get("a@example.com", "tools.read", "__global__"))
+            False
+        """
+        if not self._enabled:
+            return None
+
+        key = (user_email, permission, scope, admin_bypass)
+        cached = self._get_l1(key)
+        if cached is not None:
+            return cached
+
+        redis = await self._get_redis_client()
+        if not redis:
+            return None
+
+        try:
+            data = await redis.get(self._redis_key(key))
+            if data is not None:
+                self._l2_hit_count += 1
+                decoded = data.decode() if isinstance(data, bytes) else data
+                value = decoded == "1"
+                self._set_l1(key, value)
+                return value
+            self._l2_miss_count += 1
+        except Exception as exc:
+            logger.debug("PermissionDecisionCache Redis get failed: %s", exc)
+        return None
+
+    async def set(self, user_email: str, permission: str, scope: str, admin_bypass: bool, granted: bool, generation: Optional[int] = None) -> None:
+        """Store a decision in L1 and L2.
+
+        Args:
+            user_email: User the check is for.
+            permission: Permission being checked.
+            scope: Team scope from ``decision_scope``.
+            admin_bypass: Whether the check allowed the admin bypass.
+            granted: The decision.
+            generation: ``generation`` observed before the decision was computed;
+                the decision is discarded if an invalidation happened since.
+
+        Examples:
+            >>> import asyncio
+            >>> cache = PermissionDecisionCache(enabled=True)
+            >>> cache._l2_enabled = False
+            >>> gen = cache.generation
+            >>> asyncio.run(cache.invalidate_user("a@example.com"))
+            >>> asyncio.run(cache.set("a@example.com", "tools.read", "__global__", True, True, generation=gen))
+            >>> asyncio.run(cache.get("a@example.com", "tools.read", "__global__")) is None
+            True
+        """
+        if not self._enabled:
+            return
+        if generation is not None and generation != self._generation:
+            return
+
+        key = (user_email, permission, scope, admin_bypass)
+        self._set_l1(key, granted)
+
+        redis = await self._get_redis_client()
+        if not redis:
+            return
+
+        try:
+            await redis.setex(self._redis_key(key), self._ttl_seconds, "1" if granted else "0")
+        except Exception as exc:
+            logger.debug("PermissionDecisionCache Redis set failed: %s", exc)
+
+    def _invalidate_local(self, user_email: Optional[str] = None, team_id: Optional[str] = None) -> int:
+        """Drop matching L1 entries without touching Redis.
+
+        Used by the pub/sub subscriber so remote invalidations do not publish again.
+
+        Args:
+            user_email: Drop every decision for this user.
+            team_id: Drop decisions scoped to this team (and any-team decisions).
+
+        Returns:
+            Number of entries removed.
+
+        Examples:
+            >>> import asyncio
+            >>> cache = PermissionDecisionCache(enabled=True)
+            >>> cache._l2_enabled = False
+            >>> for email, scope in [("a", "t1"), ("a", "__global__"), ("b", "t1"), ("b", "__anyteam__"), ("b", "t2")]:
+            ...     asyncio.run(cache.set(email, "tools.read", scope, True, True))
+            >>> cache._invalidate_local(user_email="a")
+            2
+            >>> cache._invalidate_local(team_id="t1")
+            2
+            >>> sorted(k[2] for k in cache._cache)
+            ['t2']
+        """
+        with self._lock:
+            if user_email is None and team_id is None:
+                removed = len(self._cache)
+                self._cache.clear()
+            else:
+                to_remove = [k for k in self._cache if (user_email is not None and k[0] == user_email) or (team_id is not None and k[2] in (team_id, ANY_TEAM_SCOPE))]
+                for key in to_remove:
+                    self._cache.pop(key, None)
+                removed = len(to_remove)
+            self._invalidation_count += 1
+            self._generation += 1
+        return removed
+
+    async def _invalidate_redis(self, message: str, *patterns: str) -> None:
+        """Delete matching L2 keys and notify other workers.
+
+        Args:
+            message: Invalidation message to publish.
+            *patterns: Redis key globs to delete.
+        """
+        redis = await self._get_redis_client()
+        if not redis:
+            return
+        try:
+            for pattern in patterns:
+                async for key in redis.scan_iter(match=pattern):
+                    await redis.delete(key)
+            await redis.publish(_INVALIDATION_CHANNEL, message)
+        except Exception as exc:
+            logger.debug("PermissionDecisionCache Redis invalidate failed: %s", exc)
+
+    async def invalidate_user(self, user_email: str) -> None:
+        """Invalidate every cached decision for a user.
+
+        Call this when a user's roles, admin flag or team memberships change.
+
+        Args:
+            user_email: User whose decisions should be dropped.
+        """
+        if not self._enabled:
+            return
+        removed = self._invalidate_local(user_email=user_email)
+        logger.debug("PermissionDecisionCache: invalidated %d decisions for %s", removed, user_email)
+        await self._invalidate_redis(f"permissions:user:{user_email}", f"{self._cache_prefix}perm:{user_email}:*")
+
+    async def invalidate_team(self, team_id: str) -> None:
+        """Invalidate cached decisions scoped to a team.
+
+        Any-team decisions are dropped as well since they aggregate team roles.
+
+        Args:
+            team_id: Team whose decisions should be dropped.
+        """
+        if not self._enabled:
+            return
+        removed = self._invalidate_local(team_id=team_id)
+        logger.debug("PermissionDecisionCache: invalidated %d decisions for team %s", removed, team_id)
+        await self._invalidate_redis(f"permissions:team:{team_id}", f"{self._cache_prefix}perm:*:{team_id}:*", f"{self._cache_prefix}perm:*:{ANY_TEAM_SCOPE}:*")
+
+    async def invalidate_all(self) -> None:
+        """Invalidate every cached decision.
+
+        Call this when a role definition changes, since any user may hold it.
+        """
+        if not self._enabled:
+            return
+        self._invalidate_local()
+        logger.debug("PermissionDecisionCache: invalidated all decisions")
+        await self._invalidate_redis("permissions:all", f"{self._cache_prefix}perm:*")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache hit/miss statistics and configuration.
+
+        Returns:
+            Cache stats and settings.
+
+        Examples:
+            >>> import asyncio
+            >>> cache = PermissionDecisionCache(enabled=True)
+            >>> cache._l2_enabled = False
+            >>> asyncio.run(cache.get("missing", "tools.read", "__global__")) is None
+            True
+            >>> s = cache.stats()
+            >>> (s["l1_miss_count"], s["l1_hit_rate"])
+            (1, 0.0)
+        """
+        total_l1 = self._l1_hit_count + self._l1_miss_count
+        total_l2 = self._l2_hit_count + self._l2_miss_count
+        return {
+            "enabled": self._enabled,
+            "l1_hit_count": self._l1_hit_count,
+            "l1_miss_count": self._l1_miss_count,
+            "l1_hit_rate": self._l1_hit_count / total_l1 if total_l1 > 0 else 0.0,
+            "l2_hit_count": self._l2_hit_count,
+            "l2_miss_count": self._l2_miss_count,
+            "l2_hit_rate": self._l2_hit_count / total_l2 if total_l2 > 0 else 0.0,
+            "l1_size": len(self._cache),
+            "l1_maxsize": self._l1_maxsize,
+            "eviction_count": self._eviction_count,
+            "invalidation_count": self._invalidation_count,
+            "ttl_seconds": self._ttl_seconds,
+            "l2_enabled": self._l2_enabled,
+            "redis_available": self._redis_available,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters.
+
+        Examples:
+            >>> cache = PermissionDecisionCache(enabled=True)
+            >>> cache._l1_miss_count = 5
+            >>> cache.reset_stats()
+            >>> cache.stats()["l1_miss_count"]
+            0
+        """
+        self._l1_hit_count = 0
+        self._l1_miss_count = 0
+        self._l2_hit_count = 0
+        self._l2_miss_count = 0
+        self._eviction_count = 0
+        self._invalidation_count = 0
+
+
+permission_cache = PermissionDecisionCache()
@@ -14,6 +14,17 @@ Performance Impact:
     - After: 0 DB queries (cache hit) per TTL period
     - Expected 95%+ cache hit rate under load
 
+List endpoints can additionally cache their final JSON body with
+``set_response``/``get_response``. A response hit is returned as-is, with no
+model validation or re-serialization, and carries an ETag so clients can
+revalidate with ``If-None-Match``. Response entries live under the same
+per-type prefix, so ``invalidate_tools()`` and friends drop them too.
+
+Team-scoped listings (``list_scoped``) are keyed by visibility scope rather
+than by user: the rows visible through the sorted team set (plus public rows)
+are shared by every caller with that team set, and the caller's own rows are
+cached per owner and merged in.
+
 Examples:
     >>> from mcpgateway.cache.registry_cache import registry_cache
     >>> # Cache is used automatically by list endpoints
@@ -29,7 +40,7 @@ import hashlib
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +60,17 @@ def _get_cleanup_timeout() -> float:
         return 5.0
 
 
+def _mark_tool_discovery_stale() -> None:
+    """Tell the tool discovery index that the tool registry changed in bulk (lazy import to avoid circular deps)."""
+    try:
+        # First-Party
+        from mcpgateway.services.tool_discovery_service import get_tool_discovery_service  # pylint: disable=import-outside-toplevel
+
+        get_tool_discovery_service().mark_stale()
+    except Exception as e:
+        logger.debug(f"Tool discovery index not marked stale: {e}")
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with value and expiry timestamp.
@@ -72,6 +94,61 @@ class CacheEntry:
         return time.time() >= self.expiry
 
 
+@dataclass(frozen=True)
+class CachedResponse:
+    """Pre-serialized JSON response body with its entity tag.
+
+    Examples:
+        >>> response = CachedResponse.from_body(b'[{"id": "1"}]')
+        >>> response.etag == CachedResponse.from_body(b'[{"id": "1"}]').etag
+        True
+        >>> response.etag.startswith('"') and response.etag.endswith('"')
+        True
+        >>> response.etag_matches(response.etag)
+        True
+        >>> response.etag_matches(f'"other", W/{response.etag}')
+        True
+        >>> response.etag_matches("*"), response.etag_matches('"other"'), response.etag_matches(None)
+        (True, False, False)
+    """
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedResponse":
+        """Wrap a serialized body, deriving a strong ETag from its content.
+
+        The tag only depends on the bytes, so every worker computes the same
+        tag for the same body.
+
+        Args:
+            body: Serialized JSON response body.
+
+        Returns:
+            CachedResponse: Body and quoted ETag.
+        """
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+    def etag_matches(self, if_none_match: Optional[str]) -> bool:
+        """Check an ``If-None-Match`` header value against this response.
+
+        Uses the weak comparison required for ``If-None-Match`` (RFC 9110),
+        so ``W/"tag"`` matches ``"tag"``.
+
+        Args:
+            if_none_match: Raw header value, if present.
+
+        Returns:
+            bool: True if the client's copy is current (respond with 304).
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return any(candidate.strip().removeprefix("W/") == self.etag for candidate in if_none_match.split(","))
+
+
 @dataclass
 class RegistryCacheConfig:
     """Configuration for registry cache TTLs.
@@ -175,6 +252,8 @@ class RegistryCache:
         self._miss_count = 0
         self._redis_hit_count = 0
         self._redis_miss_count = 0
+        self._scoped_hit_count = 0
+        self._scoped_miss_count = 0
 
         logger.info(
             f"RegistryCache initialized: enabled={self._enabled}, "
@@ -202,6 +281,33 @@ class RegistryCache:
             return f"{self._cache_prefix}registry:{cache_type}:{filters_hash}"
         return f"{self._cache_prefix}registry:{cache_type}"
 
+    def _get_ttl(self, cache_type: str) -> int:
+        """Return the default TTL for a cache type.
+
+        Args:
+            cache_type: Type of cache entry (tools, prompts, etc.)
+
+        Returns:
+            TTL in seconds
+
+        Examples:
+            >>> cache = RegistryCache()
+            >>> cache._get_ttl("catalog") == cache._catalog_ttl
+            True
+            >>> cache._get_ttl("unknown")
+            20
+        """
+        ttl_map = {
+            "tools": self._tools_ttl,
+            "prompts": self._prompts_ttl,
+            "resources": self._resources_ttl,
+            "agents": self._agents_ttl,
+            "servers": self._servers_ttl,
+            "gateways": self._gateways_ttl,
+            "catalog": self._catalog_ttl,
+        }
+        return ttl_map.get(cache_type, 20)
+
     def hash_filters(self, **kwargs) -> str:
         """Generate a hash from filter parameters.
 
@@ -310,18 +416,8 @@ class RegistryCache:
         if not self._enabled:
             return
 
-        # Determine TTL
         if ttl is None:
-            ttl_map = {
-                "tools": self._tools_ttl,
-                "prompts": self._prompts_ttl,
-                "resources": self._resources_ttl,
-                "agents": self._agents_ttl,
-                "servers": self._servers_ttl,
-                "gateways": self._gateways_ttl,
-                "catalog": self._catalog_ttl,
-            }
-            ttl = ttl_map.get(cache_type, 20)
+            ttl = self._get_ttl(cache_type)
 
         cache_key = self._get_redis_key(cache_type, filters_hash)
 
@@ -340,6 +436,174 @@ class RegistryCache:
         with self._lock:
             self._cache[cache_key] = CacheEntry(value=data, expiry=time.time() + ttl)
 
+    async def list_scoped(
+        self,
+        cache_type: str,
+        model: Any,
+        fetch: Callable[[bool], Awaitable[Tuple[List[Any], Optional[str]]]],
+        team_ids: List[str],
+        owner_email: Optional[str] = None,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Return the first page of a team-scoped listing from shareable entries.
+
+        A scoped listing is the union of the rows visible through the caller's
+        teams (public rows plus team rows of ``team_ids``) and, unless the
+        token is public-only, the rows the caller owns. The first part depends
+        only on the sorted team set and is shared by every caller with that
+        set; the second part is cached per owner. Both are fetched and cached
+        independently and merged with ``merge_keyset_pages``. Entries are shared
+        between callers and stored in Redis, so ``fetch`` must return items
+        with secrets already masked.
+
+        Args:
+            cache_type: Type of cache (tools, prompts, resources)
+            model: Pydantic model used to rebuild cached items
+            fetch: ``fetch(owner_part)`` returns the ``(items, next_cursor)`` first page
+                of the owner condition (True) or of the team condition (False)
+            team_ids: Teams the caller can see
+            owner_email: Caller whose own rows are included, or None (public-only tokens)
+            limit: Page size requested by the caller
+            **filters: Remaining request filters (include_inactive, tags, team_id, ...)
+
+        Returns:
+            Tuple of (items, next_cursor)
+
+        Examples:
+            >>> import asyncio
+            >>> from datetime import datetime
+            >>> from pydantic import BaseModel
+            >>> class Item(BaseModel):
+            ...     id: str
+            ...     created_at: datetime
+            >>> calls = []
+            >>> async def fetch(owner_part):
+            ...     calls.append(owner_part)
+            ...     return ([Item(id="mine", created_at=datetime(2025, 1, 2))], None) if owner_part else ([Item(id="team", created_at=datetime(2025, 1, 1))], None)
+            >>> cache = RegistryCache()
+            >>> items, _ = asyncio.run(cache.list_scoped("tools", Item, fetch, ["t2", "t1"], "a@example.com", limit=0))
+            >>> [i.id for i in items]
+            ['mine', 'team']
+            >>> items, _ = asyncio.run(cache.list_scoped("tools", Item, fetch, ["t1", "t2"], None, limit=0))
+            >>> [i.id for i in items], calls  # the team part is shared, only the first call hit the database
+            (['team'], [False, True])
+        """
+        # First-Party
+        from mcpgateway.utils.pagination import merge_keyset_pages  # pylint: disable=import-outside-toplevel
+
+        parts = [(False, self.hash_filters(scope_teams=sorted(set(team_ids)), limit=limit, **filters))]
+        if owner_email:
+            parts.append((True, self.hash_filters(scope_owner=owner_email, limit=limit, **filters)))
+
+        pages = []
+        for owner_part, filters_hash in parts:
+            cached = await self.get(cache_type, filters_hash)
+            if cached is not None:
+                self._scoped_hit_count += 1
+                pages.append(([model.model_validate(item) for item in cached["items"]], cached.get("next_cursor")))
+                continue
+            self._scoped_miss_count += 1
+            items, next_cursor = await fetch(owner_part)
+            await self.set(cache_type, {"items": [item.model_dump(mode="json") for item in items], "next_cursor": next_cursor}, filters_hash)
+            pages.append((items, next_cursor))
+
+        if len(pages) == 1:
+            return pages[0]
+        return merge_keyset_pages(pages, limit)
+
+    async def get_response(self, cache_type: str, filters_hash: str = "") -> Optional[CachedResponse]:
+        """Get a cached pre-serialized response body.
+
+        The in-memory tier is checked first, since a hit there needs no
+        network round trip; Redis hits are copied into memory. Other workers'
+        in-memory copies are dropped by the invalidation subscriber.
+
+        Args:
+            cache_type: Type of cache (tools, prompts, resources, agents, servers, gateways)
+            filters_hash: Hash of the request parameters that shape the body
+
+        Returns:
+            Cached response if found, None otherwise
+
+        Examples:
+            >>> import asyncio
+            >>> cache = RegistryCache()
+            >>> asyncio.run(cache.get_response("tools", "abc123")) is None
+            True
+        """
+        if not self._enabled:
+            return None
+
+        cache_key = self._get_redis_key(cache_type, f"response:{filters_hash}")
+
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry and not entry.is_expired():
+                self._hit_count += 1
+                return entry.value
+
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                body = await redis.get(cache_key)
+                if body:
+                    if isinstance(body, str):
+                        body = body.encode()
+                    response = CachedResponse.from_body(body)
+                    with self._lock:
+                        self._cache[cache_key] = CacheEntry(value=response, expiry=time.time() + self._get_ttl(cache_type))
+                    self._hit_count += 1
+                    self._redis_hit_count += 1
+                    return response
+                self._redis_miss_count += 1
+            except Exception as e:
+                logger.warning(f"RegistryCache Redis get_response failed: {e}")
+
+        self._miss_count += 1
+        return None
+
+    async def set_response(self, cache_type: str, body: bytes, filters_hash: str = "", ttl: Optional[int] = None) -> CachedResponse:
+        """Store a pre-serialized response body.
+
+        Args:
+            cache_type: Type of cache (tools, prompts, resources, agents, servers, gateways)
+            body: Serialized JSON response body
+            filters_hash: Hash of the request parameters that shape the body
+            ttl: TTL in seconds (uses default for cache_type if not specified)
+
+        Returns:
+            The body wrapped with its ETag (returned even when caching is disabled)
+
+        Examples:
+            >>> import asyncio
+            >>> cache = RegistryCache()
+            >>> stored = asyncio.run(cache.set_response("tools", b"[]", "abc123"))
+            >>> asyncio.run(cache.get_response("tools", "abc123")) == stored
+            True
+            >>> asyncio.run(cache.invalidate_tools())
+            >>> asyncio.run(cache.get_response("tools", "abc123")) is None
+            True
+        """
+        response = CachedResponse.from_body(body)
+        if not self._enabled:
+            return response
+
+        if ttl is None:
+            ttl = self._get_ttl(cache_type)
+        cache_key = self._get_redis_key(cache_type, f"response:{filters_hash}")
+
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                await redis.setex(cache_key, ttl, body)
+            except Exception as e:
+                logger.warning(f"RegistryCache Redis set_response failed: {e}")
+
+        with self._lock:
+            self._cache[cache_key] = CacheEntry(value=response, expiry=time.time() + ttl)
+        return response
+
     async def invalidate(self, cache_type: str) -> None:
         """Invalidate all cached data for a cache type.
 
@@ -360,6 +624,9 @@ class RegistryCache:
             for key in keys_to_remove:
                 self._cache.pop(key, None)
 
+        if cache_type == "tools":
+            _mark_tool_discovery_stale()
+
         # Clear Redis
         redis = await self._get_redis_client()
         if redis:
@@ -468,6 +735,7 @@ class RegistryCache:
         """
         total = self._hit_count + self._miss_count
         redis_total = self._redis_hit_count + self._redis_miss_count
+        scoped_total = self._scoped_hit_count + self._scoped_miss_count
 
         return {
             "enabled": self._enabled,
@@ -477,6 +745,9 @@ class RegistryCache:
             "redis_hit_count": self._redis_hit_count,
             "redis_miss_count": self._redis_miss_count,
             "redis_hit_rate": self._redis_hit_count / redis_total if redis_total > 0 else 0.0,
+            "scoped_hit_count": self._scoped_hit_count,
+            "scoped_miss_count": self._scoped_miss_count,
+            "scoped_hit_rate": self._scoped_hit_count / scoped_total if scoped_total > 0 else 0.0,
             "redis_available": self._redis_available,
             "cache_size": len(self._cache),
             "ttls": {
@@ -504,6 +775,8 @@ class RegistryCache:
         self._miss_count = 0
         self._redis_hit_count = 0
         self._redis_miss_count = 0
+        self._scoped_hit_count = 0
+        self._scoped_miss_count = 0
 
 
 # Global singleton instance
@@ -542,7 +815,11 @@ class CacheInvalidationSubscriber:
         - registry:{cache_type} - Invalidate registry cache (tools, prompts, etc.)
         - tool_lookup:{name} - Invalidate specific tool lookup
         - tool_lookup:gateway:{gateway_id} - Invalidate all tools for a gateway
+        - tool_result:{tool_id} - Invalidate cached results of a tool
         - admin:{prefix} - Invalidate admin stats cache
+        - permissions:user:{email} - Invalidate permission decisions for a user
+        - permissions:team:{team_id} - Invalidate permission decisions for a team
+        - permissions:all - Invalidate all permission decisions
 
     Examples:
         >>> subscriber = CacheInvalidationSubscriber()
@@ -713,6 +990,8 @@ class CacheInvalidationSubscriber:
                     for key in keys_to_remove:
                         cache._cache.pop(key, None)  # pyright: ignore[reportPrivateUsage]
                 logger.debug("CacheInvalidationSubscriber: Cleared local registry:%s cache (%d keys)", cache_type, len(keys_to_remove))
+                if cache_type == "tools":
+                    _mark_tool_discovery_stale()
 
             elif message.startswith("tool_lookup:gateway:"):
                 # Handle gateway-wide tool lookup invalidation
@@ -738,6 +1017,30 @@ class CacheInvalidationSubscriber:
                     tool_lookup_cache._cache.pop(tool_name, None)  # pyright: ignore[reportPrivateUsage]
                 logger.debug("CacheInvalidationSubscriber: Cleared local tool_lookup:%s", tool_name)
 
+            elif message.startswith("tool_result:"):
+                # Handle tool result cache invalidation
+                tool_id = message[len("tool_result:") :]
+                # First-Party
+                from mcpgateway.cache.tool_result_cache import tool_result_cache  # pylint: disable=import-outside-toplevel
+
+                # Only clear local L1 cache
+                removed = tool_result_cache._invalidate_local(tool_id)  # pyright: ignore[reportPrivateUsage]
+                logger.debug("CacheInvalidationSubscriber: Cleared local tool_result for tool %s (%d keys)", tool_id, removed)
+
+            elif message.startswith("resource_content:"):
+                # Handle resource content cache invalidation (empty tag clears everything)
+                tag = message[len("resource_content:") :]
+                # First-Party
+                from mcpgateway.cache.resource_cache import resource_cache  # pylint: disable=import-outside-toplevel
+
+                # Only clear local cache
+                if tag:
+                    removed = resource_cache.invalidate(tag)
+                else:
+                    removed = len(resource_cache)
+                    resource_cache.clear()
+                logger.debug("CacheInvalidationSubscriber: Cleared local resource_content:%s (%d keys)", tag, removed)
+
             elif message.startswith("admin:"):
                 # Handle admin stats cache invalidation
                 prefix = message[len("admin:") :]
@@ -752,6 +1055,21 @@ class CacheInvalidationSubscriber:
                         admin_stats_cache._cache.pop(key, None)  # pyright: ignore[reportPrivateUsage]
                 logger.debug("CacheInvalidationSubscriber: Cleared local admin:%s cache (%d keys)", prefix, len(keys_to_remove))
 
+            elif message.startswith("permissions:"):
+                # Handle permission decision cache invalidation
+                target = message[len("permissions:") :]
+                # First-Party
+                from mcpgateway.cache.permission_cache import permission_cache  # pylint: disable=import-outside-toplevel
+
+                # Only clear local L1 cache
+                if target.startswith("user:"):
+                    removed = permission_cache._invalidate_local(user_email=target[len("user:") :])  # pyright: ignore[reportPrivateUsage]
+                elif target.startswith("team:"):
+                    removed = permission_cache._invalidate_local(team_id=target[len("team:") :])  # pyright: ignore[reportPrivateUsage]
+                else:
+                    removed = permission_cache._invalidate_local()  # pyright: ignore[reportPrivateUsage]
+                logger.debug("CacheInvalidationSubscriber: Cleared local permissions:%s (%d keys)", target, removed)
+
             else:
                 logger.debug("CacheInvalidationSubscriber: Unknown message format: %s", message)
 
@@ -7,10 +7,17 @@ Authors: Mihai Criveti
 Resource Cache Implementation.
 This module implements a simple in-memory cache with TTL expiration for caching
 resource content in the MCP Gateway. Features:
-- TTL-based expiration
-- Maximum size limit with LRU eviction
+- TTL-based expiration, with optional per-entry TTL
+- Maximum entry count and total byte size, with LRU eviction
+- Tag-based invalidation (e.g. all entries of a resource or gateway)
+- Hit/miss and byte usage statistics
 - Thread-safe operations
 
+``ResourceService.read_resource`` serves repeated reads of gateway resources
+from the shared ``resource_cache`` instance when ``RESOURCE_CACHE_ENABLED`` is
+set. Entries are invalidated on upstream ``notifications/resources/updated``,
+on gateway refresh and when a resource is updated or deleted.
+
 Examples:
     >>> from mcpgateway.cache.resource_cache import ResourceCache
     >>> from unittest.mock import patch
@@ -50,12 +57,17 @@ Examples:
 import asyncio
 from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
 import heapq
 import threading
 import time
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Third-Party
+import orjson
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.services.logging_service import LoggingService
 
 # Initialize logging service first
@@ -63,12 +75,90 @@ logging_service = LoggingService()
 logger = logging_service.get_logger(__name__)
 
 
+# Redis channel shared with the other caches (see CacheInvalidationSubscriber)
+INVALIDATION_CHANNEL = "mcpgw:cache:invalidate"
+
+
 @dataclass
 class CacheEntry:
-    """Cache entry with expiration."""
+    """Cache entry with expiration, size in bytes and invalidation tags."""
 
     value: Any
     expires_at: float
+    size: int = 0
+    tags: Tuple[str, ...] = ()
+
+
+def content_tag(gateway_id: str, uri: str) -> str:
+    """Build the invalidation tag of an upstream resource URI on a gateway.
+
+    Args:
+        gateway_id: Gateway ID.
+        uri: Resource URI as known to the upstream server.
+
+    Returns:
+        Tag string.
+
+    Examples:
+        >>> content_tag("gw-1", "file:///a.txt")
+        'gw-1|file:///a.txt'
+    """
+    return f"{gateway_id}|{uri}"
+
+
+def content_key(gateway_id: str, uri: str, user_email: Optional[str], token_teams: Optional[List[str]], meta_data: Optional[Dict[str, Any]] = None) -> str:
+    """Build the cache key of an upstream resource read for a caller scope.
+
+    ``token_teams=None`` (unrestricted) and ``[]`` (public only) are different scopes.
+    The request ``_meta`` forwarded upstream is part of the key, since it can change the content.
+
+    Args:
+        gateway_id: Gateway ID.
+        uri: Resource URI as known to the upstream server.
+        user_email: Calling user.
+        token_teams: Team IDs from the caller's token.
+        meta_data: Metadata passed to the upstream server with the read.
+
+    Returns:
+        Hex SHA-256 digest.
+
+    Examples:
+        >>> content_key("gw", "file:///a", "u", ["x", "y"]) == content_key("gw", "file:///a", "u", ["y", "x"])
+        True
+        >>> content_key("gw", "file:///a", "u", None) == content_key("gw", "file:///a", "u", [])
+        False
+        >>> content_key("gw", "file:///a", "u", None) == content_key("gw", "file:///a", "v", None)
+        False
+        >>> content_key("gw", "file:///a", "u", None, {"a": 1, "b": 2}) == content_key("gw", "file:///a", "u", None, {"b": 2, "a": 1})
+        True
+        >>> content_key("gw", "file:///a", "u", None, {"a": 1}) == content_key("gw", "file:///a", "u", None)
+        False
+    """
+    scope = [gateway_id, uri, user_email, sorted(token_teams) if token_teams is not None else None, meta_data or None]
+    return hashlib.sha256(orjson.dumps(scope, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def entry_size(value: Any) -> int:
+    """Estimate the size of a cached value in bytes.
+
+    Args:
+        value: Value to measure.
+
+    Returns:
+        Size in bytes (UTF-8 length for strings, JSON length for other values).
+
+    Examples:
+        >>> entry_size("héllo"), entry_size(b"abc"), entry_size({"a": 1})
+        (6, 3, 7)
+    """
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    try:
+        return len(orjson.dumps(value, default=str))
+    except TypeError:
+        return len(str(value).encode("utf-8"))
 
 
 class ResourceCache:
@@ -78,6 +168,8 @@ class ResourceCache:
     Attributes:
         max_size: Maximum number of entries
         ttl: Time-to-live in seconds
+        max_bytes: Maximum total size of cached values in bytes (None for no limit)
+        max_entry_bytes: Values larger than this are not cached (None for no limit)
         _cache: Cache storage
         _lock: Threading lock for thread safety
 
@@ -114,23 +206,42 @@ class ResourceCache:
         >>> cache.clear()
         >>> cache.get('a') is None
         True
+
+        Test byte-bounded eviction:
+
+        >>> small = ResourceCache(max_size=10, ttl=60, max_bytes=10)
+        >>> small.set('a', 'xxxxxx')
+        >>> small.set('b', 'yyyyyy')  # 12 bytes > 10, evicts 'a'
+        >>> sorted(small._cache.keys()), small.stats()["bytes"]
+        (['b'], 6)
     """
 
-    def __init__(self, max_size: int = 1000, ttl: int = 3600):
+    def __init__(self, max_size: int = 1000, ttl: int = 3600, max_bytes: Optional[int] = None, max_entry_bytes: Optional[int] = None):
         """Initialize cache.
 
         Args:
             max_size: Maximum number of entries
             ttl: Time-to-live in seconds
+            max_bytes: Maximum total size of cached values in bytes (None for no limit)
+            max_entry_bytes: Values larger than this are not cached (None for no limit)
         """
         self.max_size = max_size
         self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         # Use a threading lock for thread-safe operations across sync methods
         # and the background cleanup thread.
         self._lock = threading.Lock()
         # Min-heap of (expires_at, key) for efficient expiration cleanup
         self._expiry_heap: list[tuple[float, str]] = []
+        # tag -> keys of the entries carrying it
+        self._tags: Dict[str, Set[str]] = {}
+        self._size_bytes = 0
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
+        self._oversize_count = 0
         self._cleanup_task: Optional[asyncio.Task] = None
 
     async def initialize(self) -> None:
@@ -150,6 +261,23 @@ class ResourceCache:
                 pass
         self.clear()
 
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its size and tag bookkeeping. Caller must hold the lock.
+
+        Args:
+            key: Cache key
+        """
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return
+        self._size_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
@@ -184,6 +312,7 @@ class ResourceCache:
         """
         with self._lock:
             if key not in self._cache:
+                self._miss_count += 1
                 return None
 
             entry = self._cache[key]
@@ -191,20 +320,27 @@ class ResourceCache:
 
             # Check expiration
             if now > entry.expires_at:
-                del self._cache[key]
+                self._remove(key)
+                self._miss_count += 1
                 return None
 
             self._cache.move_to_end(key)
+            self._hit_count += 1
 
             return entry.value
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = ()) -> None:
         """
         Set value in cache.
 
+        Values larger than ``max_entry_bytes`` (or ``max_bytes``) are not
+        cached; a previous value stored under the key is dropped.
+
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Time-to-live in seconds for this entry (defaults to the cache TTL)
+            tags: Tags to invalidate the entry by (see ``invalidate``)
 
         Examples:
             >>> from mcpgateway.cache.resource_cache import ResourceCache
@@ -212,17 +348,30 @@ class ResourceCache:
             >>> cache.set('a', 1)
             >>> cache.get('a')
             1
+            >>> capped = ResourceCache(max_entry_bytes=4)
+            >>> capped.set('big', 'too large')
+            >>> capped.get('big') is None, capped.stats()["oversize_count"]
+            (True, 1)
         """
-        expires_at = time.time() + self.ttl
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        size = entry_size(value) if self.max_bytes is not None or self.max_entry_bytes is not None else 0
+        tags = tuple(tags)
         with self._lock:
-            if key in self._cache:
-                self._cache.move_to_end(key)
-            elif len(self._cache) >= self.max_size:
-                # Evict LRU
-                self._cache.popitem(last=False)
-
-            # Add / update entry
-            self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+            self._remove(key)
+            if (self.max_entry_bytes is not None and size > self.max_entry_bytes) or (self.max_bytes is not None and size > self.max_bytes):
+                self._oversize_count += 1
+                return
+
+            # Evict LRU entries until the new one fits
+            while self._cache and (len(self._cache) >= self.max_size or (self.max_bytes is not None and self._size_bytes + size > self.max_bytes)):
+                self._remove(next(iter(self._cache)))
+                self._eviction_count += 1
+
+            # Add entry
+            self._cache[key] = CacheEntry(value=value, expires_at=expires_at, size=size, tags=tags)
+            self._size_bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
             # Push expiry into heap; stale heap entries are ignored later
             heapq.heappush(self._expiry_heap, (expires_at, key))
 
@@ -242,10 +391,74 @@ class ResourceCache:
             True
         """
         with self._lock:
-            self._cache.pop(key, None)
+            self._remove(key)
             # We don't remove entries from the heap here; they'll be ignored
             # by the cleanup when popped if missing or timestamp differs.
 
+    def invalidate(self, tag: str) -> int:
+        """
+        Delete the entry stored under ``tag`` and every entry tagged with it.
+
+        Args:
+            tag: Cache key or tag (e.g. a resource ID, gateway ID or ``content_tag``)
+
+        Returns:
+            Number of entries removed.
+
+        Examples:
+            >>> from mcpgateway.cache.resource_cache import ResourceCache
+            >>> cache = ResourceCache()
+            >>> cache.set('k1', 'a', tags=('gw-1', 'res-1'))
+            >>> cache.set('k2', 'b', tags=('gw-1', 'res-2'))
+            >>> cache.set('k3', 'c', tags=('gw-2',))
+            >>> cache.invalidate('res-1'), sorted(cache._cache.keys())
+            (1, ['k2', 'k3'])
+            >>> cache.invalidate('gw-1'), sorted(cache._cache.keys())
+            (1, ['k3'])
+            >>> cache.invalidate('k3'), len(cache)
+            (1, 0)
+        """
+        with self._lock:
+            keys = set(self._tags.get(tag, ()))
+            if tag in self._cache:
+                keys.add(tag)
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    async def invalidate_shared(self, tag: Optional[str] = None) -> None:
+        """
+        Invalidate a tag (or everything) in this worker and, with Redis, in all other workers.
+
+        Args:
+            tag: Cache key or tag, or None to clear the cache.
+
+        Examples:
+            >>> import asyncio
+            >>> from mcpgateway.cache.resource_cache import ResourceCache
+            >>> cache = ResourceCache()
+            >>> cache.set('k1', 'a', tags=('gw-1',))
+            >>> asyncio.run(cache.invalidate_shared('gw-1'))
+            >>> len(cache)
+            0
+        """
+        if tag is None:
+            self.clear()
+        else:
+            self.invalidate(tag)
+
+        if settings.cache_type != "redis":
+            return
+        try:
+            # First-Party
+            from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+            redis = await get_redis_client()
+            if redis:
+                await redis.publish(INVALIDATION_CHANNEL, f"resource_content:{tag or ''}")
+        except Exception as exc:
+            logger.debug(f"Failed to publish resource cache invalidation: {exc}")
+
     def clear(self) -> None:
         """
         Clear all cached entries.
@@ -261,6 +474,48 @@ class ResourceCache:
         with self._lock:
             self._cache.clear()
             self._expiry_heap.clear()
+            self._tags.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss counts, hit rate, byte usage and limits.
+
+        Returns:
+            Cache statistics.
+
+        Examples:
+            >>> from mcpgateway.cache.resource_cache import ResourceCache
+            >>> cache = ResourceCache(max_size=10, ttl=60, max_bytes=1024)
+            >>> cache.set('a', 'abcd')
+            >>> _ = cache.get('a'), cache.get('missing')
+            >>> stats = cache.stats()
+            >>> stats["hit_count"], stats["miss_count"], stats["hit_rate"], stats["size"], stats["bytes"]
+            (1, 1, 0.5, 1, 4)
+        """
+        with self._lock:
+            total = self._hit_count + self._miss_count
+            return {
+                "hit_count": self._hit_count,
+                "miss_count": self._miss_count,
+                "hit_rate": self._hit_count / total if total > 0 else 0.0,
+                "eviction_count": self._eviction_count,
+                "oversize_count": self._oversize_count,
+                "size": len(self._cache),
+                "bytes": self._size_bytes,
+                "max_size": self.max_size,
+                "max_bytes": self.max_bytes,
+                "max_entry_bytes": self.max_entry_bytes,
+                "ttl": self.ttl,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss, eviction and oversize counters."""
+        with self._lock:
+            self._hit_count = 0
+            self._miss_count = 0
+            self._eviction_count = 0
+            self._oversize_count = 0
 
     async def _cleanup_loop(self) -> None:
         """Background task to clean expired entries efficiently.
@@ -300,7 +555,7 @@ class ResourceCache:
                 entry = self._cache.get(key)
                 # If entry is present and timestamps match, remove it
                 if entry is not None and entry.expires_at == expires_at:
-                    del self._cache[key]
+                    self._remove(key)
                     removed += 1
 
             # Check if heap needs compaction (done outside lock)
@@ -359,3 +614,12 @@ class ResourceCache:
         """
         with self._lock:
             return len(self._cache)
+
+
+# Shared content cache for upstream resource reads (see ResourceService.read_resource)
+resource_cache = ResourceCache(
+    max_size=settings.resource_cache_size,
+    ttl=settings.resource_cache_ttl,
+    max_bytes=settings.resource_cache_max_bytes,
+    max_entry_bytes=settings.resource_cache_max_entry_bytes,
+)
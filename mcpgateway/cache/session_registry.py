@@ -56,8 +56,6 @@ import logging
 import time
 import traceback
 from typing import Any, Dict, Optional
-from urllib.parse import urlparse
-import uuid
 
 # Third-Party
 from fastapi import HTTPException, status
@@ -71,9 +69,7 @@ from mcpgateway.db import get_db, SessionMessageRecord, SessionRecord
 from mcpgateway.services import PromptService, ResourceService, ToolService
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.transports import SSETransport
-from mcpgateway.utils.create_jwt_token import create_jwt_token
 from mcpgateway.utils.redis_client import get_redis_client
-from mcpgateway.utils.retry_manager import ResilientHttpClient
 from mcpgateway.validation.jsonrpc import JSONRPCError
 
 # Initialize logging service first
@@ -1884,16 +1880,19 @@ class SessionRegistry(SessionBackend):
     async def generate_response(self, message: Dict[str, Any], transport: SSETransport, server_id: Optional[str], user: Dict[str, Any], base_url: str) -> None:
         """Generate and send response for incoming MCP protocol message.
 
-        Processes MCP protocol messages and generates appropriate responses based on
-        the method. Supports various MCP methods including initialization, tool/resource/prompt
-        listing, tool invocation, and ping.
+        Dispatches the message in process through the same handlers as ``/rpc``,
+        with the auth context captured when the SSE connection was authenticated
+        (``user["auth_state"]``), and sends the JSON-RPC response. Messages of a
+        connection without a captured auth state are rejected. Supports various
+        MCP methods including initialization, tool/resource/prompt listing, tool
+        invocation, and ping.
 
         Args:
             message: Incoming MCP message as JSON. Must contain 'method' and 'id' fields.
             transport: SSE transport to send responses through.
             server_id: Optional server ID for scoped operations.
-            user: User information containing authentication token.
-            base_url: Base URL for constructing RPC endpoints.
+            user: User information with the auth token and auth state of the SSE connection.
+            base_url: Base URL of the SSE connection.
 
         Examples:
             >>> import asyncio
@@ -1924,77 +1923,30 @@ class SessionRegistry(SessionBackend):
                 "params": params,
                 "id": req_id,
             }
-            # Get the token from the current authentication context
-            # The user object should contain auth_token, token_teams, and is_admin from the SSE endpoint
-            token = None
-            is_admin = user.get("is_admin", False)  # Preserve admin status from SSE endpoint
+            # Dispatch in process with the auth context of the SSE connection, instead of
+            # an HTTP round trip through /rpc that would authenticate every message again
+            auth_state = user.get("auth_state")
 
             try:
-                if hasattr(user, "get") and user.get("auth_token"):
-                    token = user["auth_token"]
-                else:
-                    # Fallback: create lightweight session token (teams resolved server-side by downstream /rpc)
-                    logger.warning("No auth token available for SSE RPC call - creating fallback session token")
-                    now = datetime.now(timezone.utc)
-                    payload = {
-                        "sub": user.get("email", "system"),
-                        "iss": settings.jwt_issuer,
-                        "aud": settings.jwt_audience,
-                        "iat": int(now.timestamp()),
-                        "jti": str(uuid.uuid4()),
-                        "token_use": "session",  # nosec B105 - token type marker, not a password
-                        "user": {
-                            "email": user.get("email", "system"),
-                            "full_name": user.get("full_name", "System"),
-                            "is_admin": is_admin,  # Preserve admin status for cookie-authenticated admins
-                            "auth_provider": "internal",
-                        },
-                    }
-                    # Generate token using centralized token creation
-                    token = await create_jwt_token(payload)
+                if auth_state is None:
+                    # Fail closed: admin scope and teams must come from the verified token, never from the user dict
+                    raise JSONRPCError(-32000, "Authentication required")
+
+                # First-Party
+                from mcpgateway.main import dispatch_rpc_message  # pylint: disable=import-outside-toplevel
 
                 # Pass downstream session id to /rpc for session affinity.
                 # This is gateway-internal only; the pool strips it before contacting upstream MCP servers.
+                headers = {"content-type": "application/json"}
+                if user.get("auth_token"):
+                    headers["authorization"] = f"Bearer {user['auth_token']}"
                 if settings.mcpgateway_session_affinity_enabled:
-                    await self._register_session_mapping(transport.session_id, message, user.get("email") if hasattr(user, "get") else None)
-
-                headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-                if settings.mcpgateway_session_affinity_enabled:
+                    await self._register_session_mapping(transport.session_id, message, user.get("email"))
                     headers["x-mcp-session-id"] = transport.session_id
-                # Extract root URL from base_url (remove /servers/{id} path)
-                parsed_url = urlparse(base_url)
-                # Preserve the path up to the root path (before /servers/{id})
-                path_parts = parsed_url.path.split("/")
-                if "/servers/" in parsed_url.path:
-                    # Find the index of 'servers' and take everything before it
-                    try:
-                        servers_index = path_parts.index("servers")
-                        root_path = "/" + "/".join(path_parts[1:servers_index]).strip("/")
-                        if root_path == "/":
-                            root_path = ""
-                    except ValueError:
-                        root_path = ""
-                else:
-                    root_path = parsed_url.path.rstrip("/")
-
-                root_url = f"{parsed_url.scheme}://{parsed_url.netloc}{root_path}"
-                rpc_url = root_url + "/rpc"
-
-                logger.info(f"SSE RPC: Making call to {rpc_url} with method={method}, params={params}")
-
-                async with ResilientHttpClient(client_args={"timeout": settings.federation_timeout, "verify": not settings.skip_ssl_verify}) as client:
-                    logger.info(f"SSE RPC: Sending request to {rpc_url}")
-                    rpc_response = await client.post(
-                        url=rpc_url,
-                        json=rpc_input,
-                        headers=headers,
-                    )
-                    logger.info(f"SSE RPC: Got response status {rpc_response.status_code}")
-                    result = rpc_response.json()
-                    logger.info(f"SSE RPC: Response content: {result}")
-                    result = result.get("result", {})
 
-                response = {"jsonrpc": "2.0", "result": result, "id": req_id}
+                logger.debug(f"SSE RPC: Dispatching method={method}")
+                response = await dispatch_rpc_message(rpc_input, user, auth_state=auth_state, headers=headers)
+                response["id"] = req_id
             except JSONRPCError as e:
                 logger.error(f"SSE RPC: JSON-RPC error: {e}")
                 result = e.to_dict()
@@ -0,0 +1,559 @@
+# -*- coding: utf-8 -*-
+"""Tool result cache with L1 memory + L2 Redis and single-flight deduplication.
+
+``ToolService.invoke_tool`` consults this cache for tools that opt in through
+their annotations (``readOnlyHint`` or ``idempotentHint``, or an explicit
+``cacheTtlSeconds``). A hit returns the stored result without contacting the
+upstream server. Concurrent identical calls on one worker share a single
+upstream call: the first caller invokes the tool, the others wait for its
+result.
+
+Entries are keyed by tool id, canonicalized arguments and the caller's scope
+(user, token teams and virtual server), so a result is only served back to
+callers with the same visibility. L1 is a per-worker LRU bounded by entry
+count and total size; L2 (optional) is Redis, shared across workers.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-Party
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Tool annotations that make a tool eligible for result caching
+CACHEABLE_HINTS = ("readOnlyHint", "idempotentHint")
+
+
+@dataclass
+class CacheEntry:
+    """Serialized tool result with owning tool and expiry timestamp."""
+
+    value: bytes
+    tool_id: str
+    expiry: float
+
+    def is_expired(self) -> bool:
+        """Return True if the cache entry has expired.
+
+        Returns:
+            True if expired, otherwise False.
+
+        Examples:
+            >>> from unittest.mock import patch
+            >>> with patch("time.time", return_value=1000):
+            ...     CacheEntry(value=b"{}", tool_id="t", expiry=999).is_expired()
+            True
+        """
+        return time.time() >= self.expiry
+
+
+class ToolResultCache:
+    """Two-tier cache of tool invocation results.
+
+    L1: in-memory LRU per worker, bounded by entry count and total bytes.
+    L2: Redis (optional, shared across workers).
+
+    Examples:
+        >>> import asyncio
+        >>> cache = ToolResultCache(enabled=True, ttl=60, max_entries=10, max_bytes=1024, l2_enabled=False)
+        >>> key = cache.make_key("tool-1", {"q": "x"}, user_email="a@example.com", token_teams=None)
+        >>> async def run():
+        ...     value, ticket = await cache.lookup(key)
+        ...     await cache.complete(key, "tool-1", {"content": []}, ticket)
+        ...     return value, await cache.lookup(key)
+        >>> asyncio.run(run())
+        (None, ({'content': []}, None))
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+        l2_enabled: Optional[bool] = None,
+    ) -> None:
+        """Initialize cache settings and in-memory structures.
+
+        Args:
+            enabled: Whether caching is enabled (default: from settings or False)
+            ttl: Default entry lifetime in seconds (default: from settings or 60)
+            max_entries: Maximum L1 entries (default: from settings or 1000)
+            max_bytes: Maximum total size of L1 entries in bytes (default: from settings or 64 MiB)
+            max_entry_bytes: Results larger than this are not cached (default: from settings or 1 MiB)
+            l2_enabled: Whether to use Redis as L2 (default: from settings when cache_type=redis)
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._enabled = enabled if enabled is not None else getattr(settings, "tool_result_cache_enabled", False)
+            self._ttl_seconds = ttl or getattr(settings, "tool_result_cache_ttl_seconds", 60)
+            self._max_entries = max_entries or getattr(settings, "tool_result_cache_max_entries", 1000)
+            self._max_bytes = max_bytes or getattr(settings, "tool_result_cache_max_bytes", 64 * 1024 * 1024)
+            self._max_entry_bytes = max_entry_bytes or getattr(settings, "tool_result_cache_max_entry_bytes", 1024 * 1024)
+            if l2_enabled is None:
+                l2_enabled = getattr(settings, "tool_result_cache_l2_enabled", True) and settings.cache_type == "redis"
+            self._l2_enabled = l2_enabled
+            self._cache_prefix = getattr(settings, "cache_prefix", "mcpgw:")
+        except ImportError:
+            self._enabled = bool(enabled)
+            self._ttl_seconds = ttl or 60
+            self._max_entries = max_entries or 1000
+            self._max_bytes = max_bytes or 64 * 1024 * 1024
+            self._max_entry_bytes = max_entry_bytes or 1024 * 1024
+            self._l2_enabled = bool(l2_enabled)
+            self._cache_prefix = "mcpgw:"
+
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        # key -> future resolved by the caller that is invoking the tool
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self._redis_checked = False
+        self._redis_available = False
+
+        self._l1_hit_count = 0
+        self._l2_hit_count = 0
+        self._miss_count = 0
+        self._coalesced_count = 0
+        self._eviction_count = 0
+        self._oversize_count = 0
+
+        logger.info(
+            "ToolResultCache initialized: enabled=%s max_entries=%s max_bytes=%s ttl=%ss l2_enabled=%s",
+            self._enabled,
+            self._max_entries,
+            self._max_bytes,
+            self._ttl_seconds,
+            self._l2_enabled,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache is enabled.
+
+        Returns:
+            True if enabled, otherwise False.
+        """
+        return self._enabled
+
+    def ttl_for(self, annotations: Optional[Dict[str, Any]]) -> Optional[int]:
+        """Return the cache TTL for a tool, or None if its results must not be cached.
+
+        A tool opts in with ``readOnlyHint`` or ``idempotentHint`` set to true.
+        ``cacheTtlSeconds`` overrides the default TTL; 0 disables caching.
+
+        Args:
+            annotations: Tool annotations.
+
+        Returns:
+            TTL in seconds, or None.
+
+        Examples:
+            >>> cache = ToolResultCache(enabled=True, ttl=60, l2_enabled=False)
+            >>> cache.ttl_for({"readOnlyHint": True}), cache.ttl_for({"idempotentHint": True, "cacheTtlSeconds": 5})
+            (60, 5)
+            >>> cache.ttl_for({}), cache.ttl_for(None), cache.ttl_for({"readOnlyHint": True, "cacheTtlSeconds": 0})
+            (None, None, None)
+            >>> cache.ttl_for({"cacheTtlSeconds": 30})
+            30
+        """
+        if not annotations:
+            return None
+        explicit = annotations.get("cacheTtlSeconds")
+        if isinstance(explicit, (int, float)) and not isinstance(explicit, bool):
+            return int(explicit) if explicit > 0 else None
+        if any(annotations.get(hint) is True for hint in CACHEABLE_HINTS):
+            return self._ttl_seconds
+        return None
+
+    @staticmethod
+    def make_key(tool_id: str, arguments: Optional[Dict[str, Any]], user_email: Optional[str], token_teams: Optional[List[str]], server_id: Optional[str] = None) -> str:
+        """Build the cache key for a call.
+
+        Arguments are canonicalized (sorted keys), so argument order does not
+        matter. ``token_teams=None`` (unrestricted) and ``[]`` (public only)
+        are different scopes.
+
+        Args:
+            tool_id: Tool ID.
+            arguments: Tool arguments.
+            user_email: Calling user.
+            token_teams: Team IDs from the caller's token.
+            server_id: Virtual server the call was made through.
+
+        Returns:
+            Hex SHA-256 digest.
+
+        Examples:
+            >>> k = ToolResultCache.make_key
+            >>> k("t", {"a": 1, "b": 2}, "u", ["x", "y"]) == k("t", {"b": 2, "a": 1}, "u", ["y", "x"])
+            True
+            >>> k("t", {"a": 1}, "u", None) == k("t", {"a": 1}, "u", [])
+            False
+            >>> k("t", {"a": 1}, "u", None) == k("t", {"a": 1}, "v", None)
+            False
+        """
+        scope = [tool_id, arguments or {}, user_email, sorted(token_teams) if token_teams is not None else None, server_id]
+        return hashlib.sha256(orjson.dumps(scope, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+    def _redis_key(self, key: str) -> str:
+        """Build the Redis key for a cached result.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Redis key.
+        """
+        return f"{self._cache_prefix}tool_result:key:{key}"
+
+    def _tool_set_key(self, tool_id: str) -> str:
+        """Build the Redis set key listing the cached results of a tool.
+
+        Args:
+            tool_id: Tool ID.
+
+        Returns:
+            Redis set key.
+        """
+        return f"{self._cache_prefix}tool_result:tool:{tool_id}"
+
+    async def _get_redis_client(self):
+        """Return a Redis client if L2 is enabled and available.
+
+        Returns:
+            Redis client instance or None.
+        """
+        if not self._l2_enabled:
+            return None
+        try:
+            # First-Party
+            from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+            client = await get_redis_client()
+            if client and not self._redis_checked:
+                self._redis_checked = True
+                self._redis_available = True
+            return client
+        except Exception:
+            if not self._redis_checked:
+                self._redis_checked = True
+                self._redis_available = False
+            return None
+
+    def _get_l1(self, key: str) -> Optional[bytes]:
+        """Fetch a serialized result from L1 if present and not expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Serialized result or None.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and not entry.is_expired():
+                self._cache.move_to_end(key)
+                self._l1_hit_count += 1
+                return entry.value
+            if entry:
+                self._drop(key)
+        return None
+
+    def _drop(self, key: str) -> None:
+        """Remove an L1 entry (caller holds the lock).
+
+        Args:
+            key: Cache key.
+        """
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= len(entry.value)
+
+    def _set_l1(self, key: str, tool_id: str, data: bytes, ttl: float) -> None:
+        """Store a serialized result in L1, evicting least recently used entries to stay within bounds.
+
+        Args:
+            key: Cache key.
+            tool_id: Tool ID.
+            data: Serialized result.
+            ttl: Time to live in seconds.
+
+        Examples:
+            >>> cache = ToolResultCache(enabled=True, max_entries=10, max_bytes=10, l2_enabled=False)
+            >>> for key in ("a", "b", "c"):
+            ...     cache._set_l1(key, "t", b"1234", 60)
+            >>> list(cache._cache), cache.stats()["l1_bytes"]
+            (['b', 'c'], 8)
+        """
+        with self._lock:
+            self._drop(key)
+            while self._cache and (len(self._cache) >= self._max_entries or self._size_bytes + len(data) > self._max_bytes):
+                oldest = next(iter(self._cache))
+                self._drop(oldest)
+                self._eviction_count += 1
+            self._cache[key] = CacheEntry(value=data, tool_id=tool_id, expiry=time.time() + ttl)
+            self._size_bytes += len(data)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``key``, checking L1 then L2.
+
+        Args:
+            key: Cache key from ``make_key``.
+
+        Returns:
+            Fresh copy of the cached result, or None on a miss.
+        """
+        if not self._enabled:
+            return None
+
+        data = self._get_l1(key)
+        if data is not None:
+            return orjson.loads(data)
+
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                data = await redis.get(self._redis_key(key))
+                if data:
+                    if isinstance(data, str):
+                        data = data.encode()
+                    tool_id, _, payload = data.partition(b"\n")
+                    ttl = await redis.ttl(self._redis_key(key))
+                    self._l2_hit_count += 1
+                    self._set_l1(key, tool_id.decode(), payload, ttl if ttl and ttl > 0 else self._ttl_seconds)
+                    return orjson.loads(payload)
+            except Exception as exc:
+                logger.debug("ToolResultCache Redis get failed: %s", exc)
+
+        self._miss_count += 1
+        return None
+
+    async def set(self, key: str, tool_id: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a result in L1 and L2.
+
+        Results whose serialized size exceeds the per-entry limit are not cached.
+
+        Args:
+            key: Cache key from ``make_key``.
+            tool_id: Tool ID (for invalidation).
+            value: JSON-serializable result.
+            ttl: Time to live in seconds (defaults to configured TTL).
+
+        Examples:
+            >>> import asyncio
+            >>> cache = ToolResultCache(enabled=True, max_entry_bytes=16, l2_enabled=False)
+            >>> asyncio.run(cache.set("k", "t", {"text": "x" * 100}))
+            >>> asyncio.run(cache.get("k")) is None, cache.stats()["oversize_count"]
+            (True, 1)
+        """
+        if not self._enabled:
+            return
+
+        data = orjson.dumps(value)
+        if len(data) > self._max_entry_bytes:
+            self._oversize_count += 1
+            return
+
+        effective_ttl = ttl if ttl is not None else self._ttl_seconds
+        self._set_l1(key, tool_id, data, effective_ttl)
+
+        redis = await self._get_redis_client()
+        if not redis:
+            return
+
+        try:
+            await redis.setex(self._redis_key(key), effective_ttl, tool_id.encode() + b"\n" + data)
+            set_key = self._tool_set_key(tool_id)
+            await redis.sadd(set_key, key)
+            await redis.expire(set_key, max(effective_ttl, self._ttl_seconds))
+        except Exception as exc:
+            logger.debug("ToolResultCache Redis set failed: %s", exc)
+
+    async def lookup(self, key: str, wait_timeout: Optional[float] = None) -> Tuple[Optional[Dict[str, Any]], Optional[asyncio.Future]]:
+        """Return a cached result, waiting for an identical in-flight call if there is one.
+
+        On a miss with no call in flight, the caller becomes the one invoking
+        the tool and receives a ticket; it must pass the ticket to ``complete``
+        whatever the outcome. If the awaited call fails or does not finish
+        within ``wait_timeout``, the waiting callers get ``(None, None)`` and
+        invoke the tool themselves.
+
+        Args:
+            key: Cache key from ``make_key``.
+            wait_timeout: Maximum seconds to wait for an in-flight call (None waits until it completes).
+
+        Returns:
+            Tuple of the cached result (or None) and the caller's ticket (or None).
+
+        Examples:
+            >>> import asyncio
+            >>> cache = ToolResultCache(enabled=True, l2_enabled=False)
+            >>> async def run():
+            ...     _, ticket = await cache.lookup("k")
+            ...     waiter = asyncio.ensure_future(cache.lookup("k"))
+            ...     await asyncio.sleep(0)
+            ...     await cache.complete("k", "t", {"content": ["ok"]}, ticket)
+            ...     return await waiter
+            >>> asyncio.run(run())
+            ({'content': ['ok']}, None)
+            >>> cache.stats()["coalesced_count"]
+            1
+            >>> async def stuck():
+            ...     _, ticket = await cache.lookup("s")
+            ...     return await cache.lookup("s", wait_timeout=0.01), ticket.done()
+            >>> asyncio.run(stuck())
+            ((None, None), False)
+        """
+        value = await self.get(key)
+        if value is not None or not self._enabled:
+            return value, None
+
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self._coalesced_count += 1
+            # shield: a cancelled or timed out waiter must not cancel the shared call
+            try:
+                data = await asyncio.wait_for(asyncio.shield(flight), timeout=wait_timeout)
+            except asyncio.TimeoutError:
+                logger.debug("ToolResultCache gave up waiting for in-flight call after %ss", wait_timeout)
+                return None, None
+            return (orjson.loads(data) if data is not None else None), None
+
+        ticket = asyncio.get_running_loop().create_future()
+        self._inflight[key] = ticket
+        return None, ticket
+
+    async def complete(self, key: str, tool_id: str, value: Optional[Dict[str, Any]], ticket: Optional[asyncio.Future], ttl: Optional[int] = None) -> None:
+        """Store the result of a call and wake up the callers waiting for it.
+
+        Args:
+            key: Cache key from ``make_key``.
+            tool_id: Tool ID.
+            value: Result to cache, or None if the call failed or must not be cached.
+            ticket: Ticket returned by ``lookup`` (None for callers that did not hold one).
+            ttl: Time to live in seconds (defaults to configured TTL).
+        """
+        data: Optional[bytes] = None
+        try:
+            if value is not None:
+                await self.set(key, tool_id, value, ttl)
+                data = orjson.dumps(value)
+        finally:
+            if ticket is not None:
+                if self._inflight.get(key) is ticket:
+                    del self._inflight[key]
+                if not ticket.done():
+                    ticket.set_result(data)
+
+    def _invalidate_local(self, tool_id: Optional[str] = None) -> int:
+        """Drop L1 entries for a tool (or all entries) without touching L2.
+
+        Args:
+            tool_id: Tool ID, or None for all entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._cache.items() if tool_id is None or entry.tool_id == tool_id]
+            for key in keys:
+                self._drop(key)
+        return len(keys)
+
+    async def invalidate_tool(self, tool_id: str) -> None:
+        """Drop all cached results of a tool, in this worker and in Redis.
+
+        Args:
+            tool_id: Tool ID.
+
+        Examples:
+            >>> import asyncio
+            >>> cache = ToolResultCache(enabled=True, l2_enabled=False)
+            >>> asyncio.run(cache.set("k1", "t1", {"r": 1}))
+            >>> asyncio.run(cache.set("k2", "t2", {"r": 2}))
+            >>> asyncio.run(cache.invalidate_tool("t1"))
+            >>> asyncio.run(cache.get("k1")) is None, asyncio.run(cache.get("k2"))
+            (True, {'r': 2})
+        """
+        if not self._enabled:
+            return
+
+        self._invalidate_local(tool_id)
+
+        redis = await self._get_redis_client()
+        if not redis:
+            return
+
+        set_key = self._tool_set_key(tool_id)
+        try:
+            keys = await redis.smembers(set_key)
+            if keys:
+                await redis.delete(*[self._redis_key(key.decode() if isinstance(key, bytes) else key) for key in keys])
+            await redis.delete(set_key)
+            await redis.publish("mcpgw:cache:invalidate", f"tool_result:{tool_id}")
+        except Exception as exc:
+            logger.debug("ToolResultCache Redis invalidate_tool failed: %s", exc)
+
+    def invalidate_all_local(self) -> None:
+        """Clear all L1 cache entries."""
+        self._invalidate_local()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache hit/miss statistics and configuration.
+
+        Returns:
+            Cache stats and settings.
+        """
+        hits = self._l1_hit_count + self._l2_hit_count
+        total = hits + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "l1_hit_count": self._l1_hit_count,
+            "l2_hit_count": self._l2_hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": hits / total if total > 0 else 0.0,
+            "coalesced_count": self._coalesced_count,
+            "eviction_count": self._eviction_count,
+            "oversize_count": self._oversize_count,
+            "l1_size": len(self._cache),
+            "l1_bytes": self._size_bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "max_entry_bytes": self._max_entry_bytes,
+            "ttl_seconds": self._ttl_seconds,
+            "l2_enabled": self._l2_enabled,
+            "redis_available": self._redis_available,
+            "inflight": len(self._inflight),
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self._l1_hit_count = 0
+        self._l2_hit_count = 0
+        self._miss_count = 0
+        self._coalesced_count = 0
+        self._eviction_count = 0
+        self._oversize_count = 0
+
+
+tool_result_cache = ToolResultCache()
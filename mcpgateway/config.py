@@ -22,6 +22,7 @@ Environment variables:
 - DOCS_ALLOW_BASIC_AUTH: Allow basic auth for docs (default: False)
 - RESOURCE_CACHE_SIZE: Max cached resources (default: 1000)
 - RESOURCE_CACHE_TTL: Cache TTL in seconds (default: 3600)
+- RESOURCE_CACHE_ENABLED: Cache upstream resource content (default: False)
 - TOOL_TIMEOUT: Tool invocation timeout (default: 60)
 - PROMPT_CACHE_SIZE: Max cached prompts (default: 100)
 - HEALTH_CHECK_INTERVAL: Gateway health check interval (default: 300)
@@ -259,6 +260,11 @@ class Settings(BaseSettings):
     embed_environment_in_tokens: bool = Field(default=False, description="Embed environment claim in gateway-issued JWTs for environment isolation")
     validate_token_environment: bool = Field(default=False, description="Reject tokens with mismatched environment claim (tokens without env claim are allowed)")
 
+    # Verified JWT cache (skips repeated signature verification for the same token)
+    jwt_verify_cache_enabled: bool = Field(default=True, description="Cache verified JWT payloads per worker, keyed by token digest")
+    jwt_verify_cache_ttl: int = Field(default=300, ge=1, le=3600, description="Maximum seconds a verified payload is reused (never beyond the token's exp)")
+    jwt_verify_cache_max_size: int = Field(default=10000, ge=100, le=1000000, description="Maximum verified tokens cached per worker (LRU eviction)")
+
     # JSON Schema Validation for registration (Tool Input Schemas, Prompt schemas, etc)
     json_schema_validation_strict: bool = Field(default=True, description="Strict schema validation mode - reject invalid JSON schemas")
 
@@ -306,6 +312,7 @@ class Settings(BaseSettings):
     allowed_roots: List[str] = Field(default_factory=list, description="Allowed root paths for resource access")
     max_path_depth: int = Field(default=10, description="Maximum allowed path depth")
     max_param_length: int = Field(default=10000, description="Maximum parameter length")
+    validation_max_body_bytes: int = Field(default=10 * 1024 * 1024, ge=1024, description="Maximum JSON request body size (bytes) accepted by the validation middleware")
     dangerous_patterns: List[str] = Field(
         default_factory=lambda: [
             r"[;&|`$(){}\[\]<>]",  # Shell metacharacters
@@ -581,6 +588,11 @@ class Settings(BaseSettings):
     # Tool Execution Cancellation
     mcpgateway_tool_cancellation_enabled: bool = Field(default=True, description="Enable gateway-authoritative tool execution cancellation with REST API endpoints")
 
+    # JSON-RPC Batch Requests
+    mcpgateway_rpc_batch_enabled: bool = Field(default=True, description="Accept JSON-RPC 2.0 batch requests (JSON arrays) on /rpc")
+    mcpgateway_rpc_batch_max_size: int = Field(default=100, ge=1, description="Maximum number of requests allowed in a single JSON-RPC batch")
+    mcpgateway_rpc_batch_concurrency: int = Field(default=10, ge=1, description="Maximum number of batch entries dispatched concurrently per batch")
+
     # A2A (Agent-to-Agent) Feature Flags
     mcpgateway_a2a_enabled: bool = True
     mcpgateway_a2a_max_agents: int = 100
@@ -1193,6 +1205,12 @@ class Settings(BaseSettings):
     # Enable span events
     observability_events_enabled: bool = Field(default=True, description="Enable event logging within spans")
 
+    # Buffered span export (traces are assembled in memory and bulk-inserted by a background task)
+    observability_buffer_enabled: bool = Field(default=True, description="Buffer traces in memory and export them in bulk instead of writing each span synchronously")
+    observability_buffer_max_size: int = Field(default=10000, ge=100, description="Maximum queued traces before new traces are dropped")
+    observability_buffer_flush_interval: float = Field(default=2.0, gt=0, le=60, description="Seconds between span buffer flushes")
+    observability_buffer_batch_size: int = Field(default=500, ge=1, le=10000, description="Maximum traces written per bulk insert transaction")
+
     # Correlation ID Settings
     correlation_id_enabled: bool = Field(default=True, description="Enable automatic correlation ID tracking for requests")
     correlation_id_header: str = Field(default="X-Correlation-ID", description="HTTP header name for correlation ID")
@@ -1252,10 +1270,25 @@ class Settings(BaseSettings):
     security_threat_score_alert: float = Field(default=0.7, description="Threat score threshold for alerts (0.0-1.0)")
     security_rate_limit_window_minutes: int = Field(default=5, description="Time window for rate limit checks (minutes)")
 
+    # Log Write Buffer Configuration (batches structured log, security event and audit trail inserts)
+    log_write_buffer_enabled: bool = Field(default=True, description="Queue structured log, security event and audit trail rows and insert them in batches from a background task")
+    log_write_buffer_max_size: int = Field(default=10000, ge=100, description="Maximum queued log rows before the overflow policy applies")
+    log_write_buffer_flush_interval: float = Field(default=1.0, gt=0, le=60, description="Seconds between log write buffer flushes")
+    log_write_buffer_batch_size: int = Field(default=500, ge=1, le=10000, description="Maximum log rows written per transaction")
+    log_write_buffer_overflow_policy: Literal["write_through", "drop"] = Field(
+        default="write_through",
+        description="When the log write buffer is full: 'write_through' = the caller writes the row synchronously (back-pressure), 'drop' = discard the row",
+    )
+
     # API Token Tracking Configuration
     # Controls how token usage and last_used timestamps are tracked
     token_usage_logging_enabled: bool = Field(default=True, description="Enable API token usage logging middleware")
     token_last_used_update_interval_minutes: int = Field(default=5, ge=1, le=1440, description="Minimum minutes between last_used timestamp updates (rate-limits DB writes)")
+    token_usage_rollup_enabled: bool = Field(default=True, description="Aggregate API token usage into per-minute counters flushed in batches, and compute usage stats from them")
+    token_usage_rollup_flush_interval: float = Field(default=30.0, gt=0, le=300, description="Seconds between token usage rollup flushes")
+    token_usage_raw_log_sample_rate: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="Fraction of API token requests also written as raw token_usage_logs rows when rollups are enabled (0 = none, 1 = all)"
+    )
 
     # Metrics Aggregation Configuration
     metrics_aggregation_enabled: bool = Field(default=True, description="Enable automatic log aggregation into performance metrics")
@@ -1315,6 +1348,12 @@ class Settings(BaseSettings):
     auth_cache_teams_ttl: int = Field(default=60, ge=10, le=300, description="TTL in seconds for user teams list cache")
     auth_cache_batch_queries: bool = Field(default=True, description="Batch auth DB queries into single call (reduces 3 queries to 1)")
 
+    # Permission Decision Cache Configuration (shares RBAC decisions across requests)
+    permission_cache_enabled: bool = Field(default=True, description="Cache RBAC permission decisions across requests (bypassed when PERMISSION_AUDIT_ENABLED=true)")
+    permission_cache_ttl: int = Field(default=60, ge=5, le=600, description="TTL in seconds for cached permission decisions")
+    permission_cache_max_size: int = Field(default=10000, ge=100, le=1000000, description="Maximum permission decisions kept in memory per worker (LRU eviction)")
+    permission_cache_l2_enabled: bool = Field(default=True, description="Share permission decisions across workers via Redis (requires CACHE_TYPE=redis)")
+
     # Registry Cache Configuration (reduces DB queries for list endpoints)
     registry_cache_enabled: bool = Field(default=True, description="Enable caching for registry list endpoints (tools, prompts, resources, etc.)")
     registry_cache_tools_ttl: int = Field(default=20, ge=5, le=300, description="TTL in seconds for tools list cache")
@@ -1332,6 +1371,14 @@ class Settings(BaseSettings):
     tool_lookup_cache_l1_maxsize: int = Field(default=10000, ge=100, le=1000000, description="Max entries for in-memory tool lookup cache (L1)")
     tool_lookup_cache_l2_enabled: bool = Field(default=True, description="Enable Redis-backed tool lookup cache (L2) when cache_type=redis")
 
+    # Tool Result Cache Configuration (serves repeated calls to read-only/idempotent tools without contacting the upstream server)
+    tool_result_cache_enabled: bool = Field(default=False, description="Enable tool result cache for tools annotated readOnlyHint or idempotentHint")
+    tool_result_cache_ttl_seconds: int = Field(default=60, ge=1, le=86400, description="Default TTL in seconds for cached tool results (per-tool override: cacheTtlSeconds annotation)")
+    tool_result_cache_max_entries: int = Field(default=1000, ge=10, le=1000000, description="Max entries for in-memory tool result cache (L1)")
+    tool_result_cache_max_bytes: int = Field(default=64 * 1024 * 1024, ge=1024, description="Max total size in bytes of in-memory tool result cache (L1)")
+    tool_result_cache_max_entry_bytes: int = Field(default=1024 * 1024, ge=1, description="Results larger than this many bytes (serialized) are not cached")
+    tool_result_cache_l2_enabled: bool = Field(default=True, description="Enable Redis-backed tool result cache (L2) when cache_type=redis")
+
     # Admin Stats Cache Configuration (reduces dashboard query overhead)
     admin_stats_cache_enabled: bool = Field(default=True, description="Enable caching for admin dashboard statistics")
     admin_stats_cache_system_ttl: int = Field(default=60, ge=10, le=300, description="TTL in seconds for system stats cache")
@@ -1446,6 +1493,12 @@ class Settings(BaseSettings):
     # Resources
     resource_cache_size: int = 1000
     resource_cache_ttl: int = 3600  # seconds
+    resource_cache_enabled: bool = Field(default=False, description="Serve repeated reads of gateway resources from the in-memory resource content cache")
+    resource_cache_max_bytes: int = Field(default=64 * 1024 * 1024, ge=1024, description="Max total size in bytes of cached resource content per worker")
+    resource_cache_max_entry_bytes: int = Field(default=1024 * 1024, ge=1, description="Resource contents larger than this many bytes are not cached")
+    resource_cache_ttl_overrides: Dict[str, int] = Field(
+        default_factory=dict, description="Per-resource/gateway cache TTL in seconds, 0 disables caching (JSON: {resource_uri_or_gateway_id_or_gateway_name: ttl})"
+    )
     max_resource_size: int = 10 * 1024 * 1024  # 10MB
     allowed_mime_types: Set[str] = {
         "text/plain",
@@ -1462,8 +1515,21 @@ class Settings(BaseSettings):
     tool_timeout: int = 60  # seconds
     max_tool_retries: int = 3
     tool_rate_limit: int = 100  # requests per minute
+    tool_rate_limit_enabled: bool = Field(default=False, description="Enforce tool_rate_limit per token (per user without one) in invoke_tool (GCRA, shared across workers via Redis when cache_type=redis)")
+    tool_rate_limit_per_team: int = Field(default=0, ge=0, description="Tool calls per minute allowed for each team in the caller's token (0 = unlimited)")
+    tool_rate_limit_per_tool: int = Field(default=0, ge=0, description="Calls per minute allowed for each tool across all callers (0 = unlimited)")
+    tool_rate_limit_shared_file: Optional[str] = Field(
+        default=None, description="Without Redis, keep rate limit buckets in this memory-mapped file shared by all workers of the host (unset = per-worker buckets)"
+    )
     tool_concurrent_limit: int = 10
 
+    # Tool discovery meta-tool (BM25 search over a virtual server's tools)
+    tool_discovery_enabled: bool = Field(default=False, description="Offer a built-in search tool on virtual servers with many tools and list it instead of the full catalog")
+    tool_discovery_min_tools: int = Field(default=100, ge=0, description="Virtual servers with at least this many tools list only the discovery tool in tools/list")
+    tool_discovery_tool_name: str = Field(default="search_tools", min_length=1, description="Name of the discovery meta-tool")
+    tool_discovery_default_k: int = Field(default=10, ge=1, le=100, description="Tools returned by a discovery search when k is not given")
+    tool_discovery_max_k: int = Field(default=50, ge=1, le=500, description="Upper bound on k for a discovery search")
+
     # MCP Session Pool - reduces per-request latency from ~20ms to ~1-2ms
     # Disabled by default for safety. Enable explicitly in production after testing.
     mcp_session_pool_enabled: bool = False
@@ -1475,6 +1541,9 @@ class Settings(BaseSettings):
     mcp_session_pool_circuit_breaker_threshold: int = 5  # Failures before circuit opens
     mcp_session_pool_circuit_breaker_reset: float = 60.0  # Seconds before circuit resets
     mcp_session_pool_idle_eviction: float = 600.0  # Evict idle pool keys after this time
+    # Concurrent requests multiplexed over one pooled session (1 = exclusive use per request).
+    # Values > 1 share each session among up to N callers, picking the least-loaded session.
+    mcp_session_pool_max_concurrent_per_session: int = 1
     # Transport timeout for pooled sessions (default 30s to match MCP SDK default).
     # This timeout applies to all HTTP operations (connect, read, write) on pooled sessions.
     # Use a higher value for deployments with long-running tool calls.
@@ -1555,6 +1624,13 @@ class Settings(BaseSettings):
     unhealthy_threshold: int = 3
     # Max concurrent health checks per worker
     max_concurrent_health_checks: int = 10
+    # Per-gateway timer-wheel scheduling with backoff and passive health (see services/health_check_scheduler.py)
+    health_check_scheduler_enabled: bool = Field(default=False, description="Schedule each gateway's health check individually instead of sweeping all gateways every interval")
+    health_check_max_backoff: float = Field(default=4.0, ge=1.0, le=64.0, description="Max interval multiplier for gateways that keep passing health checks")
+    health_check_jitter: float = Field(default=0.1, ge=0.0, le=0.5, description="Random +/- fraction applied to each gateway's health check interval")
+    # Consistent-hash sharding of health checks across all workers (see services/shard_membership.py)
+    health_check_sharding_enabled: bool = Field(default=False, description="Split gateway health checks and auto-refresh across all live workers instead of a single leader")
+    health_check_shard_ttl: int = Field(default=30, ge=3, description="Seconds without heartbeat before a worker's gateways are reassigned")
 
     # Auto-refresh tools/resources/prompts from gateways during health checks
     # When enabled, tools/resources/prompts are fetched and synced with DB during health checks
@@ -1618,6 +1694,12 @@ class Settings(BaseSettings):
     # SQLite busy timeout: Maximum time (ms) SQLite will wait to acquire a database lock before returning SQLITE_BUSY.
     db_sqlite_busy_timeout: int = Field(default=5000, ge=1000, le=60000, description="SQLite busy timeout in milliseconds (default: 5000ms)")
 
+    # Optional async engine for request hot paths (tool lookup, tool listing, auth context).
+    # The synchronous engine remains the default and is used whenever the async engine
+    # is disabled or its driver (aiosqlite / asyncpg) is not installed.
+    db_async_enabled: bool = Field(default=False, description="Use an async SQLAlchemy engine (aiosqlite/asyncpg) for hot read paths")
+    db_async_url: Optional[str] = Field(default=None, description="Explicit async database URL (derived from DATABASE_URL when unset)")
+
     # Cache
     cache_type: Literal["redis", "memory", "none", "database"] = "database"  # memory or redis or database
     redis_url: Optional[str] = "redis://localhost:6379/0"
@@ -22,21 +22,23 @@ Examples:
 """
 
 # Standard
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta, timezone
+import importlib.util
 import logging
 import os
-from typing import Any, cast, Dict, Generator, List, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Callable, cast, Dict, Generator, List, Optional, Sequence, TYPE_CHECKING
 import uuid
 
 # Third-Party
 import jsonschema
-from sqlalchemy import Boolean, Column, create_engine, DateTime, event, Float, ForeignKey, func, Index
+from sqlalchemy import BigInteger, Boolean, Column, create_engine, DateTime, event, Float, ForeignKey, func, Index
 from sqlalchemy import inspect as sa_inspect
 from sqlalchemy import Integer, JSON, make_url, MetaData, select, String, Table, text, Text, UniqueConstraint, VARCHAR
 from sqlalchemy.engine import Engine
 from sqlalchemy.event import listen
 from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, joinedload, Mapped, mapped_column, relationship, Session, sessionmaker
 from sqlalchemy.orm.attributes import get_history
@@ -270,33 +272,34 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-# Configure SQLite for better concurrency if using SQLite
-if backend == "sqlite":
+def set_sqlite_pragma(dbapi_conn, _connection_record):
+    """Set SQLite pragmas for better concurrency.
 
-    @event.listens_for(engine, "connect")
-    def set_sqlite_pragma(dbapi_conn, _connection_record):
-        """Set SQLite pragmas for better concurrency.
+    This is critical for running with multiple gunicorn workers.
+    WAL mode allows multiple readers and a single writer concurrently.
 
-        This is critical for running with multiple gunicorn workers.
-        WAL mode allows multiple readers and a single writer concurrently.
+    Args:
+        dbapi_conn: The raw DBAPI connection.
+        _connection_record: A SQLAlchemy-specific object that maintains
+            information about the connection's context.
+    """
+    cursor = dbapi_conn.cursor()
+    # Enable WAL mode for better concurrency
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # Configure SQLite lock wait upper bound (ms) to prevent prolonged blocking under contention
+    cursor.execute(f"PRAGMA busy_timeout={settings.db_sqlite_busy_timeout}")
+    # Synchronous=NORMAL is safe with WAL mode and improves performance
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # Increase cache size for better performance (negative value = KB)
+    cursor.execute("PRAGMA cache_size=-64000")  # 64MB cache
+    # Enable foreign key constraints for ON DELETE CASCADE support
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
-        Args:
-            dbapi_conn: The raw DBAPI connection.
-            _connection_record: A SQLAlchemy-specific object that maintains
-                information about the connection's context.
-        """
-        cursor = dbapi_conn.cursor()
-        # Enable WAL mode for better concurrency
-        cursor.execute("PRAGMA journal_mode=WAL")
-        # Configure SQLite lock wait upper bound (ms) to prevent prolonged blocking under contention
-        cursor.execute(f"PRAGMA busy_timeout={settings.db_sqlite_busy_timeout}")
-        # Synchronous=NORMAL is safe with WAL mode and improves performance
-        cursor.execute("PRAGMA synchronous=NORMAL")
-        # Increase cache size for better performance (negative value = KB)
-        cursor.execute("PRAGMA cache_size=-64000")  # 64MB cache
-        # Enable foreign key constraints for ON DELETE CASCADE support
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+
+# Configure SQLite for better concurrency if using SQLite
+if backend == "sqlite":
+    event.listen(engine, "connect", set_sqlite_pragma)
 
 
 # ---------------------------------------------------------------------------
@@ -2375,6 +2378,227 @@ class A2AAgentMetricsHourly(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
+class EntityMetricCounter(Base):
+    """Running lifetime metric counters of one tool, resource, prompt, server or A2A agent.
+
+    Updated in the same transaction as the raw metric rows: per flush by
+    ``MetricsBufferService`` (one upsert per entity), and per row for metrics
+    added through the ORM. Counters cover every recorded execution, including
+    those whose raw rows were rolled up and deleted, so list views with
+    ``include_metrics`` read one joined row per entity instead of aggregating
+    the raw metrics tables. Reset together with the raw and hourly metrics.
+
+    Attributes:
+        entity_type (str): Table name of the entity (``tools``, ``resources``, ...)
+        entity_id (str): ID of the entity
+        total_count (int): Number of recorded executions
+        success_count (int): Number of successful executions
+        min_response_time (Optional[float]): Fastest response time in seconds
+        max_response_time (Optional[float]): Slowest response time in seconds
+        sum_response_time (float): Sum of the response times, for the average
+        last_execution_time (Optional[datetime]): Timestamp of the latest execution
+
+    Examples:
+        >>> counter = EntityMetricCounter(entity_type="tools", entity_id="t1", total_count=4, success_count=3, sum_response_time=2.0)
+        >>> metric_counter_summary(counter)["avg_response_time"]
+        0.5
+    """
+
+    __tablename__ = "entity_metric_counters"
+
+    entity_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    entity_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    total_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    success_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    min_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    max_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    sum_response_time: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_execution_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+def metric_counter_summary(counter: Optional[EntityMetricCounter]) -> Dict[str, Any]:
+    """Build a ``metrics_summary`` dictionary from an entity's counter row.
+
+    Args:
+        counter: The entity's counter row, or None if it never recorded a metric.
+
+    Returns:
+        Dict[str, Any]: Same keys as ``Tool.metrics_summary``.
+
+    Examples:
+        >>> metric_counter_summary(None)["total_executions"]
+        0
+        >>> summary = metric_counter_summary(EntityMetricCounter(total_count=4, success_count=3, min_response_time=0.1, max_response_time=0.9, sum_response_time=2.0))
+        >>> summary["failed_executions"], summary["failure_rate"], summary["avg_response_time"]
+        (1, 0.25, 0.5)
+    """
+    total = (counter.total_count or 0) if counter is not None else 0
+    if total == 0:
+        return {
+            "total_executions": 0,
+            "successful_executions": 0,
+            "failed_executions": 0,
+            "failure_rate": 0.0,
+            "min_response_time": None,
+            "max_response_time": None,
+            "avg_response_time": None,
+            "last_execution_time": None,
+        }
+    successful = counter.success_count or 0
+    failed = total - successful
+    return {
+        "total_executions": total,
+        "successful_executions": successful,
+        "failed_executions": failed,
+        "failure_rate": failed / total,
+        "min_response_time": counter.min_response_time,
+        "max_response_time": counter.max_response_time,
+        "avg_response_time": (counter.sum_response_time or 0.0) / total,
+        "last_execution_time": counter.last_execution_time,
+    }
+
+
+def loaded_metrics_summary(entity: Any) -> Optional[Dict[str, Any]]:
+    """Return an entity's metrics summary from its eagerly loaded ``metric_counter``.
+
+    Never triggers a query: returns None unless the ``metric_counter``
+    relationship was loaded (e.g. ``joinedload(DbTool.metric_counter)``).
+
+    Args:
+        entity: ORM entity (or any other object, which yields None).
+
+    Returns:
+        Optional[Dict[str, Any]]: Summary as built by :func:`metric_counter_summary`, or None.
+
+    Examples:
+        >>> loaded_metrics_summary(object()) is None
+        True
+        >>> loaded_metrics_summary(Tool()) is None
+        True
+    """
+    state = sa_inspect(entity, raiseerr=False)
+    if state is None or not hasattr(state, "dict") or "metric_counter" not in state.dict:
+        return None
+    return metric_counter_summary(state.dict["metric_counter"])
+
+
+def metric_counter_deltas(entity_type: str, samples: Any) -> List[Dict[str, Any]]:
+    """Fold raw metric samples into one counter delta per entity.
+
+    Args:
+        entity_type: Table name of the entities (``tools``, ``resources``, ...).
+        samples: Iterable of ``(entity_id, timestamp, response_time, is_success)``.
+
+    Returns:
+        List[Dict[str, Any]]: ``entity_metric_counters`` rows to merge with
+        :func:`apply_metric_counter_deltas`.
+
+    Examples:
+        >>> t0, t1 = datetime(2025, 1, 1), datetime(2025, 1, 2)
+        >>> [d] = metric_counter_deltas("tools", [("t1", t0, 0.5, True), ("t1", t1, 0.1, False)])
+        >>> d["total_count"], d["success_count"], d["min_response_time"], d["max_response_time"], d["sum_response_time"], d["last_execution_time"] == t1
+        (2, 1, 0.1, 0.5, 0.6, True)
+    """
+    deltas: Dict[str, Dict[str, Any]] = {}
+    for entity_id, timestamp, response_time, is_success in samples:
+        delta = deltas.get(entity_id)
+        if delta is None:
+            delta = deltas[entity_id] = {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "total_count": 0,
+                "success_count": 0,
+                "min_response_time": None,
+                "max_response_time": None,
+                "sum_response_time": 0.0,
+                "last_execution_time": None,
+            }
+        delta["total_count"] += 1
+        if is_success:
+            delta["success_count"] += 1
+        if response_time is not None:
+            if delta["min_response_time"] is None or response_time < delta["min_response_time"]:
+                delta["min_response_time"] = response_time
+            if delta["max_response_time"] is None or response_time > delta["max_response_time"]:
+                delta["max_response_time"] = response_time
+            delta["sum_response_time"] += response_time
+        if timestamp is not None and (delta["last_execution_time"] is None or timestamp > delta["last_execution_time"]):
+            delta["last_execution_time"] = timestamp
+    return list(deltas.values())
+
+
+def _merged_metric_counter(current: Any, incoming: Any) -> Dict[str, Any]:
+    """SET clause adding an incoming counter delta to the stored counter.
+
+    Args:
+        current: Columns of ``entity_metric_counters``.
+        incoming: Columns (or literals) of the delta, by column name.
+
+    Returns:
+        Dict[str, Any]: Column name to SQL expression.
+    """
+    # Third-Party
+    from sqlalchemy import case, or_  # pylint: disable=import-outside-toplevel
+
+    def _keep(name: str, newer: Any) -> Any:
+        """Take the incoming value when the stored one is NULL or ``newer`` holds.
+
+        Args:
+            name: Column name.
+            newer: Condition under which the incoming value wins.
+
+        Returns:
+            Any: CASE expression.
+        """
+        return case((or_(current[name].is_(None), newer), incoming[name]), else_=current[name])
+
+    return {
+        "total_count": current.total_count + incoming["total_count"],
+        "success_count": current.success_count + incoming["success_count"],
+        "sum_response_time": current.sum_response_time + incoming["sum_response_time"],
+        "min_response_time": _keep("min_response_time", incoming["min_response_time"] < current.min_response_time),
+        "max_response_time": _keep("max_response_time", incoming["max_response_time"] > current.max_response_time),
+        "last_execution_time": _keep("last_execution_time", incoming["last_execution_time"] > current.last_execution_time),
+    }
+
+
+def apply_metric_counter_deltas(conn: Any, deltas: List[Dict[str, Any]]) -> None:
+    """Merge counter deltas into ``entity_metric_counters``.
+
+    PostgreSQL and SQLite merge every delta in one ``INSERT ... ON CONFLICT DO
+    UPDATE``; other dialects update each counter and insert the missing ones.
+
+    Args:
+        conn: Session or Connection to write with (the caller commits).
+        deltas: Rows from :func:`metric_counter_deltas` (one per entity).
+    """
+    if not deltas:
+        return
+    # Third-Party
+    from sqlalchemy import literal  # pylint: disable=import-outside-toplevel
+
+    table = EntityMetricCounter.__table__
+    dialect = conn.dialect.name if hasattr(conn, "dialect") else conn.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            # Third-Party
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert  # pylint: disable=import-outside-toplevel
+        else:
+            # Third-Party
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert  # pylint: disable=import-outside-toplevel
+        stmt = dialect_insert(table).values(deltas)
+        conn.execute(stmt.on_conflict_do_update(index_elements=[table.c.entity_type, table.c.entity_id], set_=_merged_metric_counter(table.c, stmt.excluded)))
+        return
+
+    for delta in deltas:
+        incoming = {name: literal(value, table.c[name].type) for name, value in delta.items()}
+        result = conn.execute(
+            table.update().where(table.c.entity_type == delta["entity_type"], table.c.entity_id == delta["entity_id"]).values(_merged_metric_counter(table.c, incoming))
+        )
+        if result.rowcount == 0:
+            conn.execute(table.insert().values(**delta))
+
+
 # ===================================
 # Observability Models (OpenTelemetry-style traces, spans, events)
 # ===================================
@@ -2881,6 +3105,10 @@ class Tool(Base):
 
     # Relationship with ToolMetric records
     metrics: Mapped[List["ToolMetric"]] = relationship("ToolMetric", back_populates="tool", cascade="all, delete-orphan")
+    # Running metric counters; list views joinedload this instead of aggregating metrics
+    metric_counter: Mapped[Optional["EntityMetricCounter"]] = relationship(
+        "EntityMetricCounter", primaryjoin="and_(foreign(EntityMetricCounter.entity_id) == Tool.id, EntityMetricCounter.entity_type == 'tools')", viewonly=True, uselist=False
+    )
 
     # Team scoping fields for resource organization
     team_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("email_teams.id", ondelete="SET NULL"), nullable=True)
@@ -3135,6 +3363,7 @@ class Tool(Base):
     def metrics_summary(self) -> Dict[str, Any]:
         """Aggregated metrics for the tool.
 
+        When the ``metric_counter`` is loaded (list views): reads the running counters.
         When metrics are loaded: computes all values from memory in a single pass.
         When not loaded: uses a single SQL query with aggregation for all fields.
 
@@ -3143,6 +3372,10 @@ class Tool(Base):
                 - total_executions, successful_executions, failed_executions
                 - failure_rate, min/max/avg_response_time, last_execution_time
         """
+        summary = loaded_metrics_summary(self)
+        if summary is not None:
+            return summary
+
         # If metrics are loaded, compute everything in a single pass
         if self._metrics_loaded():
             total = 0
@@ -3265,6 +3498,10 @@ class Resource(Base):
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
 
     metrics: Mapped[List["ResourceMetric"]] = relationship("ResourceMetric", back_populates="resource", cascade="all, delete-orphan")
+    # Running metric counters; list views joinedload this instead of aggregating metrics
+    metric_counter: Mapped[Optional["EntityMetricCounter"]] = relationship(
+        "EntityMetricCounter", primaryjoin="and_(foreign(EntityMetricCounter.entity_id) == Resource.id, EntityMetricCounter.entity_type == 'resources')", viewonly=True, uselist=False
+    )
 
     # Content storage - can be text or binary
     text_content: Mapped[Optional[str]] = mapped_column(Text)
@@ -3508,6 +3745,7 @@ class Resource(Base):
     def metrics_summary(self) -> Dict[str, Any]:
         """Aggregated metrics for the resource.
 
+        When the ``metric_counter`` is loaded (list views): reads the running counters.
         When metrics are loaded: computes all values from memory in a single pass.
         When not loaded: uses a single SQL query with aggregation for all fields.
 
@@ -3516,6 +3754,10 @@ class Resource(Base):
                 - total_executions, successful_executions, failed_executions
                 - failure_rate, min/max/avg_response_time, last_execution_time
         """
+        summary = loaded_metrics_summary(self)
+        if summary is not None:
+            return summary
+
         if self._metrics_loaded():
             total = 0
             successful = 0
@@ -3683,6 +3925,10 @@ class Prompt(Base):
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
 
     metrics: Mapped[List["PromptMetric"]] = relationship("PromptMetric", back_populates="prompt", cascade="all, delete-orphan")
+    # Running metric counters; list views joinedload this instead of aggregating metrics
+    metric_counter: Mapped[Optional["EntityMetricCounter"]] = relationship(
+        "EntityMetricCounter", primaryjoin="and_(foreign(EntityMetricCounter.entity_id) == Prompt.id, EntityMetricCounter.entity_type == 'prompts')", viewonly=True, uselist=False
+    )
 
     gateway_id: Mapped[Optional[str]] = mapped_column(ForeignKey("gateways.id", ondelete="CASCADE"))
     gateway: Mapped["Gateway"] = relationship("Gateway", back_populates="prompts")
@@ -3919,6 +4165,7 @@ class Prompt(Base):
     def metrics_summary(self) -> Dict[str, Any]:
         """Aggregated metrics for the prompt.
 
+        When the ``metric_counter`` is loaded (list views): reads the running counters.
         When metrics are loaded: computes all values from memory in a single pass.
         When not loaded: uses a single SQL query with aggregation for all fields.
 
@@ -3927,6 +4174,10 @@ class Prompt(Base):
                 - total_executions, successful_executions, failed_executions
                 - failure_rate, min/max/avg_response_time, last_execution_time
         """
+        summary = loaded_metrics_summary(self)
+        if summary is not None:
+            return summary
+
         if self._metrics_loaded():
             total = 0
             successful = 0
@@ -4051,6 +4302,10 @@ class Server(Base):
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
 
     metrics: Mapped[List["ServerMetric"]] = relationship("ServerMetric", back_populates="server", cascade="all, delete-orphan")
+    # Running metric counters; list views joinedload this instead of aggregating metrics
+    metric_counter: Mapped[Optional["EntityMetricCounter"]] = relationship(
+        "EntityMetricCounter", primaryjoin="and_(foreign(EntityMetricCounter.entity_id) == Server.id, EntityMetricCounter.entity_type == 'servers')", viewonly=True, uselist=False
+    )
 
     # Many-to-many relationships for associated items
     tools: Mapped[List["Tool"]] = relationship("Tool", secondary=server_tool_association, back_populates="servers")
@@ -4224,6 +4479,7 @@ class Server(Base):
     def metrics_summary(self) -> Dict[str, Any]:
         """Aggregated metrics for the server.
 
+        When the ``metric_counter`` is loaded (list views): reads the running counters.
         When metrics are loaded: computes all values from memory in a single pass.
         When not loaded: uses a single SQL query with aggregation for all fields.
 
@@ -4232,6 +4488,10 @@ class Server(Base):
                 - total_executions, successful_executions, failed_executions
                 - failure_rate, min/max/avg_response_time, last_execution_time
         """
+        summary = loaded_metrics_summary(self)
+        if summary is not None:
+            return summary
+
         if self._metrics_loaded():
             total = 0
             successful = 0
@@ -4607,6 +4867,10 @@ class A2AAgent(Base):
     servers: Mapped[List["Server"]] = relationship("Server", secondary=server_a2a_association, back_populates="a2a_agents")
     tool: Mapped[Optional["Tool"]] = relationship("Tool", foreign_keys=[tool_id])
     metrics: Mapped[List["A2AAgentMetric"]] = relationship("A2AAgentMetric", back_populates="a2a_agent", cascade="all, delete-orphan")
+    # Running metric counters; list views joinedload this instead of aggregating metrics
+    metric_counter: Mapped[Optional["EntityMetricCounter"]] = relationship(
+        "EntityMetricCounter", primaryjoin="and_(foreign(EntityMetricCounter.entity_id) == A2AAgent.id, EntityMetricCounter.entity_type == 'a2a_agents')", viewonly=True, uselist=False
+    )
     __table_args__ = (
         UniqueConstraint("team_id", "owner_email", "slug", name="uq_team_owner_slug_a2a_agent"),
         Index("idx_a2a_agents_created_at_id", "created_at", "id"),
@@ -4719,6 +4983,60 @@ class A2AAgent(Base):
         return f"<A2AAgent(id='{self.id}', name='{self.name}', agent_type='{self.agent_type}')>"
 
 
+def tag_ids(tags: Optional[List[Any]]) -> List[str]:
+    """Return the distinct tag ids of a ``tags`` column value, in order.
+
+    Tags are stored either as legacy strings or as ``{"id": ..., "label": ...}``
+    dicts; the ``id`` (or ``label`` when ``id`` is missing) identifies the tag.
+
+    Args:
+        tags: Value of an entity's ``tags`` column.
+
+    Returns:
+        List[str]: Distinct tag ids.
+
+    Examples:
+        >>> tag_ids(["api", {"id": "db", "label": "DB"}, {"label": "web"}, "api", ""])
+        ['api', 'db', 'web']
+        >>> tag_ids(None)
+        []
+    """
+    ids: List[str] = []
+    for tag in tags or []:
+        tag_id = (tag.get("id") or tag.get("label")) if isinstance(tag, dict) else tag
+        if tag_id and isinstance(tag_id, str) and tag_id not in ids:
+            ids.append(tag_id)
+    return ids
+
+
+class EntityTag(Base):
+    """Normalized index of the tags of tools, resources, prompts, servers, gateways and A2A agents.
+
+    One row per (entity, tag), kept in sync with the entities' ``tags`` JSON
+    columns in the same transaction by the ``sync_entity_tags`` mapper events
+    and ``delete_entity_tags_on_bulk_delete``. Tag listings are a ``GROUP BY``
+    on this table and tag filters an indexed lookup, instead of scanning and
+    parsing every ``tags`` column.
+
+    Attributes:
+        entity_type (str): Table name of the tagged entity (``tools``, ``resources``, ...)
+        entity_id (str): ID of the tagged entity
+        tag (str): Tag id
+
+    Examples:
+        >>> EntityTag(entity_type="tools", entity_id="abc", tag="api").tag
+        'api'
+    """
+
+    __tablename__ = "entity_tags"
+
+    entity_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    entity_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    tag: Mapped[str] = mapped_column(String(255), primary_key=True)
+
+    __table_args__ = (Index("idx_entity_tags_type_tag", "entity_type", "tag", "entity_id"),)
+
+
 class GrpcService(Base):
     """
     ORM model for gRPC services with reflection-based discovery.
@@ -5110,6 +5428,71 @@ class TokenUsageLog(Base):
     )
 
 
+class TokenUsageRollup(Base):
+    """Per-minute API token usage counters.
+
+    ``TokenUsageRollupService`` aggregates requests in memory per token,
+    endpoint and minute and inserts one row per key at each flush, so several
+    rows (one per worker and flush) may exist for the same key; readers sum
+    them. Usage statistics are computed from this table instead of scanning
+    ``token_usage_logs``.
+
+    Attributes:
+        id (int): Auto-incrementing row ID
+        token_jti (str): Token JWT ID reference
+        user_email (str): Token owner's email
+        endpoint (str): API endpoint accessed ("" if unknown)
+        minute_start (datetime): Start of the aggregation minute (UTC)
+        request_count (int): Requests in this minute
+        status_2xx (int): Responses with a 2xx status
+        status_3xx (int): Responses with a 3xx status
+        status_4xx (int): Responses with a 4xx status
+        status_5xx (int): Responses with a 5xx status
+        blocked_count (int): Blocked requests
+        latency_count (int): Requests with a non-zero response time
+        latency_sum_ms (int): Sum of response times in milliseconds
+        latency_max_ms (int): Maximum response time in milliseconds
+        latency_le_10ms .. latency_gt_5000ms (int): Response time histogram buckets
+
+    Examples:
+        >>> row = TokenUsageRollup(token_jti="jti-1", user_email="alice@example.com", endpoint="/tools", request_count=3)
+        >>> row.request_count
+        3
+    """
+
+    __tablename__ = "token_usage_rollups"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    token_jti: Mapped[str] = mapped_column(String(36), nullable=False)
+    user_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    endpoint: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    minute_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    request_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_2xx: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_3xx: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_4xx: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_5xx: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    blocked_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    latency_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_sum_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    latency_max_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_le_10ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_le_50ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_le_100ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_le_250ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_le_500ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_le_1000ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_le_5000ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_gt_5000ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_token_usage_rollups_user_email_minute", "user_email", "minute_start"),
+        Index("idx_token_usage_rollups_token_jti_minute", "token_jti", "minute_start"),
+    )
+
+
 class TokenRevocation(Base):
     """Token revocation blacklist for immediate token invalidation.
 
@@ -5544,6 +5927,233 @@ def get_for_update(
 fresh_db_session = contextmanager(get_db)  # type: ignore
 
 
+# ---------------------------------------------------------------------------
+# Optional async engine for request hot paths (DB_ASYNC_ENABLED)
+#
+# The synchronous engine above remains the source of truth and the default.
+# When enabled, read-only hot paths (tool lookup, tool listing, auth context)
+# use an AsyncSession so slow queries do not block the event loop. Callers must
+# check async_db_available() and keep the sync path as a fallback.
+# ---------------------------------------------------------------------------
+
+# Sync backend/driver -> (async driver, importable module providing it)
+_ASYNC_DRIVERS: Dict[str, tuple[str, str]] = {
+    "sqlite": ("aiosqlite", "aiosqlite"),
+    "postgresql": ("asyncpg", "asyncpg"),
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+_async_engine_unavailable = False
+
+
+def build_async_database_url(database_url: str) -> Optional[str]:
+    """Derive an async driver URL from the synchronous database URL.
+
+    Args:
+        database_url: Synchronous SQLAlchemy database URL.
+
+    Returns:
+        Optional[str]: Async URL, or None when the backend has no supported async driver
+        (in-memory SQLite cannot be shared between engines and is also excluded).
+
+    Examples:
+        >>> build_async_database_url("sqlite:///./mcp.db")
+        'sqlite+aiosqlite:///./mcp.db'
+        >>> build_async_database_url("postgresql+psycopg://u:p@db:5432/mcp")
+        'postgresql+asyncpg://u:p@db:5432/mcp'
+        >>> build_async_database_url("postgresql+asyncpg://u:p@db/mcp")
+        'postgresql+asyncpg://u:p@db/mcp'
+        >>> build_async_database_url("sqlite:///:memory:") is None
+        True
+        >>> build_async_database_url("mysql+pymysql://u:p@db/mcp") is None
+        True
+    """
+    parsed = make_url(database_url)
+    async_backend = parsed.get_backend_name()
+    if async_backend not in _ASYNC_DRIVERS:
+        return None
+    if async_backend == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return None
+    return parsed.set(drivername=f"{async_backend}+{_ASYNC_DRIVERS[async_backend][0]}").render_as_string(hide_password=False)
+
+
+def _asyncpg_server_settings(options: str) -> Dict[str, str]:
+    """Translate libpq ``options`` (``-c key=value``) into asyncpg ``server_settings``.
+
+    Args:
+        options: libpq options string, e.g. from ``?options=-c search_path=mcp``.
+
+    Returns:
+        Dict[str, str]: Server settings applied on connect.
+
+    Examples:
+        >>> _asyncpg_server_settings("-c search_path=mcp_gateway -cstatement_timeout=5000")
+        {'search_path': 'mcp_gateway', 'statement_timeout': '5000'}
+        >>> _asyncpg_server_settings("")
+        {}
+    """
+    server_settings: Dict[str, str] = {}
+    tokens = options.split()
+    for index, token in enumerate(tokens):
+        if token == "-c" and index + 1 < len(tokens):
+            token = tokens[index + 1]
+        elif token.startswith("-c"):
+            token = token[2:]
+        else:
+            continue
+        key, sep, value = token.partition("=")
+        if sep:
+            server_settings[key] = value
+    return server_settings
+
+
+def build_async_engine(async_url: str) -> AsyncEngine:
+    """Build the async SQLAlchemy engine mirroring the sync pool settings.
+
+    Args:
+        async_url: Async SQLAlchemy database URL.
+
+    Returns:
+        AsyncEngine: Configured async engine.
+    """
+    parsed = make_url(async_url)
+    async_connect_args: Dict[str, Any] = {}
+    if parsed.get_backend_name() == "postgresql" and parsed.get_driver_name() == "asyncpg":
+        # asyncpg does not understand libpq's ?options=, translate it to server_settings
+        url_options = parsed.query.get("options")
+        if url_options:
+            async_connect_args["server_settings"] = _asyncpg_server_settings(str(url_options))
+            parsed = parsed.difference_update_query(["options"])
+
+    if parsed.get_backend_name() == "sqlite":
+        async_engine = create_async_engine(
+            parsed,
+            pool_pre_ping=True,
+            pool_size=min(settings.db_pool_size, 50),
+            max_overflow=min(settings.db_max_overflow, 20),
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            echo=_sqlalchemy_echo,
+        )
+        event.listen(async_engine.sync_engine, "connect", set_sqlite_pragma)
+        return async_engine
+
+    if settings.db_pool_class == "null" or (settings.db_pool_class == "auto" and "pgbouncer" in async_url.lower()):
+        return create_async_engine(parsed, poolclass=NullPool, connect_args=async_connect_args, echo=_sqlalchemy_echo)
+
+    return create_async_engine(
+        parsed,
+        pool_pre_ping=settings.db_pool_pre_ping != "false",
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args=async_connect_args,
+        echo=_sqlalchemy_echo,
+    )
+
+
+def get_async_session_factory() -> Optional[async_sessionmaker[AsyncSession]]:
+    """Return the async session factory, building the async engine on first use.
+
+    Returns:
+        Optional[async_sessionmaker[AsyncSession]]: The factory, or None when the async engine
+        is disabled, unsupported for the configured database, or its driver is not installed.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> with patch.object(settings, "db_async_enabled", False):
+        ...     get_async_session_factory() is None
+        True
+    """
+    global _async_engine, _async_session_factory, _async_engine_unavailable  # pylint: disable=global-statement
+
+    if not settings.db_async_enabled or _async_engine_unavailable:
+        return None
+    if _async_session_factory is not None:
+        return _async_session_factory
+
+    async_url = settings.db_async_url or build_async_database_url(settings.database_url)
+    if not async_url:
+        logger.warning("DB_ASYNC_ENABLED is set but no async driver is supported for %s - using the sync engine", backend)
+        _async_engine_unavailable = True
+        return None
+
+    async_driver = make_url(async_url).get_driver_name()
+    if async_driver and importlib.util.find_spec(async_driver) is None:
+        logger.warning("DB_ASYNC_ENABLED is set but the '%s' driver is not installed - using the sync engine", async_driver)
+        _async_engine_unavailable = True
+        return None
+
+    _async_engine = build_async_engine(async_url)
+    if settings.observability_enabled:
+        try:
+            # First-Party
+            from mcpgateway.instrumentation import instrument_sqlalchemy  # pylint: disable=import-outside-toplevel
+
+            instrument_sqlalchemy(_async_engine.sync_engine)
+        except ImportError:
+            logger.warning("Failed to import SQLAlchemy instrumentation")
+
+    # Same semantics as SessionLocal: ORM objects stay usable after commit/close
+    _async_session_factory = async_sessionmaker(_async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    logger.info("Async database engine enabled (%s)", make_url(async_url).drivername)
+    return _async_session_factory
+
+
+def async_db_available() -> bool:
+    """Return True when hot paths should use the async engine.
+
+    Returns:
+        bool: True if DB_ASYNC_ENABLED is set and the async engine could be built.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> with patch.object(settings, "db_async_enabled", False):
+        ...     async_db_available()
+        False
+    """
+    return get_async_session_factory() is not None
+
+
+@asynccontextmanager
+async def fresh_async_db_session() -> AsyncIterator[AsyncSession]:
+    """Provide a short-lived AsyncSession, the async counterpart of fresh_db_session().
+
+    Commits on success so the connection is returned to the pool without an open
+    transaction, and rolls back on error.
+
+    Yields:
+        AsyncSession: An async database session.
+
+    Raises:
+        RuntimeError: If the async engine is not available; check async_db_available() first.
+        Exception: Re-raises any exception after rolling back the transaction.
+    """
+    factory = get_async_session_factory()
+    if factory is None:
+        raise RuntimeError("Async database engine is not enabled")
+
+    async with factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def dispose_async_engine() -> None:
+    """Dispose the async engine (if built) and reset the factory, e.g. on shutdown."""
+    global _async_engine, _async_session_factory  # pylint: disable=global-statement
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+
 def patch_string_columns_for_mariadb(base, engine_) -> None:
     """
     MariaDB requires VARCHAR to have an explicit length.
@@ -6344,3 +6954,173 @@ def set_prompt_name_and_slug(mapper, connection, target):  # pylint: disable=unu
         target.name = f"{gateway_slug}{sep}{target.custom_name_slug}"
     else:
         target.name = target.custom_name_slug
+
+
+TAGGED_MODELS = (Tool, Resource, Prompt, Server, Gateway, A2AAgent)
+_TAGGED_TABLES = {model.__tablename__: model for model in TAGGED_MODELS}
+
+
+def _entity_tag_rows(entity_type: str, entity_id: str, tags: Optional[List[Any]]) -> List[Dict[str, str]]:
+    """Build the ``entity_tags`` rows for an entity.
+
+    Args:
+        entity_type: Table name of the entity.
+        entity_id: Entity ID.
+        tags: Value of the entity's ``tags`` column.
+
+    Returns:
+        List[Dict[str, str]]: Rows to insert (tags longer than the column are skipped).
+
+    Examples:
+        >>> _entity_tag_rows("tools", "t1", ["api", {"id": "db"}, "x" * 300])
+        [{'entity_type': 'tools', 'entity_id': 't1', 'tag': 'api'}, {'entity_type': 'tools', 'entity_id': 't1', 'tag': 'db'}]
+    """
+    return [{"entity_type": entity_type, "entity_id": entity_id, "tag": tag} for tag in tag_ids(tags) if len(tag) <= 255]
+
+
+@event.listens_for(Tool, "after_insert")
+@event.listens_for(Tool, "after_update")
+@event.listens_for(Resource, "after_insert")
+@event.listens_for(Resource, "after_update")
+@event.listens_for(Prompt, "after_insert")
+@event.listens_for(Prompt, "after_update")
+@event.listens_for(Server, "after_insert")
+@event.listens_for(Server, "after_update")
+@event.listens_for(Gateway, "after_insert")
+@event.listens_for(Gateway, "after_update")
+@event.listens_for(A2AAgent, "after_insert")
+@event.listens_for(A2AAgent, "after_update")
+def sync_entity_tags(mapper, connection, target):
+    """Rewrite an entity's ``entity_tags`` rows when its tags change.
+
+    Runs on the flush connection, so the index commits or rolls back with the entity.
+
+    Args:
+        mapper: SQLAlchemy mapper of the tagged model.
+        connection: Database connection of the flush.
+        target: Entity being inserted or updated.
+    """
+    if not sa_inspect(target).attrs.tags.history.has_changes():
+        return
+
+    entity_type = mapper.local_table.name
+    table = EntityTag.__table__
+    connection.execute(table.delete().where(table.c.entity_type == entity_type, table.c.entity_id == target.id))
+    rows = _entity_tag_rows(entity_type, target.id, target.tags)
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+METERED_MODELS = (Tool, Resource, Prompt, Server, A2AAgent)
+_METERED_TABLES = {model.__tablename__: model for model in METERED_MODELS}
+# Raw metric model -> (entity table name, entity id column)
+METRIC_COUNTER_SOURCES = {
+    ToolMetric: ("tools", "tool_id"),
+    ResourceMetric: ("resources", "resource_id"),
+    PromptMetric: ("prompts", "prompt_id"),
+    ServerMetric: ("servers", "server_id"),
+    A2AAgentMetric: ("a2a_agents", "a2a_agent_id"),
+}
+
+
+@event.listens_for(ToolMetric, "after_insert")
+@event.listens_for(ResourceMetric, "after_insert")
+@event.listens_for(PromptMetric, "after_insert")
+@event.listens_for(ServerMetric, "after_insert")
+@event.listens_for(A2AAgentMetric, "after_insert")
+def count_inserted_metric(mapper, connection, target):
+    """Add a metric row inserted through the ORM to its entity's counters.
+
+    Bulk inserts bypass this event; ``MetricsBufferService`` merges the
+    counters of each flush itself.
+
+    Args:
+        mapper: SQLAlchemy mapper of the raw metric model.
+        connection: Database connection of the flush.
+        target: Metric row being inserted.
+    """
+    entity_type, id_col = METRIC_COUNTER_SOURCES[mapper.class_]
+    apply_metric_counter_deltas(connection, metric_counter_deltas(entity_type, [(getattr(target, id_col), target.timestamp, target.response_time, target.is_success)]))
+
+
+# Index tables derived from entity rows, and the entity tables each one covers.
+# Their rows are removed with the entity, by the two listeners below.
+ENTITY_INDEX_TABLES = (
+    (EntityTag.__table__, frozenset(_TAGGED_TABLES)),
+    (EntityMetricCounter.__table__, frozenset(_METERED_TABLES)),
+)
+_INDEXED_TABLES = frozenset(name for _, names in ENTITY_INDEX_TABLES for name in names)
+# Entity IDs per DELETE of the index rows of a bulk delete (keeps the bound parameters well below database limits)
+_INDEX_DELETE_BATCH = 1000
+
+
+def _delete_entity_index_rows(execute: Callable[[Any], Any], entity_type: str, entity_ids: Sequence[str]) -> None:
+    """Delete the index rows of entities from every index table that covers their type.
+
+    Args:
+        execute: ``execute`` of the connection or session of the entity delete.
+        entity_type: Table name of the entities.
+        entity_ids: IDs of the deleted entities.
+    """
+    for table, entity_types in ENTITY_INDEX_TABLES:
+        if entity_type not in entity_types:
+            continue
+        for start in range(0, len(entity_ids), _INDEX_DELETE_BATCH):
+            execute(table.delete().where(table.c.entity_type == entity_type, table.c.entity_id.in_(entity_ids[start : start + _INDEX_DELETE_BATCH])))
+
+
+def delete_entity_index_rows(mapper, connection, target):
+    """Remove a deleted entity's index rows (``entity_tags``, ``entity_metric_counters``).
+
+    Args:
+        mapper: SQLAlchemy mapper of the entity model.
+        connection: Database connection of the flush.
+        target: Entity being deleted.
+    """
+    _delete_entity_index_rows(connection.execute, mapper.local_table.name, [target.id])
+
+
+for _indexed_model in {*TAGGED_MODELS, *METERED_MODELS}:
+    event.listen(_indexed_model, "after_delete", delete_entity_index_rows)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def delete_entity_index_rows_on_bulk_delete(orm_execute_state):
+    """Remove the index rows of entities removed by a bulk ``delete()``.
+
+    Bulk deletes such as ``db.execute(delete(Tool).where(...))`` bypass the
+    mapper events, so the IDs of the matching entities are selected once, with
+    the same WHERE clause, and their rows are deleted from every index table
+    first, in the same transaction.
+
+    Args:
+        orm_execute_state: State of the statement being executed.
+    """
+    if not orm_execute_state.is_delete:
+        return
+    entity_table = getattr(orm_execute_state.statement, "table", None)
+    if entity_table is None or getattr(entity_table, "name", None) not in _INDEXED_TABLES:
+        return
+
+    matching_ids = select(entity_table.c.id)
+    if orm_execute_state.statement.whereclause is not None:
+        matching_ids = matching_ids.where(orm_execute_state.statement.whereclause)
+    session = orm_execute_state.session
+    entity_ids = session.execute(matching_ids).scalars().all()
+    if entity_ids:
+        _delete_entity_index_rows(session.execute, entity_table.name, entity_ids)
+
+
+def reset_metric_counters(db: Session, entity_type: str, entity_id: Optional[str] = None) -> None:
+    """Delete the counters of one entity, or of every entity of a type, on metrics reset.
+
+    Args:
+        db: Database session (the caller commits).
+        entity_type: Table name of the entities (``tools``, ``resources``, ...).
+        entity_id: Optional ID of a single entity.
+    """
+    table = EntityMetricCounter.__table__
+    stmt = table.delete().where(table.c.entity_type == entity_type)
+    if entity_id is not None:
+        stmt = stmt.where(table.c.entity_id == entity_id)
+    db.execute(stmt)
@@ -35,6 +35,7 @@ import hashlib
 import html
 import os as _os  # local alias to avoid collisions
 import sys
+import time
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from urllib.parse import urlparse, urlunparse
 import uuid
@@ -47,6 +48,7 @@ from fastapi.exception_handlers import request_validation_exception_handler as f
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from jinja2 import Environment, FileSystemLoader
@@ -58,8 +60,10 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import HTTPConnection
 from starlette.requests import Request as starletteRequest
 from starlette.responses import Response as starletteResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 # First-Party
@@ -67,12 +71,14 @@ from mcpgateway import __version__
 from mcpgateway.admin import admin_router, set_logging_service
 from mcpgateway.auth import _check_token_revoked_sync, _lookup_api_token_sync, get_current_user, get_user_team_roles, normalize_token_teams
 from mcpgateway.bootstrap_db import main as bootstrap_db
-from mcpgateway.cache import ResourceCache, SessionRegistry
+from mcpgateway.cache import SessionRegistry
+from mcpgateway.cache.registry_cache import CachedResponse, get_registry_cache
+from mcpgateway.cache.resource_cache import resource_cache
 from mcpgateway.common.models import InitializeResult
 from mcpgateway.common.models import JSONRPCError as PydanticJSONRPCError
 from mcpgateway.common.models import ListResourceTemplatesResult, LogLevel, Root
 from mcpgateway.config import settings
-from mcpgateway.db import refresh_slugs_on_startup, SessionLocal
+from mcpgateway.db import dispose_async_engine, fresh_db_session, refresh_slugs_on_startup, SessionLocal
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.handlers.sampling import SamplingHandler
 from mcpgateway.middleware.compression import SSEAwareCompressMiddleware
@@ -85,7 +91,7 @@ from mcpgateway.middleware.security_headers import SecurityHeadersMiddleware
 from mcpgateway.middleware.token_scoping import token_scoping_middleware
 from mcpgateway.middleware.validation_middleware import ValidationMiddleware
 from mcpgateway.observability import init_telemetry
-from mcpgateway.plugins.framework import PluginError, PluginManager, PluginViolationError
+from mcpgateway.plugins.framework import GlobalContext, PluginError, PluginManager, PluginViolationError
 from mcpgateway.routers.server_well_known import router as server_well_known_router
 from mcpgateway.routers.well_known import router as well_known_router
 from mcpgateway.schemas import (
@@ -138,7 +144,8 @@ from mcpgateway.services.prompt_service import PromptError, PromptLockConflictEr
 from mcpgateway.services.resource_service import ResourceError, ResourceLockConflictError, ResourceNotFoundError, ResourceURIConflictError
 from mcpgateway.services.server_service import ServerError, ServerLockConflictError, ServerNameConflictError, ServerNotFoundError
 from mcpgateway.services.tag_service import TagService
-from mcpgateway.services.tool_service import ToolError, ToolLockConflictError, ToolNameConflictError, ToolNotFoundError
+from mcpgateway.services.tool_discovery_service import get_tool_discovery_service
+from mcpgateway.services.tool_service import ToolError, ToolLockConflictError, ToolNameConflictError, ToolNotFoundError, ToolRateLimitError
 from mcpgateway.transports.sse_transport import SSETransport
 from mcpgateway.transports.streamablehttp_transport import SessionManagerWrapper, streamable_http_auth
 from mcpgateway.utils.db_isready import wait_for_db_ready
@@ -148,7 +155,6 @@ from mcpgateway.utils.orjson_response import ORJSONResponse
 from mcpgateway.utils.passthrough_headers import set_global_passthrough_headers
 from mcpgateway.utils.redis_client import close_redis_client, get_redis_client
 from mcpgateway.utils.redis_isready import wait_for_redis_ready
-from mcpgateway.utils.retry_manager import ResilientHttpClient
 from mcpgateway.utils.verify_credentials import require_docs_auth_override, verify_jwt_token
 from mcpgateway.validation.jsonrpc import JSONRPCError
 
@@ -439,10 +445,6 @@ def _get_rpc_filter_context(request: Request, user) -> tuple:
     return user_email, token_teams, is_admin
 
 
-# Initialize cache
-resource_cache = ResourceCache(max_size=settings.resource_cache_size, ttl=settings.resource_cache_ttl)
-
-
 @lru_cache(maxsize=512)
 def _parse_jsonpath(jsonpath: str) -> JSONPath:
     """Cache parsed JSONPath expression.
@@ -644,6 +646,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             # Configurable health check chain - ordered list of methods to try.
             health_check_methods=settings.mcp_session_pool_health_check_methods,
             health_check_timeout_seconds=settings.mcp_session_pool_health_check_timeout,
+            max_concurrent_per_session=settings.mcp_session_pool_max_concurrent_per_session,
         )
         logger.info("MCP session pool initialized")
 
@@ -730,6 +733,30 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             else:
                 logger.info("Metrics buffer service initialized (recording disabled)")
 
+        # Initialize log write buffer for batching structured log, security event and audit trail writes
+        if settings.log_write_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.log_write_buffer_service import get_log_write_buffer_service  # pylint: disable=import-outside-toplevel
+
+            await get_log_write_buffer_service().start()
+            logger.info("Log write buffer service initialized")
+
+        # Initialize per-minute API token usage rollups (replaces one token_usage_logs insert per request)
+        if settings.token_usage_logging_enabled and settings.token_usage_rollup_enabled:
+            # First-Party
+            from mcpgateway.services.token_usage_rollup_service import get_token_usage_rollup_service  # pylint: disable=import-outside-toplevel
+
+            await get_token_usage_rollup_service().start()
+            logger.info("Token usage rollup service initialized")
+
+        # Initialize span buffer for bulk export of observability traces
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.span_buffer_service import get_span_buffer_service  # pylint: disable=import-outside-toplevel
+
+            await get_span_buffer_service().start()
+            logger.info("Observability span buffer initialized")
+
         # Initialize metrics cleanup service for automatic deletion of old metrics
         if settings.metrics_cleanup_enabled:
             # First-Party
@@ -895,6 +922,27 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             metrics_buffer_service = get_metrics_buffer_service()
             services_to_shutdown.insert(0, metrics_buffer_service)  # Shutdown first to flush metrics
 
+        # Add log write buffer if enabled (flush queued log, security and audit rows before shutdown)
+        if settings.log_write_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.log_write_buffer_service import get_log_write_buffer_service  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.insert(0, get_log_write_buffer_service())
+
+        # Add token usage rollups if enabled (flush pending counters before shutdown)
+        if settings.token_usage_logging_enabled and settings.token_usage_rollup_enabled:
+            # First-Party
+            from mcpgateway.services.token_usage_rollup_service import get_token_usage_rollup_service  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.insert(0, get_token_usage_rollup_service())
+
+        # Add span buffer if enabled (flush queued traces before shutdown)
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.span_buffer_service import get_span_buffer_service  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.insert(0, get_span_buffer_service())
+
         # Add metrics rollup service if enabled (shutdown before cleanup)
         if settings.metrics_rollup_enabled:
             # First-Party
@@ -920,6 +968,9 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
 
             await close_mcp_session_pool()
 
+        # Dispose the optional async database engine (no-op when DB_ASYNC_ENABLED is off)
+        await dispose_async_engine()
+
         # Shutdown shared HTTP client (after services, before Redis)
         await SharedHttpClient.shutdown()
 
@@ -1354,7 +1405,7 @@ def _normalize_scope_path(scope_path: str, root_path: str) -> str:
     return scope_path
 
 
-class DocsAuthMiddleware(BaseHTTPMiddleware):
+class DocsAuthMiddleware:
     """
     Middleware to protect FastAPI's auto-generated documentation routes
     (/docs, /redoc, and /openapi.json) using Bearer token authentication.
@@ -1371,47 +1422,60 @@ class DocsAuthMiddleware(BaseHTTPMiddleware):
         is also accepted using BASIC_AUTH_USER and BASIC_AUTH_PASSWORD credentials.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
         """
-        Intercepts incoming requests to check if they are accessing protected documentation routes.
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the error response from ``_authorize`` or pass the request on.
+
+        Args:
+            scope: ASGI scope dict.
+            receive: Receive callable.
+            send: Send callable.
+        """
+        if scope["type"] == "http":
+            error_response = await self._authorize(Request(scope, receive))
+            if error_response is not None:
+                await error_response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    async def _authorize(self, request: Request) -> Optional[Response]:
+        """
+        Check if the request is accessing protected documentation routes.
         If so, it requires a valid Bearer token; otherwise, it allows the request to proceed.
 
         Args:
             request (Request): The incoming HTTP request.
-            call_next (Callable): The function to call the next middleware or endpoint.
 
         Returns:
-            Response: Either the standard route response or a 401/403 error response.
+            Optional[Response]: A 401/403 error response, or None if the request may proceed.
 
         Examples:
             >>> import asyncio
-            >>> from unittest.mock import Mock, AsyncMock, patch
-            >>> from fastapi import HTTPException
-            >>> from fastapi.responses import JSONResponse
+            >>> from starlette.requests import Request
             >>>
             >>> # Test unprotected path - should pass through
             >>> middleware = DocsAuthMiddleware(None)
-            >>> request = Mock()
-            >>> request.url.path = "/api/tools"
-            >>> request.scope = {"path": "/api/tools", "root_path": ""}
-            >>> request.method = "GET"
-            >>> request.headers.get.return_value = None
-            >>> call_next = AsyncMock(return_value="response")
-            >>>
-            >>> result = asyncio.run(middleware.dispatch(request, call_next))
-            >>> result
-            'response'
+            >>> request = Request({"type": "http", "method": "GET", "path": "/api/tools", "root_path": "", "headers": []})
+            >>> asyncio.run(middleware._authorize(request)) is None
+            True
             >>>
-            >>> # Test that middleware checks protected paths
-            >>> request.url.path = "/docs"
-            >>> isinstance(middleware, DocsAuthMiddleware)
+            >>> # OPTIONS requests are never challenged
+            >>> request = Request({"type": "http", "method": "OPTIONS", "path": "/docs", "root_path": "", "headers": []})
+            >>> asyncio.run(middleware._authorize(request)) is None
             True
         """
         protected_paths = ["/docs", "/redoc", "/openapi.json"]
 
         # Allow OPTIONS requests to pass through for CORS preflight (RFC 7231)
         if request.method == "OPTIONS":
-            return await call_next(request)
+            return None
 
         # Get path from scope to handle root_path correctly
         scope_path = request.scope.get("path", request.url.path)
@@ -1431,10 +1495,10 @@ class DocsAuthMiddleware(BaseHTTPMiddleware):
                 return ORJSONResponse(status_code=e.status_code, content={"detail": e.detail}, headers=e.headers if e.headers else None)
 
         # Proceed to next middleware or route
-        return await call_next(request)
+        return None
 
 
-class AdminAuthMiddleware(BaseHTTPMiddleware):
+class AdminAuthMiddleware:
     """
     Middleware to protect Admin UI routes (/admin/*) requiring admin privileges.
 
@@ -1487,21 +1551,43 @@ class AdminAuthMiddleware(BaseHTTPMiddleware):
             return RedirectResponse(url=login_url, status_code=302)
         return ORJSONResponse(status_code=status_code, content={"detail": detail})
 
-    async def dispatch(self, request: Request, call_next):  # pylint: disable=too-many-return-statements
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the error response from ``_authorize`` or pass the request on.
+
+        Args:
+            scope: ASGI scope dict.
+            receive: Receive callable.
+            send: Send callable.
+        """
+        if scope["type"] == "http":
+            error_response = await self._authorize(Request(scope, receive))
+            if error_response is not None:
+                await error_response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    async def _authorize(self, request: Request) -> Optional[Response]:  # pylint: disable=too-many-return-statements
         """
         Check admin privileges for admin routes.
 
         Args:
             request (Request): The incoming HTTP request.
-            call_next (Callable): The function to call the next middleware or endpoint.
 
         Returns:
-            Response: Either the standard route response or a 401/403 error response.
+            Optional[Response]: A 401/403 error response, or None if the request may proceed.
         """
         # Skip admin auth check if auth is not required (e.g., test environments)
         # This allows tests to mock authentication at the dependency level
         if not settings.auth_required:
-            return await call_next(request)
+            return None
 
         # Get path from scope to handle root_path correctly
         scope_path = request.scope.get("path", request.url.path)
@@ -1510,18 +1596,18 @@ class AdminAuthMiddleware(BaseHTTPMiddleware):
 
         # Allow OPTIONS requests for CORS preflight (RFC 7231)
         if request.method == "OPTIONS":
-            return await call_next(request)
+            return None
 
         # Check if this is an admin route
         is_admin_route = scope_path.startswith("/admin")
 
         if not is_admin_route:
-            return await call_next(request)
+            return None
 
         # Check if path is exempt (login, logout, static)
         is_exempt = any(scope_path.startswith(p) for p in self.EXEMPT_PATHS)
         if is_exempt:
-            return await call_next(request)
+            return None
 
         # For protected admin routes, verify admin status
         try:
@@ -1624,7 +1710,7 @@ class AdminAuthMiddleware(BaseHTTPMiddleware):
             return ORJSONResponse(status_code=500, content={"detail": "Authentication error"})
 
         # Proceed to next middleware or route
-        return await call_next(request)
+        return None
 
 
 class MCPPathRewriteMiddleware:
@@ -2074,6 +2160,78 @@ async def _read_request_json(request: Request) -> Any:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON in request body") from exc
 
 
+def _cached_response(request: Request, cached: CachedResponse) -> Response:
+    """Build the HTTP response for a pre-serialized list body.
+
+    Answers ``304 Not Modified`` when the client's ``If-None-Match`` already
+    names the body's ETag.
+
+    Args:
+        request: Incoming request (for ``If-None-Match``).
+        cached: Serialized body and its ETag.
+
+    Returns:
+        Response: 200 with the body, or an empty 304; both carry the ETag.
+
+    Examples:
+        >>> from starlette.requests import Request as StarletteRequest
+        >>> cached = CachedResponse.from_body(b"[]")
+        >>> fresh = _cached_response(StarletteRequest({"type": "http", "headers": []}), cached)
+        >>> fresh.status_code, fresh.body, fresh.headers["etag"] == cached.etag
+        (200, b'[]', True)
+        >>> revalidated = StarletteRequest({"type": "http", "headers": [(b"if-none-match", cached.etag.encode())]})
+        >>> _cached_response(revalidated, cached).status_code
+        304
+    """
+    headers = {"ETag": cached.etag}
+    if cached.etag_matches(request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _serialize_list_response(items: List[Any], collection: str, next_cursor: Optional[str], include_pagination: bool) -> bytes:
+    """Serialize a list endpoint result exactly as FastAPI would render it.
+
+    Args:
+        items: Pydantic models (or already-plain dicts) to return.
+        collection: Key used for the items in the paginated envelope (e.g. ``"tools"``).
+        next_cursor: Cursor for the next page, if any.
+        include_pagination: Whether to wrap the items in ``{collection: [...], "nextCursor": ...}``.
+
+    Returns:
+        bytes: JSON body.
+
+    Examples:
+        >>> _serialize_list_response([{"id": "1"}], "tools", None, False)
+        b'[{"id":"1"}]'
+        >>> _serialize_list_response([], "tools", "abc", True)
+        b'{"tools":[],"nextCursor":"abc"}'
+    """
+    dumped = [item.model_dump(mode="json", by_alias=True) if hasattr(item, "model_dump") else item for item in items]
+    if include_pagination:
+        return orjson.dumps({collection: dumped, "nextCursor": next_cursor})
+    return orjson.dumps(dumped)
+
+
+async def _store_list_response(request: Request, cache_type: str, filters_hash: str, items: List[Any], next_cursor: Optional[str], include_pagination: bool) -> Response:
+    """Serialize a list endpoint result, cache the body and return it.
+
+    Args:
+        request: Incoming request (for ``If-None-Match``).
+        cache_type: Registry cache type (``"tools"``, ``"servers"``, ...).
+        filters_hash: Hash of every request parameter that shapes the body.
+        items: Pydantic models (or already-plain dicts) to return.
+        next_cursor: Cursor for the next page, if any.
+        include_pagination: Whether to wrap the items in a paginated envelope.
+
+    Returns:
+        Response: The serialized body with its ETag.
+    """
+    body = _serialize_list_response(items, cache_type, next_cursor, include_pagination)
+    cached = await get_registry_cache().set_response(cache_type, body, filters_hash)
+    return _cached_response(request, cached)
+
+
 def require_api_key(api_key: str) -> None:
     """Validates the provided API key.
 
@@ -2112,13 +2270,13 @@ def require_api_key(api_key: str) -> None:
 
 async def invalidate_resource_cache(uri: Optional[str] = None) -> None:
     """
-    Invalidates the resource cache.
+    Invalidates the resource cache in this worker and, with Redis, in all workers.
 
-    If a specific URI is provided, only that resource will be removed from the cache.
+    If a specific URI (or resource ID) is provided, only that resource will be removed from the cache.
     If no URI is provided, the entire resource cache will be cleared.
 
     Args:
-        uri (Optional[str]): The URI of the resource to invalidate from the cache. If None, the entire cache is cleared.
+        uri (Optional[str]): The URI or ID of the resource to invalidate from the cache. If None, the entire cache is cleared.
 
     Examples:
         >>> import asyncio
@@ -2137,10 +2295,7 @@ async def invalidate_resource_cache(uri: Optional[str] = None) -> None:
         >>> resource_cache.get("/resource1") is None and resource_cache.get("/resource2") is None
         True
     """
-    if uri:
-        resource_cache.delete(uri)
-    else:
-        resource_cache.clear()
+    await resource_cache.invalidate_shared(uri or None)
 
 
 def get_protocol_from_request(request: Request) -> str:
@@ -2438,6 +2593,7 @@ async def list_servers(
     tags: Optional[str] = None,
     team_id: Optional[str] = None,
     visibility: Optional[str] = None,
+    q: Optional[str] = Query(None, description="Full-text search over names, descriptions and tags"),
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
 ) -> Union[List[ServerRead], Dict[str, Any]]:
@@ -2453,6 +2609,7 @@ async def list_servers(
         tags (Optional[str]): Comma-separated list of tags to filter by.
         team_id (Optional[str]): Filter by specific team ID.
         visibility (Optional[str]): Filter by visibility (private, team, public).
+        q (Optional[str]): Full-text search query over names, descriptions and tags.
         db (Session): The database session used to interact with the data store.
         user (str): The authenticated user making the request.
 
@@ -2487,6 +2644,16 @@ async def list_servers(
     is_admin_bypass = token_teams is None
     is_public_only_token = token_teams is not None and len(token_teams) == 0
 
+    # Unrestricted first pages are served from the pre-serialized response cache
+    response_cache_key = None
+    if cursor is None and is_admin_bypass and not q:
+        response_cache_key = get_registry_cache().hash_filters(
+            include_pagination=include_pagination, limit=limit, include_inactive=include_inactive, tags=sorted(tags_list) if tags_list else None, team_id=team_id, visibility=visibility
+        )
+        cached = await get_registry_cache().get_response("servers", response_cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
+
     # Use consolidated server listing with optional team filtering
     # For admin bypass: pass user_email=None and token_teams=None to skip all filtering
     logger.debug(f"User: {user_email} requested server list with include_inactive={include_inactive}, tags={tags_list}, team_id={team_id}, visibility={visibility}")
@@ -2500,8 +2667,12 @@ async def list_servers(
         team_id=team_id,
         visibility="public" if is_public_only_token and not visibility else visibility,
         token_teams=token_teams,  # None = admin bypass, [] = public-only, [...] = team-scoped
+        search=q,
     )
 
+    if response_cache_key is not None:
+        return await _store_list_response(request, "servers", response_cache_key, data, next_cursor, include_pagination)
+
     if include_pagination:
         payload = {"servers": [server.model_dump(by_alias=True) for server in data]}
         if next_cursor:
@@ -2844,6 +3015,7 @@ async def sse_endpoint(request: Request, server_id: str, user=Depends(get_curren
         user_with_token["auth_token"] = auth_token
         user_with_token["token_teams"] = token_teams  # None for unrestricted, [] for public-only, [...] for team-scoped
         user_with_token["is_admin"] = is_admin  # Preserve admin status for fallback token
+        user_with_token["auth_state"] = rpc_auth_state(request)  # Auth context for in-process dispatch of SSE messages
 
         # Defensive cleanup callback - runs immediately on client disconnect
         async def on_disconnect_cleanup() -> None:
@@ -3558,6 +3730,7 @@ async def list_tools(
     team_id: Optional[str] = Query(None, description="Filter by team ID"),
     visibility: Optional[str] = Query(None, description="Filter by visibility: private, team, public"),
     gateway_id: Optional[str] = Query(None, description="Filter by gateway ID"),
+    q: Optional[str] = Query(None, description="Full-text search over names, descriptions and tags"),
     db: Session = Depends(get_db),
     apijsonpath: JsonPathModifier = Body(None),
     user=Depends(get_current_user_with_permissions),
@@ -3575,6 +3748,7 @@ async def list_tools(
         team_id: Optional team ID to filter tools by specific team
         visibility: Optional visibility filter (private, team, public)
         gateway_id: Optional gateway ID to filter tools by specific gateway
+        q (Optional[str]): Full-text search query over names, descriptions and tags.
         db: Database session
         apijsonpath: JSON path modifier to filter or transform the response
         user: Authenticated user with permissions
@@ -3618,6 +3792,16 @@ async def list_tools(
     if not is_empty_team_token:
         team_id = team_id or token_team_id
 
+    # Unrestricted first pages are served from the pre-serialized response cache
+    response_cache_key = None
+    if apijsonpath is None and cursor is None and user_email is None and token_teams is None and not q:
+        response_cache_key = get_registry_cache().hash_filters(
+            include_pagination=include_pagination, limit=limit, include_inactive=include_inactive, tags=sorted(tags_list) if tags_list else None, team_id=team_id, visibility=visibility, gateway_id=gateway_id
+        )
+        cached = await get_registry_cache().get_response("tools", response_cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
+
     # Use unified list_tools() with token-based team filtering
     # Always apply visibility filtering based on token scope
     _req_team_roles = get_user_team_roles(db, _req_email) if _req_email and not _req_is_admin else None
@@ -3632,6 +3816,7 @@ async def list_tools(
         team_id=team_id,
         visibility=visibility,
         token_teams=token_teams,
+        search=q,
         requesting_user_email=_req_email,
         requesting_user_is_admin=_req_is_admin,
         requesting_user_team_roles=_req_team_roles,
@@ -3640,6 +3825,9 @@ async def list_tools(
     db.commit()
     db.close()
 
+    if response_cache_key is not None:
+        return await _store_list_response(request, "tools", response_cache_key, data, next_cursor, include_pagination)
+
     if apijsonpath is None:
         if include_pagination:
             payload = {"tools": [tool.model_dump(by_alias=True) for tool in data]}
@@ -4096,6 +4284,7 @@ async def list_resources(
     tags: Optional[str] = None,
     team_id: Optional[str] = None,
     visibility: Optional[str] = None,
+    q: Optional[str] = Query(None, description="Full-text search over names, descriptions and tags"),
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -4111,6 +4300,7 @@ async def list_resources(
         tags (Optional[str]): Comma-separated list of tags to filter by.
         team_id (Optional[str]): Filter by specific team ID.
         visibility (Optional[str]): Filter by visibility (private, team, public).
+        q (Optional[str]): Full-text search query over names, descriptions and tags.
         db (Session): Database session.
         user (str): Authenticated user.
 
@@ -4150,6 +4340,16 @@ async def list_resources(
     if not is_empty_team_token:
         team_id = team_id or token_team_id
 
+    # Unrestricted first pages are served from the pre-serialized response cache
+    response_cache_key = None
+    if cursor is None and user_email is None and token_teams is None and not q:
+        response_cache_key = get_registry_cache().hash_filters(
+            include_pagination=include_pagination, limit=limit, include_inactive=include_inactive, tags=sorted(tags_list) if tags_list else None, team_id=team_id, visibility=visibility
+        )
+        cached = await get_registry_cache().get_response("resources", response_cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
+
     # Use unified list_resources() with token-based team filtering
     # Always apply visibility filtering based on token scope
     logger.debug(f"User {user_email} requested resource list with cursor {cursor}, include_inactive={include_inactive}, tags={tags_list}, team_id={team_id}, visibility={visibility}")
@@ -4163,11 +4363,15 @@ async def list_resources(
         team_id=team_id,
         visibility=visibility,
         token_teams=token_teams,
+        search=q,
     )
     # Release transaction before response serialization
     db.commit()
     db.close()
 
+    if response_cache_key is not None:
+        return await _store_list_response(request, "resources", response_cache_key, data, next_cursor, include_pagination)
+
     if include_pagination:
         payload = {"resources": [resource.model_dump(by_alias=True) if hasattr(resource, "model_dump") else resource for resource in data]}
         if next_cursor:
@@ -4582,6 +4786,7 @@ async def list_prompts(
     tags: Optional[str] = None,
     team_id: Optional[str] = None,
     visibility: Optional[str] = None,
+    q: Optional[str] = Query(None, description="Full-text search over names, descriptions and tags"),
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
@@ -4597,6 +4802,7 @@ async def list_prompts(
         tags: Comma-separated list of tags to filter by.
         team_id: Filter by specific team ID.
         visibility: Filter by visibility (private, team, public).
+        q (Optional[str]): Full-text search query over names, descriptions and tags.
         db: Database session.
         user: Authenticated user.
 
@@ -4636,6 +4842,16 @@ async def list_prompts(
     if not is_empty_team_token:
         team_id = team_id or token_team_id
 
+    # Unrestricted first pages are served from the pre-serialized response cache
+    response_cache_key = None
+    if cursor is None and user_email is None and token_teams is None and not q:
+        response_cache_key = get_registry_cache().hash_filters(
+            include_pagination=include_pagination, limit=limit, include_inactive=include_inactive, tags=sorted(tags_list) if tags_list else None, team_id=team_id, visibility=visibility
+        )
+        cached = await get_registry_cache().get_response("prompts", response_cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
+
     # Use consolidated prompt listing with token-based team filtering
     # Always apply visibility filtering based on token scope
     logger.debug(f"User: {user_email} requested prompt list with include_inactive={include_inactive}, cursor={cursor}, tags={tags_list}, team_id={team_id}, visibility={visibility}")
@@ -4649,11 +4865,15 @@ async def list_prompts(
         team_id=team_id,
         visibility=visibility,
         token_teams=token_teams,
+        search=q,
     )
     # Release transaction before response serialization
     db.commit()
     db.close()
 
+    if response_cache_key is not None:
+        return await _store_list_response(request, "prompts", response_cache_key, data, next_cursor, include_pagination)
+
     if include_pagination:
         payload = {"prompts": [prompt.model_dump(by_alias=True) if hasattr(prompt, "model_dump") else prompt for prompt in data]}
         if next_cursor:
@@ -5083,6 +5303,7 @@ async def list_gateways(
     include_inactive: bool = False,
     team_id: Optional[str] = Query(None, description="Filter by team ID"),
     visibility: Optional[str] = Query(None, description="Filter by visibility: private, team, public"),
+    q: Optional[str] = Query(None, description="Full-text search over names, descriptions and tags"),
     db: Session = Depends(get_db),
     user=Depends(get_current_user_with_permissions),
 ) -> Union[List[GatewayRead], Dict[str, Any]]:
@@ -5097,6 +5318,7 @@ async def list_gateways(
         include_inactive: Include inactive gateways.
         team_id (Optional): Filter by specific team ID.
         visibility (Optional): Filter by visibility (private, team, public).
+        q (Optional[str]): Full-text search query over names, descriptions and tags.
         db: Database session.
         user: Authenticated user.
 
@@ -5128,6 +5350,14 @@ async def list_gateways(
     is_admin_bypass = token_teams is None
     is_public_only_token = token_teams is not None and len(token_teams) == 0
 
+    # Unrestricted first pages are served from the pre-serialized response cache
+    response_cache_key = None
+    if cursor is None and is_admin_bypass and not q:
+        response_cache_key = get_registry_cache().hash_filters(include_pagination=include_pagination, limit=limit, include_inactive=include_inactive, team_id=team_id, visibility=visibility)
+        cached = await get_registry_cache().get_response("gateways", response_cache_key)
+        if cached is not None:
+            return _cached_response(request, cached)
+
     # Use consolidated gateway listing with optional team filtering
     # For admin bypass: pass user_email=None and token_teams=None to skip all filtering
     logger.debug(f"User: {user_email} requested gateway list with include_inactive={include_inactive}, team_id={team_id}, visibility={visibility}")
@@ -5140,11 +5370,15 @@ async def list_gateways(
         team_id=team_id,
         visibility="public" if is_public_only_token and not visibility else visibility,
         token_teams=token_teams,  # None = admin bypass, [] = public-only, [...] = team-scoped
+        search=q,
     )
     # Release transaction before response serialization
     db.commit()
     db.close()
 
+    if response_cache_key is not None:
+        return await _store_list_response(request, "gateways", response_cache_key, data, next_cursor, include_pagination)
+
     if include_pagination:
         payload = {"gateways": [gateway.model_dump(by_alias=True) for gateway in data]}
         if next_cursor:
@@ -5628,11 +5862,323 @@ async def remove_root(
 async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user_with_permissions)):
     """Handle RPC requests.
 
+    Accepts either a single JSON-RPC request object or a JSON-RPC 2.0 batch
+    (a JSON array of request objects). Batches are authenticated once and
+    their entries are dispatched concurrently, see ``_handle_rpc_batch``.
+
     Args:
         request (Request): The incoming FastAPI request.
         db (Session): Database session.
         user: The authenticated user (dict with RBAC context).
 
+    Returns:
+        Response with the RPC result or error.
+    """
+    # Extract user identifier from either RBAC user object or JWT payload
+    if hasattr(user, "email"):
+        user_id = getattr(user, "email", None)  # RBAC user object
+    elif isinstance(user, dict):
+        user_id = user.get("sub") or user.get("email") or user.get("username", "unknown")  # JWT payload
+    else:
+        user_id = str(user)  # String username from basic auth
+
+    logger.debug(f"User {user_id} made an RPC request")
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return ORJSONResponse(
+            status_code=400,
+            content={
+                "jsonrpc": "2.0",
+                "error": {"code": -32700, "message": "Parse error"},
+                "id": None,
+            },
+        )
+
+    if isinstance(body, list):
+        response = await _handle_rpc_batch(request, body, user)
+        if isinstance(response, list) and any(_has_preserialized_result(entry) for entry in response):
+            return ORJSONResponse(content=response)
+        return response
+    response = await _handle_rpc_request(request, body, db, user)
+    if _has_preserialized_result(response):
+        return ORJSONResponse(content=response)
+    return response
+
+
+def _has_preserialized_result(response: Any) -> bool:
+    """Return True if a JSON-RPC response carries an ``orjson.Fragment`` result.
+
+    Such results come straight from the registry response cache and can only
+    be rendered by orjson, not by FastAPI's ``jsonable_encoder``.
+
+    Args:
+        response: Value returned by ``_handle_rpc_request``.
+
+    Returns:
+        bool: True if the response must be rendered with ``ORJSONResponse``.
+
+    Examples:
+        >>> _has_preserialized_result({"jsonrpc": "2.0", "result": orjson.Fragment(b"{}"), "id": 1})
+        True
+        >>> _has_preserialized_result({"jsonrpc": "2.0", "result": {}, "id": 1})
+        False
+    """
+    return isinstance(response, dict) and isinstance(response.get("result"), orjson.Fragment)
+
+
+def _rpc_invalid_request(req_id: Any = None, message: str = "Invalid Request") -> Dict[str, Any]:
+    """Build a JSON-RPC ``Invalid Request`` (-32600) error response.
+
+    Args:
+        req_id: Id of the offending request, or None when it cannot be determined.
+        message: Error message.
+
+    Returns:
+        Dict[str, Any]: JSON-RPC error response object.
+
+    Examples:
+        >>> _rpc_invalid_request(7)
+        {'jsonrpc': '2.0', 'error': {'code': -32600, 'message': 'Invalid Request'}, 'id': 7}
+    """
+    return {"jsonrpc": "2.0", "error": {"code": -32600, "message": message}, "id": req_id}
+
+
+def _is_rpc_notification(entry: Any) -> bool:
+    """Return True if a batch entry is a JSON-RPC notification (a request without an ``id`` member).
+
+    Args:
+        entry: A decoded batch entry.
+
+    Returns:
+        bool: True if no response must be produced for the entry.
+
+    Examples:
+        >>> _is_rpc_notification({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        True
+        >>> _is_rpc_notification({"jsonrpc": "2.0", "method": "ping", "id": 0})
+        False
+        >>> _is_rpc_notification([1, 2])
+        False
+    """
+    return isinstance(entry, dict) and "method" in entry and "id" not in entry
+
+
+async def _handle_rpc_batch(request: Request, batch: List[Any], user) -> Any:
+    """Handle a JSON-RPC 2.0 batch request.
+
+    Authentication and RBAC have already been performed once for the whole
+    batch by the ``/rpc`` dependencies. Entries are dispatched concurrently
+    (bounded by ``mcpgateway_rpc_batch_concurrency``), each with its own
+    short-lived database session because SQLAlchemy sessions cannot be shared
+    between concurrent tasks. Responses are returned in request order and
+    notifications produce no response entry.
+
+    Args:
+        request: The incoming FastAPI request.
+        batch: The decoded JSON array.
+        user: The authenticated user (dict with RBAC context).
+
+    Returns:
+        A list of JSON-RPC responses, an error response for an invalid batch,
+        or an empty 202 response when the batch contains only notifications.
+    """
+    if not settings.mcpgateway_rpc_batch_enabled:
+        return ORJSONResponse(status_code=400, content=_rpc_invalid_request(message="Batch requests are disabled"))
+    if not batch:
+        return ORJSONResponse(status_code=400, content=_rpc_invalid_request())
+    if len(batch) > settings.mcpgateway_rpc_batch_max_size:
+        return ORJSONResponse(
+            status_code=400,
+            content=_rpc_invalid_request(message=f"Batch too large: {len(batch)} requests exceeds limit of {settings.mcpgateway_rpc_batch_max_size}"),
+        )
+
+    semaphore = asyncio.Semaphore(max(1, settings.mcpgateway_rpc_batch_concurrency))
+
+    async def run_entry(index: int, entry: Any) -> Any:
+        """Dispatch a single batch entry and normalize its response.
+
+        Args:
+            index: Position of the entry in the batch.
+            entry: A decoded batch entry.
+
+        Returns:
+            The JSON-RPC response dict for the entry.
+        """
+        if not isinstance(entry, dict) or "method" not in entry:
+            return _rpc_invalid_request(entry.get("id") if isinstance(entry, dict) else None)
+
+        async with semaphore:
+            return await _dispatch_rpc_entry(_rpc_batch_entry_request(request, index), entry, user)
+
+    logger.debug(f"Dispatching JSON-RPC batch of {len(batch)} requests")
+    responses = await asyncio.gather(*(run_entry(index, entry) for index, entry in enumerate(batch)))
+    results = [response for entry, response in zip(batch, responses) if not _is_rpc_notification(entry)]
+    if not results:
+        return Response(status_code=202)
+    return results
+
+
+def _rpc_batch_entry_request(request: Request, index: int) -> Request:
+    """Build the request a batch entry is dispatched with.
+
+    Entries run concurrently, and the handlers update the plugin global context
+    in place (server, user), so each entry gets its own copy of the context, with
+    a per-entry request ID, and a fresh plugin context table. Headers and auth
+    state are shared with the batch request.
+
+    Args:
+        request: The batch request.
+        index: Position of the entry in the batch.
+
+    Returns:
+        Request: A request sharing the batch request's scope but not its plugin contexts.
+
+    Examples:
+        >>> batch = Request({"type": "http", "headers": [], "state": {"plugin_global_context": GlobalContext(request_id="r1"), "plugin_context_table": {}, "token_teams": ["t1"]}})
+        >>> entry = _rpc_batch_entry_request(batch, 2)
+        >>> entry.state.plugin_global_context.request_id, batch.state.plugin_global_context.request_id
+        ('r1-2', 'r1')
+        >>> hasattr(entry.state, "plugin_context_table"), entry.state.token_teams
+        (False, ['t1'])
+    """
+    state = {key: value for key, value in (request.scope.get("state") or {}).items() if key != "plugin_context_table"}
+    global_context = state.get("plugin_global_context")
+    if isinstance(global_context, GlobalContext):
+        state["plugin_global_context"] = global_context.model_copy(update={"request_id": f"{global_context.request_id}-{index}"}, deep=True)
+    return Request({**request.scope, "state": state})
+
+
+async def _dispatch_rpc_entry(request: Request, entry: Dict[str, Any], user) -> Dict[str, Any]:
+    """Dispatch one JSON-RPC request with its own database session and return a plain JSON-RPC response.
+
+    Plugin errors and the HTTP responses that single-request error paths return
+    are converted to JSON-RPC error entries, for callers that cannot send an
+    HTTP status (batch entries, SSE and WebSocket messages).
+
+    Args:
+        request: Request carrying the caller's headers and auth state.
+        entry: The decoded JSON-RPC request object.
+        user: The authenticated user (dict with RBAC context).
+
+    Returns:
+        Dict[str, Any]: JSON-RPC response object.
+    """
+    try:
+        with fresh_db_session() as entry_db:
+            response = await _handle_rpc_request(request, entry, entry_db, user)
+    except PluginViolationError as e:
+        response = await plugin_violation_exception_handler(request, e)
+    except PluginError as e:
+        response = await plugin_exception_handler(request, e)
+
+    if isinstance(response, Response):
+        content = orjson.loads(response.body)
+        error = content.get("error") or {"code": -32600, "message": content.get("message", "Invalid Request")}
+        return {"jsonrpc": "2.0", "error": error, "id": entry.get("id")}
+    return response
+
+
+# Auth state set on request.state by the /rpc auth dependencies and read by the RPC handlers
+_RPC_AUTH_STATE_KEYS = ("token_teams", "team_id", "token_use", "auth_method", "jti", "user_email", "_jwt_verified_payload")
+
+
+def rpc_auth_state(connection: HTTPConnection) -> Dict[str, Any]:
+    """Snapshot the auth state of an authenticated connection for in-process RPC dispatch.
+
+    Args:
+        connection: Request (or WebSocket) the caller was authenticated on.
+
+    Returns:
+        Dict[str, Any]: The auth attributes present on ``connection.state``.
+
+    Examples:
+        >>> from starlette.requests import Request
+        >>> request = Request({"type": "http", "headers": [], "state": {"token_teams": ["t1"], "plugin_global_context": object()}})
+        >>> rpc_auth_state(request)
+        {'token_teams': ['t1']}
+    """
+    state = connection.scope.get("state") or {}
+    auth_state = {key: state[key] for key in _RPC_AUTH_STATE_KEYS if key in state}
+    if "_jwt_verified_payload" in auth_state:
+        # Token IP restrictions are checked against the connection's client for every message
+        auth_state["client_ip"] = token_scoping_middleware._get_client_ip(connection)  # pylint: disable=protected-access
+    return auth_state
+
+
+async def dispatch_rpc_message(message: Any, user, auth_state: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Any:
+    """Dispatch a JSON-RPC message in process for a caller authenticated by its transport.
+
+    Used by the SSE and WebSocket transports instead of an HTTP round trip
+    through ``/rpc``: the message runs through the same handlers as ``/rpc``
+    without another pass through TCP, the middleware stack and JWT
+    verification. The connection's token is checked again for every message:
+    calls with a token that has expired or been revoked since the connection
+    was authenticated, or that its scopes (server, IP, time, permissions) do
+    not allow, are rejected like ``TokenScopingMiddleware`` rejects them on ``/rpc``.
+
+    Args:
+        message: The decoded JSON-RPC request object, or a list of them for a batch.
+        user: The authenticated user (dict with RBAC context), as returned by the auth dependencies.
+        auth_state: Auth state of the connection, see ``rpc_auth_state``.
+        headers: Request headers visible to the handlers (session affinity, passthrough headers).
+
+    Returns:
+        The JSON-RPC response object (a list for a batch), or None for a batch of notifications.
+
+    Examples:
+        >>> import asyncio, time
+        >>> expired = {"_jwt_verified_payload": ("token", {"exp": int(time.time()) - 1})}
+        >>> asyncio.run(dispatch_rpc_message({"jsonrpc": "2.0", "method": "ping", "id": 1}, {"email": "a@example.com"}, expired))["error"]["message"]
+        'Authentication token expired'
+        >>> asyncio.run(dispatch_rpc_message(42, {"email": "a@example.com"}))["error"]["code"]
+        -32600
+    """
+    if not isinstance(message, (dict, list)):
+        return _rpc_invalid_request()
+
+    state = dict(auth_state or {})
+    verified = state.get("_jwt_verified_payload")
+    if isinstance(verified, tuple) and len(verified) == 2 and isinstance(verified[1], dict):
+        exp = verified[1].get("exp")
+        if isinstance(exp, (int, float)) and exp < time.time():
+            return {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Authentication token expired"}, "id": message.get("id") if isinstance(message, dict) else None}
+        if settings.email_auth_enabled:
+            entries = message if isinstance(message, list) else [message]
+            server_ids = [entry["params"].get("server_id") if isinstance(entry, dict) and isinstance(entry.get("params"), dict) else None for entry in entries]
+            try:
+                await token_scoping_middleware.check_rpc_message(verified[1], server_ids or [None], client_ip=state.get("client_ip"))
+            except HTTPException as exc:
+                return {"jsonrpc": "2.0", "error": {"code": -32000, "message": exc.detail}, "id": message.get("id") if isinstance(message, dict) else None}
+
+    request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/rpc",
+            "root_path": settings.app_root_path,
+            "query_string": b"",
+            "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in (headers or {}).items()],
+            "state": state,
+        }
+    )
+    if isinstance(message, list):
+        response = await _handle_rpc_batch(request, message, user)
+        if isinstance(response, Response):
+            return orjson.loads(response.body) if response.body else None
+        return response
+    return await _dispatch_rpc_entry(request, message, user)
+
+
+async def _handle_rpc_request(request: Request, body: Any, db: Session, user):
+    """Handle a single JSON-RPC request object.
+
+    Args:
+        request (Request): The incoming FastAPI request.
+        body: The decoded JSON-RPC request object.
+        db (Session): Database session.
+        user: The authenticated user (dict with RBAC context).
+
     Returns:
         Response with the RPC result or error.
 
@@ -5642,26 +6188,6 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
     """
     req_id = None
     try:
-        # Extract user identifier from either RBAC user object or JWT payload
-        if hasattr(user, "email"):
-            user_id = getattr(user, "email", None)  # RBAC user object
-        elif isinstance(user, dict):
-            user_id = user.get("sub") or user.get("email") or user.get("username", "unknown")  # JWT payload
-        else:
-            user_id = str(user)  # String username from basic auth
-
-        logger.debug(f"User {user_id} made an RPC request")
-        try:
-            body = orjson.loads(await request.body())
-        except orjson.JSONDecodeError:
-            return ORJSONResponse(
-                status_code=400,
-                content={
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32700, "message": "Parse error"},
-                    "id": None,
-                },
-            )
         method = body["method"]
         req_id = body.get("id")
         if req_id is None:
@@ -5752,7 +6278,13 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                 token_teams = None  # Admin unrestricted
             elif token_teams is None:
                 token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
+            discovery_tools = await get_tool_discovery_service().stub_tools(db, server_id) if server_id else None
+            if discovery_tools is not None:
+                # Large catalog: list only the search meta-tool
+                db.commit()
+                db.close()
+                result = {"tools": discovery_tools}
+            elif server_id:
                 tools = await tool_service.list_server_tools(
                     db,
                     server_id,
@@ -5768,22 +6300,38 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                 db.close()
                 result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
             else:
-                tools, next_cursor = await tool_service.list_tools(
-                    db,
-                    cursor=cursor,
-                    limit=0,
-                    user_email=user_email,
-                    token_teams=token_teams,
-                    requesting_user_email=_req_email,
-                    requesting_user_is_admin=_req_is_admin,
-                    requesting_user_team_roles=_req_team_roles,
-                )
+                # Unrestricted first pages are spliced into the envelope from the pre-serialized response cache
+                response_cache_key = None
+                cached = None
+                if cursor is None and user_email is None and token_teams is None:
+                    response_cache_key = get_registry_cache().hash_filters(rpc_method=method)
+                    cached = await get_registry_cache().get_response("tools", response_cache_key)
+                if cached is None:
+                    tools, next_cursor = await tool_service.list_tools(
+                        db,
+                        cursor=cursor,
+                        limit=0,
+                        user_email=user_email,
+                        token_teams=token_teams,
+                        requesting_user_email=_req_email,
+                        requesting_user_is_admin=_req_is_admin,
+                        requesting_user_team_roles=_req_team_roles,
+                    )
                 # Release DB connection early to prevent idle-in-transaction under load
                 db.commit()
                 db.close()
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
+                if cached is not None:
+                    result = orjson.Fragment(cached.body)
+                elif response_cache_key is not None:
+                    result = {"tools": [t.model_dump(mode="json", by_alias=True, exclude_none=True) for t in tools]}
+                    if next_cursor:
+                        result["nextCursor"] = next_cursor
+                    cached = await get_registry_cache().set_response("tools", orjson.dumps(result), response_cache_key)
+                    result = orjson.Fragment(cached.body)
+                else:
+                    result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
+                    if next_cursor:
+                        result["nextCursor"] = next_cursor
         elif method == "list_tools":  # Legacy endpoint
             user_email, token_teams, is_admin = _get_rpc_filter_context(request, user)
             _req_email, _req_is_admin = user_email, is_admin
@@ -5795,7 +6343,13 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                 token_teams = None  # Admin unrestricted
             elif token_teams is None:
                 token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
+            discovery_tools = await get_tool_discovery_service().stub_tools(db, server_id) if server_id else None
+            if discovery_tools is not None:
+                # Large catalog: list only the search meta-tool
+                db.commit()
+                db.close()
+                result = {"tools": discovery_tools}
+            elif server_id:
                 tools = await tool_service.list_server_tools(
                     db,
                     server_id,
@@ -6057,6 +6611,7 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                             plugin_context_table=plugin_context_table,
                             plugin_global_context=plugin_global_context,
                             meta_data=meta_data,
+                            token_jti=getattr(request.state, "jti", None),
                         )
                     except ValueError:
                         # Tool not found log error and raise JSONRPCError
@@ -6283,10 +6838,11 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                     plugin_context_table=plugin_context_table,
                     plugin_global_context=plugin_global_context,
                     meta_data=meta_data,
+                    token_jti=getattr(request.state, "jti", None),
                 )
                 if hasattr(result, "model_dump"):
                     result = result.model_dump(by_alias=True, exclude_none=True)
-            except (PluginError, PluginViolationError):
+            except (PluginError, PluginViolationError, ToolRateLimitError):
                 raise
             except Exception:
                 # Log error and return invalid method
@@ -6300,6 +6856,12 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
     except JSONRPCError as e:
         error = e.to_dict()
         return {"jsonrpc": "2.0", "error": error["error"], "id": req_id}
+    except ToolRateLimitError as e:
+        return ORJSONResponse(
+            content={"jsonrpc": "2.0", "error": e.rpc_error(), "id": req_id},
+            status_code=429,
+            headers=e.result.headers(),
+        )
     except Exception as e:
         if isinstance(e, ValueError):
             return ORJSONResponse(content={"message": "Method invalid"}, status_code=422)
@@ -6314,15 +6876,16 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
 @utility_router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
-    Handle WebSocket connection to relay JSON-RPC requests to the internal RPC endpoint.
+    Handle WebSocket connection to relay JSON-RPC requests to the internal RPC handlers.
 
-    Accepts incoming text messages, parses them as JSON-RPC requests, sends them to /rpc,
-    and returns the result to the client over the same WebSocket.
+    Authenticates the connection once, like ``/rpc`` does for each request, then
+    accepts incoming text messages, parses them as JSON-RPC requests, dispatches
+    them in process and returns the result to the client over the same WebSocket.
 
     Args:
         websocket: The WebSocket connection instance.
     """
-    # Track auth credentials to forward to /rpc
+    # Track auth credentials of the connection
     auth_token: Optional[str] = None
     proxy_user: Optional[str] = None
 
@@ -6357,26 +6920,30 @@ async def websocket_endpoint(websocket: WebSocket):
                     await websocket.close(code=1008, reason="Invalid authentication")
                     return
 
+        # Resolve the user and auth state once for the connection, with the same dependency as /rpc
+        auth_request = Request({**websocket.scope, "type": "http", "method": "GET", "state": dict(websocket.scope.get("state") or {})})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=auth_token) if auth_token else None
+        try:
+            user = await get_current_user_with_permissions(auth_request, credentials=credentials, jwt_token=None)
+        except HTTPException:
+            await websocket.close(code=1008, reason="Invalid authentication")
+            return
+        auth_state = rpc_auth_state(auth_request)
+
+        # Headers visible to the RPC handlers (passthrough headers)
+        rpc_headers: Dict[str, str] = {"content-type": "application/json"}
+        if auth_token:
+            rpc_headers["authorization"] = f"Bearer {auth_token}"
+        if proxy_user:
+            rpc_headers[settings.proxy_user_header] = proxy_user
+
         await websocket.accept()
         while True:
             try:
                 data = await websocket.receive_text()
-                client_args = {"timeout": settings.federation_timeout, "verify": not settings.skip_ssl_verify}
-
-                # Build headers for /rpc request - forward auth credentials
-                rpc_headers: Dict[str, str] = {"Content-Type": "application/json"}
-                if auth_token:
-                    rpc_headers["Authorization"] = f"Bearer {auth_token}"
-                if proxy_user:
-                    rpc_headers[settings.proxy_user_header] = proxy_user
-
-                async with ResilientHttpClient(client_args=client_args) as client:
-                    response = await client.post(
-                        f"http://localhost:{settings.port}{settings.app_root_path}/rpc",
-                        json=orjson.loads(data),
-                        headers=rpc_headers,
-                    )
-                    await websocket.send_text(response.text)
+                response = await dispatch_rpc_message(orjson.loads(data), user, auth_state=auth_state, headers=rpc_headers)
+                if response is not None:
+                    await websocket.send_text(orjson.dumps(response).decode())
             except JSONRPCError as e:
                 await websocket.send_text(orjson.dumps(e.to_dict()).decode())
             except orjson.JSONDecodeError:
@@ -6468,6 +7035,7 @@ async def utility_sse_endpoint(request: Request, user=Depends(get_current_user_w
         user_with_token["auth_token"] = auth_token
         user_with_token["token_teams"] = token_teams  # None for unrestricted, [] for public-only, [...] for team-scoped
         user_with_token["is_admin"] = is_admin  # Preserve admin status for fallback token
+        user_with_token["auth_state"] = rpc_auth_state(request)  # Auth context for in-process dispatch of SSE messages
 
         # Create respond task and register for cancellation on disconnect
         respond_task = asyncio.create_task(session_registry.respond(None, user_with_token, session_id=transport.session_id, base_url=base_url))
@@ -17,13 +17,11 @@ Examples:
 
 # Standard
 import logging
-from typing import Callable
 
 # Third-Party
 from fastapi.security import HTTPAuthorizationCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.auth import get_current_user
@@ -55,7 +53,7 @@ def _should_log_auth_failure() -> bool:
     return settings.security_logging_level in ("all", "failures_only")
 
 
-class AuthContextMiddleware(BaseHTTPMiddleware):
+class AuthContextMiddleware:
     """Middleware for extracting user authentication context early in request lifecycle.
 
     This middleware attempts to authenticate requests using JWT tokens from cookies
@@ -70,19 +68,33 @@ class AuthContextMiddleware(BaseHTTPMiddleware):
         Route-level dependencies should still enforce authentication requirements.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and populate user context if authenticated.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+            app: The ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Populate user context if authenticated, then call the wrapped app.
+
+        Args:
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
+        """
+        # Skip for non-HTTP scopes, health checks and static files
+        if scope["type"] == "http" and not should_skip_auth_context(scope["path"]):
+            await self._populate_user_context(Request(scope, receive))
+        await self.app(scope, receive, send)
+
+    async def _populate_user_context(self, request: Request) -> None:
+        """Authenticate the request and store the user in ``request.state.user``.
 
-        Returns:
-            HTTP response
+        Args:
+            request: Incoming HTTP request
         """
-        # Skip for health checks and static files
-        if should_skip_auth_context(request.url.path):
-            return await call_next(request)
 
         # Try to extract token from multiple sources
         token = None
@@ -99,7 +111,7 @@ class AuthContextMiddleware(BaseHTTPMiddleware):
 
         # If no token found, continue without user context
         if not token:
-            return await call_next(request)
+            return
 
         # Check logging settings once upfront to avoid DB session when not needed
         log_success = _should_log_auth_success()
@@ -171,6 +183,3 @@ class AuthContextMiddleware(BaseHTTPMiddleware):
                         db.close()
                     except Exception as close_error:
                         logger.debug(f"Failed to close database session: {close_error}")
-
-        # Continue with request
-        return await call_next(request)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/middleware/body_replay.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Request body replay for raw ASGI middleware.
+
+A raw ASGI middleware that reads the request body (to validate or log it)
+consumes the ``http.request`` messages of ``receive``. ``replay_body`` returns
+a receive callable that hands the already-read body to the downstream app and
+then forwards to the original ``receive`` (so disconnects are still seen),
+like ``BaseHTTPMiddleware`` does for bodies read in ``dispatch``.
+
+Examples:
+    >>> import asyncio
+    >>> from mcpgateway.middleware.body_replay import replay_body
+    >>> async def receive():
+    ...     return {"type": "http.disconnect"}
+    >>> replayed = replay_body(b'{"a": 1}', receive)
+    >>> asyncio.run(replayed())
+    {'type': 'http.request', 'body': b'{"a": 1}', 'more_body': False}
+    >>> asyncio.run(replayed())
+    {'type': 'http.disconnect'}
+"""
+
+# Third-Party
+from starlette.types import Message, Receive
+
+
+def replay_body(body: bytes, receive: Receive) -> Receive:
+    """Return a receive callable that first delivers ``body`` as one message.
+
+    Args:
+        body: Request body already read from ``receive``
+        receive: Original receive callable
+
+    Returns:
+        Receive: Receive callable for the downstream app
+    """
+    replayed = False
+
+    async def replay() -> Message:
+        """Deliver the buffered body once, then defer to the original receive.
+
+        Returns:
+            Message: ASGI receive message
+        """
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
@@ -20,11 +20,10 @@ This enables end-to-end tracing: HTTP → Middleware → Services → Plugins 
 
 # Standard
 import logging
-from typing import Callable
 
 # Third-Party
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.config import settings
@@ -38,7 +37,7 @@ from mcpgateway.utils.correlation_id import (
 logger = logging.getLogger(__name__)
 
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
+class CorrelationIDMiddleware:
     """Middleware for automatic request ID (correlation ID) handling.
 
     This middleware:
@@ -59,20 +58,23 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     - correlation_id_header: Header name to use (default: X-Correlation-ID)
     - correlation_id_preserve: Whether to preserve incoming IDs (default: True)
     - correlation_id_response_header: Whether to add ID to responses (default: True)
+
+    Implemented as raw ASGI middleware: the response header is added to the
+    ``http.response.start`` message, so streaming responses are not buffered.
     """
 
-    def __init__(self, app):
+    def __init__(self, app: ASGIApp):
         """Initialize the correlation ID (request ID) middleware.
 
         Args:
             app: The FastAPI application instance
         """
-        super().__init__(app)
+        self.app = app
         self.header_name = getattr(settings, "correlation_id_header", "X-Correlation-ID")
         self.preserve_incoming = getattr(settings, "correlation_id_preserve", True)
         self.add_to_response = getattr(settings, "correlation_id_response_header", True)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and manage request ID (correlation ID) lifecycle.
 
         Extracts or generates a request ID, stores it in context variables for use throughout
@@ -80,16 +82,18 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         it back into the X-Correlation-ID response header.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler
-
-        Returns:
-            Response: The HTTP response with correlation ID header added
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract correlation ID from incoming request headers
         correlation_id = None
         if self.preserve_incoming:
-            correlation_id = extract_correlation_id_from_headers(dict(request.headers), self.header_name)
+            correlation_id = extract_correlation_id_from_headers(dict(Headers(scope=scope)), self.header_name)
 
         # Generate new correlation ID if none was provided
         if not correlation_id:
@@ -102,16 +106,19 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         # This makes it available to all downstream code (auth, services, plugins, logs)
         set_correlation_id(correlation_id)
 
-        try:
-            # Process the request
-            response = await call_next(request)
-
-            # Add correlation ID to response headers if enabled
-            if self.add_to_response:
-                response.headers[self.header_name] = correlation_id
+        async def send_wrapper(message: Message) -> None:
+            """Add the correlation ID to the response headers.
 
-            return response
+            Args:
+                message: ASGI message dict
+            """
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.header_name] = correlation_id
+            await send(message)
 
+        try:
+            # Process the request
+            await self.app(scope, receive, send_wrapper if self.add_to_response else send)
         finally:
             # Clean up context after request completes
             # Note: ContextVar automatically cleans up, but explicit cleanup is good practice
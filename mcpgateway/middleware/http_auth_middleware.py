@@ -11,8 +11,8 @@ import logging
 
 # Third-Party
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.plugins.framework import GlobalContext, HttpHeaderPayload, HttpHookType, HttpPostRequestPayload, HttpPreRequestPayload, PluginManager
@@ -21,7 +21,7 @@ from mcpgateway.utils.correlation_id import generate_correlation_id, get_correla
 logger = logging.getLogger(__name__)
 
 
-class HttpAuthMiddleware(BaseHTTPMiddleware):
+class HttpAuthMiddleware:
     """Middleware for HTTP authentication hooks.
 
     This middleware invokes plugin hooks for HTTP request processing:
@@ -34,6 +34,9 @@ class HttpAuthMiddleware(BaseHTTPMiddleware):
     - Implement custom authentication schemes
     - Audit authentication attempts
     - Log response status and headers
+
+    Implemented as raw ASGI middleware: the post-request hook runs on the
+    ``http.response.start`` message, before the body is streamed.
     """
 
     def __init__(self, app: ASGIApp, plugin_manager: PluginManager | None = None):
@@ -43,29 +46,31 @@ class HttpAuthMiddleware(BaseHTTPMiddleware):
             app: The ASGI application
             plugin_manager: Optional plugin manager for hook invocation
         """
-        super().__init__(app)
+        self.app = app
         self.plugin_manager = plugin_manager
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through plugin hooks.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware/handler in the chain
-
-        Returns:
-            The response from the application
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
         """
-        # Skip hook invocation if no plugin manager
-        if not self.plugin_manager:
-            return await call_next(request)
+        # Skip hook invocation for non-HTTP scopes or if no plugin manager
+        if scope["type"] != "http" or not self.plugin_manager:
+            await self.app(scope, receive, send)
+            return
 
         # Skip payload creation if no HTTP hooks registered
         has_pre = self.plugin_manager.has_hooks_for(HttpHookType.HTTP_PRE_REQUEST)
         has_post = self.plugin_manager.has_hooks_for(HttpHookType.HTTP_POST_REQUEST)
 
         if not has_pre and not has_post:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
 
         # Use correlation ID from CorrelationIDMiddleware if available
         # This ensures all hooks and downstream code see the same unified request ID
@@ -120,18 +125,15 @@ class HttpAuthMiddleware(BaseHTTPMiddleware):
 
                 # Apply modified headers if plugin returned them
                 if pre_result.modified_payload:
-                    # Modify request headers by updating request.scope["headers"]
-                    # This is the proper way to modify headers in Starlette/FastAPI
-                    # Reference: https://stackoverflow.com/questions/69934160/python-how-to-manipulate-fastapi-request-headers-to-be-mutable
+                    # Modify request headers by updating scope["headers"], the raw header list Starlette uses
                     modified_headers_dict = pre_result.modified_payload.root
 
                     # Merge modified headers with original headers (modified headers take precedence)
                     original_headers = dict(request.headers)
                     merged_headers = {**original_headers, **modified_headers_dict}
 
-                    # Update request.scope["headers"] which is the raw header list Starlette uses
                     # Convert dict to list of (name, value) tuples with lowercase byte keys
-                    request.scope["headers"] = [(name.lower().encode(), value.encode()) for name, value in merged_headers.items()]
+                    scope["headers"] = [(name.lower().encode(), value.encode()) for name, value in merged_headers.items()]
 
                     logger.debug(f"Pre-request hook modified headers: {list(modified_headers_dict.keys())}")
 
@@ -139,42 +141,62 @@ class HttpAuthMiddleware(BaseHTTPMiddleware):
                 # Log but don't fail the request if pre-hook has issues
                 logger.warning(f"HTTP_PRE_REQUEST hook failed: {e}", exc_info=True)
 
-        # Process the request through the rest of the application
-        response = await call_next(request)
+        if not has_post:
+            # Process the request through the rest of the application
+            await self.app(scope, receive, send)
+            return
 
-        # POST-REQUEST HOOK: Allow plugins to inspect and modify response
-        # Only create payload and invoke hook if plugins are registered for this hook type
-        if has_post:
-            try:
-                # Extract response headers
-                response_headers = HttpHeaderPayload(root=dict(response.headers))
+        async def send_wrapper(message: Message) -> None:
+            """Run the post-request hook when the response starts.
 
-                post_result, _ = await self.plugin_manager.invoke_hook(
-                    HttpHookType.HTTP_POST_REQUEST,
-                    payload=HttpPostRequestPayload(
-                        path=str(request.url.path),
-                        method=request.method,
-                        headers=HttpHeaderPayload(root=dict(request.headers)),
-                        client_host=client_host,
-                        client_port=client_port,
-                        response_headers=response_headers,
-                        status_code=response.status_code,
-                    ),
-                    global_context=global_context,
-                    local_contexts=context_table,  # Pass context from pre-hook
-                    violations_as_exceptions=False,  # Don't block on post-request violations
-                )
+            Args:
+                message: ASGI message dict
+            """
+            if message["type"] == "http.response.start":
+                await self._post_request(request, message, global_context, context_table, client_host, client_port)
+            await send(message)
 
-                # Apply modified response headers if plugin returned them
-                if post_result.modified_payload:
-                    modified_response_headers = post_result.modified_payload.root
-                    # Update response headers (response.headers is mutable)
-                    for header_name, header_value in modified_response_headers.items():
-                        response.headers[header_name] = header_value
-                    logger.debug(f"Post-request hook modified response headers: {list(modified_response_headers.keys())}")
+        await self.app(scope, receive, send_wrapper)
 
-            except Exception as e:
-                # Log but don't fail the response if post-hook has issues
-                logger.warning(f"HTTP_POST_REQUEST hook failed: {e}", exc_info=True)
+    async def _post_request(self, request: Request, message: Message, global_context: GlobalContext, context_table, client_host, client_port) -> None:
+        """Invoke the HTTP_POST_REQUEST hook and apply modified response headers.
 
-        return response
+        Args:
+            request: The incoming request
+            message: ``http.response.start`` message (headers are modified in place)
+            global_context: Global context shared with the pre-request hook
+            context_table: Local contexts returned by the pre-request hook
+            client_host: Client host, if known
+            client_port: Client port, if known
+        """
+        try:
+            # Extract response headers
+            response_headers = HttpHeaderPayload(root=dict(Headers(raw=message.get("headers", []))))
+
+            post_result, _ = await self.plugin_manager.invoke_hook(
+                HttpHookType.HTTP_POST_REQUEST,
+                payload=HttpPostRequestPayload(
+                    path=str(request.url.path),
+                    method=request.method,
+                    headers=HttpHeaderPayload(root=dict(request.headers)),
+                    client_host=client_host,
+                    client_port=client_port,
+                    response_headers=response_headers,
+                    status_code=message["status"],
+                ),
+                global_context=global_context,
+                local_contexts=context_table,  # Pass context from pre-hook
+                violations_as_exceptions=False,  # Don't block on post-request violations
+            )
+
+            # Apply modified response headers if plugin returned them
+            if post_result.modified_payload:
+                modified_response_headers = post_result.modified_payload.root
+                headers = MutableHeaders(scope=message)
+                for header_name, header_value in modified_response_headers.items():
+                    headers[header_name] = header_value
+                logger.debug(f"Post-request hook modified response headers: {list(modified_response_headers.keys())}")
+
+        except Exception as e:
+            # Log but don't fail the response if post-hook has issues
+            logger.warning(f"HTTP_POST_REQUEST hook failed: {e}", exc_info=True)
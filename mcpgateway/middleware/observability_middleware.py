@@ -18,24 +18,25 @@ Examples:
 import logging
 import time
 import traceback
-from typing import Callable
+from typing import Any, Dict, Optional
 
 # Third-Party
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import SessionLocal
 from mcpgateway.instrumentation.sqlalchemy import attach_trace_to_session
 from mcpgateway.middleware.path_filter import should_skip_observability
-from mcpgateway.services.observability_service import current_trace_id, ObservabilityService, parse_traceparent
+from mcpgateway.services.observability_service import current_trace_id, ObservabilityService, parse_traceparent, should_sample_trace
+from mcpgateway.services.span_buffer_service import get_span_buffer_service
 
 logger = logging.getLogger(__name__)
 
 
-class ObservabilityMiddleware(BaseHTTPMiddleware):
+class ObservabilityMiddleware:
     """Middleware for automatic HTTP request/response tracing.
 
     Captures every HTTP request as a trace with timing, status codes,
@@ -43,40 +44,51 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
 
     This middleware is disabled by default and can be enabled via the
     MCPGATEWAY_OBSERVABILITY_ENABLED environment variable.
+
+    With OBSERVABILITY_BUFFER_ENABLED (the default) the trace and its spans are
+    assembled in memory and exported in bulk by the span buffer; otherwise each
+    span is written through its own database session.
+
+    The request span and trace end when the response starts, before its body
+    is streamed.
     """
 
-    def __init__(self, app, enabled: bool = None):
+    def __init__(self, app: ASGIApp, enabled: bool = None, buffered: Optional[bool] = None):
         """Initialize the observability middleware.
 
         Args:
             app: ASGI application
             enabled: Whether observability is enabled (defaults to settings)
+            buffered: Whether traces go through the span buffer (defaults to settings)
         """
-        super().__init__(app)
+        self.app = app
         self.enabled = enabled if enabled is not None else getattr(settings, "observability_enabled", False)
+        self.buffered = buffered if buffered is not None else getattr(settings, "observability_buffer_enabled", True)
         self.service = ObservabilityService()
-        logger.info(f"Observability middleware initialized (enabled={self.enabled})")
+        logger.info(f"Observability middleware initialized (enabled={self.enabled}, buffered={self.buffered})")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and create observability trace.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            HTTP response
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
 
         Raises:
             Exception: Re-raises any exception from request processing after logging
         """
         # Skip if observability is disabled
-        if not self.enabled:
-            return await call_next(request)
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
 
         # Skip health checks and static files to reduce noise
         if should_skip_observability(request.url.path):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Extract request context
         http_method = request.method
@@ -92,13 +104,43 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         # Extract W3C Trace Context from headers (for distributed tracing)
         external_trace_id = None
         external_parent_span_id = None
+        trace_flags = None
         traceparent_header = request.headers.get("traceparent")
         if traceparent_header:
             parsed = parse_traceparent(traceparent_header)
             if parsed:
-                external_trace_id, external_parent_span_id, _flags = parsed
+                external_trace_id, external_parent_span_id, trace_flags = parsed
                 logger.debug(f"Extracted W3C trace context: trace_id={external_trace_id}, parent_span_id={external_parent_span_id}")
 
+        # Head-based sampling: decide once for the whole trace
+        if not should_sample_trace(trace_flags):
+            get_span_buffer_service().record_sampled_out()
+            await self.app(scope, receive, send)
+            return
+
+        trace_kwargs: Dict[str, Any] = {
+            "name": f"{http_method} {request.url.path}",
+            "trace_id": external_trace_id,  # Use external trace ID if provided
+            "parent_span_id": external_parent_span_id,  # Track parent span from upstream
+            "http_method": http_method,
+            "http_url": http_url,
+            "user_email": user_email,
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+            "attributes": {
+                "http.route": request.url.path,
+                "http.query": str(request.url.query) if request.url.query else None,
+            },
+            "resource_attributes": {
+                "service.name": "mcp-gateway",
+                "service.version": getattr(settings, "version", "unknown"),
+            },
+        }
+
+        if self.buffered:
+            await self._call_buffered(request, receive, send, trace_kwargs)
+            return
+
         db = None
         trace_id = None
         span_id = None
@@ -109,25 +151,7 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
             db = SessionLocal()
 
             # Start trace (use external trace_id if provided for distributed tracing)
-            trace_id = self.service.start_trace(
-                db=db,
-                name=f"{http_method} {request.url.path}",
-                trace_id=external_trace_id,  # Use external trace ID if provided
-                parent_span_id=external_parent_span_id,  # Track parent span from upstream
-                http_method=http_method,
-                http_url=http_url,
-                user_email=user_email,
-                user_agent=user_agent,
-                ip_address=ip_address,
-                attributes={
-                    "http.route": request.url.path,
-                    "http.query": str(request.url.query) if request.url.query else None,
-                },
-                resource_attributes={
-                    "service.name": "mcp-gateway",
-                    "service.version": getattr(settings, "version", "unknown"),
-                },
-            )
+            trace_id = self.service.start_trace(db=db, **trace_kwargs)
 
             # Store trace_id in request state for use in route handlers
             request.state.trace_id = trace_id
@@ -152,42 +176,58 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                 except Exception as close_error:
                     logger.debug(f"Failed to close database session during cleanup: {close_error}")
             # Continue without tracing
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            """End the request span and trace when the response starts.
+
+            Args:
+                message: ASGI message dict
+            """
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+
+                # End span successfully
+                if span_id:
+                    try:
+                        self.service.end_span(
+                            db,
+                            span_id,
+                            status="ok" if status_code < 400 else "error",
+                            attributes={"http.status_code": status_code, "http.response_size": Headers(raw=message.get("headers", [])).get("content-length")},
+                        )
+                    except Exception as end_span_error:
+                        logger.warning(f"Failed to end span {span_id}: {end_span_error}")
+
+                # End trace
+                if trace_id:
+                    duration_ms = (time.time() - start_time) * 1000
+                    try:
+                        self.service.end_trace(
+                            db,
+                            trace_id,
+                            status="ok" if status_code < 400 else "error",
+                            http_status_code=status_code,
+                            attributes={"response_time_ms": duration_ms},
+                        )
+                    except Exception as end_trace_error:
+                        logger.warning(f"Failed to end trace {trace_id}: {end_trace_error}")
+            await send(message)
 
         # Process request (trace is set up at this point)
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-
-            # End span successfully
-            if span_id:
-                try:
-                    self.service.end_span(
-                        db,
-                        span_id,
-                        status="ok" if status_code < 400 else "error",
-                        attributes={"http.status_code": status_code, "http.response_size": response.headers.get("content-length")},
-                    )
-                except Exception as end_span_error:
-                    logger.warning(f"Failed to end span {span_id}: {end_span_error}")
-
-            # End trace
-            if trace_id:
-                duration_ms = (time.time() - start_time) * 1000
-                try:
-                    self.service.end_trace(
-                        db,
-                        trace_id,
-                        status="ok" if status_code < 400 else "error",
-                        http_status_code=status_code,
-                        attributes={"response_time_ms": duration_ms},
-                    )
-                except Exception as end_trace_error:
-                    logger.warning(f"Failed to end trace {trace_id}: {end_trace_error}")
-
-            return response
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
+            # The span and trace were already ended if the response had started
+            if response_started:
+                raise
+
             # Log exception in span
             if span_id:
                 try:
@@ -226,3 +266,73 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                     db.close()
                 except Exception as close_error:
                     logger.warning(f"Failed to close database session: {close_error}")
+
+    async def _call_buffered(self, request: Request, receive: Receive, send: Send, trace_kwargs: Dict[str, Any]) -> None:
+        """Trace a request in memory and queue it for the background exporter.
+
+        No database session is opened on the request path; spans recorded by
+        handlers and plugins for this trace are collected on the buffered trace.
+
+        Args:
+            request: Incoming HTTP request
+            receive: Receive callable
+            send: Send callable
+            trace_kwargs: Trace attributes extracted from the request
+
+        Raises:
+            Exception: Re-raises any exception from request processing after recording it
+        """
+        start_time = time.time()
+        try:
+            trace_id = self.service.begin_buffered_trace(**trace_kwargs)
+            request.state.trace_id = trace_id
+            current_trace_id.set(trace_id)
+            span_id = self.service.start_span(
+                None, trace_id=trace_id, name="http.request", kind="server", attributes={"http.method": trace_kwargs["http_method"], "http.url": trace_kwargs["http_url"]}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to setup buffered observability trace: {e}")
+            await self.app(request.scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            """Finish the buffered trace when the response starts.
+
+            Args:
+                message: ASGI message dict
+            """
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                status = "ok" if status_code < 400 else "error"
+                try:
+                    self.service.end_span(None, span_id, status=status, attributes={"http.status_code": status_code, "http.response_size": Headers(raw=message.get("headers", [])).get("content-length")})
+                    self.service.finish_buffered_trace(trace_id, status=status, http_status_code=status_code, attributes={"response_time_ms": (time.time() - start_time) * 1000})
+                except Exception as trace_error:
+                    logger.warning(f"Failed to finish buffered trace {trace_id}: {trace_error}")
+            await send(message)
+
+        try:
+            await self.app(request.scope, receive, send_wrapper)
+        except Exception as e:
+            if response_started:
+                raise
+            try:
+                self.service.end_span(None, span_id, status="error", status_message=str(e), attributes={"exception.type": type(e).__name__, "exception.message": str(e)})
+                self.service.add_event(
+                    None,
+                    span_id,
+                    name="exception",
+                    severity="error",
+                    message=str(e),
+                    exception_type=type(e).__name__,
+                    exception_message=str(e),
+                    exception_stacktrace=traceback.format_exc(),
+                )
+                self.service.finish_buffered_trace(trace_id, status="error", status_message=str(e), http_status_code=500)
+            except Exception as trace_error:
+                logger.warning(f"Failed to record exception in buffered trace {trace_id}: {trace_error}")
+            raise
@@ -3,13 +3,12 @@
 
 # Standard
 import logging
-from typing import Callable
 
 # Third-Party
-from fastapi import Request, Response
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS as MCP_SUPPORTED_PROTOCOL_VERSIONS
 from mcp.types import LATEST_PROTOCOL_VERSION
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.utils.orjson_response import ORJSONResponse
@@ -22,91 +21,69 @@ SUPPORTED_PROTOCOL_VERSIONS = list(MCP_SUPPORTED_PROTOCOL_VERSIONS)
 DEFAULT_PROTOCOL_VERSION = LATEST_PROTOCOL_VERSION
 
 
-class MCPProtocolVersionMiddleware(BaseHTTPMiddleware):
+class MCPProtocolVersionMiddleware:
     """
     Validates MCP-Protocol-Version header on MCP protocol HTTP endpoints.
+
+    Implemented as raw ASGI middleware so responses are passed through
+    without the per-request task and stream overhead of BaseHTTPMiddleware.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Validate MCP-Protocol-Version header for MCP protocol endpoints.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler in the chain
+            app: ASGI application to wrap
+        """
+        self.app = app
 
-        Returns:
-            Response: Either a 400 error for invalid protocol versions or the result of call_next
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate MCP-Protocol-Version header for MCP protocol endpoints.
+
+        Args:
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
 
         Examples:
             Non-MCP endpoints are bypassed:
 
             >>> import asyncio
-            >>> from starlette.requests import Request
             >>> from starlette.responses import Response
             >>> from mcpgateway.middleware.protocol_version import MCPProtocolVersionMiddleware
-            >>> async def call_next(req): return Response("ok", media_type="text/plain")
-            >>> scope = {
-            ...     "type": "http",
-            ...     "asgi": {"version": "3.0"},
-            ...     "method": "GET",
-            ...     "path": "/health",
-            ...     "raw_path": b"/health",
-            ...     "query_string": b"",
-            ...     "headers": [],
-            ...     "client": ("testclient", 50000),
-            ...     "server": ("testserver", 80),
-            ...     "scheme": "http",
-            ... }
-            >>> resp = asyncio.run(MCPProtocolVersionMiddleware(app=None).dispatch(Request(scope), call_next))
-            >>> resp.status_code
+            >>> async def app(scope, receive, send):
+            ...     await Response("ok", media_type="text/plain")(scope, receive, send)
+            >>> def run(path, headers=()):
+            ...     scope = {"type": "http", "method": "POST", "path": path, "headers": list(headers)}
+            ...     sent = []
+            ...     async def send(message):
+            ...         sent.append(message)
+            ...     asyncio.run(MCPProtocolVersionMiddleware(app)(scope, None, send))
+            ...     return scope, sent
+            >>> _, sent = run("/health")
+            >>> sent[0]["status"]
             200
 
             MCP endpoints default the version when the header is missing:
 
             >>> from mcpgateway.middleware.protocol_version import DEFAULT_PROTOCOL_VERSION
-            >>> scope_rpc = {
-            ...     "type": "http",
-            ...     "asgi": {"version": "3.0"},
-            ...     "method": "POST",
-            ...     "path": "/rpc",
-            ...     "raw_path": b"/rpc",
-            ...     "query_string": b"",
-            ...     "headers": [],
-            ...     "client": ("testclient", 50000),
-            ...     "server": ("testserver", 80),
-            ...     "scheme": "http",
-            ... }
-            >>> req = Request(scope_rpc)
-            >>> _ = asyncio.run(MCPProtocolVersionMiddleware(app=None).dispatch(req, call_next))
-            >>> req.state.mcp_protocol_version == DEFAULT_PROTOCOL_VERSION
+            >>> scope, _ = run("/rpc")
+            >>> scope["state"]["mcp_protocol_version"] == DEFAULT_PROTOCOL_VERSION
             True
 
             Unsupported versions return `400`:
 
-            >>> bad_scope = {
-            ...     "type": "http",
-            ...     "asgi": {"version": "3.0"},
-            ...     "method": "POST",
-            ...     "path": "/rpc",
-            ...     "raw_path": b"/rpc",
-            ...     "query_string": b"",
-            ...     "headers": [(b"mcp-protocol-version", b"bad")],
-            ...     "client": ("testclient", 50000),
-            ...     "server": ("testserver", 80),
-            ...     "scheme": "http",
-            ... }
-            >>> bad_resp = asyncio.run(MCPProtocolVersionMiddleware(app=None).dispatch(Request(bad_scope), call_next))
-            >>> (bad_resp.status_code, b"Unsupported protocol version: bad" in bad_resp.body)
+            >>> _, sent = run("/rpc", [(b"mcp-protocol-version", b"bad")])
+            >>> (sent[0]["status"], b"Unsupported protocol version: bad" in sent[1]["body"])
             (400, True)
         """
-        path = request.url.path
-
         # Skip validation for non-MCP endpoints (admin UI, health, openapi, etc.)
-        if not self._is_mcp_endpoint(path):
-            return await call_next(request)
+        if scope["type"] != "http" or not self._is_mcp_endpoint(scope.get("path", "")):
+            await self.app(scope, receive, send)
+            return
 
         # Get the protocol version from headers (case-insensitive)
-        protocol_version = request.headers.get("mcp-protocol-version")
+        protocol_version = Headers(scope=scope).get("mcp-protocol-version")
 
         # If no protocol version provided, assume default version (backwards compatibility)
         if protocol_version is None:
@@ -117,15 +94,17 @@ class MCPProtocolVersionMiddleware(BaseHTTPMiddleware):
         if protocol_version not in SUPPORTED_PROTOCOL_VERSIONS:
             supported = ", ".join(SUPPORTED_PROTOCOL_VERSIONS)
             logger.warning(f"Unsupported protocol version: {protocol_version}")
-            return ORJSONResponse(
+            response = ORJSONResponse(
                 status_code=400,
                 content={"error": "Bad Request", "message": f"Unsupported protocol version: {protocol_version}. Supported versions: {supported}"},
             )
+            await response(scope, receive, send)
+            return
 
         # Store validated version in request state for use by handlers
-        request.state.mcp_protocol_version = protocol_version
+        scope.setdefault("state", {})["mcp_protocol_version"] = protocol_version
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     def _is_mcp_endpoint(self, path: str) -> bool:
         """
@@ -49,18 +49,18 @@ Examples:
 import logging
 import secrets
 import time
-from typing import Callable, List, Optional
+from typing import Any, Dict, List, Optional
 
 # Third-Party
 from fastapi.security import HTTPAuthorizationCredentials
 import orjson
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.auth import get_current_user
 from mcpgateway.config import settings
+from mcpgateway.middleware.body_replay import replay_body
 from mcpgateway.middleware.path_filter import should_skip_request_logging
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.structured_logger import get_structured_logger
@@ -194,11 +194,12 @@ def mask_sensitive_headers(headers):
     return masked_headers
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Middleware for logging HTTP requests with sensitive data masking.
 
     Logs incoming requests including method, path, headers, and body while
     masking sensitive information like passwords, tokens, and authorization headers.
+    Request completion is logged when the response starts, before its body is streamed.
 
     Examples:
         >>> middleware = RequestLoggingMiddleware(
@@ -222,7 +223,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         enable_gateway_logging: bool = True,
         log_detailed_requests: bool = False,
         log_level: str = "DEBUG",
@@ -246,7 +247,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             log_detailed_skip_endpoints: Optional list of path prefixes to skip detailed logging
             log_detailed_sample_rate: Float in [0.0, 1.0] sampling rate for detailed logging
         """
-        super().__init__(app)
+        self.app = app
         self.enable_gateway_logging = enable_gateway_logging
         self.log_detailed_requests = log_detailed_requests
         self.log_level = log_level.upper()
@@ -299,23 +300,26 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         except Exception:
             return (None, None)
 
-    async def dispatch(self, request: Request, call_next: Callable):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process incoming request and log details with sensitive data masked.
 
         Args:
-            request: The incoming HTTP request
-            call_next: Function to call the next middleware/handler
-
-        Returns:
-            Response: The HTTP response from downstream handlers
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
 
         Raises:
             Exception: Any exception from downstream handlers is re-raised
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Track start time for total duration
         start_time = time.time()
 
         # Get basic request metadata (cheap operations)
+        request = Request(scope, receive)
         path = request.url.path
         method = request.method
 
@@ -348,7 +352,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         # Fast path: if no logging needed at all, skip everything
         if not should_log_boundary and not should_log_detailed:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Get correlation ID and additional metadata (only if we're logging)
         correlation_id = get_correlation_id()
@@ -367,143 +372,107 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             user_id = str(raw_user_id) if raw_user_id is not None else None
             user_email = getattr(request.state.user, "email", None)
 
+        boundary: Dict[str, Any] = {
+            "correlation_id": correlation_id,
+            "user_email": user_email,
+            "user_id": user_id,
+            "operation_type": "http_request",
+            "request_method": method,
+            "request_path": path,
+            "user_agent": user_agent,
+            "client_ip": client_ip,
+        }
+
         # Log gateway request started (optional - disabled by default for performance)
         if should_log_boundary and self.log_request_start:
             try:
                 structured_logger.log(
                     level="INFO",
                     message=f"Request started: {method} {path}",
-                    correlation_id=correlation_id,
-                    user_email=user_email,
-                    user_id=user_id,
-                    operation_type="http_request",
-                    request_method=method,
-                    request_path=path,
-                    user_agent=user_agent,
-                    client_ip=client_ip,
                     metadata={"event": "request_started", "query_params": str(request.query_params) if request.query_params else None},
+                    **boundary,
                 )
             except Exception as e:
                 logger.warning(f"Failed to log request start: {e}")
 
-        # Skip detailed logging if disabled (already checked via should_log_detailed)
-        if not should_log_detailed:
-            response = await call_next(request)
+        # Always log at INFO level for request payloads to ensure visibility
+        # (skipped if the logger level is higher than INFO)
+        if should_log_detailed and logger.isEnabledFor(logging.INFO):
+            receive = await self._log_request_details(request, receive)
 
-            # Still log request completed even if detailed logging is disabled.
-            #
-            # Note: reaching this block means we didn't take the early return where both
-            # boundary and detailed logging are disabled, so boundary logging is required.
-            duration_ms = (time.time() - start_time) * 1000
-            try:
-                log_level = "ERROR" if response.status_code >= 500 else "WARNING" if response.status_code >= 400 else "INFO"
-                structured_logger.log(
-                    level=log_level,
-                    message=f"Request completed: {method} {path} - {response.status_code}",
-                    correlation_id=correlation_id,
-                    user_email=user_email,
-                    user_id=user_id,
-                    operation_type="http_request",
-                    request_method=method,
-                    request_path=path,
-                    response_status_code=response.status_code,
-                    user_agent=user_agent,
-                    client_ip=client_ip,
-                    duration_ms=duration_ms,
-                    metadata={"event": "request_completed", "response_time_category": "fast" if duration_ms < 100 else "normal" if duration_ms < 1000 else "slow"},
-                )
-            except Exception as e:
-                logger.warning(f"Failed to log request completion: {e}")
+        if not should_log_boundary:
+            await self.app(scope, receive, send)
+            return
 
-            return response
+        response_started = False
 
-        # Always log at INFO level for request payloads to ensure visibility
-        log_level = logging.INFO
+        async def send_wrapper(message: Message) -> None:
+            """Log request completion when the response starts.
+
+            Args:
+                message: ASGI message dict
+            """
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                duration_ms = (time.time() - start_time) * 1000
+                try:
+                    structured_logger.log(
+                        level="ERROR" if status_code >= 500 else "WARNING" if status_code >= 400 else "INFO",
+                        message=f"Request completed: {method} {path} - {status_code}",
+                        response_status_code=status_code,
+                        duration_ms=duration_ms,
+                        metadata={"event": "request_completed", "response_time_category": self._categorize_response_time(duration_ms)},
+                        **boundary,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to log request completion: {e}")
+            await send(message)
 
-        # Skip if logger level is higher than INFO
-        if not logger.isEnabledFor(log_level):
-            return await call_next(request)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if not response_started:
+                try:
+                    structured_logger.log(
+                        level="ERROR",
+                        message=f"Request failed: {method} {path}",
+                        duration_ms=(time.time() - start_time) * 1000,
+                        error=e,
+                        metadata={"event": "request_failed"},
+                        **boundary,
+                    )
+                except Exception as log_error:
+                    logger.warning(f"Failed to log request failure: {log_error}")
+            raise
+
+    async def _log_request_details(self, request: Request, receive: Receive) -> Receive:
+        """Log the request with masked headers and body.
+
+        Args:
+            request: The incoming HTTP request
+            receive: Receive callable of the request
+
+        Returns:
+            Receive: Receive callable for downstream handlers (replays the body if it was read)
+        """
+        log_level = logging.INFO
+        masked_headers = mask_sensitive_headers(dict(request.headers))
+        request_id = get_correlation_id()
 
         # Size-based fast path: skip detailed processing for very large bodies
         content_length_header = request.headers.get("content-length")
         if content_length_header:
             try:
                 content_length = int(content_length_header)
-                # Skip if body is >4x over limit (not worth reading/parsing)
-                if content_length > self.max_body_size * 4:
-                    # Log placeholder without reading body
-                    masked_headers = mask_sensitive_headers(dict(request.headers))
-                    request_id = get_correlation_id()
-                    try:
-                        logger.log(
-                            log_level,
-                            f"📩 Incoming request: {request.method} {request.url.path}\n"
-                            f"Query params: {dict(request.query_params)}\n"
-                            f"Headers: {masked_headers}\n"
-                            f"Body: <body too large: {content_length} bytes>",
-                            extra={"request_id": request_id},
-                        )
-                    except TypeError:
-                        logger.log(
-                            log_level,
-                            f"📩 Incoming request: {request.method} {request.url.path}\n"
-                            f"Query params: {dict(request.query_params)}\n"
-                            f"Headers: {masked_headers}\n"
-                            f"Body: <body too large: {content_length} bytes>",
-                        )
-
-                    # Continue with request processing (boundary logging handled below)
-                    try:
-                        response = await call_next(request)
-                    except Exception as e:
-                        duration_ms = (time.time() - start_time) * 1000
-                        if should_log_boundary:
-                            try:
-                                structured_logger.log(
-                                    level="ERROR",
-                                    message=f"Request failed: {method} {path}",
-                                    correlation_id=correlation_id,
-                                    user_email=user_email,
-                                    user_id=user_id,
-                                    operation_type="http_request",
-                                    request_method=method,
-                                    request_path=path,
-                                    user_agent=user_agent,
-                                    client_ip=client_ip,
-                                    duration_ms=duration_ms,
-                                    error=e,
-                                    metadata={"event": "request_failed"},
-                                )
-                            except Exception as log_error:
-                                logger.warning(f"Failed to log request failure: {log_error}")
-                        raise
-
-                    # Log boundary completion for large body requests
-                    if should_log_boundary:
-                        duration_ms = (time.time() - start_time) * 1000
-                        try:
-                            boundary_log_level = "ERROR" if response.status_code >= 500 else "WARNING" if response.status_code >= 400 else "INFO"
-                            structured_logger.log(
-                                level=boundary_log_level,
-                                message=f"Request completed: {method} {path} - {response.status_code}",
-                                correlation_id=correlation_id,
-                                user_email=user_email,
-                                user_id=user_id,
-                                operation_type="http_request",
-                                request_method=method,
-                                request_path=path,
-                                response_status_code=response.status_code,
-                                user_agent=user_agent,
-                                client_ip=client_ip,
-                                duration_ms=duration_ms,
-                                metadata={"event": "request_completed", "response_time_category": self._categorize_response_time(duration_ms)},
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to log request completion: {e}")
-
-                    return response
             except ValueError:
-                pass  # Invalid content-length, continue with normal processing
+                content_length = None  # Invalid content-length, continue with normal processing
+            # Skip if body is >4x over limit (not worth reading/parsing)
+            if content_length is not None and content_length > self.max_body_size * 4:
+                # Log placeholder without reading body
+                self._log_incoming(log_level, request, masked_headers, f"<body too large: {content_length} bytes>", request_id)
+                return receive
 
         body = b""
         try:
@@ -533,105 +502,32 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             else:
                 payload_str = "<empty>"
 
-            # Mask sensitive headers
-            masked_headers = mask_sensitive_headers(dict(request.headers))
-
-            # Get correlation ID for request tracking
-            request_id = get_correlation_id()
-
-            # Try to log with extra parameter, fall back to without if not supported
-            try:
-                logger.log(
-                    log_level,
-                    f"📩 Incoming request: {request.method} {request.url.path}\n"
-                    f"Query params: {dict(request.query_params)}\n"
-                    f"Headers: {masked_headers}\n"
-                    f"Body: {payload_str}{'... [truncated]' if truncated else ''}",
-                    extra={"request_id": request_id},
-                )
-            except TypeError:
-                # Fall back for test loggers that don't accept extra parameter
-                logger.log(
-                    log_level,
-                    f"📩 Incoming request: {request.method} {request.url.path}\n"
-                    f"Query params: {dict(request.query_params)}\n"
-                    f"Headers: {masked_headers}\n"
-                    f"Body: {payload_str}{'... [truncated]' if truncated else ''}",
-                )
+            self._log_incoming(log_level, request, masked_headers, f"{payload_str}{'... [truncated]' if truncated else ''}", request_id)
 
         except Exception as e:
             logger.warning(f"Failed to log request body: {e}")
 
         # Recreate request stream for downstream handlers
-        async def receive():
-            """Recreate request body for downstream handlers.
-
-            Returns:
-                dict: ASGI receive message with request body
-            """
-            return {"type": "http.request", "body": body, "more_body": False}
+        return replay_body(body, receive)
 
-        # Create new request with the body we've already read
-        new_scope = request.scope.copy()
-        new_request = Request(new_scope, receive=receive)
+    @staticmethod
+    def _log_incoming(log_level: int, request: Request, masked_headers: Dict[str, str], body: str, request_id: Optional[str]) -> None:
+        """Write the detailed incoming-request log line.
 
-        # Process request
+        Args:
+            log_level: Log level to use
+            request: The incoming HTTP request
+            masked_headers: Request headers with sensitive values masked
+            body: Body text (already masked) or placeholder
+            request_id: Correlation ID for request tracking
+        """
+        message = f"📩 Incoming request: {request.method} {request.url.path}\nQuery params: {dict(request.query_params)}\nHeaders: {masked_headers}\nBody: {body}"
+        # Try to log with extra parameter, fall back to without if not supported
         try:
-            response: Response = await call_next(new_request)
-            status_code = response.status_code
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Log request failed
-            if should_log_boundary:
-                try:
-                    structured_logger.log(
-                        level="ERROR",
-                        message=f"Request failed: {method} {path}",
-                        correlation_id=correlation_id,
-                        user_email=user_email,
-                        user_id=user_id,
-                        operation_type="http_request",
-                        request_method=method,
-                        request_path=path,
-                        user_agent=user_agent,
-                        client_ip=client_ip,
-                        duration_ms=duration_ms,
-                        error=e,
-                        metadata={"event": "request_failed"},
-                    )
-                except Exception as log_error:
-                    logger.warning(f"Failed to log request failure: {log_error}")
-
-            raise
-
-        # Calculate total duration
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Log gateway request completed
-        if should_log_boundary:
-            try:
-                log_level = "ERROR" if status_code >= 500 else "WARNING" if status_code >= 400 else "INFO"
-
-                structured_logger.log(
-                    level=log_level,
-                    message=f"Request completed: {method} {path} - {status_code}",
-                    correlation_id=correlation_id,
-                    user_email=user_email,
-                    user_id=user_id,
-                    operation_type="http_request",
-                    request_method=method,
-                    request_path=path,
-                    response_status_code=status_code,
-                    user_agent=user_agent,
-                    client_ip=client_ip,
-                    duration_ms=duration_ms,
-                    metadata={"event": "request_completed", "response_time_category": self._categorize_response_time(duration_ms)},
-                )
-            except Exception as e:
-                logger.warning(f"Failed to log request completion: {e}")
-
-        return response
+            logger.log(log_level, message, extra={"request_id": request_id})
+        except TypeError:
+            # Fall back for test loggers that don't accept extra parameter
+            logger.log(log_level, message)
 
     @staticmethod
     def _categorize_response_time(duration_ms: float) -> str:
@@ -11,15 +11,14 @@ XSS, clickjacking, MIME sniffing, and cross-origin attacks.
 """
 
 # Third-Party
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.config import settings
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Security headers middleware that adds essential security headers to all responses.
 
@@ -77,16 +76,49 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         'Accept-Encoding, Origin'
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap
         """
-        Process the request and add security headers to the response.
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to the ``http.response.start`` message of HTTP responses.
+
+        Implemented as raw ASGI middleware so the response body is streamed
+        through untouched.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or endpoint handler
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            """Add security headers when the response starts.
+
+            Args:
+                message: ASGI message dict
+            """
+            if message["type"] == "http.response.start" and settings.security_headers_enabled:
+                self._apply_security_headers(scope, MutableHeaders(scope=message))
+            await send(message)
 
-        Returns:
-            Response with security headers added
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _apply_security_headers(scope: Scope, headers: MutableHeaders) -> None:
+        """
+        Add security headers to a response and remove server disclosure headers.
+
+        Args:
+            scope: ASGI scope of the request
+            headers: Mutable headers of the ``http.response.start`` message
 
         Examples:
             Test middleware instantiation:
@@ -205,19 +237,21 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             >>> allow
             True
 
-            Execute middleware end-to-end with a dummy call_next:
+            Execute middleware end-to-end with a dummy app:
             >>> import asyncio
             >>> from unittest.mock import patch
-            >>> from starlette.requests import Request
+            >>> from starlette.datastructures import Headers
             >>> from starlette.responses import Response
-            >>> async def call_next(req):
-            ...     return Response("ok")
+            >>> async def app(scope, receive, send):
+            ...     await Response("ok")(scope, receive, send)
             >>> scope = {
             ...     'type': 'http', 'method': 'GET', 'path': '/', 'scheme': 'https',
             ...     'headers': [(b'origin', b'https://example.com'), (b'x-forwarded-proto', b'https')]
             ... }
-            >>> request = Request(scope)
-            >>> mw = SecurityHeadersMiddleware(app=None)
+            >>> sent = []
+            >>> async def send(message):
+            ...     sent.append(message)
+            >>> mw = SecurityHeadersMiddleware(app)
             >>> with patch('mcpgateway.middleware.security_headers.settings') as s:
             ...     s.security_headers_enabled = True
             ...     s.x_content_type_options_enabled = True
@@ -231,29 +265,26 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             ...     s.environment = 'production'
             ...     s.allowed_origins = ['https://example.com']
             ...     s.cors_allow_credentials = True
-            ...     resp = asyncio.run(mw.dispatch(request, call_next))
-            >>> resp.headers['X-Content-Type-Options']
+            ...     asyncio.run(mw(scope, None, send))
+            >>> resp_headers = Headers(raw=sent[0]['headers'])
+            >>> resp_headers['X-Content-Type-Options']
             'nosniff'
-            >>> resp.headers['X-Frame-Options']
+            >>> resp_headers['X-Frame-Options']
             'DENY'
-            >>> 'Content-Security-Policy' in resp.headers
+            >>> 'Content-Security-Policy' in resp_headers
             True
-            >>> resp.headers['Strict-Transport-Security'].startswith('max-age=')
+            >>> resp_headers['Strict-Transport-Security'].startswith('max-age=')
             True
-            >>> resp.headers['Access-Control-Allow-Origin']
+            >>> resp_headers['Access-Control-Allow-Origin']
             'https://example.com'
-            >>> 'Vary' in resp.headers and 'Origin' in resp.headers['Vary']
+            >>> 'Vary' in resp_headers and 'Origin' in resp_headers['Vary']
             True
         """
-        response = await call_next(request)
-
-        # Only apply security headers if enabled
-        if not settings.security_headers_enabled:
-            return response
+        request_headers = Headers(scope=scope)
 
         # Essential security headers (configurable)
         if settings.x_content_type_options_enabled:
-            response.headers["X-Content-Type-Options"] = "nosniff"
+            headers["X-Content-Type-Options"] = "nosniff"
 
         # Handle X-Frame-Options: None/empty = don't set header (allow embedding), other values = set header
         # Note: config validator normalizes ""/"null"/"none" to None, but we guard here too for safety
@@ -261,15 +292,15 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         if isinstance(x_frame, str) and not x_frame.strip():
             x_frame = None
         if x_frame is not None:
-            response.headers["X-Frame-Options"] = x_frame
+            headers["X-Frame-Options"] = x_frame
 
         if settings.x_xss_protection_enabled:
-            response.headers["X-XSS-Protection"] = "0"  # Modern browsers use CSP instead
+            headers["X-XSS-Protection"] = "0"  # Modern browsers use CSP instead
 
         if settings.x_download_options_enabled:
-            response.headers["X-Download-Options"] = "noopen"  # Prevent IE from executing downloads
+            headers["X-Download-Options"] = "noopen"  # Prevent IE from executing downloads
 
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
 
         # Content Security Policy
         # This CSP is designed to work with the Admin UI while providing security
@@ -301,24 +332,24 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 frame_ancestors = "'none'"
 
             csp_directives.append(f"frame-ancestors {frame_ancestors}")
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives) + ";"
+        headers["Content-Security-Policy"] = "; ".join(csp_directives) + ";"
 
         # HSTS for HTTPS connections (configurable)
-        if settings.hsts_enabled and (request.url.scheme == "https" or request.headers.get("X-Forwarded-Proto") == "https"):
+        if settings.hsts_enabled and (scope.get("scheme") == "https" or request_headers.get("X-Forwarded-Proto") == "https"):
             hsts_value = f"max-age={settings.hsts_max_age}"
             if settings.hsts_include_subdomains:
                 hsts_value += "; includeSubDomains"
-            response.headers["Strict-Transport-Security"] = hsts_value
+            headers["Strict-Transport-Security"] = hsts_value
 
         # Remove sensitive headers that might disclose server information (configurable)
         if settings.remove_server_headers:
-            if "X-Powered-By" in response.headers:
-                del response.headers["X-Powered-By"]
-            if "Server" in response.headers:
-                del response.headers["Server"]
+            if "X-Powered-By" in headers:
+                del headers["X-Powered-By"]
+            if "Server" in headers:
+                del headers["Server"]
 
         # Lightweight dynamic CORS reflection based on current settings
-        origin = request.headers.get("Origin")
+        origin = request_headers.get("Origin")
         if origin:
             allow = False
             if settings.environment != "production":
@@ -328,16 +359,14 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 # In production, require explicit allow-list
                 allow = origin in settings.allowed_origins
             if allow:
-                response.headers["Access-Control-Allow-Origin"] = origin
+                headers["Access-Control-Allow-Origin"] = origin
                 # Standard CORS helpers
                 if settings.cors_allow_credentials:
-                    response.headers["Access-Control-Allow-Credentials"] = "true"
+                    headers["Access-Control-Allow-Credentials"] = "true"
                 # Expose common headers for clients
                 exposed = ["Content-Length", "X-Request-ID"]
-                response.headers["Access-Control-Expose-Headers"] = ", ".join(exposed)
+                headers["Access-Control-Expose-Headers"] = ", ".join(exposed)
                 # Ensure caches vary on Origin
-                existing_vary = response.headers.get("Vary")
+                existing_vary = headers.get("Vary")
                 vary_val = "Origin" if not existing_vary else (existing_vary + ", Origin")
-                response.headers["Vary"] = vary_val
-
-        return response
+                headers["Vary"] = vary_val
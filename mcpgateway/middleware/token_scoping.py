@@ -11,17 +11,19 @@ and time-based restrictions.
 """
 
 # Standard
+import asyncio
 from datetime import datetime, timezone
 import ipaddress
 import re
-from typing import List, Optional, Pattern, Tuple
+from typing import Iterable, List, Optional, Pattern, Tuple
 
 # Third-Party
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPBearer
 
 # First-Party
-from mcpgateway.auth import normalize_token_teams
+from mcpgateway.auth import _check_token_revoked_sync, normalize_token_teams
+from mcpgateway.config import settings
 from mcpgateway.db import Permissions
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.utils.orjson_response import ORJSONResponse
@@ -807,6 +809,117 @@ class TokenScopingMiddleware:
                 finally:
                     db.close()
 
+    def _check_scopes(self, scopes: dict, request_path: str, request_method: str, client_ip: Optional[str]) -> None:
+        """Check the server ID, IP, time and permission restrictions of a token.
+
+        Args:
+            scopes: The ``scopes`` claim of the token payload
+            request_path: The request path/URL
+            request_method: HTTP method (GET, POST, etc.)
+            client_ip: Client IP address (only needed with IP restrictions)
+
+        Raises:
+            HTTPException: If a restriction is violated
+
+        Examples:
+            >>> m = TokenScopingMiddleware()
+            >>> m._check_scopes({"server_id": "abc", "permissions": ["tools.read"]}, "/servers/abc/tools", "GET", None)
+            >>> try:
+            ...     m._check_scopes({"server_id": "abc"}, "/servers/def/tools", "GET", None)
+            ... except HTTPException as exc:
+            ...     exc.status_code
+            403
+        """
+        # Check server ID restriction
+        server_id = scopes.get("server_id")
+        if not self._check_server_restriction(request_path, server_id):
+            logger.warning(f"Token not authorized for this server. Required: {server_id}")
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Token not authorized for this server. Required: {server_id}")
+
+        # Check IP restrictions
+        ip_restrictions = scopes.get("ip_restrictions", [])
+        if ip_restrictions and not self._check_ip_restrictions(client_ip or "unknown", ip_restrictions):
+            logger.warning(f"Request from IP {client_ip} not allowed by token restrictions")
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Request from IP {client_ip} not allowed by token restrictions")
+
+        # Check time restrictions
+        time_restrictions = scopes.get("time_restrictions", {})
+        if not self._check_time_restrictions(time_restrictions):
+            logger.warning("Request not allowed at this time by token restrictions")
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Request not allowed at this time by token restrictions")
+
+        # Check permission restrictions
+        permissions = scopes.get("permissions", [])
+        if not self._check_permission_restrictions(request_path, request_method, permissions):
+            logger.warning("Insufficient permissions for this operation")
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions for this operation")
+
+    async def _is_token_revoked(self, payload: dict) -> bool:
+        """Check whether a token has been revoked since it was verified.
+
+        Uses the auth cache when enabled and falls back to the database.
+
+        Args:
+            payload: Verified token payload
+
+        Returns:
+            bool: True if the token's ``jti`` is revoked
+        """
+        jti = payload.get("jti")
+        if not jti:
+            return False
+
+        if settings.auth_cache_enabled:
+            # First-Party
+            from mcpgateway.cache.auth_cache import auth_cache  # pylint: disable=import-outside-toplevel
+
+            cached_ctx = await auth_cache.get_auth_context(payload.get("sub") or payload.get("email") or "", jti)
+            if cached_ctx:
+                return cached_ctx.is_token_revoked
+            revoked = await auth_cache.is_token_revoked(jti)
+            if revoked is not None:
+                return revoked
+
+        try:
+            return await asyncio.to_thread(_check_token_revoked_sync, jti)
+        except Exception as revoke_check_error:
+            logger.warning(f"Token revocation check failed for JTI {jti}: {revoke_check_error}")
+            return False
+
+    async def check_rpc_message(self, payload: dict, server_ids: Iterable[Optional[str]] = (None,), client_ip: Optional[str] = None) -> None:
+        """Check revocation and scopes of a connection's token for a JSON-RPC message dispatched in process.
+
+        SSE and WebSocket messages do not pass through this middleware, so the
+        transports call this for every message they dispatch. Messages with a
+        ``server_id`` are checked as calls to that server's MCP endpoint, the
+        others as calls to ``/rpc``.
+
+        Args:
+            payload: Verified payload of the token the connection was authenticated with
+            server_ids: Server IDs the message (or batch) targets, None for no server
+            client_ip: Client IP address of the connection
+
+        Raises:
+            HTTPException: If the token was revoked or a restriction is violated
+
+        Examples:
+            >>> import asyncio
+            >>> m = TokenScopingMiddleware()
+            >>> asyncio.run(m.check_rpc_message({"scopes": {"server_id": "abc"}}, ["abc"]))
+            >>> try:
+            ...     asyncio.run(m.check_rpc_message({"scopes": {"server_id": "abc"}}, ["def"]))
+            ... except HTTPException as exc:
+            ...     exc.detail
+            'Token not authorized for this server. Required: abc'
+        """
+        if await self._is_token_revoked(payload):
+            logger.warning("Token rejected: token has been revoked")
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
+
+        scopes = payload.get("scopes") or {}
+        for server_id in set(server_ids):
+            self._check_scopes(scopes, f"/servers/{server_id}/mcp" if server_id else "/rpc", "POST", client_ip)
+
     async def __call__(self, request: Request, call_next):
         """Middleware function to check token scoping including team-level validation.
 
@@ -919,34 +1032,10 @@ class TokenScopingMiddleware:
                     logger.warning(f"Access denied: Resource does not belong to token's teams {token_teams}")
                     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied: You do not have permission to access this resource using the current token")
 
-            # Extract scopes from payload
+            # Check server ID, IP, time and permission restrictions
             scopes = payload.get("scopes", {})
-
-            # Check server ID restriction
-            server_id = scopes.get("server_id")
-            if not self._check_server_restriction(request.url.path, server_id):
-                logger.warning(f"Token not authorized for this server. Required: {server_id}")
-                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Token not authorized for this server. Required: {server_id}")
-
-            # Check IP restrictions
-            ip_restrictions = scopes.get("ip_restrictions", [])
-            if ip_restrictions:
-                client_ip = self._get_client_ip(request)
-                if not self._check_ip_restrictions(client_ip, ip_restrictions):
-                    logger.warning(f"Request from IP {client_ip} not allowed by token restrictions")
-                    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Request from IP {client_ip} not allowed by token restrictions")
-
-            # Check time restrictions
-            time_restrictions = scopes.get("time_restrictions", {})
-            if not self._check_time_restrictions(time_restrictions):
-                logger.warning("Request not allowed at this time by token restrictions")
-                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Request not allowed at this time by token restrictions")
-
-            # Check permission restrictions
-            permissions = scopes.get("permissions", [])
-            if not self._check_permission_restrictions(request.url.path, request.method, permissions):
-                logger.warning("Insufficient permissions for this operation")
-                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions for this operation")
+            client_ip = self._get_client_ip(request) if scopes.get("ip_restrictions") else None
+            self._check_scopes(scopes, request.url.path, request.method, client_ip)
 
             # All scoping checks passed, continue
             return await call_next(request)
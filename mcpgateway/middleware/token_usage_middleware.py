@@ -10,6 +10,11 @@ This middleware logs API token usage for analytics and security monitoring.
 It records each request made with an API token, including endpoint, method,
 response time, and status code.
 
+With TOKEN_USAGE_ROLLUP_ENABLED (the default) requests are counted in the
+per-minute rollups of ``TokenUsageRollupService``; a sampled fraction
+(TOKEN_USAGE_RAW_LOG_SAMPLE_RATE, all requests by default) is also written as
+a raw row.
+
 Note: Implemented as raw ASGI middleware (not BaseHTTPMiddleware) to avoid
 response body buffering issues with streaming responses.
 
@@ -31,6 +36,7 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 from mcpgateway.db import fresh_db_session
 from mcpgateway.middleware.path_filter import should_skip_auth_context
 from mcpgateway.services.token_catalog_service import TokenCatalogService
+from mcpgateway.services.token_usage_rollup_service import get_token_usage_rollup_service
 from mcpgateway.utils.verify_credentials import verify_jwt_token_cached
 
 logger = logging.getLogger(__name__)
@@ -151,6 +157,12 @@ class TokenUsageMiddleware:
             logger.debug("Missing JTI or user_email for token usage logging")
             return
 
+        # Count in the per-minute rollups; raw rows only for sampled requests
+        # (or for every request while the rollup flush task is not running)
+        rollups = get_token_usage_rollup_service()
+        if rollups.record(jti, user_email, path, status_code, response_time_ms) and not rollups.sample_raw():
+            return
+
         # Log token usage
         try:
             with fresh_db_session() as db:
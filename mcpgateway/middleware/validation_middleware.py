@@ -25,13 +25,19 @@ from typing import Any
 # Third-Party
 from fastapi import HTTPException, Request, Response
 import orjson
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # First-Party
 from mcpgateway.config import settings
+from mcpgateway.middleware.body_replay import replay_body
+from mcpgateway.utils.pattern_matcher import collect_json_strings, DangerousPatternMatcher
 
 logger = logging.getLogger(__name__)
 
+# Control characters removed from responses (newlines, carriage returns and tabs are kept)
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+
 
 def is_path_traversal(uri: str) -> bool:
     """Check if URI contains path traversal patterns.
@@ -45,49 +51,52 @@ def is_path_traversal(uri: str) -> bool:
     return ".." in uri or uri.startswith("/") or "\\" in uri
 
 
-class ValidationMiddleware(BaseHTTPMiddleware):
+class ValidationMiddleware:
     """Middleware for validating inputs and sanitizing outputs.
 
     This middleware validates request parameters, JSON data, and resource paths
     to prevent security vulnerabilities. It can operate in strict or lenient mode
     and optionally sanitizes response content.
+
+    Implemented as raw ASGI middleware: a JSON body read for validation is
+    replayed to the downstream app, and only complete (non-streamed) text
+    responses are held back for sanitization.
     """
 
-    def __init__(self, app):
+    def __init__(self, app: ASGIApp):
         """Initialize validation middleware with configuration settings.
 
         Args:
             app: FastAPI application instance
         """
-        super().__init__(app)
+        self.app = app
         self.enabled = settings.experimental_validate_io
         self.strict = settings.validation_strict
         self.sanitize = settings.sanitize_output
         self.allowed_roots = [Path(root).resolve() for root in settings.allowed_roots]
-        self.dangerous_patterns = [re.compile(pattern) for pattern in settings.dangerous_patterns]
+        self.pattern_matcher = DangerousPatternMatcher(settings.dangerous_patterns)
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with validation and response sanitization.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            HTTP response, potentially sanitized
+            scope: ASGI scope dict
+            receive: Receive callable
+            send: Send callable
 
         Raises:
             HTTPException: If validation fails in strict mode
         """
         # Phase 0: Feature disabled - skip entirely
-        if not self.enabled:
-            response = await call_next(request)
-            return response
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
 
         # Phase 1: Log-only mode in dev/staging
         warn_only = settings.environment in ("development", "staging") and not self.strict
 
         # Validate input
+        request = Request(scope, receive)
         try:
             await self._validate_request(request)
         except HTTPException as e:
@@ -97,13 +106,37 @@ class ValidationMiddleware(BaseHTTPMiddleware):
                 logger.error("[VALIDATION] Input validation failed: %s", e.detail)
                 raise
 
-        response = await call_next(request)
+        # Hand the JSON body read for validation to the downstream app
+        if request.headers.get("content-type", "").startswith("application/json"):
+            receive = replay_body(await request.body(), receive)
 
         # Sanitize output
-        if self.sanitize:
-            response = await self._sanitize_response(response)
+        if not self.sanitize:
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        start_message: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            """Hold the response start until the first body chunk and sanitize complete text bodies.
+
+            Args:
+                message: ASGI message dict
+            """
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is not None and message["type"] == "http.response.body":
+                start, start_message = start_message, None
+                if not message.get("more_body", False) and self._is_sanitizable(start):
+                    body = self._sanitize_body(message.get("body", b""))
+                    MutableHeaders(scope=start)["content-length"] = str(len(body))
+                    message = {**message, "body": body}
+                await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
     async def _validate_request(self, request: Request):
         """Validate incoming request parameters.
@@ -127,12 +160,31 @@ class ValidationMiddleware(BaseHTTPMiddleware):
         if request.headers.get("content-type", "").startswith("application/json"):
             try:
                 body = await request.body()
+                if len(body) > settings.validation_max_body_bytes:
+                    self._reject(413, "Request body exceeds validation size limit")
+                    return
                 if body:
                     data = orjson.loads(body)
                     self._validate_json_data(data)
             except orjson.JSONDecodeError:
                 pass  # Let other middleware handle JSON errors
 
+    @staticmethod
+    def _reject(status_code: int, detail: str) -> None:
+        """Reject the request, or only log the violation in development and staging.
+
+        Args:
+            status_code (int): HTTP status for the rejection
+            detail (str): Error detail
+
+        Raises:
+            HTTPException: Outside development and staging
+        """
+        if settings.environment in ("development", "staging"):
+            logger.warning(detail)
+            return
+        raise HTTPException(status_code=status_code, detail=detail)
+
     def _validate_parameter(self, key: str, value: str):
         """Validate individual parameter for length and dangerous patterns.
 
@@ -149,15 +201,18 @@ class ValidationMiddleware(BaseHTTPMiddleware):
                 return
             raise HTTPException(status_code=422, detail=f"Parameter {key} exceeds maximum length")
 
-        for pattern in self.dangerous_patterns:
-            if pattern.search(value):
-                if settings.environment in ("development", "staging"):
-                    logger.warning(f"Parameter {key} contains dangerous characters")
-                    return
-                raise HTTPException(status_code=422, detail=f"Parameter {key} contains dangerous characters")
+        if self.pattern_matcher.search(value):
+            if settings.environment in ("development", "staging"):
+                logger.warning(f"Parameter {key} contains dangerous characters")
+                return
+            raise HTTPException(status_code=422, detail=f"Parameter {key} contains dangerous characters")
 
     def _validate_json_data(self, data: Any):
-        """Recursively validate JSON data structure.
+        """Validate all string values of a JSON document in one batch.
+
+        String values are collected with a depth budget and checked by the
+        multi-pattern matcher. Outside development and staging the first
+        violation (in document order) is raised without scanning the rest.
 
         Args:
             data (Any): JSON data to validate
@@ -165,15 +220,30 @@ class ValidationMiddleware(BaseHTTPMiddleware):
         Raises:
             HTTPException: If validation fails in strict mode
         """
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, str):
-                    self._validate_parameter(key, value)
-                elif isinstance(value, (dict, list)):
-                    self._validate_json_data(value)
-        elif isinstance(data, list):
-            for item in data:
-                self._validate_json_data(item)
+        keys, values, too_deep = collect_json_strings(data, settings.validation_max_json_depth)
+        if too_deep:
+            self._reject(422, "JSON body exceeds maximum nesting depth")
+            return
+
+        max_length = settings.max_param_length
+        too_long = [index for index, value in enumerate(values) if len(value) > max_length]
+
+        if settings.environment in ("development", "staging"):
+            # Log every violation; over-long values are not pattern-checked (as for single parameters)
+            skipped = set(too_long)
+            checked = [index for index in range(len(values)) if index not in skipped]
+            hits = [checked[hit] for hit in self.pattern_matcher.matching([values[index] for index in checked])]
+            for index in sorted(too_long + hits):
+                logger.warning(f"Parameter {keys[index]} {'exceeds maximum length' if index in skipped else 'contains dangerous characters'}")
+            return
+
+        # Only values before the first over-long one can produce an earlier violation
+        end = too_long[0] if too_long else len(values)
+        hits = self.pattern_matcher.matching(values[:end], first_only=True)
+        if hits:
+            raise HTTPException(status_code=422, detail=f"Parameter {keys[hits[0]]} contains dangerous characters")
+        if too_long:
+            raise HTTPException(status_code=422, detail=f"Parameter {keys[end]} exceeds maximum length")
 
     def validate_resource_path(self, path: str) -> str:
         """Validate and normalize resource paths to prevent traversal attacks.
@@ -215,6 +285,46 @@ class ValidationMiddleware(BaseHTTPMiddleware):
         except (OSError, ValueError):
             raise HTTPException(status_code=400, detail="invalid_path: Invalid path")
 
+    @staticmethod
+    def _is_sanitizable(start: Message) -> bool:
+        """Check whether a response body can be sanitized as text.
+
+        Args:
+            start: ``http.response.start`` message
+
+        Returns:
+            bool: True for uncompressed responses without a content type or with a text/JSON/XML one
+
+        Examples:
+            >>> ValidationMiddleware._is_sanitizable({"headers": [(b"content-type", b"application/json")]})
+            True
+            >>> ValidationMiddleware._is_sanitizable({"headers": [(b"content-type", b"image/png")]})
+            False
+            >>> ValidationMiddleware._is_sanitizable({"headers": [(b"content-type", b"text/plain"), (b"content-encoding", b"gzip")]})
+            False
+        """
+        headers = Headers(raw=start.get("headers", []))
+        content_type = headers.get("content-type", "")
+        return "content-encoding" not in headers and (not content_type or content_type.startswith(("text/", "application/json", "application/xml")))
+
+    @staticmethod
+    def _sanitize_body(body: bytes | str) -> bytes:
+        """Remove control characters (except newlines and tabs) from a response body.
+
+        Args:
+            body: Response body
+
+        Returns:
+            bytes: Sanitized UTF-8 body
+
+        Examples:
+            >>> ValidationMiddleware._sanitize_body(b"Hello\\x00World\\n")
+            b'HelloWorld\\n'
+        """
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        return CONTROL_CHARS_PATTERN.sub("", body).encode("utf-8")
+
     async def _sanitize_response(self, response: Response) -> Response:
         """Sanitize response content by removing control characters.
 
@@ -228,14 +338,7 @@ class ValidationMiddleware(BaseHTTPMiddleware):
             return response
 
         try:
-            body = response.body
-            if isinstance(body, bytes):
-                body = body.decode("utf-8", errors="replace")
-
-            # Remove control characters except newlines and tabs
-            sanitized = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", body)
-
-            response.body = sanitized.encode("utf-8")
+            response.body = self._sanitize_body(response.body)
             response.headers["content-length"] = str(len(response.body))
 
         except Exception as e:
@@ -29,6 +29,7 @@ Examples:
 
 # Standard
 import asyncio
+from itertools import groupby
 import logging
 import threading
 from typing import Any, Optional, Union
@@ -61,6 +62,98 @@ class PayloadSizeError(ValueError):
     """Raised when a payload exceeds the maximum allowed size."""
 
 
+_UNSET = object()
+
+
+def _merge_dict_changes(base: dict[str, Any], first: dict[str, Any], second: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Merge the key-level changes two plugins made to the same dict field.
+
+    Args:
+        base: The field value both plugins received.
+        first: The value returned by the first plugin.
+        second: The value returned by the second plugin.
+
+    Returns:
+        The merged dict, or None if both plugins changed the same key differently.
+
+    Examples:
+        >>> _merge_dict_changes({"a": 1, "b": 2}, {"a": 10, "b": 2}, {"a": 1, "b": 20})
+        {'a': 10, 'b': 20}
+        >>> _merge_dict_changes({"a": 1}, {"a": 10}, {"a": 11}) is None
+        True
+    """
+    merged = dict(first)
+    for key in base.keys() | second.keys():
+        old, new = base.get(key, _UNSET), second.get(key, _UNSET)
+        if new == old:
+            continue
+        current = first.get(key, _UNSET)
+        if current not in (old, new):
+            return None
+        if new is _UNSET:
+            merged.pop(key, None)
+        else:
+            merged[key] = new
+    return merged
+
+
+def _merge_payload_modifications(payload: PluginPayload, modifications: list[tuple[str, PluginPayload]]) -> PluginPayload:
+    """Merge the payloads returned by plugins that ran concurrently on the same input.
+
+    Changes are compared field by field against the input payload (key by key
+    for dict fields, e.g. tool arguments) and applied in priority order.
+    Different plugins may change different fields or keys; changing the same
+    one to different values is a conflict.
+
+    Args:
+        payload: The payload every plugin of the band received.
+        modifications: ``(plugin name, modified payload)`` pairs in priority order.
+
+    Returns:
+        The merged payload.
+
+    Raises:
+        PluginError: If two plugins modified the same field or key differently.
+
+    Examples:
+        >>> from mcpgateway.plugins.framework.hooks.tools import ToolPreInvokePayload
+        >>> base = ToolPreInvokePayload(name="search", args={"query": "a@example.com", "key": "sk-123"})
+        >>> pii = ToolPreInvokePayload(name="search", args={"query": "[EMAIL]", "key": "sk-123"})
+        >>> secrets = ToolPreInvokePayload(name="search", args={"query": "a@example.com", "key": "***"})
+        >>> _merge_payload_modifications(base, [("pii", pii), ("secrets", secrets)]).args
+        {'query': '[EMAIL]', 'key': '***'}
+        >>> other = ToolPreInvokePayload(name="search", args={"query": "redacted", "key": "sk-123"})
+        >>> _merge_payload_modifications(base, [("pii", pii), ("other", other)])
+        Traceback (most recent call last):
+        ...
+        mcpgateway.plugins.framework.errors.PluginError: Plugins pii and other made conflicting modifications to 'args' in the same priority band
+    """
+    if len(modifications) == 1:
+        return modifications[0][1]
+
+    updates: dict[str, Any] = {}
+    owners: dict[str, str] = {}
+    for plugin_name, modified in modifications:
+        for field in type(payload).model_fields:
+            old, new = getattr(payload, field, None), getattr(modified, field, None)
+            if new == old:
+                continue
+            if field not in updates or updates[field] == new:
+                updates[field] = new
+                owners.setdefault(field, plugin_name)
+                continue
+            merged = _merge_dict_changes(old, updates[field], new) if isinstance(old, dict) and isinstance(new, dict) and isinstance(updates[field], dict) else None
+            if merged is None:
+                raise PluginError(
+                    error=PluginErrorModel(
+                        message=f"Plugins {owners[field]} and {plugin_name} made conflicting modifications to '{field}' in the same priority band",
+                        plugin_name=plugin_name,
+                    )
+                )
+            updates[field] = merged
+    return payload.model_copy(update=updates)
+
+
 class PluginExecutor:
     """Executes a list of plugins with timeout protection and error handling.
 
@@ -69,6 +162,8 @@ class PluginExecutor:
     - Context management between plugins
     - Error isolation to prevent plugin failures from affecting the gateway
     - Metadata aggregation from multiple plugins
+    - Concurrent execution of plugins with equal priority, when
+      ``plugin_settings.parallel_execution_within_band`` is enabled
 
     Examples:
         >>> executor = PluginExecutor()
@@ -103,6 +198,9 @@ class PluginExecutor:
     ) -> tuple[PluginResult, PluginContextTable | None]:
         """Execute plugins in priority order with timeout protection.
 
+        With ``plugin_settings.parallel_execution_within_band``, plugins of equal
+        priority (a band) run concurrently, see ``_execute_band``.
+
         Args:
             hook_refs: List of hook references to execute, sorted by priority.
             payload: The payload to be processed by plugins.
@@ -146,6 +244,7 @@ class PluginExecutor:
         combined_metadata: dict[str, Any] = {}
         current_payload: PluginPayload | None = None
 
+        runnable = []
         for hook_ref in hook_refs:
             # Skip disabled plugins
             if hook_ref.plugin_ref.mode == PluginMode.DISABLED:
@@ -155,24 +254,24 @@ class PluginExecutor:
             if hook_ref.plugin_ref.conditions and not payload_matches(payload, hook_type, hook_ref.plugin_ref.conditions, global_context):
                 logger.debug("Skipping plugin %s - conditions not met", hook_ref.plugin_ref.name)
                 continue
+            runnable.append(hook_ref)
+
+        if self.config and self.config.plugin_settings.parallel_execution_within_band:
+            bands = [list(band) for _, band in groupby(runnable, key=lambda hook_ref: hook_ref.plugin_ref.priority)]
+        else:
+            bands = [[hook_ref] for hook_ref in runnable]
+
+        for band in bands:
+            runs = [(hook_ref, self._get_local_context(hook_ref, global_context, local_contexts, res_local_contexts)) for hook_ref in band]
+            if len(runs) > 1:
+                result, band_payload = await self._execute_band(runs, current_payload or payload, violations_as_exceptions, global_context, combined_metadata)
+                if result is not None:
+                    return (result, res_local_contexts)
+                if band_payload is not None:
+                    current_payload = band_payload
+                continue
 
-            tmp_global_context = GlobalContext(
-                request_id=global_context.request_id,
-                user=global_context.user,
-                tenant_id=global_context.tenant_id,
-                server_id=global_context.server_id,
-                state={} if not global_context.state else copyonwrite(global_context.state),
-                metadata={} if not global_context.metadata else copyonwrite(global_context.metadata),
-            )
-            # Get or create local context for this plugin
-            local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
-            if local_contexts and local_context_key in local_contexts:
-                local_context = local_contexts[local_context_key]
-                local_context.global_context = tmp_global_context
-            else:
-                local_context = PluginContext(global_context=tmp_global_context)
-            res_local_contexts[local_context_key] = local_context
-
+            hook_ref, local_context = runs[0]
             # Execute plugin with timeout protection
             result = await self.execute_plugin(
                 hook_ref,
@@ -193,6 +292,100 @@ class PluginExecutor:
             res_local_contexts,
         )
 
+    @staticmethod
+    def _get_local_context(hook_ref: HookRef, global_context: GlobalContext, local_contexts: Optional[PluginContextTable], res_local_contexts: PluginContextTable) -> PluginContext:
+        """Get or create the local context of a plugin for this execution.
+
+        Args:
+            hook_ref: The hook reference of the plugin.
+            global_context: Shared context for all plugins containing request metadata.
+            local_contexts: Optional existing contexts from previous hook executions.
+            res_local_contexts: Contexts of this execution, updated in place.
+
+        Returns:
+            The plugin's local context, with a copy-on-write view of the global context.
+        """
+        tmp_global_context = GlobalContext(
+            request_id=global_context.request_id,
+            user=global_context.user,
+            tenant_id=global_context.tenant_id,
+            server_id=global_context.server_id,
+            state={} if not global_context.state else copyonwrite(global_context.state),
+            metadata={} if not global_context.metadata else copyonwrite(global_context.metadata),
+        )
+        # Get or create local context for this plugin
+        local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
+        if local_contexts and local_context_key in local_contexts:
+            local_context = local_contexts[local_context_key]
+            local_context.global_context = tmp_global_context
+        else:
+            local_context = PluginContext(global_context=tmp_global_context)
+        res_local_contexts[local_context_key] = local_context
+        return local_context
+
+    async def _execute_band(
+        self,
+        runs: list[tuple[HookRef, PluginContext]],
+        payload: PluginPayload,
+        violations_as_exceptions: bool,
+        global_context: GlobalContext,
+        combined_metadata: dict[str, Any],
+    ) -> tuple[Optional[PluginResult], Optional[PluginPayload]]:
+        """Execute plugins of equal priority concurrently.
+
+        Every plugin receives the same payload. Global context state, metadata
+        and payload modifications are merged in priority order once the band
+        completes, so the outcome does not depend on which plugin finishes
+        first. The first plugin to block in enforce mode, or to raise, cancels
+        the rest of the band.
+
+        Args:
+            runs: Hook references of the band with their local contexts, in priority order.
+            payload: The payload to be processed by the band.
+            violations_as_exceptions: Raise violations as exceptions rather than as returns.
+            global_context: Shared context for all plugins containing request metadata.
+            combined_metadata: combination of the metadata of all plugins, updated in place.
+
+        Returns:
+            A tuple of the blocking result (None if no plugin blocked) and the
+            merged modified payload (None if no plugin modified the payload).
+        """
+        # Each plugin merges into its own context so that results can be applied in priority order
+        scratch = [(GlobalContext(request_id=global_context.request_id), {}) for _ in runs]
+        tasks = [
+            asyncio.create_task(self.execute_plugin(hook_ref, payload, local_context, violations_as_exceptions, band_context, band_metadata))
+            for (hook_ref, local_context), (band_context, band_metadata) in zip(runs, scratch)
+        ]
+        results: list[Optional[PluginResult]] = [None] * len(tasks)
+        blocking: Optional[PluginResult] = None
+        pending = set(tasks)
+        try:
+            while pending and blocking is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for index, task in enumerate(tasks):
+                    if task not in done:
+                        continue
+                    results[index] = result = task.result()
+                    if blocking is None and not result.continue_processing and runs[index][0].plugin_ref.plugin.mode == PluginMode.ENFORCE:
+                        blocking = result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for result, (band_context, band_metadata) in zip(results, scratch):
+            if result is not None:
+                global_context.state.update(band_context.state)
+                global_context.metadata.update(band_context.metadata)
+                combined_metadata.update(band_metadata)
+
+        if blocking is not None:
+            return PluginResult(continue_processing=False, modified_payload=payload, violation=blocking.violation, metadata=combined_metadata), None
+
+        modifications = [(hook_ref.plugin_ref.name, result.modified_payload) for (hook_ref, _), result in zip(runs, results) if result is not None and result.modified_payload is not None]
+        return None, _merge_payload_modifications(payload, modifications) if modifications else None
+
     async def execute_plugin(
         self,
         hook_ref: HookRef,
@@ -311,13 +504,15 @@ class PluginExecutor:
             # First-Party
             # pylint: disable=import-outside-toplevel
             from mcpgateway.db import SessionLocal
-            from mcpgateway.services.observability_service import current_trace_id, ObservabilityService
+            from mcpgateway.services.observability_service import current_buffered_trace, current_trace_id, ObservabilityService
 
             # pylint: enable=import-outside-toplevel
 
             trace_id = current_trace_id.get()
             if trace_id:
-                db = SessionLocal()
+                # Buffered traces are assembled in memory, so no session is needed
+                buffered = current_buffered_trace.get()
+                db = None if buffered is not None and buffered.trace_id == trace_id else SessionLocal()
                 try:
                     service = ObservabilityService()
                     span_id = service.start_span(
@@ -351,7 +546,8 @@ class PluginExecutor:
                     )
                     return result
                 finally:
-                    db.close()  # Observability service handles its own commits
+                    if db is not None:
+                        db.close()  # Observability service handles its own commits
             else:
                 # No active trace, execute without instrumentation
                 return await asyncio.wait_for(hook_ref.hook(payload, context), timeout=self.timeout)
@@ -23,6 +23,7 @@ from mcpgateway.db import SessionLocal
 from mcpgateway.middleware.rbac import get_current_user_with_permissions, require_permission
 from mcpgateway.schemas import ObservabilitySpanRead, ObservabilityTraceRead, ObservabilityTraceWithSpans
 from mcpgateway.services.observability_service import ObservabilityService
+from mcpgateway.services.span_buffer_service import get_span_buffer_service
 
 router = APIRouter(prefix="/observability", tags=["Observability"])
 
@@ -423,6 +424,7 @@ async def get_stats(
     - Success/error counts
     - Average response time
     - Top slowest endpoints
+    - Span buffer queue depth and drop counters
 
     Args:
         hours: Time window in hours
@@ -467,6 +469,7 @@ async def get_stats(
         "error_rate": (error_count / total_traces * 100) if total_traces > 0 else 0,
         "avg_duration_ms": round(avg_duration, 2),
         "slowest_endpoints": [{"name": row[0], "avg_duration_ms": round(row[1], 2), "count": row[2]} for row in slowest],
+        "export_buffer": get_span_buffer_service().get_stats(),
     }
 
 
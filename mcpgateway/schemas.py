@@ -6488,6 +6488,8 @@ class TokenUsageStatsResponse(BaseModel):
         blocked_requests: Number of blocked requests
         success_rate: Success rate percentage
         average_response_time_ms: Average response time
+        p95_response_time_ms: Estimated 95th percentile response time (rollups only)
+        status_classes: Response counts per status class (rollups only)
         top_endpoints: Most accessed endpoints
 
     Examples:
@@ -6510,6 +6512,8 @@ class TokenUsageStatsResponse(BaseModel):
     blocked_requests: int = Field(..., description="Number of blocked requests")
     success_rate: float = Field(..., description="Success rate (0-1)")
     average_response_time_ms: float = Field(..., description="Average response time in milliseconds")
+    p95_response_time_ms: Optional[float] = Field(None, description="Estimated 95th percentile response time in milliseconds (from the rollup latency histogram)")
+    status_classes: Optional[Dict[str, int]] = Field(None, description="Response counts per status class (2xx, 3xx, 4xx, 5xx)")
     top_endpoints: List[tuple[str, int]] = Field(..., description="Most accessed endpoints with counts")
 
 
@@ -26,7 +26,7 @@ from sqlalchemy.orm import Session
 # First-Party
 from mcpgateway.cache.a2a_stats_cache import a2a_stats_cache
 from mcpgateway.db import A2AAgent as DbA2AAgent
-from mcpgateway.db import A2AAgentMetric, A2AAgentMetricsHourly, EmailTeam, fresh_db_session, get_for_update
+from mcpgateway.db import A2AAgentMetric, A2AAgentMetricsHourly, EmailTeam, fresh_db_session, get_for_update, loaded_metrics_summary, reset_metric_counters
 from mcpgateway.schemas import A2AAgentCreate, A2AAgentMetrics, A2AAgentRead, A2AAgentUpdate
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.metrics_cleanup_service import delete_metrics_in_batches, pause_rollup_during_purge
@@ -36,7 +36,7 @@ from mcpgateway.utils.correlation_id import get_correlation_id
 from mcpgateway.utils.create_slug import slugify
 from mcpgateway.utils.pagination import unified_paginate
 from mcpgateway.utils.services_auth import decode_auth, encode_auth
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr
 
 # Cache import (lazy to avoid circular dependencies)
 _REGISTRY_CACHE = None
@@ -656,7 +656,7 @@ class A2AAgentService:
 
         # Add tag filtering if tags are provided (supports both List[str] and List[Dict] formats)
         if tags:
-            query = query.where(json_contains_tag_expr(db, DbA2AAgent.tags, tags, match_any=True))
+            query = query.where(entity_tag_expr(DbA2AAgent.tags, tags, match_any=True))
 
         # Use unified pagination helper - handles both page and cursor pagination
         pag_result = await unified_paginate(
@@ -1633,6 +1633,7 @@ class A2AAgentService:
         else:
             db.execute(delete(A2AAgentMetric))
             db.execute(delete(A2AAgentMetricsHourly))
+        reset_metric_counters(db, "a2a_agents", agent_id)
         db.commit()
 
         # Invalidate metrics cache
@@ -1695,7 +1696,11 @@ class A2AAgentService:
             setattr(db_agent, "team", team_name)
 
         # Compute metrics only if requested (avoids N+1 queries in list operations)
-        if include_metrics:
+        counter_summary = loaded_metrics_summary(db_agent) if include_metrics else None
+        if counter_summary is not None:
+            # A2A metrics report the failure rate as a percentage
+            metrics = A2AAgentMetrics(**{**counter_summary, "failure_rate": counter_summary["failure_rate"] * 100})
+        elif include_metrics:
             total_executions = len(db_agent.metrics)
             successful_executions = sum(1 for m in db_agent.metrics if m.is_success)
             failed_executions = total_executions - successful_executions
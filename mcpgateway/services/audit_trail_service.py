@@ -22,6 +22,7 @@ from sqlalchemy.orm import Session
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import AuditTrail, SessionLocal
+from mcpgateway.services.log_write_buffer_service import get_log_write_buffer_service
 from mcpgateway.utils.correlation_id import get_or_generate_correlation_id
 
 logger = logging.getLogger(__name__)
@@ -129,12 +130,7 @@ class AuditTrailService:
 
         correlation_id = get_or_generate_correlation_id()
 
-        # Use provided session or create new one
         close_db = False
-        if db is None:
-            db = SessionLocal()
-            close_db = True
-
         try:
             context_payload: Dict[str, Any] = dict(context) if context else {}
             if details:
@@ -174,6 +170,15 @@ class AuditTrailService:
                 context=context_value,
             )
 
+            # Without a caller session the row goes through the batching log writer
+            if db is None and get_log_write_buffer_service().enqueue(audit_entry):
+                return audit_entry
+
+            # Use provided session or create new one
+            if db is None:
+                db = SessionLocal()
+                close_db = True
+
             db.add(audit_entry)
             db.commit()
             db.refresh(audit_entry)
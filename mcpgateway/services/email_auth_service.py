@@ -41,6 +41,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.permission_cache import permission_cache
 from mcpgateway.config import settings
 from mcpgateway.db import EmailAuthEvent, EmailTeam, EmailTeamMember, EmailUser, PasswordResetToken, utc_now
 from mcpgateway.schemas import PaginationLinks, PaginationMeta
@@ -1722,6 +1723,13 @@ class EmailAuthService:
             self.db.delete(user)
             self.db.commit()
 
+            # Drop cached permission decisions only now: invalidating before the commit
+            # would let a concurrent check re-cache the deleted role assignments
+            try:
+                await permission_cache.invalidate_user(email)
+            except Exception as cache_error:
+                logger.warning(f"Failed to invalidate permission cache on user delete: {cache_error}")
+
             # Invalidate all auth caches for deleted user
             try:
                 # First-Party
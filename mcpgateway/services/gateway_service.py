@@ -94,10 +94,12 @@ from mcpgateway.schemas import GatewayCreate, GatewayRead, GatewayUpdate, Prompt
 # logging.getLogger("httpx").setLevel(logging.WARNING)  # Disables httpx logs for regular health checks
 from mcpgateway.services.audit_trail_service import get_audit_trail_service
 from mcpgateway.services.event_service import EventService
+from mcpgateway.services.health_check_scheduler import get_health_check_scheduler
 from mcpgateway.services.http_client_service import get_default_verify, get_http_timeout, get_isolated_http_client
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.mcp_session_pool import get_mcp_session_pool, register_gateway_capabilities_for_notifications, TransportType
 from mcpgateway.services.oauth_manager import OAuthManager
+from mcpgateway.services.shard_membership import ShardMembership
 from mcpgateway.services.structured_logger import get_structured_logger
 from mcpgateway.services.team_management_service import TeamManagementService
 from mcpgateway.utils.create_slug import slugify
@@ -106,8 +108,9 @@ from mcpgateway.utils.pagination import unified_paginate
 from mcpgateway.utils.passthrough_headers import get_passthrough_headers
 from mcpgateway.utils.redis_client import get_redis_client
 from mcpgateway.utils.retry_manager import ResilientHttpClient
+from mcpgateway.utils.search_index import apply_search_filter
 from mcpgateway.utils.services_auth import decode_auth, encode_auth
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr
 from mcpgateway.utils.ssl_context_cache import get_cached_ssl_context
 from mcpgateway.utils.url_auth import apply_query_param_auth, sanitize_exception_message, sanitize_url_for_logging
 from mcpgateway.utils.validate_signature import validate_signature
@@ -116,6 +119,7 @@ from mcpgateway.validation.tags import validate_tags_field
 # Cache import (lazy to avoid circular dependencies)
 _REGISTRY_CACHE = None
 _TOOL_LOOKUP_CACHE = None
+_RESOURCE_CACHE = None
 
 
 def _get_registry_cache():
@@ -148,6 +152,21 @@ def _get_tool_lookup_cache():
     return _TOOL_LOOKUP_CACHE
 
 
+def _get_resource_cache():
+    """Get resource content cache singleton lazily.
+
+    Returns:
+        ResourceCache instance.
+    """
+    global _RESOURCE_CACHE  # pylint: disable=global-statement
+    if _RESOURCE_CACHE is None:
+        # First-Party
+        from mcpgateway.cache.resource_cache import resource_cache  # pylint: disable=import-outside-toplevel
+
+        _RESOURCE_CACHE = resource_cache
+    return _RESOURCE_CACHE
+
+
 # Initialize logging service first
 logging_service = LoggingService()
 logger = logging_service.get_logger(__name__)
@@ -381,6 +400,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         self._http_client = ResilientHttpClient(client_args={"timeout": settings.federation_timeout, "verify": not settings.skip_ssl_verify})
         self._health_check_interval = GW_HEALTH_CHECK_INTERVAL
         self._health_check_task: Optional[asyncio.Task] = None
+        self._shard_membership: Optional[ShardMembership] = None
+        self._shard_heartbeat_task: Optional[asyncio.Task] = None
         self._active_gateways: Set[str] = set()  # Track active gateway URLs
         self._stream_response = None
         self._pending_responses = {}
@@ -508,6 +529,10 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             except Exception as e:
                 raise ConnectionError(f"Redis ping failed: {e}") from e
 
+        if settings.health_check_sharding_enabled:
+            # Every worker checks its own share of the gateways; no leader election
+            await self._start_sharded_health_checks(user_email)
+        elif self._redis_client:
             is_leader = await self._redis_client.set(self._leader_key, self._instance_id, ex=self._leader_ttl, nx=True)
             if is_leader:
                 logger.info("Acquired Redis leadership. Starting health check and heartbeat tasks.")
@@ -540,6 +565,16 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             except asyncio.CancelledError:
                 pass
 
+        # Leave the health check shards so other workers take over our gateways
+        if self._shard_heartbeat_task:
+            self._shard_heartbeat_task.cancel()
+            try:
+                await self._shard_heartbeat_task
+            except asyncio.CancelledError:
+                pass
+        if self._shard_membership:
+            await self._shard_membership.leave()
+
         # Cancel leader heartbeat task if running
         if getattr(self, "_leader_heartbeat_task", None):
             self._leader_heartbeat_task.cancel()
@@ -1479,6 +1514,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         team_id: Optional[str] = None,
         visibility: Optional[str] = None,
         token_teams: Optional[List[str]] = None,
+        search: Optional[str] = None,
     ) -> Union[tuple[List[GatewayRead], Optional[str]], Dict[str, Any]]:
         """List all registered gateways with cursor pagination and optional team filtering.
 
@@ -1494,6 +1530,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             team_id: Optional team ID to filter by specific team (requires user_email).
             visibility: Optional visibility filter (private, team, public) (requires user_email).
             token_teams: Optional list of team IDs from the token (None=unrestricted, []=public-only).
+            search: Optional full-text query over name, URL, description and tags. Search results are never cached.
 
         Returns:
             If page is provided: Dict with {"data": [...], "pagination": {...}, "links": {...}}
@@ -1540,7 +1577,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         # SECURITY: Only cache public-only results (token_teams=[]), never admin bypass or team-scoped
         cache = _get_registry_cache()
         is_public_only = token_teams is not None and len(token_teams) == 0
-        use_cache = cursor is None and user_email is None and page is None and is_public_only
+        use_cache = cursor is None and user_email is None and page is None and is_public_only and not search
         if use_cache:
             filters_hash = cache.hash_filters(include_inactive=include_inactive, tags=sorted(tags) if tags else None)
             cached = await cache.get("gateways", filters_hash)
@@ -1608,7 +1645,11 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
         # Add tag filtering if tags are provided (supports both List[str] and List[Dict] formats)
         if tags:
-            query = query.where(json_contains_tag_expr(db, DbGateway.tags, tags, match_any=True))
+            query = query.where(entity_tag_expr(DbGateway.tags, tags, match_any=True))
+
+        # Full-text search (LIKE where the database has no search index)
+        query = apply_search_filter(db, query, DbGateway, search)
+
         # Use unified pagination helper - handles both page and cursor pagination
         pag_result = await unified_paginate(
             db=db,
@@ -1654,7 +1695,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
         # Cache first page results - only for public-only queries (no user/team filtering)
         # SECURITY: Only cache public-only results (token_teams=[]), never admin bypass or team-scoped
-        if cursor is None and user_email is None and is_public_only:
+        if cursor is None and user_email is None and is_public_only and not search:
             try:
                 cache_data = {"gateways": [s.model_dump(mode="json") for s in result], "next_cursor": next_cursor}
                 await cache.set("gateways", cache_data, filters_hash)
@@ -3007,6 +3048,8 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             >>> service._gateway_failure_counts.get('gw1', 0) == old_count
             True
         """
+        get_health_check_scheduler().record_failure(gateway.id)
+
         if GW_FAILURE_THRESHOLD == -1:
             return  # Gateway failure action disabled
 
@@ -3768,6 +3811,48 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 logger.warning(f"Leader heartbeat error: {e}")
                 # Continue trying - the main health check loop will handle leadership loss
 
+    async def _start_sharded_health_checks(self, user_email: str) -> None:
+        """Join the health check shards and start this worker's heartbeat and health check loops.
+
+        Membership lives in Redis when it is configured (shared across hosts),
+        otherwise in a directory of heartbeat files next to the leader lock file
+        (workers on one host).
+
+        Args:
+            user_email: Email of the user for OAuth token lookup
+
+        Examples:
+            >>> import asyncio, tempfile
+            >>> from unittest.mock import AsyncMock, patch
+            >>> service = GatewayService()
+            >>> service._lock_path = tempfile.mkdtemp() + "/leader.lock"
+            >>> service._run_health_checks = AsyncMock()
+            >>> async def start():
+            ...     await service._start_sharded_health_checks("admin@example.com")
+            ...     await service._health_check_task
+            ...     service._shard_heartbeat_task.cancel()
+            >>> asyncio.run(start())
+            >>> service._shard_membership.members == (service._shard_membership.instance_id,)
+            True
+        """
+        instance_id = getattr(self, "_instance_id", None) or str(uuid.uuid4())
+        directory = f"{getattr(self, '_lock_path', None) or os.path.join(tempfile.gettempdir(), settings.filelock_name)}.members"
+        self._shard_membership = ShardMembership(instance_id, ttl=settings.health_check_shard_ttl, redis_client=self._redis_client, directory=directory)
+        await self._shard_membership.heartbeat()
+        logger.info(f"Joined health check shards as {instance_id} ({len(self._shard_membership.members)} instance(s))")
+        self._shard_heartbeat_task = asyncio.create_task(self._run_shard_heartbeat())
+        self._health_check_task = asyncio.create_task(self._run_health_checks(user_email))
+
+    async def _run_shard_heartbeat(self) -> None:
+        """Keep this worker's shard membership alive and pick up joins and departures.
+
+        Runs every third of ``HEALTH_CHECK_SHARD_TTL``. Ownership changes take
+        effect at the start of each worker's next health check cycle.
+        """
+        while True:
+            await asyncio.sleep(settings.health_check_shard_ttl / 3)
+            await self._shard_membership.heartbeat()
+
     async def _run_health_checks(self, user_email: str) -> None:
         """Run health checks periodically,
         Uses Redis or FileLock - for multiple workers.
@@ -3797,7 +3882,11 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
         while True:
             try:
-                if self._redis_client and settings.cache_type == "redis":
+                if self._shard_membership:
+                    # Sharded: every worker runs, checking only the gateways it owns
+                    await self._run_health_check_cycle(user_email)
+
+                elif self._redis_client and settings.cache_type == "redis":
                     # Redis-based leader check (async, decode_responses=True returns strings)
                     # Note: Leader key TTL refresh is handled by _run_leader_heartbeat task
                     current_leader = await self._redis_client.get(self._leader_key)
@@ -3805,22 +3894,15 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         return
 
                     # Run health checks
-                    gateways = await asyncio.to_thread(self._get_gateways)
-                    if gateways:
-                        await self.check_health_of_gateways(gateways, user_email)
-
-                    await asyncio.sleep(self._health_check_interval)
+                    await self._run_health_check_cycle(user_email)
 
                 elif settings.cache_type == "none":
                     try:
                         # For single worker mode, run health checks directly
-                        gateways = await asyncio.to_thread(self._get_gateways)
-                        if gateways:
-                            await self.check_health_of_gateways(gateways, user_email)
+                        await self._run_health_check_cycle(user_email)
                     except Exception as e:
                         logger.error(f"Health check run failed: {str(e)}")
-
-                    await asyncio.sleep(self._health_check_interval)
+                        await asyncio.sleep(self._health_check_interval)
 
                 else:
                     # FileLock-based leader fallback
@@ -3829,10 +3911,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                         logger.info("File lock acquired. Running health checks.")
 
                         while True:
-                            gateways = await asyncio.to_thread(self._get_gateways)
-                            if gateways:
-                                await self.check_health_of_gateways(gateways, user_email)
-                            await asyncio.sleep(self._health_check_interval)
+                            await self._run_health_check_cycle(user_email)
 
                     except Timeout:
                         logger.debug("File lock already held. Retrying later.")
@@ -3853,6 +3932,60 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 logger.error(f"Unexpected error in health check loop: {str(e)}")
                 await asyncio.sleep(self._health_check_interval)
 
+    async def _run_health_check_cycle(self, user_email: Optional[str]) -> None:
+        """Run one health check interval.
+
+        Without the scheduler, every gateway is checked at once and the cycle
+        then sleeps for the interval. With ``HEALTH_CHECK_SCHEDULER_ENABLED``,
+        the scheduler instead dispatches each gateway's check at its own due
+        time over the interval. Either way the caller re-checks leadership
+        after each cycle.
+
+        Args:
+            user_email: Email of the user for OAuth token lookup
+
+        Examples:
+            >>> import asyncio
+            >>> from unittest.mock import AsyncMock, patch
+            >>> service = GatewayService()
+            >>> service._health_check_interval = 0
+            >>> service._get_gateways = lambda: []
+            >>> service.check_health_of_gateways = AsyncMock()
+            >>> with patch("mcpgateway.services.gateway_service.settings.health_check_scheduler_enabled", False):
+            ...     asyncio.run(service._run_health_check_cycle(None))
+            >>> service.check_health_of_gateways.called  # no gateways: nothing to check
+            False
+        """
+        gateways = await asyncio.to_thread(self._get_gateways)
+        if self._shard_membership:
+            gateways = [gw for gw in gateways if self._shard_membership.owns(gw.id)]
+        if not settings.health_check_scheduler_enabled:
+            if gateways:
+                await self.check_health_of_gateways(gateways, user_email)
+            await asyncio.sleep(self._health_check_interval)
+            return
+
+        async def probe(gateway: DbGateway) -> bool:
+            """Check one gateway with the same timeout handling as batch checks.
+
+            Args:
+                gateway: Gateway to check.
+
+            Returns:
+                bool: False on timeout (failures inside the check are reported via ``_handle_gateway_failure``).
+            """
+            try:
+                await asyncio.wait_for(self._check_single_gateway_health(gateway, user_email), timeout=settings.gateway_health_check_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Gateway {getattr(gateway, 'name', 'unknown')} health check timed out after {settings.gateway_health_check_timeout}s")
+                await self._handle_gateway_failure(gateway)
+                return False
+            return True
+
+        concurrency = min(settings.max_concurrent_health_checks, max(10, (os.cpu_count() or 1) * 5))
+        eligible = [gw for gw in gateways if gw.auth_type != "one_time_auth"]
+        await get_health_check_scheduler().run(eligible, probe, duration=self._health_check_interval, concurrency=concurrency)
+
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get default headers for gateway requests (no authentication).
 
@@ -4668,6 +4801,10 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
                 db.commit()
                 logger.debug(f"No changes detected during refresh of gateway {gateway_name}")
 
+        # A refresh re-syncs the gateway's resources, so drop their cached content too
+        if include_resources and settings.resource_cache_enabled:
+            await _get_resource_cache().invalidate_shared(str(gateway_id))
+
         return result
 
     def _get_refresh_lock(self, gateway_id: str) -> asyncio.Lock:
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+"""Adaptive per-gateway health-check scheduler.
+
+``GatewayService`` used to probe every gateway once per
+``HEALTH_CHECK_INTERVAL`` in fixed chunks. With thousands of gateways that
+gives periodic bursts of outbound traffic, and it probes gateways that have
+just served tool calls. With ``HEALTH_CHECK_SCHEDULER_ENABLED`` the health
+leader uses this scheduler instead:
+
+- Each gateway has its own due time in a timer wheel (one-second slots).
+  New gateways are spread across the first interval, so probes form a steady
+  trickle rather than a burst.
+- Every reschedule applies +/- ``HEALTH_CHECK_JITTER`` to the interval.
+- Each healthy result doubles a gateway's interval, up to
+  ``HEALTH_CHECK_MAX_BACKOFF`` times the base interval. A failure drops it
+  back to the base interval.
+- A successful tool invocation through ``ToolService.invoke_tool`` is a
+  passive health signal. When one happened since a gateway's last check,
+  its probe is skipped and counted as healthy. Workers share these signals
+  through a Redis hash, throttled per gateway, so the leader sees traffic
+  served by other workers too.
+
+Scheduler lag (how late checks start compared with their due time) and
+check outcomes are exported as the ``gateway_health_check_lag_seconds`` and
+``gateway_health_checks_total`` Prometheus metrics. ``get_stats()`` returns
+the same figures.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from dataclasses import dataclass
+import logging
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.utils.redis_client import get_redis_client_sync
+
+logger = logging.getLogger(__name__)
+
+PASSIVE_HEALTH_KEY = "mcpgw:health:passive"
+
+
+def _export(outcome: Optional[str] = None, lag: Optional[float] = None) -> None:
+    """Export a check outcome or a scheduling lag sample to Prometheus.
+
+    Args:
+        outcome: ``healthy``, ``unhealthy`` or ``passive_skip``.
+        lag: Seconds between a check's due time and its start.
+    """
+    try:
+        # First-Party
+        from mcpgateway.services.metrics import gateway_health_check_lag_histogram, gateway_health_checks_counter  # pylint: disable=import-outside-toplevel
+
+        if outcome is not None:
+            gateway_health_checks_counter.labels(outcome=outcome).inc()
+        if lag is not None:
+            gateway_health_check_lag_histogram.observe(lag)
+    except Exception as e:
+        logger.debug(f"Failed to export health check metrics: {e}")
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Scheduling state for one gateway."""
+
+    gateway: Any
+    due: float
+    multiplier: float = 1.0
+    failed: bool = False
+
+
+class HealthCheckScheduler:
+    """Timer wheel of per-gateway health checks.
+
+    Configuration (via environment variables):
+    - HEALTH_CHECK_SCHEDULER_ENABLED: Use this scheduler instead of whole-fleet sweeps (default: False)
+    - HEALTH_CHECK_INTERVAL: Base interval per gateway in seconds (default: 60)
+    - HEALTH_CHECK_MAX_BACKOFF: Max interval multiplier for stable gateways (default: 4.0)
+    - HEALTH_CHECK_JITTER: Interval jitter as a fraction (default: 0.1)
+    - MAX_CONCURRENT_HEALTH_CHECKS: Max probes in flight (default: 10)
+
+    Examples:
+        >>> sched = HealthCheckScheduler(interval=10, max_backoff=4, jitter=0, slots=8)
+        >>> gw = type("Gw", (), {"id": "g1", "reachable": True})()
+        >>> sched.sync([gw], now=0.0)
+        >>> [g.id for g in sched.pop_due(now=10.0)]
+        ['g1']
+        >>> sched.complete("g1", healthy=True, now=10.0)  # stable: interval doubles
+        >>> sched.pop_due(now=20.0), [g.id for g in sched.pop_due(now=30.0)]
+        ([], ['g1'])
+        >>> sched.get_stats()["gateways"]
+        1
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        max_backoff: Optional[float] = None,
+        jitter: Optional[float] = None,
+        tick: float = 1.0,
+        slots: int = 512,
+    ) -> None:
+        """Create an empty scheduler.
+
+        Args:
+            interval: Base check interval in seconds (default: ``HEALTH_CHECK_INTERVAL``).
+            max_backoff: Max interval multiplier (default: ``HEALTH_CHECK_MAX_BACKOFF``).
+            jitter: Jitter fraction (default: ``HEALTH_CHECK_JITTER``).
+            tick: Wheel slot width in seconds.
+            slots: Number of wheel slots (due times beyond one revolution wait extra rounds).
+        """
+        self.interval = float(interval if interval is not None else settings.health_check_interval)
+        self.max_backoff = max(1.0, float(max_backoff if max_backoff is not None else settings.health_check_max_backoff))
+        self.jitter = float(jitter if jitter is not None else settings.health_check_jitter)
+        self.tick = tick
+        self._wheel: List[Set[str]] = [set() for _ in range(slots)]
+        self._entries: Dict[str, _Entry] = {}
+        self._cursor: Optional[int] = None
+        self._passive: Dict[str, float] = {}
+        self._published: Dict[str, float] = {}
+        self._probes = 0
+        self._skipped = 0
+        self._failures = 0
+        self._lag_last = 0.0
+        self._lag_max = 0.0
+        self._lag_total = 0.0
+        self._fired = 0
+
+    def _slot(self, due: float) -> int:
+        """Return the absolute tick number for a due time.
+
+        Args:
+            due: Monotonic due time.
+
+        Returns:
+            int: Tick number.
+        """
+        return math.floor(due / self.tick)
+
+    def _schedule(self, gateway_id: str, due: float) -> None:
+        """Place a gateway in the wheel.
+
+        Args:
+            gateway_id: Gateway ID.
+            due: Monotonic due time.
+        """
+        self._entries[gateway_id].due = due
+        self._wheel[self._slot(due) % len(self._wheel)].add(gateway_id)
+
+    def _next_interval(self, entry: _Entry) -> float:
+        """Return the jittered interval for an entry's current multiplier.
+
+        Args:
+            entry: Scheduling entry.
+
+        Returns:
+            float: Seconds until the next check.
+        """
+        return self.interval * entry.multiplier * (1 + random.uniform(-self.jitter, self.jitter))  # nosec B311 - scheduling jitter, not security
+
+    def sync(self, gateways: Iterable[Any], now: Optional[float] = None) -> None:
+        """Track exactly ``gateways``: add new ones spread over the next interval, drop removed ones.
+
+        Args:
+            gateways: Current gateways (objects with ``id`` and ``reachable``).
+            now: Monotonic time (default: now).
+        """
+        now = time.monotonic() if now is None else now
+        if self._cursor is None:
+            self._cursor = self._slot(now) - 1
+        current = {gw.id: gw for gw in gateways}
+        for gateway_id in set(self._entries) - set(current):
+            entry = self._entries.pop(gateway_id)
+            self._wheel[self._slot(entry.due) % len(self._wheel)].discard(gateway_id)
+            self._passive.pop(gateway_id, None)
+        for gateway_id, gateway in current.items():
+            entry = self._entries.get(gateway_id)
+            if entry is not None:
+                entry.gateway = gateway
+                continue
+            self._entries[gateway_id] = _Entry(gateway=gateway, due=now)
+            self._schedule(gateway_id, now + random.uniform(0, self.interval))  # nosec B311 - scheduling jitter, not security
+
+    def pop_due(self, now: Optional[float] = None) -> List[Any]:
+        """Advance the wheel to ``now`` and return gateways whose check is due.
+
+        Gateways with a recent passive success are rescheduled as healthy
+        without being returned.
+
+        Args:
+            now: Monotonic time (default: now).
+
+        Returns:
+            List[Any]: Gateways to probe; call :meth:`complete` for each when done.
+        """
+        now = time.monotonic() if now is None else now
+        current = self._slot(now)
+        if self._cursor is None:
+            self._cursor = current - 1
+        # Catch up at most one revolution; older slots are the same buckets again
+        start = max(self._cursor + 1, current - len(self._wheel) + 1)
+        due: List[Any] = []
+        wall = time.time()
+        for tick in range(start, current + 1):
+            bucket = self._wheel[tick % len(self._wheel)]
+            for gateway_id in [gid for gid in bucket if self._entries[gid].due <= now]:
+                bucket.discard(gateway_id)
+                entry = self._entries[gateway_id]
+                lag = now - entry.due
+                self._fired += 1
+                self._lag_last = lag
+                self._lag_total += lag
+                self._lag_max = max(self._lag_max, lag)
+                last_passive = self._passive.get(gateway_id)
+                if last_passive is not None and getattr(entry.gateway, "reachable", True) and wall - last_passive <= self.interval * entry.multiplier:
+                    self._skipped += 1
+                    _export(outcome="passive_skip", lag=lag)
+                    entry.multiplier = min(entry.multiplier * 2, self.max_backoff)
+                    self._schedule(gateway_id, now + self._next_interval(entry))
+                    continue
+                entry.failed = False
+                self._probes += 1
+                _export(lag=lag)
+                due.append(entry.gateway)
+        # The current slot may still hold checks due later within this tick
+        self._cursor = current - 1
+        return due
+
+    def complete(self, gateway_id: str, healthy: bool, now: Optional[float] = None) -> None:
+        """Record a probe result and schedule the next check.
+
+        Args:
+            gateway_id: Gateway ID.
+            healthy: Probe outcome (ignored if :meth:`record_failure` was called during the probe).
+            now: Monotonic time (default: now).
+        """
+        entry = self._entries.get(gateway_id)
+        if entry is None:
+            return
+        now = time.monotonic() if now is None else now
+        if healthy and not entry.failed and getattr(entry.gateway, "reachable", True):
+            entry.multiplier = min(entry.multiplier * 2, self.max_backoff)
+            _export(outcome="healthy")
+        else:
+            self._failures += 1
+            entry.multiplier = 1.0
+            _export(outcome="unhealthy")
+        self._schedule(gateway_id, now + self._next_interval(entry))
+
+    def record_failure(self, gateway_id: str) -> None:
+        """Mark the in-flight probe of a gateway as failed.
+
+        Args:
+            gateway_id: Gateway ID.
+        """
+        entry = self._entries.get(gateway_id)
+        if entry is not None:
+            entry.failed = True
+
+    def record_success(self, gateway_id: Optional[str]) -> None:
+        """Record a successful tool invocation through a gateway (passive health signal).
+
+        Also published to Redis, at most once per gateway per quarter
+        interval, so the health leader sees traffic served by other workers.
+
+        Args:
+            gateway_id: Gateway ID (None is ignored).
+        """
+        if not gateway_id:
+            return
+        wall = time.time()
+        self._passive[gateway_id] = wall
+        if wall - self._published.get(gateway_id, 0.0) < self.interval / 4:
+            return
+        redis = get_redis_client_sync() if settings.cache_type == "redis" else None
+        if redis is None:
+            return
+        self._published[gateway_id] = wall
+        try:
+            asyncio.get_running_loop().create_task(self._publish(redis, gateway_id, wall))
+        except RuntimeError:
+            pass  # no running loop (sync caller): local signal only
+
+    async def _publish(self, redis: Any, gateway_id: str, wall: float) -> None:
+        """Share a passive success with the other workers.
+
+        Args:
+            redis: Async Redis client.
+            gateway_id: Gateway ID.
+            wall: Wall-clock time of the success.
+        """
+        try:
+            await redis.hset(PASSIVE_HEALTH_KEY, gateway_id, wall)
+            await redis.expire(PASSIVE_HEALTH_KEY, int(self.interval * self.max_backoff * 2) + 1)
+        except Exception as e:
+            logger.debug(f"Failed to publish passive health for gateway {gateway_id}: {e}")
+
+    async def merge_remote_passive(self) -> None:
+        """Pull passive successes recorded by other workers from Redis."""
+        redis = get_redis_client_sync() if settings.cache_type == "redis" else None
+        if redis is None:
+            return
+        try:
+            remote = await redis.hgetall(PASSIVE_HEALTH_KEY)
+        except Exception as e:
+            logger.debug(f"Failed to read passive health signals: {e}")
+            return
+        for gateway_id, value in (remote or {}).items():
+            gateway_id = gateway_id.decode() if isinstance(gateway_id, bytes) else gateway_id
+            if gateway_id in self._entries:
+                self._passive[gateway_id] = max(self._passive.get(gateway_id, 0.0), float(value))
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        """Return how long to sleep before the next wheel tick.
+
+        Args:
+            now: Monotonic time (default: now).
+
+        Returns:
+            float: Seconds (0 < value <= tick).
+        """
+        now = time.monotonic() if now is None else now
+        return max(0.001, (self._slot(now) + 1) * self.tick - now)
+
+    async def run(self, gateways: Iterable[Any], probe: Callable[[Any], Awaitable[bool]], duration: float, concurrency: int) -> None:
+        """Sync the gateway set, then dispatch due probes for ``duration`` seconds.
+
+        Args:
+            gateways: Current gateways.
+            probe: Coroutine function checking one gateway; returns True when healthy.
+            duration: Seconds to run before returning (the caller re-checks leadership and reloads gateways).
+            concurrency: Max probes in flight.
+        """
+        self.sync(gateways)
+        await self.merge_remote_passive()
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks: Set[asyncio.Task] = set()
+
+        async def check(gateway: Any) -> None:
+            """Run one probe and record its outcome.
+
+            Args:
+                gateway: Gateway to probe.
+            """
+            healthy = False
+            try:
+                async with semaphore:
+                    healthy = await probe(gateway)
+            except Exception as e:
+                logger.warning(f"Health probe for gateway {getattr(gateway, 'name', gateway.id)} failed: {e}")
+            finally:
+                self.complete(gateway.id, healthy)
+
+        end = time.monotonic() + duration
+        while True:
+            for gateway in self.pop_due():
+                task = asyncio.create_task(check(gateway))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(self.seconds_until_next(), remaining))
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return scheduler counters.
+
+        Returns:
+            Dict[str, Any]: Gateway count, probe/skip/failure counts and lag in seconds.
+        """
+        return {
+            "gateways": len(self._entries),
+            "probes": self._probes,
+            "passive_skips": self._skipped,
+            "failures": self._failures,
+            "lag_last_seconds": round(self._lag_last, 3),
+            "lag_max_seconds": round(self._lag_max, 3),
+            "lag_avg_seconds": round(self._lag_total / self._fired, 3) if self._fired else 0.0,
+        }
+
+
+_health_check_scheduler: Optional[HealthCheckScheduler] = None
+
+
+def get_health_check_scheduler() -> HealthCheckScheduler:
+    """Get or create the singleton HealthCheckScheduler instance.
+
+    Returns:
+        HealthCheckScheduler: The singleton scheduler instance.
+    """
+    global _health_check_scheduler  # pylint: disable=global-statement
+    if _health_check_scheduler is None:
+        _health_check_scheduler = HealthCheckScheduler()
+    return _health_check_scheduler
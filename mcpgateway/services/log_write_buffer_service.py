@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""Buffered writer for structured logs, security events and audit trail rows.
+
+``LogRouter``, ``SecurityLogger`` and ``AuditTrailService`` used to open a
+session and commit one row per event on the caller's thread, which adds
+several synchronous inserts to every authenticated request when database
+logging is enabled. They now hand their ORM rows to this service instead. A
+background task drains the bounded queue and writes each batch in one
+transaction from a worker thread.
+
+Rows are only queued while the flush task is running; otherwise (CLI tools,
+tests, buffering disabled) ``enqueue`` returns False and the caller keeps
+writing synchronously. When the queue is full the overflow policy decides
+between back-pressure (``write_through``: the caller writes the row itself)
+and shedding load (``drop``: the row is discarded and counted).
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from collections import deque
+import logging
+import threading
+from typing import Any, Deque, List, Optional
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import fresh_db_session
+
+logger = logging.getLogger(__name__)
+
+
+class LogWriteBufferService:
+    """Bounded queue of log rows flushed to the database in batches.
+
+    Configuration (via environment variables):
+    - LOG_WRITE_BUFFER_ENABLED: Buffer log, security event and audit rows (default: True)
+    - LOG_WRITE_BUFFER_MAX_SIZE: Max queued rows before the overflow policy applies (default: 10000)
+    - LOG_WRITE_BUFFER_FLUSH_INTERVAL: Seconds between flushes (default: 1.0)
+    - LOG_WRITE_BUFFER_BATCH_SIZE: Max rows written per transaction (default: 500)
+    - LOG_WRITE_BUFFER_OVERFLOW_POLICY: ``write_through`` or ``drop`` (default: write_through)
+
+    Examples:
+        >>> svc = LogWriteBufferService(max_queue_size=1, enabled=True, overflow_policy="drop")
+        >>> svc.enqueue(object())  # flush task not running: caller writes the row
+        False
+        >>> svc._running = lambda: True
+        >>> svc.enqueue(object()), svc.enqueue(object())
+        (True, True)
+        >>> stats = svc.get_stats()
+        >>> (stats["queue_depth"], stats["total_enqueued"], stats["dropped_queue_full"])
+        (1, 1, 1)
+    """
+
+    def __init__(
+        self,
+        max_queue_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        overflow_policy: Optional[str] = None,
+    ):
+        """Initialize the log buffer service.
+
+        Args:
+            max_queue_size: Maximum queued rows (default: from settings or 10000)
+            flush_interval: Seconds between automatic flushes (default: from settings or 1.0)
+            batch_size: Maximum rows per transaction (default: from settings or 500)
+            enabled: Whether buffering is enabled (default: from settings or True)
+            overflow_policy: ``write_through`` or ``drop`` (default: from settings or write_through)
+        """
+        self.max_queue_size = max_queue_size or getattr(settings, "log_write_buffer_max_size", 10000)
+        self.flush_interval = flush_interval or getattr(settings, "log_write_buffer_flush_interval", 1.0)
+        self.batch_size = batch_size or getattr(settings, "log_write_buffer_batch_size", 500)
+        self.enabled = enabled if enabled is not None else getattr(settings, "log_write_buffer_enabled", True)
+        self.overflow_policy = overflow_policy or getattr(settings, "log_write_buffer_overflow_policy", "write_through")
+
+        self._queue: Deque[Any] = deque()
+        self._lock = threading.Lock()
+
+        # Background flush task; the wakeup event lets a full batch flush early
+        self._flush_task: Optional[asyncio.Task] = None
+        self._shutdown_event = asyncio.Event()
+        self._wakeup_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Stats for monitoring
+        self._total_enqueued = 0
+        self._total_flushed = 0
+        self._flush_count = 0
+        self._flush_failures = 0
+        self._written_through = 0
+        self._dropped_queue_full = 0
+        self._dropped_flush_error = 0
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if not self.enabled:
+            logger.info("LogWriteBufferService disabled, skipping start")
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._shutdown_event.clear()
+            self._loop = asyncio.get_running_loop()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(
+                f"LogWriteBufferService flush task started (interval={self.flush_interval}s, max_queue_size={self.max_queue_size}, "
+                f"batch_size={self.batch_size}, overflow_policy={self.overflow_policy})"
+            )
+
+    async def shutdown(self) -> None:
+        """Shutdown service with final flush."""
+        logger.info("LogWriteBufferService shutting down...")
+        self._shutdown_event.set()
+
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+        logger.info(
+            f"LogWriteBufferService shutdown complete: total_enqueued={self._total_enqueued}, total_flushed={self._total_flushed}, "
+            f"written_through={self._written_through}, dropped_queue_full={self._dropped_queue_full}, dropped_flush_error={self._dropped_flush_error}"
+        )
+
+    def _running(self) -> bool:
+        """Return True while the flush task is alive.
+
+        Returns:
+            bool: True if queued rows will be flushed.
+        """
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def enqueue(self, record: Any) -> bool:
+        """Queue an ORM row for the next batch write.
+
+        Args:
+            record: Transient ORM instance (StructuredLogEntry, SecurityEvent, AuditTrail, ...).
+
+        Returns:
+            bool: True if the buffer took the row (queued, or dropped under the ``drop``
+            policy); False if the caller must write it synchronously.
+        """
+        if not self.enabled or not self._running():
+            return False
+
+        with self._lock:
+            full = len(self._queue) >= self.max_queue_size
+            if full:
+                if self.overflow_policy == "drop":
+                    self._dropped_queue_full += 1
+                else:
+                    self._written_through += 1
+            else:
+                self._queue.append(record)
+                self._total_enqueued += 1
+            depth = len(self._queue)
+
+        if full:
+            logger.debug(f"Log buffer full ({self.max_queue_size}), {'dropping' if self.overflow_policy == 'drop' else 'writing through'} {type(record).__name__}")
+            return self.overflow_policy == "drop"
+
+        if depth >= self.batch_size:
+            self._wake()
+        return True
+
+    def _wake(self) -> None:
+        """Wake the flush loop early; safe to call from worker threads."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._wakeup_event.set()
+        else:
+            loop.call_soon_threadsafe(self._wakeup_event.set)
+
+    async def _flush_loop(self) -> None:
+        """Background task that periodically flushes queued rows.
+
+        Raises:
+            asyncio.CancelledError: When the flush loop is cancelled.
+        """
+        while not self._shutdown_event.is_set():
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup_event.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup_event.clear()
+
+                await self.flush()
+
+            except asyncio.CancelledError:
+                logger.debug("Log flush loop cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Error in log flush loop: {e}", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def flush(self) -> int:
+        """Drain the queue in batches, writing each batch in a worker thread.
+
+        Returns:
+            int: Number of rows written.
+        """
+        written = 0
+        while True:
+            with self._lock:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            if not batch:
+                return written
+
+            flushed = await asyncio.to_thread(self._flush_to_db, batch)
+            written += flushed
+            self._total_flushed += flushed
+            self._flush_count += 1
+            if flushed < len(batch):
+                self._flush_failures += 1
+                self._dropped_flush_error += len(batch) - flushed
+
+    def _flush_to_db(self, batch: List[Any]) -> int:
+        """Insert a batch of rows in one transaction (runs in thread).
+
+        If the batch fails, rows are retried one per transaction so a single
+        bad row does not discard the rest of the batch.
+
+        Args:
+            batch: ORM rows to persist.
+
+        Returns:
+            int: Number of rows written.
+        """
+        try:
+            with fresh_db_session() as db:
+                db.add_all(batch)
+                db.commit()
+            return len(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f"Failed to flush {type(batch[0]).__name__} row: {e}")
+                return 0
+            logger.warning(f"Failed to flush {len(batch)} log rows, retrying individually: {e}")
+
+        written = 0
+        for record in batch:
+            try:
+                with fresh_db_session() as db:
+                    db.add(record)
+                    db.commit()
+                written += 1
+            except Exception as e:
+                # Rows are lost on failure - surfaced via dropped_flush_error
+                logger.error(f"Failed to flush {type(record).__name__} row: {e}")
+        return written
+
+    def get_stats(self) -> dict:
+        """Get buffer statistics for monitoring.
+
+        Returns:
+            dict: Queue depth, throughput and overflow counters.
+        """
+        with self._lock:
+            depth = len(self._queue)
+
+        return {
+            "enabled": self.enabled,
+            "running": self._running(),
+            "max_queue_size": self.max_queue_size,
+            "flush_interval": self.flush_interval,
+            "batch_size": self.batch_size,
+            "overflow_policy": self.overflow_policy,
+            "queue_depth": depth,
+            "total_enqueued": self._total_enqueued,
+            "total_flushed": self._total_flushed,
+            "flush_count": self._flush_count,
+            "flush_failures": self._flush_failures,
+            "written_through": self._written_through,
+            "dropped_queue_full": self._dropped_queue_full,
+            "dropped_flush_error": self._dropped_flush_error,
+        }
+
+
+# Singleton instance
+_log_write_buffer_service: Optional[LogWriteBufferService] = None
+
+
+def get_log_write_buffer_service() -> LogWriteBufferService:
+    """Get or create the singleton LogWriteBufferService instance.
+
+    Returns:
+        LogWriteBufferService: The singleton log buffer service instance.
+    """
+    global _log_write_buffer_service  # pylint: disable=global-statement
+    if _log_write_buffer_service is None:
+        _log_write_buffer_service = LogWriteBufferService()
+    return _log_write_buffer_service
@@ -116,6 +116,8 @@ class PooledSession:
     created_at: float = field(default_factory=time.time)
     last_used: float = field(default_factory=time.time)
     use_count: int = 0
+    in_flight: int = 0  # Requests currently using this session (multiplexed mode)
+    validating: bool = False  # Health check in progress before first use (multiplexed mode)
     _closed: bool = field(default=False, repr=False)
 
     @property
@@ -211,6 +213,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         - Configurable pool size per URL+identity+transport
         - Circuit breaker for failing endpoints
         - Idle pool key eviction to prevent unbounded growth
+        - Optional multiplexing of concurrent requests over one session
         - Custom identity extractor for rotating tokens (e.g., JWT decode)
         - Metrics for monitoring (hits, misses, evictions)
         - Graceful shutdown with close_all()
@@ -233,6 +236,14 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             return claims.get("sub") or claims.get("user_id")
 
         pool = MCPSessionPool(identity_extractor=extract_user_id)
+
+    Multiplexing:
+        By default a session is used by one caller at a time. With
+        ``max_concurrent_per_session`` > 1, up to that many callers share a
+        session concurrently (MCP JSON-RPC correlates responses by request id),
+        and each acquire picks the least-loaded open session for its key. A new
+        session is opened only when every open session is full, and callers
+        wait for a free slot once ``max_sessions_per_key`` sessions are open.
     """
 
     # Headers that contribute to session identity (case-insensitive)
@@ -263,6 +274,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         health_check_methods: Optional[list[str]] = None,
         health_check_timeout_seconds: float = 5.0,
         message_handler_factory: Optional[MessageHandlerFactory] = None,
+        max_concurrent_per_session: int = 1,
     ):
         """
         Initialize the session pool.
@@ -288,6 +300,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             message_handler_factory: Optional factory for creating message handlers.
                                     Called with (url, gateway_id) to create handlers for
                                     each new session. Enables notification handling.
+            max_concurrent_per_session: Requests that may share one session concurrently.
+                                       1 (default) gives each caller exclusive use of a session.
         """
         # Configuration
         self._max_sessions = max_sessions_per_key
@@ -304,6 +318,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._health_check_methods = health_check_methods or ["ping", "skip"]
         self._health_check_timeout = health_check_timeout_seconds
         self._message_handler_factory = message_handler_factory
+        self._max_concurrent_per_session = max(1, max_concurrent_per_session)
 
         # State - protected by _global_lock for creation, per-key locks for access
         self._global_lock = asyncio.Lock()
@@ -313,6 +328,12 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._semaphores: Dict[PoolKey, asyncio.Semaphore] = {}
         self._pool_last_used: Dict[PoolKey, float] = {}  # Track last use time per pool key
 
+        # Multiplexed mode: open sessions shared by concurrent callers, keys with a
+        # session being opened, and events set whenever a key gains free capacity
+        self._shared: Dict[PoolKey, list[PooledSession]] = {}
+        self._creating: Set[PoolKey] = set()
+        self._capacity_events: Dict[PoolKey, asyncio.Event] = {}
+
         # Circuit breaker state
         self._failures: Dict[str, int] = {}  # url -> consecutive failure count
         self._circuit_open_until: Dict[str, float] = {}  # url -> timestamp
@@ -330,6 +351,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._pool_keys_evicted = 0
         self._sessions_reaped = 0  # Sessions closed during background eviction
         self._anonymous_identity_count = 0  # Count of requests with no identity headers
+        self._multiplexed_waits = 0  # Acquires that waited for a free slot on a full key
 
         # Lifecycle
         self._closed = False
@@ -764,6 +786,9 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         # Throttled eviction - only run if enough time has passed (inline, not spawned)
         await self._maybe_evict_idle_pool_keys()
 
+        if self._max_concurrent_per_session > 1:
+            return await self._acquire_shared(pool_key, url, headers, transport_type, httpx_client_factory, effective_timeout, user_id, gateway_id)
+
         # Try to get from pool first (quick path, no lock needed for queue get)
         while True:
             try:
@@ -800,17 +825,12 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             # Verify we own this session before creating (prevents race condition)
             # If another worker already claimed ownership, we should not create a new session
             # Note: Ownership is registered atomically in register_session_mapping() using SETNX
-            if settings.mcpgateway_session_affinity_enabled and headers:
-                headers_lower = {k.lower(): v for k, v in headers.items()}
-                mcp_session_id = headers_lower.get("x-mcp-session-id")
-                if mcp_session_id and self.is_valid_mcp_session_id(mcp_session_id):
-                    owner = await self._get_pool_session_owner(mcp_session_id)
-                    if owner and owner != WORKER_ID:
-                        # Another worker claimed ownership - should have been forwarded
-                        # Release semaphore and raise to trigger forwarding
-                        semaphore.release()
-                        logger.warning(f"Session {mcp_session_id[:8]}... owned by worker {owner}, not us ({WORKER_ID})")
-                        raise RuntimeError(f"Session owned by another worker: {owner}")
+            owner = await self._foreign_session_owner(headers)
+            if owner:
+                # Another worker claimed ownership - should have been forwarded
+                # Release semaphore and raise to trigger forwarding
+                semaphore.release()
+                raise RuntimeError(f"Session owned by another worker: {owner}")
 
             pooled = await asyncio.wait_for(
                 self._create_session(url, headers, transport_type, httpx_client_factory, effective_timeout, gateway_id),
@@ -837,6 +857,201 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 logger.warning(f"Failed to create session for {sanitize_url_for_logging(url)}: {e}")
             raise
 
+    async def _foreign_session_owner(self, headers: Optional[Dict[str, str]]) -> Optional[str]:
+        """Return the owning worker if another worker owns the downstream session in ``headers``.
+
+        Args:
+            headers: Request headers (checked for ``x-mcp-session-id``).
+
+        Returns:
+            The other worker's ID, or None if this worker may create the session.
+        """
+        if not (settings.mcpgateway_session_affinity_enabled and headers):
+            return None
+        headers_lower = {k.lower(): v for k, v in headers.items()}
+        mcp_session_id = headers_lower.get("x-mcp-session-id")
+        if not (mcp_session_id and self.is_valid_mcp_session_id(mcp_session_id)):
+            return None
+        owner = await self._get_pool_session_owner(mcp_session_id)
+        if owner and owner != WORKER_ID:
+            logger.warning(f"Session {mcp_session_id[:8]}... owned by worker {owner}, not us ({WORKER_ID})")
+            return owner
+        return None
+
+    async def _acquire_shared(
+        self,
+        pool_key: PoolKey,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        transport_type: TransportType,
+        httpx_client_factory: Optional[HttpxClientFactory],
+        timeout: float,
+        user_id: str,
+        gateway_id: Optional[str],
+    ) -> PooledSession:
+        """
+        Acquire a slot on a shared session (multiplexed mode).
+
+        Picks the least-loaded open session for ``pool_key`` with a free slot.
+        When every session is full, opens another one if the per-key limit
+        allows; only one session is opened per key at a time, so a cold burst
+        fills the first session before opening more. Otherwise waits for a
+        release until the acquire timeout.
+
+        Args:
+            pool_key: Pool key computed by acquire().
+            url: The MCP server URL.
+            headers: Request headers.
+            transport_type: Transport type to use.
+            httpx_client_factory: Optional factory for httpx clients.
+            timeout: Transport timeout in seconds.
+            user_id: Raw user identity stored on new sessions.
+            gateway_id: Optional gateway ID for notification handler context.
+
+        Returns:
+            PooledSession with ``in_flight`` already incremented for the caller.
+
+        Raises:
+            asyncio.TimeoutError: If no slot frees up within the acquire timeout.
+            RuntimeError: If the pool closes while waiting or another worker owns the session.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._acquire_timeout
+        waited = False
+
+        while True:
+            if self._closed:
+                raise RuntimeError("Session pool is closed")
+
+            # Grab the event before checking capacity so a release in between is not missed
+            capacity = self._capacity_events.setdefault(pool_key, asyncio.Event())
+            shared = self._shared.get(pool_key, [])
+
+            for stale in [p for p in shared if p.in_flight == 0 and (p.is_closed or p.age_seconds > self._session_ttl)]:
+                await self._retire_shared(pool_key, stale)
+
+            candidates = [
+                p for p in shared if not p.is_closed and not p.validating and p.in_flight < self._max_concurrent_per_session and p.age_seconds <= self._session_ttl
+            ]
+            if candidates:
+                pooled = min(candidates, key=lambda p: p.in_flight)
+                pooled.in_flight += 1
+                if pooled.in_flight == 1:
+                    # Health-check an idle session before reuse; other callers skip it until the check is done
+                    pooled.validating = True
+                    try:
+                        healthy = await self._validate_session(pooled)
+                    except BaseException:
+                        pooled.in_flight -= 1
+                        raise
+                    finally:
+                        pooled.validating = False
+                        self._notify_capacity(pool_key)
+                    if not healthy:
+                        pooled.in_flight -= 1
+                        await self._retire_shared(pool_key, pooled)
+                        continue
+                pooled.last_used = time.time()
+                pooled.use_count += 1
+                self._hits += 1
+                self._active.setdefault(pool_key, set()).add(pooled)
+                return pooled
+
+            semaphore = self._semaphores.get(pool_key)
+            if semaphore is None:
+                await self._get_or_create_pool(pool_key)
+                semaphore = self._semaphores[pool_key]
+            if pool_key not in self._creating and not semaphore.locked():
+                break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(f"Timeout waiting for available session for {sanitize_url_for_logging(url)}")
+            if not waited:
+                waited = True
+                self._multiplexed_waits += 1
+            try:
+                await asyncio.wait_for(capacity.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"Timeout waiting for available session for {sanitize_url_for_logging(url)}") from None
+
+        # Open a new session (semaphore is free, so this does not block)
+        await semaphore.acquire()
+        self._creating.add(pool_key)
+        try:
+            owner = await self._foreign_session_owner(headers)
+            if owner:
+                raise RuntimeError(f"Session owned by another worker: {owner}")
+            pooled = await asyncio.wait_for(
+                self._create_session(url, headers, transport_type, httpx_client_factory, timeout, gateway_id),
+                timeout=self._session_create_timeout,
+            )
+        except BaseException as e:
+            semaphore.release()
+            if not isinstance(e, asyncio.CancelledError):
+                self._record_failure(url)
+                logger.warning(f"Failed to create session for {sanitize_url_for_logging(url)}: {e}")
+            raise
+        finally:
+            self._creating.discard(pool_key)
+            self._notify_capacity(pool_key)
+
+        pooled.identity_key = pool_key[2]
+        pooled.user_identity = user_id
+        pooled.in_flight = 1
+        self._misses += 1
+        self._record_success(url)
+        self._shared.setdefault(pool_key, []).append(pooled)
+        self._active.setdefault(pool_key, set()).add(pooled)
+        logger.debug(f"Pool miss for {sanitize_url_for_logging(url)} - opened shared session (transport={transport_type.value})")
+        return pooled
+
+    async def _release_shared(self, pool_key: PoolKey, pooled: PooledSession) -> None:
+        """Give back one slot on a shared session (multiplexed mode).
+
+        Args:
+            pool_key: Pool key the session belongs to.
+            pooled: The session to release.
+        """
+        pooled.in_flight = max(0, pooled.in_flight - 1)
+        pooled.last_used = time.time()
+        self._pool_last_used[pool_key] = pooled.last_used
+
+        if pooled.in_flight == 0:
+            self._active.get(pool_key, set()).discard(pooled)
+            if self._closed or pooled.age_seconds > self._session_ttl:
+                await self._retire_shared(pool_key, pooled)
+                return
+
+        self._notify_capacity(pool_key)
+
+    async def _retire_shared(self, pool_key: PoolKey, pooled: PooledSession) -> None:
+        """Remove an idle shared session from its key, free its slot and close it.
+
+        Args:
+            pool_key: Pool key the session belongs to.
+            pooled: The session to retire.
+        """
+        shared = self._shared.get(pool_key)
+        if shared is not None and pooled in shared:
+            shared.remove(pooled)
+            if pool_key in self._semaphores:
+                self._semaphores[pool_key].release()
+            self._evictions += 1
+        self._active.get(pool_key, set()).discard(pooled)
+        await self._close_session(pooled)
+        self._notify_capacity(pool_key)
+
+    def _notify_capacity(self, pool_key: PoolKey) -> None:
+        """Wake callers waiting for a free slot on ``pool_key``.
+
+        Args:
+            pool_key: Pool key whose capacity changed.
+        """
+        event = self._capacity_events.pop(pool_key, None)
+        if event is not None:
+            event.set()
+
     async def release(self, pooled: PooledSession) -> None:
         """
         Return a session to the pool for reuse.
@@ -855,6 +1070,10 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             user_hash = hashlib.sha256(pooled.user_identity.encode()).hexdigest()
 
         pool_key = (user_hash, pooled.url, pooled.identity_key, pooled.transport_type.value, pooled.gateway_id)
+        if self._max_concurrent_per_session > 1:
+            await self._release_shared(pool_key, pooled)
+            return
+
         lock = await self._get_or_create_lock(pool_key)
         pool = await self._get_or_create_pool(pool_key)
 
@@ -934,6 +1153,18 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 if active:
                     continue
 
+                # Multiplexed mode: reap idle shared sessions, keep the key while any remain
+                shared = self._shared.get(pool_key)
+                if shared:
+                    for session in list(shared):
+                        if session.age_seconds > self._session_ttl or session.idle_seconds > self._idle_pool_eviction:
+                            shared.remove(session)
+                            sessions_to_close.append(session)
+                            if pool_key in self._semaphores:
+                                self._semaphores[pool_key].release()
+                    if shared:
+                        continue
+
                 if pool:
                     # Phase 1: Drain and collect expired/stale sessions from idle pools
                     while not pool.empty():
@@ -963,6 +1194,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 self._locks.pop(pool_key, None)
                 self._semaphores.pop(pool_key, None)
                 self._pool_last_used.pop(pool_key, None)
+                self._shared.pop(pool_key, None)
+                self._capacity_events.pop(pool_key, None)
                 self._pool_keys_evicted += 1
                 logger.debug(f"Evicted idle pool key: {pool_key[0][:8]}|{pool_key[1]}|{pool_key[2][:8]}")
 
@@ -1276,10 +1509,19 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 for pooled in list(active_set):
                     await self._close_session(pooled)
 
+            # Close shared sessions and wake callers waiting for a slot
+            for _pool_key, shared in list(self._shared.items()):
+                for pooled in shared:
+                    await self._close_session(pooled)
+            for event in self._capacity_events.values():
+                event.set()
+
             self._pools.clear()
             self._active.clear()
             self._locks.clear()
             self._semaphores.clear()
+            self._shared.clear()
+            self._capacity_events.clear()
 
         # Stop RPC listener if running
         if self._rpc_listener_task and not self._rpc_listener_task.done():
@@ -1800,6 +2042,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             "anonymous_identity_count": self._anonymous_identity_count,
             "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
             "pool_key_count": len(self._pools),
+            "max_concurrent_per_session": self._max_concurrent_per_session,
+            "multiplexed_waits": self._multiplexed_waits,
             # Session affinity metrics
             "session_affinity": {
                 "local_hits": self._session_affinity_local_hits,
@@ -1811,12 +2055,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 "forwarded_timeouts": self._forwarded_request_timeouts,
             },
             "pools": {
-                f"{url}|{identity[:8]}|{transport}|{user}|{gw_id[:8] if gw_id else 'none'}": {
-                    "available": pool.qsize(),
-                    "active": len(self._active.get((user, url, identity, transport, gw_id), set())),
-                    "max": self._max_sessions,
-                }
-                for (user, url, identity, transport, gw_id), pool in self._pools.items()
+                f"{url}|{identity[:8]}|{transport}|{user}|{gw_id[:8] if gw_id else 'none'}": self._pool_metrics((user, url, identity, transport, gw_id))
+                for (user, url, identity, transport, gw_id) in self._pools
             },
             "circuit_breakers": {
                 url: {
@@ -1827,6 +2067,30 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             },
         }
 
+    def _pool_metrics(self, pool_key: PoolKey) -> Dict[str, Any]:
+        """Return the metrics entry for one pool key.
+
+        In multiplexed mode the entry also lists an in-flight gauge per open session.
+
+        Args:
+            pool_key: Pool key to describe.
+
+        Returns:
+            Dict with available, active, in_flight and max (plus sessions when multiplexed).
+        """
+        active = self._active.get(pool_key, set())
+        if self._max_concurrent_per_session == 1:
+            return {"available": self._pools[pool_key].qsize(), "active": len(active), "in_flight": len(active), "max": self._max_sessions}
+
+        shared = self._shared.get(pool_key, [])
+        return {
+            "available": sum(1 for p in shared if p.in_flight == 0),
+            "active": len(active),
+            "in_flight": sum(p.in_flight for p in shared),
+            "max": self._max_sessions,
+            "sessions": [{"in_flight": p.in_flight, "use_count": p.use_count, "age_seconds": round(p.age_seconds, 1)} for p in shared],
+        }
+
     @asynccontextmanager
     async def session(
         self,
@@ -1897,6 +2161,7 @@ def init_mcp_session_pool(
     health_check_methods: Optional[list[str]] = None,
     health_check_timeout_seconds: float = 5.0,
     message_handler_factory: Optional[MessageHandlerFactory] = None,
+    max_concurrent_per_session: int = 1,
     enable_notifications: bool = True,
     notification_debounce_seconds: float = 5.0,
 ) -> MCPSessionPool:
@@ -1954,6 +2219,7 @@ def init_mcp_session_pool(
         health_check_methods=health_check_methods,
         health_check_timeout_seconds=health_check_timeout_seconds,
         message_handler_factory=effective_handler_factory,
+        max_concurrent_per_session=max_concurrent_per_session,
     )
     logger.info("MCP session pool initialized")
     return _mcp_session_pool
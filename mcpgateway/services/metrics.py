@@ -44,7 +44,7 @@ import re
 
 # Third-Party
 from fastapi import Response, status
-from prometheus_client import Counter, Gauge, REGISTRY
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY
 from prometheus_fastapi_instrumentator import Instrumentator
 
 # First-Party
@@ -79,6 +79,12 @@ tool_timeout_counter = Counter(
     ["tool_name"],
 )
 
+tool_result_cache_hits_counter = Counter(
+    "tool_result_cache_hits_total",
+    "Total number of tool invocations served from the tool result cache",
+    ["tool_name"],
+)
+
 circuit_breaker_open_counter = Counter(
     "circuit_breaker_open_total",
     "Total number of times circuit breaker opened",
@@ -97,6 +103,18 @@ password_reset_completions_counter = Counter(
     ["outcome"],
 )
 
+gateway_health_checks_counter = Counter(
+    "gateway_health_checks_total",
+    "Total number of scheduled gateway health checks by outcome (healthy, unhealthy, passive_skip)",
+    ["outcome"],
+)
+
+gateway_health_check_lag_histogram = Histogram(
+    "gateway_health_check_lag_seconds",
+    "Delay between a gateway health check's due time and when the scheduler started it",
+    buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
+)
+
 
 def setup_metrics(app):
     """
@@ -20,7 +20,7 @@ from typing import Deque, Optional
 
 # First-Party
 from mcpgateway.config import settings
-from mcpgateway.db import A2AAgentMetric, fresh_db_session, PromptMetric, ResourceMetric, ServerMetric, ToolMetric
+from mcpgateway.db import A2AAgentMetric, apply_metric_counter_deltas, fresh_db_session, metric_counter_deltas, PromptMetric, ResourceMetric, ServerMetric, ToolMetric
 
 logger = logging.getLogger(__name__)
 
@@ -550,6 +550,16 @@ class MetricsBufferService:
                         ],
                     )
 
+                # Bulk inserts skip the ORM events, so merge the per-entity counters once per flush
+                for entity_type, id_attr, metrics in (
+                    ("tools", "tool_id", tool_metrics),
+                    ("resources", "resource_id", resource_metrics),
+                    ("prompts", "prompt_id", prompt_metrics),
+                    ("servers", "server_id", server_metrics),
+                    ("a2a_agents", "a2a_agent_id", a2a_agent_metrics),
+                ):
+                    apply_metric_counter_deltas(db, metric_counter_deltas(entity_type, ((getattr(m, id_attr), m.timestamp, m.response_time, m.is_success) for m in metrics)))
+
                 db.commit()
 
         except Exception as e:
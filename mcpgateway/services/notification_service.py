@@ -19,6 +19,9 @@ Description:
     - Per-gateway session isolation ensures correct notification attribution
     - Supports tools, resources, and prompts list_changed notifications
 
+    notifications/resources/updated drops the cached content of that resource
+    (see mcpgateway.cache.resource_cache).
+
     Capable of handling other tasks as well like cancellation, progress notifications, etc. (to be implemented here)
 
 Usage:
@@ -192,6 +195,7 @@ class NotificationService:
         self._notifications_debounced = 0
         self._refreshes_triggered = 0
         self._refreshes_failed = 0
+        self._resource_updates_received = 0
 
     async def initialize(self, gateway_service: Optional["GatewayService"] = None) -> None:
         """Initialize the notification service and start background worker.
@@ -415,6 +419,10 @@ class NotificationService:
         elif "PromptListChangedNotification" in root_class or "PromptsListChangedNotification" in root_class:
             notification_type = NotificationType.PROMPTS_LIST_CHANGED
 
+        if "ResourceUpdatedNotification" in root_class:
+            await self._invalidate_resource_content(gateway_id, notification_root)
+            return
+
         if notification_type:
             logger.info(
                 "Received %s notification from gateway %s (%s)",
@@ -430,6 +438,31 @@ class NotificationService:
                 root_class,
             )
 
+    async def _invalidate_resource_content(self, gateway_id: str, notification: Any) -> None:
+        """Drop cached content of a resource after a notifications/resources/updated.
+
+        Args:
+            gateway_id: The gateway ID that sent the notification.
+            notification: The ResourceUpdatedNotification.
+
+        Example:
+            >>> import asyncio
+            >>> from types import SimpleNamespace
+            >>> from mcpgateway.cache.resource_cache import content_tag, resource_cache
+            >>> resource_cache.set("k", "stale", tags=(content_tag("gw-1", "file:///a.txt"),))
+            >>> notification = SimpleNamespace(params=SimpleNamespace(uri="file:///a.txt"))
+            >>> asyncio.run(NotificationService()._invalidate_resource_content("gw-1", notification))
+            >>> resource_cache.get("k") is None
+            True
+        """
+        # First-Party
+        from mcpgateway.cache.resource_cache import content_tag, resource_cache  # pylint: disable=import-outside-toplevel
+
+        uri = str(notification.params.uri)
+        logger.info("Received notifications/resources/updated for %s from gateway %s", uri, gateway_id)
+        self._resource_updates_received += 1
+        await resource_cache.invalidate_shared(content_tag(gateway_id, uri))
+
     async def _enqueue_refresh(
         self,
         gateway_id: str,
@@ -635,6 +668,7 @@ class NotificationService:
             "notifications_debounced": self._notifications_debounced,
             "refreshes_triggered": self._refreshes_triggered,
             "refreshes_failed": self._refreshes_failed,
+            "resource_updates_received": self._resource_updates_received,
             "pending_refreshes": self._refresh_queue.qsize(),
             "registered_gateways": len(self._gateway_capabilities),
             "debounce_seconds": self.debounce_seconds,
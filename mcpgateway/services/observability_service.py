@@ -15,6 +15,7 @@ It includes:
 - Metrics collection and storage
 - Query and filtering capabilities
 - Integration with FastAPI middleware
+- Buffered traces assembled in memory and bulk-exported by the span buffer
 
 Examples:
     >>> from mcpgateway.services.observability_service import ObservabilityService  # doctest: +SKIP
@@ -30,6 +31,7 @@ from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
 import logging
+import random
 import re
 import traceback
 from typing import Any, Dict, List, Optional, Pattern, Tuple
@@ -41,7 +43,9 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload, Session
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.db import ObservabilityEvent, ObservabilityMetric, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.services.span_buffer_service import BufferedTrace, get_span_buffer_service
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +56,9 @@ _TRACEPARENT_RE: Pattern[str] = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9
 # Context variable for tracking the current trace_id across async calls
 current_trace_id: ContextVar[Optional[str]] = ContextVar("current_trace_id", default=None)
 
+# In-memory trace being assembled for the span buffer (see begin_buffered_trace)
+current_buffered_trace: ContextVar[Optional[BufferedTrace]] = ContextVar("current_buffered_trace", default=None)
+
 
 def utc_now() -> datetime:
     """Return current UTC time with timezone.
@@ -165,6 +172,45 @@ def format_traceparent(trace_id: str, span_id: str, sampled: bool = True) -> str
     return f"00-{trace_id}-{span_id}-{flags}"
 
 
+def should_sample_trace(trace_flags: Optional[str] = None, sample_rate: Optional[float] = None) -> bool:
+    """Make the head-based sampling decision for a new trace.
+
+    An upstream W3C ``traceparent`` decision is honoured when present;
+    otherwise the trace is kept with probability ``sample_rate``.
+
+    Args:
+        trace_flags: Trace flags from an incoming traceparent header (hex string)
+        sample_rate: Probability of keeping a root trace (defaults to OBSERVABILITY_SAMPLE_RATE)
+
+    Returns:
+        True if the trace should be recorded
+
+    Examples:
+        >>> should_sample_trace("01", sample_rate=0.0)
+        True
+        >>> should_sample_trace("00", sample_rate=1.0)
+        False
+        >>> should_sample_trace(None, sample_rate=1.0)
+        True
+        >>> should_sample_trace(None, sample_rate=0.0)
+        False
+        >>> should_sample_trace("zz", sample_rate=1.0)
+        True
+    """
+    if trace_flags is not None:
+        try:
+            return bool(int(trace_flags, 16) & 0x01)
+        except ValueError:
+            pass
+
+    rate = settings.observability_sample_rate if sample_rate is None else sample_rate
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    return random.random() < rate  # nosec B311 - sampling, not security
+
+
 class ObservabilityService:
     """Service for managing observability traces, spans, events, and metrics.
 
@@ -320,6 +366,161 @@ class ObservabilityService:
         self._safe_commit(db, "end_trace")
         logger.debug(f"Ended trace {trace_id}: {status} ({duration_ms:.2f}ms)")
 
+    # ==============================
+    # Buffered Traces
+    # ==============================
+
+    def begin_buffered_trace(
+        self,
+        name: str,
+        trace_id: Optional[str] = None,
+        parent_span_id: Optional[str] = None,
+        http_method: Optional[str] = None,
+        http_url: Optional[str] = None,
+        user_email: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        resource_attributes: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Start a trace that is assembled in memory instead of written per call.
+
+        The trace becomes the current buffered trace for this context, so
+        ``start_span``/``end_span``/``add_event``/``record_metric`` calls for it
+        only touch memory. ``finish_buffered_trace`` hands it to the span buffer
+        for a bulk write by the background exporter.
+
+        Args:
+            name: Trace name (e.g., "POST /tools/invoke")
+            trace_id: External trace ID (for distributed tracing, W3C format)
+            parent_span_id: Parent span ID from upstream service
+            http_method: HTTP method (GET, POST, etc.)
+            http_url: Full request URL
+            user_email: Authenticated user email
+            user_agent: Client user agent string
+            ip_address: Client IP address
+            attributes: Additional trace attributes
+            resource_attributes: Resource attributes (service name, version, etc.)
+
+        Returns:
+            Trace ID (UUID string or W3C format)
+
+        Examples:
+            >>> service = ObservabilityService()
+            >>> tid = service.begin_buffered_trace("GET /tools", http_method="GET")
+            >>> sid = service.start_span(None, tid, "work")
+            >>> service.end_span(None, sid, status="ok")
+            >>> buffered = current_buffered_trace.get()
+            >>> (buffered.trace_id == tid, buffered.spans[sid]["status"])
+            (True, 'ok')
+            >>> _ = current_buffered_trace.set(None)
+        """
+        if not trace_id:
+            trace_id = str(uuid.uuid4())
+
+        attrs = attributes or {}
+        if parent_span_id:
+            attrs["parent_span_id"] = parent_span_id
+
+        now = utc_now()
+        buffered = BufferedTrace(
+            trace={
+                "trace_id": trace_id,
+                "name": name,
+                "start_time": now,
+                "end_time": None,
+                "duration_ms": None,
+                "status": "unset",
+                "status_message": None,
+                "http_method": http_method,
+                "http_url": http_url,
+                "http_status_code": None,
+                "user_email": user_email,
+                "user_agent": user_agent,
+                "ip_address": ip_address,
+                "attributes": attrs,
+                "resource_attributes": resource_attributes or {},
+                "created_at": now,
+            }
+        )
+        current_buffered_trace.set(buffered)
+        logger.debug(f"Started buffered trace {trace_id}: {name}")
+        return trace_id
+
+    def finish_buffered_trace(
+        self,
+        trace_id: str,
+        status: str = "ok",
+        status_message: Optional[str] = None,
+        http_status_code: Optional[int] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Complete the current buffered trace and queue it for export.
+
+        Args:
+            trace_id: Trace ID returned by ``begin_buffered_trace``
+            status: Trace status (ok, error)
+            status_message: Optional status message
+            http_status_code: HTTP response status code
+            attributes: Additional attributes to merge
+
+        Returns:
+            True if the trace was queued, False if it was unknown or dropped
+
+        Examples:
+            >>> service = ObservabilityService()
+            >>> service.finish_buffered_trace("missing")
+            False
+        """
+        buffered = self._matching_buffered_trace(trace_id=trace_id)
+        if buffered is None or buffered.closed:
+            logger.warning(f"Buffered trace {trace_id} not found")
+            return False
+
+        trace = buffered.trace
+        end_time = utc_now()
+        trace["end_time"] = end_time
+        trace["duration_ms"] = (end_time - trace["start_time"]).total_seconds() * 1000
+        trace["status"] = status
+        trace["status_message"] = status_message
+        if http_status_code is not None:
+            trace["http_status_code"] = http_status_code
+        if attributes:
+            trace["attributes"] = {**(trace["attributes"] or {}), **attributes}
+
+        # Spans still open (e.g. abandoned by a cancelled task) are exported as-is
+        buffered.closed = True
+        logger.debug(f"Finished buffered trace {trace_id}: {status} ({trace['duration_ms']:.2f}ms, {buffered.span_count} spans)")
+        return get_span_buffer_service().enqueue(buffered)
+
+    @staticmethod
+    def _matching_buffered_trace(trace_id: Optional[str] = None, span_id: Optional[str] = None) -> Optional[BufferedTrace]:
+        """Return the current buffered trace if it owns the given trace or span.
+
+        Callers must check ``closed``: a span or event arriving after its trace
+        was queued is dropped (and counted) rather than written directly, since
+        the trace row may not exist in the database yet.
+
+        Args:
+            trace_id: Trace ID to match
+            span_id: Span ID to match
+
+        Returns:
+            The matching buffered trace, or None if the call should use the database
+
+        Examples:
+            >>> ObservabilityService._matching_buffered_trace(trace_id="t1") is None
+            True
+        """
+        buffered = current_buffered_trace.get()
+        if buffered is None:
+            return None
+        if trace_id is not None and buffered.trace_id != trace_id:
+            return None
+        if span_id is not None and span_id not in buffered.spans:
+            return None
+        return buffered
+
     def get_trace(self, db: Session, trace_id: str, include_spans: bool = False) -> Optional[ObservabilityTrace]:
         """Get a trace by ID.
 
@@ -386,6 +587,32 @@ class ObservabilityService:
             ... )
         """
         span_id = str(uuid.uuid4())
+        buffered = self._matching_buffered_trace(trace_id=trace_id)
+        if buffered is not None:
+            if buffered.closed:
+                get_span_buffer_service().record_late_drop()
+                return span_id
+            now = utc_now()
+            buffered.spans[span_id] = {
+                "span_id": span_id,
+                "trace_id": trace_id,
+                "parent_span_id": parent_span_id,
+                "name": name,
+                "kind": kind,
+                "start_time": now,
+                "end_time": None,
+                "duration_ms": None,
+                "status": "unset",
+                "status_message": None,
+                "resource_name": resource_name,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "attributes": attributes or {},
+                "created_at": now,
+            }
+            logger.debug(f"Started buffered span {span_id}: {name} (trace={trace_id})")
+            return span_id
+
         span = ObservabilitySpan(
             span_id=span_id,
             trace_id=trace_id,
@@ -429,6 +656,23 @@ class ObservabilityService:
         Examples:
             >>> service.end_span(db, span_id, status="ok")  # doctest: +SKIP
         """
+        buffered = self._matching_buffered_trace(span_id=span_id)
+        if buffered is not None:
+            if buffered.closed:
+                get_span_buffer_service().record_late_drop()
+                return
+            span_data = buffered.spans[span_id]
+            end_time = utc_now()
+            duration_ms = (end_time - span_data["start_time"]).total_seconds() * 1000
+            span_data["end_time"] = end_time
+            span_data["duration_ms"] = duration_ms
+            span_data["status"] = status
+            span_data["status_message"] = status_message
+            if attributes:
+                span_data["attributes"] = {**(span_data["attributes"] or {}), **attributes}
+            logger.debug(f"Ended buffered span {span_id}: {status} ({duration_ms:.2f}ms)")
+            return
+
         span = db.query(ObservabilitySpan).filter_by(span_id=span_id).first()
         if not span:
             logger.warning(f"Span {span_id} not found")
@@ -616,6 +860,29 @@ class ObservabilityService:
             ...     message="Failed to connect to database"  # doctest: +SKIP
             ... )  # doctest: +SKIP
         """
+        buffered = self._matching_buffered_trace(span_id=span_id)
+        if buffered is not None:
+            if buffered.closed:
+                get_span_buffer_service().record_late_drop()
+            else:
+                now = utc_now()
+                buffered.events.append(
+                    {
+                        "span_id": span_id,
+                        "name": name,
+                        "timestamp": now,
+                        "severity": severity,
+                        "message": message,
+                        "exception_type": exception_type,
+                        "exception_message": exception_message,
+                        "exception_stacktrace": exception_stacktrace,
+                        "attributes": attributes or {},
+                        "created_at": now,
+                    }
+                )
+            # Buffered events get their ID on insert
+            return 0
+
         event = ObservabilityEvent(
             span_id=span_id,
             name=name,
@@ -690,21 +957,28 @@ class ObservabilityService:
 
         # Store in span attributes if span_id provided
         if span_id:
-            span = db.query(ObservabilitySpan).filter_by(span_id=span_id).first()
-            if span:
-                attrs = span.attributes or {}
-                attrs.update(
-                    {
-                        "llm.model": model,
-                        "llm.provider": provider,
-                        "llm.input_tokens": input_tokens,
-                        "llm.output_tokens": output_tokens,
-                        "llm.total_tokens": total_tokens,
-                        "llm.estimated_cost_usd": estimated_cost_usd,
-                    }
-                )
-                span.attributes = attrs
-                self._safe_commit(db, "record_token_usage")
+            llm_attrs = {
+                "llm.model": model,
+                "llm.provider": provider,
+                "llm.input_tokens": input_tokens,
+                "llm.output_tokens": output_tokens,
+                "llm.total_tokens": total_tokens,
+                "llm.estimated_cost_usd": estimated_cost_usd,
+            }
+            buffered = self._matching_buffered_trace(span_id=span_id)
+            if buffered is not None:
+                if buffered.closed:
+                    get_span_buffer_service().record_late_drop()
+                else:
+                    span_data = buffered.spans[span_id]
+                    span_data["attributes"] = {**(span_data["attributes"] or {}), **llm_attrs}
+            else:
+                span = db.query(ObservabilitySpan).filter_by(span_id=span_id).first()
+                if span:
+                    attrs = span.attributes or {}
+                    attrs.update(llm_attrs)
+                    span.attributes = attrs
+                    self._safe_commit(db, "record_token_usage")
 
         # Also record as metrics for aggregation
         if input_tokens > 0:
@@ -1028,6 +1302,29 @@ class ObservabilityService:
             ...     trace_id=trace_id  # doctest: +SKIP
             ... )  # doctest: +SKIP
         """
+        buffered = self._matching_buffered_trace(trace_id=trace_id) if trace_id else None
+        if buffered is not None:
+            if buffered.closed:
+                get_span_buffer_service().record_late_drop()
+            else:
+                now = utc_now()
+                buffered.metrics.append(
+                    {
+                        "name": name,
+                        "value": value,
+                        "metric_type": metric_type,
+                        "timestamp": now,
+                        "unit": unit,
+                        "resource_type": resource_type,
+                        "resource_id": resource_id,
+                        "trace_id": trace_id,
+                        "attributes": attributes or {},
+                        "created_at": now,
+                    }
+                )
+            # Buffered metrics get their ID on insert
+            return 0
+
         metric = ObservabilityMetric(
             name=name,
             value=value,
@@ -20,6 +20,7 @@ from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import contains_eager, Session
 
 # First-Party
+from mcpgateway.cache.permission_cache import decision_scope, permission_cache
 from mcpgateway.config import settings
 from mcpgateway.db import PermissionAuditLog, Permissions, Role, UserRole, utc_now
 
@@ -114,9 +115,21 @@ class PermissionService:
             >>> asyncio.iscoroutinefunction(service.check_permission)
             True
         """
+        # Decisions are shared across requests through the process-wide cache.
+        # Audited checks always go to the database so every check is logged.
+        use_cache = permission_cache.enabled and not self.audit_enabled
+        if use_cache:
+            scope = decision_scope(team_id, check_any_team)
+            cached = await permission_cache.get(user_email, permission, scope, allow_admin_bypass)
+            if cached is not None:
+                return cached
+            generation = permission_cache.generation
+
         try:
             # Check if user is admin (bypass all permission checks if allowed)
             if allow_admin_bypass and await self._is_user_admin(user_email):
+                if use_cache:
+                    await permission_cache.set(user_email, permission, scope, allow_admin_bypass, True, generation=generation)
                 return True
 
             # Get user's effective permissions (uses cache when valid)
@@ -151,6 +164,9 @@ class PermissionService:
 
             logger.debug(f"Permission check: user={user_email}, permission={permission}, team={team_id}, granted={granted}")
 
+            if use_cache:
+                await permission_cache.set(user_email, permission, scope, allow_admin_bypass, granted, generation=generation)
+
             return granted
 
         except Exception as e:
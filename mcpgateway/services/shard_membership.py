@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""Consistent-hash sharding of gateway health checks across live instances.
+
+By default one leader (elected through Redis or a file lock) runs every
+gateway health check and auto-refresh while the other workers sit idle.
+With ``HEALTH_CHECK_SHARDING_ENABLED``, every worker takes part instead:
+
+- Each worker heartbeats its instance ID into a shared membership list. The
+  list is a Redis sorted set across hosts and replicas, or a directory of
+  heartbeat files when Redis is not configured (several workers on one
+  host).
+- Members whose heartbeat is older than ``HEALTH_CHECK_SHARD_TTL`` seconds
+  are dropped.
+- Gateways are assigned to members with a consistent-hash ring. When an
+  instance joins or leaves, only about 1/N of the gateways change owner.
+- Each worker checks and refreshes only the gateways it owns.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+import bisect
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MEMBERS_KEY = "mcpgw:health:members"
+
+
+def _hash(value: str) -> int:
+    """Return a stable 64-bit hash (Python's ``hash`` is salted per process).
+
+    Args:
+        value: String to hash.
+
+    Returns:
+        int: Hash value.
+
+    Examples:
+        >>> _hash("gw-1") == _hash("gw-1")
+        True
+    """
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent-hash ring with virtual nodes.
+
+    Examples:
+        >>> ring = HashRing(["a", "b", "c"])
+        >>> owners = [ring.owner(f"gw-{i}") for i in range(3000)]
+        >>> sorted(set(owners))
+        ['a', 'b', 'c']
+        >>> all(800 < owners.count(m) < 1200 for m in "abc")
+        True
+        >>> grown = HashRing(["a", "b", "c", "d"])
+        >>> moved = sum(owners[i] != grown.owner(f"gw-{i}") for i in range(3000))
+        >>> moved < 1000  # only keys taken over by the new member move
+        True
+        >>> HashRing([]).owner("gw-1") is None
+        True
+    """
+
+    def __init__(self, members: Iterable[str], replicas: int = 64) -> None:
+        """Build the ring.
+
+        Args:
+            members: Instance IDs.
+            replicas: Virtual nodes per member (more = more even spread).
+        """
+        points: List[Tuple[int, str]] = sorted((_hash(f"{member}#{i}"), member) for member in set(members) for i in range(replicas))
+        self._keys = [point for point, _ in points]
+        self._members = [member for _, member in points]
+
+    def owner(self, key: str) -> Optional[str]:
+        """Return the member owning ``key``.
+
+        Args:
+            key: Key to place (gateway ID).
+
+        Returns:
+            Optional[str]: Owning member, or None for an empty ring.
+        """
+        if not self._keys:
+            return None
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._members[index]
+
+
+class ShardMembership:
+    """Heartbeat-based membership of one instance, plus gateway ownership.
+
+    Examples:
+        >>> import asyncio, tempfile
+        >>> directory = tempfile.mkdtemp()
+        >>> a = ShardMembership("a", ttl=30, directory=directory)
+        >>> b = ShardMembership("b", ttl=30, directory=directory)
+        >>> asyncio.run(a.heartbeat()), asyncio.run(b.heartbeat()), asyncio.run(a.heartbeat())  # a alone, then b joins
+        (False, True, True)
+        >>> a.members
+        ('a', 'b')
+        >>> sum(a.owns(f"gw-{i}") for i in range(100)) + sum(b.owns(f"gw-{i}") for i in range(100))
+        100
+        >>> asyncio.run(b.leave()); asyncio.run(a.heartbeat())
+        True
+        >>> a.members, a.owns("gw-1")
+        (('a',), True)
+    """
+
+    def __init__(self, instance_id: str, ttl: float, redis_client: Optional[Any] = None, directory: Optional[str] = None) -> None:
+        """Create membership for this instance (call :meth:`heartbeat` to join).
+
+        Args:
+            instance_id: Unique ID of this worker.
+            ttl: Seconds after which a member without heartbeat is considered gone.
+            redis_client: Async Redis client (shared membership across hosts).
+            directory: Heartbeat file directory (used when ``redis_client`` is None).
+
+        Raises:
+            ValueError: If neither ``redis_client`` nor ``directory`` is given.
+        """
+        if redis_client is None and directory is None:
+            raise ValueError("ShardMembership needs a Redis client or a directory")
+        self.instance_id = instance_id
+        self.ttl = ttl
+        self._redis = redis_client
+        self._directory = directory
+        self.members: Tuple[str, ...] = (instance_id,)
+        self._ring = HashRing(self.members)
+        self.rebalances = 0
+
+    def owns(self, key: str) -> bool:
+        """Return True if this instance owns ``key``.
+
+        Args:
+            key: Gateway ID.
+
+        Returns:
+            bool: Ownership.
+        """
+        return self._ring.owner(key) == self.instance_id
+
+    async def heartbeat(self) -> bool:
+        """Refresh this instance's heartbeat and reload the live members.
+
+        Returns:
+            bool: True if the membership changed (gateways were rebalanced).
+        """
+        try:
+            if self._redis is not None:
+                members = await self._redis_heartbeat()
+            else:
+                members = await asyncio.to_thread(self._file_heartbeat)
+        except Exception as e:
+            logger.warning(f"Health check shard heartbeat failed, keeping {len(self.members)} known member(s): {e}")
+            return False
+        members = tuple(sorted(set(members) | {self.instance_id}))
+        if members == self.members:
+            return False
+        logger.info(f"Health check shards rebalanced: {len(self.members)} -> {len(members)} instance(s)")
+        self.members = members
+        self._ring = HashRing(members)
+        self.rebalances += 1
+        return True
+
+    async def _redis_heartbeat(self) -> List[str]:
+        """Heartbeat into the Redis sorted set (score = last heartbeat time).
+
+        Returns:
+            List[str]: Live members.
+        """
+        now = time.time()
+        pipe = self._redis.pipeline()
+        pipe.zadd(MEMBERS_KEY, {self.instance_id: now})
+        pipe.zremrangebyscore(MEMBERS_KEY, "-inf", now - self.ttl)
+        pipe.zrange(MEMBERS_KEY, 0, -1)
+        results = await pipe.execute()
+        return [m.decode() if isinstance(m, bytes) else m for m in results[-1]]
+
+    def _file_heartbeat(self) -> List[str]:
+        """Heartbeat by touching this instance's file; runs in a worker thread.
+
+        Returns:
+            List[str]: Live members.
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        with open(os.path.join(self._directory, self.instance_id), "w", encoding="utf-8"):
+            pass
+        cutoff = time.time() - self.ttl
+        members = []
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime >= cutoff:
+                        members.append(entry.name)
+                    else:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    continue  # removed by another worker
+        return members
+
+    async def leave(self) -> None:
+        """Remove this instance so the others take over its gateways at their next heartbeat."""
+        try:
+            if self._redis is not None:
+                await self._redis.zrem(MEMBERS_KEY, self.instance_id)
+            else:
+                await asyncio.to_thread(os.remove, os.path.join(self._directory, self.instance_id))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Failed to leave health check shard membership: {e}")
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""Buffered span exporter for the built-in observability tables.
+
+Traces recorded by the observability middleware are assembled in memory
+(trace row, spans, events and metrics) and handed to this service once the
+request completes. A background task drains the bounded queue and writes each
+batch with bulk inserts in a worker thread, so tracing no longer adds
+synchronous database round trips to every request and plugin hook.
+
+When the queue is full new traces are dropped (and counted) rather than
+applying back-pressure to request handling.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+import threading
+from typing import Any, Deque, Dict, List, Optional
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import fresh_db_session, ObservabilityEvent, ObservabilityMetric, ObservabilitySpan, ObservabilityTrace
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BufferedTrace:
+    """A trace assembled in memory until it is complete.
+
+    Spans are kept in insertion order so parents are always written before
+    their children (``observability_spans.parent_span_id`` is a foreign key).
+
+    Examples:
+        >>> bt = BufferedTrace(trace={"trace_id": "t1", "name": "GET /"})
+        >>> bt.trace_id
+        't1'
+        >>> bt.span_count
+        0
+    """
+
+    trace: Dict[str, Any]
+    spans: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    metrics: List[Dict[str, Any]] = field(default_factory=list)
+    closed: bool = False
+
+    @property
+    def trace_id(self) -> str:
+        """Return the trace identifier.
+
+        Returns:
+            str: Trace ID of the buffered trace.
+        """
+        return self.trace["trace_id"]
+
+    @property
+    def span_count(self) -> int:
+        """Return the number of spans recorded so far.
+
+        Returns:
+            int: Number of spans in the trace.
+        """
+        return len(self.spans)
+
+
+class SpanBufferService:
+    """Bounded queue of completed traces flushed to the database in bulk.
+
+    Configuration (via environment variables):
+    - OBSERVABILITY_BUFFER_ENABLED: Buffer traces instead of writing per call (default: True)
+    - OBSERVABILITY_BUFFER_MAX_SIZE: Max queued traces before new ones are dropped (default: 10000)
+    - OBSERVABILITY_BUFFER_FLUSH_INTERVAL: Seconds between flushes (default: 2.0)
+    - OBSERVABILITY_BUFFER_BATCH_SIZE: Max traces written per transaction (default: 500)
+
+    Examples:
+        >>> svc = SpanBufferService(max_queue_size=1, enabled=True)
+        >>> svc.enqueue(BufferedTrace(trace={"trace_id": "a"}))
+        True
+        >>> svc.enqueue(BufferedTrace(trace={"trace_id": "b"}))
+        False
+        >>> stats = svc.get_stats()
+        >>> (stats["queue_depth"], stats["total_enqueued"], stats["dropped_queue_full"])
+        (1, 1, 1)
+    """
+
+    def __init__(
+        self,
+        max_queue_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """Initialize the span buffer service.
+
+        Args:
+            max_queue_size: Maximum queued traces (default: from settings or 10000)
+            flush_interval: Seconds between automatic flushes (default: from settings or 2.0)
+            batch_size: Maximum traces per bulk write (default: from settings or 500)
+            enabled: Whether buffering is enabled (default: from settings or True)
+        """
+        self.max_queue_size = max_queue_size or getattr(settings, "observability_buffer_max_size", 10000)
+        self.flush_interval = flush_interval or getattr(settings, "observability_buffer_flush_interval", 2.0)
+        self.batch_size = batch_size or getattr(settings, "observability_buffer_batch_size", 500)
+        self.enabled = enabled if enabled is not None else getattr(settings, "observability_buffer_enabled", True)
+
+        self._queue: Deque[BufferedTrace] = deque()
+        self._lock = threading.Lock()
+
+        # Background flush task; the wakeup event lets a full batch flush early
+        self._flush_task: Optional[asyncio.Task] = None
+        self._shutdown_event = asyncio.Event()
+        self._wakeup_event = asyncio.Event()
+
+        # Stats for monitoring
+        self._total_enqueued = 0
+        self._total_flushed = 0
+        self._total_spans_flushed = 0
+        self._flush_count = 0
+        self._flush_failures = 0
+        self._dropped_queue_full = 0
+        self._dropped_flush_error = 0
+        self._dropped_late = 0
+        self._sampled_out = 0
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if not self.enabled:
+            logger.info("SpanBufferService disabled, skipping start")
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._shutdown_event.clear()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(f"SpanBufferService flush task started (interval={self.flush_interval}s, max_queue_size={self.max_queue_size}, batch_size={self.batch_size})")
+
+    async def shutdown(self) -> None:
+        """Shutdown service with final flush."""
+        logger.info("SpanBufferService shutting down...")
+        self._shutdown_event.set()
+
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+
+        await self.flush()
+
+        logger.info(
+            f"SpanBufferService shutdown complete: total_enqueued={self._total_enqueued}, total_flushed={self._total_flushed}, "
+            f"dropped_queue_full={self._dropped_queue_full}, dropped_flush_error={self._dropped_flush_error}"
+        )
+
+    def enqueue(self, buffered: BufferedTrace) -> bool:
+        """Queue a completed trace for the next flush.
+
+        Args:
+            buffered: The completed trace with its spans, events and metrics.
+
+        Returns:
+            bool: True if queued, False if dropped because the queue is full.
+        """
+        with self._lock:
+            if len(self._queue) >= self.max_queue_size:
+                self._dropped_queue_full += 1
+                dropped = True
+            else:
+                self._queue.append(buffered)
+                self._total_enqueued += 1
+                dropped = False
+            depth = len(self._queue)
+
+        if dropped:
+            logger.debug(f"Span buffer full ({self.max_queue_size}), dropping trace {buffered.trace_id}")
+            return False
+
+        if depth >= self.batch_size:
+            self._wakeup_event.set()
+        return True
+
+    def record_sampled_out(self) -> None:
+        """Count a request that was not traced because of head-based sampling."""
+        self._sampled_out += 1
+
+    def record_late_drop(self) -> None:
+        """Count a span or event that arrived after its trace was already queued."""
+        self._dropped_late += 1
+
+    async def _flush_loop(self) -> None:
+        """Background task that periodically flushes queued traces.
+
+        Raises:
+            asyncio.CancelledError: When the flush loop is cancelled.
+        """
+        while not self._shutdown_event.is_set():
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup_event.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup_event.clear()
+
+                await self.flush()
+
+            except asyncio.CancelledError:
+                logger.debug("Span flush loop cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Error in span flush loop: {e}", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def flush(self) -> int:
+        """Drain the queue in batches, writing each batch in a worker thread.
+
+        Returns:
+            int: Number of traces written.
+        """
+        written = 0
+        while True:
+            with self._lock:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            if not batch:
+                return written
+
+            if await asyncio.to_thread(self._flush_to_db, batch):
+                written += len(batch)
+                self._total_flushed += len(batch)
+                self._total_spans_flushed += sum(b.span_count for b in batch)
+                self._flush_count += 1
+            else:
+                self._flush_failures += 1
+                self._dropped_flush_error += len(batch)
+
+    def _flush_to_db(self, batch: List[BufferedTrace]) -> bool:
+        """Bulk insert a batch of traces (runs in thread).
+
+        Traces are written before spans, and spans before events and metrics,
+        so foreign keys are satisfied within one transaction.
+
+        Args:
+            batch: Completed traces to persist.
+
+        Returns:
+            bool: True on success, False if the batch was discarded.
+        """
+        traces = [b.trace for b in batch]
+        spans = [span for b in batch for span in b.spans.values()]
+        events = [event for b in batch for event in b.events]
+        metrics = [metric for b in batch for metric in b.metrics]
+
+        try:
+            with fresh_db_session() as db:
+                db.bulk_insert_mappings(ObservabilityTrace, traces)
+                if spans:
+                    db.bulk_insert_mappings(ObservabilitySpan, spans)
+                if events:
+                    db.bulk_insert_mappings(ObservabilityEvent, events)
+                if metrics:
+                    db.bulk_insert_mappings(ObservabilityMetric, metrics)
+                db.commit()
+            logger.debug(f"Flushed {len(traces)} traces, {len(spans)} spans, {len(events)} events, {len(metrics)} metrics")
+            return True
+        except Exception as e:
+            # Traces are lost on failure - acceptable trade-off, surfaced via dropped_flush_error
+            logger.error(f"Failed to flush {len(traces)} observability traces: {e}", exc_info=True)
+            return False
+
+    def get_stats(self) -> dict:
+        """Get buffer statistics for monitoring.
+
+        Returns:
+            dict: Queue depth, throughput and drop counters.
+        """
+        with self._lock:
+            depth = len(self._queue)
+
+        return {
+            "enabled": self.enabled,
+            "max_queue_size": self.max_queue_size,
+            "flush_interval": self.flush_interval,
+            "batch_size": self.batch_size,
+            "queue_depth": depth,
+            "total_enqueued": self._total_enqueued,
+            "total_flushed": self._total_flushed,
+            "total_spans_flushed": self._total_spans_flushed,
+            "flush_count": self._flush_count,
+            "flush_failures": self._flush_failures,
+            "dropped_queue_full": self._dropped_queue_full,
+            "dropped_flush_error": self._dropped_flush_error,
+            "dropped_late": self._dropped_late,
+            "sampled_out": self._sampled_out,
+        }
+
+
+# Singleton instance
+_span_buffer_service: Optional[SpanBufferService] = None
+
+
+def get_span_buffer_service() -> SpanBufferService:
+    """Get or create the singleton SpanBufferService instance.
+
+    Returns:
+        SpanBufferService: The singleton span buffer service instance.
+    """
+    global _span_buffer_service  # pylint: disable=global-statement
+    if _span_buffer_service is None:
+        _span_buffer_service = SpanBufferService()
+    return _span_buffer_service
@@ -21,6 +21,7 @@ from typing import Any, Dict, List, Optional, Union
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import fresh_db_session, StructuredLogEntry
+from mcpgateway.services.log_write_buffer_service import get_log_write_buffer_service
 from mcpgateway.services.performance_tracker import get_performance_tracker
 from mcpgateway.utils.correlation_id import get_correlation_id
 
@@ -195,105 +196,110 @@ class LogRouter:
     def _persist_to_database(self, entry: Dict[str, Any]) -> None:
         """Persist log entry to database.
 
-        Always uses a fresh, independent database session to avoid accidentally
+        The row is queued on the shared log buffer and inserted in a batch by
+        its flush task. When buffering is not running it is written here with
+        a fresh, independent database session, to avoid accidentally
         committing unrelated pending objects from the caller's session.
 
         Args:
             entry: Log entry
         """
         try:
-            with fresh_db_session() as log_db:
-                # Build error_details JSON from error-related fields
-                error_details = None
-                if any([entry.get("error_type"), entry.get("error_message"), entry.get("error_stack_trace"), entry.get("error_context")]):
-                    error_details = {
-                        "error_type": entry.get("error_type"),
-                        "error_message": entry.get("error_message"),
-                        "error_stack_trace": entry.get("error_stack_trace"),
-                        "error_context": entry.get("error_context"),
-                    }
-
-                # Build performance_metrics JSON from performance-related fields
-                performance_metrics = None
-                perf_fields = {
-                    "database_query_count": entry.get("database_query_count"),
-                    "database_query_duration_ms": entry.get("database_query_duration_ms"),
-                    "cache_hits": entry.get("cache_hits"),
-                    "cache_misses": entry.get("cache_misses"),
-                    "external_api_calls": entry.get("external_api_calls"),
-                    "external_api_duration_ms": entry.get("external_api_duration_ms"),
-                    "memory_usage_mb": entry.get("memory_usage_mb"),
-                    "cpu_usage_percent": entry.get("cpu_usage_percent"),
-                }
-                if any(v is not None for v in perf_fields.values()):
-                    performance_metrics = {k: v for k, v in perf_fields.items() if v is not None}
-
-                # Build threat_indicators JSON from security-related fields
-                threat_indicators = None
-                security_fields = {
-                    "security_event_type": entry.get("security_event_type"),
-                    "security_threat_score": entry.get("security_threat_score"),
-                    "security_action_taken": entry.get("security_action_taken"),
+            # Build error_details JSON from error-related fields
+            error_details = None
+            if any([entry.get("error_type"), entry.get("error_message"), entry.get("error_stack_trace"), entry.get("error_context")]):
+                error_details = {
+                    "error_type": entry.get("error_type"),
+                    "error_message": entry.get("error_message"),
+                    "error_stack_trace": entry.get("error_stack_trace"),
+                    "error_context": entry.get("error_context"),
                 }
-                if any(v is not None for v in security_fields.values()):
-                    threat_indicators = {k: v for k, v in security_fields.items() if v is not None}
-
-                # Build context JSON from remaining fields
-                context_fields = {
-                    "team_id": entry.get("team_id"),
-                    "request_query": entry.get("request_query"),
-                    "request_headers": entry.get("request_headers"),
-                    "request_body_size": entry.get("request_body_size"),
-                    "response_status_code": entry.get("response_status_code"),
-                    "response_body_size": entry.get("response_body_size"),
-                    "response_headers": entry.get("response_headers"),
-                    "business_event_type": entry.get("business_event_type"),
-                    "business_entity_type": entry.get("business_entity_type"),
-                    "business_entity_id": entry.get("business_entity_id"),
-                    "resource_type": entry.get("resource_type"),
-                    "resource_id": entry.get("resource_id"),
-                    "resource_action": entry.get("resource_action"),
-                    "category": entry.get("category"),
-                    "custom_fields": entry.get("custom_fields"),
-                    "tags": entry.get("tags"),
-                    "metadata": entry.get("metadata"),
-                }
-                context = {k: v for k, v in context_fields.items() if v is not None}
-
-                # Determine if this is a security event
-                is_security_event = entry.get("is_security_event", False) or bool(threat_indicators)
-                security_severity = entry.get("security_severity")
-
-                log_entry = StructuredLogEntry(
-                    timestamp=entry.get("timestamp", datetime.now(timezone.utc)),
-                    level=entry.get("level", "INFO"),
-                    component=entry.get("component"),
-                    message=entry.get("message", ""),
-                    correlation_id=entry.get("correlation_id"),
-                    request_id=entry.get("request_id"),
-                    trace_id=entry.get("trace_id"),
-                    span_id=entry.get("span_id"),
-                    user_id=entry.get("user_id"),
-                    user_email=entry.get("user_email"),
-                    client_ip=entry.get("client_ip"),
-                    user_agent=entry.get("user_agent"),
-                    request_method=entry.get("request_method"),
-                    request_path=entry.get("request_path"),
-                    duration_ms=entry.get("duration_ms"),
-                    operation_type=entry.get("operation_type"),
-                    is_security_event=is_security_event,
-                    security_severity=security_severity,
-                    threat_indicators=threat_indicators,
-                    context=context if context else None,
-                    error_details=error_details,
-                    performance_metrics=performance_metrics,
-                    hostname=entry.get("hostname"),
-                    process_id=entry.get("process_id"),
-                    thread_id=entry.get("thread_id"),
-                    environment=entry.get("environment", getattr(settings, "environment", "development")),
-                    version=entry.get("version", getattr(settings, "version", "unknown")),
-                )
 
+            # Build performance_metrics JSON from performance-related fields
+            performance_metrics = None
+            perf_fields = {
+                "database_query_count": entry.get("database_query_count"),
+                "database_query_duration_ms": entry.get("database_query_duration_ms"),
+                "cache_hits": entry.get("cache_hits"),
+                "cache_misses": entry.get("cache_misses"),
+                "external_api_calls": entry.get("external_api_calls"),
+                "external_api_duration_ms": entry.get("external_api_duration_ms"),
+                "memory_usage_mb": entry.get("memory_usage_mb"),
+                "cpu_usage_percent": entry.get("cpu_usage_percent"),
+            }
+            if any(v is not None for v in perf_fields.values()):
+                performance_metrics = {k: v for k, v in perf_fields.items() if v is not None}
+
+            # Build threat_indicators JSON from security-related fields
+            threat_indicators = None
+            security_fields = {
+                "security_event_type": entry.get("security_event_type"),
+                "security_threat_score": entry.get("security_threat_score"),
+                "security_action_taken": entry.get("security_action_taken"),
+            }
+            if any(v is not None for v in security_fields.values()):
+                threat_indicators = {k: v for k, v in security_fields.items() if v is not None}
+
+            # Build context JSON from remaining fields
+            context_fields = {
+                "team_id": entry.get("team_id"),
+                "request_query": entry.get("request_query"),
+                "request_headers": entry.get("request_headers"),
+                "request_body_size": entry.get("request_body_size"),
+                "response_status_code": entry.get("response_status_code"),
+                "response_body_size": entry.get("response_body_size"),
+                "response_headers": entry.get("response_headers"),
+                "business_event_type": entry.get("business_event_type"),
+                "business_entity_type": entry.get("business_entity_type"),
+                "business_entity_id": entry.get("business_entity_id"),
+                "resource_type": entry.get("resource_type"),
+                "resource_id": entry.get("resource_id"),
+                "resource_action": entry.get("resource_action"),
+                "category": entry.get("category"),
+                "custom_fields": entry.get("custom_fields"),
+                "tags": entry.get("tags"),
+                "metadata": entry.get("metadata"),
+            }
+            context = {k: v for k, v in context_fields.items() if v is not None}
+
+            # Determine if this is a security event
+            is_security_event = entry.get("is_security_event", False) or bool(threat_indicators)
+            security_severity = entry.get("security_severity")
+
+            log_entry = StructuredLogEntry(
+                timestamp=entry.get("timestamp", datetime.now(timezone.utc)),
+                level=entry.get("level", "INFO"),
+                component=entry.get("component"),
+                message=entry.get("message", ""),
+                correlation_id=entry.get("correlation_id"),
+                request_id=entry.get("request_id"),
+                trace_id=entry.get("trace_id"),
+                span_id=entry.get("span_id"),
+                user_id=entry.get("user_id"),
+                user_email=entry.get("user_email"),
+                client_ip=entry.get("client_ip"),
+                user_agent=entry.get("user_agent"),
+                request_method=entry.get("request_method"),
+                request_path=entry.get("request_path"),
+                duration_ms=entry.get("duration_ms"),
+                operation_type=entry.get("operation_type"),
+                is_security_event=is_security_event,
+                security_severity=security_severity,
+                threat_indicators=threat_indicators,
+                context=context if context else None,
+                error_details=error_details,
+                performance_metrics=performance_metrics,
+                hostname=entry.get("hostname"),
+                process_id=entry.get("process_id"),
+                thread_id=entry.get("thread_id"),
+                environment=entry.get("environment", getattr(settings, "environment", "development")),
+                version=entry.get("version", getattr(settings, "version", "unknown")),
+            )
+
+            # Hand the row to the batching writer; write it here when buffering is not running
+            if get_log_write_buffer_service().enqueue(log_entry):
+                return
+            with fresh_db_session() as log_db:
                 log_db.add(log_entry)
 
         except Exception as e:
@@ -35,6 +35,7 @@ from sqlalchemy import case, func, literal, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.db import (
     A2AAgent,
     A2AAgentMetric,
@@ -61,6 +62,7 @@ from mcpgateway.db import (
     SSOProvider,
     TokenRevocation,
     TokenUsageLog,
+    TokenUsageRollup,
     Tool,
     ToolMetric,
 )
@@ -354,6 +356,12 @@ class SystemStatsService:
             >>> # assert stats["total"] >= 0
             >>> # assert "tool_metrics" in stats["breakdown"]
         """
+        # With rollups enabled token_usage_logs may hold only a sample of the requests; count them from the rollups
+        if settings.token_usage_rollup_enabled:
+            token_usage = select(literal("token_usage_logs").label("type"), func.coalesce(func.sum(TokenUsageRollup.request_count), 0).label("cnt")).select_from(TokenUsageRollup)
+        else:
+            token_usage = select(literal("token_usage_logs").label("type"), func.count(TokenUsageLog.id).label("cnt")).select_from(TokenUsageLog)
+
         # Optimized from 6 queries to 1 using UNION ALL (separate tables need separate selects)
         stmt = (
             select(literal("tool_metrics").label("type"), func.count(ToolMetric.id).label("cnt"))
@@ -363,7 +371,7 @@ class SystemStatsService:
                 select(literal("prompt_metrics").label("type"), func.count(PromptMetric.id).label("cnt")).select_from(PromptMetric),
                 select(literal("server_metrics").label("type"), func.count(ServerMetric.id).label("cnt")).select_from(ServerMetric),
                 select(literal("a2a_agent_metrics").label("type"), func.count(A2AAgentMetric.id).label("cnt")).select_from(A2AAgentMetric),
-                select(literal("token_usage_logs").label("type"), func.count(TokenUsageLog.id).label("cnt")).select_from(TokenUsageLog),
+                token_usage,
             )
         )
         results = db.execute(stmt).all()
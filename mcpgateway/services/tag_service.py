@@ -11,27 +11,41 @@ It handles:
 - Filtering tags by entity type
 - Tag statistics and counts
 - Retrieving entities that have specific tags
+
+All queries run against the normalized ``entity_tags`` index table, which is
+kept in sync with the entities' ``tags`` JSON columns (see ``mcpgateway.db``),
+so tag listings are a ``GROUP BY`` and tag lookups an indexed join.
 """
 
 # Standard
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 # Third-Party
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.db import EntityTag
 from mcpgateway.db import Gateway as DbGateway
 from mcpgateway.db import Prompt as DbPrompt
 from mcpgateway.db import Resource as DbResource
 from mcpgateway.db import Server as DbServer
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.schemas import TaggedEntity, TagInfo, TagStats
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr
 
 logger = logging.getLogger(__name__)
 
+# Entity types (``entity_tags.entity_type`` values) and their models
+ENTITY_MODELS = {
+    "tools": DbTool,
+    "resources": DbResource,
+    "prompts": DbPrompt,
+    "servers": DbServer,
+    "gateways": DbGateway,
+}
+
 # Cache import (lazy to avoid circular dependencies)
 _ADMIN_STATS_CACHE = None
 
@@ -97,14 +111,14 @@ class TagService:
 
         Example:
             >>> import asyncio
-            >>> from unittest.mock import MagicMock, AsyncMock
+            >>> from unittest.mock import MagicMock
             >>>
             >>> # Create service and mock database
             >>> service = TagService()
             >>> mock_db = MagicMock()
             >>>
             >>> # Mock empty result
-            >>> mock_db.execute.return_value.__iter__ = lambda self: iter([])
+            >>> mock_db.execute.return_value = iter([])
             >>>
             >>> # Test with empty database
             >>> async def test_empty():
@@ -113,27 +127,18 @@ class TagService:
             >>> asyncio.run(test_empty())
             0
 
-            >>> # Mock result with tag data
-            >>> mock_result = MagicMock()
-            >>> mock_result.__iter__ = lambda self: iter([
-            ...     (["api", "database"],),
-            ...     (["api", "web"],),
-            ... ])
-            >>> mock_db.execute.return_value = mock_result
-            >>>
-            >>> # Test with tag data
+            >>> # Mock GROUP BY rows: (tag, entity_type, count)
+            >>> mock_db.execute.return_value = iter([("api", "tools", 2), ("api", "servers", 1), ("web", "tools", 1)])
             >>> async def test_with_tags():
-            ...     tags = await service.get_all_tags(mock_db, entity_types=["tools"])
-            ...     return len(tags) >= 2  # Should have at least api, database, web tags
+            ...     tags = await service.get_all_tags(mock_db, entity_types=["tools", "servers"])
+            ...     return [(t.name, t.stats.tools, t.stats.servers, t.stats.total) for t in tags]
             >>> asyncio.run(test_with_tags())
-            True
+            [('api', 2, 1, 3), ('web', 1, 0, 1)]
 
-            >>> # include_entities=True path
+            >>> # include_entities=True path: (tag, entity) rows
             >>> from types import SimpleNamespace
-            >>> entity = SimpleNamespace(id='1', name='E', description='d', tags=['api'])
-            >>> mock_result2 = MagicMock()
-            >>> mock_result2.scalars.return_value = [entity]
-            >>> mock_db.execute.return_value = mock_result2
+            >>> entity = SimpleNamespace(id='1', name='E', description='d')
+            >>> mock_db.execute.return_value = iter([("api", entity)])
             >>> async def test_with_entities():
             ...     tags = await service.get_all_tags(mock_db, entity_types=["tools"], include_entities=True)
             ...     return len(tags) == 1 and tags[0].entities[0].name == 'E'
@@ -158,82 +163,28 @@ class TagService:
 
         tag_data: Dict[str, Dict] = {}
 
-        # Define entity type mapping
-        entity_map = {
-            "tools": DbTool,
-            "resources": DbResource,
-            "prompts": DbPrompt,
-            "servers": DbServer,
-            "gateways": DbGateway,
-        }
-
         # If no entity types specified, use all
         if entity_types is None:
-            entity_types = list(entity_map.keys())
-
-        # Collect tags from each requested entity type
-        for entity_type in entity_types:
-            if entity_type not in entity_map:
-                continue
-
-            model = entity_map[entity_type]
-
-            # Query all entities with tags from this entity type
-            if include_entities:
-                # Get full entity details
-                stmt = select(model).where(model.tags.isnot(None))
-                result = db.execute(stmt)
-
-                for entity in result.scalars():
-                    tags = entity.tags if entity.tags else []
-                    for raw_tag in tags:
-                        tag = self._get_tag_id(raw_tag)
-                        if tag not in tag_data:
-                            tag_data[tag] = {"stats": TagStats(tools=0, resources=0, prompts=0, servers=0, gateways=0, total=0), "entities": []}
-
-                        # Create TaggedEntity
-                        # Determine the ID
-                        if hasattr(entity, "id") and entity.id is not None:
-                            entity_id = str(entity.id)
-                        elif entity_type == "resources" and hasattr(entity, "uri"):
-                            entity_id = str(entity.uri)
-                        else:
-                            entity_id = str(entity.name if hasattr(entity, "name") and entity.name else "unknown")
-
-                        # Determine the name
-                        if hasattr(entity, "name") and entity.name:
-                            entity_name = entity.name
-                        elif hasattr(entity, "original_name") and entity.original_name:
-                            entity_name = entity.original_name
-                        elif hasattr(entity, "uri"):
-                            entity_name = str(entity.uri)
-                        else:
-                            entity_name = entity_id
-
-                        entity_info = TaggedEntity(
-                            id=entity_id,
-                            name=entity_name,
-                            type=entity_type[:-1],  # Remove plural 's'
-                            description=entity.description if hasattr(entity, "description") else None,
-                        )
-                        tag_data[tag]["entities"].append(entity_info)
-
-                        # Update stats
-                        self._update_stats(tag_data[tag]["stats"], entity_type)
-            else:
-                # Just get tags without entity details
-                stmt = select(model.tags).where(model.tags.isnot(None))
-                result = db.execute(stmt)
-
-                for row in result:
-                    tags = row[0] if row[0] else []
-                    for raw_tag in tags:
-                        tag = self._get_tag_id(raw_tag)
-                        if tag not in tag_data:
-                            tag_data[tag] = {"stats": TagStats(tools=0, resources=0, prompts=0, servers=0, gateways=0, total=0), "entities": []}
-
-                        # Update stats
-                        self._update_stats(tag_data[tag]["stats"], entity_type)
+            entity_types = list(ENTITY_MODELS.keys())
+        entity_types = [entity_type for entity_type in entity_types if entity_type in ENTITY_MODELS]
+
+        if include_entities:
+            # Join the index to each entity table to get full entity details
+            for entity_type in entity_types:
+                model = ENTITY_MODELS[entity_type]
+                stmt = select(EntityTag.tag, model).join(model, model.id == EntityTag.entity_id).where(EntityTag.entity_type == entity_type)
+                for tag, entity in db.execute(stmt):
+                    if tag not in tag_data:
+                        tag_data[tag] = {"stats": TagStats(tools=0, resources=0, prompts=0, servers=0, gateways=0, total=0), "entities": []}
+                    tag_data[tag]["entities"].append(self._tagged_entity(entity, entity_type))
+                    self._update_stats(tag_data[tag]["stats"], entity_type)
+        elif entity_types:
+            # Just count tags per entity type, in the database
+            stmt = select(EntityTag.tag, EntityTag.entity_type, func.count()).where(EntityTag.entity_type.in_(entity_types)).group_by(EntityTag.tag, EntityTag.entity_type)
+            for tag, entity_type, count in db.execute(stmt):
+                if tag not in tag_data:
+                    tag_data[tag] = {"stats": TagStats(tools=0, resources=0, prompts=0, servers=0, gateways=0, total=0), "entities": []}
+                self._update_stats(tag_data[tag]["stats"], entity_type, count)
 
         # Convert to TagInfo list
         tags = [TagInfo(name=tag, stats=data["stats"], entities=data["entities"] if include_entities else []) for tag, data in sorted(tag_data.items())]
@@ -245,7 +196,7 @@ class TagService:
 
         return tags
 
-    def _update_stats(self, stats: TagStats, entity_type: str) -> None:
+    def _update_stats(self, stats: TagStats, entity_type: str, count: int = 1) -> None:
         """Update statistics for a specific entity type.
 
         This helper method increments the appropriate counter in the TagStats object
@@ -255,6 +206,7 @@ class TagService:
             stats: TagStats object to update with new counts
             entity_type: Type of entity to increment count for. Must be one of:
                         'tools', 'resources', 'prompts', 'servers', 'gateways'
+            count: Number of entities to add
 
         Example:
             >>> from mcpgateway.schemas import TagStats
@@ -269,52 +221,63 @@ class TagService:
             1
             >>>
             >>> # Test updating resource stats
-            >>> service._update_stats(stats, "resources")
+            >>> service._update_stats(stats, "resources", 3)
             >>> stats.resources
-            1
+            3
             >>> stats.total
-            2
+            4
             >>>
             >>> # Test with invalid entity type (should not crash)
             >>> service._update_stats(stats, "invalid")
-            >>> stats.total  # Should remain 2
-            2
+            >>> stats.total  # Should remain 4
+            4
         """
-        if entity_type == "tools":
-            stats.tools += 1
-            stats.total += 1
-        elif entity_type == "resources":
-            stats.resources += 1
-            stats.total += 1
-        elif entity_type == "prompts":
-            stats.prompts += 1
-            stats.total += 1
-        elif entity_type == "servers":
-            stats.servers += 1
-            stats.total += 1
-        elif entity_type == "gateways":
-            stats.gateways += 1
-            stats.total += 1
-        # Invalid entity types are ignored (no increment)
-
-    def _get_tag_id(self, tag) -> str:
-        """Return the tag id for a tag entry which may be a string or a dict.
-
-        Supports legacy string tags and new dict tags with an 'id' field.
-        Falls back to 'label' or the string representation when 'id' is missing.
+        if entity_type not in ENTITY_MODELS:
+            # Invalid entity types are ignored (no increment)
+            return
+        setattr(stats, entity_type, getattr(stats, entity_type) + count)
+        stats.total += count
+
+    def _tagged_entity(self, entity: Any, entity_type: str) -> TaggedEntity:
+        """Build the TaggedEntity summary of an entity.
 
         Args:
-            tag: Tag value which may be a string (legacy) or a dict with an
-                 'id' or 'label' key.
+            entity: Tool, resource, prompt, server or gateway.
+            entity_type: Entity type the entity belongs to (plural).
 
         Returns:
-            The normalized tag id as a string.
+            TaggedEntity with the entity's id, name, type and description.
+
+        Example:
+            >>> from types import SimpleNamespace
+            >>> resource = SimpleNamespace(id=None, name=None, uri="file:///a", description=None)
+            >>> TagService()._tagged_entity(resource, "resources").model_dump(exclude_none=True)
+            {'id': 'file:///a', 'name': 'file:///a', 'type': 'resource'}
         """
-        if isinstance(tag, str):
-            return tag
-        if isinstance(tag, dict):
-            return tag.get("id") or tag.get("label") or str(tag)
-        return str(tag)
+        # Determine the ID
+        if hasattr(entity, "id") and entity.id is not None:
+            entity_id = str(entity.id)
+        elif entity_type == "resources" and hasattr(entity, "uri"):
+            entity_id = str(entity.uri)
+        else:
+            entity_id = str(entity.name if hasattr(entity, "name") and entity.name else "unknown")
+
+        # Determine the name
+        if hasattr(entity, "name") and entity.name:
+            entity_name = entity.name
+        elif hasattr(entity, "original_name") and entity.original_name:
+            entity_name = entity.original_name
+        elif hasattr(entity, "uri"):
+            entity_name = str(entity.uri)
+        else:
+            entity_name = entity_id
+
+        return TaggedEntity(
+            id=entity_id,
+            name=entity_name,
+            type=entity_type[:-1],  # Remove plural 's'
+            description=entity.description if hasattr(entity, "description") else None,
+        )
 
     async def get_entities_by_tag(self, db: Session, tag_name: str, entity_types: Optional[List[str]] = None) -> List[TaggedEntity]:
         """Get all entities that have a specific tag.
@@ -342,103 +305,48 @@ class TagService:
             >>> # Setup service and mock database
             >>> service = TagService()
             >>> mock_db = MagicMock()
-            >>> mock_db.get_bind.return_value.dialect.name = "sqlite"
             >>>
             >>> # Mock entity with tag
             >>> mock_entity = MagicMock()
             >>> mock_entity.id = "test-123"
             >>> mock_entity.name = "Test Entity"
             >>> mock_entity.description = "A test entity"
-            >>> mock_entity.tags = ["api", "test", "database"]
             >>>
             >>> # Mock database result
-            >>> mock_result = MagicMock()
-            >>> mock_result.scalars.return_value = [mock_entity]
-            >>> mock_db.execute.return_value = mock_result
+            >>> mock_db.execute.return_value.scalars.return_value = [mock_entity]
             >>>
             >>> # Test entity lookup by tag
             >>> async def test_entity_lookup():
             ...     entities = await service.get_entities_by_tag(mock_db, "api", ["tools"])
-            ...     return len(entities)
+            ...     return [(e.id, e.type) for e in entities]
             >>> asyncio.run(test_entity_lookup())
-            1
-
-            >>> # Test with non-existent tag
-            >>> mock_entity.tags = ["different", "tags"]
-            >>> async def test_no_match():
-            ...     entities = await service.get_entities_by_tag(mock_db, "api", ["tools"])
-            ...     return len(entities)
-            >>> asyncio.run(test_no_match())
-            0
+            [('test-123', 'tool')]
 
         Note:
             - Tag matching is exact and case-sensitive
-            - Entities without the specified tag are filtered out after database query
-            - Performance scales with the number of entities in filtered types
-            - Uses json_contains_tag_expr for cross-database filtering (PostgreSQL/SQLite)
+            - Each entity type is one indexed lookup in ``entity_tags`` (see entity_tag_expr)
         """
         entities = []
 
-        # Define entity type mapping
-        entity_map = {
-            "tools": DbTool,
-            "resources": DbResource,
-            "prompts": DbPrompt,
-            "servers": DbServer,
-            "gateways": DbGateway,
-        }
-
         # If no entity types specified, use all
         if entity_types is None:
-            entity_types = list(entity_map.keys())
+            entity_types = list(ENTITY_MODELS.keys())
 
         for entity_type in entity_types:
-            if entity_type not in entity_map:
+            if entity_type not in ENTITY_MODELS:
                 continue
 
-            model = entity_map[entity_type]
-
-            # Query entities that have this tag
-            # Using json_contains_tag_expr for cross-database compatibility (PostgreSQL/SQLite)
-            stmt = select(model).where(json_contains_tag_expr(db, model.tags, [tag_name], match_any=True))
-            result = db.execute(stmt)
-
-            for entity in result.scalars():
-                entity_tags = entity.tags or []
-                entity_tag_ids = [self._get_tag_id(t) for t in entity_tags]
-                if tag_name in entity_tag_ids:
-                    # Determine the ID
-                    if hasattr(entity, "id") and entity.id is not None:
-                        entity_id = str(entity.id)
-                    elif entity_type == "resources" and hasattr(entity, "uri"):
-                        entity_id = str(entity.uri)
-                    else:
-                        entity_id = str(entity.name if hasattr(entity, "name") and entity.name else "unknown")
-
-                    # Determine the name
-                    if hasattr(entity, "name") and entity.name:
-                        entity_name = entity.name
-                    elif hasattr(entity, "original_name") and entity.original_name:
-                        entity_name = entity.original_name
-                    elif hasattr(entity, "uri"):
-                        entity_name = str(entity.uri)
-                    else:
-                        entity_name = entity_id
-
-                    entity_info = TaggedEntity(
-                        id=entity_id,
-                        name=entity_name,
-                        type=entity_type[:-1],  # Remove plural 's'
-                        description=entity.description if hasattr(entity, "description") else None,
-                    )
-                    entities.append(entity_info)
+            model = ENTITY_MODELS[entity_type]
+            stmt = select(model).where(entity_tag_expr(model.tags, [tag_name]))
+            for entity in db.execute(stmt).scalars():
+                entities.append(self._tagged_entity(entity, entity_type))
 
         return entities
 
     async def get_tag_counts(self, db: Session) -> Dict[str, int]:
-        """Get count of unique tags per entity type.
+        """Get count of tags per entity type.
 
-        This method calculates the total number of tag instances (not unique tag names)
+        This method calculates the total number of tag assignments (not unique tag names)
         across all entity types. Useful for analytics and capacity planning.
 
         Args:
@@ -447,7 +355,7 @@ class TagService:
         Returns:
             Dictionary mapping entity type names to total tag counts.
             Keys: 'tools', 'resources', 'prompts', 'servers', 'gateways'
-            Values: Integer counts of total tag instances in each type
+            Values: Integer counts of total tag assignments in each type
 
         Example:
             >>> import asyncio
@@ -457,56 +365,19 @@ class TagService:
             >>> service = TagService()
             >>> mock_db = MagicMock()
             >>>
-            >>> # Mock tag count results
-            >>> mock_db.execute.return_value.scalars.return_value.all.return_value = [2, 1, 3]  # 3 entities with 2, 1, 3 tags each
-            >>>
-            >>> # Execute method with mocked responses (same values reused for simplicity)
-            >>> class _Res:
-            ...     def scalars(self):
-            ...         class _S:
-            ...             def all(self_inner):
-            ...                 return [2, 1, 3]
-            ...         return _S()
-            >>> mock_db.execute.return_value = _Res()
+            >>> # Mock GROUP BY rows: (entity_type, count)
+            >>> mock_db.execute.return_value = iter([("tools", 6), ("gateways", 2)])
             >>> counts = asyncio.run(service.get_tag_counts(mock_db))
-            >>> counts['tools']
-            6
-            >>> all(isinstance(v, int) for v in counts.values())
-            True
-            >>> len(counts)
-            5
+            >>> counts
+            {'tools': 6, 'resources': 0, 'prompts': 0, 'servers': 0, 'gateways': 2}
 
         Note:
-            - Counts tag instances, not unique tag names
+            - Counts tag assignments, not unique tag names
             - An entity with 3 tags contributes 3 to the count
             - Empty or null tag arrays contribute 0 to the count
-            - Uses json_array_length() for efficient counting
         """
-        counts = {}
-
-        # Count unique tags for tools
-        tool_tags_stmt = select(func.json_array_length(DbTool.tags)).where(DbTool.tags.isnot(None))
-        tool_tags = db.execute(tool_tags_stmt).scalars().all()
-        counts["tools"] = sum(tool_tags)
-
-        # Count unique tags for resources
-        resource_tags_stmt = select(func.json_array_length(DbResource.tags)).where(DbResource.tags.isnot(None))
-        resource_tags = db.execute(resource_tags_stmt).scalars().all()
-        counts["resources"] = sum(resource_tags)
-
-        # Count unique tags for prompts
-        prompt_tags_stmt = select(func.json_array_length(DbPrompt.tags)).where(DbPrompt.tags.isnot(None))
-        prompt_tags = db.execute(prompt_tags_stmt).scalars().all()
-        counts["prompts"] = sum(prompt_tags)
-
-        # Count unique tags for servers
-        server_tags_stmt = select(func.json_array_length(DbServer.tags)).where(DbServer.tags.isnot(None))
-        server_tags = db.execute(server_tags_stmt).scalars().all()
-        counts["servers"] = sum(server_tags)
-
-        # Count unique tags for gateways
-        gateway_tags_stmt = select(func.json_array_length(DbGateway.tags)).where(DbGateway.tags.isnot(None))
-        gateway_tags = db.execute(gateway_tags_stmt).scalars().all()
-        counts["gateways"] = sum(gateway_tags)
-
+        counts = dict.fromkeys(ENTITY_MODELS, 0)
+        stmt = select(EntityTag.entity_type, func.count()).where(EntityTag.entity_type.in_(list(ENTITY_MODELS))).group_by(EntityTag.entity_type)
+        for entity_type, count in db.execute(stmt):
+            counts[entity_type] = count
         return counts
@@ -28,8 +28,9 @@ from sqlalchemy.orm import Session
 
 # First-Party
 from mcpgateway.config import settings
-from mcpgateway.db import EmailApiToken, EmailUser, TokenRevocation, TokenUsageLog, utc_now
+from mcpgateway.db import EmailApiToken, EmailUser, TokenRevocation, TokenUsageLog, TokenUsageRollup, utc_now
 from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.services.token_usage_rollup_service import LATENCY_BUCKET_COLUMNS, latency_percentile
 from mcpgateway.utils.create_jwt_token import create_jwt_token
 
 # Initialize logging
@@ -983,12 +984,82 @@ class TokenCatalogService:
             if token:
                 token_jti = token.jti
 
+        # Per-minute rollups are aggregated in SQL on every dialect
+        if settings.token_usage_rollup_enabled:
+            return await self._get_usage_stats_rollup(user_email, start_date, token_jti, days)
+
         # Use SQL aggregation for PostgreSQL, Python fallback for SQLite
         dialect_name = self.db.get_bind().dialect.name
         if dialect_name == "postgresql":
             return await self._get_usage_stats_postgresql(user_email, start_date, token_jti, days)
         return await self._get_usage_stats_python(user_email, start_date, token_jti, days)
 
+    async def _get_usage_stats_rollup(self, user_email: str, start_date: datetime, token_jti: Optional[str], days: int) -> dict:
+        """Compute usage stats from the per-minute ``token_usage_rollups`` table.
+
+        Requests still held in memory by the rollup service (up to one flush
+        interval) are not included.
+
+        Args:
+            user_email: User's email address
+            start_date: Start date for analysis
+            token_jti: Optional token JTI filter
+            days: Number of days being analyzed
+
+        Returns:
+            dict: Usage statistics computed from rollups
+        """
+        conditions = [TokenUsageRollup.user_email == user_email, TokenUsageRollup.minute_start >= start_date]
+        if token_jti:
+            conditions.append(TokenUsageRollup.token_jti == token_jti)
+        base_filter = and_(*conditions)
+
+        bucket_columns = [getattr(TokenUsageRollup, column) for column in LATENCY_BUCKET_COLUMNS]
+        stats_query = select(
+            func.sum(TokenUsageRollup.request_count).label("total"),
+            func.sum(TokenUsageRollup.status_2xx).label("status_2xx"),
+            func.sum(TokenUsageRollup.status_3xx).label("status_3xx"),
+            func.sum(TokenUsageRollup.status_4xx).label("status_4xx"),
+            func.sum(TokenUsageRollup.status_5xx).label("status_5xx"),
+            func.sum(TokenUsageRollup.blocked_count).label("blocked"),
+            func.sum(TokenUsageRollup.latency_count).label("latency_count"),
+            func.sum(TokenUsageRollup.latency_sum_ms).label("latency_sum"),
+            func.max(TokenUsageRollup.latency_max_ms).label("latency_max"),
+            *[func.sum(column).label(column.key) for column in bucket_columns],
+        ).where(base_filter)
+        result = self.db.execute(stats_query).fetchone()
+
+        total_requests = int(result.total or 0)
+        status_classes = {name: int(getattr(result, f"status_{name}") or 0) for name in ("2xx", "3xx", "4xx", "5xx")}
+        successful_requests = status_classes["2xx"] + status_classes["3xx"]
+        blocked_requests = int(result.blocked or 0)
+        latency_count = int(result.latency_count or 0)
+        avg_response_time = int(result.latency_sum or 0) / latency_count if latency_count else 0.0
+        buckets = [int(getattr(result, column) or 0) for column in LATENCY_BUCKET_COLUMNS]
+        p95_response_time = latency_percentile(buckets, 0.95, int(result.latency_max or 0))
+
+        endpoint_total = func.sum(TokenUsageRollup.request_count)
+        endpoints_query = (
+            select(TokenUsageRollup.endpoint, endpoint_total.label("count"))
+            .where(and_(base_filter, TokenUsageRollup.endpoint != ""))
+            .group_by(TokenUsageRollup.endpoint)
+            .order_by(endpoint_total.desc())
+            .limit(5)
+        )
+        top_endpoints = [(row.endpoint, int(row.count)) for row in self.db.execute(endpoints_query).fetchall()]
+
+        return {
+            "period_days": days,
+            "total_requests": total_requests,
+            "successful_requests": successful_requests,
+            "blocked_requests": blocked_requests,
+            "success_rate": successful_requests / total_requests if total_requests > 0 else 0,
+            "average_response_time_ms": round(avg_response_time, 2),
+            "p95_response_time_ms": p95_response_time,
+            "status_classes": status_classes,
+            "top_endpoints": top_endpoints,
+        }
+
     async def _get_usage_stats_postgresql(self, user_email: str, start_date: datetime, token_jti: Optional[str], days: int) -> dict:
         """Compute usage stats using PostgreSQL SQL aggregation.
 
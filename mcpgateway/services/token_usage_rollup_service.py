@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""Per-minute API token usage counters flushed to the database in batches.
+
+``TokenUsageMiddleware`` used to commit one ``token_usage_logs`` row per API
+token request, and the usage-stats API scanned those rows. This service keeps
+counters in memory instead, keyed by token, endpoint and minute: request
+count, status classes, blocked requests, and a latency sum, maximum and
+histogram. A background task inserts the counters into ``token_usage_rollups``
+every ``TOKEN_USAGE_ROLLUP_FLUSH_INTERVAL`` seconds, so the table grows with
+the number of active token/endpoint/minute keys rather than with requests.
+
+Raw rows become optional: ``TOKEN_USAGE_RAW_LOG_SAMPLE_RATE`` keeps a random
+fraction of requests as ``token_usage_logs`` rows for auditing (all of them by
+default; lower it to drop the per-request inserts). While the
+flush task is not running (CLI tools, tests, rollups disabled) ``record``
+returns False and the caller writes a raw row as before.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+import bisect
+from datetime import datetime, timezone
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import fresh_db_session, TokenUsageRollup
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (inclusive, in ms) of the latency histogram buckets; the last column counts slower requests
+LATENCY_BUCKETS_MS: Tuple[int, ...] = (10, 50, 100, 250, 500, 1000, 5000)
+LATENCY_BUCKET_COLUMNS: Tuple[str, ...] = tuple(f"latency_le_{bound}ms" for bound in LATENCY_BUCKETS_MS) + (f"latency_gt_{LATENCY_BUCKETS_MS[-1]}ms",)
+
+# Counter layout: request_count, status_2xx, status_3xx, status_4xx, status_5xx, blocked_count, latency_count, latency_sum_ms, latency_max_ms, buckets...
+_REQUESTS, _STATUS_2XX, _BLOCKED, _LATENCY_COUNT, _LATENCY_SUM, _LATENCY_MAX, _BUCKETS = 0, 1, 5, 6, 7, 8, 9
+_COUNTER_SIZE = _BUCKETS + len(LATENCY_BUCKET_COLUMNS)
+
+RollupKey = Tuple[str, str, str, int]  # (token_jti, user_email, endpoint, minute epoch seconds)
+
+
+def latency_percentile(buckets: List[int], fraction: float, max_ms: int = 0) -> Optional[float]:
+    """Estimate a latency percentile from histogram bucket counts.
+
+    Returns the upper bound of the bucket containing the percentile, capped
+    at the observed maximum (which is also used for the overflow bucket).
+
+    Args:
+        buckets: Counts per bucket, in ``LATENCY_BUCKET_COLUMNS`` order.
+        fraction: Percentile as a fraction (0.95 for p95).
+        max_ms: Largest observed response time.
+
+    Returns:
+        Optional[float]: Estimated percentile in ms, or None without samples.
+
+    Examples:
+        >>> latency_percentile([90, 5, 5, 0, 0, 0, 0, 0], 0.5)
+        10.0
+        >>> latency_percentile([90, 5, 5, 0, 0, 0, 0, 0], 0.99, max_ms=80)
+        80.0
+        >>> latency_percentile([0, 0, 0, 0, 0, 0, 0, 2], 0.95, max_ms=7200)
+        7200.0
+        >>> latency_percentile([0] * 8, 0.95) is None
+        True
+    """
+    total = sum(buckets)
+    if not total:
+        return None
+    rank = fraction * total
+    seen = 0
+    for index, count in enumerate(buckets):
+        seen += count
+        if seen >= rank and count:
+            if index < len(LATENCY_BUCKETS_MS):
+                bound = LATENCY_BUCKETS_MS[index]
+                return float(min(bound, max_ms) if max_ms else bound)
+            break
+    return float(max_ms or LATENCY_BUCKETS_MS[-1])
+
+
+class TokenUsageRollupService:
+    """In-memory per-minute token usage counters with periodic batch flush.
+
+    Configuration (via environment variables):
+    - TOKEN_USAGE_ROLLUP_ENABLED: Aggregate usage into rollups (default: True)
+    - TOKEN_USAGE_ROLLUP_FLUSH_INTERVAL: Seconds between flushes (default: 30)
+    - TOKEN_USAGE_RAW_LOG_SAMPLE_RATE: Fraction of requests also kept as raw rows (default: 1.0)
+
+    Examples:
+        >>> svc = TokenUsageRollupService(enabled=True, raw_sample_rate=0.0)
+        >>> svc.record("jti-1", "a@example.com", "/tools", 200, 42)  # flush task not running: caller logs a raw row
+        False
+        >>> svc._running = lambda: True
+        >>> svc.record("jti-1", "a@example.com", "/tools", 200, 42, now=60.0)
+        True
+        >>> svc.record("jti-1", "a@example.com", "/tools", 503, 7, now=119.0)
+        True
+        >>> svc._counters[("jti-1", "a@example.com", "/tools", 60)][:9]
+        [2, 1, 0, 0, 1, 0, 2, 49, 42]
+        >>> svc.sample_raw()
+        False
+    """
+
+    def __init__(self, flush_interval: Optional[float] = None, enabled: Optional[bool] = None, raw_sample_rate: Optional[float] = None):
+        """Initialize the rollup service.
+
+        Args:
+            flush_interval: Seconds between automatic flushes (default: from settings or 30)
+            enabled: Whether rollups are enabled (default: from settings or True)
+            raw_sample_rate: Fraction of requests also logged as raw rows (default: from settings or 1.0)
+        """
+        self.flush_interval = flush_interval or getattr(settings, "token_usage_rollup_flush_interval", 30.0)
+        self.enabled = enabled if enabled is not None else getattr(settings, "token_usage_rollup_enabled", True)
+        self.raw_sample_rate = raw_sample_rate if raw_sample_rate is not None else getattr(settings, "token_usage_raw_log_sample_rate", 1.0)
+
+        self._counters: Dict[RollupKey, List[int]] = {}
+        self._lock = threading.Lock()
+
+        # Background flush task
+        self._flush_task: Optional[asyncio.Task] = None
+        self._shutdown_event = asyncio.Event()
+
+        # Stats for monitoring
+        self._total_recorded = 0
+        self._rows_flushed = 0
+        self._flush_count = 0
+        self._flush_failures = 0
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if not self.enabled:
+            logger.info("TokenUsageRollupService disabled, skipping start")
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._shutdown_event.clear()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(f"TokenUsageRollupService flush task started (interval={self.flush_interval}s, raw_sample_rate={self.raw_sample_rate})")
+
+    async def shutdown(self) -> None:
+        """Shutdown service with final flush."""
+        logger.info("TokenUsageRollupService shutting down...")
+        self._shutdown_event.set()
+
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+        logger.info(f"TokenUsageRollupService shutdown complete: total_recorded={self._total_recorded}, rows_flushed={self._rows_flushed}, flush_count={self._flush_count}")
+
+    def _running(self) -> bool:
+        """Return True while the flush task is alive.
+
+        Returns:
+            bool: True if recorded counters will be flushed.
+        """
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def record(
+        self,
+        jti: str,
+        user_email: str,
+        endpoint: Optional[str],
+        status_code: Optional[int],
+        response_time_ms: Optional[int],
+        blocked: bool = False,
+        now: Optional[float] = None,
+    ) -> bool:
+        """Count one API token request in the current minute.
+
+        Args:
+            jti: JWT ID of token used
+            user_email: Token owner's email
+            endpoint: API endpoint accessed
+            status_code: HTTP response status
+            response_time_ms: Response time in milliseconds
+            blocked: Whether request was blocked
+            now: Request time as epoch seconds (default: current time)
+
+        Returns:
+            bool: True if counted; False if the caller must write a raw row instead.
+        """
+        if not self.enabled or not self._running():
+            return False
+
+        minute = int((time.time() if now is None else now) // 60) * 60
+        key = (jti, user_email, (endpoint or "")[:255], minute)
+        with self._lock:
+            counters = self._counters.get(key)
+            if counters is None:
+                counters = self._counters[key] = [0] * _COUNTER_SIZE
+            counters[_REQUESTS] += 1
+            if status_code and 200 <= status_code < 600:
+                counters[_STATUS_2XX + status_code // 100 - 2] += 1
+            if blocked:
+                counters[_BLOCKED] += 1
+            if response_time_ms and response_time_ms > 0:
+                counters[_LATENCY_COUNT] += 1
+                counters[_LATENCY_SUM] += response_time_ms
+                counters[_LATENCY_MAX] = max(counters[_LATENCY_MAX], response_time_ms)
+                counters[_BUCKETS + bisect.bisect_left(LATENCY_BUCKETS_MS, response_time_ms)] += 1
+            self._total_recorded += 1
+        return True
+
+    def sample_raw(self) -> bool:
+        """Decide whether a counted request is also kept as a raw ``token_usage_logs`` row.
+
+        Returns:
+            bool: True if the raw row should be written.
+        """
+        return self.raw_sample_rate > 0 and random.random() < self.raw_sample_rate  # nosec B311 - sampling, not security
+
+    async def _flush_loop(self) -> None:
+        """Background task that periodically flushes counters.
+
+        Raises:
+            asyncio.CancelledError: When the flush loop is cancelled.
+        """
+        while not self._shutdown_event.is_set():
+            try:
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+                await self.flush()
+
+            except asyncio.CancelledError:
+                logger.debug("Token usage rollup flush loop cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Error in token usage rollup flush loop: {e}", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def flush(self) -> int:
+        """Write the accumulated counters as rollup rows in one transaction.
+
+        Counters from a failed flush are merged back and retried next time.
+
+        Returns:
+            int: Number of rows written.
+        """
+        with self._lock:
+            counters, self._counters = self._counters, {}
+        if not counters:
+            return 0
+
+        try:
+            await asyncio.to_thread(self._flush_to_db, counters)
+        except Exception as e:
+            self._flush_failures += 1
+            logger.warning(f"Failed to flush {len(counters)} token usage rollup rows, retrying next flush: {e}")
+            with self._lock:
+                for key, values in counters.items():
+                    current = self._counters.get(key)
+                    if current is None:
+                        self._counters[key] = values
+                    else:
+                        for index, value in enumerate(values):
+                            current[index] = max(current[index], value) if index == _LATENCY_MAX else current[index] + value
+            return 0
+
+        self._rows_flushed += len(counters)
+        self._flush_count += 1
+        return len(counters)
+
+    @staticmethod
+    def _flush_to_db(counters: Dict[RollupKey, List[int]]) -> None:
+        """Insert one rollup row per key (runs in thread).
+
+        Args:
+            counters: Counters keyed by (token_jti, user_email, endpoint, minute).
+        """
+        rows = []
+        for (jti, user_email, endpoint, minute), values in counters.items():
+            row = TokenUsageRollup(
+                token_jti=jti,
+                user_email=user_email,
+                endpoint=endpoint,
+                minute_start=datetime.fromtimestamp(minute, tz=timezone.utc),
+                request_count=values[_REQUESTS],
+                status_2xx=values[_STATUS_2XX],
+                status_3xx=values[_STATUS_2XX + 1],
+                status_4xx=values[_STATUS_2XX + 2],
+                status_5xx=values[_STATUS_2XX + 3],
+                blocked_count=values[_BLOCKED],
+                latency_count=values[_LATENCY_COUNT],
+                latency_sum_ms=values[_LATENCY_SUM],
+                latency_max_ms=values[_LATENCY_MAX],
+            )
+            for column, value in zip(LATENCY_BUCKET_COLUMNS, values[_BUCKETS:]):
+                setattr(row, column, value)
+            rows.append(row)
+
+        with fresh_db_session() as db:
+            db.add_all(rows)
+            db.commit()
+
+    def get_stats(self) -> dict:
+        """Get rollup statistics for monitoring.
+
+        Returns:
+            dict: Pending keys and flush counters.
+        """
+        with self._lock:
+            pending = len(self._counters)
+
+        return {
+            "enabled": self.enabled,
+            "running": self._running(),
+            "flush_interval": self.flush_interval,
+            "raw_sample_rate": self.raw_sample_rate,
+            "pending_keys": pending,
+            "total_recorded": self._total_recorded,
+            "rows_flushed": self._rows_flushed,
+            "flush_count": self._flush_count,
+            "flush_failures": self._flush_failures,
+        }
+
+
+# Singleton instance
+_token_usage_rollup_service: Optional[TokenUsageRollupService] = None
+
+
+def get_token_usage_rollup_service() -> TokenUsageRollupService:
+    """Get or create the singleton TokenUsageRollupService instance.
+
+    Returns:
+        TokenUsageRollupService: The singleton rollup service instance.
+    """
+    global _token_usage_rollup_service  # pylint: disable=global-statement
+    if _token_usage_rollup_service is None:
+        _token_usage_rollup_service = TokenUsageRollupService()
+    return _token_usage_rollup_service
@@ -0,0 +1,603 @@
+# -*- coding: utf-8 -*-
+"""Ranked tool discovery for virtual servers with large catalogs.
+
+A virtual server with hundreds of tools returns all of them, schemas
+included, on every ``tools/list``. Agents download the whole catalog again on
+each turn, which costs bandwidth and LLM context. When
+``TOOL_DISCOVERY_ENABLED`` is set, servers with at least
+``TOOL_DISCOVERY_MIN_TOOLS`` tools list a single meta-tool,
+``search_tools(query, k)``, instead. Agents search for what they need, then
+call the returned tools by name as usual.
+
+Search uses an in-process BM25 index over tool names, descriptions and
+input-schema property names:
+
+- The index is built lazily from the registry on first use.
+- Tool events published by ``ToolService`` mark single tools dirty. Dirty
+  tools are re-read (or dropped) before the next search.
+- Bulk changes (gateway refreshes, bulk imports, other workers) invalidate
+  the ``tools`` registry cache, which marks the whole index stale. The
+  index is then rebuilt in a worker thread while the old one keeps serving.
+
+Results respect the caller's token scope and the server's tool membership,
+with the same visibility rules as ``ToolService.list_server_tools``.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import heapq
+import logging
+import math
+import re
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Third-Party
+import orjson
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.common.models import TextContent, ToolResult
+from mcpgateway.config import settings
+from mcpgateway.db import fresh_db_session, server_tool_association
+from mcpgateway.db import Tool as DbTool
+from mcpgateway.services.team_management_service import TeamManagementService
+
+logger = logging.getLogger(__name__)
+
+# Words in camelCase, PascalCase, snake_case, kebab-case and acronyms ("HTTPServer" -> http, server)
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+_STOPWORDS = frozenset({"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it", "of", "on", "or", "that", "the", "this", "to", "with"})
+
+# Term frequency multipliers per field
+_NAME_WEIGHT = 3
+_SCHEMA_WEIGHT = 2
+_DESCRIPTION_WEIGHT = 1
+
+_MEMBERSHIP_BATCH = 500
+_INDEX_COLUMNS = (
+    DbTool.id,
+    DbTool.name,
+    DbTool.original_name,
+    DbTool.display_name,
+    DbTool.description,
+    DbTool.input_schema,
+    DbTool.enabled,
+    DbTool.visibility,
+    DbTool.team_id,
+    DbTool.owner_email,
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase search terms, dropping common stopwords.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        List[str]: Terms in input order (repeats kept).
+
+    Examples:
+        >>> tokenize("getWeatherForecast")
+        ['get', 'weather', 'forecast']
+        >>> tokenize("HTTPServer list_open-PRs v2")
+        ['http', 'server', 'list', 'open', 'p', 'rs', 'v', '2']
+        >>> tokenize("Search the issues of a repo")
+        ['search', 'issues', 'repo']
+        >>> tokenize(None)
+        []
+    """
+    if not text:
+        return []
+    return [word for word in (w.lower() for w in _WORD.findall(text)) if word not in _STOPWORDS]
+
+
+def _schema_property_names(schema: Any, depth: int = 0) -> Iterator[str]:
+    """Yield property names from a JSON schema, including nested objects and arrays.
+
+    Args:
+        schema: JSON schema (any value; non-dicts yield nothing).
+        depth: Current nesting depth (recursion stops at 4).
+
+    Yields:
+        str: Property names.
+
+    Examples:
+        >>> schema = {"properties": {"repo": {}, "filter": {"properties": {"labelName": {}}}, "ids": {"items": {"properties": {"pr": {}}}}}}
+        >>> list(_schema_property_names(schema))
+        ['repo', 'filter', 'labelName', 'ids', 'pr']
+    """
+    if not isinstance(schema, dict) or depth > 4:
+        return
+    properties = schema.get("properties")
+    if isinstance(properties, dict):
+        for name, sub in properties.items():
+            yield str(name)
+            yield from _schema_property_names(sub, depth + 1)
+    if "items" in schema:
+        yield from _schema_property_names(schema["items"], depth + 1)
+
+
+@dataclass(slots=True)
+class _Doc:
+    """One indexed tool."""
+
+    tool_id: str
+    terms: Tuple[Tuple[str, int], ...]
+    length: int
+    enabled: bool
+    visibility: Optional[str]
+    team_id: Optional[str]
+    owner_email: Optional[str]
+
+
+class ToolSearchIndex:
+    """In-memory BM25 index over tools.
+
+    Terms from the tool's names count three times, input-schema property
+    names twice and description words once, so name matches dominate.
+
+    Examples:
+        >>> index = ToolSearchIndex()
+        >>> index.upsert("t1", names=["get_weather"], description="Current conditions for a city", schema={"properties": {"city": {}}})
+        >>> index.upsert("t2", names=["list_issues"], description="List GitHub issues, e.g. weather-related bugs")
+        >>> [tool_id for tool_id, _ in index.search("weather")]
+        ['t1', 't2']
+        >>> [tool_id for tool_id, _ in index.search("city")]
+        ['t1']
+        >>> index.remove("t1")
+        >>> [tool_id for tool_id, _ in index.search("weather")], len(index)
+        (['t2'], 1)
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        """Create an empty index.
+
+        Args:
+            k1: BM25 term-frequency saturation.
+            b: BM25 document-length normalization.
+        """
+        self.k1 = k1
+        self.b = b
+        self._docs: Dict[str, _Doc] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._disabled: Set[str] = set()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed tools.
+
+        Returns:
+            int: Indexed tool count.
+        """
+        return len(self._docs)
+
+    def upsert(
+        self,
+        tool_id: str,
+        names: Iterable[Optional[str]],
+        description: Optional[str] = None,
+        schema: Any = None,
+        enabled: bool = True,
+        visibility: Optional[str] = "public",
+        team_id: Optional[str] = None,
+        owner_email: Optional[str] = None,
+    ) -> None:
+        """Index a tool, replacing any previous entry with the same id.
+
+        Args:
+            tool_id: Tool ID.
+            names: Name variants (qualified name, original name, display name).
+            description: Tool description.
+            schema: Input JSON schema.
+            enabled: Whether the tool is enabled (disabled tools never match).
+            visibility: Tool visibility (public, team, private).
+            team_id: Owning team.
+            owner_email: Owner.
+        """
+        self.remove(tool_id)
+        counts: Counter = Counter()
+        for term in set(term for name in names for term in tokenize(name)):
+            counts[term] += _NAME_WEIGHT
+        for term in set(term for prop in _schema_property_names(schema) for term in tokenize(prop)):
+            counts[term] += _SCHEMA_WEIGHT
+        for term in tokenize(description):
+            counts[term] += _DESCRIPTION_WEIGHT
+
+        # Share term strings across documents to keep memory flat for large catalogs
+        terms = tuple((sys.intern(term), tf) for term, tf in counts.items())
+        length = sum(counts.values())
+        self._docs[tool_id] = _Doc(tool_id, terms, length, enabled, visibility, team_id, owner_email)
+        self._lengths[tool_id] = length
+        if not enabled:
+            self._disabled.add(tool_id)
+        self._total_length += length
+        for term, tf in terms:
+            self._postings.setdefault(term, {})[tool_id] = tf
+
+    def remove(self, tool_id: str) -> None:
+        """Drop a tool from the index (no-op if absent).
+
+        Args:
+            tool_id: Tool ID.
+        """
+        doc = self._docs.pop(tool_id, None)
+        if doc is None:
+            return
+        del self._lengths[tool_id]
+        self._disabled.discard(tool_id)
+        self._total_length -= doc.length
+        for term, _ in doc.terms:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(tool_id, None)
+                if not posting:
+                    del self._postings[term]
+
+    def get(self, tool_id: str) -> Optional[_Doc]:
+        """Return the indexed entry for a tool.
+
+        Args:
+            tool_id: Tool ID.
+
+        Returns:
+            Optional[_Doc]: The entry, or None.
+        """
+        return self._docs.get(tool_id)
+
+    def _scores(self, query: str) -> Dict[str, float]:
+        """Compute BM25 scores for every enabled tool matching at least one query term.
+
+        Args:
+            query: Free-text query.
+
+        Returns:
+            Dict[str, float]: Score per tool ID.
+        """
+        count = len(self._docs)
+        if not count:
+            return {}
+        k1, b = self.k1, self.b
+        length_factor = b / (self._total_length / count)
+        lengths = self._lengths
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5)) * (k1 + 1)
+            for tool_id, tf in posting.items():
+                scores[tool_id] = scores.get(tool_id, 0.0) + idf * tf / (tf + k1 * (1 - b + length_factor * lengths[tool_id]))
+        if self._disabled:
+            for tool_id in self._disabled.intersection(scores):
+                del scores[tool_id]
+        return scores
+
+    def search(self, query: str) -> List[Tuple[str, float]]:
+        """Rank every enabled tool matching at least one query term.
+
+        Args:
+            query: Free-text query.
+
+        Returns:
+            List[Tuple[str, float]]: ``(tool_id, score)`` pairs, best first.
+        """
+        return sorted(self._scores(query).items(), key=lambda item: (-item[1], item[0]))
+
+    def top(self, query: str, k: int) -> List[Tuple[str, float]]:
+        """Return the ``k`` best matches without sorting every hit.
+
+        Args:
+            query: Free-text query.
+            k: Number of results.
+
+        Returns:
+            List[Tuple[str, float]]: ``(tool_id, score)`` pairs, best first.
+        """
+        return heapq.nsmallest(k, self._scores(query).items(), key=lambda item: (-item[1], item[0]))
+
+    def stats(self) -> Dict[str, int]:
+        """Return index size counters.
+
+        Returns:
+            Dict[str, int]: Tool, term and posting counts.
+        """
+        return {"tools": len(self._docs), "terms": len(self._postings), "postings": sum(len(p) for p in self._postings.values())}
+
+
+def _index_row(index: ToolSearchIndex, row: Any) -> None:
+    """Add one ``_INDEX_COLUMNS`` row to ``index``.
+
+    Args:
+        index: Target index.
+        row: Row with the ``_INDEX_COLUMNS`` attributes.
+    """
+    index.upsert(
+        row.id,
+        names=(row.name, row.original_name, row.display_name),
+        description=row.description,
+        schema=row.input_schema,
+        enabled=bool(row.enabled),
+        visibility=row.visibility,
+        team_id=row.team_id,
+        owner_email=row.owner_email,
+    )
+
+
+class ToolDiscoveryService:
+    """Keeps the tool search index current and serves the ``search_tools`` meta-tool.
+
+    Configuration (via environment variables):
+    - TOOL_DISCOVERY_ENABLED: Offer the meta-tool on large virtual servers (default: False)
+    - TOOL_DISCOVERY_MIN_TOOLS: Servers with at least this many tools list only the meta-tool (default: 100)
+    - TOOL_DISCOVERY_TOOL_NAME: Meta-tool name (default: search_tools)
+    - TOOL_DISCOVERY_DEFAULT_K / TOOL_DISCOVERY_MAX_K: Result count default and cap (default: 10 / 50)
+
+    Examples:
+        >>> svc = ToolDiscoveryService()
+        >>> svc.meta_tool()["name"] == settings.tool_discovery_tool_name
+        True
+        >>> svc.handle_event({"type": "tool_updated", "data": {"id": "t1"}})  # index not built yet: ignored
+        >>> svc.get_stats()["dirty"]
+        0
+    """
+
+    def __init__(self) -> None:
+        """Create the service; the index is built on first search."""
+        self._index: Optional[ToolSearchIndex] = None
+        self._stale = False
+        self._dirty: Set[str] = set()
+        self._build_lock = asyncio.Lock()
+        self._rebuild_task: Optional[asyncio.Task] = None
+        self._searches = 0
+        self._rebuilds = 0
+
+    def meta_tool(self) -> Dict[str, Any]:
+        """Return the MCP definition of the discovery meta-tool.
+
+        Returns:
+            Dict[str, Any]: Tool definition with ``name``, ``description`` and ``inputSchema``.
+        """
+        return {
+            "name": settings.tool_discovery_tool_name,
+            "description": (
+                "Search this server's tools. The catalog is too large to list, so describe what you want to do and call the returned tools by name. "
+                "Returns the best matches with their descriptions and input schemas."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "What you want to do, e.g. 'create a GitHub issue' or 'weather forecast'"},
+                    "k": {"type": "integer", "minimum": 1, "maximum": settings.tool_discovery_max_k, "description": f"Number of tools to return (default {settings.tool_discovery_default_k})"},
+                },
+                "required": ["query"],
+            },
+        }
+
+    async def stub_tools(self, db: Session, server_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the compact tool list for a server that should use discovery.
+
+        Args:
+            db: Database session.
+            server_id: Virtual server ID.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: ``[meta_tool]`` when discovery applies to this server, else None
+            (the caller lists tools normally).
+        """
+        if not settings.tool_discovery_enabled:
+            return None
+        count = db.execute(select(func.count()).select_from(server_tool_association).where(server_tool_association.c.server_id == server_id)).scalar() or 0
+        if count < settings.tool_discovery_min_tools:
+            return None
+        return [self.meta_tool()]
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply a ``ToolService`` event to the index.
+
+        Deletions drop the tool at once; other events mark it dirty so it is
+        re-read before the next search.
+
+        Args:
+            event: Event dict with ``type`` and ``data.id``.
+        """
+        if self._index is None:
+            return
+        tool_id = (event.get("data") or {}).get("id")
+        if not tool_id:
+            return
+        if event.get("type") == "tool_deleted":
+            self._index.remove(tool_id)
+            self._dirty.discard(tool_id)
+        else:
+            self._dirty.add(tool_id)
+
+    def mark_stale(self) -> None:
+        """Schedule a full rebuild (bulk changes or changes made by other workers)."""
+        if self._index is not None:
+            self._stale = True
+
+    @staticmethod
+    def _build() -> ToolSearchIndex:
+        """Build a fresh index from the registry (runs in a worker thread).
+
+        Returns:
+            ToolSearchIndex: The new index.
+        """
+        index = ToolSearchIndex()
+        with fresh_db_session() as db:
+            for row in db.execute(select(*_INDEX_COLUMNS).execution_options(yield_per=2000)):
+                _index_row(index, row)
+            db.commit()
+        return index
+
+    async def _rebuild(self) -> None:
+        """Replace the index with a freshly built one."""
+        self._stale = False
+        self._dirty.clear()
+        index = await asyncio.to_thread(self._build)
+        self._index = index
+        self._rebuilds += 1
+        logger.info("Tool discovery index built: %s", index.stats())
+
+    async def _current_index(self, db: Session) -> ToolSearchIndex:
+        """Return an up-to-date index, building or refreshing it as needed.
+
+        Args:
+            db: Database session used to re-read dirty tools.
+
+        Returns:
+            ToolSearchIndex: The index.
+        """
+        if self._index is None:
+            async with self._build_lock:
+                if self._index is None:
+                    await self._rebuild()
+        elif self._stale and (self._rebuild_task is None or self._rebuild_task.done()):
+            # Keep serving the current index while the new one is built
+            self._rebuild_task = asyncio.create_task(self._rebuild())
+
+        index = self._index
+        if self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            found = set()
+            for row in db.execute(select(*_INDEX_COLUMNS).where(DbTool.id.in_(dirty))):
+                _index_row(index, row)
+                found.add(row.id)
+            for tool_id in dirty - found:
+                index.remove(tool_id)
+        return index
+
+    async def search(
+        self,
+        db: Session,
+        server_id: str,
+        query: str,
+        k: int,
+        user_email: Optional[str] = None,
+        token_teams: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the ``k`` best tools on ``server_id`` for ``query`` that the caller may use.
+
+        Args:
+            db: Database session.
+            server_id: Virtual server ID.
+            query: Free-text query.
+            k: Number of results.
+            user_email: Caller email (None with ``token_teams`` None = unrestricted admin).
+            token_teams: Caller's token teams (None = look up, [] = public-only).
+
+        Returns:
+            List[Dict[str, Any]]: Tool definitions (``name``, ``description``, ``inputSchema``) best first.
+        """
+        index = await self._current_index(db)
+        self._searches += 1
+
+        restricted = user_email is not None or token_teams is not None
+        public_only = token_teams is not None and len(token_teams) == 0
+        if token_teams is not None:
+            team_ids = set(token_teams)
+        elif user_email:
+            team_ids = {team.id for team in await TeamManagementService(db).get_user_teams(user_email)}
+        else:
+            team_ids = set()
+
+        def visible(doc: _Doc) -> bool:
+            """Apply the same access rules as ``ToolService.list_server_tools``.
+
+            Args:
+                doc: Indexed tool.
+
+            Returns:
+                bool: True if the caller may see the tool.
+            """
+            if not restricted or doc.visibility == "public":
+                return True
+            if not public_only and user_email and doc.owner_email == user_email:
+                return True
+            return doc.team_id in team_ids and doc.visibility in ("team", "public")
+
+        candidates = [tool_id for tool_id, _ in index.search(query) if visible(index.get(tool_id))]
+        chosen: List[str] = []
+        for start in range(0, len(candidates), _MEMBERSHIP_BATCH):
+            batch = candidates[start : start + _MEMBERSHIP_BATCH]
+            members = set(
+                db.execute(select(server_tool_association.c.tool_id).where(server_tool_association.c.server_id == server_id, server_tool_association.c.tool_id.in_(batch))).scalars()
+            )
+            chosen.extend(tool_id for tool_id in batch if tool_id in members)
+            if len(chosen) >= k:
+                break
+        chosen = chosen[:k]
+        if not chosen:
+            return []
+
+        rows = {row.id: row for row in db.execute(select(DbTool.id, DbTool.name, DbTool.description, DbTool.input_schema).where(DbTool.id.in_(chosen)))}
+        return [{"name": rows[tool_id].name, "description": rows[tool_id].description, "inputSchema": rows[tool_id].input_schema} for tool_id in chosen if tool_id in rows]
+
+    async def invoke(
+        self,
+        db: Session,
+        server_id: str,
+        arguments: Optional[Dict[str, Any]],
+        user_email: Optional[str] = None,
+        token_teams: Optional[List[str]] = None,
+    ) -> ToolResult:
+        """Run the meta-tool.
+
+        Args:
+            db: Database session.
+            server_id: Virtual server ID.
+            arguments: Tool arguments (``query``, optional ``k``).
+            user_email: Caller email.
+            token_teams: Caller's token teams.
+
+        Returns:
+            ToolResult: Matching tools as JSON text and structured content, or an error result for bad arguments.
+        """
+        arguments = arguments or {}
+        query = arguments.get("query")
+        if not isinstance(query, str) or not query.strip():
+            return ToolResult(content=[TextContent(type="text", text="'query' must be a non-empty string")], is_error=True)
+        try:
+            k = int(arguments.get("k") or settings.tool_discovery_default_k)
+        except (TypeError, ValueError):
+            return ToolResult(content=[TextContent(type="text", text="'k' must be an integer")], is_error=True)
+        k = max(1, min(k, settings.tool_discovery_max_k))
+
+        tools = await self.search(db, server_id, query, k, user_email=user_email, token_teams=token_teams)
+        payload = {"tools": tools}
+        return ToolResult(content=[TextContent(type="text", text=orjson.dumps(payload).decode())], structured_content=payload)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return index and usage counters.
+
+        Returns:
+            Dict[str, Any]: Stats for monitoring.
+        """
+        stats: Dict[str, Any] = {"built": self._index is not None, "stale": self._stale, "dirty": len(self._dirty), "searches": self._searches, "rebuilds": self._rebuilds}
+        if self._index is not None:
+            stats.update(self._index.stats())
+        return stats
+
+
+_tool_discovery_service: Optional[ToolDiscoveryService] = None
+
+
+def get_tool_discovery_service() -> ToolDiscoveryService:
+    """Get or create the singleton ToolDiscoveryService instance.
+
+    Returns:
+        ToolDiscoveryService: The singleton discovery service instance.
+    """
+    global _tool_discovery_service  # pylint: disable=global-statement
+    if _tool_discovery_service is None:
+        _tool_discovery_service = ToolDiscoveryService()
+    return _tool_discovery_service
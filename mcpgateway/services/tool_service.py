@@ -41,7 +41,7 @@ import orjson
 from pydantic import ValidationError
 from sqlalchemy import and_, delete, desc, or_, select
 from sqlalchemy.exc import IntegrityError, OperationalError
-from sqlalchemy.orm import joinedload, selectinload, Session
+from sqlalchemy.orm import joinedload, Session
 
 # First-Party
 from mcpgateway.cache.global_config_cache import global_config_cache
@@ -51,9 +51,9 @@ from mcpgateway.common.models import Tool as PydanticTool
 from mcpgateway.common.models import ToolResult
 from mcpgateway.config import settings
 from mcpgateway.db import A2AAgent as DbA2AAgent
-from mcpgateway.db import fresh_db_session
+from mcpgateway.db import async_db_available, fresh_async_db_session, fresh_db_session
 from mcpgateway.db import Gateway as DbGateway
-from mcpgateway.db import get_for_update, server_tool_association
+from mcpgateway.db import get_for_update, reset_metric_counters, server_tool_association
 from mcpgateway.db import Tool as DbTool
 from mcpgateway.db import ToolMetric, ToolMetricsHourly
 from mcpgateway.observability import create_span
@@ -72,6 +72,7 @@ from mcpgateway.plugins.framework.constants import GATEWAY_METADATA, TOOL_METADA
 from mcpgateway.schemas import AuthenticationValues, ToolCreate, ToolRead, ToolUpdate, TopPerformer
 from mcpgateway.services.audit_trail_service import get_audit_trail_service
 from mcpgateway.services.event_service import EventService
+from mcpgateway.services.health_check_scheduler import get_health_check_scheduler
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.mcp_session_pool import get_mcp_session_pool, TransportType
 from mcpgateway.services.metrics_cleanup_service import delete_metrics_in_batches, pause_rollup_during_purge
@@ -81,6 +82,7 @@ from mcpgateway.services.observability_service import current_trace_id, Observab
 from mcpgateway.services.performance_tracker import get_performance_tracker
 from mcpgateway.services.structured_logger import get_structured_logger
 from mcpgateway.services.team_management_service import TeamManagementService
+from mcpgateway.services.tool_discovery_service import get_tool_discovery_service
 from mcpgateway.utils.correlation_id import get_correlation_id
 from mcpgateway.utils.create_slug import slugify
 from mcpgateway.utils.display_name import generate_display_name
@@ -88,9 +90,11 @@ from mcpgateway.utils.gateway_access import build_gateway_auth_headers, check_ga
 from mcpgateway.utils.metrics_common import build_top_performers
 from mcpgateway.utils.pagination import decode_cursor, encode_cursor, unified_paginate
 from mcpgateway.utils.passthrough_headers import compute_passthrough_headers_cached
+from mcpgateway.utils.rate_limiter import get_rate_limiter, RateLimitResult
 from mcpgateway.utils.retry_manager import ResilientHttpClient
+from mcpgateway.utils.search_index import apply_search_filter
 from mcpgateway.utils.services_auth import decode_auth
-from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr
 from mcpgateway.utils.ssl_context_cache import get_cached_ssl_context
 from mcpgateway.utils.url_auth import apply_query_param_auth, sanitize_exception_message, sanitize_url_for_logging
 from mcpgateway.utils.validate_signature import validate_signature
@@ -98,6 +102,7 @@ from mcpgateway.utils.validate_signature import validate_signature
 # Cache import (lazy to avoid circular dependencies)
 _REGISTRY_CACHE = None
 _TOOL_LOOKUP_CACHE = None
+_TOOL_RESULT_CACHE = None
 
 
 def _get_registry_cache():
@@ -130,6 +135,21 @@ def _get_tool_lookup_cache():
     return _TOOL_LOOKUP_CACHE
 
 
+def _get_tool_result_cache():
+    """Get tool result cache singleton lazily.
+
+    Returns:
+        ToolResultCache instance.
+    """
+    global _TOOL_RESULT_CACHE  # pylint: disable=global-statement
+    if _TOOL_RESULT_CACHE is None:
+        # First-Party
+        from mcpgateway.cache.tool_result_cache import tool_result_cache  # pylint: disable=import-outside-toplevel
+
+        _TOOL_RESULT_CACHE = tool_result_cache
+    return _TOOL_RESULT_CACHE
+
+
 # Initialize logging service first
 logging_service = LoggingService()
 logger = logging_service.get_logger(__name__)
@@ -399,6 +419,42 @@ class ToolTimeoutError(ToolInvocationError):
     """
 
 
+class ToolRateLimitError(ToolError):
+    """Raised when a tool call exceeds a configured rate limit.
+
+    Examples:
+        >>> from mcpgateway.utils.rate_limiter import RateLimitResult
+        >>> err = ToolRateLimitError("Rate limit exceeded for user", RateLimitResult(allowed=False, limit=10, remaining=0, retry_after=3, reset_after=6))
+        >>> err.result.headers()["Retry-After"]
+        '3'
+        >>> isinstance(err, ToolError)
+        True
+    """
+
+    def __init__(self, message: str, result: RateLimitResult):
+        """Initialize the error with the rejected rate limit check.
+
+        Args:
+            message: Error message.
+            result: Result of the check that rejected the call (carries the response headers).
+        """
+        self.result = result
+        super().__init__(message)
+
+    def rpc_error(self) -> Dict[str, Any]:
+        """Return the JSON-RPC error object sent with the HTTP 429 response.
+
+        Returns:
+            JSON-RPC error with the retry delay in ``data.retryAfter``.
+
+        Examples:
+            >>> from mcpgateway.utils.rate_limiter import RateLimitResult
+            >>> ToolRateLimitError("Rate limit exceeded for user", RateLimitResult(allowed=False, limit=10, remaining=0, retry_after=3, reset_after=6)).rpc_error()
+            {'code': -32000, 'message': 'Rate limit exceeded for user', 'data': {'retryAfter': 3}}
+        """
+        return {"code": -32000, "message": str(self), "data": {"retryAfter": int(self.result.headers()["Retry-After"])}}
+
+
 class ToolService:
     """Service for managing and invoking tools.
 
@@ -511,6 +567,35 @@ class ToolService:
 
         return top_performers
 
+    async def _enforce_rate_limits(self, name: str, tool_id: str, user_email: Optional[str], token_teams: Optional[List[str]], token_jti: Optional[str] = None) -> None:
+        """Count a tool call against the caller, team and tool rate limits.
+
+        Args:
+            name: Tool name (for the error message).
+            tool_id: Tool ID (empty in direct proxy mode, where the per-tool limit does not apply).
+            user_email: Calling user (None for unauthenticated calls).
+            token_teams: Team IDs from the caller's token.
+            token_jti: ID of the caller's token; the caller limit applies per token when set, per user otherwise.
+
+        Raises:
+            ToolRateLimitError: If any limit is exceeded.
+        """
+        if token_jti:
+            buckets = [(f"token:{token_jti}", settings.tool_rate_limit, "token")]
+        else:
+            buckets = [(f"user:{user_email or 'anonymous'}", settings.tool_rate_limit, "user")]
+        if settings.tool_rate_limit_per_team:
+            buckets.extend((f"team:{team_id}", settings.tool_rate_limit_per_team, f"team {team_id}") for team_id in token_teams or [])
+        if settings.tool_rate_limit_per_tool and tool_id:
+            buckets.append((f"tool:{tool_id}", settings.tool_rate_limit_per_tool, f"tool {name}"))
+
+        # Check every bucket in one step: a call rejected by one bucket uses up no quota in the others
+        buckets = [bucket for bucket in buckets if bucket[1] > 0]
+        results = await get_rate_limiter().hit_many([(key, limit, 60) for key, limit, _ in buckets])
+        for (_, limit, label), result in zip(buckets, results):
+            if not result.allowed:
+                raise ToolRateLimitError(f"Rate limit exceeded for {label}: {limit} tool calls per minute, retry after {result.headers()['Retry-After']}s", result)
+
     def _build_tool_cache_payload(self, tool: DbTool, gateway: Optional[DbGateway]) -> Dict[str, Any]:
         """Build cache payload for tool lookup by name.
 
@@ -775,23 +860,51 @@ class ToolService:
         # Mask custom headers unless the requester is allowed to modify this tool.
         # Safe default: if no requester context is provided, mask everything.
         headers = tool_dict.get("headers")
-        if headers:
-            can_view = requesting_user_is_admin
-            if not can_view and getattr(tool, "owner_email", None) == requesting_user_email:
-                can_view = True
-            if (
-                not can_view
-                and getattr(tool, "visibility", None) == "team"
-                and getattr(tool, "team_id", None) is not None
-                and requesting_user_team_roles
-                and requesting_user_team_roles.get(str(tool.team_id)) == "owner"
-            ):
-                can_view = True
-            if not can_view:
-                tool_dict["headers"] = {k: settings.masked_auth_value for k in headers}
+        if headers and not self._can_view_tool_headers(tool, requesting_user_email, requesting_user_is_admin, requesting_user_team_roles):
+            tool_dict["headers"] = {k: settings.masked_auth_value for k in headers}
 
         return ToolRead.model_validate(tool_dict)
 
+    @staticmethod
+    def _can_view_tool_headers(
+        tool: Any,
+        requesting_user_email: Optional[str],
+        requesting_user_is_admin: bool,
+        requesting_user_team_roles: Optional[Dict[str, str]],
+    ) -> bool:
+        """Return True if the requester may see a tool's custom header values.
+
+        Admins, the tool owner and owners of the tool's team (for team-visible
+        tools) can view them; everyone else gets masked values.
+
+        Args:
+            tool: DbTool or ToolRead exposing ``owner_email``, ``visibility`` and ``team_id``.
+            requesting_user_email: Email of the requesting user.
+            requesting_user_is_admin: Whether the requester is an admin.
+            requesting_user_team_roles: {team_id: role} for the requester.
+
+        Returns:
+            bool: True if headers can be shown unmasked.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> tool = SimpleNamespace(owner_email="o@x.com", visibility="team", team_id="t1")
+            >>> ToolService._can_view_tool_headers(tool, "o@x.com", False, None)
+            True
+            >>> ToolService._can_view_tool_headers(tool, "u@x.com", False, {"t1": "owner"})
+            True
+            >>> ToolService._can_view_tool_headers(tool, "u@x.com", False, {"t1": "member"})
+            False
+        """
+        if requesting_user_is_admin or getattr(tool, "owner_email", None) == requesting_user_email:
+            return True
+        return bool(
+            getattr(tool, "visibility", None) == "team"
+            and getattr(tool, "team_id", None) is not None
+            and requesting_user_team_roles
+            and requesting_user_team_roles.get(str(tool.team_id)) == "owner"
+        )
+
     async def _record_tool_metric(self, db: Session, tool: DbTool, start_time: float, success: bool, error_message: Optional[str]) -> None:
         """
         Records a metric for a tool invocation.
@@ -1726,6 +1839,7 @@ class ToolService:
         requesting_user_email: Optional[str] = None,
         requesting_user_is_admin: bool = False,
         requesting_user_team_roles: Optional[Dict[str, str]] = None,
+        search: Optional[str] = None,
     ) -> Union[tuple[List[ToolRead], Optional[str]], Dict[str, Any]]:
         """
         Retrieve a list of registered tools from the database with pagination support.
@@ -1752,6 +1866,8 @@ class ToolService:
             requesting_user_email (Optional[str]): Email of the requesting user for header masking.
             requesting_user_is_admin (bool): Whether the requester is an admin.
             requesting_user_team_roles (Optional[Dict[str, str]]): {team_id: role} for the requester.
+            search (Optional[str]): Full-text query over name, display name, URL, description and tags.
+                Results keep the listing order; search results are never cached.
 
         Returns:
             tuple[List[ToolRead], Optional[str]]: Tuple containing:
@@ -1786,7 +1902,7 @@ class ToolService:
         except Exception:
             converter_is_default = False
 
-        if cursor is None and user_email is None and token_teams is None and page is None and converter_is_default:
+        if cursor is None and user_email is None and token_teams is None and page is None and converter_is_default and not search:
             filters_hash = cache.hash_filters(include_inactive=include_inactive, tags=sorted(tags) if tags else None, gateway_id=gateway_id, limit=limit)
             cached = await cache.get("tools", filters_hash)
             if cached is not None:
@@ -1800,6 +1916,8 @@ class ToolService:
         # Apply active/inactive filter
         if not include_inactive:
             query = query.where(DbTool.enabled)
+        # Team-scoped first pages are served from cache entries keyed by visibility scope (see below)
+        scoped_access = None
         # Apply team-based access control if user_email is provided OR token_teams is explicitly set
         # This ensures unauthenticated requests with token_teams=[] only see public tools
         if user_email is not None or token_teams is not None:  # empty-string user_email -> public-only filtering (secure default)
@@ -1817,6 +1935,7 @@ class ToolService:
             # Public-only tokens can ONLY see public resources - no owner access
             is_public_only_token = token_teams is not None and len(token_teams) == 0
 
+            owner_condition = None
             if team_id:
                 # User requesting specific team - verify access
                 if team_id not in team_ids:
@@ -1826,8 +1945,8 @@ class ToolService:
                 ]
                 # Only include owner access for non-public-only tokens
                 if not is_public_only_token and user_email:
-                    access_conditions.append(and_(DbTool.team_id == team_id, DbTool.owner_email == user_email))
-                query = query.where(or_(*access_conditions))
+                    owner_condition = and_(DbTool.team_id == team_id, DbTool.owner_email == user_email)
+                    access_conditions.append(owner_condition)
             else:
                 # General access: public tools + team tools (+ owner tools if not public-only token)
                 access_conditions = [
@@ -1835,9 +1954,15 @@ class ToolService:
                 ]
                 # Only include owner access for non-public-only tokens with user_email
                 if not is_public_only_token and user_email:
-                    access_conditions.append(DbTool.owner_email == user_email)
+                    owner_condition = DbTool.owner_email == user_email
+                    access_conditions.append(owner_condition)
                 if team_ids:
                     access_conditions.append(and_(DbTool.team_id.in_(team_ids), DbTool.visibility.in_(["team", "public"])))
+
+            if cursor is None and page is None and converter_is_default and not search:
+                # The owner condition is the only user-specific part; the rest is shared by the team set
+                scoped_access = (team_ids, [c for c in access_conditions if c is not owner_condition], owner_condition)
+            else:
                 query = query.where(or_(*access_conditions))
 
             if visibility:
@@ -1852,19 +1977,85 @@ class ToolService:
 
         # Add tag filtering if tags are provided (supports both List[str] and List[Dict] formats)
         if tags:
-            query = query.where(json_contains_tag_expr(db, DbTool.tags, tags, match_any=True))
+            query = query.where(entity_tag_expr(DbTool.tags, tags, match_any=True))
+
+        # Full-text search (LIKE where the database has no search index)
+        query = apply_search_filter(db, query, DbTool, search)
+
+        if scoped_access is not None:
+            scoped_team_ids, shared_conditions, owner_condition = scoped_access
+
+            async def fetch_scope_part(owner_part: bool) -> Tuple[List[ToolRead], Optional[str]]:
+                """Fetch the owner or team part of a scoped listing, with masked headers.
+
+                The parts are shared through the registry cache (Redis included), so
+                header values never go into them; requesters allowed to see them get
+                the values from the database after retrieval.
+
+                Args:
+                    owner_part: True for the caller's own tools, False for public and team tools.
+
+                Returns:
+                    Tuple of (tools, next_cursor).
+                """
+                part_query = query.where(owner_condition if owner_part else or_(*shared_conditions))
+                if async_db_available():
+                    async with fresh_async_db_session() as async_db:
+                        part_db, part_cursor = await unified_paginate(db=db, query=part_query, cursor=None, limit=limit, async_db=async_db)
+                else:
+                    part_db, part_cursor = await unified_paginate(db=db, query=part_query, cursor=None, limit=limit)
+                db.commit()  # Release transaction to avoid idle-in-transaction
+                part = []
+                for s in part_db:
+                    try:
+                        tool_read = self.convert_tool_to_read(s, include_metrics=False, include_auth=False, requesting_user_is_admin=True)
+                        if tool_read.headers:
+                            tool_read = tool_read.model_copy(update={"headers": {k: settings.masked_auth_value for k in tool_read.headers}})
+                        part.append(tool_read)
+                    except (ValidationError, ValueError, KeyError, TypeError, binascii.Error) as e:
+                        logger.exception(f"Failed to convert tool {getattr(s, 'id', 'unknown')} ({getattr(s, 'name', 'unknown')}): {e}")
+                return (part, part_cursor)
+
+            tools, next_cursor = await cache.list_scoped(
+                "tools",
+                ToolRead,
+                fetch_scope_part,
+                scoped_team_ids,
+                owner_email=user_email if owner_condition is not None else None,
+                limit=limit,
+                include_inactive=include_inactive,
+                tags=sorted(tags) if tags else None,
+                gateway_id=gateway_id,
+                team_id=team_id,
+                visibility=visibility,
+            )
+            # Cached entries hold masked headers; load the real values the requester may see
+            viewable_ids = [t.id for t in tools if t.headers and self._can_view_tool_headers(t, requesting_user_email, requesting_user_is_admin, requesting_user_team_roles)]
+            if not viewable_ids:
+                return (tools, next_cursor)
+            headers_by_id = dict(db.execute(select(DbTool.id, DbTool.headers).where(DbTool.id.in_(viewable_ids))).all())
+            db.commit()  # Release transaction to avoid idle-in-transaction
+            result = [t.model_copy(update={"headers": headers_by_id[t.id]}) if t.id in headers_by_id else t for t in tools]
+            return (result, next_cursor)
 
         # Use unified pagination helper - handles both page and cursor pagination
-        pag_result = await unified_paginate(
-            db=db,
-            query=query,
-            page=page,
-            per_page=per_page,
-            cursor=cursor,
-            limit=limit,
-            base_url="/admin/tools",  # Used for page-based links
-            query_params={"include_inactive": include_inactive} if include_inactive else {},
-        )
+        paginate_kwargs = {
+            "db": db,
+            "query": query,
+            "page": page,
+            "per_page": per_page,
+            "cursor": cursor,
+            "limit": limit,
+            "base_url": "/admin/tools",  # Used for page-based links
+            "query_params": {"include_inactive": include_inactive} if include_inactive else {},
+        }
+        if page is None and async_db_available():
+            # Cursor-based listing on the async engine; gateway/email_team are eager-loaded,
+            # so conversion below does not need the session.
+            async with fresh_async_db_session() as async_db:
+                pag_result = await unified_paginate(**paginate_kwargs, async_db=async_db)
+        else:
+            pag_result = await unified_paginate(**paginate_kwargs)
 
         next_cursor = None
         # Extract servers based on pagination type
@@ -1974,7 +2165,7 @@ class ToolService:
             query = (
                 select(DbTool)
                 .options(joinedload(DbTool.gateway), joinedload(DbTool.email_team))
-                .options(selectinload(DbTool.metrics))
+                .options(joinedload(DbTool.metric_counter))
                 .join(server_tool_association, DbTool.id == server_tool_association.c.tool_id)
                 .where(server_tool_association.c.server_id == server_id)
             )
@@ -2144,7 +2335,7 @@ class ToolService:
                 query = query.where(DbTool.gateway_id == gateway_id)
 
         if tags:
-            query = query.where(json_contains_tag_expr(db, DbTool.tags, tags, match_any=True))
+            query = query.where(entity_tag_expr(DbTool.tags, tags, match_any=True))
 
         # Apply cursor filter (WHERE id > last_id)
         if last_id:
@@ -2342,6 +2533,7 @@ class ToolService:
             await cache.invalidate_tools()
             tool_lookup_cache = _get_tool_lookup_cache()
             await tool_lookup_cache.invalidate(tool_name, gateway_id=str(tool.gateway_id) if tool.gateway_id else None)
+            await _get_tool_result_cache().invalidate_tool(tool_id)
             # Also invalidate tags cache since tool tags may have changed
             # First-Party
             from mcpgateway.cache.admin_stats_cache import admin_stats_cache  # pylint: disable=import-outside-toplevel
@@ -2463,6 +2655,7 @@ class ToolService:
                     await cache.invalidate_tools()
                     tool_lookup_cache = _get_tool_lookup_cache()
                     await tool_lookup_cache.invalidate(tool.name, gateway_id=str(tool.gateway_id) if tool.gateway_id else None)
+                    await _get_tool_result_cache().invalidate_tool(tool_id)
 
                 if not tool.enabled:
                     # Inactive
@@ -2657,6 +2850,7 @@ class ToolService:
         plugin_context_table: Optional[PluginContextTable] = None,
         plugin_global_context: Optional[GlobalContext] = None,
         meta_data: Optional[Dict[str, Any]] = None,
+        token_jti: Optional[str] = None,
     ) -> ToolResult:
         """
         Invoke a registered tool and record execution metrics.
@@ -2678,6 +2872,8 @@ class ToolService:
             plugin_context_table: Optional plugin context table from previous hooks for cross-hook state sharing.
             plugin_global_context: Optional global context from middleware for consistency across hooks.
             meta_data: Optional metadata dictionary for additional context (e.g., request ID).
+            token_jti (Optional[str], optional): ID of the caller's token. Each token gets its own
+                rate limit bucket; calls without one are limited per user.
 
         Returns:
             Tool invocation result.
@@ -2686,6 +2882,7 @@ class ToolService:
             ToolNotFoundError: If tool not found or access denied.
             ToolInvocationError: If invocation fails.
             ToolTimeoutError: If tool invocation times out.
+            ToolRateLimitError: If the call exceeds a configured rate limit.
             PluginViolationError: If plugin blocks tool invocation.
             PluginError: If encounters issue with plugin
 
@@ -2698,6 +2895,12 @@ class ToolService:
         # pylint: disable=comparison-with-callable
         logger.info(f"Invoking tool: {name} with arguments: {arguments.keys() if arguments else None} and headers: {request_headers.keys() if request_headers else None}")
 
+        # Built-in discovery meta-tool on large virtual servers (listed in place of the full catalog)
+        if server_id and settings.tool_discovery_enabled and name == settings.tool_discovery_tool_name:
+            discovery = get_tool_discovery_service()
+            if await discovery.stub_tools(db, server_id) is not None:
+                return await discovery.invoke(db, server_id, arguments, user_email=user_email, token_teams=token_teams)
+
         # ═══════════════════════════════════════════════════════════════════════════
         # PHASE 1: Check for X-Context-Forge-Gateway-Id header for direct_proxy mode (no DB lookup)
         # ═══════════════════════════════════════════════════════════════════════════
@@ -2774,7 +2977,15 @@ class ToolService:
             # Use a single query to avoid a race between separate enabled/inactive lookups.
             # Use scalars().all() instead of scalar_one_or_none() to handle duplicate
             # tool names across teams without crashing on MultipleResultsFound.
-            tools = db.execute(select(DbTool).options(joinedload(DbTool.gateway)).where(DbTool.name == name)).scalars().all()
+            lookup_query = select(DbTool).options(joinedload(DbTool.gateway)).where(DbTool.name == name)
+            # With DB_ASYNC_ENABLED the lookup runs on the async engine; the loaded objects are
+            # only used to build the lookup payload below (same path as a lookup-cache hit).
+            loaded_async = async_db_available()
+            if loaded_async:
+                async with fresh_async_db_session() as async_db:
+                    tools = (await async_db.execute(lookup_query)).scalars().all()
+            else:
+                tools = db.execute(lookup_query).scalars().all()
 
             if not tools:
                 raise ToolNotFoundError(f"Tool not found: {name}")
@@ -2823,6 +3034,10 @@ class ToolService:
             # user-dependent, so a cached result could be wrong for other users.
             if not multiple_found:
                 await tool_lookup_cache.set(name, cache_payload, gateway_id=tool_payload.get("gateway_id"))
+            if loaded_async:
+                # Objects from the async session must not trigger lazy loads later on
+                tool = None
+                gateway = None
 
         if tool_payload.get("enabled") is False:
             raise ToolNotFoundError(f"Tool '{name}' exists but is inactive")
@@ -2986,6 +3201,18 @@ class ToolService:
         db.commit()  # End read-only transaction cleanly (commit not rollback to avoid inflating rollback stats)
         db.close()
 
+        if settings.tool_rate_limit_enabled:
+            await self._enforce_rate_limits(name, tool_id, user_email, token_teams, token_jti)
+
+        # Tool result cache: tools annotated readOnlyHint/idempotentHint opt in.
+        # Keep the caller's virtual server for the key (server_id is reused below for the plugin context).
+        result_cache = _get_tool_result_cache()
+        result_cache_ttl = result_cache.ttl_for(tool_annotations) if result_cache.enabled and tool_id and not is_direct_proxy else None
+        result_cache_server_id = server_id
+        result_cache_key: Optional[str] = None
+        result_cache_ticket = None
+        cacheable_result: Optional[Dict[str, Any]] = None
+
         # Plugin hook: tool pre-invoke
         # Use existing context_table from previous hooks if available
         context_table = plugin_context_table
@@ -3046,6 +3273,63 @@ class ToolService:
                 logger.warning(f"Failed to start observability span for tool invocation: {e}")
                 db_span_id = None
 
+        async def lookup_cached_result() -> Optional[ToolResult]:
+            """Serve from the tool result cache, or wait for an identical call already in flight.
+
+            Called after the pre-invoke hook, so the key uses the arguments the plugins let through.
+            On a miss this call may receive the single-flight ticket, released in the ``finally`` below.
+
+            Returns:
+                Optional[ToolResult]: Cached result, or None if the tool must be invoked.
+            """
+            nonlocal result_cache_key, result_cache_ticket
+            if not result_cache_ttl:
+                return None
+            result_cache_key = result_cache.make_key(tool_id, arguments, user_email, token_teams, result_cache_server_id)
+            cached_result, result_cache_ticket = await result_cache.lookup(result_cache_key, wait_timeout=effective_timeout)
+            if cached_result is None:
+                return None
+            try:
+                # First-Party
+                from mcpgateway.services.metrics import tool_result_cache_hits_counter  # pylint: disable=import-outside-toplevel
+
+                tool_result_cache_hits_counter.labels(tool_name=name).inc()
+            except Exception as exc:
+                logger.debug("Failed to increment tool_result_cache_hits_counter for %s: %s", name, exc, exc_info=True)
+            return ToolResult.model_validate(cached_result)
+
+        async def run_post_invoke(tool_result: ToolResult) -> ToolResult:
+            """Run the tool post-invoke hook on a result, upstream or cached.
+
+            Args:
+                tool_result: Result of the call.
+
+            Returns:
+                ToolResult: Result as modified by the plugins.
+            """
+            if not (self._plugin_manager and self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE)):
+                return tool_result
+            post_result, _ = await self._plugin_manager.invoke_hook(
+                ToolHookType.TOOL_POST_INVOKE,
+                payload=ToolPostInvokePayload(name=name, result=tool_result.model_dump(by_alias=True)),
+                global_context=global_context,
+                local_contexts=context_table,
+                violations_as_exceptions=True,
+            )
+            # Use modified payload if provided
+            if post_result.modified_payload:
+                # Reconstruct ToolResult from modified result
+                modified_result = post_result.modified_payload.result
+                if isinstance(modified_result, dict) and "content" in modified_result:
+                    # Safely obtain structured content using .get() to avoid KeyError when
+                    # plugins provide only the content without structured content fields.
+                    structured = modified_result.get("structuredContent") if "structuredContent" in modified_result else modified_result.get("structured_content")
+
+                    return ToolResult(content=modified_result["content"], structured_content=structured)
+                # If result is not in expected format, convert it to text content
+                return ToolResult(content=[TextContent(type="text", text=str(modified_result))])
+            return tool_result
+
         # Create a trace span for OpenTelemetry export (Jaeger, Zipkin, etc.)
         with create_span(
             "tool.invoke",
@@ -3116,6 +3400,11 @@ class ToolService:
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
 
+                    cached_tool_result = await lookup_cached_result()
+                    if cached_tool_result is not None:
+                        success = True
+                        return await run_post_invoke(cached_tool_result)
+
                     # Build the payload based on integration type
                     payload = arguments.copy()
 
@@ -3670,6 +3959,11 @@ class ToolService:
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
 
+                    cached_tool_result = await lookup_cached_result()
+                    if cached_tool_result is not None:
+                        success = True
+                        return await run_post_invoke(cached_tool_result)
+
                     tool_call_result = ToolResult(content=[TextContent(text="", type="text")])
                     if transport == "sse":
                         tool_call_result = await connect_to_sse_server(gateway_url, headers=headers)
@@ -3718,6 +4012,11 @@ class ToolService:
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
 
+                    cached_tool_result = await lookup_cached_result()
+                    if cached_tool_result is not None:
+                        success = True
+                        return await run_post_invoke(cached_tool_result)
+
                     # Build request data based on agent type
                     endpoint_url = a2a_agent_endpoint_url
                     if a2a_agent_type in ["generic", "jsonrpc"] or endpoint_url.endswith("/"):
@@ -3819,30 +4118,12 @@ class ToolService:
                 else:
                     tool_result = ToolResult(content=[TextContent(type="text", text="Invalid tool type")], is_error=True)
 
-                # Plugin hook: tool post-invoke
-                if self._plugin_manager and self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
-                    post_result, _ = await self._plugin_manager.invoke_hook(
-                        ToolHookType.TOOL_POST_INVOKE,
-                        payload=ToolPostInvokePayload(name=name, result=tool_result.model_dump(by_alias=True)),
-                        global_context=global_context,
-                        local_contexts=context_table,
-                        violations_as_exceptions=True,
-                    )
-                    # Use modified payload if provided
-                    if post_result.modified_payload:
-                        # Reconstruct ToolResult from modified result
-                        modified_result = post_result.modified_payload.result
-                        if isinstance(modified_result, dict) and "content" in modified_result:
-                            # Safely obtain structured content using .get() to avoid KeyError when
-                            # plugins provide only the content without structured content fields.
-                            structured = modified_result.get("structuredContent") if "structuredContent" in modified_result else modified_result.get("structured_content")
-
-                            tool_result = ToolResult(content=modified_result["content"], structured_content=structured)
-                        else:
-                            # If result is not in expected format, convert it to text content
-                            tool_result = ToolResult(content=[TextContent(type="text", text=str(modified_result))])
+                # Cache the upstream result: the post-invoke hook runs again on every hit
+                if result_cache_key and not tool_result.is_error:
+                    cacheable_result = tool_result.model_dump(by_alias=True, mode="json")
 
-                return tool_result
+                # Plugin hook: tool post-invoke
+                return await run_post_invoke(tool_result)
             except (PluginError, PluginViolationError):
                 raise
             except ToolTimeoutError as e:
@@ -3884,6 +4165,13 @@ class ToolService:
 
                 raise ToolInvocationError(f"Tool invocation failed: {error_message}")
             finally:
+                # Store the result and release callers waiting on this call (they invoke the tool themselves if it failed)
+                if result_cache_key and (result_cache_ticket is not None or cacheable_result is not None):
+                    try:
+                        await result_cache.complete(result_cache_key, tool_id, cacheable_result, result_cache_ticket, result_cache_ttl)
+                    except Exception as cache_error:
+                        logger.warning(f"Failed to store tool result in cache: {cache_error}")
+
                 # Calculate duration
                 duration_ms = (time.monotonic() - start_time) * 1000
 
@@ -3932,6 +4220,10 @@ class ToolService:
                     except Exception as metric_error:
                         logger.warning(f"Failed to record tool metric: {metric_error}")
 
+                # A successful call proves the gateway is healthy: lets the health scheduler skip its next probe
+                if success and gateway_id_str and settings.health_check_scheduler_enabled:
+                    get_health_check_scheduler().record_success(gateway_id_str)
+
                 # Log structured message with performance tracking (using local variables)
                 if success:
                     structured_logger.info(
@@ -4177,6 +4469,7 @@ class ToolService:
             tool_lookup_cache = _get_tool_lookup_cache()
             await tool_lookup_cache.invalidate(old_tool_name, gateway_id=str(old_gateway_id) if old_gateway_id else None)
             await tool_lookup_cache.invalidate(tool.name, gateway_id=str(tool.gateway_id) if tool.gateway_id else None)
+            await _get_tool_result_cache().invalidate_tool(tool_id)
             # Also invalidate tags cache since tool tags may have changed
             # First-Party
             from mcpgateway.cache.admin_stats_cache import admin_stats_cache  # pylint: disable=import-outside-toplevel
@@ -4391,6 +4684,7 @@ class ToolService:
         Args:
             event: Event to publish
         """
+        get_tool_discovery_service().handle_event(event)
         await self._event_service.publish_event(event)
 
     async def _validate_tool_url(self, url: str) -> None:
@@ -4507,6 +4801,7 @@ class ToolService:
         else:
             db.execute(delete(ToolMetric))
             db.execute(delete(ToolMetricsHourly))
+        reset_metric_counters(db, "tools", tool_id)
         db.commit()
 
         # Invalidate metrics cache
@@ -118,6 +118,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 from contextlib import suppress
+from dataclasses import dataclass
 import logging
 import os
 import shlex
@@ -559,6 +560,577 @@ class StdIOEndpoint:
             raise
 
 
+# ---------------------------------------------------------------------------#
+# Pooled stdio workers (--stdio-workers N)                                   #
+# ---------------------------------------------------------------------------#
+WORKER_RESTART_DELAY = 1.0  # seconds before a crashed worker is restarted
+WORKER_EXITED_ERROR_CODE = -32603  # JSON-RPC "internal error"
+
+
+class _WorkerOutput:
+    """Pub/Sub stand-in that hands one worker's stdout lines to its pool.
+
+    ``StdIOEndpoint`` only needs an object with an async ``publish`` method,
+    so each pooled worker gets one of these instead of the shared ``_PubSub``.
+
+    Examples:
+        >>> import asyncio
+        >>> seen = []
+        >>> class _Pool:
+        ...     async def _dispatch(self, index, line):
+        ...         seen.append((index, line))
+        >>> asyncio.run(_WorkerOutput(_Pool(), 2).publish("x"))
+        >>> seen
+        [(2, 'x')]
+    """
+
+    def __init__(self, pool: Any, index: int) -> None:
+        """Bind the output sink to a pool and worker index.
+
+        Args:
+            pool: The owning ``StdIOWorkerPool``.
+            index: Index of the worker whose stdout this sink receives.
+        """
+        self._pool = pool
+        self._index = index
+
+    async def publish(self, data: str) -> None:
+        """Forward one stdout line to the pool dispatcher.
+
+        Args:
+            data: Raw line read from the worker's stdout.
+        """
+        await self._pool._dispatch(self._index, data)  # pylint: disable=protected-access
+
+
+@dataclass
+class _PoolWorker:
+    """Book-keeping for one child process of a ``StdIOWorkerPool``.
+
+    Examples:
+        >>> w = _PoolWorker(0, StdIOEndpoint("cat", _PubSub()))
+        >>> (w.in_flight, w.initialized, w.restarts, w.is_alive())
+        (0, False, 0, False)
+    """
+
+    index: int
+    endpoint: StdIOEndpoint
+    in_flight: int = 0
+    initialized: bool = False
+    restarts: int = 0
+    supervisor: Optional[asyncio.Task[None]] = None
+
+    def is_alive(self) -> bool:
+        """Return True if the worker process is running.
+
+        Returns:
+            bool: True if the child process exists and has not exited.
+        """
+        proc = self.endpoint._proc  # pylint: disable=protected-access
+        return proc is not None and proc.returncode is None
+
+
+def _is_request(message: Any) -> bool:
+    """Return True if ``message`` is a JSON-RPC request (method and non-null id).
+
+    Args:
+        message: Decoded JSON-RPC message.
+
+    Returns:
+        bool: True for requests, False for notifications and responses.
+
+    Examples:
+        >>> _is_request({"jsonrpc": "2.0", "id": 1, "method": "ping"})
+        True
+        >>> _is_request({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        False
+        >>> _is_request({"jsonrpc": "2.0", "id": 1, "result": {}})
+        False
+    """
+    return isinstance(message, dict) and "method" in message and message.get("id") is not None
+
+
+class StdIOWorkerPool:
+    """Run N copies of a stdio MCP server behind one SSE endpoint.
+
+    The pool exposes the same ``start``/``stop``/``is_running``/``send`` surface
+    as ``StdIOEndpoint`` so the HTTP handlers can use either one:
+
+    - Requests go to the live worker with the fewest in-flight requests
+      (round-robin on ties). Each request id is rewritten to a pool-unique id
+      and mapped back on the way out, so a response is delivered only to the
+      SSE session that sent the request. Responses to callers without a
+      session (e.g. ``POST /mcp``) are published on the shared ``_PubSub``.
+    - Server notifications and server-initiated requests are broadcast to all
+      subscribers, as in single-process mode; replies to server-initiated
+      requests are routed back to the worker that asked.
+    - The first client ``initialize`` request is remembered and replayed to
+      each worker before the first request it is given, so every copy
+      completes the MCP handshake.
+    - Workers that exit are restarted after ``restart_delay`` seconds; their
+      in-flight requests are answered with a JSON-RPC error.
+
+    Examples:
+        >>> pool = StdIOWorkerPool("cat", _PubSub(), workers=3)
+        >>> len(pool._workers)
+        3
+        >>> pool.is_running()
+        False
+        >>> [w["queue_depth"] for w in pool.health()["workers"]]
+        [0, 0, 0]
+        >>> StdIOWorkerPool("cat", _PubSub(), workers=0)
+        Traceback (most recent call last):
+        ...
+        ValueError: workers must be >= 1
+    """
+
+    def __init__(
+        self,
+        cmd: str,
+        pubsub: _PubSub,
+        workers: int,
+        env_vars: Optional[Dict[str, str]] = None,
+        header_mappings: Optional[NormalizedMappings] = None,
+        restart_delay: float = WORKER_RESTART_DELAY,
+    ) -> None:
+        """Create the pool; no process is started until ``start()``.
+
+        Args:
+            cmd: The command string to execute for every worker.
+            pubsub: Shared publish-subscribe system for broadcast messages.
+            workers: Number of child processes to run.
+            env_vars: Optional environment variables for every worker.
+            header_mappings: Optional mapping of HTTP headers to environment variable names.
+            restart_delay: Seconds to wait before restarting a crashed worker.
+
+        Raises:
+            ValueError: If ``workers`` is less than 1.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self._cmd = cmd
+        self._pubsub = pubsub
+        self._restart_delay = restart_delay
+        self._workers = [_PoolWorker(i, StdIOEndpoint(cmd, _WorkerOutput(self, i), env_vars, header_mappings)) for i in range(workers)]  # type: ignore[arg-type]
+        self._sessions: Dict[str, asyncio.Queue[str]] = {}
+        # pool id -> (worker index, session id, original request id)
+        self._pending: Dict[int, Tuple[int, Optional[str], Any]] = {}
+        # pool ids of replayed ``initialize`` requests whose responses are swallowed
+        self._replay_ids: set[int] = set()
+        # pool id -> (worker index, original id) for server-initiated requests
+        self._server_requests: Dict[int, Tuple[int, Any]] = {}
+        self._init_request: Optional[Dict[str, Any]] = None
+        self._start_env: Optional[Dict[str, str]] = None
+        self._next_id = 0
+        self._rr = 0
+        self._started = False
+
+    async def start(self, additional_env_vars: Optional[Dict[str, str]] = None) -> None:
+        """Start every worker and its crash supervisor.
+
+        Args:
+            additional_env_vars: Optional environment variables passed to each
+                worker's ``StdIOEndpoint.start``; reused on crash restarts.
+        """
+        if self._started:
+            await self.stop()
+
+        LOGGER.info(f"Starting {len(self._workers)} stdio workers: {self._cmd}")
+        self._start_env = additional_env_vars
+        for worker in self._workers:
+            worker.initialized = False
+            await worker.endpoint.start(additional_env_vars)
+            worker.supervisor = asyncio.create_task(self._supervise(worker))
+        self._started = True
+
+    async def stop(self) -> None:
+        """Stop every worker and fail requests that are still in flight.
+
+        Examples:
+            >>> import asyncio
+            >>> asyncio.run(StdIOWorkerPool("cat", _PubSub(), workers=2).stop())  # safe before start
+        """
+        self._started = False
+        for worker in self._workers:
+            if worker.supervisor:
+                worker.supervisor.cancel()
+                with suppress(BaseException):
+                    await worker.supervisor
+                worker.supervisor = None
+        for worker in self._workers:
+            await worker.endpoint.stop()
+            await self._fail_in_flight(worker, "stdio worker pool stopped")
+
+    def is_running(self) -> bool:
+        """Check if the pool has been started.
+
+        Returns:
+            bool: True between ``start()`` and ``stop()``.
+        """
+        return self._started
+
+    def register_session(self, session_id: str, queue: "asyncio.Queue[str]") -> None:
+        """Deliver responses for ``session_id`` to ``queue``.
+
+        Args:
+            session_id: SSE session identifier handed out in the endpoint event.
+            queue: The session's subscriber queue.
+        """
+        self._sessions[session_id] = queue
+
+    def unregister_session(self, session_id: str) -> None:
+        """Stop delivering responses for ``session_id``.
+
+        Args:
+            session_id: SSE session identifier.
+        """
+        self._sessions.pop(session_id, None)
+
+    async def send(self, raw: str, session_id: Optional[str] = None) -> None:
+        """Route a client message to the appropriate worker(s).
+
+        Args:
+            raw: A single JSON-RPC message or batch, as sent by the client.
+            session_id: SSE session that should receive the responses, or None
+                to publish them on the shared ``_PubSub``.
+        """
+        try:
+            message = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            await self._pick_worker().endpoint.send(raw.rstrip() + "\n")
+            return
+
+        items = message if isinstance(message, list) else [message]
+        if any(_is_request(item) for item in items):
+            await self._route_requests(message, items, session_id)
+            return
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            if "method" in item:
+                await self._route_notification(item, session_id)
+            else:
+                await self._route_reply(item)
+
+    def health(self) -> Dict[str, Any]:
+        """Report per-worker state for ``/healthz``.
+
+        Returns:
+            Dict[str, Any]: Overall status plus pid, liveness, in-flight queue
+            depth and restart count for each worker.
+        """
+        workers = [
+            {
+                "index": w.index,
+                "pid": w.endpoint._proc.pid if w.is_alive() else None,  # pylint: disable=protected-access
+                "running": w.is_alive(),
+                "queue_depth": w.in_flight,
+                "restarts": w.restarts,
+            }
+            for w in self._workers
+        ]
+        return {
+            "status": "ok" if any(w["running"] for w in workers) else "unavailable",
+            "workers": workers,
+            "sessions": len(self._sessions),
+            "pending": len(self._pending),
+        }
+
+    # ----- routing ----------------------------------------------------------#
+    def _new_id(self) -> int:
+        """Allocate a pool-unique JSON-RPC id.
+
+        Returns:
+            int: The next id.
+        """
+        self._next_id += 1
+        return self._next_id
+
+    def _pick_worker(self) -> _PoolWorker:
+        """Return the live worker with the fewest in-flight requests.
+
+        Returns:
+            _PoolWorker: Selected worker.
+
+        Raises:
+            RuntimeError: If no worker is running.
+        """
+        count = len(self._workers)
+        start = self._rr
+        self._rr = (self._rr + 1) % count
+        best: Optional[_PoolWorker] = None
+        for offset in range(count):
+            worker = self._workers[(start + offset) % count]
+            if worker.is_alive() and (best is None or worker.in_flight < best.in_flight):
+                best = worker
+        if best is None:
+            raise RuntimeError("no stdio workers available")
+        return best
+
+    async def _route_requests(self, message: Any, items: List[Any], session_id: Optional[str]) -> None:
+        """Rewrite request ids and send a request (or batch) to one worker.
+
+        Args:
+            message: Decoded message as sent by the client.
+            items: ``message`` as a list of JSON-RPC items.
+            session_id: Session that should receive the responses.
+        """
+        worker = self._pick_worker()
+        handshake = next((item for item in items if _is_request(item) and item["method"] == "initialize"), None)
+        prefix = ""
+        if handshake is not None:
+            self._init_request = {"method": "initialize", "params": handshake.get("params", {})}
+            worker.initialized = True
+        elif not worker.initialized and self._init_request is not None:
+            prefix = self._replay_handshake(worker)
+
+        for item in items:
+            if _is_request(item):
+                pool_id = self._new_id()
+                self._pending[pool_id] = (worker.index, session_id, item["id"])
+                item["id"] = pool_id
+                worker.in_flight += 1
+        # One write keeps a replayed handshake ahead of the request
+        await worker.endpoint.send(prefix + orjson.dumps(message).decode() + "\n")
+
+    def _replay_handshake(self, worker: _PoolWorker) -> str:
+        """Build the ``initialize`` + ``notifications/initialized`` lines for a fresh worker.
+
+        Args:
+            worker: Worker that has not completed the MCP handshake.
+
+        Returns:
+            str: Newline-terminated lines to write before the worker's first request.
+        """
+        pool_id = self._new_id()
+        self._pending[pool_id] = (worker.index, None, None)
+        self._replay_ids.add(pool_id)
+        worker.in_flight += 1
+        worker.initialized = True
+        LOGGER.debug(f"Replaying initialize to stdio worker {worker.index}")
+        request = orjson.dumps({"jsonrpc": "2.0", "id": pool_id, **self._init_request}).decode()  # type: ignore[dict-item]
+        notification = orjson.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}).decode()
+        return f"{request}\n{notification}\n"
+
+    async def _route_notification(self, item: Dict[str, Any], session_id: Optional[str]) -> None:
+        """Send a client notification to the worker(s) that need it.
+
+        ``notifications/cancelled`` goes only to the worker handling the
+        cancelled request (with its id rewritten); anything else goes to every
+        live worker that has completed the handshake.
+
+        Args:
+            item: JSON-RPC notification.
+            session_id: Session that sent the notification.
+        """
+        if item["method"] == "notifications/cancelled":
+            params = item.get("params") or {}
+            for pool_id, (index, owner, original_id) in self._pending.items():
+                if owner == session_id and original_id == params.get("requestId"):
+                    item["params"] = {**params, "requestId": pool_id}
+                    worker = self._workers[index]
+                    if worker.is_alive():
+                        await worker.endpoint.send(orjson.dumps(item).decode() + "\n")
+                    return
+            return
+
+        line = orjson.dumps(item).decode() + "\n"
+        for worker in self._workers:
+            if worker.is_alive() and (worker.initialized or self._init_request is None):
+                await worker.endpoint.send(line)
+
+    async def _route_reply(self, item: Dict[str, Any]) -> None:
+        """Return a client reply to the worker whose request it answers.
+
+        Args:
+            item: JSON-RPC response to a server-initiated request.
+        """
+        pool_id = item.get("id")
+        entry = self._server_requests.pop(pool_id, None) if isinstance(pool_id, int) else None
+        if entry is None:
+            LOGGER.warning(f"Dropping reply to unknown server request id {pool_id!r}")
+            return
+        index, original_id = entry
+        item["id"] = original_id
+        worker = self._workers[index]
+        if worker.is_alive():
+            await worker.endpoint.send(orjson.dumps(item).decode() + "\n")
+
+    def _claim_response(self, item: Dict[str, Any]) -> Tuple[bool, Optional[str], bool]:
+        """Map a worker response back to its original id and session.
+
+        Args:
+            item: JSON-RPC response emitted by a worker (modified in place).
+
+        Returns:
+            Tuple[bool, Optional[str], bool]: ``(mapped, session_id, internal)``;
+            ``internal`` is True for replayed handshake responses.
+        """
+        pool_id = item.get("id")
+        entry = self._pending.pop(pool_id, None) if isinstance(pool_id, int) else None
+        if entry is None:
+            return False, None, False
+        index, session_id, original_id = entry
+        worker = self._workers[index]
+        worker.in_flight = max(0, worker.in_flight - 1)
+        if pool_id in self._replay_ids:
+            self._replay_ids.discard(pool_id)
+            return True, None, True
+        item["id"] = original_id
+        return True, session_id, False
+
+    async def _dispatch(self, index: int, line: str) -> None:
+        """Deliver one stdout line from worker ``index``.
+
+        Args:
+            index: Index of the worker that produced the line.
+            line: Raw stdout line.
+        """
+        try:
+            message = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            await self._pubsub.publish(line)
+            return
+
+        if isinstance(message, dict):
+            if "method" in message:
+                if message.get("id") is not None:
+                    pool_id = self._new_id()
+                    self._server_requests[pool_id] = (index, message["id"])
+                    message["id"] = pool_id
+                    line = orjson.dumps(message).decode()
+                await self._pubsub.publish(line)
+                return
+            mapped, session_id, internal = self._claim_response(message)
+            if internal:
+                return
+            await self._deliver(session_id, orjson.dumps(message).decode() if mapped else line)
+            return
+
+        if isinstance(message, list):
+            owner: Optional[str] = None
+            kept: List[Any] = []
+            for item in message:
+                if isinstance(item, dict) and "method" not in item:
+                    mapped, session_id, internal = self._claim_response(item)
+                    if internal:
+                        continue
+                    if mapped:
+                        owner = session_id
+                kept.append(item)
+            if kept:
+                await self._deliver(owner, orjson.dumps(kept).decode())
+            return
+
+        await self._pubsub.publish(line)
+
+    async def _deliver(self, session_id: Optional[str], data: str) -> None:
+        """Send ``data`` to one session, or broadcast it when there is none.
+
+        Args:
+            session_id: Target session, or None to publish on the shared ``_PubSub``.
+            data: Serialized JSON-RPC message.
+        """
+        if session_id is None:
+            await self._pubsub.publish(data)
+            return
+        queue = self._sessions.get(session_id)
+        if queue is None:
+            LOGGER.debug(f"Dropping response for closed session {session_id}")
+            return
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            LOGGER.warning(f"Session {session_id} queue full; dropping response")
+
+    # ----- crash handling ---------------------------------------------------#
+    async def _fail_in_flight(self, worker: _PoolWorker, reason: str) -> None:
+        """Answer every request pending on ``worker`` with a JSON-RPC error.
+
+        Args:
+            worker: Worker that exited or was stopped.
+            reason: Error message returned to the clients.
+        """
+        for pool_id, (index, session_id, original_id) in list(self._pending.items()):
+            if index != worker.index:
+                continue
+            del self._pending[pool_id]
+            if pool_id in self._replay_ids:
+                self._replay_ids.discard(pool_id)
+                continue
+            error = {"jsonrpc": "2.0", "id": original_id, "error": {"code": WORKER_EXITED_ERROR_CODE, "message": reason}}
+            await self._deliver(session_id, orjson.dumps(error).decode())
+        for pool_id, (index, _) in list(self._server_requests.items()):
+            if index == worker.index:
+                del self._server_requests[pool_id]
+        worker.in_flight = 0
+
+    async def _supervise(self, worker: _PoolWorker) -> None:
+        """Restart ``worker`` whenever its stdout reaches EOF.
+
+        Args:
+            worker: Worker to watch; cancelled by ``stop()``.
+        """
+        while True:
+            pump = worker.endpoint._pump_task  # pylint: disable=protected-access
+            if pump is None:
+                return
+            await asyncio.wait({pump})
+
+            proc = worker.endpoint._proc  # pylint: disable=protected-access
+            LOGGER.warning(f"stdio worker {worker.index} exited (returncode={proc.returncode if proc else None}); restarting in {self._restart_delay}s")
+            worker.initialized = False
+            await self._fail_in_flight(worker, "stdio worker exited before responding")
+            await asyncio.sleep(self._restart_delay)
+
+            worker.restarts += 1
+            try:
+                await worker.endpoint.start(self._start_env)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.error(f"Failed to restart stdio worker {worker.index}: {exc}")
+
+
+def _make_stdio(cmd: str, pubsub: _PubSub, workers: int = 1, header_mappings: Optional[NormalizedMappings] = None) -> StdIOEndpoint | StdIOWorkerPool:
+    """Create a single stdio endpoint, or a worker pool when ``workers > 1``.
+
+    Args:
+        cmd: The command to run.
+        pubsub: Shared publish-subscribe system.
+        workers: Number of child processes.
+        header_mappings: Optional mapping of HTTP headers to environment variable names.
+
+    Returns:
+        StdIOEndpoint | StdIOWorkerPool: The endpoint used by the HTTP handlers.
+
+    Examples:
+        >>> type(_make_stdio("cat", _PubSub())).__name__
+        'StdIOEndpoint'
+        >>> type(_make_stdio("cat", _PubSub(), workers=4)).__name__
+        'StdIOWorkerPool'
+    """
+    if workers > 1:
+        return StdIOWorkerPool(cmd, pubsub, workers, header_mappings=header_mappings)
+    return StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings)
+
+
+def _pool_health_response(pool: StdIOWorkerPool) -> Response:
+    """Build the ``/healthz`` response for a worker pool.
+
+    Args:
+        pool: The running worker pool.
+
+    Returns:
+        Response: JSON report; ``503`` when no worker is running.
+
+    Examples:
+        >>> resp = _pool_health_response(StdIOWorkerPool("cat", _PubSub(), workers=2))
+        >>> resp.status_code
+        503
+    """
+    report = pool.health()
+    return ORJSONResponse(report, status_code=status.HTTP_200_OK if report["status"] == "ok" else status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
 # ---------------------------------------------------------------------------#
 # SSE Event Parser                                                           #
 # ---------------------------------------------------------------------------#
@@ -648,7 +1220,7 @@ class SSEEvent:
 
 def _build_fastapi(
     pubsub: _PubSub,
-    stdio: StdIOEndpoint,
+    stdio: StdIOEndpoint | StdIOWorkerPool,
     keep_alive: float = KEEP_ALIVE_INTERVAL,
     sse_path: str = "/sse",
     message_path: str = "/message",
@@ -662,7 +1234,7 @@ def _build_fastapi(
 
     Args:
         pubsub: The publish/subscribe system for message routing.
-        stdio: The stdio endpoint for subprocess communication.
+        stdio: The stdio endpoint (or worker pool) for subprocess communication.
         keep_alive: Interval in seconds for keepalive messages. Defaults to KEEP_ALIVE_INTERVAL.
         sse_path: Path for the SSE endpoint. Defaults to "/sse".
         message_path: Path for the message endpoint. Defaults to "/message".
@@ -738,6 +1310,8 @@ def _build_fastapi(
 
         queue = pubsub.subscribe()
         session_id = uuid.uuid4().hex
+        if isinstance(stdio, StdIOWorkerPool):
+            stdio.register_session(session_id, queue)
 
         async def event_gen() -> AsyncIterator[Dict[str, Any]]:
             """Generate Server-Sent Events for the SSE stream.
@@ -796,6 +1370,8 @@ def _build_fastapi(
             finally:
                 if pubsub:
                     pubsub.unsubscribe(queue)
+                if isinstance(stdio, StdIOWorkerPool):
+                    stdio.unregister_session(session_id)
 
         return EventSourceResponse(
             event_gen(),
@@ -822,8 +1398,6 @@ def _build_fastapi(
             Response: ``202 Accepted`` if the payload is forwarded successfully,
             or ``400 Bad Request`` when the body is not valid JSON.
         """
-        _ = session_id  # Unused but required for API compatibility
-
         # Extract environment variables from headers if dynamic env is enabled
         additional_env_vars = {}
         if header_mappings:
@@ -851,7 +1425,10 @@ def _build_fastapi(
                 f"Invalid JSON payload: {exc}",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
-        await stdio.send(payload.decode().rstrip() + "\n")
+        if isinstance(stdio, StdIOWorkerPool):
+            await stdio.send(payload.decode(), session_id=session_id)
+        else:
+            await stdio.send(payload.decode().rstrip() + "\n")
         return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
     # ----- Liveness ---------------------------------------------------------#
@@ -860,8 +1437,11 @@ def _build_fastapi(
         """Health check endpoint.
 
         Returns:
-            Response: A plain text response with "ok" status.
+            Response: A plain text response with "ok" status, or a JSON report
+            with per-worker queue depth when running a worker pool.
         """
+        if isinstance(stdio, StdIOWorkerPool):
+            return _pool_health_response(stdio)
         return PlainTextResponse("ok")
 
     return app
@@ -957,6 +1537,12 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
         >>> args.keepAlive
         60
 
+        >>> # Test pooled stdio workers
+        >>> _parse_args(["--stdio", "cat"]).stdio_workers
+        1
+        >>> _parse_args(["--stdio", "cat", "--stdio-workers", "4"]).stdio_workers
+        4
+
         >>> # Test connect-sse with stdio command
         >>> args = _parse_args(["--connect-sse", "http://example.com/sse", "--stdioCommand", "uvx mcp-server-git"])
         >>> args.stdioCommand
@@ -1024,6 +1610,13 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
         default=KEEP_ALIVE_INTERVAL,
         help=f"Keep-alive interval in seconds (default: {KEEP_ALIVE_INTERVAL})",
     )
+    p.add_argument(
+        "--stdio-workers",
+        dest="stdio_workers",
+        type=int,
+        default=1,
+        help="Number of copies of the --stdio command to run; requests are load-balanced and responses routed to the sending session (default: 1)",
+    )
 
     # For SSE to stdio mode
     p.add_argument(
@@ -1053,6 +1646,8 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     )
 
     args = p.parse_args(argv)
+    if args.stdio_workers < 1:
+        p.error("--stdio-workers must be >= 1")
     # streamableHttp is now supported, no need to raise NotImplementedError
     return args
 
@@ -1067,6 +1662,7 @@ async def _run_stdio_to_sse(
     message_path: str = "/message",
     keep_alive: float = KEEP_ALIVE_INTERVAL,
     header_mappings: Optional[NormalizedMappings] = None,
+    stdio_workers: int = 1,
 ) -> None:
     """Run stdio to SSE bridge.
 
@@ -1083,6 +1679,7 @@ async def _run_stdio_to_sse(
         message_path: Path for the message endpoint. Defaults to "/message".
         keep_alive: Keep-alive interval in seconds. Defaults to KEEP_ALIVE_INTERVAL.
         header_mappings: Optional mapping of HTTP headers to environment variables.
+        stdio_workers: Number of copies of ``cmd`` to run. Defaults to 1.
 
     Examples:
         >>> import asyncio # doctest: +SKIP
@@ -1093,7 +1690,7 @@ async def _run_stdio_to_sse(
         True
     """
     pubsub = _PubSub()
-    stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings)
+    stdio = _make_stdio(cmd, pubsub, stdio_workers, header_mappings)
     await stdio.start()
 
     app = _build_fastapi(pubsub, stdio, keep_alive=keep_alive, sse_path=sse_path, message_path=message_path, cors_origins=cors, header_mappings=header_mappings)
@@ -1808,6 +2405,7 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     stateless: bool = False,
     json_response: bool = False,
     header_mappings: Optional[NormalizedMappings] = None,
+    stdio_workers: int = 1,
 ) -> None:
     """Run a stdio server and expose it via multiple protocols simultaneously.
 
@@ -1825,6 +2423,7 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
         stateless: Whether to use stateless mode for streamable HTTP.
         json_response: Whether to return JSON responses for streamable HTTP.
         header_mappings: Optional mapping of HTTP headers to environment variables.
+        stdio_workers: Number of copies of ``cmd`` to run behind the endpoints. Defaults to 1.
     """
     LOGGER.info(f"Starting multi-protocol server for command: {cmd}")
     LOGGER.info(f"Protocols: SSE={expose_sse}, StreamableHTTP={expose_streamable_http}")
@@ -1833,7 +2432,7 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     pubsub = _PubSub() if (expose_sse or expose_streamable_http) else None
 
     # Create the stdio endpoint
-    stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings) if (expose_sse or expose_streamable_http) and pubsub else None
+    stdio = _make_stdio(cmd, pubsub, stdio_workers, header_mappings) if (expose_sse or expose_streamable_http) and pubsub else None
 
     # Create fastapi app and middleware
     app = FastAPI()
@@ -1882,6 +2481,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
 
             queue = pubsub.subscribe()
             session_id = uuid.uuid4().hex
+            if isinstance(stdio, StdIOWorkerPool):
+                stdio.register_session(session_id, queue)
 
             async def event_gen() -> AsyncIterator[Dict[str, Any]]:
                 """Generate SSE events for the client.
@@ -1918,6 +2519,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                 finally:
                     if pubsub:
                         pubsub.unsubscribe(queue)
+                    if isinstance(stdio, StdIOWorkerPool):
+                        stdio.unregister_session(session_id)
 
             return EventSourceResponse(
                 event_gen(),
@@ -1939,8 +2542,6 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
             Returns:
                 Response: Acknowledgement of message receipt.
             """
-            _ = session_id
-
             # Extract environment variables from headers if dynamic env is enabled
             additional_env_vars = {}
             if header_mappings and stdio:
@@ -1970,7 +2571,10 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                 )
             if not stdio:
                 raise RuntimeError("Stdio endpoint not available")
-            await stdio.send(payload.decode().rstrip() + "\n")
+            if isinstance(stdio, StdIOWorkerPool):
+                await stdio.send(payload.decode(), session_id=session_id)
+            else:
+                await stdio.send(payload.decode().rstrip() + "\n")
             return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
     # Add health check
@@ -1979,8 +2583,10 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
         """Health check endpoint.
 
         Returns:
-            Response: Health status response.
+            Response: Health status response (per-worker JSON report in pooled mode).
         """
+        if isinstance(stdio, StdIOWorkerPool):
+            return _pool_health_response(stdio)
         return PlainTextResponse("ok")
 
     # Streamable HTTP support
@@ -2429,6 +3035,7 @@ def main(argv: Optional[Sequence[str]] | None = None) -> None:
                     stateless=getattr(args, "stateless", False),
                     json_response=getattr(args, "jsonResponse", False),
                     header_mappings=header_mappings,
+                    stdio_workers=getattr(args, "stdio_workers", 1),
                 )
             )
 
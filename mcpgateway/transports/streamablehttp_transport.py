@@ -64,7 +64,8 @@ from mcpgateway.services.completion_service import CompletionService
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.prompt_service import PromptService
 from mcpgateway.services.resource_service import ResourceService
-from mcpgateway.services.tool_service import ToolService
+from mcpgateway.services.tool_discovery_service import get_tool_discovery_service
+from mcpgateway.services.tool_service import ToolRateLimitError, ToolService
 from mcpgateway.transports.redis_event_store import RedisEventStore
 from mcpgateway.utils.gateway_access import build_gateway_auth_headers, check_gateway_access, extract_gateway_id_from_headers, GATEWAY_ID_HEADER
 from mcpgateway.utils.orjson_response import ORJSONResponse
@@ -88,6 +89,8 @@ mcp_app: Server[Any] = Server("mcp-streamable-http")
 server_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("server_id", default="default_server_id")
 request_headers_var: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar("request_headers", default={})
 user_context_var: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar("user_context", default={})
+# Tool calls of the current request rejected by a rate limit (answered with HTTP 429, as on /rpc)
+tool_rate_limit_var: contextvars.ContextVar[Optional[List[ToolRateLimitError]]] = contextvars.ContextVar("tool_rate_limit", default=None)
 
 # ------------------------------ Event store ------------------------------
 
@@ -824,6 +827,7 @@ async def call_tool(name: str, arguments: dict) -> Union[
                 token_teams=token_teams,
                 server_id=server_id,
                 meta_data=meta_data,
+                token_jti=user_context.get("jti") if user_context else None,
             )
             if not result or not result.content:
                 logger.warning(f"No content returned by tool: {name}")
@@ -938,6 +942,12 @@ async def call_tool(name: str, arguments: dict) -> Union[
                 return (unstructured, structured)
 
             return unstructured
+    except ToolRateLimitError as e:
+        # Turned into an HTTP 429 with rate limit headers by SessionManagerWrapper.handle_streamable_http
+        rejected = tool_rate_limit_var.get()
+        if rejected is not None:
+            rejected.append(e)
+        raise
     except Exception as e:
         logger.exception(f"Error calling tool '{name}': {e}")
         # Re-raise the exception so the MCP SDK can properly convert it to an error response
@@ -945,6 +955,54 @@ async def call_tool(name: str, arguments: dict) -> Union[
         raise
 
 
+def _rate_limit_headers(headers: Any) -> List[Tuple[bytes, bytes]]:
+    """Pick the ``RateLimit-*`` and ``Retry-After`` headers of a ``/rpc`` response to pass on.
+
+    Args:
+        headers: Response headers (mapping of name to value).
+
+    Returns:
+        ASGI header pairs.
+
+    Examples:
+        >>> _rate_limit_headers({"Content-Type": "application/json", "RateLimit-Limit": "10", "Retry-After": "2"})
+        [(b'ratelimit-limit', b'10'), (b'retry-after', b'2')]
+    """
+    return [(name.lower().encode(), value.encode()) for name, value in headers.items() if name.lower().startswith("ratelimit-") or name.lower() == "retry-after"]
+
+
+def _rate_limited_response(start: Dict[str, Any], body: bytes, error: ToolRateLimitError) -> Tuple[Dict[str, Any], bytes]:
+    """Turn the SDK's JSON response to a rate limited tool call into the HTTP 429 ``/rpc`` returns.
+
+    Args:
+        start: ``http.response.start`` message of the SDK response.
+        body: JSON-RPC response body of the SDK response.
+        error: Rate limit error raised by the tool call.
+
+    Returns:
+        Tuple of the response start message and body to send instead.
+
+    Examples:
+        >>> from mcpgateway.utils.rate_limiter import RateLimitResult
+        >>> error = ToolRateLimitError("Rate limit exceeded for user", RateLimitResult(allowed=False, limit=10, remaining=0, retry_after=3, reset_after=6))
+        >>> start = {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json"), (b"content-length", b"2")]}
+        >>> start, body = _rate_limited_response(start, b'{"jsonrpc":"2.0","id":7,"result":{"isError":true}}', error)
+        >>> start["status"], dict(start["headers"])[b"retry-after"], dict(start["headers"])[b"content-length"] == str(len(body)).encode()
+        (429, b'3', True)
+        >>> orjson.loads(body)
+        {'jsonrpc': '2.0', 'error': {'code': -32000, 'message': 'Rate limit exceeded for user', 'data': {'retryAfter': 3}}, 'id': 7}
+    """
+    try:
+        request_id = orjson.loads(body).get("id")
+    except (orjson.JSONDecodeError, AttributeError):
+        request_id = None
+    body = orjson.dumps({"jsonrpc": "2.0", "error": error.rpc_error(), "id": request_id})
+    headers = [(name, value) for name, value in start.get("headers", []) if name.lower() != b"content-length"]
+    headers.append((b"content-length", str(len(body)).encode()))
+    headers.extend(_rate_limit_headers(error.result.headers()))
+    return {**start, "status": 429, "headers": headers}, body
+
+
 async def _get_request_context_or_default() -> Tuple[str, dict[str, Any], dict[str, Any]]:
     """Retrieve request context information for the current execution.
 
@@ -1026,7 +1084,7 @@ def _normalize_jwt_payload(payload: dict[str, Any]) -> dict[str, Any]:
     """Normalize a raw JWT payload to the canonical user context shape.
 
     Converts raw JWT fields (sub, token_use, nested user.is_admin) into the
-    canonical ``{email, teams, is_admin, is_authenticated}`` dict that MCP
+    canonical ``{email, teams, is_admin, is_authenticated, jti}`` dict that MCP
     handlers expect.  This mirrors the normalization performed by
     ``streamable_http_auth`` so that the stateful-session fallback path in
     ``_get_request_context_or_default`` returns an identical shape.
@@ -1035,7 +1093,7 @@ def _normalize_jwt_payload(payload: dict[str, Any]) -> dict[str, Any]:
         payload: Raw JWT payload dict from ``require_auth_override``.
 
     Returns:
-        Canonical user context dict with keys email, teams, is_admin, is_authenticated.
+        Canonical user context dict with keys email, teams, is_admin, is_authenticated, jti.
     """
     email = payload.get("sub") or payload.get("email")
     is_admin = payload.get("is_admin", False)
@@ -1067,6 +1125,7 @@ def _normalize_jwt_payload(payload: dict[str, Any]) -> dict[str, Any]:
         "teams": final_teams,
         "is_admin": is_admin,
         "is_authenticated": True,
+        "jti": payload.get("jti"),
     }
 
 
@@ -1157,6 +1216,11 @@ async def list_tools() -> List[types.Tool]:
                     logger.warning(f"Server {server_id} not found in database")
                     return []
 
+                # Large catalog: list only the search meta-tool
+                discovery_tools = await get_tool_discovery_service().stub_tools(db, server_id)
+                if discovery_tools is not None:
+                    return [types.Tool(**tool) for tool in discovery_tools]
+
                 # Default cache mode: use database
                 tools = await tool_service.list_server_tools(db, server_id, user_email=user_email, token_teams=token_teams, _request_headers=request_headers)
                 return [types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools]
@@ -1882,6 +1946,7 @@ class SessionManagerWrapper:
                     ]
                     if mcp_session_id != "not-provided":
                         response_headers.append((b"mcp-session-id", mcp_session_id.encode()))
+                    response_headers.extend(_rate_limit_headers(response.headers))
 
                     await send(
                         {
@@ -2031,6 +2096,7 @@ class SessionManagerWrapper:
                                 (b"content-length", str(len(response.content)).encode()),
                                 (b"mcp-session-id", mcp_session_id.encode()),
                             ]
+                            response_headers.extend(_rate_limit_headers(response.headers))
 
                             await send(
                                 {
@@ -2066,17 +2132,39 @@ class SessionManagerWrapper:
         else:
             server_id_var.set(None)
 
+        # Collect rate limited tool calls: their JSON response is sent as a 429, like on /rpc.
+        # Handlers see this list in stateless mode, where the SDK runs them in this request's context;
+        # SSE responses have started before the tool runs and keep the SDK's tool error.
+        rejected: List[ToolRateLimitError] = []
+        tool_rate_limit_var.set(rejected)
+        held_start: Optional[Dict[str, Any]] = None
+
         # For session affinity: wrap send to capture session ID from response headers
         # This allows us to register ownership for new sessions created by the SDK
         captured_session_id: Optional[str] = None
 
         async def send_with_capture(message: Dict[str, Any]) -> None:
-            """Wrap ASGI send to capture session ID from response headers.
+            """Wrap ASGI send to capture session ID from response headers and answer rate limited tool calls with 429.
 
             Args:
                 message: ASGI message dict.
             """
-            nonlocal captured_session_id
+            nonlocal captured_session_id, held_start
+            if message["type"] == "http.response.start" and rejected and message.get("status") == 200:
+                # Hold the start until the body: both are rewritten into the 429
+                held_start = message
+                return
+            if held_start is not None and message["type"] == "http.response.body":
+                start, held_start = held_start, None
+                if message.get("more_body", False):
+                    start = {**start, "status": 429, "headers": [*start.get("headers", []), *_rate_limit_headers(rejected[0].result.headers())]}
+                else:
+                    start, body = _rate_limited_response(start, message.get("body", b""), rejected[0])
+                    message = {**message, "body": body}
+                # The rewritten start has status 429, so it is not held again
+                await send_with_capture(start)
+                await send(message)
+                return
             if message["type"] == "http.response.start" and settings.mcpgateway_session_affinity_enabled:
                 # Look for mcp-session-id in response headers
                 response_headers = message.get("headers", [])
@@ -2310,6 +2398,7 @@ async def streamable_http_auth(scope: Any, receive: Any, send: Any) -> bool:
                     "teams": final_teams,
                     "is_authenticated": True,
                     "is_admin": is_admin,
+                    "jti": user_payload.get("jti"),
                 }
             )
         elif proxy_user:
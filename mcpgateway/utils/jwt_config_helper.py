@@ -201,7 +201,12 @@ def clear_jwt_caches() -> None:
 
     Note: In production, JWT config/key changes require application restart.
     """
+    # First-Party
+    from mcpgateway.cache.jwt_verify_cache import jwt_verify_cache  # pylint: disable=import-outside-toplevel
+
     _get_validated_config.cache_clear()
     get_jwt_public_key_or_secret.cache_clear()
     get_jwt_private_key_or_secret.cache_clear()
     _key_file_cache.clear()
+    # Payloads verified under the old keys/settings must be re-verified
+    jwt_verify_cache.clear()
@@ -38,6 +38,7 @@ Examples:
 
 # Standard
 import base64
+from datetime import datetime
 import logging
 import math
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -47,6 +48,7 @@ from urllib.parse import urlencode
 from fastapi import Request
 import orjson
 from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import Select
 
@@ -655,6 +657,7 @@ async def unified_paginate(
     limit: Optional[int] = None,
     base_url: str = "",
     query_params: Optional[Dict[str, Any]] = None,
+    async_db: Optional[AsyncSession] = None,
 ) -> Union[Dict[str, Any], Tuple[List[Any], Optional[str]]]:
     """Unified pagination helper that returns cursor or page format based on parameters.
 
@@ -672,6 +675,8 @@ async def unified_paginate(
         limit: Maximum items for cursor-based pagination (overrides default page size)
         base_url: Base URL for link generation in page-based mode
         query_params: Additional query parameters for links
+        async_db: Optional AsyncSession used to run the cursor-based query without
+            blocking the event loop (page-based mode always uses ``db``)
 
     Returns:
         Union[Dict[str, Any], Tuple[List[Any], Optional[str]]]:
@@ -726,14 +731,7 @@ async def unified_paginate(
         return result
 
     # CURSOR-BASED PAGINATION
-    # Determine page size from limit parameter
-    if limit is not None:
-        if limit == 0:
-            page_size = None  # No limit, fetch all
-        else:
-            page_size = min(limit, settings.pagination_max_page_size)
-    else:
-        page_size = settings.pagination_default_page_size
+    page_size = _cursor_page_size(limit)
 
     # Decode cursor if provided
     # Standard
@@ -766,7 +764,10 @@ async def unified_paginate(
     # Fetch page_size + 1 to determine if there are more results
     if page_size is not None:
         query = query.limit(page_size + 1)
-    items = db.execute(query).scalars().all()
+    if async_db is not None:
+        items = (await async_db.execute(query)).scalars().all()
+    else:
+        items = db.execute(query).scalars().all()
 
     # Check if there are more results
     has_more = False
@@ -798,6 +799,86 @@ async def unified_paginate(
     return (items, next_cursor)
 
 
+def _cursor_page_size(limit: Optional[int]) -> Optional[int]:
+    """Resolve the page size used for cursor-based pagination.
+
+    Args:
+        limit: Requested maximum number of items (0 means no limit).
+
+    Returns:
+        Page size, or None when all items should be returned.
+
+    Examples:
+        >>> _cursor_page_size(0) is None
+        True
+        >>> _cursor_page_size(5)
+        5
+        >>> _cursor_page_size(None) == settings.pagination_default_page_size
+        True
+    """
+    if limit is None:
+        return settings.pagination_default_page_size
+    if limit == 0:
+        return None  # No limit, fetch all
+    return min(limit, settings.pagination_max_page_size)
+
+
+def merge_keyset_pages(pages: List[Tuple[List[Any], Optional[str]]], limit: Optional[int] = None) -> Tuple[List[Any], Optional[str]]:
+    """Merge first pages of several keyset-paginated queries into one page.
+
+    Each page must come from ``unified_paginate`` (``created_at DESC, id DESC``
+    order, same ``limit``). Because every item of the merged first page is
+    within the first page of the query it came from, merging the pages and
+    truncating yields exactly the first page of the union of the queries.
+    Items present in several pages are kept once. The returned cursor has the
+    same format as ``unified_paginate``'s, so the next page can be fetched
+    with the combined query.
+
+    Args:
+        pages: ``(items, next_cursor)`` first pages to merge. Items need ``id`` and ``created_at``.
+        limit: The ``limit`` the pages were fetched with.
+
+    Returns:
+        Tuple of (merged items, next_cursor).
+
+    Examples:
+        >>> from datetime import datetime
+        >>> from types import SimpleNamespace as Item
+        >>> a = [Item(id="a2", created_at=datetime(2025, 1, 4)), Item(id="a1", created_at=datetime(2025, 1, 1))]
+        >>> b = [Item(id="b1", created_at=datetime(2025, 1, 3)), Item(id="a1", created_at=datetime(2025, 1, 1))]
+        >>> items, cursor = merge_keyset_pages([(a, None), (b, None)], limit=0)
+        >>> [i.id for i in items], cursor
+        (['a2', 'b1', 'a1'], None)
+        >>> items, cursor = merge_keyset_pages([(a, None), (b, None)], limit=2)
+        >>> [i.id for i in items], decode_cursor(cursor)
+        (['a2', 'b1'], {'created_at': '2025-01-03T00:00:00', 'id': 'b1'})
+        >>> undated = [Item(id="u1", created_at=None)]
+        >>> [i.id for i in merge_keyset_pages([(a, None), (undated, None)], limit=0)[0]]
+        ['a2', 'a1', 'u1']
+    """
+    page_size = _cursor_page_size(limit)
+    seen = set()
+    merged = []
+    for items, _ in pages:
+        for item in items:
+            if item.id not in seen:
+                seen.add(item.id)
+                merged.append(item)
+    # Rows without created_at sort after every dated row (like NULLs in a DESC order on SQLite)
+    merged.sort(key=lambda item: (item.created_at is not None, item.created_at or datetime.min, item.id), reverse=True)
+
+    has_more = any(cursor for _, cursor in pages)
+    if page_size is not None and len(merged) > page_size:
+        merged = merged[:page_size]
+        has_more = True
+
+    next_cursor = None
+    if has_more and merged:
+        last_item = merged[-1]
+        next_cursor = encode_cursor({"created_at": last_item.created_at.isoformat() if last_item.created_at else None, "id": last_item.id})
+    return merged, next_cursor
+
+
 def parse_pagination_params(request: Request) -> Dict[str, Any]:
     """Parse pagination parameters from request.
 
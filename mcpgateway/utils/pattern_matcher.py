@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/pattern_matcher.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Multi-pattern matcher for ``settings.dangerous_patterns``.
+
+``ValidationMiddleware`` used to run every compiled pattern over every string
+value of a request, one ``re.search`` call per (pattern, value) pair. This
+module checks a whole batch of values at once:
+
+- With the optional Rust extension (``plugins_rust/validation_matcher``), the
+  patterns are combined into one alternation and compiled by the ``regex``
+  crate. Its automaton scans each value once, whatever the number of patterns.
+- Otherwise the values are joined with a separator that no pattern matches,
+  and each pattern scans the joined text once from C. A hit is mapped back
+  to its value and re-checked against that value alone, so a match that only
+  exists across the separator is discarded. CPython's backtracking engine
+  retries every branch at every position, so a single alternation is slower
+  than separate passes on large strings; joining removes the per-value
+  Python overhead instead.
+
+Joining is only used when no pattern contains anchors, word boundaries or
+lookarounds, whose result could change at a value boundary. Otherwise each
+value is checked separately. The Rust matcher is skipped for such patterns
+too: the ``regex`` crate has no lookarounds or backreferences, and its ``$``
+does not match before a trailing newline like Python's, so only patterns
+both engines read the same way are handed to it
+(``tests/differential/test_validation_matcher_differential.py`` checks it).
+
+Examples:
+    >>> matcher = DangerousPatternMatcher([r"<script", r"\\.\\.[\\\\/]", r"1.2"], use_rust=False)
+    >>> matcher.backend
+    'joined'
+    >>> matcher.search("hello"), matcher.search("../etc")
+    (False, True)
+    >>> matcher.matching(["ok", "v1", "2x", "<script>", "../x"])  # "1.2" only matches across the "v1"/"2x" separator
+    [3, 4]
+    >>> matcher.matching(["ok", "<script>", "../x"], first_only=True)
+    [1]
+    >>> DangerousPatternMatcher([r"^rm "], use_rust=False).backend
+    'sequential'
+"""
+
+# Standard
+import bisect
+from itertools import accumulate
+import logging
+import re
+from typing import Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Optional Rust matcher (build with: make rust-validation-matcher-dev)
+try:
+    # Third-Party
+    import validation_matcher as _rust_matcher  # pylint: disable=import-error
+
+    _RUST_AVAILABLE = True
+except ImportError:
+    _rust_matcher = None  # type: ignore[assignment]
+    _RUST_AVAILABLE = False
+
+
+# Value separators for the joined scan; the first one no pattern matches on its own is used.
+# "\xff" keeps joined Latin-1 values in CPython's compact one-byte string storage.
+_SEPARATORS = ("\xff", "\uffff", "\ufffe", "\U0010ffff", "\x00", "\n")
+
+
+def _boundary_sensitive(pattern: str) -> bool:
+    """Return True if a pattern's result may depend on characters around the matched value.
+
+    Flags anchors, word boundaries and lookarounds outside character classes
+    (escaped characters and class contents are skipped).
+
+    Args:
+        pattern: Regex source.
+
+    Returns:
+        bool: True if values must be checked separately.
+
+    Examples:
+        >>> _boundary_sensitive(r"[;&|`$(){}\\[\\]<>^]"), _boundary_sensitive(r"\\$\\{")
+        (False, False)
+        >>> _boundary_sensitive(r"^rm"), _boundary_sensitive(r"end$"), _boundary_sensitive(r"\\bdrop"), _boundary_sensitive(r"a(?!b)")
+        (True, True, True, True)
+    """
+    index, in_class = 0, False
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if not in_class and pattern[index + 1 : index + 2] in ("b", "B", "A", "Z"):
+                return True
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A leading "^" negates and a following "]" is a literal
+            index += 2 if pattern[index + 1 : index + 2] == "^" else 1
+            index += 1 if pattern[index : index + 1] == "]" else 0
+            continue
+        elif char in "^$" or pattern.startswith(("(?=", "(?!", "(?<=", "(?<!"), index):
+            return True
+        index += 1
+    return False
+
+
+class DangerousPatternMatcher:
+    """Check many strings against a list of regex patterns in one pass per pattern.
+
+    Attributes:
+        patterns: Compiled patterns, in configuration order.
+        backend: ``rust``, ``joined`` or ``sequential`` (see module docstring).
+    """
+
+    def __init__(self, patterns: Sequence[str], use_rust: bool = True) -> None:
+        """Compile the patterns and pick the fastest backend that preserves their semantics.
+
+        Args:
+            patterns: Regex patterns (Python ``re`` syntax).
+            use_rust: Use the Rust extension when it is installed and all patterns are boundary-insensitive and accepted by it.
+
+        Raises:
+            re.error: If a pattern is not a valid Python regex.
+
+        Examples:
+            >>> DangerousPatternMatcher([]).matching(["<script>"])
+            []
+            >>> DangerousPatternMatcher(["("])
+            Traceback (most recent call last):
+            ...
+            re.error: missing ), unterminated subpattern at position 0
+        """
+        self.patterns: List[re.Pattern[str]] = [re.compile(pattern) for pattern in patterns]
+        self._rust: Any = None
+        boundary_sensitive = any(_boundary_sensitive(p.pattern) for p in self.patterns)
+        if use_rust and _RUST_AVAILABLE and self.patterns and not boundary_sensitive:
+            try:
+                self._rust = _rust_matcher.PatternMatcher(list(patterns))
+            except ValueError as e:
+                # The regex crate has no lookarounds or backreferences
+                logger.info(f"Dangerous patterns not supported by the Rust matcher, using Python: {e}")
+
+        self._separator: Optional[str] = next((sep for sep in _SEPARATORS if not any(p.search(sep) for p in self.patterns)), None)
+        if self._rust is not None:
+            self.backend = "rust"
+        elif self._separator is not None and not boundary_sensitive:
+            self.backend = "joined"
+        else:
+            self.backend = "sequential"
+
+    def search(self, value: str) -> bool:
+        """Return True if any pattern matches ``value``.
+
+        Args:
+            value: String to check.
+
+        Returns:
+            bool: True if a dangerous pattern was found.
+        """
+        if self._rust is not None:
+            return bool(self._rust.is_match(value))
+        return any(pattern.search(value) for pattern in self.patterns)
+
+    def matching(self, values: Sequence[str], first_only: bool = False) -> List[int]:
+        """Return the indices of the values that any pattern matches.
+
+        Args:
+            values: Strings to check.
+            first_only: Stop at the first matching value (in order).
+
+        Returns:
+            List[int]: Sorted indices of matching values (at most one with ``first_only``).
+        """
+        if not values or not self.patterns:
+            return []
+        if self._rust is not None:
+            return list(self._rust.matching_indices(list(values), first_only))
+        if self.backend == "sequential" or len(values) == 1:
+            hits = []
+            for index, value in enumerate(values):
+                if self.search(value):
+                    hits.append(index)
+                    if first_only:
+                        break
+            return hits
+        return self._matching_joined(values, first_only)
+
+    def _matching_joined(self, values: Sequence[str], first_only: bool) -> List[int]:
+        """Scan the separator-joined values once per pattern.
+
+        Args:
+            values: Strings to check.
+            first_only: Stop at the first matching value.
+
+        Returns:
+            List[int]: Sorted indices of matching values.
+        """
+        joined = self._separator.join(values)  # type: ignore[union-attr]
+        starts = list(accumulate((len(value) + 1 for value in values[:-1]), initial=0))
+        hits = set()
+        limit = len(joined)
+        for pattern in self.patterns:
+            pos = 0
+            while pos < limit:
+                match = pattern.search(joined, pos, limit)
+                if match is None:
+                    break
+                index = bisect.bisect_right(starts, match.start()) - 1
+                if index not in hits and pattern.search(values[index]):
+                    hits.add(index)
+                    if first_only:
+                        # Later patterns only need to find an earlier value
+                        limit = starts[index]
+                        break
+                pos = starts[index] + len(values[index]) + 1
+        if first_only and hits:
+            return [min(hits)]
+        return sorted(hits)
+
+
+class _TooDeep(Exception):
+    """Raised inside the JSON walk when the depth budget is exceeded."""
+
+
+def collect_json_strings(data: Any, max_depth: int) -> Tuple[List[str], List[str], bool]:
+    """Collect the string values of all objects in a decoded JSON document.
+
+    Walks the document in document order. Like the original walk, strings
+    directly inside lists are not collected. Stops when the nesting exceeds
+    ``max_depth``, which bounds the recursion (keep it well below
+    ``sys.getrecursionlimit()``; ``validation_max_json_depth`` is at most 100).
+
+    Args:
+        data: Decoded JSON document.
+        max_depth: Maximum object/array nesting depth.
+
+    Returns:
+        Tuple[List[str], List[str], bool]: Keys, values, and whether the depth budget was exceeded.
+
+    Examples:
+        >>> collect_json_strings({"a": "x", "b": [{"c": "y"}, "skipped"], "d": 1, "e": "z"}, max_depth=8)
+        (['a', 'c', 'e'], ['x', 'y', 'z'], False)
+        >>> collect_json_strings({"a": {"b": {"c": "x"}}}, max_depth=2)
+        ([], [], True)
+    """
+    keys: List[str] = []
+    values: List[str] = []
+
+    def walk(node: Any, depth: int) -> None:
+        """Append the object string values under ``node``.
+
+        Args:
+            node: Object or array at nesting level ``depth``.
+            depth: Nesting level of ``node`` (the document root is 1).
+
+        Raises:
+            _TooDeep: If ``depth`` exceeds ``max_depth``.
+        """
+        if depth > max_depth:
+            raise _TooDeep
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, str):
+                    keys.append(key)
+                    values.append(value)
+                elif isinstance(value, (dict, list)):
+                    walk(value, depth + 1)
+        else:
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    walk(item, depth + 1)
+
+    if isinstance(data, (dict, list)):
+        try:
+            walk(data, 1)
+        except _TooDeep:
+            return keys, values, True
+    return keys, values, False
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/search_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Full-text search index for tools, resources, prompts, servers and gateways.
+
+Each entity gets an index over its name columns, identifiers (display name,
+URL/URI), description and tag labels:
+
+- SQLite: an FTS5 table ``<table>_fts`` kept in sync with the base table by
+  ``AFTER INSERT/UPDATE/DELETE`` triggers. The FTS rowid mirrors the base
+  table's rowid, so updates and deletes touch one index entry.
+- PostgreSQL: a GIN index on a weighted ``to_tsvector`` expression. Postgres
+  maintains it on write; queries repeat the same expression so the planner
+  uses the index.
+- Other backends have no index and callers fall back to ``LIKE``.
+
+User input is split into alphanumeric terms and every term must match as a
+prefix, so ``"weath fore"`` finds ``get_weather_forecast``. Results are ranked
+(bm25 on SQLite, ``ts_rank`` on PostgreSQL) with name matches weighted
+highest.
+
+Examples:
+    >>> match_terms("Get_Weather  forecast!")
+    ['get', 'weather', 'forecast']
+    >>> sqlite_match_expression("get_weather")
+    '"get"* "weather"*'
+    >>> postgres_tsquery("get_weather")
+    'get:* & weather:*'
+    >>> sqlite_match_expression("%%") is None
+    True
+"""
+
+# Standard
+from dataclasses import dataclass
+import logging
+import re
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+import weakref
+
+# Third-Party
+from sqlalchemy import Float, func, inspect, or_, String, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.selectable import Subquery
+
+logger = logging.getLogger(__name__)
+
+_TERM = re.compile(r"[^\W_]+")
+_MAX_TERMS = 16
+
+# bm25() weights for the FTS5 columns (id, name, alt, description, tags); id is UNINDEXED
+_BM25_WEIGHTS = "0.0, 10.0, 4.0, 1.0, 2.0"
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Columns of one base table that feed its search index.
+
+    Attributes:
+        table: Base table name.
+        names: Name columns (highest weight).
+        alt: Secondary identifiers such as display names and URLs.
+        like_columns: Columns searched by the ``LIKE`` fallback.
+    """
+
+    table: str
+    names: Tuple[str, ...]
+    alt: Tuple[str, ...]
+    like_columns: Tuple[str, ...]
+
+
+SEARCH_INDEX_SPECS: Dict[str, IndexSpec] = {
+    "tools": IndexSpec("tools", ("name", "original_name", "custom_name"), ("display_name", "url"), ("name", "original_name", "custom_name", "display_name", "description")),
+    "resources": IndexSpec("resources", ("name",), ("uri",), ("name", "uri", "description")),
+    "prompts": IndexSpec("prompts", ("name", "original_name", "custom_name"), ("display_name",), ("name", "original_name", "display_name", "description")),
+    "servers": IndexSpec("servers", ("name",), (), ("name", "description")),
+    "gateways": IndexSpec("gateways", ("name",), ("url",), ("name", "url", "description")),
+}
+
+# Engine -> tables with a usable index (filled lazily, reset by create/drop)
+_available: "weakref.WeakKeyDictionary[Engine, FrozenSet[str]]" = weakref.WeakKeyDictionary()
+
+
+def match_terms(query: str) -> List[str]:
+    """Split user input into lowercase alphanumeric search terms.
+
+    Args:
+        query: Raw search text.
+
+    Returns:
+        List[str]: At most 16 terms, in input order.
+
+    Examples:
+        >>> match_terms("  ")
+        []
+        >>> match_terms("café-api v2")
+        ['café', 'api', 'v2']
+    """
+    return _TERM.findall(query.lower())[:_MAX_TERMS]
+
+
+def sqlite_match_expression(query: str) -> Optional[str]:
+    """Build an FTS5 ``MATCH`` expression where every term must match as a prefix.
+
+    Args:
+        query: Raw search text.
+
+    Returns:
+        Optional[str]: FTS5 query, or None when the input has no terms.
+    """
+    terms = match_terms(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def postgres_tsquery(query: str) -> Optional[str]:
+    """Build a ``to_tsquery`` string where every term must match as a prefix.
+
+    Args:
+        query: Raw search text.
+
+    Returns:
+        Optional[str]: tsquery text, or None when the input has no terms.
+    """
+    terms = match_terms(query)
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _concat(columns: Tuple[str, ...], prefix: str) -> str:
+    """Return a SQL expression joining nullable text columns with spaces.
+
+    Args:
+        columns: Column names.
+        prefix: Row qualifier such as ``NEW.`` (or empty).
+
+    Returns:
+        str: SQL expression (``''`` when there are no columns).
+
+    Examples:
+        >>> _concat(("name", "url"), "NEW.")
+        "coalesce(NEW.name, '') || ' ' || coalesce(NEW.url, '')"
+        >>> _concat((), "")
+        "''"
+    """
+    if not columns:
+        return "''"
+    return " || ' ' || ".join(f"coalesce({prefix}{column}, '')" for column in columns)
+
+
+def _sqlite_tags(prefix: str) -> str:
+    """Return a SQLite expression flattening a JSON tag list to space-separated labels.
+
+    Handles both string tags and ``{"id": ..., "label": ...}`` objects, and
+    yields NULL for invalid JSON instead of failing the write.
+
+    Args:
+        prefix: Row qualifier such as ``NEW.`` (or empty).
+
+    Returns:
+        str: SQL expression.
+    """
+    return (
+        f"CASE WHEN json_valid({prefix}tags) THEN (SELECT group_concat(CASE WHEN type = 'object' "
+        f"THEN coalesce(json_extract(value, '$.label'), json_extract(value, '$.id')) ELSE value END, ' ') FROM json_each({prefix}tags)) END"
+    )
+
+
+def _sqlite_values(spec: IndexSpec, prefix: str) -> str:
+    """Return the SELECT list feeding the FTS5 table from a base row.
+
+    Args:
+        spec: Index definition.
+        prefix: Row qualifier such as ``NEW.`` (or empty).
+
+    Returns:
+        str: Comma-separated SQL expressions for (rowid, id, name, alt, description, tags).
+    """
+    return f"{prefix}rowid, {prefix}id, {_concat(spec.names, prefix)}, {_concat(spec.alt, prefix)}, {prefix}description, {_sqlite_tags(prefix)}"
+
+
+def _sqlite_ddl(spec: IndexSpec) -> List[str]:
+    """Return the statements creating the FTS5 table and its sync triggers.
+
+    Args:
+        spec: Index definition.
+
+    Returns:
+        List[str]: DDL statements.
+    """
+    fts = f"{spec.table}_fts"
+    columns = ", ".join(dict.fromkeys((*spec.names, *spec.alt, "description", "tags")))
+    insert = f"INSERT INTO {fts}(rowid, id, name, alt, description, tags) SELECT {_sqlite_values(spec, 'NEW.')};"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(id UNINDEXED, name, alt, description, tags, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {spec.table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {spec.table} BEGIN DELETE FROM {fts} WHERE rowid = OLD.rowid; END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {columns} ON {spec.table} BEGIN DELETE FROM {fts} WHERE rowid = OLD.rowid; {insert} END",
+    ]
+
+
+def postgres_vector(spec: IndexSpec) -> str:
+    """Return the weighted tsvector expression indexed for ``spec``.
+
+    Queries must use this exact expression for PostgreSQL to pick the GIN index.
+
+    Args:
+        spec: Index definition.
+
+    Returns:
+        str: SQL expression.
+
+    Examples:
+        >>> vector = postgres_vector(SEARCH_INDEX_SPECS["gateways"])
+        >>> "to_tsvector('simple'::regconfig, coalesce(name, '')), 'A'" in vector
+        True
+        >>> "coalesce(url, '')), 'B'" in vector
+        True
+    """
+    return (
+        f"(setweight(to_tsvector('simple'::regconfig, {_concat(spec.names, '')}), 'A') || "
+        f"setweight(to_tsvector('simple'::regconfig, {_concat(spec.alt, '')}), 'B') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C') || "
+        "setweight(jsonb_to_tsvector('simple'::regconfig, coalesce(tags::jsonb, '[]'::jsonb), '[\"string\"]'::jsonb), 'B'))"
+    )
+
+
+def _engine_of(bind: Any) -> Any:
+    """Return the Engine behind a Connection or Engine.
+
+    Args:
+        bind: Connection or Engine.
+
+    Returns:
+        The engine (or ``bind`` itself when it has none).
+    """
+    return getattr(bind, "engine", bind)
+
+
+def create_search_index(conn: Connection) -> None:
+    """Create (if missing) and populate the search index for every entity table.
+
+    Safe to run repeatedly. Tables that do not exist yet are skipped. On SQLite
+    a freshly created FTS table is backfilled from its base table.
+
+    Args:
+        conn: Open connection; the caller commits.
+    """
+    dialect = conn.dialect.name
+    existing = set(inspect(conn).get_table_names())
+    for spec in SEARCH_INDEX_SPECS.values():
+        if spec.table not in existing:
+            continue
+        if dialect == "sqlite":
+            created = f"{spec.table}_fts" not in existing
+            for statement in _sqlite_ddl(spec):
+                conn.exec_driver_sql(statement)
+            if created:
+                rebuild_search_index(conn, spec.table)
+        elif dialect == "postgresql":
+            conn.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS ix_{spec.table}_search ON {spec.table} USING GIN ({postgres_vector(spec)})")
+    _available.pop(_engine_of(conn), None)
+
+
+def drop_search_index(conn: Connection) -> None:
+    """Drop the search index objects created by :func:`create_search_index`.
+
+    Args:
+        conn: Open connection; the caller commits.
+    """
+    dialect = conn.dialect.name
+    for spec in SEARCH_INDEX_SPECS.values():
+        fts = f"{spec.table}_fts"
+        if dialect == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {fts}")
+        elif dialect == "postgresql":
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS ix_{spec.table}_search")
+    _available.pop(_engine_of(conn), None)
+
+
+def rebuild_search_index(conn: Connection, table: str) -> None:
+    """Repopulate one SQLite FTS table from its base table.
+
+    PostgreSQL indexes need no rebuild (use ``REINDEX`` if ever required).
+
+    Args:
+        conn: Open connection; the caller commits.
+        table: Base table name (a key of ``SEARCH_INDEX_SPECS``).
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    spec = SEARCH_INDEX_SPECS[table]
+    conn.exec_driver_sql(f"DELETE FROM {table}_fts")
+    conn.exec_driver_sql(f"INSERT INTO {table}_fts(rowid, id, name, alt, description, tags) SELECT {_sqlite_values(spec, '')} FROM {table}")
+
+
+def indexed_tables(db: Session) -> FrozenSet[str]:
+    """Return the entity tables that have a search index in ``db``'s database.
+
+    The lookup runs once per engine and is cached.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        FrozenSet[str]: Indexed base table names (empty on unsupported backends).
+    """
+    try:
+        bind = db.get_bind()
+        dialect = bind.dialect.name
+    except Exception:
+        return frozenset()
+    if dialect not in ("sqlite", "postgresql"):
+        return frozenset()
+
+    engine = _engine_of(bind)
+    try:
+        cached = _available.get(engine)
+    except TypeError:  # not weak-referenceable
+        cached = None
+    if cached is not None:
+        return cached
+
+    if dialect == "sqlite":
+        rows = db.execute(text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE '%\\_fts' ESCAPE '\\'")).scalars()
+        found = frozenset(name[: -len("_fts")] for name in rows) & SEARCH_INDEX_SPECS.keys()
+    else:
+        rows = db.execute(text("SELECT indexname FROM pg_indexes WHERE indexname LIKE 'ix\\_%\\_search'")).scalars()
+        found = frozenset(name[len("ix_") : -len("_search")] for name in rows) & SEARCH_INDEX_SPECS.keys()
+
+    try:
+        _available[engine] = found
+    except TypeError:
+        pass
+    return found
+
+
+def search_match(db: Session, table: str, query: str) -> Optional[Subquery]:
+    """Return a subquery of ``(id, rank)`` for rows of ``table`` matching ``query``.
+
+    Lower ranks are better. Returns None when the table has no index in this
+    database or the query has no searchable terms; callers then fall back to
+    :func:`like_filter`.
+
+    Args:
+        db: Database session.
+        table: Base table name.
+        query: Raw search text.
+
+    Returns:
+        Optional[Subquery]: Subquery with ``id`` and ``rank`` columns, or None.
+    """
+    if table not in indexed_tables(db):
+        return None
+
+    param = f"{table}_search_q"
+    if db.get_bind().dialect.name == "sqlite":
+        expression = sqlite_match_expression(query)
+        if expression is None:
+            return None
+        sql = f"SELECT id, bm25({table}_fts, {_BM25_WEIGHTS}) AS rank FROM {table}_fts WHERE {table}_fts MATCH :{param}"
+    else:
+        expression = postgres_tsquery(query)
+        if expression is None:
+            return None
+        vector = postgres_vector(SEARCH_INDEX_SPECS[table])
+        sql = f"SELECT id, -ts_rank({vector}, to_tsquery('simple', :{param})) AS rank FROM {table} WHERE {vector} @@ to_tsquery('simple', :{param})"
+    return text(sql).bindparams(**{param: expression}).columns(id=String, rank=Float).subquery(f"{table}_search")
+
+
+def _escape_like(value: str) -> str:
+    """Escape SQL LIKE wildcard characters.
+
+    Args:
+        value: Raw search string.
+
+    Returns:
+        str: Escaped string for use with ``ESCAPE '\\'``.
+
+    Examples:
+        >>> _escape_like("50%_off")
+        '50\\\\%\\\\_off'
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def like_filter(model: Any, query: str) -> Any:
+    """Case-insensitive substring filter over the model's searchable columns.
+
+    Args:
+        model: ORM model whose table is in ``SEARCH_INDEX_SPECS``.
+        query: Raw search text.
+
+    Returns:
+        SQLAlchemy boolean expression.
+    """
+    pattern = "%" + _escape_like(query.strip().lower()) + "%"
+    table = model.__table__
+    return or_(*(func.lower(func.coalesce(table.c[column], "")).like(pattern, escape="\\") for column in SEARCH_INDEX_SPECS[table.name].like_columns))
+
+
+def apply_search_filter(db: Session, query: Select, model: Any, search: Optional[str]) -> Select:
+    """Restrict ``query`` to ``model`` rows matching ``search``, keeping its ordering.
+
+    Uses the full-text index when available, otherwise substring ``LIKE``.
+
+    Args:
+        db: Database session.
+        query: SELECT over ``model``.
+        model: ORM model whose table is in ``SEARCH_INDEX_SPECS``.
+        search: Raw search text (no-op when empty).
+
+    Returns:
+        Select: The filtered query.
+    """
+    if not search or not search.strip():
+        return query
+    match = search_match(db, model.__tablename__, search)
+    if match is not None:
+        return query.where(model.id.in_(match.select().with_only_columns(match.c.id)))
+    return query.where(like_filter(model, search))
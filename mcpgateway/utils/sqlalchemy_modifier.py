@@ -8,6 +8,7 @@ SQLAlchemy modifiers
 
 - json_contains_expr: handles json_contains logic for different dialects
 - json_contains_tag_expr: handles tag filtering for dict-format tags [{id, label}]
+- entity_tag_expr: tag filtering through the indexed entity_tags table
 """
 
 # Standard
@@ -19,7 +20,7 @@ import uuid
 
 # Third-Party
 import orjson
-from sqlalchemy import and_, func, or_, text
+from sqlalchemy import and_, func, or_, select, text
 from sqlalchemy.sql.elements import TextClause
 
 # Thread-safe counter for generating unique bind parameter prefixes
@@ -272,6 +273,52 @@ def json_contains_tag_expr(session, col, values: Union[str, Iterable[str]], matc
     raise RuntimeError(f"Unsupported dialect for json_contains_tag: {dialect}")
 
 
+def entity_tag_expr(col, values: Union[str, Iterable[str]], match_any: bool = True) -> Any:
+    """
+    Return a SQLAlchemy expression that is True when the entity owning the
+    ``tags`` column `col` has tags matching the given values.
+
+    Unlike `json_contains_tag_expr`, the match is an indexed lookup in the
+    ``entity_tags`` table (kept in sync with the ``tags`` columns), so it does
+    not parse the JSON of every row and is the same on every dialect.
+
+    Args:
+        col: ``tags`` attribute of a tagged model (e.g. ``Tool.tags``)
+        values: list of tag IDs to match against
+        match_any: Boolean to set OR (True) or AND (False) matching
+
+    Returns:
+        Any: SQLAlchemy boolean expression suitable for use in .where()
+
+    Raises:
+        ValueError: If values is empty
+
+    Examples:
+        >>> from mcpgateway.db import Tool
+        >>> print(entity_tag_expr(Tool.tags, ["api", "db"]))  # doctest: +NORMALIZE_WHITESPACE
+        tools.id IN (SELECT entity_tags.entity_id FROM entity_tags
+        WHERE entity_tags.entity_type = :entity_type_1 AND entity_tags.tag IN (__[POSTCOMPILE_tag_1]))
+        >>> "HAVING count(*) = " in str(entity_tag_expr(Tool.tags, ["api", "db"], match_any=False))
+        True
+        >>> entity_tag_expr(Tool.tags, [])
+        Traceback (most recent call last):
+        ...
+        ValueError: values must be non-empty
+    """
+    # First-Party
+    from mcpgateway.db import EntityTag  # pylint: disable=import-outside-toplevel
+
+    values_list = list(dict.fromkeys(_ensure_list(values)))
+    if not values_list:
+        raise ValueError("values must be non-empty")
+
+    model = col.class_
+    matching_ids = select(EntityTag.entity_id).where(EntityTag.entity_type == model.__tablename__, EntityTag.tag.in_(values_list))
+    if not match_any and len(values_list) > 1:
+        matching_ids = matching_ids.group_by(EntityTag.entity_id).having(func.count() == len(values_list))
+    return model.id.in_(matching_ids)
+
+
 def json_contains_expr(session, col, values: Union[str, Iterable[str]], match_any: bool = True) -> Any:
     """
     Return a SQLAlchemy expression that is True when JSON column `col`
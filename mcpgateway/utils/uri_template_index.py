@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/uri_template_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Segment trie for resolving a URI to the resource template that matches it.
+
+Templates are split on ``/`` (so the scheme and host become the first
+segments) and inserted into a trie. Literal segments are looked up by exact
+match; segments containing ``{var}`` expressions are matched with a small
+per-segment regex; a ``{var*}`` expression (which may span ``/``) parks the
+template in a fallback list checked with its full regex. Lookup walks the
+URI's segments, trying literal children before parameterized ones before
+wildcards, so resolving a URI costs roughly one dict lookup per segment
+instead of one regex per registered template.
+
+Matching semantics are the same as ``ResourceService._build_regex``:
+``{var}`` matches one or more characters other than ``/``, ``{var*}`` matches
+one or more characters including ``/``, and ``{?a,b}`` query expressions are
+ignored (the URI's query string is stripped before matching).
+
+Examples:
+    >>> index = UriTemplateIndex()
+    >>> index.add("1", "file:///logs/{date}", "logs")
+    >>> index.add("2", "file:///{path*}", "any-file")
+    >>> index.add("3", "db://users/{id}{?fields}", "user")
+    >>> index.match("file:///logs/2025-01-01")
+    'logs'
+    >>> index.match("file:///etc/hosts")
+    'any-file'
+    >>> index.match("db://users/42?fields=name")
+    'user'
+    >>> index.match("db://orders/1") is None
+    True
+    >>> index.remove("2")
+    True
+    >>> index.match("file:///etc/hosts") is None
+    True
+"""
+
+# Standard
+from dataclasses import dataclass, field
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+_QUERY_EXPR = re.compile(r"\{\?[^}]+\}")
+_EXPR = re.compile(r"(\{[^}]+\})")
+
+
+def _segment_pattern(segment: str) -> str:
+    """Return the regex source for one ``/``-free template segment.
+
+    Parameter names are dropped so equivalent segments such as ``{id}`` and
+    ``{name}`` share one trie node.
+
+    Args:
+        segment: Template segment containing at least one ``{var}`` expression.
+
+    Returns:
+        str: Anchored regex source for the segment.
+
+    Examples:
+        >>> _segment_pattern("{id}")
+        '^[^/]+$'
+        >>> _segment_pattern("{id}.json")
+        '^[^/]+\\\\.json$'
+    """
+    parts = _EXPR.split(segment)
+    return "^" + "".join("[^/]+" if part.startswith("{") else re.escape(part) for part in parts) + "$"
+
+
+def _template_regex(template: str) -> Pattern[str]:
+    """Compile the full-URI regex for a template (used for wildcard templates).
+
+    Args:
+        template: URI template with query expressions already removed.
+
+    Returns:
+        Pattern[str]: Compiled anchored regex.
+
+    Examples:
+        >>> bool(_template_regex("files://root/{path*}/meta").match("files://root/a/b/meta"))
+        True
+    """
+    pattern = ""
+    for part in _EXPR.split(template):
+        if part.startswith("{"):
+            pattern += ".+" if part.endswith("*}") else "[^/]+"
+        else:
+            pattern += re.escape(part)
+    return re.compile(f"^{pattern}$")
+
+
+@dataclass
+class _Node:
+    """One trie level: children by literal segment and by segment pattern."""
+
+    literal: Dict[str, "_Node"] = field(default_factory=dict)
+    param: Dict[str, Tuple[Pattern[str], "_Node"]] = field(default_factory=dict)
+    # Templates that end at this node: key -> value (insertion ordered)
+    terminal: Dict[str, Any] = field(default_factory=dict)
+    # Templates whose remaining segments contain {var*}: key -> (regex, value)
+    wildcard: Dict[str, Tuple[Pattern[str], Any]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        """Return True if nothing hangs off this node.
+
+        Returns:
+            bool: True when the node can be pruned.
+        """
+        return not (self.literal or self.param or self.terminal or self.wildcard)
+
+
+class UriTemplateIndex:
+    """Trie of URI templates keyed by a caller-chosen id.
+
+    ``add`` replaces any existing entry with the same key, so the index can be
+    kept current incrementally from create/update/delete events.
+
+    Examples:
+        >>> index = UriTemplateIndex()
+        >>> len(index), index.loaded
+        (0, False)
+        >>> index.add("t", "mem://{a}/{b}", "x")
+        >>> index.add("t", "mem://{a}", "y")  # replaces the previous template
+        >>> (index.match("mem://1/2"), index.match("mem://1"), len(index))
+        (None, 'y', 1)
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._root = _Node()
+        # key -> (parent node, edge, is_param) hops from the root, for removal
+        self._paths: Dict[str, List[Tuple[_Node, str, bool]]] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        """Return the number of indexed templates.
+
+        Returns:
+            int: Number of templates.
+        """
+        return len(self._paths)
+
+    def clear(self) -> None:
+        """Remove every template and mark the index as not loaded."""
+        self._root = _Node()
+        self._paths.clear()
+        self.loaded = False
+
+    def add(self, key: str, template: str, value: Any) -> None:
+        """Index ``template`` under ``key``, replacing any previous entry.
+
+        Args:
+            key: Stable identifier (e.g. the resource id).
+            template: URI template string.
+            value: Object returned by ``match`` for URIs matching the template.
+        """
+        self.remove(key)
+        self._insert(key, template, value)
+
+    def _insert(self, key: str, template: str, value: Any) -> None:
+        """Walk/create trie nodes for ``template`` and attach ``value``.
+
+        Args:
+            key: Template identifier.
+            template: URI template string.
+            value: Stored value.
+        """
+        stripped = _QUERY_EXPR.sub("", template)
+        node = self._root
+        path: List[Tuple[_Node, str, bool]] = []
+        segments = stripped.split("/")
+        for i, segment in enumerate(segments):
+            if "*}" in segment:
+                regex = _template_regex(stripped)
+                node.wildcard[key] = (regex, value)
+                path.append((node, "", False))
+                self._paths[key] = path
+                return
+            if "{" in segment:
+                pattern = _segment_pattern(segment)
+                entry = node.param.get(pattern)
+                if entry is None:
+                    entry = (re.compile(pattern), _Node())
+                    node.param[pattern] = entry
+                path.append((node, pattern, True))
+                node = entry[1]
+            else:
+                child = node.literal.get(segment)
+                if child is None:
+                    child = node.literal[segment] = _Node()
+                path.append((node, segment, False))
+                node = child
+            if i == len(segments) - 1:
+                node.terminal[key] = value
+        self._paths[key] = path
+
+    def remove(self, key: str) -> bool:
+        """Remove the template indexed under ``key``.
+
+        Args:
+            key: Template identifier.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+        path = self._paths.pop(key, None)
+        if path is None:
+            return False
+
+        parent, edge, is_param = path[-1]
+        if key in parent.wildcard:
+            parent.wildcard.pop(key, None)
+            path = path[:-1]
+        else:
+            leaf = parent.param[edge][1] if is_param else parent.literal[edge]
+            leaf.terminal.pop(key, None)
+
+        # Prune empty nodes bottom-up
+        for parent, edge, is_param in reversed(path):
+            child = parent.param[edge][1] if is_param else parent.literal[edge]
+            if not child.is_empty():
+                break
+            if is_param:
+                del parent.param[edge]
+            else:
+                del parent.literal[edge]
+        return True
+
+    def match(self, uri: str) -> Optional[Any]:
+        """Return the value of the most specific template matching ``uri``.
+
+        Literal segments win over parameterized segments, which win over
+        ``{var*}`` wildcards; ties keep insertion order.
+
+        Args:
+            uri: Concrete URI, optionally with a query string.
+
+        Returns:
+            Optional[Any]: Stored value, or None if no template matches.
+        """
+        uri_path, _, _ = uri.partition("?")
+        return self._match(self._root, uri_path.split("/"), 0, uri_path)
+
+    def _match(self, node: _Node, segments: List[str], depth: int, uri_path: str) -> Optional[Any]:
+        """Depth-first lookup with ordered fallbacks.
+
+        Args:
+            node: Current trie node.
+            segments: URI split on ``/``.
+            depth: Index of the next segment to consume.
+            uri_path: URI without query string (for wildcard regexes).
+
+        Returns:
+            Optional[Any]: Stored value, or None if no template matches.
+        """
+        if depth == len(segments):
+            return next(iter(node.terminal.values()), None)
+
+        segment = segments[depth]
+        child = node.literal.get(segment)
+        if child is not None:
+            found = self._match(child, segments, depth + 1, uri_path)
+            if found is not None:
+                return found
+
+        for regex, param_child in node.param.values():
+            if regex.match(segment):
+                found = self._match(param_child, segments, depth + 1, uri_path)
+                if found is not None:
+                    return found
+
+        for regex, value in node.wildcard.values():
+            if regex.match(uri_path):
+                return value
+        return None
@@ -62,6 +62,7 @@ from fastapi.security.utils import get_authorization_scheme_param
 import jwt
 
 # First-Party
+from mcpgateway.cache.jwt_verify_cache import jwt_verify_cache
 from mcpgateway.config import settings
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.utils.jwt_config_helper import validate_jwt_algo_and_keys
@@ -173,11 +174,13 @@ async def verify_jwt_token(token: str) -> dict:
 
 
 async def verify_jwt_token_cached(token: str, request: Optional[Request] = None) -> dict:
-    """Verify JWT token with request-level caching.
+    """Verify JWT token with request-level and process-level caching.
 
     If a request object is provided and the token has already been verified
-    for this request, returns the cached payload. Otherwise, performs
-    verification and caches the result in request.state.
+    for this request, returns the cached payload. Otherwise the worker-wide
+    ``jwt_verify_cache`` is consulted (keyed by token digest, bounded by the
+    token's ``exp``), and only on a miss is the signature verified. The
+    result is cached in request.state in both cases.
 
     Args:
         token: JWT token string to verify
@@ -199,8 +202,11 @@ async def verify_jwt_token_cached(token: str, request: Optional[Request] = None)
             if cached_token == token:
                 return cached_payload
 
-    # Verify token (single decode)
-    payload = await verify_jwt_token(token)
+    # Reuse a payload verified by an earlier request, else verify (single decode)
+    payload = jwt_verify_cache.get(token)
+    if payload is None:
+        payload = await verify_jwt_token(token)
+        jwt_verify_cache.set(token, payload)
 
     # Cache in request.state for reuse across middleware
     if request is not None and hasattr(request, "state"):
@@ -5,8 +5,10 @@ SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
 Rate Limiter Plugin.
-Enforces simple in-memory rate limits by user, tenant, and/or tool.
-Uses a fixed window keyed by second for simplicity and determinism.
+Enforces rate limits by user, tenant, and/or tool.
+The default fixed-window algorithm keeps in-memory windows keyed by second for
+simplicity and determinism; ``algorithm: gcra`` uses the gateway's token-bucket
+limiter, which is shared across workers and hosts when Redis is configured.
 """
 
 # Future
@@ -14,8 +16,9 @@ from __future__ import annotations
 
 # Standard
 from dataclasses import dataclass
+import math
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 # Third-Party
 from pydantic import BaseModel, Field
@@ -31,30 +34,7 @@ from mcpgateway.plugins.framework import (
     ToolPreInvokePayload,
     ToolPreInvokeResult,
 )
-
-
-def _parse_rate(rate: str) -> tuple[int, int]:
-    """Parse rate like '60/m', '10/s', '100/h' -> (count, window_seconds).
-
-    Args:
-        rate: Rate string in format 'count/unit' (e.g., '60/m', '10/s', '100/h').
-
-    Returns:
-        Tuple of (count, window_seconds) for the rate limit.
-
-    Raises:
-        ValueError: If the rate unit is not supported.
-    """
-    count_str, per = rate.split("/")
-    count = int(count_str)
-    per = per.strip().lower()
-    if per in ("s", "sec", "second"):
-        return count, 1
-    if per in ("m", "min", "minute"):
-        return count, 60
-    if per in ("h", "hr", "hour"):
-        return count, 3600
-    raise ValueError(f"Unsupported rate unit: {per}")
+from mcpgateway.utils.rate_limiter import get_rate_limiter, parse_rate
 
 
 class RateLimiterConfig(BaseModel):
@@ -64,11 +44,13 @@ class RateLimiterConfig(BaseModel):
         by_user: Rate limit per user (e.g., '60/m').
         by_tenant: Rate limit per tenant (e.g., '600/m').
         by_tool: Per-tool rate limits (e.g., {'search': '10/m'}).
+        algorithm: 'fixed_window' (per-process windows) or 'gcra' (token bucket shared through Redis).
     """
 
     by_user: Optional[str] = Field(default=None, description="e.g. '60/m'")
     by_tenant: Optional[str] = Field(default=None, description="e.g. '600/m'")
     by_tool: Optional[Dict[str, str]] = Field(default=None, description="per-tool rates, e.g. {'search': '10/m'}")
+    algorithm: Literal["fixed_window", "gcra"] = Field(default="fixed_window", description="'gcra' smooths bursts and shares limits across workers via Redis")
 
 
 @dataclass
@@ -100,7 +82,7 @@ def _allow(key: str, limit: Optional[str]) -> tuple[bool, dict[str, Any]]:
     """
     if not limit:
         return True, {"limited": False}
-    count, window_seconds = _parse_rate(limit)
+    count, window_seconds = parse_rate(limit)
     now = int(time.time())
     win_key = f"{key}:{window_seconds}"
     wnd = _store.get(win_key)
@@ -114,8 +96,29 @@ def _allow(key: str, limit: Optional[str]) -> tuple[bool, dict[str, Any]]:
     return False, {"limited": True, "remaining": 0, "reset_in": window_seconds - (now - wnd.window_start)}
 
 
+async def _allow_gcra(key: str, limit: Optional[str]) -> tuple[bool, dict[str, Any]]:
+    """Check if a request is allowed using the gateway's GCRA limiter.
+
+    Args:
+        key: Unique key for the rate limit (e.g., 'user:alice', 'tool:search').
+        limit: Rate limit string (e.g., '60/m') or None to allow unlimited.
+
+    Returns:
+        Tuple of (allowed, metadata) where allowed is True if the request is allowed,
+        and metadata contains rate limiting information and response headers.
+    """
+    if not limit:
+        return True, {"limited": False}
+    count, window_seconds = parse_rate(limit)
+    result = await get_rate_limiter().hit(f"plugin:{key}:{window_seconds}", limit=count, period=window_seconds)
+    meta: dict[str, Any] = {"limited": True, "remaining": result.remaining, "reset_in": math.ceil(result.reset_after), "headers": result.headers()}
+    if not result.allowed:
+        meta["retry_after"] = math.ceil(result.retry_after)
+    return result.allowed, meta
+
+
 class RateLimiterPlugin(Plugin):
-    """Simple fixed-window rate limiter with per-user/tenant/tool buckets."""
+    """Rate limiter with per-user/tenant/tool buckets (fixed window or GCRA)."""
 
     def __init__(self, config: PluginConfig) -> None:
         """Initialize the rate limiter plugin.
@@ -126,6 +129,20 @@ class RateLimiterPlugin(Plugin):
         super().__init__(config)
         self._cfg = RateLimiterConfig(**(config.config or {}))
 
+    async def _check(self, key: str, limit: Optional[str]) -> tuple[bool, dict[str, Any]]:
+        """Check a bucket with the configured algorithm.
+
+        Args:
+            key: Unique key for the rate limit.
+            limit: Rate limit string or None to allow unlimited.
+
+        Returns:
+            Tuple of (allowed, metadata).
+        """
+        if self._cfg.algorithm == "gcra":
+            return await _allow_gcra(key, limit)
+        return _allow(key, limit)
+
     async def prompt_pre_fetch(self, payload: PromptPrehookPayload, context: PluginContext) -> PromptPrehookResult:
         """Check rate limits before fetching a prompt.
 
@@ -139,7 +156,7 @@ class RateLimiterPlugin(Plugin):
         user = context.global_context.user or "anonymous"
         tenant = context.global_context.tenant_id or "default"
 
-        ok_u, meta_u = _allow(f"user:{user}", self._cfg.by_user)
+        ok_u, meta_u = await self._check(f"user:{user}", self._cfg.by_user)
         if not ok_u:
             return PromptPrehookResult(
                 continue_processing=False,
@@ -151,7 +168,7 @@ class RateLimiterPlugin(Plugin):
                 ),
             )
 
-        ok_t, meta_t = _allow(f"tenant:{tenant}", self._cfg.by_tenant)
+        ok_t, meta_t = await self._check(f"tenant:{tenant}", self._cfg.by_tenant)
         if not ok_t:
             return PromptPrehookResult(
                 continue_processing=False,
@@ -181,14 +198,14 @@ class RateLimiterPlugin(Plugin):
         tenant = context.global_context.tenant_id or "default"
 
         meta: dict[str, Any] = {}
-        ok_u, meta_u = _allow(f"user:{user}", self._cfg.by_user)
-        ok_t, meta_t = _allow(f"tenant:{tenant}", self._cfg.by_tenant)
+        ok_u, meta_u = await self._check(f"user:{user}", self._cfg.by_user)
+        ok_t, meta_t = await self._check(f"tenant:{tenant}", self._cfg.by_tenant)
         ok_tool = True
         meta_tool: dict[str, Any] | None = None
         by_tool_config = self._cfg.by_tool
         if hasattr(by_tool_config, "__contains__"):
             if tool in by_tool_config:  # pylint: disable=unsupported-membership-test
-                ok_tool, meta_tool = _allow(f"tool:{tool}", by_tool_config[tool])
+                ok_tool, meta_tool = await self._check(f"tool:{tool}", by_tool_config[tool])
         meta.update({"by_user": meta_u, "by_tenant": meta_t})
         if meta_tool is not None:
             meta["by_tool"] = meta_tool
@@ -0,0 +1,101 @@
+// Copyright 2025
+// SPDX-License-Identifier: Apache-2.0
+//
+// Multi-pattern matcher for mcpgateway.utils.pattern_matcher.
+//
+// The dangerous patterns are combined into one alternation and compiled by the
+// regex crate, whose automaton checks all patterns in a single linear pass over
+// each value. Patterns the crate does not support (lookarounds, backreferences)
+// raise ValueError, and the Python side falls back to its own matcher.
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use regex::Regex;
+
+fn combine(patterns: &[String]) -> Result<Regex, regex::Error> {
+    let alternation = patterns
+        .iter()
+        .map(|pattern| format!("(?:{pattern})"))
+        .collect::<Vec<_>>()
+        .join("|");
+    Regex::new(&alternation)
+}
+
+fn matching(regex: &Regex, values: &[String], first_only: bool) -> Vec<usize> {
+    let mut hits = Vec::new();
+    for (index, value) in values.iter().enumerate() {
+        if regex.is_match(value) {
+            hits.push(index);
+            if first_only {
+                break;
+            }
+        }
+    }
+    hits
+}
+
+#[pyclass(frozen)]
+struct PatternMatcher {
+    regex: Regex,
+}
+
+#[pymethods]
+impl PatternMatcher {
+    #[new]
+    fn new(patterns: Vec<String>) -> PyResult<Self> {
+        let regex = combine(&patterns).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(Self { regex })
+    }
+
+    /// Return True if any pattern matches `value`.
+    fn is_match(&self, py: Python<'_>, value: String) -> bool {
+        py.detach(|| self.regex.is_match(&value))
+    }
+
+    /// Return the indices of the values any pattern matches (only the first with `first_only`).
+    #[pyo3(signature = (values, first_only = false))]
+    fn matching_indices(&self, py: Python<'_>, values: Vec<String>, first_only: bool) -> Vec<usize> {
+        py.detach(|| matching(&self.regex, &values, first_only))
+    }
+}
+
+#[pymodule]
+fn validation_matcher(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<PatternMatcher>()?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn default_patterns() -> Vec<String> {
+        vec![
+            r"[;&|`$(){}\[\]<>]".to_string(),
+            r"\.\.[\\/]".to_string(),
+            r"[\x00-\x1f\x7f-\x9f]".to_string(),
+        ]
+    }
+
+    #[test]
+    fn test_combined_patterns_match_any() {
+        let regex = combine(&default_patterns()).unwrap();
+        assert!(regex.is_match("rm -rf /; echo"));
+        assert!(regex.is_match("../etc/passwd"));
+        assert!(regex.is_match("line\nbreak"));
+        assert!(!regex.is_match("plain text, with punctuation."));
+    }
+
+    #[test]
+    fn test_matching_indices() {
+        let regex = combine(&default_patterns()).unwrap();
+        let values: Vec<String> = ["ok", "$(id)", "fine", "../x"].iter().map(|v| v.to_string()).collect();
+        assert_eq!(matching(&regex, &values, false), vec![1, 3]);
+        assert_eq!(matching(&regex, &values, true), vec![1]);
+    }
+
+    #[test]
+    fn test_lookaround_is_rejected() {
+        assert!(combine(&["(?<=a)b".to_string()]).is_err());
+    }
+}
@@ -405,6 +405,55 @@ def clear_metrics_cache():
         pass
 
 
+@pytest.fixture(autouse=True)
+def clear_permission_cache():
+    """Clear the process-wide permission decision cache around each test.
+
+    Decisions are keyed by user email, so tests reusing the same users would
+    otherwise see each other's cached allow/deny results.
+    """
+    try:
+        from mcpgateway.cache.permission_cache import permission_cache
+
+        permission_cache._invalidate_local()
+    except ImportError:
+        pass  # Cache module not available
+
+    yield
+
+    try:
+        from mcpgateway.cache.permission_cache import permission_cache
+
+        permission_cache._invalidate_local()
+    except ImportError:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_registry_cache():
+    """Clear the process-wide registry cache around each test.
+
+    List endpoints cache their serialized response bodies, so tests that mock
+    different service results for the same query would otherwise see a body
+    cached by an earlier test.
+    """
+    try:
+        from mcpgateway.cache.registry_cache import registry_cache
+
+        registry_cache.invalidate_all()
+    except ImportError:
+        pass  # Cache module not available
+
+    yield
+
+    try:
+        from mcpgateway.cache.registry_cache import registry_cache
+
+        registry_cache.invalidate_all()
+    except ImportError:
+        pass
+
+
 @pytest.fixture(autouse=True)
 def clear_jwt_cache_between_tests():
     """Ensure JWT caches are cleared between tests for isolation.
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/differential/test_validation_matcher_differential.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Differential testing: the Rust validation matcher must flag exactly the values
+Python's ``re`` flags for the dangerous patterns.
+
+Requires the extension (``make rust-validation-matcher-dev``); skipped otherwise.
+"""
+
+# Standard
+import random
+import re
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.utils.pattern_matcher import DangerousPatternMatcher
+
+try:
+    # Third-Party
+    import validation_matcher  # noqa: F401  # pylint: disable=unused-import
+
+    RUST_AVAILABLE = True
+except ImportError:
+    RUST_AVAILABLE = False
+
+# Configured patterns first, then typical custom additions
+PATTERN_SETS = [
+    settings.dangerous_patterns,
+    [r"[;&|`$(){}\[\]<>]", r"\.\.[\\/]", r"[\x00-\x1f\x7f-\x9f]"],
+    [r"<script", r"javascript:", r"on\w+\s*=", r"\$\{.*\}"],
+    [r"(?i)union\s+select", r"(?i)drop\s+table", r"--\s"],
+    [r"[^\x20-\x7e]", r"\d{3}-\d{2}-\d{4}"],
+]
+
+# Mostly plain words, with shell/path characters, C0/C1 controls, Latin-1 and non-BMP characters mixed in
+WORDS = ("select", "UNION", "drop", "table", "<script", "javascript:", "onload=", "rm", "etc", "passwd", "123", "45", "6789", " ", "-", "/", ".")
+SPECIALS = "${}.;&|`$(){}[]<>/\\\n\r\t\x00\x1b\x7f\x85\x9f\xa0\xe9ſK\U0001f600"
+
+
+def _corpus(seed: int, count: int = 3000):
+    rng = random.Random(seed)
+    values = ["".join(rng.choice(SPECIALS) if rng.random() < 0.03 else rng.choice(WORDS) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+    return values + ["", "plain text", "../etc/passwd", "$(id)", "line\nbreak", "caf\xe9", "\U0001f600", "x" * 10000 + ";"]
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust validation matcher not available")
+class TestDifferentialValidationMatcher:
+    """Rust backend against the Python backend on the same patterns and values."""
+
+    @pytest.mark.parametrize("patterns", PATTERN_SETS)
+    def test_matching_is_identical(self, patterns):
+        rust = DangerousPatternMatcher(patterns)
+        python = DangerousPatternMatcher(patterns, use_rust=False)
+        assert rust.backend == "rust"
+
+        values = _corpus(seed=len(patterns))
+        assert rust.matching(values) == python.matching(values)
+        assert rust.matching(values, first_only=True) == python.matching(values, first_only=True)
+        mismatches = [value for value in values if rust.search(value) != python.search(value)]
+        assert not mismatches, f"Backends disagree on {mismatches[:5]!r}"
+
+    @pytest.mark.parametrize("patterns", PATTERN_SETS)
+    def test_matches_per_pattern_re_search(self, patterns):
+        compiled = [re.compile(pattern) for pattern in patterns]
+        values = _corpus(seed=99)
+        expected = [index for index, value in enumerate(values) if any(pattern.search(value) for pattern in compiled)]
+        assert DangerousPatternMatcher(patterns).matching(values) == expected
+
+    @pytest.mark.parametrize("patterns", [[r"^rm\s"], [r"drop$"], [r"\bselect\b"], [r"(?<=a)b"], [r"(a)\1"]])
+    def test_patterns_read_differently_stay_on_python(self, patterns):
+        assert DangerousPatternMatcher(patterns).backend != "rust"
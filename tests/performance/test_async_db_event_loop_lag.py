@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Event-loop lag benchmark: sync SessionLocal vs. the optional async engine.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Services run their queries inside ``async def`` handlers. With the synchronous
+engine every query blocks the event loop, so concurrent requests on the same
+worker are delayed by the slowest query. With ``DB_ASYNC_ENABLED=true`` the hot
+read paths use an ``AsyncSession`` and the loop keeps serving other tasks.
+
+The benchmark issues concurrent "slow" queries (a SQLite UDF that sleeps, to
+stand in for a slow PostgreSQL query) and measures how late a 1 ms heartbeat
+task wakes up while they run.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_async_db_event_loop_lag.py
+"""
+
+# Standard
+import asyncio
+import statistics
+import time
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+QUERY_MS = 20
+CONCURRENT_QUERIES = 20
+HEARTBEAT_S = 0.001
+
+
+def _register_sleep(dbapi_conn, _record):
+    """Register ``sleep_ms(n)`` so a query takes a predictable amount of time.
+
+    Args:
+        dbapi_conn: DBAPI connection.
+        _record: Connection record (unused).
+    """
+    dbapi_conn.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000) or ms)
+
+
+async def _measure_lag(workload) -> dict:
+    """Run ``workload`` while a heartbeat task records how late it wakes up.
+
+    Args:
+        workload: Coroutine function running the queries.
+
+    Returns:
+        dict: Lag statistics in milliseconds and wall time in seconds.
+    """
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def heartbeat():
+        while not stop.is_set():
+            expected = time.perf_counter() + HEARTBEAT_S
+            await asyncio.sleep(HEARTBEAT_S)
+            lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    hb_task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await workload()
+    wall = time.perf_counter() - start
+    stop.set()
+    await hb_task
+
+    lags.sort()
+    return {
+        "max_ms": lags[-1] if lags else 0.0,
+        "p99_ms": lags[int(len(lags) * 0.99) - 1] if len(lags) > 1 else (lags[0] if lags else 0.0),
+        "mean_ms": statistics.fmean(lags) if lags else 0.0,
+        "wall_s": wall,
+    }
+
+
+@pytest.mark.benchmark
+async def test_event_loop_lag_sync_vs_async(tmp_path):
+    """The async engine should keep event-loop lag far below one query duration."""
+    db_file = tmp_path / "lag.db"
+
+    sync_engine = create_engine(f"sqlite:///{db_file}", connect_args={"check_same_thread": False})
+    event.listen(sync_engine, "connect", _register_sleep)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}", pool_size=CONCURRENT_QUERIES)
+    event.listen(async_engine.sync_engine, "connect", _register_sleep)
+
+    async def sync_workload():
+        # Mirrors services calling db.execute() directly inside async handlers
+        async def one():
+            with sync_engine.connect() as conn:
+                conn.execute(text(f"SELECT sleep_ms({QUERY_MS})")).scalar()
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*(one() for _ in range(CONCURRENT_QUERIES)))
+
+    async def async_workload():
+        async def one():
+            async with async_engine.connect() as conn:
+                (await conn.execute(text(f"SELECT sleep_ms({QUERY_MS})"))).scalar()
+
+        await asyncio.gather(*(one() for _ in range(CONCURRENT_QUERIES)))
+
+    try:
+        sync_stats = await _measure_lag(sync_workload)
+        async_stats = await _measure_lag(async_workload)
+    finally:
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+    print(f"\n{CONCURRENT_QUERIES} concurrent queries of {QUERY_MS} ms each")
+    print(f"{'engine':<8} {'max lag ms':>11} {'p99 lag ms':>11} {'mean lag ms':>12} {'wall s':>8}")
+    for label, stats in (("sync", sync_stats), ("async", async_stats)):
+        print(f"{label:<8} {stats['max_ms']:>11.1f} {stats['p99_ms']:>11.1f} {stats['mean_ms']:>12.2f} {stats['wall_s']:>8.3f}")
+
+    # Sync queries hold the loop for at least one full query; async ones must not
+    assert sync_stats["max_ms"] >= QUERY_MS * 0.8
+    assert async_stats["max_ms"] < sync_stats["max_ms"]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: metric-enriched tool listings from raw metrics vs entity_metric_counters.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Fills a SQLite database with 500 tools and 200,000 raw tool metrics, with the
+``entity_metric_counters`` rows ``MetricsBufferService`` maintains, then builds
+``metrics_summary`` for the whole page three ways:
+
+- per-tool aggregate query (``metrics_summary`` without preloading: N+1);
+- ``selectinload(Tool.metrics)`` and a Python pass over every raw row;
+- ``joinedload(Tool.metric_counter)`` (one join, independent of metrics volume).
+
+Run with:
+    uv run pytest -v -s tests/performance/test_entity_metric_counters.py
+"""
+
+# Standard
+from datetime import datetime, timedelta, timezone
+import random
+import statistics
+import time
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import joinedload, selectinload, Session
+
+# First-Party
+from mcpgateway.db import apply_metric_counter_deltas, Base, EntityMetricCounter, metric_counter_deltas, Tool, ToolMetric
+
+TOOLS = 500
+METRICS = 200_000
+
+
+@pytest.fixture(scope="module")
+def metrics_db(tmp_path_factory):
+    """SQLite database with ``TOOLS`` tools, ``METRICS`` raw metrics and their counters."""
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('counters') / 'counters.db'}")
+    Base.metadata.create_all(engine, tables=[Tool.__table__, ToolMetric.__table__, EntityMetricCounter.__table__])
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    tools = [{"id": f"t{i:031x}", "name": f"tool_{i}", "original_name": f"tool_{i}", "custom_name": f"tool_{i}", "custom_name_slug": f"tool-{i}", "input_schema": {}} for i in range(TOOLS)]
+    metrics = [
+        {"tool_id": tools[rng.randrange(TOOLS)]["id"], "timestamp": start + timedelta(seconds=i), "response_time": rng.random(), "is_success": rng.random() > 0.1}
+        for i in range(METRICS)
+    ]
+    with engine.begin() as conn:
+        conn.execute(Tool.__table__.insert(), tools)
+        for offset in range(0, METRICS, 10_000):
+            batch = metrics[offset : offset + 10_000]
+            conn.execute(ToolMetric.__table__.insert(), batch)
+            apply_metric_counter_deltas(conn, metric_counter_deltas("tools", ((m["tool_id"], m["timestamp"], m["response_time"], m["is_success"]) for m in batch)))
+    yield engine
+    engine.dispose()
+
+
+def _summaries(db: Session, *options) -> dict:
+    db.expunge_all()
+    return {tool.id: tool.metrics_summary for tool in db.execute(select(Tool).options(*options)).scalars()}
+
+
+def _median_ms(fn, rounds: int = 3) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _same(a: dict, b: dict) -> bool:
+    for tool_id, expected in a.items():
+        actual = b[tool_id]
+        for key in ("total_executions", "successful_executions", "failed_executions", "min_response_time", "max_response_time"):
+            if actual[key] != expected[key]:
+                return False
+        if actual["avg_response_time"] != pytest.approx(expected["avg_response_time"]):
+            return False
+    return True
+
+
+@pytest.mark.benchmark
+def test_counter_join_beats_raw_metric_aggregation(metrics_db):
+    """One joined counter row per tool should beat aggregating raw metrics, with the same results."""
+    with Session(metrics_db) as db:
+        per_tool = _summaries(db)
+        preloaded = _summaries(db, selectinload(Tool.metrics))
+        counters = _summaries(db, joinedload(Tool.metric_counter))
+        assert _same(per_tool, counters)
+        assert _same(preloaded, counters)
+
+        per_tool_ms = _median_ms(lambda: _summaries(db))
+        preloaded_ms = _median_ms(lambda: _summaries(db, selectinload(Tool.metrics)))
+        counter_ms = _median_ms(lambda: _summaries(db, joinedload(Tool.metric_counter)))
+
+    print(f"\n{TOOLS} tools, {METRICS:,} raw metrics, include_metrics listing")
+    print(f"  per-tool aggregate (N+1): {per_tool_ms:8.2f} ms")
+    print(f"  selectinload(metrics):    {preloaded_ms:8.2f} ms")
+    print(f"  joinedload(counter):      {counter_ms:8.2f} ms")
+    print(f"  speedup vs N+1:           {per_tool_ms / counter_ms:.1f}x")
+
+    assert counter_ms < per_tool_ms
+    assert counter_ms < preloaded_ms
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: tag listing and tag filters on JSON columns vs the entity_tags index.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Fills a SQLite database with 50,000 synthetic tools and servers (both tag
+formats) and their ``entity_tags`` rows, then compares:
+
+- tag listing: loading every ``tags`` column and counting in Python (what
+  ``TagService.get_all_tags`` did) vs the ``GROUP BY`` on ``entity_tags``;
+- tag filters: :func:`json_contains_tag_expr` (parses every row's JSON) vs
+  :func:`entity_tag_expr` (indexed lookup), for one tag and for all-of-two.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_entity_tag_index.py
+"""
+
+# Standard
+from collections import Counter
+import random
+import statistics
+import time
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+# First-Party
+from mcpgateway.db import _entity_tag_rows, Base, EntityTag, Server, tag_ids, Tool
+from mcpgateway.utils.sqlalchemy_modifier import entity_tag_expr, json_contains_tag_expr
+
+ENTITIES = 50_000
+TAGS = [f"tag-{i}" for i in range(200)]
+FILTERS = [["tag-7"], ["tag-42"], ["tag-7", "tag-42"], ["missing"]]
+
+
+def _tags(rng: random.Random, i: int) -> list:
+    picked = rng.sample(TAGS, 3)
+    # Half the entities use the {id, label} format, half legacy strings
+    return [{"id": tag, "label": tag.title()} for tag in picked] if i % 2 else picked
+
+
+@pytest.fixture(scope="module")
+def tagged_db(tmp_path_factory):
+    """SQLite database with ``ENTITIES`` tools and servers and their index rows."""
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('tags') / 'tags.db'}")
+    Base.metadata.create_all(engine, tables=[Tool.__table__, Server.__table__, EntityTag.__table__])
+    rng = random.Random(42)
+    tools, servers, index = [], [], []
+    for i in range(ENTITIES):
+        tags = _tags(rng, i)
+        if i % 5:
+            entity_id = f"t{i:031x}"
+            tools.append({"id": entity_id, "name": f"tool_{i}", "original_name": f"tool_{i}", "custom_name": f"tool_{i}", "custom_name_slug": f"tool-{i}", "input_schema": {}, "tags": tags})
+            index.extend(_entity_tag_rows("tools", entity_id, tags))
+        else:
+            entity_id = f"s{i:031x}"
+            servers.append({"id": entity_id, "name": f"server_{i}", "tags": tags})
+            index.extend(_entity_tag_rows("servers", entity_id, tags))
+    with engine.begin() as conn:
+        for table, rows in ((Tool.__table__, tools), (Server.__table__, servers), (EntityTag.__table__, index)):
+            for start in range(0, len(rows), 5_000):
+                conn.execute(table.insert(), rows[start : start + 5_000])
+    yield engine
+    engine.dispose()
+
+
+def _scan_tag_counts(db: Session) -> Counter:
+    counts: Counter = Counter()
+    for entity_type, model in (("tools", Tool), ("servers", Server)):
+        for (tags,) in db.execute(select(model.tags).where(model.tags.isnot(None))):
+            for tag in tag_ids(tags):
+                counts[(tag, entity_type)] += 1
+    return counts
+
+
+def _indexed_tag_counts(db: Session) -> Counter:
+    stmt = select(EntityTag.tag, EntityTag.entity_type, func.count()).where(EntityTag.entity_type.in_(["tools", "servers"])).group_by(EntityTag.tag, EntityTag.entity_type)
+    return Counter({(tag, entity_type): count for tag, entity_type, count in db.execute(stmt)})
+
+
+def _json_filter(db: Session, tags: list) -> list:
+    return db.execute(select(Tool.id).where(json_contains_tag_expr(db, Tool.tags, tags, match_any=len(tags) == 1))).scalars().all()
+
+
+def _indexed_filter(db: Session, tags: list) -> list:
+    return db.execute(select(Tool.id).where(entity_tag_expr(Tool.tags, tags, match_any=len(tags) == 1))).scalars().all()
+
+
+def _median_ms(fn, rounds: int = 5) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+@pytest.mark.benchmark
+def test_tag_listing_group_by_beats_json_scan(tagged_db):
+    """Counting tags in the index should beat loading and parsing every tags column."""
+    with Session(tagged_db) as db:
+        assert _indexed_tag_counts(db) == _scan_tag_counts(db)
+
+        scan_ms = _median_ms(lambda: _scan_tag_counts(db))
+        indexed_ms = _median_ms(lambda: _indexed_tag_counts(db))
+
+    print(f"\n{ENTITIES:,} entities, tag listing")
+    print(f"  JSON scan:  {scan_ms:8.2f} ms")
+    print(f"  GROUP BY:   {indexed_ms:8.2f} ms")
+    print(f"  speedup:    {scan_ms / indexed_ms:.1f}x")
+
+    assert indexed_ms < scan_ms
+
+
+@pytest.mark.benchmark
+def test_tag_filter_index_beats_json_contains(tagged_db):
+    """Filtering through the index should beat json_contains_tag_expr, with identical results."""
+    with Session(tagged_db) as db:
+        for tags in FILTERS:
+            assert sorted(_indexed_filter(db, tags)) == sorted(_json_filter(db, tags))
+
+        json_ms = _median_ms(lambda: [_json_filter(db, tags) for tags in FILTERS]) / len(FILTERS)
+        indexed_ms = _median_ms(lambda: [_indexed_filter(db, tags) for tags in FILTERS]) / len(FILTERS)
+
+    print(f"\n{ENTITIES:,} entities, {len(FILTERS)} tag filters")
+    print(f"  json_contains_tag_expr: {json_ms:8.2f} ms/query")
+    print(f"  entity_tags index:      {indexed_ms:8.2f} ms/query")
+    print(f"  speedup:                {json_ms / indexed_ms:.1f}x")
+
+    assert indexed_ms < json_ms
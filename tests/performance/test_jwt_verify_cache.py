@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Microbenchmark: RS256 JWT verification with and without the verified-token cache.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Every authenticated request calls ``verify_jwt_token_cached``. Without the
+process-level cache each call performs an RSA signature verification; with
+``JWT_VERIFY_CACHE_ENABLED=true`` repeated requests carrying the same token
+only hash the token and copy the cached claims.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_jwt_verify_cache.py
+"""
+
+# Standard
+import time
+import uuid
+
+# Third-Party
+import jwt
+import pytest
+
+# First-Party
+from mcpgateway.cache.jwt_verify_cache import JWTVerifyCache
+from mcpgateway.config import settings
+from mcpgateway.utils import verify_credentials
+from mcpgateway.utils.jwt_config_helper import clear_jwt_caches
+
+rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+
+ITERATIONS = 2000
+
+
+@pytest.fixture
+def rs256_settings(tmp_path, monkeypatch):
+    """Configure RS256 with a freshly generated 2048-bit key pair."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    public_pem = key.public_key().public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+    (tmp_path / "private.pem").write_bytes(private_pem)
+    (tmp_path / "public.pem").write_bytes(public_pem)
+
+    monkeypatch.setattr(settings, "jwt_algorithm", "RS256")
+    monkeypatch.setattr(settings, "jwt_private_key_path", str(tmp_path / "private.pem"))
+    monkeypatch.setattr(settings, "jwt_public_key_path", str(tmp_path / "public.pem"))
+    clear_jwt_caches()
+    yield private_pem
+    clear_jwt_caches()
+
+
+def _make_token(private_pem: bytes) -> str:
+    """Sign a gateway-style token with the benchmark key.
+
+    Args:
+        private_pem: PEM-encoded RSA private key.
+
+    Returns:
+        str: Encoded JWT.
+    """
+    now = int(time.time())
+    claims = {
+        "sub": "bench@example.com",
+        "aud": settings.jwt_audience,
+        "iss": settings.jwt_issuer,
+        "iat": now,
+        "exp": now + 3600,
+        "jti": str(uuid.uuid4()),
+    }
+    return jwt.encode(claims, private_pem, algorithm="RS256")
+
+
+async def _time_verifications(token: str) -> float:
+    """Verify ``token`` repeatedly, as successive requests would.
+
+    Args:
+        token: Encoded JWT.
+
+    Returns:
+        float: Mean microseconds per verification.
+    """
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await verify_credentials.verify_jwt_token_cached(token, None)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+@pytest.mark.benchmark
+async def test_rs256_verification_with_and_without_cache(rs256_settings, monkeypatch):
+    """Cached verification should be an order of magnitude cheaper than RSA verify."""
+    token = _make_token(rs256_settings)
+
+    monkeypatch.setattr(verify_credentials, "jwt_verify_cache", JWTVerifyCache(enabled=False))
+    uncached_us = await _time_verifications(token)
+
+    cache = JWTVerifyCache(ttl=300, max_size=1000, enabled=True)
+    monkeypatch.setattr(verify_credentials, "jwt_verify_cache", cache)
+    cached_us = await _time_verifications(token)
+
+    print(f"\nRS256 verify_jwt_token_cached over {ITERATIONS} calls")
+    print(f"{'mode':<10} {'us/call':>10}")
+    print(f"{'uncached':<10} {uncached_us:>10.1f}")
+    print(f"{'cached':<10} {cached_us:>10.1f}  ({uncached_us / cached_us:.0f}x)")
+
+    stats = cache.stats()
+    assert stats["miss_count"] == 1
+    assert stats["hit_count"] == ITERATIONS - 1
+    assert cached_us * 5 < uncached_us
+
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: tool-call throughput through MCPSessionPool, exclusive vs multiplexed.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Starts a local streamable HTTP MCP stub whose only tool sleeps for a fixed
+upstream latency, then drives a burst of concurrent ``call_tool`` requests
+through the pool twice: once with exclusive sessions (one request per
+session, the default) and once with ``max_concurrent_per_session`` > 1.
+Callers are capped at the pool's capacity (sessions x slots per session),
+as in-process callers beyond that would otherwise sit out the acquire
+timeout. With the same number of sessions per key, multiplexing should
+carry the burst in a fraction of the wall time.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_mcp_session_pool_multiplexing.py
+"""
+
+# Standard
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+
+# Third-Party
+import httpx
+import pytest
+
+# First-Party
+from mcpgateway.services.mcp_session_pool import MCPSessionPool
+
+SESSIONS_PER_KEY = 4
+CONCURRENT_PER_SESSION = 16
+CALLS = 128
+UPSTREAM_LATENCY = 0.2
+
+# Runs in its own process so the stub does not compete with the pool for the event loop
+STUB_SERVER = """
+import asyncio, sys
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("pool-stub", host="127.0.0.1", port=int(sys.argv[1]), json_response=True, log_level="WARNING")
+
+
+@mcp.tool(structured_output=False)
+async def slow_echo(text: str) -> str:
+    await asyncio.sleep(float(sys.argv[2]))
+    return text
+
+
+mcp.run(transport="streamable-http")
+"""
+
+
+def _free_port() -> int:
+    """Return a free localhost TCP port.
+
+    Returns:
+        int: Port number.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def stub_server_url():
+    """Run a streamable HTTP MCP server with one slow tool in a subprocess."""
+    port = _free_port()
+    proc = subprocess.Popen([sys.executable, "-c", STUB_SERVER, str(port), str(UPSTREAM_LATENCY)])  # nosec B603
+    url = f"http://127.0.0.1:{port}/mcp"
+    try:
+        async with httpx.AsyncClient() as client:
+            for _ in range(200):
+                try:
+                    await client.get(url)
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.05)
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+async def _run_burst(url: str, max_concurrent_per_session: int) -> tuple:
+    """Send ``CALLS`` concurrent tool calls through a fresh pool.
+
+    Args:
+        url: Stub server URL.
+        max_concurrent_per_session: Pool multiplexing factor.
+
+    Returns:
+        tuple: (elapsed seconds, pool metrics after the burst).
+    """
+    pool = MCPSessionPool(max_sessions_per_key=SESSIONS_PER_KEY, max_concurrent_per_session=max_concurrent_per_session, acquire_timeout_seconds=60)
+    try:
+        # Warm the key so session setup is not part of the measurement
+        async with pool.session(url) as pooled:
+            await pooled.session.call_tool("slow_echo", {"text": "warm"})
+
+        capacity = asyncio.Semaphore(SESSIONS_PER_KEY * max_concurrent_per_session)
+
+        async def call(i: int) -> str:
+            async with capacity, pool.session(url) as pooled:
+                result = await pooled.session.call_tool("slow_echo", {"text": str(i)})
+                return result.content[0].text
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(call(i) for i in range(CALLS)))
+        elapsed = time.perf_counter() - start
+
+        assert results == [str(i) for i in range(CALLS)]
+        return elapsed, pool.get_metrics()
+    finally:
+        await pool.close_all()
+
+
+@pytest.mark.benchmark
+async def test_multiplexed_sessions_increase_throughput(stub_server_url):
+    """Multiplexing K requests per session should beat exclusive sessions on a burst."""
+    exclusive, exclusive_metrics = await _run_burst(stub_server_url, 1)
+    multiplexed, multiplexed_metrics = await _run_burst(stub_server_url, CONCURRENT_PER_SESSION)
+
+    print(f"\n{CALLS} calls, {SESSIONS_PER_KEY} sessions/key, {UPSTREAM_LATENCY * 1000:.0f}ms upstream latency")
+    print(f"  exclusive:   {exclusive:.3f}s  ({CALLS / exclusive:,.0f} calls/s)")
+    print(f"  multiplexed: {multiplexed:.3f}s  ({CALLS / multiplexed:,.0f} calls/s, K={CONCURRENT_PER_SESSION})")
+    print(f"  speedup:     {exclusive / multiplexed:.1f}x")
+
+    assert exclusive_metrics["misses"] <= SESSIONS_PER_KEY
+    assert multiplexed_metrics["misses"] <= SESSIONS_PER_KEY
+    assert multiplexed < exclusive / 2
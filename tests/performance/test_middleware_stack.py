@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: requests per second through the default middleware stack.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Sends GET requests to a trivial endpoint wrapped in the middlewares that
+``main.py`` registers by default, in the same order, and reports requests per
+second for:
+
+- the raw ASGI stack,
+- the same stack with every layer behind a ``BaseHTTPMiddleware`` hop, which
+  adds the per-layer task and stream overhead the middlewares had when they
+  subclassed ``BaseHTTPMiddleware``.
+
+Requests are driven directly through the ASGI interface, so no client or
+server overhead is included. Run with:
+    uv run pytest -v -s tests/performance/test_middleware_stack.py
+"""
+
+# Standard
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+# Third-Party
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+# First-Party
+from mcpgateway.main import AdminAuthMiddleware, DocsAuthMiddleware
+from mcpgateway.middleware.auth_middleware import AuthContextMiddleware
+from mcpgateway.middleware.correlation_id import CorrelationIDMiddleware
+from mcpgateway.middleware.http_auth_middleware import HttpAuthMiddleware
+from mcpgateway.middleware.observability_middleware import ObservabilityMiddleware
+from mcpgateway.middleware.protocol_version import MCPProtocolVersionMiddleware
+from mcpgateway.middleware.request_logging_middleware import RequestLoggingMiddleware
+from mcpgateway.middleware.security_headers import SecurityHeadersMiddleware
+from mcpgateway.middleware.validation_middleware import ValidationMiddleware
+
+REQUESTS = 3_000
+
+# Innermost first, in main.py registration order
+STACK = [
+    (SecurityHeadersMiddleware, {}),
+    (ValidationMiddleware, {}),
+    (MCPProtocolVersionMiddleware, {}),
+    (HttpAuthMiddleware, {"plugin_manager": None}),
+    (RequestLoggingMiddleware, {"enable_gateway_logging": True}),
+    (DocsAuthMiddleware, {}),
+    (AdminAuthMiddleware, {}),
+    (CorrelationIDMiddleware, {}),
+    (AuthContextMiddleware, {}),
+    (ObservabilityMiddleware, {"enabled": True, "buffered": True}),
+]
+
+
+async def _ping(_request):
+    return PlainTextResponse("pong")
+
+
+def _build(with_base_http_hops: bool):
+    """Wrap the trivial endpoint in the default stack.
+
+    Args:
+        with_base_http_hops: Put a pass-through ``BaseHTTPMiddleware`` in front of every layer.
+
+    Returns:
+        ASGI application.
+    """
+    app = Starlette(routes=[Route("/ping", _ping)])
+    for middleware_class, kwargs in STACK:
+        app = middleware_class(app, **kwargs)
+        if with_base_http_hops:
+            app = BaseHTTPMiddleware(app, dispatch=lambda request, call_next: call_next(request))
+    return app
+
+
+async def _requests_per_second(app) -> float:
+    """Send ``REQUESTS`` sequential GET /ping requests and return the rate.
+
+    Args:
+        app: ASGI application.
+
+    Returns:
+        float: Requests per second.
+    """
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+
+    def scope():
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "client": ("127.0.0.1", 12345),
+            "path": "/ping",
+            "raw_path": b"/ping",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver"), (b"user-agent", b"bench"), (b"accept", b"*/*")],
+        }
+
+    for _ in range(100):  # warm-up
+        await app(scope(), receive, send)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(scope(), receive, send)
+    return REQUESTS / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+def test_default_middleware_stack_requests_per_second():
+    """Measure requests per second through the raw ASGI stack and with BaseHTTPMiddleware hops."""
+    # Boundary logs would otherwise be written to the database
+    with patch("mcpgateway.middleware.request_logging_middleware.structured_logger", MagicMock()), patch("mcpgateway.middleware.observability_middleware.should_sample_trace", return_value=True):
+        raw_rps = asyncio.run(_requests_per_second(_build(with_base_http_hops=False)))
+        hops_rps = asyncio.run(_requests_per_second(_build(with_base_http_hops=True)))
+
+    print(f"\n  raw ASGI stack           {raw_rps:8.0f} req/s")
+    print(f"  with BaseHTTPMiddleware  {hops_rps:8.0f} req/s   ({raw_rps / hops_rps:4.1f}x)")
+    assert raw_rps > hops_rps
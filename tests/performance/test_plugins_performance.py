@@ -13,6 +13,10 @@ showing average execution times per hook type per plugin.
 Usage:
     python tests/performance/test_plugins_performance.py [--details]
 
+``test_parallel_band_latency`` also benchmarks a band of equal-priority
+plugins run sequentially and with ``parallel_execution_within_band``:
+    uv run pytest -v -s tests/performance/test_plugins_performance.py
+
 Options:
     --details    Print detailed profile for each plugin-hook combination
 
@@ -33,8 +37,12 @@ import os
 import pstats
 import sys
 from pstats import SortKey
+import time
 from typing import Any, Dict, Tuple
 
+# Third-Party
+import pytest
+
 # Disable security warnings
 logging.getLogger("mcpgateway.config").setLevel(logging.ERROR)
 logging.getLogger("mcpgateway.observability").setLevel(logging.ERROR)
@@ -48,7 +56,10 @@ sys.path.insert(0, ROOT_DIR)
 from mcpgateway.common.models import Message, PromptResult, ResourceContent, Role, TextContent  # noqa: E402
 from mcpgateway.plugins.framework import (  # noqa: E402
     GlobalContext,
+    Plugin,
+    PluginConfig,
     PluginManager,
+    PluginResult,
     PromptHookType,
     PromptPosthookPayload,
     PromptPrehookPayload,
@@ -59,6 +70,10 @@ from mcpgateway.plugins.framework import (  # noqa: E402
     ToolPostInvokePayload,
     ToolPreInvokePayload,
 )
+from mcpgateway.plugins.framework.base import HookRef  # noqa: E402
+from mcpgateway.plugins.framework.manager import PluginExecutor  # noqa: E402
+from mcpgateway.plugins.framework.models import Config, PluginSettings  # noqa: E402
+from mcpgateway.plugins.framework.registry import PluginRef  # noqa: E402
 
 # Configuration
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "plugins", "config.yaml")
@@ -339,6 +354,61 @@ def print_detailed_profile(profile_path: str, limit: int = 20) -> None:
     print(s.getvalue())
 
 
+class DetectorPlugin(Plugin):
+    """Stand-in for an independent detector (PII, secrets, moderation, ...) that waits on I/O."""
+
+    async def tool_pre_invoke(self, payload: ToolPreInvokePayload, context: Any) -> PluginResult:
+        """Simulate a detector call.
+
+        Args:
+            payload: Tool pre-invoke payload.
+            context: Plugin context.
+
+        Returns:
+            PluginResult: Result that lets the request continue.
+        """
+        await asyncio.sleep(self.config.config["latency"])
+        return PluginResult(metadata={self.name: "clean"})
+
+
+async def _band_latency(parallel: bool, detectors: int = 5, latency: float = 0.005, iterations: int = 50) -> float:
+    """Run a band of equal-priority detectors and return the mean latency per call.
+
+    Args:
+        parallel: Enable ``parallel_execution_within_band``.
+        detectors: Number of plugins in the band.
+        latency: Simulated latency of each detector in seconds.
+        iterations: Number of tool calls to average over.
+
+    Returns:
+        float: Mean seconds per tool call.
+    """
+    plugins = [
+        DetectorPlugin(PluginConfig(name=f"detector-{i}", kind="bench", version="1.0", author="bench", hooks=[ToolHookType.TOOL_PRE_INVOKE], priority=10, config={"latency": latency}))
+        for i in range(detectors)
+    ]
+    hook_refs = [HookRef(ToolHookType.TOOL_PRE_INVOKE, PluginRef(plugin)) for plugin in plugins]
+    executor = PluginExecutor(config=Config(plugin_settings=PluginSettings(parallel_execution_within_band=parallel)))
+    payload = ToolPreInvokePayload(name="search", args={"query": "hello"})
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        result, _ = await executor.execute(hook_refs, payload, GlobalContext(request_id=f"bench-{i}"), ToolHookType.TOOL_PRE_INVOKE)
+        assert result.continue_processing
+    return (time.perf_counter() - start) / iterations
+
+
+@pytest.mark.benchmark
+def test_parallel_band_latency():
+    """Compare a band of five detectors run sequentially and concurrently."""
+    sequential = asyncio.run(_band_latency(parallel=False))
+    parallel = asyncio.run(_band_latency(parallel=True))
+
+    print(f"\n  5 detectors, sequential  {sequential * 1000:6.2f} ms/call")
+    print(f"  5 detectors, parallel    {parallel * 1000:6.2f} ms/call   ({sequential / parallel:4.1f}x)")
+    assert parallel < sequential
+
+
 async def main():
     """Main execution function."""
     # Parse command line arguments
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Microbenchmark: resolving a URI against 10k resource templates.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Compares the previous linear scan (one cached regex per template, in
+registration order) with ``UriTemplateIndex``, the segment trie used by
+``ResourceService._read_template_resource``.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_resource_template_index.py
+"""
+
+# Standard
+import random
+import time
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.services.resource_service import ResourceService
+from mcpgateway.utils.uri_template_index import UriTemplateIndex
+
+TEMPLATE_COUNT = 10_000
+LOOKUPS = 2_000
+
+
+def _templates() -> list:
+    """Build a mix of templates spread over schemes, hosts and shapes.
+
+    Returns:
+        list: URI template strings.
+    """
+    shapes = [
+        "svc{n}://host{h}/items/{{id}}",
+        "svc{n}://host{h}/users/{{user}}/orders/{{order}}",
+        "svc{n}://host{h}/reports/{{year}}-{{month}}.json",
+        "svc{n}://host{h}/files/{{path*}}",
+    ]
+    return [shapes[i % len(shapes)].format(n=i // 400, h=i % 100) for i in range(TEMPLATE_COUNT)]
+
+
+def _concrete(template: str) -> str:
+    """Turn a template into a URI that matches it.
+
+    Args:
+        template: URI template.
+
+    Returns:
+        str: Concrete URI.
+    """
+    return template.replace("{id}", "42").replace("{user}", "u1").replace("{order}", "o9").replace("{year}", "2025").replace("{month}", "01").replace("{path*}", "a/b/c.txt")
+
+
+def _linear_match(compiled: list, uri: str):
+    """Previous behaviour: first template whose regex matches.
+
+    Args:
+        compiled: ``(template, regex)`` pairs in registration order.
+        uri: URI to resolve.
+
+    Returns:
+        The matching template, or None.
+    """
+    uri_path = uri.partition("?")[0]
+    for template, regex in compiled:
+        if regex.match(uri_path):
+            return template
+    return None
+
+
+@pytest.mark.benchmark
+def test_template_index_vs_linear_scan_10k():
+    """The trie should resolve URIs far faster than a regex-per-template scan."""
+    templates = _templates()
+    rng = random.Random(7)
+    uris = [_concrete(rng.choice(templates)) for _ in range(LOOKUPS)]
+
+    # Precompile every regex so the linear scan is not penalized by the 256-entry LRU
+    compiled = [(template, ResourceService._build_regex.__wrapped__(template)) for template in templates]
+
+    start = time.perf_counter()
+    index = UriTemplateIndex()
+    for template in templates:
+        index.add(template, template, template)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    linear_sample = uris[:200]
+    start = time.perf_counter()
+    linear = [_linear_match(compiled, uri) for uri in linear_sample]
+    linear_us = (time.perf_counter() - start) / len(linear_sample) * 1e6
+
+    start = time.perf_counter()
+    indexed = [index.match(uri) for uri in uris]
+    indexed_us = (time.perf_counter() - start) / len(uris) * 1e6
+
+    print(f"\n{TEMPLATE_COUNT} templates, index built in {build_ms:.0f} ms")
+    print(f"{'mode':<8} {'us/lookup':>10}")
+    print(f"{'linear':<8} {linear_us:>10.1f}")
+    print(f"{'trie':<8} {indexed_us:>10.1f}  ({linear_us / indexed_us:.0f}x)")
+
+    assert indexed[: len(linear_sample)] == linear
+    assert all(found is not None for found in indexed)
+    assert indexed_us * 20 < linear_us
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: JSON-RPC messages per second for the SSE transport.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+SSE (and WebSocket) clients send JSON-RPC messages that the gateway answers
+through the same handlers as ``/rpc``. This reports messages per second for:
+
+- an HTTP round trip through ``/rpc`` carrying the connection's token, as
+  ``SessionRegistry.generate_response`` used to make for every message (the
+  full middleware stack, JWT verification and user lookup, without the TCP
+  hop a real loopback also pays),
+- ``dispatch_rpc_message``, which runs the handlers in process with the auth
+  state captured when the SSE connection was authenticated.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_sse_dispatch.py
+"""
+
+# Standard
+import asyncio
+import time
+
+# Third-Party
+import httpx
+import pytest
+
+# First-Party
+from mcpgateway import db as db_mod
+from mcpgateway.main import dispatch_rpc_message
+from mcpgateway.utils.create_jwt_token import create_jwt_token
+
+MESSAGES = 500
+
+
+def _ping(req_id: int) -> dict:
+    return {"jsonrpc": "2.0", "method": "ping", "params": {}, "id": req_id}
+
+
+async def _loopback_messages_per_second(app, token: str) -> float:
+    """Send ``MESSAGES`` pings as HTTP requests to ``/rpc`` and return the rate.
+
+    Args:
+        app: The gateway ASGI application.
+        token: Bearer token of the SSE connection.
+
+    Returns:
+        float: Messages per second.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        for i in range(20):  # warm-up
+            response = await client.post("/rpc", json=_ping(i), headers=headers)
+            assert response.status_code == 200, response.text
+        start = time.perf_counter()
+        for i in range(MESSAGES):
+            response = await client.post("/rpc", json=_ping(i), headers=headers)
+            assert response.json()["result"] == {}
+        return MESSAGES / (time.perf_counter() - start)
+
+
+async def _in_process_messages_per_second(token: str) -> float:
+    """Dispatch ``MESSAGES`` pings with the connection's auth state and return the rate.
+
+    Args:
+        token: Bearer token of the SSE connection.
+
+    Returns:
+        float: Messages per second.
+    """
+    user = {"email": "bench@example.com", "is_admin": False}
+    auth_state = {"token_teams": [], "_jwt_verified_payload": (token, {"sub": "bench@example.com", "teams": []})}
+    headers = {"authorization": f"Bearer {token}"}
+    for i in range(20):  # warm-up
+        await dispatch_rpc_message(_ping(i), user, auth_state=auth_state, headers=headers)
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        response = await dispatch_rpc_message(_ping(i), user, auth_state=auth_state, headers=headers)
+        assert response["result"] == {}
+    return MESSAGES / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+def test_sse_message_dispatch_messages_per_second(app):
+    """Measure messages per second through an HTTP round trip to /rpc and in process."""
+    with db_mod.SessionLocal() as db:
+        db.add(db_mod.EmailUser(email="bench@example.com", password_hash="x", full_name="Bench"))  # nosec B106 - never used to log in
+        db.commit()
+    token = asyncio.run(create_jwt_token({"sub": "bench@example.com", "teams": []}))
+
+    loopback_mps = asyncio.run(_loopback_messages_per_second(app, token))
+    in_process_mps = asyncio.run(_in_process_messages_per_second(token))
+
+    print(f"\n  HTTP round trip to /rpc  {loopback_mps:8.0f} msg/s")
+    print(f"  in-process dispatch      {in_process_mps:8.0f} msg/s   ({in_process_mps / loopback_mps:4.1f}x)")
+    assert in_process_mps > loopback_mps
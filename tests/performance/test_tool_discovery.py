@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: tool discovery index at 50k tools.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Builds the in-process BM25 index used by the ``search_tools`` meta-tool over
+50,000 synthetic tools and reports:
+
+- index build time,
+- memory held by the index (tracemalloc),
+- per-query search latency (top 10),
+- incremental update cost for a single tool event,
+
+and compares the size of a full ``tools/list`` payload with the meta-tool stub.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_tool_discovery.py
+"""
+
+# Standard
+import random
+import statistics
+import time
+import tracemalloc
+
+# Third-Party
+import orjson
+import pytest
+
+# First-Party
+from mcpgateway.services.tool_discovery_service import ToolDiscoveryService, ToolSearchIndex
+
+TOOLS = 50_000
+VERBS = ["get", "list", "create", "update", "delete", "search", "send", "fetch", "run", "sync"]
+NOUNS = ["weather", "forecast", "issue", "pull_request", "message", "channel", "ticket", "invoice", "calendar_event", "file", "image", "translation", "stock_quote", "email", "user"]
+PROPS = ["city", "repo", "owner", "title", "body", "channel", "query", "limit", "date", "language", "path", "symbol", "recipient", "page"]
+QUERIES = ["weather forecast city", "create github issue", "send slack message to channel", "translate text language", "stock quote symbol", "zzz"]
+
+
+def _tools(count: int):
+    """Yield synthetic tool definitions.
+
+    Args:
+        count: Number of tools.
+
+    Yields:
+        dict: ``id``, ``name``, ``description`` and ``inputSchema``.
+    """
+    rng = random.Random(42)
+    for i in range(count):
+        verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+        props = rng.sample(PROPS, 3)
+        yield {
+            "id": f"{i:032x}",
+            "name": f"server{i % 500}-{verb}-{noun}-{i}",
+            "description": f"{verb.title()} a {noun.replace('_', ' ')} using the {props[0]} and {props[1]} parameters. Returns the result as JSON.",
+            "inputSchema": {"type": "object", "properties": {p: {"type": "string", "description": f"The {p}"} for p in props}},
+        }
+
+
+def _build(tools: list) -> ToolSearchIndex:
+    index = ToolSearchIndex()
+    for tool in tools:
+        index.upsert(tool["id"], names=(tool["name"],), description=tool["description"], schema=tool["inputSchema"])
+    return index
+
+
+@pytest.mark.benchmark
+def test_tool_discovery_at_50k_tools():
+    """Index 50k tools and measure build time, memory, search latency and update cost."""
+    tools = list(_tools(TOOLS))
+
+    start = time.perf_counter()
+    index = _build(tools)
+    build_s = time.perf_counter() - start
+
+    # Measure a second build so only the index itself is traced, not the synthetic tools
+    tracemalloc.start()
+    traced = _build(tools)
+    index_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+    del traced
+
+    latencies = []
+    for _ in range(5):
+        for q in QUERIES:
+            start = time.perf_counter()
+            index.top(q, 10)
+            latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    start = time.perf_counter()
+    for tool in tools[:1000]:
+        index.upsert(tool["id"], names=(tool["name"],), description=tool["description"], schema=tool["inputSchema"])
+    upsert_us = (time.perf_counter() - start) * 1_000_000 / 1000
+
+    full_list = len(orjson.dumps({"tools": [{k: v for k, v in t.items() if k != "id"} for t in tools]}))
+    stub_list = len(orjson.dumps({"tools": [ToolDiscoveryService().meta_tool()]}))
+
+    print(f"\n{TOOLS:,} tools, index stats {index.stats()}")
+    print(f"  build:        {build_s:8.2f} s")
+    print(f"  memory:       {index_mb:8.1f} MiB")
+    print(f"  search p50:   {statistics.median(latencies):8.2f} ms")
+    print(f"  search p95:   {latencies[int(len(latencies) * 0.95) - 1]:8.2f} ms")
+    print(f"  tool update:  {upsert_us:8.1f} us")
+    print(f"  tools/list:   {full_list / 1024 / 1024:8.1f} MiB full vs {stub_list} bytes with discovery")
+
+    assert index.top("weather forecast city", 10)
+    assert index.top("zzz", 10) == []
+    assert len(index) == TOOLS
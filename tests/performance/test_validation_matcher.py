@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Benchmark: dangerous-pattern validation of 1 MB JSON bodies.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Compares the original per-pattern, per-value recursive check with the batched
+``ValidationMiddleware._validate_json_data`` on two clean 1 MB payloads:
+
+- one large string value,
+- 20,000 small string values.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_validation_matcher.py
+"""
+
+# Standard
+import re
+import statistics
+import time
+from unittest.mock import patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.middleware.validation_middleware import ValidationMiddleware
+
+PAYLOADS = {
+    "one 1 MB string": {"content": "lorem ipsum dolor sit amet, " * 37_450},
+    "20k small strings": {"items": [{"name": f"item-{i}", "description": "a plain description of the item", "owner": "user@example.com"} for i in range(6_700)]},
+}
+
+
+def _legacy(patterns, data):
+    """Original recursive check: every pattern over every string value.
+
+    Args:
+        patterns: Compiled dangerous patterns.
+        data: Decoded JSON document.
+    """
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, str):
+                for pattern in patterns:
+                    if pattern.search(value):
+                        raise ValueError("dangerous")
+            elif isinstance(value, (dict, list)):
+                _legacy(patterns, value)
+    elif isinstance(data, list):
+        for item in data:
+            _legacy(patterns, item)
+
+
+def _time_ms(func, runs=20):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.mark.benchmark
+def test_validation_matcher_1mb_bodies():
+    """Measure per-body validation time with the legacy and batched matchers."""
+    patterns = [re.compile(p) for p in settings.dangerous_patterns]
+    with patch("mcpgateway.middleware.validation_middleware.settings") as mock_settings:
+        mock_settings.dangerous_patterns = settings.dangerous_patterns
+        mock_settings.max_param_length = 2 * 1024 * 1024
+        mock_settings.validation_max_json_depth = 30
+        mock_settings.environment = "production"
+        middleware = ValidationMiddleware(app=None)
+
+        print(f"\nbackend: {middleware.pattern_matcher.backend}")
+        for name, payload in PAYLOADS.items():
+            legacy_ms = _time_ms(lambda payload=payload: _legacy(patterns, payload))
+            batched_ms = _time_ms(lambda payload=payload: middleware._validate_json_data(payload))
+            print(f"  {name:18} legacy {legacy_ms:8.2f} ms   batched {batched_ms:8.2f} ms   ({legacy_ms / batched_ms:4.1f}x)")
+
+        with pytest.raises(Exception):
+            middleware._validate_json_data({"items": [{"name": "ok"}] * 1000 + [{"cmd": "$(id)"}]})
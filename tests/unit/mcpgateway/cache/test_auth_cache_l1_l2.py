@@ -734,6 +734,20 @@ class TestNoRedisPartialBranches:
         assert "other@test.com:team-1" not in auth_cache._role_cache
         assert "u@test.com:team-2" in auth_cache._role_cache
 
+    @pytest.mark.asyncio
+    async def test_role_invalidation_drops_permission_decisions(self, auth_cache):
+        """Role and membership invalidation propagate to the permission decision cache."""
+        with patch("mcpgateway.cache.auth_cache.permission_cache") as perm_cache:
+            perm_cache.invalidate_user = AsyncMock()
+            perm_cache.invalidate_team = AsyncMock()
+            await auth_cache.invalidate_user_role("u@test.com", "team-1")
+            await auth_cache.invalidate_team_roles("team-1")
+            await auth_cache.invalidate_team_membership("m@test.com")
+            await auth_cache.invalidate_user("a@test.com")
+
+        assert [c.args for c in perm_cache.invalidate_user.await_args_list] == [("u@test.com",), ("m@test.com",), ("a@test.com",)]
+        perm_cache.invalidate_team.assert_awaited_once_with("team-1")
+
     @pytest.mark.asyncio
     async def test_get_user_teams_no_redis_miss(self, auth_cache):
         """get_user_teams L1 miss + no Redis = cache miss (branches 704->728, line 724)."""
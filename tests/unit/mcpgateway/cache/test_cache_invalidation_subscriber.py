@@ -139,6 +139,46 @@ class TestCacheInvalidationSubscriber:
                 assert "tool-a" not in mock_tool_lookup._cache
                 assert "tool-b" in mock_tool_lookup._cache
 
+    @pytest.mark.asyncio
+    async def test_process_tool_result_invalidation(self, cache_subscriber):
+        """Test processing of tool_result:tool_id invalidation message."""
+        # First-Party
+        from mcpgateway.cache.tool_result_cache import ToolResultCache
+
+        result_cache = ToolResultCache(enabled=True, l2_enabled=False)
+        await result_cache.set("key-a", "tool-a", {"content": []})
+        await result_cache.set("key-b", "tool-b", {"content": []})
+
+        with patch.dict("sys.modules", {"mcpgateway.cache.tool_result_cache": MagicMock(tool_result_cache=result_cache)}):
+            with patch("mcpgateway.cache.registry_cache.get_registry_cache"):
+                await cache_subscriber._process_invalidation("tool_result:tool-a")
+
+                # Only the local L1 entries of that tool should be cleared
+                assert "key-a" not in result_cache._cache
+                assert "key-b" in result_cache._cache
+
+    @pytest.mark.asyncio
+    async def test_process_resource_content_invalidation(self, cache_subscriber):
+        """Test processing of resource_content:tag invalidation messages."""
+        # First-Party
+        from mcpgateway.cache.resource_cache import ResourceCache
+
+        content_cache = ResourceCache()
+        content_cache.set("key-a", "a", tags=("gw-a",))
+        content_cache.set("key-b", "b", tags=("gw-b",))
+
+        with patch.dict("sys.modules", {"mcpgateway.cache.resource_cache": MagicMock(resource_cache=content_cache)}):
+            with patch("mcpgateway.cache.registry_cache.get_registry_cache"):
+                await cache_subscriber._process_invalidation("resource_content:gw-a")
+
+                # Only the local entries with that tag should be cleared
+                assert "key-a" not in content_cache._cache
+                assert "key-b" in content_cache._cache
+
+                # An empty tag clears everything
+                await cache_subscriber._process_invalidation("resource_content:")
+                assert len(content_cache) == 0
+
     @pytest.mark.asyncio
     async def test_process_admin_invalidation(self, cache_subscriber):
         """Test processing of admin:prefix invalidation message."""
@@ -157,6 +197,22 @@ class TestCacheInvalidationSubscriber:
             assert "admin:users:list" not in mock_admin_cache._cache
             assert "admin:teams:list" in mock_admin_cache._cache
 
+    @pytest.mark.asyncio
+    async def test_process_permissions_invalidation(self, cache_subscriber):
+        """Test processing of permissions:* invalidation messages."""
+        mock_permission_cache = MagicMock()
+        mock_permission_cache._invalidate_local.return_value = 1
+
+        with patch.dict("sys.modules", {"mcpgateway.cache.permission_cache": MagicMock(permission_cache=mock_permission_cache)}):
+            await cache_subscriber._process_invalidation("permissions:user:alice@example.com")
+            await cache_subscriber._process_invalidation("permissions:team:team-1")
+            await cache_subscriber._process_invalidation("permissions:all")
+
+        assert mock_permission_cache._invalidate_local.call_args_list[0].kwargs == {"user_email": "alice@example.com"}
+        assert mock_permission_cache._invalidate_local.call_args_list[1].kwargs == {"team_id": "team-1"}
+        assert mock_permission_cache._invalidate_local.call_args_list[2].kwargs == {}
+        mock_permission_cache.invalidate_user.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_process_unknown_message_format(self, cache_subscriber):
         """Test that unknown message formats are handled gracefully."""
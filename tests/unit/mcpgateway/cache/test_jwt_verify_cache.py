@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Tests for JWTVerifyCache."""
+
+# Standard
+import time
+from unittest.mock import AsyncMock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.auth_cache import AuthCache
+from mcpgateway.cache.jwt_verify_cache import JWTVerifyCache, token_digest
+from mcpgateway.utils.jwt_config_helper import clear_jwt_caches
+
+
+@pytest.fixture
+def jwt_cache():
+    return JWTVerifyCache(ttl=300, max_size=10, enabled=True)
+
+
+def test_keyed_by_digest_not_raw_token(jwt_cache):
+    jwt_cache.set("header.payload.sig", {"sub": "a"})
+
+    assert list(jwt_cache._cache) == [token_digest("header.payload.sig")]
+    assert jwt_cache.get("header.payload.sig") == {"sub": "a"}
+    assert jwt_cache.get("header.payload.other") is None
+    stats = jwt_cache.stats()
+    assert (stats["hit_count"], stats["miss_count"]) == (1, 1)
+
+
+def test_ttl_bounded_by_exp(jwt_cache):
+    now = time.time()
+    jwt_cache.set("short", {"sub": "a", "exp": int(now) + 2})
+    jwt_cache.set("long", {"sub": "a", "exp": int(now) + 10_000})
+    jwt_cache.set("no-exp", {"sub": "a"})
+
+    assert jwt_cache._cache[token_digest("short")].expiry <= now + 2
+    assert jwt_cache._cache[token_digest("long")].expiry <= now + 301
+    assert jwt_cache._cache[token_digest("no-exp")].expiry <= now + 301
+
+
+def test_expired_entry_is_dropped(jwt_cache):
+    jwt_cache.set("tok", {"sub": "a", "jti": "j1", "exp": int(time.time()) + 60})
+    with patch("time.time", return_value=time.time() + 120):
+        assert jwt_cache.get("tok") is None
+    assert jwt_cache.stats()["size"] == 0
+    assert jwt_cache._jti_index == {}
+
+
+def test_already_expired_token_not_cached(jwt_cache):
+    jwt_cache.set("tok", {"sub": "a", "exp": int(time.time()) - 5})
+    assert jwt_cache.stats()["size"] == 0
+
+
+def test_lru_eviction_keeps_jti_index_consistent(jwt_cache):
+    jwt_cache._maxsize = 2
+    jwt_cache.set("t1", {"jti": "j1"})
+    jwt_cache.set("t2", {"jti": "j2"})
+    assert jwt_cache.get("t1") is not None  # t2 is now least recently used
+    jwt_cache.set("t3", {"jti": "j3"})
+
+    assert jwt_cache.get("t2") is None
+    assert set(jwt_cache._jti_index) == {"j1", "j3"}
+    assert jwt_cache.stats()["eviction_count"] == 1
+
+
+def test_evict_jti_removes_all_tokens_for_jti(jwt_cache):
+    jwt_cache.set("t1", {"jti": "shared"})
+    jwt_cache.set("t2", {"jti": "shared"})
+    jwt_cache.set("t3", {"jti": "other"})
+
+    assert jwt_cache.evict_jti("shared") == 2
+    assert jwt_cache.evict_jti("missing") == 0
+    assert jwt_cache.get("t3") is not None
+    assert jwt_cache.stats()["revocation_evictions"] == 2
+
+
+def test_overwrite_same_token(jwt_cache):
+    jwt_cache.set("t", {"jti": "j1"})
+    jwt_cache.set("t", {"jti": "j2"})
+
+    assert jwt_cache.get("t") == {"jti": "j2"}
+    assert set(jwt_cache._jti_index) == {"j2"}
+
+
+def test_disabled_noops():
+    cache = JWTVerifyCache(enabled=False)
+    cache.set("t", {"sub": "a"})
+    assert cache.get("t") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_reset_stats(jwt_cache):
+    jwt_cache.get("missing")
+    jwt_cache.reset_stats()
+    assert jwt_cache.stats()["miss_count"] == 0
+
+
+def test_clear_jwt_caches_clears_verified_payloads():
+    with patch("mcpgateway.cache.jwt_verify_cache.jwt_verify_cache") as global_cache:
+        clear_jwt_caches()
+    global_cache.clear.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_revocation_evicts_verified_tokens(jwt_cache):
+    auth_cache = AuthCache(enabled=True)
+    auth_cache._redis_checked = True
+    auth_cache._redis_available = False
+    jwt_cache.set("t1", {"jti": "revoked"})
+    jwt_cache.set("t2", {"jti": "known-revoked"})
+
+    with patch("mcpgateway.cache.auth_cache.jwt_verify_cache", jwt_cache):
+        await auth_cache.invalidate_revocation("revoked")
+        assert jwt_cache.get("t1") is None
+
+        auth_cache._revoked_jtis.add("known-revoked")
+        assert await auth_cache.is_token_revoked("known-revoked") is True
+        assert jwt_cache.get("t2") is None
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_redis_revocation_evicts_verified_tokens(jwt_cache):
+    auth_cache = AuthCache(enabled=True)
+    redis = AsyncMock()
+    redis.sismember = AsyncMock(return_value=True)
+    auth_cache._get_redis_client = AsyncMock(return_value=redis)
+    jwt_cache.set("t1", {"jti": "remote-revoked"})
+
+    with patch("mcpgateway.cache.auth_cache.jwt_verify_cache", jwt_cache):
+        assert await auth_cache.is_token_revoked("remote-revoked") is True
+
+    assert jwt_cache.get("t1") is None
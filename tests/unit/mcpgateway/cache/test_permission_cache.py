@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""Tests for PermissionDecisionCache."""
+
+# Standard
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.permission_cache import ANY_TEAM_SCOPE, CacheEntry, GLOBAL_SCOPE, PermissionDecisionCache
+
+
+class _AsyncIter:
+    """Minimal async iterator standing in for redis.scan_iter."""
+
+    def __init__(self, items):
+        self._items = list(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._items:
+            raise StopAsyncIteration
+        return self._items.pop(0)
+
+
+@pytest.fixture
+def permission_cache_instance():
+    cache = PermissionDecisionCache(ttl=60, max_size=10, enabled=True)
+    cache._l2_enabled = False
+    return cache
+
+
+@pytest.fixture
+def redis_client():
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.setex = AsyncMock()
+    redis.delete = AsyncMock()
+    redis.publish = AsyncMock()
+    redis.scan_iter = MagicMock(side_effect=lambda match: _AsyncIter([match.replace("*", "x")]))
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_set_get_l1(permission_cache_instance):
+    await permission_cache_instance.set("a@example.com", "tools.read", "team-1", True, True)
+
+    assert await permission_cache_instance.get("a@example.com", "tools.read", "team-1", True) is True
+    # admin_bypass is part of the key
+    assert await permission_cache_instance.get("a@example.com", "tools.read", "team-1", False) is None
+    stats = permission_cache_instance.stats()
+    assert stats["l1_hit_count"] == 1
+    assert stats["l1_miss_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deny_decisions_are_cached(permission_cache_instance):
+    await permission_cache_instance.set("a@example.com", "tools.create", GLOBAL_SCOPE, True, False)
+    assert await permission_cache_instance.get("a@example.com", "tools.create", GLOBAL_SCOPE, True) is False
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(permission_cache_instance):
+    permission_cache_instance._l1_maxsize = 2
+    await permission_cache_instance.set("a", "p1", GLOBAL_SCOPE, True, True)
+    await permission_cache_instance.set("a", "p2", GLOBAL_SCOPE, True, True)
+    # Touch p1 so p2 becomes least recently used
+    assert await permission_cache_instance.get("a", "p1", GLOBAL_SCOPE, True) is True
+    await permission_cache_instance.set("a", "p3", GLOBAL_SCOPE, True, True)
+
+    assert await permission_cache_instance.get("a", "p2", GLOBAL_SCOPE, True) is None
+    assert await permission_cache_instance.get("a", "p1", GLOBAL_SCOPE, True) is True
+    assert permission_cache_instance.stats()["eviction_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_a_miss(permission_cache_instance):
+    key = ("a", "tools.read", GLOBAL_SCOPE, True)
+    permission_cache_instance._cache[key] = CacheEntry(value=True, expiry=time.time() - 1)
+
+    assert await permission_cache_instance.get(*key) is None
+    assert key not in permission_cache_instance._cache
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_and_team(permission_cache_instance):
+    await permission_cache_instance.set("a", "tools.read", "team-1", True, True)
+    await permission_cache_instance.set("a", "tools.read", GLOBAL_SCOPE, True, True)
+    await permission_cache_instance.set("b", "tools.read", "team-1", True, True)
+    await permission_cache_instance.set("b", "tools.read", ANY_TEAM_SCOPE, True, True)
+    await permission_cache_instance.set("b", "tools.read", "team-2", True, True)
+
+    await permission_cache_instance.invalidate_user("a")
+    assert {k[0] for k in permission_cache_instance._cache} == {"b"}
+
+    await permission_cache_instance.invalidate_team("team-1")
+    assert [k[2] for k in permission_cache_instance._cache] == ["team-2"]
+
+    await permission_cache_instance.invalidate_all()
+    assert permission_cache_instance.stats()["l1_size"] == 0
+    assert permission_cache_instance.stats()["invalidation_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stale_decision_discarded_after_invalidation(permission_cache_instance):
+    generation = permission_cache_instance.generation
+    await permission_cache_instance.invalidate_user("someone-else")
+    await permission_cache_instance.set("a", "tools.read", GLOBAL_SCOPE, True, True, generation=generation)
+
+    assert await permission_cache_instance.get("a", "tools.read", GLOBAL_SCOPE, True) is None
+
+
+@pytest.mark.asyncio
+async def test_l2_hit_populates_l1(permission_cache_instance, redis_client):
+    permission_cache_instance._l2_enabled = True
+    redis_client.get = AsyncMock(return_value=b"1")
+    permission_cache_instance._get_redis_client = AsyncMock(return_value=redis_client)
+
+    assert await permission_cache_instance.get("a", "tools.read", "team-1", True) is True
+    redis_client.get.assert_awaited_once_with("mcpgw:perm:a:team-1:tools.read:1")
+    assert ("a", "tools.read", "team-1", True) in permission_cache_instance._cache
+    assert permission_cache_instance.stats()["l2_hit_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_l2_miss_and_errors(permission_cache_instance, redis_client):
+    permission_cache_instance._l2_enabled = True
+    permission_cache_instance._get_redis_client = AsyncMock(return_value=redis_client)
+
+    assert await permission_cache_instance.get("a", "tools.read", "team-1", True) is None
+    assert permission_cache_instance.stats()["l2_miss_count"] == 1
+
+    redis_client.get = AsyncMock(side_effect=RuntimeError("boom"))
+    redis_client.setex = AsyncMock(side_effect=RuntimeError("boom"))
+    assert await permission_cache_instance.get("b", "tools.read", "team-1", True) is None
+    await permission_cache_instance.set("b", "tools.read", "team-1", True, False)
+    # L1 still updated when Redis fails
+    assert await permission_cache_instance.get("b", "tools.read", "team-1", True) is False
+
+
+@pytest.mark.asyncio
+async def test_set_writes_l2(permission_cache_instance, redis_client):
+    permission_cache_instance._l2_enabled = True
+    permission_cache_instance._get_redis_client = AsyncMock(return_value=redis_client)
+
+    await permission_cache_instance.set("a", "tools.read", GLOBAL_SCOPE, False, False)
+
+    redis_client.setex.assert_awaited_once_with("mcpgw:perm:a:__global__:tools.read:0", 60, "0")
+
+
+@pytest.mark.asyncio
+async def test_invalidation_publishes_to_other_workers(permission_cache_instance, redis_client):
+    permission_cache_instance._l2_enabled = True
+    permission_cache_instance._get_redis_client = AsyncMock(return_value=redis_client)
+
+    await permission_cache_instance.invalidate_user("a")
+    await permission_cache_instance.invalidate_team("team-1")
+    await permission_cache_instance.invalidate_all()
+
+    messages = [c.args for c in redis_client.publish.await_args_list]
+    assert messages == [
+        ("mcpgw:cache:invalidate", "permissions:user:a"),
+        ("mcpgw:cache:invalidate", "permissions:team:team-1"),
+        ("mcpgw:cache:invalidate", "permissions:all"),
+    ]
+    patterns = [c.kwargs["match"] for c in redis_client.scan_iter.call_args_list]
+    assert patterns == ["mcpgw:perm:a:*", "mcpgw:perm:*:team-1:*", f"mcpgw:perm:*:{ANY_TEAM_SCOPE}:*", "mcpgw:perm:*"]
+    assert redis_client.delete.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_invalidate_redis_error_is_swallowed(permission_cache_instance, redis_client):
+    permission_cache_instance._l2_enabled = True
+    redis_client.publish = AsyncMock(side_effect=RuntimeError("boom"))
+    permission_cache_instance._get_redis_client = AsyncMock(return_value=redis_client)
+
+    await permission_cache_instance.invalidate_all()
+
+
+@pytest.mark.asyncio
+async def test_disabled_noops():
+    cache = PermissionDecisionCache(enabled=False)
+    await cache.set("a", "tools.read", GLOBAL_SCOPE, True, True)
+    assert await cache.get("a", "tools.read", GLOBAL_SCOPE, True) is None
+    await cache.invalidate_user("a")
+    await cache.invalidate_team("t")
+    await cache.invalidate_all()
+    assert cache.stats()["invalidation_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_redis_client(monkeypatch):
+    cache = PermissionDecisionCache(enabled=True)
+    cache._l2_enabled = False
+    assert await cache._get_redis_client() is None
+
+    cache._l2_enabled = True
+    monkeypatch.setattr("mcpgateway.utils.redis_client.get_redis_client", AsyncMock(return_value=MagicMock()))
+    assert await cache._get_redis_client() is not None
+    assert cache.stats()["redis_available"] is True
+
+    other = PermissionDecisionCache(enabled=True)
+    other._l2_enabled = True
+    monkeypatch.setattr("mcpgateway.utils.redis_client.get_redis_client", AsyncMock(side_effect=RuntimeError("down")))
+    assert await other._get_redis_client() is None
+    assert other.stats()["redis_available"] is False
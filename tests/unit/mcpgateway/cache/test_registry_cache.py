@@ -11,14 +11,16 @@ Tests for the registry cache module.
 import asyncio
 import builtins
 import time
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 # Third-Party
 import orjson
+from pydantic import BaseModel
 import pytest
 
 # First-Party
-from mcpgateway.cache.registry_cache import CacheEntry, CacheInvalidationSubscriber, RegistryCache, RegistryCacheConfig, _get_cleanup_timeout
+from mcpgateway.cache.registry_cache import CachedResponse, CacheEntry, CacheInvalidationSubscriber, RegistryCache, RegistryCacheConfig, _get_cleanup_timeout
 
 
 class TestCacheEntry:
@@ -437,3 +439,177 @@ class TestRegistryCache:
         cache._get_redis_client = AsyncMock(return_value=redis)
 
         await cache.invalidate("tools")
+
+
+class _ScopedItem(BaseModel):
+    id: str
+    created_at: datetime
+
+
+def _scoped_fetcher(team_items, owner_items):
+    """Build a fetch(owner_part) callable that records which parts hit the database."""
+    calls = []
+
+    async def fetch(owner_part):
+        calls.append(owner_part)
+        return (owner_items if owner_part else team_items), None
+
+    return fetch, calls
+
+
+class TestScopedListings:
+    """Tests for team-scoped list entries shared across users."""
+
+    TEAM = [_ScopedItem(id="t1", created_at=datetime(2025, 1, 1))]
+
+    @pytest.mark.asyncio
+    async def test_team_part_shared_across_users_with_same_teams(self):
+        cache = RegistryCache()
+        alice = [_ScopedItem(id="a1", created_at=datetime(2025, 1, 3))]
+        bob = [_ScopedItem(id="b1", created_at=datetime(2025, 1, 2))]
+        fetch_alice, alice_calls = _scoped_fetcher(self.TEAM, alice)
+        fetch_bob, bob_calls = _scoped_fetcher(self.TEAM, bob)
+
+        items, _ = await cache.list_scoped("tools", _ScopedItem, fetch_alice, ["x", "y"], "alice@example.com", limit=0)
+        assert [i.id for i in items] == ["a1", "t1"]
+
+        # Same team set in a different order: only Bob's own rows are fetched
+        items, _ = await cache.list_scoped("tools", _ScopedItem, fetch_bob, ["y", "x", "x"], "bob@example.com", limit=0)
+        assert [i.id for i in items] == ["b1", "t1"]
+        assert alice_calls == [False, True]
+        assert bob_calls == [True]
+
+    @pytest.mark.asyncio
+    async def test_filters_and_team_sets_are_separate_entries(self):
+        cache = RegistryCache()
+        fetch, calls = _scoped_fetcher(self.TEAM, [])
+
+        await cache.list_scoped("tools", _ScopedItem, fetch, ["x"], limit=0)
+        await cache.list_scoped("tools", _ScopedItem, fetch, ["x", "y"], limit=0)
+        await cache.list_scoped("tools", _ScopedItem, fetch, ["x"], limit=0, include_inactive=True)
+        await cache.list_scoped("tools", _ScopedItem, fetch, ["x"], limit=10)
+
+        assert calls == [False, False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_stats_report_scoped_hit_rate(self):
+        cache = RegistryCache()
+        fetch, _ = _scoped_fetcher(self.TEAM, [])
+
+        await cache.list_scoped("prompts", _ScopedItem, fetch, [], limit=0)
+        await cache.list_scoped("prompts", _ScopedItem, fetch, [], limit=0)
+        await cache.list_scoped("prompts", _ScopedItem, fetch, [], limit=0)
+
+        stats = cache.stats()
+        assert (stats["scoped_hit_count"], stats["scoped_miss_count"]) == (2, 1)
+        assert stats["scoped_hit_rate"] == pytest.approx(2 / 3)
+        cache.reset_stats()
+        assert cache.stats()["scoped_hit_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_invalidation_drops_scoped_entries(self):
+        cache = RegistryCache()
+        fetch, calls = _scoped_fetcher(self.TEAM, [])
+
+        await cache.list_scoped("resources", _ScopedItem, fetch, ["x"], limit=0)
+        await cache.invalidate_resources()
+        await cache.list_scoped("resources", _ScopedItem, fetch, ["x"], limit=0)
+
+        assert calls == [False, False]
+
+
+class TestCachedResponses:
+    """Tests for pre-serialized response bodies and their ETags."""
+
+    def test_etag_depends_only_on_body(self):
+        assert CachedResponse.from_body(b"[1]").etag == CachedResponse.from_body(b"[1]").etag
+        assert CachedResponse.from_body(b"[1]").etag != CachedResponse.from_body(b"[2]").etag
+
+    def test_etag_matches_header_forms(self):
+        response = CachedResponse.from_body(b"[]")
+        assert response.etag_matches(response.etag)
+        assert response.etag_matches(f"W/{response.etag}")
+        assert response.etag_matches(f'"stale", {response.etag}')
+        assert response.etag_matches("*")
+        assert not response.etag_matches('"stale"')
+        assert not response.etag_matches("")
+
+    @pytest.mark.asyncio
+    async def test_set_and_get_response(self):
+        cache = RegistryCache()
+        stored = await cache.set_response("tools", b'[{"id":"1"}]', "h1")
+
+        assert await cache.get_response("tools", "h1") == stored
+        assert await cache.get_response("tools", "h2") is None
+        assert cache._hit_count == 1 and cache._miss_count == 1
+
+    @pytest.mark.asyncio
+    async def test_response_does_not_collide_with_data_entry(self):
+        cache = RegistryCache()
+        await cache.set("tools", {"tools": []}, "h1")
+        await cache.set_response("tools", b"[]", "h1")
+
+        assert await cache.get("tools", "h1") == {"tools": []}
+        assert (await cache.get_response("tools", "h1")).body == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tools_drops_responses(self):
+        cache = RegistryCache()
+        await cache.set_response("tools", b"[]", "h1")
+        await cache.set_response("prompts", b"[]", "h1")
+
+        await cache.invalidate_tools()
+
+        assert await cache.get_response("tools", "h1") is None
+        assert await cache.get_response("prompts", "h1") is not None
+
+    @pytest.mark.asyncio
+    async def test_response_disabled(self):
+        cache = RegistryCache()
+        cache._enabled = False
+
+        stored = await cache.set_response("tools", b"[]", "h1")
+
+        assert stored.body == b"[]" and stored.etag
+        assert await cache.get_response("tools", "h1") is None
+        assert cache._cache == {}
+
+    @pytest.mark.asyncio
+    async def test_response_expires(self):
+        cache = RegistryCache()
+        await cache.set_response("tools", b"[]", "h1", ttl=1)
+        cache._cache[cache._get_redis_key("tools", "response:h1")].expiry = time.time() - 1
+
+        assert await cache.get_response("tools", "h1") is None
+
+    @pytest.mark.asyncio
+    async def test_response_redis_round_trip(self):
+        cache = RegistryCache()
+        redis = MagicMock()
+        redis.setex = AsyncMock()
+        cache._get_redis_client = AsyncMock(return_value=redis)
+
+        stored = await cache.set_response("tools", b"[]", "h1")
+        redis.setex.assert_awaited_once_with("mcpgw:registry:tools:response:h1", cache._tools_ttl, b"[]")
+
+        # Another worker: empty local tier, body served from Redis and copied locally
+        other = RegistryCache()
+        redis.get = AsyncMock(return_value="[]")
+        other._get_redis_client = AsyncMock(return_value=redis)
+        assert await other.get_response("tools", "h1") == stored
+        assert other._redis_hit_count == 1
+        redis.get.reset_mock()
+        assert await other.get_response("tools", "h1") == stored
+        redis.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_response_redis_errors_fall_back_to_memory(self):
+        cache = RegistryCache()
+        redis = MagicMock()
+        redis.setex = AsyncMock(side_effect=RuntimeError("boom"))
+        redis.get = AsyncMock(side_effect=RuntimeError("boom"))
+        cache._get_redis_client = AsyncMock(return_value=redis)
+
+        stored = await cache.set_response("tools", b"[]", "h1")
+        assert await cache.get_response("tools", "h1") == stored
+        assert await cache.get_response("tools", "h2") is None
@@ -10,6 +10,7 @@ Unit tests for ResourceCache.
 # Standard
 import asyncio
 import time
+from unittest.mock import AsyncMock, patch
 
 # Third-Party
 import pytest
@@ -90,6 +91,132 @@ def test_clear(cache):
     assert len(cache) == 0
 
 
+def test_byte_bound_evicts_lru_entries():
+    """Entries are evicted in LRU order until the total size fits max_bytes."""
+    cache = ResourceCache(max_size=100, ttl=60, max_bytes=10)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    assert cache.get("a") == "aaaa"  # 'b' is now least recently used
+
+    cache.set("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    stats = cache.stats()
+    assert stats["bytes"] == 8
+    assert stats["eviction_count"] == 1
+
+
+def test_oversize_entry_not_cached_and_replaces_previous_value():
+    """A value above max_entry_bytes is not cached and drops the stale value under its key."""
+    cache = ResourceCache(max_size=10, ttl=60, max_bytes=100, max_entry_bytes=5)
+    cache.set("a", "ok")
+    cache.set("a", "far too large")
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0
+    assert cache.stats()["oversize_count"] == 1
+
+
+def test_replacing_entry_updates_byte_usage():
+    """Overwriting a key accounts for the new size only."""
+    cache = ResourceCache(max_size=10, ttl=60, max_bytes=100)
+    cache.set("a", "12345")
+    cache.set("a", b"12")
+
+    assert cache.stats()["bytes"] == 2
+    assert len(cache) == 1
+
+
+def test_per_entry_ttl():
+    """The ttl argument overrides the cache TTL for one entry."""
+    with patch("time.time") as mock_time:
+        mock_time.return_value = 1000
+        cache = ResourceCache(max_size=10, ttl=60)
+        cache.set("short", 1, ttl=5)
+        cache.set("default", 2)
+
+        mock_time.return_value = 1010
+        assert cache.get("short") is None
+        assert cache.get("default") == 2
+
+
+def test_invalidate_by_tag_and_key():
+    """invalidate drops the entry under the key and all entries carrying the tag."""
+    cache = ResourceCache(max_size=10, ttl=60, max_bytes=100)
+    cache.set("k1", "a", tags=("gw-1", "res-1"))
+    cache.set("k2", "b", tags=("gw-1", "res-2"))
+    cache.set("k3", "c", tags=("gw-2",))
+
+    assert cache.invalidate("gw-1") == 2
+    assert cache.get("k1") is None and cache.get("k2") is None
+    assert cache.get("k3") == "c"
+    assert cache.invalidate("k3") == 1
+    assert cache.invalidate("unknown") == 0
+    assert cache.stats()["bytes"] == 0
+    assert cache._tags == {}
+
+
+def test_expired_entries_release_tags_and_bytes():
+    """Entries removed on expiry no longer count towards bytes or tag lookups."""
+    cache = ResourceCache(max_size=10, ttl=0.05, max_bytes=100)
+    cache.set("k1", "abc", tags=("gw-1",))
+    time.sleep(0.1)
+    cache._cleanup_once()
+
+    assert cache.stats()["bytes"] == 0
+    assert cache._tags == {}
+
+
+def test_stats_hit_rate():
+    """Hits and misses are counted and reset."""
+    cache = ResourceCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    stats = cache.stats()
+    assert (stats["hit_count"], stats["miss_count"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    cache.reset_stats()
+    assert cache.stats()["hit_count"] == 0
+    assert cache.stats()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_shared_publishes_with_redis(monkeypatch):
+    """With Redis, invalidation is published to the other workers."""
+    cache = ResourceCache()
+    cache.set("k1", "a", tags=("gw-1",))
+    redis = AsyncMock()
+    monkeypatch.setattr("mcpgateway.cache.resource_cache.settings.cache_type", "redis")
+
+    with patch("mcpgateway.utils.redis_client.get_redis_client", AsyncMock(return_value=redis)):
+        await cache.invalidate_shared("gw-1")
+        await cache.invalidate_shared()
+
+    assert len(cache) == 0
+    redis.publish.assert_any_await("mcpgw:cache:invalidate", "resource_content:gw-1")
+    redis.publish.assert_any_await("mcpgw:cache:invalidate", "resource_content:")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_shared_without_redis_is_local(monkeypatch):
+    """Without Redis, only the local cache is invalidated."""
+    cache = ResourceCache()
+    cache.set("k1", "a")
+    monkeypatch.setattr("mcpgateway.cache.resource_cache.settings.cache_type", "memory")
+
+    with patch("mcpgateway.utils.redis_client.get_redis_client", AsyncMock()) as get_client:
+        await cache.invalidate_shared("k1")
+
+    get_client.assert_not_called()
+    assert len(cache) == 0
+
+
 @pytest.mark.asyncio
 async def test_initialize_and_shutdown_logs(monkeypatch):
     """Test initialize and shutdown log and cleanup."""
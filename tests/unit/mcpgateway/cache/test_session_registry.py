@@ -447,28 +447,14 @@ async def test_generate_response_initialize(registry: SessionRegistry):
 
     msg = {"method": "initialize", "id": 101, "params": {"protocol_version": settings.protocol_version}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"result": {"protocolVersion": settings.protocol_version}, "id": 101}
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {"protocolVersion": settings.protocol_version}, "id": 101})
 
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
-
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id=None,
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -489,28 +475,14 @@ async def test_generate_response_ping(registry: SessionRegistry):
 
     msg = {"method": "ping", "id": 77, "params": {}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"result": {}, "id": 77}
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {}, "id": 77})
 
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
-
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id=None,
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -525,28 +497,14 @@ async def test_generate_response_tools_list(registry: SessionRegistry, stub_db,
 
     msg = {"method": "tools/list", "id": 42, "params": {}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 42}
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 42})
 
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id=None,
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -564,28 +522,14 @@ async def test_generate_response_resources_list(registry: SessionRegistry, stub_
 
     msg = {"method": "resources/list", "id": 43, "params": {}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 42}
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 42})
 
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
-
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id=None,
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -602,28 +546,14 @@ async def test_generate_response_prompts_list(registry: SessionRegistry, stub_db
 
     msg = {"method": "prompts/list", "id": 44, "params": {}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 42}
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 42})
 
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
-
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id=None,
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -634,35 +564,19 @@ async def test_generate_response_prompts_list(registry: SessionRegistry, stub_db
 
 @pytest.mark.asyncio
 async def test_generate_response_tools_call(registry: SessionRegistry, stub_db, stub_services):
-    """*tools/call* makes HTTP request and returns response."""
+    """*tools/call* is dispatched in process and the result is returned."""
     tr = FakeSSETransport("tools_call")
     await registry.add_session("tools_call", tr)
 
-    # Mock httpx.AsyncClient properly as an async context manager
-    mock_response = Mock()
-    mock_response.json.return_value = {"result": "tool_executed"}
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    # Create a proper async context manager mock
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": "tool_executed", "id": 45})
 
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         msg = {"method": "tools/call", "id": 45, "params": {"name": "test_tool", "arguments": {"arg1": "value1"}}}
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id=None,
-            user={"token": "test_token"},
+            user={"token": "test_token", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -679,28 +593,14 @@ async def test_generate_response_server_specific_tools_list(registry: SessionReg
 
     msg = {"method": "tools/list", "id": 46, "params": {}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 46}
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 46})
 
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
-
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id="server123",
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -717,28 +617,14 @@ async def test_generate_response_server_specific_resources_list(registry: Sessio
 
     msg = {"method": "resources/list", "id": 43, "params": {}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 43}
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 43})
 
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
-
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id="server123",
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -755,28 +641,14 @@ async def test_generate_response_server_specific_prompts_list(registry: SessionR
 
     msg = {"method": "prompts/list", "id": 44, "params": {}}
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 44}
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "jsonrpc": "2.0", "result": [{"name": "demo"}], "id": 44})
 
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id="server123",
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -791,29 +663,15 @@ async def test_generate_response_unknown_method(registry: SessionRegistry, stub_
     tr = FakeSSETransport("unknown")
     await registry.add_session("unknown", tr)
 
-    mock_response = Mock()
-    mock_response.json.return_value = {"result": {}}
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
+    mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {}})
 
     msg = {"method": "unknown_method", "id": 47, "params": {}}
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
         await registry.generate_response(
             message=msg,
             transport=tr,
             server_id=None,
-            user={"token": "test"},
+            user={"token": "test", "auth_state": {}},
             base_url="http://host",
         )
 
@@ -892,7 +750,7 @@ async def test_none_backend():
         assert not tr.disconnect_called
 
         await registry.broadcast("none_test", {"test": "message"})
-        await registry.respond(server_id=None, user={"token": "test"}, session_id="none_test", base_url="http://localhost")
+        await registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="none_test", base_url="http://localhost")
 
         assert len(tr.sent) == 0
     finally:
@@ -1297,25 +1155,11 @@ async def test_full_memory_workflow(stub_db, stub_services):
         init_message = {"method": "initialize", "id": 1, "params": {"protocol_version": settings.protocol_version}}
         await registry.broadcast("workflow_test", init_message)
 
-        mock_response = Mock()
-        mock_response.json.return_value = {"result": {"protocolVersion": settings.protocol_version}, "id": 1}
-
-        mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
-
-            async def __aenter__(self):
-                return mock_client
-
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
+        mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {"protocolVersion": settings.protocol_version}, "id": 1})
 
         # Respond to message
-        with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
-            await registry.respond(server_id=None, user={"token": "test"}, session_id="workflow_test", base_url="http://localhost")
+        with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
+            await registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="workflow_test", base_url="http://localhost")
 
         # Should have received initialize response + notifications
         assert len(transport.sent) >= 5
@@ -1457,7 +1301,7 @@ async def test_respond_memory_backend_no_message(registry: SessionRegistry):
     registry._session_message = None
 
     # The respond method should handle None _session_message gracefully
-    await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
+    await registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="test_session", base_url="http://localhost")
 
 
 @pytest.mark.asyncio
@@ -1473,7 +1317,7 @@ async def test_respond_memory_backend_with_none_message_content(registry: Sessio
     registry._session_message = {"session_id": "test_session", "message": None}
 
     with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
-        await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
+        await registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="test_session", base_url="http://localhost")
 
         # Should NOT call generate_response since message content is None
         mock_gen.assert_not_called()
@@ -1488,7 +1332,7 @@ async def test_respond_memory_backend_with_message_no_transport(registry: Sessio
     registry._session_message = {"session_id": "missing_session", "message": json.dumps({"method": "ping", "id": 1})}
 
     with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
-        await registry.respond(server_id=None, user={"token": "test"}, session_id="missing_session", base_url="http://localhost")
+        await registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="missing_session", base_url="http://localhost")
 
         mock_gen.assert_not_called()
 
@@ -1503,7 +1347,7 @@ async def test_respond_memory_backend_with_session_message_check(registry: Sessi
     registry._session_message = {"session_id": "test_session", "message": json.dumps({"method": "ping", "id": 1})}
 
     with patch.object(registry, "generate_response", new_callable=AsyncMock) as mock_gen:
-        await registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost")
+        await registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="test_session", base_url="http://localhost")
 
         # Should call generate_response since transport exists
         mock_gen.assert_called_once()
@@ -1520,22 +1364,13 @@ async def test_generate_response_jsonrpc_error(registry: SessionRegistry):
 
     message = {"method": "test_method", "id": 1, "params": {}}
 
-    # Mock ResilientHttpClient to raise JSONRPCError
     # First-Party
     from mcpgateway.validation.jsonrpc import JSONRPCError
 
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            raise JSONRPCError(code=-32601, message="Method not found")
+    mock_dispatch = AsyncMock(side_effect=JSONRPCError(code=-32601, message="Method not found"))
 
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
-
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
-        await registry.generate_response(message=message, transport=tr, server_id=None, user={"token": "test"}, base_url="http://localhost")
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
+        await registry.generate_response(message=message, transport=tr, server_id=None, user={"token": "test", "auth_state": {}}, base_url="http://localhost")
 
     # Should have sent error response
     assert len(tr.sent) == 1
@@ -1552,19 +1387,10 @@ async def test_generate_response_general_exception(registry: SessionRegistry):
 
     message = {"method": "test_method", "id": 1, "params": {}}
 
-    # Mock ResilientHttpClient to raise general exception
-    class MockAsyncClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            raise Exception("Network error")
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
+    mock_dispatch = AsyncMock(side_effect=Exception("Network error"))
 
-    with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
-        await registry.generate_response(message=message, transport=tr, server_id=None, user={"token": "test"}, base_url="http://localhost")
+    with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
+        await registry.generate_response(message=message, transport=tr, server_id=None, user={"token": "test", "auth_state": {}}, base_url="http://localhost")
 
     # Should have sent error response
     assert len(tr.sent) == 1
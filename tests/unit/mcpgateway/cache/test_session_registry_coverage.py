@@ -2153,29 +2153,15 @@ class TestGenerateResponseEdgeCases:
         tr = FakeSSETransport("auth_tok")
         await registry.add_session("auth_tok", tr)
 
-        mock_response = Mock()
-        mock_response.json.return_value = {"result": {}, "id": 77}
-
-        mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
-
-            async def __aenter__(self):
-                return mock_client
-
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
+        mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {}, "id": 77})
 
         msg = {"method": "ping", "id": 77, "params": {}}
-        with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+        with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
             await registry.generate_response(
                 message=msg,
                 transport=tr,
                 server_id=None,
-                user={"auth_token": "my_jwt_token", "email": "user@test.com"},
+                user={"auth_token": "my_jwt_token", "email": "user@test.com", "auth_state": {}},
                 base_url="http://host",
             )
 
@@ -2189,79 +2175,71 @@ class TestGenerateResponseEdgeCases:
         tr = FakeSSETransport("affinity_test")
         await registry.add_session("affinity_test", tr)
 
-        mock_response = Mock()
-        mock_response.json.return_value = {"result": {}, "id": 88}
-
-        mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
-
-            async def __aenter__(self):
-                return mock_client
-
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
+        mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {}, "id": 88})
 
         msg = {"method": "ping", "id": 88, "params": {}}
 
-        with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
+        with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
             with patch.object(registry, "_register_session_mapping", new_callable=AsyncMock) as mock_reg:
                 await registry.generate_response(
                     message=msg,
                     transport=tr,
                     server_id=None,
-                    user={"auth_token": "tok", "email": "u@t.com"},
+                    user={"auth_token": "tok", "email": "u@t.com", "auth_state": {}},
                     base_url="http://host",
                 )
 
                 mock_reg.assert_awaited_once()
 
         # Verify x-mcp-session-id header was passed
-        call_args = mock_client.post.call_args
-        headers = call_args.kwargs.get("headers", {})
-        assert "x-mcp-session-id" in headers
+        headers = mock_dispatch.call_args.kwargs["headers"]
+        assert headers["x-mcp-session-id"] == "affinity_test"
+        assert headers["authorization"] == "Bearer tok"
 
     @pytest.mark.asyncio
-    async def test_generate_response_servers_path_extraction(self, registry, stub_db, stub_services):
-        """Lines 1962-1968: URL path with /servers/ prefix."""
-        tr = FakeSSETransport("srv_path")
-        await registry.add_session("srv_path", tr)
+    async def test_generate_response_dispatches_with_connection_auth_state(self, registry, stub_db, stub_services):
+        """The auth state captured on the SSE connection is passed to the dispatcher."""
+        tr = FakeSSETransport("auth_state")
+        await registry.add_session("auth_state", tr)
 
-        mock_response = Mock()
-        mock_response.json.return_value = {"result": {}, "id": 99}
+        mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {"tools": []}, "id": 99})
+        auth_state = {"token_teams": ["team-1"], "_jwt_verified_payload": ("tok", {"sub": "u@t.com"})}
+        user = {"auth_token": "tok", "email": "u@t.com", "auth_state": auth_state}
 
-        mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
+        with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
+            await registry.generate_response(message={"method": "tools/list", "id": 99, "params": {}}, transport=tr, server_id="srv-1", user=user, base_url="http://host/servers/srv-1")
 
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
+        rpc_input, dispatched_user = mock_dispatch.call_args.args
+        assert rpc_input == {"jsonrpc": "2.0", "method": "tools/list", "params": {"server_id": "srv-1"}, "id": 99}
+        assert dispatched_user is user
+        assert mock_dispatch.call_args.kwargs["auth_state"] is auth_state
+        assert tr.sent[-1] == {"jsonrpc": "2.0", "result": {"tools": []}, "id": 99}
 
-            async def __aenter__(self):
-                return mock_client
+    @pytest.mark.asyncio
+    async def test_generate_response_without_auth_state_is_rejected(self, registry, stub_db, stub_services):
+        """Without a captured auth state the message is rejected, never dispatched with admin status from the user dict."""
+        tr = FakeSSETransport("no_auth_state")
+        await registry.add_session("no_auth_state", tr)
 
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
+        mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "result": {}, "id": 5})
 
-        msg = {"method": "ping", "id": 99, "params": {}}
+        with patch("mcpgateway.main.dispatch_rpc_message", mock_dispatch):
+            await registry.generate_response(message={"method": "ping", "id": 5}, transport=tr, server_id=None, user={"email": "admin@t.com", "token_teams": None, "is_admin": True}, base_url="http://host")
 
-        with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
-            await registry.generate_response(
-                message=msg,
-                transport=tr,
-                server_id=None,
-                user={"auth_token": "tok"},
-                base_url="http://host/prefix/servers/abc123",
-            )
+        mock_dispatch.assert_not_awaited()
+        assert tr.sent == [{"jsonrpc": "2.0", "error": {"code": -32000, "message": "Authentication required"}, "id": 5}]
+
+    @pytest.mark.asyncio
+    async def test_generate_response_forwards_rpc_errors(self, registry, stub_db, stub_services):
+        """JSON-RPC errors from the dispatcher reach the SSE client."""
+        tr = FakeSSETransport("rpc_error")
+        await registry.add_session("rpc_error", tr)
 
-        # Verify the RPC URL strips the /servers/ part
-        call_args = mock_client.post.call_args
-        url = call_args.args[0] if call_args.args else call_args.kwargs.get("url", "")
-        assert "/servers/" not in url
-        assert url.endswith("/rpc")
+        error = {"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": 7}
+        with patch("mcpgateway.main.dispatch_rpc_message", AsyncMock(return_value=error)):
+            await registry.generate_response(message={"method": "nope", "id": 7, "params": {}}, transport=tr, server_id=None, user={"auth_token": "tok", "auth_state": {}}, base_url="http://host")
+
+        assert tr.sent == [error]
 
 
 # ---------------------------------------------------------------------------
@@ -2406,104 +2384,6 @@ class TestReapStuckTasksDoneException:
         assert "Reaped 1 completed stuck tasks" in caplog.text
 
 
-# ---------------------------------------------------------------------------
-# generate_response: servers path where root_path == "/" (lines 1965-1966)
-# ---------------------------------------------------------------------------
-class TestGenerateResponseServersPath:
-    """Cover the /servers/ path extraction edge case."""
-
-    @pytest.mark.asyncio
-    async def test_generate_response_servers_at_root(self, registry, stub_db, stub_services):
-        """Lines 1965-1966: root_path == '/' becomes empty string."""
-        tr = FakeSSETransport("root_srv")
-        await registry.add_session("root_srv", tr)
-
-        mock_response = Mock()
-        mock_response.json.return_value = {"result": {}, "id": 55}
-
-        mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
-
-            async def __aenter__(self):
-                return mock_client
-
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
-
-        msg = {"method": "ping", "id": 55, "params": {}}
-
-        with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
-            await registry.generate_response(
-                message=msg,
-                transport=tr,
-                server_id=None,
-                user={"auth_token": "tok"},
-                base_url="http://host/servers/abc123",
-            )
-
-        call_args = mock_client.post.call_args
-        url = call_args.args[0] if call_args.args else call_args.kwargs.get("url", "")
-        assert url == "http://host/rpc"
-
-    @pytest.mark.asyncio
-    async def test_generate_response_servers_index_value_error(self, registry, stub_db, stub_services):
-        """Lines 1966-1967: ValueError in path_parts.index('servers') falls back to empty root_path."""
-        tr = FakeSSETransport("valerr_srv")
-        await registry.add_session("valerr_srv", tr)
-
-        mock_response = Mock()
-        mock_response.json.return_value = {"result": {}, "id": 56}
-
-        mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-
-        class MockAsyncClient:
-            def __init__(self, *args, **kwargs):
-                pass
-
-            async def __aenter__(self):
-                return mock_client
-
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
-
-        class _Parts(list):
-            def index(self, *_args, **_kwargs):  # noqa: A003 - match list.index signature
-                raise ValueError("servers not found")
-
-        class _Path(str):
-            def split(self, sep=None, maxsplit=-1):  # noqa: D401
-                return _Parts(super().split(sep, maxsplit))
-
-        class _Parsed:
-            scheme = "http"
-            netloc = "host"
-            path = _Path("/servers/abc123")
-
-        def fake_urlparse(_url: str):  # noqa: D401
-            return _Parsed()
-
-        msg = {"method": "ping", "id": 56, "params": {}}
-
-        with patch("mcpgateway.cache.session_registry.urlparse", fake_urlparse):
-            with patch("mcpgateway.cache.session_registry.ResilientHttpClient", MockAsyncClient):
-                await registry.generate_response(
-                    message=msg,
-                    transport=tr,
-                    server_id=None,
-                    user={"auth_token": "tok"},
-                    base_url="http://ignored/servers/abc123",
-                )
-
-        call_args = mock_client.post.call_args
-        url = call_args.args[0] if call_args.args else call_args.kwargs.get("url", "")
-        assert url == "http://host/rpc"
-
-
 # ---------------------------------------------------------------------------
 # OAuth config: scopes fallback (line 1727->1731 branch)
 # ---------------------------------------------------------------------------
@@ -261,7 +261,7 @@ class TestRedisBackendRespond:
                 # Mock generate_response to track calls
                 with patch.object(registry, "generate_response", new_callable=AsyncMock):
                     # Start respond task and let it process one message
-                    respond_task = asyncio.create_task(registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost"))
+                    respond_task = asyncio.create_task(registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="test_session", base_url="http://localhost"))
 
                     # Give it time to process messages
                     await asyncio.sleep(0.01)
@@ -308,7 +308,7 @@ class TestRedisBackendRespond:
                 await registry.add_session("test_session", mock_sse_transport)
 
                 # Start respond task and cancel it
-                respond_task = asyncio.create_task(registry.respond(server_id=None, user={"token": "test"}, session_id="test_session", base_url="http://localhost"))
+                respond_task = asyncio.create_task(registry.respond(server_id=None, user={"token": "test", "auth_state": {}}, session_id="test_session", base_url="http://localhost"))
 
                 await asyncio.sleep(0.01)  # Let it start
                 respond_task.cancel()
@@ -384,7 +384,7 @@ class TestDatabaseBackendRespond:
 
                         await registry.respond(
                             server_id=None,
-                            user={"token": "test"},
+                            user={"token": "test", "auth_state": {}},
                             session_id="test_session",
                             base_url="http://localhost",
                         )
@@ -447,7 +447,7 @@ class TestDatabaseBackendRespond:
                     ):
                         await registry.respond(
                             server_id=None,
-                            user={"token": "test"},
+                            user={"token": "test", "auth_state": {}},
                             session_id="test_session",
                             base_url="http://localhost",
                         )
@@ -513,7 +513,7 @@ class TestDatabaseBackendRespond:
                     ):
                         await registry.respond(
                             server_id=None,
-                            user={"token": "test"},
+                            user={"token": "test", "auth_state": {}},
                             session_id="test_session",
                             base_url="http://localhost",
                         )
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Tests for ToolResultCache."""
+
+# Standard
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.tool_result_cache import ToolResultCache
+
+
+@pytest.fixture
+def cache():
+    return ToolResultCache(enabled=True, ttl=60, max_entries=10, max_bytes=1024, max_entry_bytes=512, l2_enabled=False)
+
+
+RESULT = {"content": [{"type": "text", "text": "ok"}], "isError": False}
+
+
+@pytest.mark.asyncio
+async def test_set_get_l1_returns_copies(cache):
+    await cache.set("k", "tool-a", RESULT)
+
+    first = await cache.get("k")
+    first["content"].clear()
+    assert await cache.get("k") == RESULT
+    assert cache.stats()["l1_hit_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_never_stores():
+    cache = ToolResultCache(enabled=False, l2_enabled=False)
+    await cache.set("k", "tool-a", RESULT)
+
+    assert await cache.lookup("k") == (None, None)
+    assert cache.stats()["l1_size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_dropped(cache):
+    await cache.set("k", "tool-a", RESULT, ttl=0)
+
+    assert await cache.get("k") is None
+    assert cache.stats()["l1_bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_by_entry_count(cache):
+    cache._max_entries = 2
+    for key in ("a", "b"):
+        await cache.set(key, "tool-a", RESULT)
+    await cache.get("a")  # "b" is now least recently used
+    await cache.set("c", "tool-a", RESULT)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == RESULT
+    assert cache.stats()["eviction_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_by_total_bytes(cache):
+    cache._max_bytes = 600
+    big = {"content": [{"type": "text", "text": "x" * 300}]}
+    await cache.set("a", "tool-a", big)
+    await cache.set("b", "tool-a", big)
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == big
+    assert cache.stats()["l1_bytes"] <= 600
+
+
+def test_key_scopes_callers():
+    key = ToolResultCache.make_key
+    base = key("tool-a", {"q": 1}, "alice@example.com", ["t1"], "srv-1")
+
+    assert base == key("tool-a", {"q": 1}, "alice@example.com", ["t1"], "srv-1")
+    assert base != key("tool-b", {"q": 1}, "alice@example.com", ["t1"], "srv-1")
+    assert base != key("tool-a", {"q": 2}, "alice@example.com", ["t1"], "srv-1")
+    assert base != key("tool-a", {"q": 1}, "bob@example.com", ["t1"], "srv-1")
+    assert base != key("tool-a", {"q": 1}, "alice@example.com", ["t2"], "srv-1")
+    assert base != key("tool-a", {"q": 1}, "alice@example.com", ["t1"], "srv-2")
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_misses(cache):
+    calls = 0
+
+    async def invoke():
+        nonlocal calls
+        value, ticket = await cache.lookup("k")
+        if value is not None:
+            return value
+        calls += 1
+        await asyncio.sleep(0.01)
+        await cache.complete("k", "tool-a", RESULT, ticket)
+        return RESULT
+
+    results = await asyncio.gather(*(invoke() for _ in range(5)))
+
+    assert calls == 1
+    assert results == [RESULT] * 5
+    assert cache.stats()["coalesced_count"] == 4
+    assert cache.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_leader_releases_waiters(cache):
+    _, ticket = await cache.lookup("k")
+    waiter = asyncio.ensure_future(cache.lookup("k"))
+    await asyncio.sleep(0)
+
+    await cache.complete("k", "tool-a", None, ticket)
+
+    assert await waiter == (None, None)
+    assert await cache.get("k") is None
+    assert cache.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_leader(cache):
+    _, ticket = await cache.lookup("k")
+    waiter = asyncio.ensure_future(cache.lookup("k"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    assert not ticket.cancelled()
+    await cache.complete("k", "tool-a", RESULT, ticket)
+    assert ticket.result() is not None
+
+
+@pytest.mark.asyncio
+async def test_waiter_times_out_on_stuck_leader(cache):
+    _, ticket = await cache.lookup("k")
+
+    assert await cache.lookup("k", wait_timeout=0.01) == (None, None)
+    assert not ticket.done()
+    await cache.complete("k", "tool-a", RESULT, ticket)
+    assert cache.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_oversize_result_is_not_cached(cache):
+    await cache.set("k", "tool-a", {"content": [{"type": "text", "text": "x" * 1000}]})
+
+    assert await cache.get("k") is None
+    assert cache.stats()["oversize_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tool_only_drops_that_tool(cache):
+    await cache.set("a", "tool-a", RESULT)
+    await cache.set("b", "tool-b", RESULT)
+
+    await cache.invalidate_tool("tool-a")
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == RESULT
+
+
+@pytest.mark.asyncio
+async def test_l2_roundtrip_and_invalidation(cache):
+    store = {}
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+    redis.ttl = AsyncMock(return_value=30)
+    redis.setex = AsyncMock(side_effect=lambda key, ttl, value: store.__setitem__(key, value.decode()))  # decode_responses=True
+    redis.sadd = AsyncMock()
+    redis.expire = AsyncMock()
+    redis.smembers = AsyncMock(return_value={"k"})
+    redis.delete = AsyncMock()
+    redis.publish = AsyncMock()
+    cache._l2_enabled = True
+    cache._get_redis_client = AsyncMock(return_value=redis)
+
+    await cache.set("k", "tool-a", RESULT)
+    cache.invalidate_all_local()
+
+    assert await cache.get("k") == RESULT
+    assert cache.stats()["l2_hit_count"] == 1
+    assert cache._cache["k"].tool_id == "tool-a"
+
+    await cache.invalidate_tool("tool-a")
+    redis.delete.assert_any_await("mcpgw:tool_result:key:k")
+    redis.publish.assert_awaited_once_with("mcpgw:cache:invalidate", "tool_result:tool-a")
+
+
+@pytest.mark.asyncio
+async def test_l2_errors_fall_back_to_l1(cache):
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+    redis.setex = AsyncMock(side_effect=ConnectionError("down"))
+    cache._l2_enabled = True
+    cache._get_redis_client = AsyncMock(return_value=redis)
+
+    await cache.set("k", "tool-a", RESULT)
+    assert await cache.get("k") == RESULT
+    assert await cache.get("missing") is None
@@ -12,6 +12,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from starlette.requests import Request
 from starlette.responses import Response
 from mcpgateway.middleware.auth_middleware import AuthContextMiddleware
+from tests.utils.asgi import dispatch
+
+
+def make_request(path, cookies=None, headers=None):
+    """Build a real request for the raw ASGI middleware."""
+    raw_headers = [(name.encode(), value.encode()) for name, value in (headers or {}).items()]
+    if cookies:
+        raw_headers.append((b"cookie", "; ".join(f"{name}={value}" for name, value in cookies.items()).encode()))
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": raw_headers, "client": ("127.0.0.1", 12345)}
+    return Request(scope)
 
 
 @pytest.mark.asyncio
@@ -21,9 +31,8 @@ async def test_health_and_static_paths_skipped(monkeypatch):
     call_next = AsyncMock(return_value=Response("ok"))
 
     for path in ["/health", "/healthz", "/ready", "/metrics", "/static/logo.png"]:
-        request = MagicMock(spec=Request)
-        request.url.path = path
-        response = await middleware.dispatch(request, call_next)
+        request = make_request(path)
+        response = await dispatch(middleware, request, call_next)
         call_next.assert_awaited_once_with(request)
         assert response.status_code == 200
         call_next.reset_mock()
@@ -34,18 +43,12 @@ async def test_no_token_continues(monkeypatch):
     """If no token found, request continues without user context."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {}
-    request.headers = {}
+    request = make_request("/api/data")
 
-    response = await middleware.dispatch(request, call_next)
+    response = await dispatch(middleware, request, call_next)
     call_next.assert_awaited_once_with(request)
     assert response.status_code == 200
-    # request.state is a MagicMock, so user may exist as mock attribute
-    # Instead, ensure user was never set explicitly
-    # Ensure user attribute was not explicitly set (MagicMock defaults to having attributes)
-    assert "user" not in request.state.__dict__
+    assert not hasattr(request.state, "user")
 
 
 @pytest.mark.asyncio
@@ -53,10 +56,7 @@ async def test_token_from_cookie(monkeypatch):
     """Token extracted from cookie triggers authentication."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "cookie_token"}
-    request.headers = {}
+    request = make_request("/api/data", cookies={"jwt_token": "cookie_token"})
 
     mock_user = MagicMock()
     mock_user.email = "user@example.com"
@@ -65,7 +65,7 @@ async def test_token_from_cookie(monkeypatch):
     with patch("mcpgateway.middleware.auth_middleware._should_log_auth_success", return_value=True), \
          patch("mcpgateway.middleware.auth_middleware.SessionLocal", return_value=MagicMock()) as mock_session, \
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(return_value=mock_user)):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     call_next.assert_awaited_once_with(request)
     assert response.status_code == 200
@@ -78,10 +78,7 @@ async def test_token_from_header(monkeypatch):
     """Token extracted from Authorization header triggers authentication."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {}
-    request.headers = {"authorization": "Bearer header_token"}
+    request = make_request("/api/data", headers={"authorization": "Bearer header_token"})
 
     mock_user = MagicMock()
     mock_user.email = "header@example.com"
@@ -90,7 +87,7 @@ async def test_token_from_header(monkeypatch):
     with patch("mcpgateway.middleware.auth_middleware._should_log_auth_success", return_value=True), \
          patch("mcpgateway.middleware.auth_middleware.SessionLocal", return_value=MagicMock()) as mock_session, \
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(return_value=mock_user)):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     call_next.assert_awaited_once_with(request)
     assert response.status_code == 200
@@ -103,13 +100,7 @@ async def test_authentication_failure(monkeypatch):
     """Authentication failure should log and continue without user context."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "bad_token"}
-    request.headers = {}
-    # Mock request.client for security_logger
-    request.client = MagicMock()
-    request.client.host = "127.0.0.1"
+    request = make_request("/api/data", cookies={"jwt_token": "bad_token"})
 
     # Mock security_logger to prevent database operations
     mock_security_logger = MagicMock()
@@ -121,12 +112,11 @@ async def test_authentication_failure(monkeypatch):
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(side_effect=Exception("Invalid token"))), \
          patch("mcpgateway.middleware.auth_middleware.logger") as mock_logger, \
          patch("mcpgateway.middleware.auth_middleware.security_logger", mock_security_logger):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     call_next.assert_awaited_once_with(request)
     assert response.status_code == 200
-    # Ensure user attribute was not explicitly set (MagicMock defaults to having attributes)
-    assert "user" not in request.state.__dict__
+    assert not hasattr(request.state, "user")
     # Verify log message contains failure text
     logged_messages = [args[0] for args, _ in mock_logger.info.call_args_list]
     assert any("✗ Auth context extraction failed" in msg for msg in logged_messages)
@@ -143,10 +133,7 @@ async def test_db_close_exception(monkeypatch):
     """
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "token"}
-    request.headers = {}
+    request = make_request("/api/data", cookies={"jwt_token": "token"})
 
     mock_user = MagicMock()
     mock_user.email = "user@example.com"
@@ -159,7 +146,7 @@ async def test_db_close_exception(monkeypatch):
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(return_value=mock_user)):
         # The close() exception should be caught in finally block
         # and not propagate to break the request
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     call_next.assert_awaited_once_with(request)
     assert response.status_code == 200
@@ -176,10 +163,7 @@ async def test_no_db_session_when_logging_disabled(monkeypatch):
     """
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "cookie_token"}
-    request.headers = {}
+    request = make_request("/api/data", cookies={"jwt_token": "cookie_token"})
 
     mock_user = MagicMock()
     mock_user.email = "user@example.com"
@@ -189,7 +173,7 @@ async def test_no_db_session_when_logging_disabled(monkeypatch):
          patch("mcpgateway.middleware.auth_middleware._should_log_auth_failure", return_value=False), \
          patch("mcpgateway.middleware.auth_middleware.SessionLocal") as mock_session, \
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(return_value=mock_user)):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     call_next.assert_awaited_once_with(request)
     assert response.status_code == 200
@@ -208,10 +192,7 @@ async def test_success_logging_exception(monkeypatch):
     """log_authentication_attempt raises during success logging (lines 139-140)."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "token"}
-    request.headers = {}
+    request = make_request("/api/data", cookies={"jwt_token": "token"})
 
     mock_user = MagicMock()
     mock_user.email = "user@example.com"
@@ -222,7 +203,7 @@ async def test_success_logging_exception(monkeypatch):
          patch("mcpgateway.middleware.auth_middleware.SessionLocal", return_value=MagicMock()), \
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(return_value=mock_user)), \
          patch("mcpgateway.middleware.auth_middleware.security_logger", mock_security_logger):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     assert response.status_code == 200
     assert request.state.user.email == "user@example.com"
@@ -233,16 +214,13 @@ async def test_auth_failure_logging_disabled(monkeypatch):
     """Auth fails but failure logging is disabled (branch 153->176)."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "bad_token"}
-    request.headers = {}
+    request = make_request("/api/data", cookies={"jwt_token": "bad_token"})
 
     with patch("mcpgateway.middleware.auth_middleware._should_log_auth_failure", return_value=False), \
          patch("mcpgateway.middleware.auth_middleware._should_log_auth_success", return_value=False), \
          patch("mcpgateway.middleware.auth_middleware.SessionLocal") as mock_session, \
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(side_effect=Exception("bad"))):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     assert response.status_code == 200
     mock_session.assert_not_called()
@@ -253,12 +231,7 @@ async def test_failure_logging_exception(monkeypatch):
     """log_authentication_attempt raises during failure logging (lines 167-168)."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "bad_token"}
-    request.headers = {}
-    request.client = MagicMock()
-    request.client.host = "127.0.0.1"
+    request = make_request("/api/data", cookies={"jwt_token": "bad_token"})
 
     mock_security_logger = MagicMock()
     mock_security_logger.log_authentication_attempt.side_effect = RuntimeError("log fail")
@@ -268,7 +241,7 @@ async def test_failure_logging_exception(monkeypatch):
          patch("mcpgateway.middleware.auth_middleware.SessionLocal", return_value=MagicMock()), \
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(side_effect=Exception("bad"))), \
          patch("mcpgateway.middleware.auth_middleware.security_logger", mock_security_logger):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     assert response.status_code == 200
 
@@ -278,12 +251,7 @@ async def test_failure_logging_close_exception(monkeypatch):
     """db.close() raises during failure logging (lines 172-173)."""
     middleware = AuthContextMiddleware(app=AsyncMock())
     call_next = AsyncMock(return_value=Response("ok"))
-    request = MagicMock(spec=Request)
-    request.url.path = "/api/data"
-    request.cookies = {"jwt_token": "bad_token"}
-    request.headers = {}
-    request.client = MagicMock()
-    request.client.host = "127.0.0.1"
+    request = make_request("/api/data", cookies={"jwt_token": "bad_token"})
 
     mock_db = MagicMock()
     mock_db.close.side_effect = RuntimeError("close fail")
@@ -294,7 +262,7 @@ async def test_failure_logging_close_exception(monkeypatch):
          patch("mcpgateway.middleware.auth_middleware.SessionLocal", return_value=mock_db), \
          patch("mcpgateway.middleware.auth_middleware.get_current_user", AsyncMock(side_effect=Exception("bad"))), \
          patch("mcpgateway.middleware.auth_middleware.security_logger", mock_security_logger):
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
     assert response.status_code == 200
     mock_db.close.assert_called_once()
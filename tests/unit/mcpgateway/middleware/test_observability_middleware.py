@@ -13,20 +13,26 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from starlette.requests import Request
 from starlette.responses import Response
 from mcpgateway.middleware.observability_middleware import ObservabilityMiddleware
+from tests.utils.asgi import dispatch
+
+
+def make_request(path="/rpc"):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": path,
+        "query_string": b"param=value",
+        "headers": [(b"user-agent", b"pytest"), (b"traceparent", b"00-abc123-def456-01")],
+        "client": ("127.0.0.1", 12345),
+    }
+    return Request(scope)
 
 
 @pytest.fixture
 def mock_request():
-    request = MagicMock(spec=Request)
-    request.method = "GET"
-    request.url.path = "/rpc"
-    request.url.query = "param=value"
-    request.url.__str__.return_value = "http://testserver/rpc?param=value"
-    request.client = MagicMock()
-    request.client.host = "127.0.0.1"
-    request.headers = {"user-agent": "pytest", "traceparent": "00-abc123-def456-01"}
-    request.state = MagicMock()
-    return request
+    return make_request()
 
 
 @pytest.fixture
@@ -39,25 +45,22 @@ def mock_call_next():
 @pytest.mark.asyncio
 async def test_dispatch_disabled(mock_request, mock_call_next):
     middleware = ObservabilityMiddleware(app=None, enabled=False)
-    response = await middleware.dispatch(mock_request, mock_call_next)
+    response = await dispatch(middleware, mock_request, mock_call_next)
     assert response.status_code == 200
-    # Since mock_request.state is a MagicMock, trace_id may exist implicitly
-    # Ensure middleware did not modify it explicitly
-    # Ensure middleware did not set trace_id explicitly
-    assert "trace_id" not in mock_request.state.__dict__
+    assert not hasattr(mock_request.state, "trace_id")
 
 
 @pytest.mark.asyncio
 async def test_dispatch_health_check_skipped(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
-    mock_request.url.path = "/health"
-    response = await middleware.dispatch(mock_request, mock_call_next)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
+    mock_request = make_request("/health")
+    response = await dispatch(middleware, mock_request, mock_call_next)
     assert response.status_code == 200
 
 
 @pytest.mark.asyncio
 async def test_dispatch_trace_setup_success(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=MagicMock()) as mock_session, \
          patch.object(middleware.service, "start_trace", return_value="trace123") as mock_start_trace, \
          patch.object(middleware.service, "start_span", return_value="span123") as mock_start_span, \
@@ -65,7 +68,7 @@ async def test_dispatch_trace_setup_success(mock_request, mock_call_next):
          patch.object(middleware.service, "end_trace") as mock_end_trace, \
          patch("mcpgateway.middleware.observability_middleware.attach_trace_to_session") as mock_attach, \
          patch("mcpgateway.middleware.observability_middleware.parse_traceparent", return_value=("traceX", "spanY", "flags")):
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await dispatch(middleware, mock_request, mock_call_next)
         assert response.status_code == 200
         mock_start_trace.assert_called_once()
         mock_start_span.assert_called_once()
@@ -76,9 +79,9 @@ async def test_dispatch_trace_setup_success(mock_request, mock_call_next):
 
 @pytest.mark.asyncio
 async def test_dispatch_trace_setup_failure(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", side_effect=Exception("DB fail")):
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await dispatch(middleware, mock_request, mock_call_next)
         assert response.status_code == 200
 
 
@@ -87,7 +90,7 @@ async def test_dispatch_exception_during_request(mock_request):
     async def failing_call_next(request):
         raise RuntimeError("Request failed")
 
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
          patch.object(middleware.service, "start_trace", return_value="trace123"), \
@@ -96,7 +99,7 @@ async def test_dispatch_exception_during_request(mock_request):
          patch.object(middleware.service, "add_event") as mock_add_event, \
          patch.object(middleware.service, "end_trace") as mock_end_trace:
         with pytest.raises(RuntimeError):
-            await middleware.dispatch(mock_request, failing_call_next)
+            await dispatch(middleware, mock_request, failing_call_next)
         mock_end_span.assert_called()
         mock_add_event.assert_called()
         mock_end_trace.assert_called()
@@ -104,7 +107,7 @@ async def test_dispatch_exception_during_request(mock_request):
 
 @pytest.mark.asyncio
 async def test_dispatch_close_db_failure(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
     db_mock.close.side_effect = Exception("close fail")
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
@@ -112,18 +115,18 @@ async def test_dispatch_close_db_failure(mock_request, mock_call_next):
          patch.object(middleware.service, "start_span", return_value="span123"), \
          patch.object(middleware.service, "end_span"), \
          patch.object(middleware.service, "end_trace"):
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await dispatch(middleware, mock_request, mock_call_next)
         assert response.status_code == 200
 
 
 @pytest.mark.asyncio
 async def test_dispatch_trace_setup_failure_rolls_back_and_closes_db(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
 
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
          patch.object(middleware.service, "start_trace", side_effect=Exception("trace fail")):
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await dispatch(middleware, mock_request, mock_call_next)
         assert response.status_code == 200
 
     db_mock.rollback.assert_called()
@@ -132,21 +135,21 @@ async def test_dispatch_trace_setup_failure_rolls_back_and_closes_db(mock_reques
 
 @pytest.mark.asyncio
 async def test_dispatch_trace_setup_cleanup_close_failure_logs_debug(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
     db_mock.close.side_effect = Exception("close fail")
 
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
          patch.object(middleware.service, "start_trace", side_effect=Exception("trace fail")), \
          patch("mcpgateway.middleware.observability_middleware.logger.debug") as mock_debug:
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await dispatch(middleware, mock_request, mock_call_next)
         assert response.status_code == 200
         mock_debug.assert_called()
 
 
 @pytest.mark.asyncio
 async def test_dispatch_end_span_failure_logs_warning(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
 
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
@@ -155,14 +158,14 @@ async def test_dispatch_end_span_failure_logs_warning(mock_request, mock_call_ne
          patch.object(middleware.service, "end_span", side_effect=Exception("end span fail")), \
          patch.object(middleware.service, "end_trace"), \
          patch("mcpgateway.middleware.observability_middleware.logger.warning") as mock_warning:
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await dispatch(middleware, mock_request, mock_call_next)
         assert response.status_code == 200
         mock_warning.assert_called()
 
 
 @pytest.mark.asyncio
 async def test_dispatch_end_trace_failure_logs_warning(mock_request, mock_call_next):
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
 
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
@@ -171,7 +174,7 @@ async def test_dispatch_end_trace_failure_logs_warning(mock_request, mock_call_n
          patch.object(middleware.service, "end_span"), \
          patch.object(middleware.service, "end_trace", side_effect=Exception("end trace fail")), \
          patch("mcpgateway.middleware.observability_middleware.logger.warning") as mock_warning:
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await dispatch(middleware, mock_request, mock_call_next)
         assert response.status_code == 200
         mock_warning.assert_called()
 
@@ -181,7 +184,7 @@ async def test_dispatch_exception_logging_failure_logs_warning(mock_request):
     async def failing_call_next(request):
         raise RuntimeError("Request failed")
 
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
 
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
@@ -192,7 +195,7 @@ async def test_dispatch_exception_logging_failure_logs_warning(mock_request):
          patch.object(middleware.service, "end_trace"), \
          patch("mcpgateway.middleware.observability_middleware.logger.warning") as mock_warning:
         with pytest.raises(RuntimeError):
-            await middleware.dispatch(mock_request, failing_call_next)
+            await dispatch(middleware, mock_request, failing_call_next)
         mock_warning.assert_called()
 
 
@@ -201,7 +204,7 @@ async def test_dispatch_end_trace_error_failure_logs_warning(mock_request):
     async def failing_call_next(request):
         raise RuntimeError("Request failed")
 
-    middleware = ObservabilityMiddleware(app=None, enabled=True)
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=False)
     db_mock = MagicMock()
 
     with patch("mcpgateway.middleware.observability_middleware.SessionLocal", return_value=db_mock), \
@@ -212,5 +215,86 @@ async def test_dispatch_end_trace_error_failure_logs_warning(mock_request):
          patch.object(middleware.service, "end_trace", side_effect=Exception("end trace fail")), \
          patch("mcpgateway.middleware.observability_middleware.logger.warning") as mock_warning:
         with pytest.raises(RuntimeError):
-            await middleware.dispatch(mock_request, failing_call_next)
+            await dispatch(middleware, mock_request, failing_call_next)
         mock_warning.assert_called()
+
+
+@pytest.fixture
+def span_buffer():
+    # First-Party
+    from mcpgateway.services.span_buffer_service import SpanBufferService
+
+    service = SpanBufferService(max_queue_size=100, enabled=True)
+    with patch("mcpgateway.services.observability_service.get_span_buffer_service", return_value=service), \
+         patch("mcpgateway.middleware.observability_middleware.get_span_buffer_service", return_value=service):
+        yield service
+
+
+@pytest.mark.asyncio
+async def test_dispatch_buffered_collects_spans_without_db(mock_request, span_buffer):
+    # First-Party
+    from mcpgateway.services.observability_service import current_trace_id, ObservabilityService
+
+    async def call_next(request):
+        # Spans from handlers/plugins join the buffered trace via the context
+        service = ObservabilityService()
+        span_id = service.start_span(None, current_trace_id.get(), "tool.invoke.echo")
+        service.end_span(None, span_id, status="ok")
+        return Response("OK", status_code=200)
+
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=True)
+    with patch("mcpgateway.middleware.observability_middleware.SessionLocal", side_effect=AssertionError("no DB on request path")):
+        response = await dispatch(middleware, mock_request, call_next)
+
+    assert response.status_code == 200
+    assert span_buffer.get_stats()["queue_depth"] == 1
+    buffered = span_buffer._queue[0]
+    assert buffered.trace["status"] == "ok"
+    assert buffered.trace["http_status_code"] == 200
+    assert [s["name"] for s in buffered.spans.values()] == ["http.request", "tool.invoke.echo"]
+    assert mock_request.state.trace_id == buffered.trace_id
+
+
+@pytest.mark.asyncio
+async def test_dispatch_buffered_records_exception(mock_request, span_buffer):
+    async def failing_call_next(request):
+        raise RuntimeError("boom")
+
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=True)
+    with pytest.raises(RuntimeError):
+        await dispatch(middleware, mock_request, failing_call_next)
+
+    buffered = span_buffer._queue[0]
+    assert buffered.trace["status"] == "error"
+    assert buffered.trace["http_status_code"] == 500
+    assert buffered.events[0]["exception_type"] == "RuntimeError"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_buffered_setup_failure_continues(mock_request, mock_call_next, span_buffer):
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=True)
+    with patch.object(middleware.service, "begin_buffered_trace", side_effect=Exception("boom")):
+        response = await dispatch(middleware, mock_request, mock_call_next)
+    assert response.status_code == 200
+    assert span_buffer.get_stats()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_head_sampling_skips_unsampled_parent(mock_request, mock_call_next, span_buffer):
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=True)
+    with patch("mcpgateway.middleware.observability_middleware.parse_traceparent", return_value=("traceX", "spanY", "00")), \
+         patch.object(middleware.service, "begin_buffered_trace") as mock_begin:
+        response = await dispatch(middleware, mock_request, mock_call_next)
+    assert response.status_code == 200
+    mock_begin.assert_not_called()
+    assert span_buffer.get_stats()["sampled_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_head_sampling_rate_zero(mock_request, mock_call_next, span_buffer):
+    middleware = ObservabilityMiddleware(app=None, enabled=True, buffered=True)
+    with patch("mcpgateway.services.observability_service.settings.observability_sample_rate", 0.0), \
+         patch.object(middleware.service, "begin_buffered_trace") as mock_begin:
+        response = await dispatch(middleware, mock_request, mock_call_next)
+    assert response.status_code == 200
+    mock_begin.assert_not_called()
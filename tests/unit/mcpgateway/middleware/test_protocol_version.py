@@ -12,6 +12,7 @@ from starlette.responses import Response
 
 # First-Party
 from mcpgateway.middleware.protocol_version import DEFAULT_PROTOCOL_VERSION, MCPProtocolVersionMiddleware
+from tests.utils.asgi import dispatch
 
 
 def _make_request(path: str, headers: Iterable[Tuple[bytes, bytes]] | None = None) -> Request:
@@ -36,7 +37,7 @@ async def test_non_mcp_endpoint_skips_validation():
     async def call_next(req):
         return Response("ok")
 
-    response = await middleware.dispatch(request, call_next)
+    response = await dispatch(middleware, request, call_next)
 
     assert response.status_code == 200
 
@@ -49,7 +50,7 @@ async def test_default_protocol_version_applied():
     async def call_next(req):
         return Response("ok")
 
-    response = await middleware.dispatch(request, call_next)
+    response = await dispatch(middleware, request, call_next)
 
     assert response.status_code == 200
     assert request.state.mcp_protocol_version == DEFAULT_PROTOCOL_VERSION
@@ -63,7 +64,7 @@ async def test_unsupported_protocol_version_rejected():
     async def call_next(req):
         return Response("ok")
 
-    response = await middleware.dispatch(request, call_next)
+    response = await dispatch(middleware, request, call_next)
 
     assert response.status_code == 400
     payload = orjson.loads(response.body)
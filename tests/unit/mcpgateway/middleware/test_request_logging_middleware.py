@@ -18,6 +18,7 @@ from mcpgateway.middleware.request_logging_middleware import (
     RequestLoggingMiddleware,
     SENSITIVE_KEYS,
 )
+from tests.utils.asgi import dispatch
 import logging
 
 class DummyLogger:
@@ -129,7 +130,7 @@ async def test_dispatch_logs_json_body(dummy_logger, mock_structured_logger, dum
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=False, log_detailed_requests=True)
     body = orjson.dumps({"password": "123", "data": "ok"})
     request = make_request(body=body, headers={"Authorization": "Bearer abc"})
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
     assert "******" in dummy_logger.logged[0][1]
@@ -139,7 +140,7 @@ async def test_dispatch_logs_non_json_body(dummy_logger, mock_structured_logger,
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=False, log_detailed_requests=True)
     body = b"token=abc"
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("<contains sensitive data - masked>" in msg for _, msg in dummy_logger.logged)
 
@@ -148,7 +149,7 @@ async def test_dispatch_large_body_truncated(dummy_logger, mock_structured_logge
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=False, log_detailed_requests=True, max_body_size=10)
     body = b"{" + b"a" * 100 + b"}"
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("[truncated]" in msg for _, msg in dummy_logger.logged)
 
@@ -157,7 +158,7 @@ async def test_dispatch_logging_disabled(dummy_logger, mock_structured_logger, d
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=False, log_detailed_requests=False)
     body = b"{}"
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert dummy_logger.logged == []
 
@@ -167,18 +168,17 @@ async def test_dispatch_logger_disabled(dummy_logger, mock_structured_logger, du
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=False, log_detailed_requests=True)
     body = b"{}"
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert dummy_logger.logged == []
 
 @pytest.mark.asyncio
 async def test_dispatch_exception_handling(dummy_logger, mock_structured_logger, dummy_call_next, monkeypatch):
-    async def bad_body():
+    async def bad_receive():
         raise ValueError("fail")
-    request = make_request()
-    monkeypatch.setattr(request, "body", bad_body)
+    request = Request(make_request().scope, receive=bad_receive)
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=False, log_detailed_requests=True)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("Failed to log request body" in msg for msg in dummy_logger.warnings)
 
@@ -243,7 +243,7 @@ async def test_large_body_fast_path(dummy_logger, mock_structured_logger, dummy_
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=False, log_detailed_requests=True, max_body_size=100)
     body = b"x" * 500  # Large body
     request = make_request_with_headers(body=body, headers={"content-length": "500"})
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Should log "body too large" message
     assert any("body too large: 500 bytes" in msg for _, msg in dummy_logger.logged)
@@ -260,7 +260,7 @@ async def test_large_body_fast_path_exception_logs_failure(dummy_logger, mock_st
     request = make_request_with_headers(body=body, headers={"content-length": "500"})
 
     with pytest.raises(RuntimeError):
-        await middleware.dispatch(request, _call_next)
+        await dispatch(middleware, request, _call_next)
 
     assert mock_structured_logger.log.call_count == 1
     call_kwargs = mock_structured_logger.log.call_args.kwargs
@@ -281,7 +281,7 @@ async def test_no_logging_for_skipped_paths(mock_structured_logger, dummy_call_n
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # structured_logger.log should not have been called
     mock_structured_logger.log.assert_not_called()
@@ -315,7 +315,7 @@ async def test_skip_endpoints_skips_detailed_logging(dummy_logger, mock_structur
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Detailed logging should be skipped, so no "📩 Incoming request" logged
     assert not any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -340,7 +340,7 @@ async def test_skip_endpoints_prefix_match(dummy_logger, mock_structured_logger,
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Detailed logging should be skipped for paths starting with /api/v1/
     assert not any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -357,7 +357,7 @@ async def test_skip_endpoints_non_matching_path_logs(dummy_logger, mock_structur
     )
     body = b'{"data": "test"}'
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Path /test doesn't match /metrics, so detailed logging should occur
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -376,7 +376,7 @@ async def test_sampling_rate_zero_skips_all(dummy_logger, mock_structured_logger
     )
     body = b'{"data": "test"}'
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # With sample rate 0.0, no detailed logging should occur
     assert not any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -393,7 +393,7 @@ async def test_sampling_rate_one_logs_all(dummy_logger, mock_structured_logger,
     )
     body = b'{"data": "test"}'
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # With sample rate 1.0, detailed logging should occur
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -412,7 +412,7 @@ async def test_sampling_rate_half_keeps_logging_when_random_below_rate(
         log_detailed_sample_rate=0.5,
     )
     request = make_request(body=b'{"data": "test"}')
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
 
@@ -443,7 +443,7 @@ async def test_request_start_and_completion_logging_failures_warn(
         return {"type": "http.request", "body": b"", "more_body": False}
 
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("Failed to log request start" in msg for msg in dummy_logger.warnings)
     assert any("Failed to log request completion" in msg for msg in dummy_logger.warnings)
@@ -462,7 +462,7 @@ async def test_large_body_fast_path_exception_no_boundary_skips_structured_loggi
     request = make_request_with_headers(body=b"x" * 500, headers={"content-length": "500"})
 
     with pytest.raises(RuntimeError):
-        await middleware.dispatch(request, _call_next)
+        await dispatch(middleware, request, _call_next)
 
     mock_structured_logger.log.assert_not_called()
 
@@ -482,7 +482,7 @@ async def test_large_body_fast_path_exception_structured_logging_failure_warns(
     request = make_request_with_headers(body=b"x" * 500, headers={"content-length": "500"})
 
     with pytest.raises(RuntimeError):
-        await middleware.dispatch(request, _call_next)
+        await dispatch(middleware, request, _call_next)
 
     assert any("Failed to log request failure" in msg for msg in dummy_logger.warnings)
 
@@ -496,7 +496,7 @@ async def test_large_body_fast_path_completion_structured_logging_failure_warns(
 
     middleware = RequestLoggingMiddleware(app=None, enable_gateway_logging=True, log_detailed_requests=True, max_body_size=100)
     request = make_request_with_headers(body=b"x" * 500, headers={"content-length": "500"})
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("Failed to log request completion" in msg for msg in dummy_logger.warnings)
 
@@ -512,7 +512,7 @@ async def test_receive_recreates_request_body_for_downstream(dummy_logger, mock_
         assert await req.body() == original_body
         return Response(content="OK", status_code=200)
 
-    response = await middleware.dispatch(request, _call_next)
+    response = await dispatch(middleware, request, _call_next)
     assert response.status_code == 200
 
 
@@ -530,7 +530,7 @@ async def test_call_next_exception_structured_logging_failure_warns(
         raise RuntimeError("boom")
 
     with pytest.raises(RuntimeError):
-        await middleware.dispatch(request, _call_next)
+        await dispatch(middleware, request, _call_next)
 
     assert any("Failed to log request failure" in msg for msg in dummy_logger.warnings)
 
@@ -547,7 +547,7 @@ async def test_call_next_exception_no_boundary_does_not_attempt_structured_loggi
         raise RuntimeError("boom")
 
     with pytest.raises(RuntimeError):
-        await middleware.dispatch(request, _call_next)
+        await dispatch(middleware, request, _call_next)
 
     mock_structured_logger.log.assert_not_called()
 
@@ -581,7 +581,7 @@ async def test_log_resolve_user_identity_false_skips_db_lookup(mock_structured_l
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # get_current_user should NOT be called when log_resolve_user_identity=False
     assert len(get_current_user_called) == 0
@@ -615,7 +615,7 @@ async def test_log_resolve_user_identity_true_attempts_db_lookup(mock_structured
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # get_current_user SHOULD be called when log_resolve_user_identity=True
     assert len(get_current_user_called) == 1
@@ -637,7 +637,7 @@ async def test_resolve_user_identity_from_request_state(mock_structured_logger,
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
     request.state.user = MagicMock(id=42, email="user@test.com")
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Verify structured logger was called with user info
     assert mock_structured_logger.log.called
@@ -665,7 +665,7 @@ async def test_resolve_user_identity_cookie_token(mock_structured_logger, dummy_
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     call_kwargs = mock_structured_logger.log.call_args.kwargs
     assert call_kwargs.get("user_email") == "cookie@test.com"
@@ -685,7 +685,7 @@ async def test_resolve_user_identity_no_token(mock_structured_logger, dummy_call
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     call_kwargs = mock_structured_logger.log.call_args.kwargs
     assert call_kwargs.get("user_id") is None
@@ -711,7 +711,7 @@ async def test_resolve_user_identity_exception(mock_structured_logger, dummy_cal
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     call_kwargs = mock_structured_logger.log.call_args.kwargs
     assert call_kwargs.get("user_id") is None
@@ -733,7 +733,7 @@ async def test_sampling_exception_fallback(dummy_logger, mock_structured_logger,
     )
     body = b'{"data": "test"}'
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Should still log (fallback to log on sampling failure)
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -757,7 +757,7 @@ async def test_detailed_only_user_identity(dummy_logger, mock_structured_logger,
         return {"type": "http.request", "body": body, "more_body": False}
     request = Request(scope, receive=receive)
     request.state.user = MagicMock(id=99, email="detail@test.com")
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
 
 
@@ -777,7 +777,7 @@ async def test_log_request_start_enabled(mock_structured_logger, dummy_call_next
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Should have at least 2 calls: request_started + request_completed
     assert mock_structured_logger.log.call_count >= 2
@@ -800,7 +800,7 @@ async def test_boundary_only_no_detailed(mock_structured_logger, dummy_call_next
     async def receive():
         return {"type": "http.request", "body": b"", "more_body": False}
     request = Request(scope, receive=receive)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert mock_structured_logger.log.call_count == 1
     call_kwargs = mock_structured_logger.log.call_args.kwargs
@@ -826,7 +826,7 @@ async def test_logger_type_error_fallback(dummy_logger, mock_structured_logger,
     )
     body = b'{"data": "test"}'
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Should have fallen back and logged
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -846,7 +846,7 @@ async def test_large_body_exception_with_boundary(dummy_logger, mock_structured_
     body = b"x" * 500
     request = make_request_with_headers(body=body, headers={"content-length": "500"})
     with pytest.raises(RuntimeError):
-        await middleware.dispatch(request, _call_next)
+        await dispatch(middleware, request, _call_next)
 
     # Structured logger should log request_failed
     assert mock_structured_logger.log.called
@@ -864,7 +864,7 @@ async def test_body_read_with_receive(dummy_logger, mock_structured_logger, dumm
     )
     body = b'{"name": "test"}'
     request = make_request(body=body, headers={"content-length": str(len(body))})
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
     # Boundary logging should also have been called
@@ -885,7 +885,7 @@ async def test_exception_during_processing_boundary_log(dummy_logger, mock_struc
     body = b'{"data": "test"}'
     request = make_request(body=body)
     with pytest.raises(ValueError):
-        await middleware.dispatch(request, _call_next)
+        await dispatch(middleware, request, _call_next)
 
     # Boundary should log request_failed
     found_failed = False
@@ -906,7 +906,7 @@ async def test_response_completion_logging(dummy_logger, mock_structured_logger,
     )
     body = b'{"data": "test"}'
     request = make_request(body=body)
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Find the request_completed event
     found_completed = False
@@ -944,7 +944,7 @@ async def test_invalid_content_length(dummy_logger, mock_structured_logger, dumm
     )
     body = b'{"data": "test"}'
     request = make_request_with_headers(body=body, headers={"content-length": "not-a-number"})
-    response = await middleware.dispatch(request, dummy_call_next)
+    response = await dispatch(middleware, request, dummy_call_next)
     assert response.status_code == 200
     # Should still log the request (falls through to normal body read)
     assert any("📩 Incoming request" in msg for _, msg in dummy_logger.logged)
@@ -976,7 +976,7 @@ async def test_large_body_boundary_logging_on_exception(dummy_logger, mock_struc
     request = make_request(body=body, headers={"content-length": str(len(body))})
 
     with pytest.raises(RuntimeError, match="downstream failure"):
-        await middleware.dispatch(request, _failing_call_next)
+        await dispatch(middleware, request, _failing_call_next)
 
     # Structured logger should have logged a request_failed event
     mock_structured_logger.log.assert_called()
@@ -994,7 +994,7 @@ async def test_large_body_boundary_completion_logging(dummy_logger, mock_structu
         return Response(content="OK", status_code=200)
 
     request = make_request(body=body, headers={"content-length": str(len(body))})
-    response = await middleware.dispatch(request, _call_next)
+    response = await dispatch(middleware, request, _call_next)
     assert response.status_code == 200
     # Structured logger should have logged request_completed
     mock_structured_logger.log.assert_called()
@@ -1040,7 +1040,7 @@ async def test_large_body_logger_type_error_fallback(dummy_logger, mock_structur
             return Response(content="OK", status_code=200)
 
         request = make_request(body=body, headers={"content-length": str(len(body))})
-        response = await middleware.dispatch(request, _call_next)
+        response = await dispatch(middleware, request, _call_next)
         assert response.status_code == 200
         # Second call (without extra) should succeed
         assert len(rlm.logger.logged) >= 1
@@ -1059,7 +1059,7 @@ async def test_empty_body_logs_empty_placeholder(dummy_logger, mock_structured_l
         return Response(content="OK", status_code=200)
 
     request = make_request(body=b"")
-    response = await middleware.dispatch(request, _call_next)
+    response = await dispatch(middleware, request, _call_next)
     assert response.status_code == 200
     assert any("<empty>" in msg for _, msg in dummy_logger.logged)
 
@@ -1077,7 +1077,7 @@ async def test_dispatch_exception_with_boundary_logging(dummy_logger, mock_struc
     request = make_request(body=b'{"key": "value"}')
 
     with pytest.raises(ValueError, match="handler error"):
-        await middleware.dispatch(request, _failing_call_next)
+        await dispatch(middleware, request, _failing_call_next)
 
     # Structured logger should have been called with error event
     mock_structured_logger.log.assert_called()
@@ -1096,7 +1096,7 @@ async def test_boundary_completion_structured_log_failure(dummy_logger, mock_str
         return Response(content="OK", status_code=200)
 
     request = make_request(body=b'{"test": true}')
-    response = await middleware.dispatch(request, _call_next)
+    response = await dispatch(middleware, request, _call_next)
     assert response.status_code == 200
     # Warning should have been logged about structured log failure
     assert any("Failed to log" in w for w in dummy_logger.warnings)
@@ -1128,7 +1128,7 @@ async def test_sampling_exception_defaults_to_logging(dummy_logger, mock_structu
         return Response(content="OK", status_code=200)
 
     request = make_request(body=b'{"data": "test"}')
-    response = await middleware.dispatch(request, _call_next)
+    response = await dispatch(middleware, request, _call_next)
     assert response.status_code == 200
     # Should still have logged despite sampling exception
     assert len(dummy_logger.logged) > 0
@@ -8,6 +8,7 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from mcpgateway.middleware.security_headers import SecurityHeadersMiddleware
+from tests.utils.asgi import dispatch
 
 
 def _make_request(headers=None, scheme="https"):
@@ -50,7 +51,7 @@ async def test_headers_disabled():
     settings.security_headers_enabled = False
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert "X-Content-Type-Options" not in response.headers
     finally:
         mock.stop()
@@ -64,7 +65,7 @@ async def test_x_content_type_options():
     settings.x_frame_options = "DENY"
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert response.headers.get("X-Content-Type-Options") == "nosniff"
     finally:
         mock.stop()
@@ -77,7 +78,7 @@ async def test_x_frame_options_deny():
     settings.x_frame_options = "DENY"
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert response.headers.get("X-Frame-Options") == "DENY"
         assert "frame-ancestors 'none'" in response.headers.get("Content-Security-Policy", "")
     finally:
@@ -91,7 +92,7 @@ async def test_x_frame_options_sameorigin():
     settings.x_frame_options = "SAMEORIGIN"
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert response.headers.get("X-Frame-Options") == "SAMEORIGIN"
         assert "frame-ancestors 'self'" in response.headers.get("Content-Security-Policy", "")
     finally:
@@ -105,7 +106,7 @@ async def test_x_frame_options_allow_from():
     settings.x_frame_options = "ALLOW-FROM https://example.com"
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert "frame-ancestors https://example.com" in response.headers.get("Content-Security-Policy", "")
     finally:
         mock.stop()
@@ -118,7 +119,7 @@ async def test_x_frame_options_allow_all():
     settings.x_frame_options = "ALLOW-ALL"
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert "frame-ancestors * file: http: https:" in response.headers.get("Content-Security-Policy", "")
     finally:
         mock.stop()
@@ -131,7 +132,7 @@ async def test_x_frame_options_none():
     settings.x_frame_options = None
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert "X-Frame-Options" not in response.headers
         assert "frame-ancestors" not in response.headers.get("Content-Security-Policy", "")
     finally:
@@ -145,7 +146,7 @@ async def test_x_frame_options_raw_empty_string():
     settings.x_frame_options = ""
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert "X-Frame-Options" not in response.headers
         assert "frame-ancestors" not in response.headers.get("Content-Security-Policy", "")
     finally:
@@ -159,7 +160,7 @@ async def test_x_frame_options_raw_whitespace_string():
     settings.x_frame_options = "   "
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert "X-Frame-Options" not in response.headers
         assert "frame-ancestors" not in response.headers.get("Content-Security-Policy", "")
     finally:
@@ -173,7 +174,7 @@ async def test_x_xss_protection():
     settings.x_xss_protection_enabled = True
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert response.headers.get("X-XSS-Protection") == "0"
     finally:
         mock.stop()
@@ -186,7 +187,7 @@ async def test_x_download_options():
     settings.x_download_options_enabled = True
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert response.headers.get("X-Download-Options") == "noopen"
     finally:
         mock.stop()
@@ -198,7 +199,7 @@ async def test_referrer_policy():
     mock, settings = _mock_settings()
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         assert response.headers.get("Referrer-Policy") == "strict-origin-when-cross-origin"
     finally:
         mock.stop()
@@ -214,7 +215,7 @@ async def test_hsts_enabled():
     try:
         middleware = SecurityHeadersMiddleware(app=None)
         request = _make_request(headers=[(b"x-forwarded-proto", b"https")])
-        response = await middleware.dispatch(request, _call_next)
+        response = await dispatch(middleware, request, _call_next)
         hsts = response.headers.get("Strict-Transport-Security")
         assert hsts is not None
         assert "max-age=31536000" in hsts
@@ -232,7 +233,7 @@ async def test_cors_production_allowed():
     try:
         middleware = SecurityHeadersMiddleware(app=None)
         request = _make_request(headers=[(b"origin", b"https://example.com")])
-        response = await middleware.dispatch(request, _call_next)
+        response = await dispatch(middleware, request, _call_next)
         assert response.headers.get("Access-Control-Allow-Origin") == "https://example.com"
         assert response.headers.get("Access-Control-Allow-Credentials") == "true"
     finally:
@@ -247,7 +248,7 @@ async def test_cors_production_not_allowed():
     try:
         middleware = SecurityHeadersMiddleware(app=None)
         request = _make_request(headers=[(b"origin", b"https://example.com")])
-        response = await middleware.dispatch(request, _call_next)
+        response = await dispatch(middleware, request, _call_next)
         assert "Access-Control-Allow-Origin" not in response.headers
     finally:
         mock.stop()
@@ -263,7 +264,7 @@ async def test_cors_development_all_allowed():
     try:
         middleware = SecurityHeadersMiddleware(app=None)
         request = _make_request(headers=[(b"origin", b"https://example.com")])
-        response = await middleware.dispatch(request, _call_next)
+        response = await dispatch(middleware, request, _call_next)
         assert response.headers.get("Access-Control-Allow-Origin") == "https://example.com"
     finally:
         mock.stop()
@@ -283,7 +284,7 @@ async def test_remove_server_headers():
     settings.remove_server_headers = True
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), call_next_with_headers)
+        response = await dispatch(middleware, _make_request(), call_next_with_headers)
         assert "X-Powered-By" not in response.headers
         assert "Server" not in response.headers
     finally:
@@ -297,7 +298,7 @@ async def test_unknown_x_frame_options():
     settings.x_frame_options = "UNKNOWN"
     try:
         middleware = SecurityHeadersMiddleware(app=None)
-        response = await middleware.dispatch(_make_request(), _call_next)
+        response = await dispatch(middleware, _make_request(), _call_next)
         csp = response.headers.get("Content-Security-Policy", "")
         assert "frame-ancestors 'none'" in csp
     finally:
@@ -4,7 +4,7 @@
 # Standard
 from datetime import datetime, timezone
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Third-Party
 import pytest
@@ -387,3 +387,37 @@ def test_check_time_restrictions_outside_business_hours(monkeypatch):
 
     monkeypatch.setattr("mcpgateway.middleware.token_scoping.datetime", FakeDateTime)
     assert middleware._check_time_restrictions({"business_hours_only": True}) is False
+
+
+# --------------------------------------------------------------------------- #
+# check_rpc_message: per-message checks for in-process SSE/WebSocket dispatch  #
+# --------------------------------------------------------------------------- #
+@pytest.mark.asyncio
+async def test_check_rpc_message_uses_cached_revocation(monkeypatch):
+    middleware = TokenScopingMiddleware()
+    monkeypatch.setattr("mcpgateway.middleware.token_scoping.settings.auth_cache_enabled", True)
+    cached = SimpleNamespace(is_token_revoked=True)
+
+    with (
+        patch("mcpgateway.cache.auth_cache.auth_cache.get_auth_context", new=AsyncMock(return_value=cached)) as get_ctx,
+        patch("mcpgateway.middleware.token_scoping._check_token_revoked_sync") as db_check,
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await middleware.check_rpc_message({"sub": "u@t.com", "jti": "jti-1"})
+
+    assert exc_info.value.status_code == 401
+    get_ctx.assert_awaited_once_with("u@t.com", "jti-1")
+    db_check.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_check_rpc_message_checks_scopes_per_server(monkeypatch):
+    middleware = TokenScopingMiddleware()
+    payload = {"sub": "u@t.com", "scopes": {"server_id": "srv-1", "permissions": ["servers.use"], "ip_restrictions": ["10.0.0.0/8"]}}
+
+    await middleware.check_rpc_message(payload, ["srv-1", None], client_ip="10.1.2.3")
+
+    with pytest.raises(HTTPException, match="not allowed by token restrictions"):
+        await middleware.check_rpc_message(payload, ["srv-1"], client_ip="192.168.1.1")
+    with pytest.raises(HTTPException, match="Insufficient permissions"):
+        await middleware.check_rpc_message({"scopes": {"permissions": ["tools.read"]}}, ["srv-1"])
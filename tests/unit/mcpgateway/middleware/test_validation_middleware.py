@@ -13,12 +13,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 # Third-Party
 from fastapi import HTTPException
+import orjson
 import pytest
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 # First-Party
 from mcpgateway.middleware.validation_middleware import ValidationMiddleware, is_path_traversal
+from tests.utils.asgi import dispatch
 
 
 class TestIsPathTraversal:
@@ -55,6 +57,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = [r"<script", r"javascript:"]
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.max_path_depth = 10
             mock_settings.environment = "production"
 
@@ -93,7 +97,7 @@ class TestValidationMiddleware:
         async def call_next(request):
             return Response("ok")
 
-        response = await middleware_disabled.dispatch(mock_request, call_next)
+        response = await dispatch(middleware_disabled, mock_request, call_next)
         assert response.body == b"ok"
 
     @pytest.mark.asyncio
@@ -106,6 +110,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -122,7 +128,7 @@ class TestValidationMiddleware:
             async def call_next(req):
                 return Response("ok")
 
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
             assert response.body == b"ok"
 
     @pytest.mark.asyncio
@@ -135,6 +141,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = [r"<script"]
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "development"  # Development mode
 
             middleware = ValidationMiddleware(app=None)
@@ -152,7 +160,7 @@ class TestValidationMiddleware:
                 return Response("ok")
 
             # Should not raise in warn-only mode
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
             assert response.body == b"ok"
 
     @pytest.mark.asyncio
@@ -165,6 +173,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "development"
 
             middleware = ValidationMiddleware(app=None)
@@ -183,7 +193,7 @@ class TestValidationMiddleware:
             async def call_next(req):
                 return Response("ok")
 
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
             assert response.body == b"ok"
 
     @pytest.mark.asyncio
@@ -196,6 +206,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -215,7 +227,7 @@ class TestValidationMiddleware:
                 return Response("ok")
 
             with pytest.raises(HTTPException):
-                await middleware.dispatch(request, call_next)
+                await dispatch(middleware, request, call_next)
 
     @pytest.mark.asyncio
     async def test_validate_request_path_params_and_empty_json_body(self):
@@ -227,6 +239,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -251,6 +265,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -273,6 +289,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 10
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -292,6 +310,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = [r"<script"]
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -311,6 +331,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = [r"<script"]
             mock_settings.max_param_length = 10
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "development"
 
             middleware = ValidationMiddleware(app=None)
@@ -327,6 +349,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -343,6 +367,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -577,6 +603,8 @@ class TestValidationMiddleware:
             mock_settings.allowed_roots = []
             mock_settings.dangerous_patterns = []
             mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
             mock_settings.environment = "production"
 
             middleware = ValidationMiddleware(app=None)
@@ -593,6 +621,139 @@ class TestValidationMiddleware:
             async def call_next(req):
                 return Response(content="Hello\x00World")
 
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
             assert b"\x00" not in response.body
+            assert response.headers["content-length"] == str(len(response.body))
+
+    @pytest.mark.asyncio
+    async def test_sanitize_output_skips_binary_and_streamed_responses(self):
+        """Only complete text responses are sanitized; binary and streamed bodies pass through."""
+        with patch("mcpgateway.middleware.validation_middleware.settings") as mock_settings:
+            mock_settings.experimental_validate_io = True
+            mock_settings.validation_strict = True
+            mock_settings.sanitize_output = True
+            mock_settings.allowed_roots = []
+            mock_settings.dangerous_patterns = []
+            mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
+            mock_settings.environment = "production"
+
+            middleware = ValidationMiddleware(app=None)
+            scope = {"type": "http", "asgi": {"spec_version": "2.4"}, "method": "GET", "path": "/test", "query_string": b"", "headers": []}
+
+            async def binary(req):
+                return Response(content=b"\x89PNG\x00\x01", media_type="image/png")
+
+            response = await dispatch(middleware, Request(scope), binary)
+            assert response.body == b"\x89PNG\x00\x01"
+
+            async def streamed(req):
+                async def chunks():
+                    yield b"event\x00"
+                    yield b"data"
+
+                return StreamingResponse(chunks(), media_type="text/event-stream")
+
+            response = await dispatch(middleware, Request(scope), streamed)
+            assert response.body == b"event\x00data"
+
+    @pytest.mark.asyncio
+    async def test_json_body_is_replayed_downstream(self):
+        """The JSON body read for validation is still delivered to the downstream app."""
+        with patch("mcpgateway.middleware.validation_middleware.settings") as mock_settings:
+            mock_settings.experimental_validate_io = True
+            mock_settings.validation_strict = True
+            mock_settings.sanitize_output = False
+            mock_settings.allowed_roots = []
+            mock_settings.dangerous_patterns = []
+            mock_settings.max_param_length = 1000
+            mock_settings.validation_max_json_depth = 30
+            mock_settings.validation_max_body_bytes = 1024 * 1024
+            mock_settings.environment = "production"
+
+            middleware = ValidationMiddleware(app=None)
+            body = orjson.dumps({"name": "tool"})
+
+            async def receive():
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            scope = {"type": "http", "method": "POST", "path": "/tools", "query_string": b"", "headers": [(b"content-type", b"application/json")]}
+
+            async def call_next(req):
+                return Response(await req.body())
+
+            response = await dispatch(middleware, Request(scope, receive), call_next)
+            assert response.body == body
+
+
+class TestBatchedJsonValidation:
+    """Tests for batched JSON body validation with depth and size budgets."""
+
+    @pytest.fixture
+    def settings_mock(self):
+        with patch("mcpgateway.middleware.validation_middleware.settings") as mock_settings:
+            mock_settings.experimental_validate_io = True
+            mock_settings.validation_strict = True
+            mock_settings.sanitize_output = False
+            mock_settings.allowed_roots = []
+            mock_settings.dangerous_patterns = [r"[;&|`$(){}\[\]<>]", r"\.\.[\\/]"]
+            mock_settings.max_param_length = 20
+            mock_settings.validation_max_json_depth = 8
+            mock_settings.validation_max_body_bytes = 1024
+            mock_settings.environment = "production"
+            yield mock_settings
+
+    def test_first_violation_in_document_order(self, settings_mock):
+        middleware = ValidationMiddleware(app=None)
+        data = {"ok": "fine", "args": [{"path": "../etc"}], "cmd": "$(id)"}
+        with pytest.raises(HTTPException) as exc_info:
+            middleware._validate_json_data(data)
+        assert exc_info.value.detail == "Parameter path contains dangerous characters"
+
+    def test_length_violation_before_pattern_violation(self, settings_mock):
+        middleware = ValidationMiddleware(app=None)
+        with pytest.raises(HTTPException) as exc_info:
+            middleware._validate_json_data({"long": "a" * 50, "cmd": "$(id)"})
+        assert exc_info.value.detail == "Parameter long exceeds maximum length"
+
+        with pytest.raises(HTTPException) as exc_info:
+            middleware._validate_json_data({"cmd": "$(id)", "long": "a" * 50})
+        assert exc_info.value.detail == "Parameter cmd contains dangerous characters"
+
+    def test_depth_budget(self, settings_mock):
+        middleware = ValidationMiddleware(app=None)
+        data = current = {}
+        for _ in range(10):
+            current["x"] = {}
+            current = current["x"]
+        with pytest.raises(HTTPException) as exc_info:
+            middleware._validate_json_data(data)
+        assert exc_info.value.status_code == 422
+        assert "nesting depth" in exc_info.value.detail
+
+    def test_development_logs_every_violation(self, settings_mock):
+        settings_mock.environment = "development"
+        middleware = ValidationMiddleware(app=None)
+        with patch("mcpgateway.middleware.validation_middleware.logger") as mock_logger:
+            middleware._validate_json_data({"a": "$(id)", "b": "ok", "c": "a" * 50, "d": "../x"})
+        messages = [call.args[0] for call in mock_logger.warning.call_args_list]
+        assert messages == [
+            "Parameter a contains dangerous characters",
+            "Parameter c exceeds maximum length",
+            "Parameter d contains dangerous characters",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_body_size_budget(self, settings_mock):
+        middleware = ValidationMiddleware(app=None)
+        body = orjson.dumps({"data": ["x" * 10] * 200})
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        scope = {"type": "http", "method": "POST", "path": "/rpc", "query_string": b"", "headers": [(b"content-type", b"application/json")]}
+        with pytest.raises(HTTPException) as exc_info:
+            await middleware._validate_request(Request(scope, receive))
+        assert exc_info.value.status_code == 413
@@ -190,6 +190,30 @@ class TestExecuteWithTimeout:
         mock_service.end_span.assert_called_once()
         mock_db.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_with_buffered_trace_skips_session(self):
+        executor = PluginExecutor(timeout=30)
+        hook_ref = _make_hook_ref()
+        context = PluginContext(global_context=GlobalContext(request_id="1"))
+        payload = MagicMock(spec=PluginPayload)
+
+        mock_service = MagicMock()
+        mock_trace = MagicMock()
+        mock_trace.get.return_value = "trace-abc"
+        mock_buffered = MagicMock()
+        mock_buffered.get.return_value = MagicMock(trace_id="trace-abc")
+
+        with patch("mcpgateway.services.observability_service.current_trace_id", mock_trace), \
+             patch("mcpgateway.services.observability_service.current_buffered_trace", mock_buffered), \
+             patch("mcpgateway.db.SessionLocal") as mock_session_local, \
+             patch("mcpgateway.services.observability_service.ObservabilityService", return_value=mock_service):
+            result = await executor._execute_with_timeout(hook_ref, payload, context)
+
+        assert result.continue_processing is True
+        mock_session_local.assert_not_called()
+        assert mock_service.start_span.call_args.kwargs["db"] is None
+        mock_service.end_span.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_no_trace(self):
         executor = PluginExecutor(timeout=30)
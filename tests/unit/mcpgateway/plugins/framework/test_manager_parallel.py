@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/plugins/framework/test_manager_parallel.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for concurrent execution of plugins with equal priority
+(``plugin_settings.parallel_execution_within_band``).
+"""
+
+# Standard
+import asyncio
+import time
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.plugins.framework import (
+    GlobalContext,
+    Plugin,
+    PluginConfig,
+    PluginError,
+    PluginMode,
+    PluginResult,
+    PluginViolation,
+    PluginViolationError,
+    ToolHookType,
+    ToolPreInvokePayload,
+)
+from mcpgateway.plugins.framework.base import HookRef
+from mcpgateway.plugins.framework.manager import PluginExecutor
+from mcpgateway.plugins.framework.models import Config, PluginSettings
+from mcpgateway.plugins.framework.registry import PluginRef
+
+
+class ArgPlugin(Plugin):
+    """Sleeps, then optionally sets a tool argument, metadata and global state."""
+
+    def __init__(self, config: PluginConfig, delay: float = 0.0, arg: tuple | None = None, metadata: dict | None = None, block: bool = False):
+        super().__init__(config)
+        self.delay = delay
+        self.arg = arg
+        self.result_metadata = metadata or {}
+        self.block = block
+        self.seen_args: dict | None = None
+        self.cancelled = False
+
+    async def tool_pre_invoke(self, payload, context):
+        self.seen_args = dict(payload.args)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        context.global_context.state[self.name] = True
+        if self.block:
+            return PluginResult(continue_processing=False, violation=PluginViolation(reason="blocked", description="blocked by test", code="BLOCKED", details={}))
+        modified = None
+        if self.arg:
+            modified = ToolPreInvokePayload(name=payload.name, args={**payload.args, self.arg[0]: self.arg[1]})
+        return PluginResult(modified_payload=modified, metadata=self.result_metadata)
+
+
+def _plugin(name: str, priority: int = 10, mode: PluginMode = PluginMode.ENFORCE, **kwargs) -> ArgPlugin:
+    config = PluginConfig(name=name, kind="test", version="1.0", author="test", hooks=[ToolHookType.TOOL_PRE_INVOKE], priority=priority, mode=mode)
+    return ArgPlugin(config, **kwargs)
+
+
+def _executor(parallel: bool = True) -> PluginExecutor:
+    return PluginExecutor(config=Config(plugin_settings=PluginSettings(parallel_execution_within_band=parallel)))
+
+
+def _refs(*plugins: Plugin) -> list[HookRef]:
+    return [HookRef(ToolHookType.TOOL_PRE_INVOKE, PluginRef(plugin)) for plugin in plugins]
+
+
+def _payload() -> ToolPreInvokePayload:
+    return ToolPreInvokePayload(name="search", args={"query": "hello"})
+
+
+@pytest.mark.asyncio
+async def test_band_runs_concurrently():
+    """Plugins with equal priority overlap instead of adding up their latencies."""
+    plugins = [_plugin(f"p{i}", delay=0.1) for i in range(4)]
+
+    start = time.perf_counter()
+    result, contexts = await _executor().execute(_refs(*plugins), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE)
+    elapsed = time.perf_counter() - start
+
+    assert result.continue_processing
+    assert elapsed < 0.3
+    assert len(contexts) == 4
+
+
+@pytest.mark.asyncio
+async def test_band_disabled_runs_sequentially():
+    """Without the setting, plugins of equal priority still run one after another."""
+    first = _plugin("first", arg=("a", 1))
+    second = _plugin("second", arg=("b", 2))
+
+    result, _ = await _executor(parallel=False).execute(_refs(first, second), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert second.seen_args == {"query": "hello", "a": 1}
+    assert result.modified_payload.args == {"query": "hello", "a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_band_merges_modifications_state_and_metadata_in_priority_order():
+    """Results are merged in priority order, whichever plugin finishes first."""
+    slow = _plugin("slow", delay=0.05, arg=("a", 1), metadata={"shared": "slow", "slow": True})
+    fast = _plugin("fast", arg=("b", 2), metadata={"shared": "fast"})
+    global_context = GlobalContext(request_id="r1")
+
+    result, _ = await _executor().execute(_refs(slow, fast), _payload(), global_context, ToolHookType.TOOL_PRE_INVOKE)
+
+    # Both plugins saw the band's input payload
+    assert slow.seen_args == fast.seen_args == {"query": "hello"}
+    assert result.modified_payload.args == {"query": "hello", "a": 1, "b": 2}
+    assert result.metadata == {"shared": "fast", "slow": True}
+    assert global_context.state == {"slow": True, "fast": True}
+
+
+@pytest.mark.asyncio
+async def test_next_band_sees_merged_payload():
+    """Bands run in priority order, each on the payload produced by the previous band."""
+    band = [_plugin("a", arg=("a", 1)), _plugin("b", arg=("b", 2))]
+    later = _plugin("later", priority=20)
+
+    await _executor().execute(_refs(*band, later), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert later.seen_args == {"query": "hello", "a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_band_conflicting_modifications_are_rejected():
+    """Two plugins rewriting the same argument differently is an error."""
+    first = _plugin("first", arg=("query", "one"))
+    second = _plugin("second", arg=("query", "two"))
+
+    with pytest.raises(PluginError, match="first and second made conflicting modifications to 'args'"):
+        await _executor().execute(_refs(first, second), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE)
+
+
+@pytest.mark.asyncio
+async def test_band_identical_modifications_are_not_a_conflict():
+    """Two plugins making the same change agree."""
+    first = _plugin("first", arg=("query", "same"))
+    second = _plugin("second", arg=("query", "same"))
+
+    result, _ = await _executor().execute(_refs(first, second), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert result.modified_payload.args == {"query": "same"}
+
+
+@pytest.mark.asyncio
+async def test_band_enforce_violation_cancels_the_rest():
+    """The first blocking plugin in enforce mode short-circuits the band."""
+    slow = _plugin("slow", delay=5)
+    blocker = _plugin("blocker", block=True)
+    later = _plugin("later", priority=20)
+
+    start = time.perf_counter()
+    result, _ = await _executor().execute(_refs(slow, blocker, later), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert time.perf_counter() - start < 1
+    assert not result.continue_processing
+    assert result.violation.code == "BLOCKED"
+    assert result.violation.plugin_name == "blocker"
+    assert slow.cancelled
+    assert later.seen_args is None
+
+
+@pytest.mark.asyncio
+async def test_band_enforce_violation_as_exception_cancels_the_rest():
+    """With violations_as_exceptions the violation is raised and the band cancelled."""
+    slow = _plugin("slow", delay=5)
+    blocker = _plugin("blocker", block=True)
+
+    with pytest.raises(PluginViolationError):
+        await _executor().execute(_refs(slow, blocker), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE, violations_as_exceptions=True)
+
+    assert slow.cancelled
+
+
+@pytest.mark.asyncio
+async def test_band_permissive_violation_does_not_block():
+    """A permissive plugin that would block lets the band and the chain continue."""
+    auditor = _plugin("auditor", mode=PluginMode.PERMISSIVE, block=True)
+    other = _plugin("other", arg=("a", 1))
+
+    result, _ = await _executor().execute(_refs(auditor, other), _payload(), GlobalContext(request_id="r1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert result.continue_processing
+    assert result.modified_payload.args == {"query": "hello", "a": 1}
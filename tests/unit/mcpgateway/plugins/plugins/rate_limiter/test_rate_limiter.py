@@ -7,6 +7,8 @@ Authors: Mihai Criveti
 Tests for RateLimiterPlugin.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from mcpgateway.plugins.framework import (
@@ -15,7 +17,8 @@ from mcpgateway.plugins.framework import (
     PluginContext,
     PromptHookType,
     PromptPrehookPayload,
-    ToolHookType
+    ToolHookType,
+    ToolPreInvokePayload,
 )
 from plugins.rate_limiter.rate_limiter import RateLimiterPlugin
 
@@ -42,3 +45,30 @@ async def test_rate_limit_blocks_on_third_call():
     assert r2.violation is None
     r3 = await plugin.prompt_pre_fetch(payload, ctx)
     assert r3.violation is not None
+
+
+@pytest.mark.asyncio
+async def test_gcra_algorithm_blocks_and_reports_headers():
+    from mcpgateway.utils.rate_limiter import RateLimiter
+
+    plugin = RateLimiterPlugin(
+        PluginConfig(
+            name="rl",
+            kind="plugins.rate_limiter.rate_limiter.RateLimiterPlugin",
+            hooks=[ToolHookType.TOOL_PRE_INVOKE],
+            config={"by_tool": {"search": "2/m"}, "algorithm": "gcra"},
+        )
+    )
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1", user="u-gcra"))
+    payload = ToolPreInvokePayload(name="search", args={})
+    with patch("plugins.rate_limiter.rate_limiter.get_rate_limiter", return_value=RateLimiter(use_redis=False)):
+        assert (await plugin.tool_pre_invoke(payload, ctx)).violation is None
+        assert (await plugin.tool_pre_invoke(payload, ctx)).violation is None
+        blocked = await plugin.tool_pre_invoke(payload, ctx)
+
+    assert blocked.violation is not None
+    assert blocked.violation.code == "RATE_LIMIT"
+    meta_tool = blocked.violation.details["by_tool"]
+    assert meta_tool["remaining"] == 0
+    assert meta_tool["retry_after"] == 30
+    assert meta_tool["headers"]["Retry-After"] == "30"
@@ -688,7 +688,7 @@ class TestA2AAgentService:
         await service.reset_metrics(mock_db)
 
         # Verify
-        assert mock_db.execute.call_count == 2
+        assert mock_db.execute.call_count == 3
         mock_db.commit.assert_called_once()
 
     async def test_reset_metrics_specific_agent(self, service, mock_db):
@@ -701,7 +701,7 @@ class TestA2AAgentService:
         await service.reset_metrics(mock_db, agent_id)
 
         # Verify
-        assert mock_db.execute.call_count == 2
+        assert mock_db.execute.call_count == 3
         mock_db.commit.assert_called_once()
 
     def testconvert_agent_to_read_conversion(self, service, sample_db_agent):
@@ -616,23 +616,23 @@ class TestCachePoisoningPrevention:
     """
 
     @pytest.mark.asyncio
-    async def test_list_tools_skips_cache_when_token_teams_set(self, tool_service, mock_db):
-        """Cache should be skipped when token_teams is set (even empty list)."""
-        # Mock the registry cache module to track cache.get calls
+    async def test_list_tools_uses_scoped_cache_when_token_teams_set(self, tool_service, mock_db):
+        """Scoped tokens (even public-only) never read the unrestricted admin entry."""
         with patch("mcpgateway.services.tool_service._get_registry_cache") as mock_get_cache:
             mock_cache = MagicMock()
             mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.list_scoped = AsyncMock(return_value=([], None))
             mock_get_cache.return_value = mock_cache
 
-            mock_scalars = Mock()
-            mock_scalars.all.return_value = []
-            mock_db.execute = Mock(return_value=MagicMock(scalars=Mock(return_value=mock_scalars)))
-
-            # With token_teams=[] (public-only), cache should NOT be used
+            # With token_teams=[] (public-only), only the team-scoped entry may be used
             await tool_service.list_tools(mock_db, user_email=None, token_teams=[])
 
-            # Cache get should NOT have been called because token_teams was set
             mock_cache.get.assert_not_called()
+            mock_cache.list_scoped.assert_awaited_once()
+            args, kwargs = mock_cache.list_scoped.await_args
+            assert args[0] == "tools"
+            assert args[3] == []
+            assert kwargs["owner_email"] is None
 
     @pytest.mark.asyncio
     async def test_list_tools_uses_cache_when_admin(self, tool_service, mock_db):
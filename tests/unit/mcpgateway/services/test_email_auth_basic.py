@@ -2362,6 +2362,28 @@ class TestEmailAuthServiceUserDeletion:
         mock_db.delete.assert_called_once_with(mock_user)
         mock_db.commit.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_delete_user_invalidates_permission_cache_after_commit(self, service, mock_db, mock_user):
+        """Cached permission decisions are dropped only once the role deletion is committed."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_result.scalars.return_value.all.return_value = []
+        mock_db.execute.return_value = mock_result
+
+        events = []
+        mock_db.commit.side_effect = lambda: events.append("commit")
+        mock_role_svc = MagicMock()
+        mock_role_svc.delete_all_user_roles = AsyncMock(return_value=1)
+
+        with (
+            patch.object(type(service), "role_service", new_callable=lambda: property(lambda self: mock_role_svc)),
+            patch("mcpgateway.services.email_auth_service.permission_cache") as perm_cache,
+        ):
+            perm_cache.invalidate_user = AsyncMock(side_effect=lambda email: events.append(("invalidate", email)))
+            assert await service.delete_user("test@example.com") is True
+
+        assert events == ["commit", ("invalidate", "test@example.com")]
+
     @pytest.mark.asyncio
     async def test_delete_user_cache_invalidation_exception_is_non_fatal(self, service, mock_db, mock_user):
         """Test delete_user continues when auth cache invalidation fails."""
@@ -207,6 +207,39 @@ class TestAutoRefreshGatewayToolsResourcesPrompts:
         # Old tool should be marked for removal
         assert result["tools_removed"] == 1
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("include_resources", [True, False])
+    async def test_refresh_invalidates_resource_content_cache(self, gateway_service, monkeypatch, include_resources):
+        """Test that a refresh including resources drops the gateway's cached resource content."""
+        # First-Party
+        from mcpgateway.config import settings
+
+        monkeypatch.setattr(settings, "resource_cache_enabled", True)
+        mock_gateway = _make_mock_gateway()
+        mock_gateway.tools = []
+        mock_gateway.resources = []
+        mock_gateway.prompts = []
+
+        mock_session = MagicMock()
+        mock_session.dirty = set()
+        mock_session.execute.return_value.scalar_one_or_none.side_effect = [mock_gateway, mock_gateway]
+        content_cache = MagicMock(invalidate_shared=AsyncMock())
+
+        with (
+            patch("mcpgateway.services.gateway_service.fresh_db_session") as mock_fresh,
+            patch.object(gateway_service, "_initialize_gateway", new_callable=AsyncMock) as mock_init,
+            patch("mcpgateway.services.gateway_service._get_resource_cache", return_value=content_cache),
+        ):
+            mock_fresh.return_value.__enter__.return_value = mock_session
+            mock_init.return_value = ({}, [], [], [])
+
+            await gateway_service._refresh_gateway_tools_resources_prompts("gw-123", include_resources=include_resources)
+
+        if include_resources:
+            content_cache.invalidate_shared.assert_awaited_once_with("gw-123")
+        else:
+            content_cache.invalidate_shared.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_refresh_preserves_user_created_items(self, gateway_service):
         """Test that refresh only removes MCP-discovered items, not user-created ones."""
@@ -1851,18 +1851,18 @@ class TestGatewayService:
         gateway_service.convert_gateway_to_read = MagicMock(return_value=mocked_gateway_read)
 
         with patch("mcpgateway.services.gateway_service.select", side_effect=mock_select):
-            with patch("mcpgateway.services.gateway_service.json_contains_tag_expr") as mock_json_contains:
+            with patch("mcpgateway.services.gateway_service.entity_tag_expr") as mock_entity_tag_expr:
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tag_expr.return_value = fake_condition
 
                 # Pass include_inactive=True to avoid the enabled filter, so we can test tag filtering in isolation
                 result, next_cursor = await gateway_service.list_gateways(session, tags=["test", "production"], include_inactive=True)
 
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is session  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
-                assert called_args[2] == ["test", "production"]
+                mock_entity_tag_expr.assert_called_once()  # called exactly once
+                called_args = mock_entity_tag_expr.call_args[0]  # positional args tuple
+                assert called_args[0].key == "tags"  # tags column passed through
+                # second positional arg is the tags list (signature: col, values, match_any=True)
+                assert called_args[1] == ["test", "production"]
                 # Verify where() was called and the fake_condition is in one of the calls
                 assert mock_query.where.called, "where() should have been called"
                 # Check that fake_condition appears in at least one of the where() calls
@@ -330,6 +330,7 @@ class TestGatewayServiceExtended:
         # Use cache_type="none" to avoid file lock complexity
         with patch("mcpgateway.services.gateway_service.settings") as mock_settings:
             mock_settings.cache_type = "none"
+            mock_settings.health_check_scheduler_enabled = False
 
             # Run health checks for a short time (no db parameter - uses fresh_db_session internally)
             health_check_task = asyncio.create_task(service._run_health_checks("user@example.com"))
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""Tests for the adaptive gateway health-check scheduler.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.services import health_check_scheduler as hcs
+from mcpgateway.services.health_check_scheduler import get_health_check_scheduler, HealthCheckScheduler, PASSIVE_HEALTH_KEY
+
+
+def _gw(gateway_id: str, reachable: bool = True, auth_type=None):
+    return SimpleNamespace(id=gateway_id, name=gateway_id, reachable=reachable, auth_type=auth_type)
+
+
+def _ids(gateways) -> list:
+    return sorted(gw.id for gw in gateways)
+
+
+@pytest.fixture
+def sched():
+    return HealthCheckScheduler(interval=10, max_backoff=4, jitter=0, slots=16)
+
+
+class TestScheduling:
+    def test_new_gateways_are_spread_over_the_interval(self):
+        sched = HealthCheckScheduler(interval=60, jitter=0)
+        sched.sync([_gw(f"g{i}") for i in range(6000)], now=0.0)
+        per_second = Counter()
+        for second in range(1, 61):
+            per_second[second] = len(sched.pop_due(now=float(second)))
+        assert sum(per_second.values()) == 6000
+        assert max(per_second.values()) < 200  # ~100/s rather than one burst of 6000
+
+    def test_backoff_on_success_and_reset_on_failure(self, sched):
+        sched.sync([_gw("g1")], now=0.0)
+        assert _ids(sched.pop_due(now=10.0)) == ["g1"]
+        for now, expected in ((10.0, 30.0), (30.0, 70.0), (70.0, 110.0)):  # 2x, 4x, capped at 4x
+            sched.complete("g1", healthy=True, now=now)
+            assert sched.pop_due(now=expected - 1) == []
+            assert _ids(sched.pop_due(now=expected)) == ["g1"]
+
+        sched.complete("g1", healthy=False, now=110.0)
+        assert _ids(sched.pop_due(now=120.0)) == ["g1"]
+        assert sched.get_stats()["failures"] == 1
+
+    def test_failure_recorded_during_probe_wins(self, sched):
+        sched.sync([_gw("g1")], now=0.0)
+        sched.pop_due(now=10.0)
+        sched.record_failure("g1")
+        sched.complete("g1", healthy=True, now=10.0)
+        assert _ids(sched.pop_due(now=20.0)) == ["g1"]  # base interval, not backed off
+
+    def test_unreachable_gateways_do_not_back_off(self, sched):
+        sched.sync([_gw("g1", reachable=False)], now=0.0)
+        sched.pop_due(now=10.0)
+        sched.complete("g1", healthy=True, now=10.0)
+        assert _ids(sched.pop_due(now=20.0)) == ["g1"]
+
+    def test_jitter_bounds(self):
+        sched = HealthCheckScheduler(interval=100, max_backoff=1, jitter=0.1)
+        sched.sync([_gw("g1")], now=0.0)
+        sched.pop_due(now=100.0)
+        sched.complete("g1", healthy=True, now=100.0)
+        assert 190.0 <= sched._entries["g1"].due <= 210.0
+
+    def test_sync_drops_removed_gateways(self, sched):
+        sched.sync([_gw("g1"), _gw("g2")], now=0.0)
+        sched.sync([_gw("g2")], now=1.0)
+        assert _ids(sched.pop_due(now=10.0)) == ["g2"]
+        sched.complete("g1", healthy=True)  # result for a removed gateway is ignored
+        assert sched.get_stats()["gateways"] == 1
+
+    def test_lag_is_measured(self, sched):
+        sched.sync([_gw("g1")], now=0.0)
+        due = sched._entries["g1"].due
+        sched.pop_due(now=due + 2.5)
+        stats = sched.get_stats()
+        assert stats["lag_last_seconds"] == pytest.approx(2.5, abs=0.01)
+        assert stats["lag_max_seconds"] >= 2.5
+        assert stats["probes"] == 1
+
+
+class TestPassiveHealth:
+    def test_recent_success_skips_probe(self, sched):
+        sched.sync([_gw("g1")], now=0.0)
+        sched.record_success("g1")
+        assert sched.pop_due(now=10.0) == []
+        stats = sched.get_stats()
+        assert (stats["probes"], stats["passive_skips"]) == (0, 1)
+        assert sched._entries["g1"].multiplier == 2  # counted as healthy
+
+    def test_unreachable_gateway_is_still_probed(self, sched):
+        sched.sync([_gw("g1", reachable=False)], now=0.0)
+        sched.record_success("g1")
+        assert _ids(sched.pop_due(now=10.0)) == ["g1"]
+
+    def test_old_success_does_not_skip(self, sched, monkeypatch):
+        sched.sync([_gw("g1")], now=0.0)
+        sched.record_success("g1")
+        sched._passive["g1"] -= 60
+        assert _ids(sched.pop_due(now=10.0)) == ["g1"]
+        sched.record_success(None)  # ignored
+
+    async def test_success_is_shared_through_redis(self, monkeypatch):
+        redis = MagicMock()
+        redis.hset = AsyncMock()
+        redis.expire = AsyncMock()
+        monkeypatch.setattr(hcs, "get_redis_client_sync", lambda: redis)
+        monkeypatch.setattr(hcs.settings, "cache_type", "redis")
+
+        worker = HealthCheckScheduler(interval=10, jitter=0)
+        worker.record_success("g1")
+        worker.record_success("g1")  # throttled
+        await asyncio.sleep(0)
+        redis.hset.assert_awaited_once()
+        assert redis.hset.await_args.args[:2] == (PASSIVE_HEALTH_KEY, "g1")
+
+        redis.hgetall = AsyncMock(return_value={b"g1": str(redis.hset.await_args.args[2]).encode(), b"gone": b"1"})
+        leader = HealthCheckScheduler(interval=10, jitter=0)
+        leader.sync([_gw("g1")], now=0.0)
+        await leader.merge_remote_passive()
+        assert leader.pop_due(now=10.0) == []
+        assert "gone" not in leader._passive
+
+
+class TestRun:
+    async def test_run_dispatches_due_probes(self):
+        sched = HealthCheckScheduler(interval=0.05, max_backoff=1, jitter=0, tick=0.01)
+        probed = []
+
+        async def probe(gw):
+            probed.append(gw.id)
+            return gw.id != "bad"
+
+        await sched.run([_gw("ok"), _gw("bad")], probe, duration=0.2, concurrency=2)
+        assert set(probed) == {"ok", "bad"}
+        assert probed.count("ok") >= 2  # rescheduled every interval
+        assert sched.get_stats()["failures"] >= 1
+
+    async def test_probe_exception_counts_as_failure(self):
+        sched = HealthCheckScheduler(interval=0.02, jitter=0, tick=0.01)
+        probe = AsyncMock(side_effect=RuntimeError("boom"))
+        await sched.run([_gw("g1")], probe, duration=0.05, concurrency=1)
+        assert sched.get_stats()["failures"] >= 1
+
+    def test_singleton(self):
+        assert get_health_check_scheduler() is get_health_check_scheduler()
+
+
+class TestGatewayServiceIntegration:
+    async def test_cycle_uses_scheduler_when_enabled(self, monkeypatch):
+        # First-Party
+        from mcpgateway.services.gateway_service import GatewayService
+
+        service = GatewayService()
+        service._health_check_interval = 7
+        service._get_gateways = lambda: [_gw("g1"), _gw("g2", auth_type="one_time_auth")]
+        service._check_single_gateway_health = AsyncMock()
+        scheduler = MagicMock()
+        scheduler.run = AsyncMock()
+        monkeypatch.setattr("mcpgateway.services.gateway_service.settings.health_check_scheduler_enabled", True)
+        monkeypatch.setattr("mcpgateway.services.gateway_service.get_health_check_scheduler", lambda: scheduler)
+
+        await service._run_health_check_cycle("admin@example.com")
+
+        gateways, probe = scheduler.run.await_args.args
+        assert _ids(gateways) == ["g1"]
+        assert scheduler.run.await_args.kwargs["duration"] == 7
+        assert await probe(gateways[0]) is True
+        service._check_single_gateway_health.assert_awaited_once_with(gateways[0], "admin@example.com")
+
+    async def test_probe_timeout_is_a_failure(self, monkeypatch):
+        # First-Party
+        from mcpgateway.services.gateway_service import GatewayService
+
+        service = GatewayService()
+        service._get_gateways = lambda: [_gw("g1")]
+        service._check_single_gateway_health = AsyncMock(side_effect=asyncio.TimeoutError)
+        service._handle_gateway_failure = AsyncMock()
+        scheduler = MagicMock()
+        scheduler.run = AsyncMock()
+        monkeypatch.setattr("mcpgateway.services.gateway_service.settings.health_check_scheduler_enabled", True)
+        monkeypatch.setattr("mcpgateway.services.gateway_service.get_health_check_scheduler", lambda: scheduler)
+
+        await service._run_health_check_cycle(None)
+        gateways, probe = scheduler.run.await_args.args
+        assert await probe(gateways[0]) is False
+        service._handle_gateway_failure.assert_awaited_once()
+
+    async def test_gateway_failure_is_reported_to_scheduler(self, monkeypatch):
+        # First-Party
+        from mcpgateway.services.gateway_service import GatewayService
+
+        scheduler = MagicMock()
+        monkeypatch.setattr("mcpgateway.services.gateway_service.get_health_check_scheduler", lambda: scheduler)
+        with patch("mcpgateway.services.gateway_service.GW_FAILURE_THRESHOLD", -1):
+            await GatewayService()._handle_gateway_failure(_gw("g1"))
+        scheduler.record_failure.assert_called_once_with("g1")
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""Tests for the batching writer used by structured logs, security events and audit trails.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import patch
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+# First-Party
+from mcpgateway.db import AuditTrail, Base, SecurityEvent, StructuredLogEntry
+from mcpgateway.services import audit_trail_service, security_logger
+from mcpgateway.services.log_write_buffer_service import LogWriteBufferService
+from mcpgateway.services.security_logger import SecurityLogger, SecuritySeverity
+from mcpgateway.services.structured_logger import LogRouter
+
+
+@pytest.fixture
+def log_db(tmp_path):
+    """File-backed SQLite DB with the log tables, patched into the writer."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'logs.db'}")
+    Base.metadata.create_all(engine, tables=[StructuredLogEntry.__table__, SecurityEvent.__table__, AuditTrail.__table__])
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    sessions = []
+
+    @contextmanager
+    def _session():
+        db = factory()
+        sessions.append(db)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with patch("mcpgateway.services.log_write_buffer_service.fresh_db_session", _session):
+        yield factory, sessions
+    engine.dispose()
+
+
+@pytest.fixture
+async def log_buffer():
+    """Running buffer with a long interval, wired in as the process singleton."""
+    service = LogWriteBufferService(max_queue_size=100, flush_interval=60, batch_size=10, enabled=True)
+    await service.start()
+    with (
+        patch("mcpgateway.services.structured_logger.get_log_write_buffer_service", return_value=service),
+        patch("mcpgateway.services.security_logger.get_log_write_buffer_service", return_value=service),
+        patch("mcpgateway.services.audit_trail_service.get_log_write_buffer_service", return_value=service),
+    ):
+        yield service
+    await service.shutdown()
+
+
+def _count(factory, model) -> int:
+    with factory() as db:
+        return db.execute(select(func.count()).select_from(model)).scalar()
+
+
+async def _flushed(service: LogWriteBufferService, rows: int) -> None:
+    for _ in range(200):
+        if service.get_stats()["total_flushed"] >= rows:
+            return
+        await asyncio.sleep(0.01)
+
+
+def _audit(action: str = "CREATE") -> AuditTrail:
+    return AuditTrail(action=action, resource_type="tool", resource_id="t1", user_id="u1", success=True)
+
+
+class TestQueueing:
+    """Queueing, overflow policy and fallbacks."""
+
+    def test_not_running_leaves_write_to_caller(self):
+        service = LogWriteBufferService(enabled=True)
+        assert service.enqueue(_audit()) is False
+        assert service.get_stats()["total_enqueued"] == 0
+
+    async def test_disabled_never_queues(self):
+        service = LogWriteBufferService(enabled=False)
+        await service.start()
+        assert service.enqueue(_audit()) is False
+        assert service.get_stats()["running"] is False
+
+    async def test_write_through_when_full(self, log_buffer):
+        log_buffer.max_queue_size = 1
+        assert log_buffer.enqueue(_audit()) is True
+        assert log_buffer.enqueue(_audit()) is False
+
+        stats = log_buffer.get_stats()
+        assert (stats["queue_depth"], stats["written_through"], stats["dropped_queue_full"]) == (1, 1, 0)
+
+    async def test_drop_when_full(self, log_buffer):
+        log_buffer.max_queue_size = 1
+        log_buffer.overflow_policy = "drop"
+        assert log_buffer.enqueue(_audit()) is True
+        assert log_buffer.enqueue(_audit()) is True
+
+        stats = log_buffer.get_stats()
+        assert (stats["queue_depth"], stats["written_through"], stats["dropped_queue_full"]) == (1, 0, 1)
+
+
+class TestFlushing:
+    """Batch writes to the database."""
+
+    async def test_flush_writes_batches(self, log_db, log_buffer):
+        factory, sessions = log_db
+        for _ in range(25):
+            log_buffer.enqueue(_audit())
+
+        await log_buffer.flush()
+        await _flushed(log_buffer, 25)  # the loop may still be writing the first full batch
+
+        assert _count(factory, AuditTrail) == 25
+        assert len(sessions) == 3  # batch_size=10
+        stats = log_buffer.get_stats()
+        assert (stats["total_flushed"], stats["flush_count"], stats["queue_depth"]) == (25, 3, 0)
+
+    async def test_full_batch_wakes_flush_loop(self, log_db, log_buffer):
+        factory, _ = log_db
+        for _ in range(log_buffer.batch_size):
+            log_buffer.enqueue(_audit())
+
+        await _flushed(log_buffer, log_buffer.batch_size)
+        assert _count(factory, AuditTrail) == log_buffer.batch_size
+
+    async def test_bad_row_does_not_discard_batch(self, log_db, log_buffer):
+        factory, _ = log_db
+        log_buffer.enqueue(_audit())
+        log_buffer.enqueue(_audit(action=None))  # violates NOT NULL
+        log_buffer.enqueue(_audit())
+
+        assert await log_buffer.flush() == 2
+        assert _count(factory, AuditTrail) == 2
+        stats = log_buffer.get_stats()
+        assert (stats["flush_failures"], stats["dropped_flush_error"]) == (1, 1)
+
+    async def test_shutdown_flushes_remaining(self, log_db):
+        factory, _ = log_db
+        service = LogWriteBufferService(flush_interval=60, enabled=True)
+        await service.start()
+        service.enqueue(_audit())
+
+        await service.shutdown()
+
+        assert _count(factory, AuditTrail) == 1
+        assert service.enqueue(_audit()) is False  # stopped: callers write synchronously again
+
+
+class TestCallers:
+    """LogRouter, SecurityLogger and AuditTrailService route rows through the buffer."""
+
+    async def test_structured_log_is_buffered(self, log_db, log_buffer):
+        factory, _ = log_db
+        router = LogRouter()
+        with patch("mcpgateway.services.structured_logger.fresh_db_session") as direct:
+            router._persist_to_database({"level": "INFO", "message": "hello", "component": "test", "hostname": "h1", "process_id": 1})
+        direct.assert_not_called()
+
+        await log_buffer.flush()
+        assert _count(factory, StructuredLogEntry) == 1
+
+    async def test_security_event_and_audit_are_buffered(self, log_db, log_buffer):
+        factory, _ = log_db
+        sec = SecurityLogger()
+        with patch.object(security_logger, "SessionLocal") as session_local:
+            event = sec._create_security_event(
+                event_type="authentication_failure",
+                severity=SecuritySeverity.LOW,
+                category="authentication",
+                client_ip="10.0.0.1",
+                description="bad password",
+                threat_score=0.1,
+            )
+            audit = sec._create_audit_trail(action="delete", resource_type="tool", user_id="u1", success=True)
+        session_local.assert_not_called()
+        assert event.timestamp is not None and audit.timestamp is not None
+
+        await log_buffer.flush()
+        assert (_count(factory, SecurityEvent), _count(factory, AuditTrail)) == (1, 1)
+
+    async def test_audit_trail_service_is_buffered(self, log_db, log_buffer, monkeypatch):
+        factory, _ = log_db
+        monkeypatch.setattr(audit_trail_service.settings, "audit_trail_enabled", True)
+        with patch.object(audit_trail_service, "SessionLocal") as session_local:
+            entry = audit_trail_service.AuditTrailService().log_action(action="CREATE", resource_type="tool", resource_id="t1", user_id="u1")
+        session_local.assert_not_called()
+        assert entry is not None
+
+        await log_buffer.flush()
+        assert _count(factory, AuditTrail) == 1
+
+    async def test_caller_session_bypasses_buffer(self, log_buffer):
+        sec = SecurityLogger()
+        with patch.object(security_logger, "SessionLocal") as session_local:
+            db = session_local.return_value
+            sec._create_audit_trail(action="delete", resource_type="tool", user_id="u1", success=True, db=db)
+        db.add.assert_called_once()
+        assert log_buffer.get_stats()["total_enqueued"] == 0
@@ -1437,3 +1437,206 @@ class TestContextManager:
             assert pool._pools[pool_key].qsize() == 1
 
         await pool.close_all()
+
+
+class TestMultiplexedSessions:
+    """Tests for multiplexed mode (max_concurrent_per_session > 1)."""
+
+    URL = "http://upstream:9000/mcp"
+    KEY = ("anonymous", URL, "anonymous", "streamablehttp", "")
+
+    @pytest.fixture
+    async def pool(self):
+        pool = MCPSessionPool(max_sessions_per_key=2, max_concurrent_per_session=3, acquire_timeout_seconds=1.0)
+        created = []
+
+        async def create_session(url, headers, transport_type, *args, **kwargs):
+            pooled = PooledSession(session=MagicMock(), transport_context=MagicMock(), url=url, transport_type=transport_type, headers={}, identity_key="anonymous")
+            created.append(pooled)
+            return pooled
+
+        pool._create_session = AsyncMock(side_effect=create_session)
+        pool._close_session = AsyncMock(side_effect=lambda pooled: pooled.mark_closed())
+        pool.created = created
+        yield pool
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_callers_share_session_up_to_limit(self, pool):
+        held = [await pool.acquire(self.URL) for _ in range(3)]
+
+        assert len(pool.created) == 1
+        assert all(p is pool.created[0] for p in held)
+        assert pool.created[0].in_flight == 3
+
+        fourth = await pool.acquire(self.URL)
+        assert fourth is not pool.created[0]
+        assert len(pool.created) == 2
+        assert (pool._hits, pool._misses) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_session_is_picked(self, pool):
+        held = [await pool.acquire(self.URL) for _ in range(4)]  # 3 on the first session, 1 on the second
+        first, second = pool.created
+        await pool.release(held[0])
+        await pool.release(held[1])  # first: 1 in flight, second: 1 in flight
+        await pool.release(held[3])  # second: 0 in flight
+
+        assert await pool.acquire(self.URL) is second
+        assert (first.in_flight, second.in_flight) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cold_burst_opens_one_session_at_a_time(self, pool):
+        held = await asyncio.gather(*(pool.acquire(self.URL) for _ in range(3)))
+
+        assert len(pool.created) == 1
+        assert {id(p) for p in held} == {id(pool.created[0])}
+
+    @pytest.mark.asyncio
+    async def test_full_key_waits_for_release(self, pool):
+        held = [await pool.acquire(self.URL) for _ in range(6)]  # 2 sessions x 3 slots
+        waiter = asyncio.create_task(pool.acquire(self.URL))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await pool.release(held[-1])
+        pooled = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert pooled is held[-1]
+        assert len(pool.created) == 2
+        assert pool.get_metrics()["multiplexed_waits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_key_times_out(self, pool):
+        pool._acquire_timeout = 0.05
+        for _ in range(6):
+            await pool.acquire(self.URL)
+
+        with pytest.raises(asyncio.TimeoutError, match="Timeout waiting for available session"):
+            await pool.acquire(self.URL)
+
+    @pytest.mark.asyncio
+    async def test_close_all_wakes_waiters(self, pool):
+        for _ in range(6):
+            await pool.acquire(self.URL)
+        waiter = asyncio.create_task(pool.acquire(self.URL))
+        await asyncio.sleep(0.01)
+
+        await pool.close_all()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await asyncio.wait_for(waiter, timeout=1.0)
+        assert all(p.is_closed for p in pool.created)
+
+    @pytest.mark.asyncio
+    async def test_expired_session_closed_after_last_release(self, pool):
+        first = await pool.acquire(self.URL)
+        second = await pool.acquire(self.URL)
+        first.created_at -= pool._session_ttl + 1
+
+        await pool.release(first)
+        assert not first.is_closed  # still carrying a request
+
+        await pool.release(second)
+        assert first.is_closed
+        assert pool._shared[self.KEY] == []
+        assert pool._semaphores[self.KEY]._value == 2  # slot returned
+        assert pool._evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_session_failing_health_check_is_replaced(self, pool):
+        pooled = await pool.acquire(self.URL)
+        await pool.release(pooled)
+        pool._validate_session = AsyncMock(return_value=False)
+
+        replacement = await pool.acquire(self.URL)
+
+        assert pooled.is_closed
+        assert replacement is not pooled
+        assert pool._shared[self.KEY] == [replacement]
+
+    @pytest.mark.asyncio
+    async def test_session_under_health_check_is_not_handed_out(self, pool):
+        pooled = await pool.acquire(self.URL)
+        await pool.release(pooled)
+        checking, finish = asyncio.Event(), asyncio.Event()
+
+        async def slow_failing_check(_pooled):
+            checking.set()
+            await finish.wait()
+            return False
+
+        pool._validate_session = AsyncMock(side_effect=slow_failing_check)
+        first = asyncio.create_task(pool.acquire(self.URL))
+        await checking.wait()
+
+        # Another caller skips the session being checked instead of sharing it
+        second = await asyncio.wait_for(pool.acquire(self.URL), timeout=1.0)
+        assert second is not pooled
+
+        finish.set()
+        replacement = await asyncio.wait_for(first, timeout=1.0)
+
+        # The failed session is retired although the check overlapped with other acquires
+        assert pooled.is_closed and not pooled.validating
+        assert replacement is second
+        assert pool._shared[self.KEY] == [second]
+        assert second.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_create_failure_frees_slot_and_wakes_waiters(self, pool):
+        pool._create_session.side_effect = RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError, match="upstream down"):
+            await pool.acquire(self.URL)
+
+        assert pool._creating == set()
+        assert pool._semaphores[self.KEY]._value == 2
+        assert pool._failures[self.URL] == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_report_per_session_in_flight(self, pool):
+        held = [await pool.acquire(self.URL) for _ in range(4)]
+        await pool.release(held[0])
+
+        metrics = pool.get_metrics()
+        (entry,) = metrics["pools"].values()
+
+        assert metrics["max_concurrent_per_session"] == 3
+        assert [s["in_flight"] for s in entry["sessions"]] == [2, 1]
+        assert (entry["in_flight"], entry["active"], entry["available"]) == (3, 2, 0)
+
+    @pytest.mark.asyncio
+    async def test_idle_shared_sessions_are_reaped(self, pool):
+        pooled = await pool.acquire(self.URL)
+        await pool.release(pooled)
+        pooled.last_used -= pool._idle_pool_eviction + 1
+        pool._pool_last_used[self.KEY] -= pool._idle_pool_eviction + 1
+        pool._last_eviction_run = 0
+
+        await pool._maybe_evict_idle_pool_keys()
+
+        assert pooled.is_closed
+        assert self.KEY not in pool._pools and self.KEY not in pool._shared
+
+    @pytest.mark.asyncio
+    async def test_exclusive_mode_metrics_include_in_flight(self):
+        pool = MCPSessionPool()
+        with patch.object(pool, "_create_session", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = PooledSession(session=MagicMock(), transport_context=MagicMock(), url=self.URL, transport_type=TransportType.STREAMABLE_HTTP, headers={}, identity_key="anonymous")
+            pooled = await pool.acquire(self.URL)
+
+            (entry,) = pool.get_metrics()["pools"].values()
+            assert (entry["in_flight"], entry["active"]) == (1, 1)
+            assert "sessions" not in entry
+
+            await pool.release(pooled)
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_init_passes_max_concurrent_per_session(self):
+        pool = init_mcp_session_pool(max_concurrent_per_session=8, enable_notifications=False)
+        try:
+            assert pool._max_concurrent_per_session == 8
+        finally:
+            await close_mcp_session_pool()
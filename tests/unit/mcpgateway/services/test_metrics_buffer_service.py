@@ -523,7 +523,9 @@ def test_flush_to_db_writes_batches(monkeypatch):
         def __exit__(self, exc_type, exc, tb):
             return False
 
+    counter_deltas = []
     monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.fresh_db_session", lambda: DummySession())
+    monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.apply_metric_counter_deltas", lambda db, deltas: counter_deltas.extend(deltas))
 
     tool_metric = SimpleNamespace(tool_id="t1", timestamp=time.time(), response_time=0.1, is_success=True, error_message=None)
     resource_metric = SimpleNamespace(resource_id="r1", timestamp=time.time(), response_time=0.2, is_success=False, error_message="err")
@@ -531,6 +533,7 @@ def test_flush_to_db_writes_batches(monkeypatch):
     service._flush_to_db([tool_metric], [resource_metric], [], [], [])
     assert holder["db"].committed is True
     assert holder["db"].bulk_calls
+    assert [(d["entity_type"], d["entity_id"], d["total_count"], d["success_count"]) for d in counter_deltas] == [("tools", "t1", 1, 1), ("resources", "r1", 1, 0)]
 
 
 def test_flush_to_db_writes_all_metric_types(monkeypatch):
@@ -561,6 +564,7 @@ def test_flush_to_db_writes_all_metric_types(monkeypatch):
             return False
 
     monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.fresh_db_session", lambda: DummySession())
+    monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.apply_metric_counter_deltas", lambda db, deltas: None)
 
     tool_metric = SimpleNamespace(tool_id="t1", timestamp=time.time(), response_time=0.1, is_success=True, error_message=None)
     resource_metric = SimpleNamespace(resource_id="r1", timestamp=time.time(), response_time=0.2, is_success=False, error_message="err")
@@ -579,6 +583,62 @@ def test_flush_to_db_writes_all_metric_types(monkeypatch):
     assert A2AAgentMetric in models
 
 
+def test_flush_to_db_merges_entity_metric_counters(monkeypatch):
+    """Each flush merges one counter row per entity; list queries read it with one join."""
+    # Standard
+    from contextlib import contextmanager
+    from datetime import datetime, timedelta, timezone
+
+    # Third-Party
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import joinedload, Session
+    from sqlalchemy.pool import StaticPool
+
+    # First-Party
+    from mcpgateway.db import Base, EntityMetricCounter, Tool, ToolMetric
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    @contextmanager
+    def session():
+        with Session(engine) as db:
+            yield db
+
+    monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.fresh_db_session", session)
+    with session() as db:
+        db.add(Tool(id="t1", name="tool", original_name="tool", custom_name="tool", custom_name_slug="tool", input_schema={}))
+        db.commit()
+
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    service = MetricsBufferService(enabled=True)
+    service._flush_to_db(
+        [
+            SimpleNamespace(tool_id="t1", timestamp=t0, response_time=0.4, is_success=True, error_message=None),
+            SimpleNamespace(tool_id="t1", timestamp=t0 + timedelta(seconds=1), response_time=0.2, is_success=False, error_message="err"),
+        ],
+        [],
+        [],
+        [],
+        [],
+    )
+    service._flush_to_db([SimpleNamespace(tool_id="t1", timestamp=t0 + timedelta(seconds=2), response_time=0.9, is_success=True, error_message=None)], [], [], [], [])
+
+    with session() as db:
+        assert len(db.execute(select(ToolMetric)).scalars().all()) == 3
+        counter = db.get(EntityMetricCounter, ("tools", "t1"))
+        assert (counter.total_count, counter.success_count, counter.min_response_time, counter.max_response_time) == (3, 2, 0.2, 0.9)
+        assert counter.sum_response_time == pytest.approx(1.5)
+
+        tool = db.execute(select(Tool).options(joinedload(Tool.metric_counter))).scalar_one()
+        summary = tool.metrics_summary
+        assert summary["total_executions"] == 3
+        assert summary["failed_executions"] == 1
+        assert summary["avg_response_time"] == pytest.approx(0.5)
+        assert summary["last_execution_time"].replace(tzinfo=timezone.utc) == t0 + timedelta(seconds=2)
+        assert "metrics" not in tool.__dict__  # raw metrics never loaded
+
+
 def test_record_tool_metric_falls_back_to_immediate_write(monkeypatch):
     service = MetricsBufferService(enabled=False)
     service.recording_enabled = True
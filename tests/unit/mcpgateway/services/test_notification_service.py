@@ -195,6 +195,29 @@ class TestNotificationDispatch:
             "gw-1", NotificationType.PROMPTS_LIST_CHANGED
         )
 
+    @pytest.mark.asyncio
+    async def test_handle_notification_resource_updated(self, notification_service):
+        """Test resources/updated drops the cached content of that resource instead of refreshing."""
+        # Third-Party
+        import mcp.types as mcp_types
+
+        # First-Party
+        from mcpgateway.cache.resource_cache import content_tag, ResourceCache
+
+        notification_service._enqueue_refresh = AsyncMock()
+        cache = ResourceCache()
+        cache.set("updated", "old", tags=(content_tag("gw-1", "file:///a.txt"),))
+        cache.set("other", "keep", tags=(content_tag("gw-1", "file:///b.txt"),))
+        notification = mcp_types.ServerNotification(mcp_types.ResourceUpdatedNotification(params=mcp_types.ResourceUpdatedNotificationParams(uri="file:///a.txt")))
+
+        with patch("mcpgateway.cache.resource_cache.resource_cache", cache):
+            await notification_service._handle_notification("gw-1", notification)
+
+        notification_service._enqueue_refresh.assert_not_called()
+        assert cache.get("updated") is None
+        assert cache.get("other") == "keep"
+        assert notification_service.get_metrics()["resource_updates_received"] == 1
+
     @pytest.mark.asyncio
     async def test_handle_notification_unknown(self, notification_service):
         """Test handling unknown notification type."""
@@ -228,6 +228,67 @@ async def test_check_permission_exception_denies(svc):
     assert result is False
 
 
+# ---------- check_permission decision cache ----------
+
+
+@pytest.mark.asyncio
+async def test_check_permission_decision_cached_across_instances(mock_db):
+    """A second service instance reuses the decision without querying roles."""
+    first = PermissionService(mock_db, audit_enabled=False)
+    with patch.object(first, "_is_user_admin", return_value=False):
+        with patch.object(first, "get_user_permissions", return_value={"tools.read"}):
+            assert await first.check_permission("user@test.com", "tools.read", team_id="team-1") is True
+
+    second = PermissionService(mock_db, audit_enabled=False)
+    with patch.object(second, "_is_user_admin") as admin_check:
+        with patch.object(second, "get_user_permissions") as perms:
+            assert await second.check_permission("user@test.com", "tools.read", team_id="team-1") is True
+    admin_check.assert_not_called()
+    perms.assert_not_called()
+
+    # Different scope is a separate decision
+    with patch.object(second, "_is_user_admin", return_value=False):
+        with patch.object(second, "get_user_permissions", return_value=set()) as perms:
+            assert await second.check_permission("user@test.com", "tools.read", team_id="team-2") is False
+    perms.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_check_permission_cache_invalidated_on_role_change(svc):
+    """Invalidating the user drops cached decisions."""
+    # First-Party
+    from mcpgateway.cache.permission_cache import permission_cache
+
+    with patch.object(svc, "_is_user_admin", return_value=False):
+        with patch.object(svc, "get_user_permissions", return_value=set()):
+            assert await svc.check_permission("user@test.com", "tools.create") is False
+        await permission_cache.invalidate_user("user@test.com")
+        with patch.object(svc, "get_user_permissions", return_value={"tools.create"}):
+            assert await svc.check_permission("user@test.com", "tools.create") is True
+
+
+@pytest.mark.asyncio
+async def test_check_permission_error_not_cached(svc):
+    """A deny caused by an error is not cached."""
+    with patch.object(svc, "_is_user_admin", side_effect=RuntimeError("db error")):
+        assert await svc.check_permission("user@test.com", "tools.create") is False
+    with patch.object(svc, "_is_user_admin", return_value=True):
+        assert await svc.check_permission("user@test.com", "tools.create") is True
+
+
+@pytest.mark.asyncio
+async def test_check_permission_audit_bypasses_cache(mock_db):
+    """Audited checks always evaluate (and log) the permission."""
+    svc = PermissionService(mock_db, audit_enabled=True)
+    with patch.object(svc, "_is_user_admin", return_value=False):
+        with patch.object(svc, "get_user_permissions", return_value={"tools.read"}):
+            with patch.object(svc, "_get_roles_for_audit", return_value={"roles": []}):
+                with patch.object(svc, "_log_permission_check") as mock_log:
+                    await svc.check_permission("user@test.com", "tools.read")
+                    await svc.check_permission("user@test.com", "tools.read")
+    assert mock_log.call_count == 2
+
+
 # ---------- has_admin_permission ----------
 
 
@@ -963,7 +963,7 @@ class TestPromptService:
         test_db.execute = Mock()
         test_db.commit = Mock()
         await prompt_service.reset_metrics(test_db)
-        assert test_db.execute.call_count == 2
+        assert test_db.execute.call_count == 3
         test_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1027,19 +1027,19 @@ class TestPromptService:
         session.get_bind.return_value = bind
 
         with patch("mcpgateway.services.prompt_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.prompt_service.json_contains_tag_expr") as mock_json_contains:
+            with patch("mcpgateway.services.prompt_service.entity_tag_expr") as mock_entity_tag_expr:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tag_expr.return_value = fake_condition
 
                 result, _ = await prompt_service.list_prompts(session, tags=["test", "production"])
 
                 # helper should be called once with the tags list (not once per tag)
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is session  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
-                assert called_args[2] == ["test", "production"]
+                mock_entity_tag_expr.assert_called_once()  # called exactly once
+                called_args = mock_entity_tag_expr.call_args[0]  # positional args tuple
+                assert called_args[0].key == "tags"  # tags column passed through
+                # second positional arg is the tags list (signature: col, values, match_any=True)
+                assert called_args[1] == ["test", "production"]
                 # and the fake condition returned must have been passed to where() at some point
                 # (there may be multiple where() calls for enabled filter and tags filter)
                 mock_query.where.assert_any_call(fake_condition)
@@ -25,6 +25,7 @@ import pytest
 from sqlalchemy.exc import IntegrityError
 
 # First-Party
+from mcpgateway.cache.registry_cache import RegistryCache
 from mcpgateway.db import Resource as DbResource
 from mcpgateway.schemas import ResourceCreate, ResourceRead, ResourceSubscription, ResourceUpdate
 from mcpgateway.services.resource_service import (
@@ -208,7 +209,7 @@ class TestResourceServiceLifecycle:
         """Test service initialization."""
         await resource_service.initialize()
         # EventService handles subscribers internally now
-        assert resource_service._template_cache == {}
+        assert len(resource_service._template_index) == 0
 
     @pytest.mark.asyncio
     async def test_shutdown(self, resource_service):
@@ -477,7 +478,7 @@ class TestResourceListing:
             patch("mcpgateway.services.resource_service._get_registry_cache") as mock_cache_fn,
             patch("mcpgateway.services.resource_service.unified_paginate", new_callable=AsyncMock, return_value=([], None)),
         ):
-            mock_cache_fn.return_value = AsyncMock()
+            mock_cache_fn.return_value = RegistryCache()
             resources, cursor = await resource_service.list_resources(mock_db, user_email="")
 
         assert resources == []
@@ -800,6 +801,119 @@ class TestResourceReading:
             current_trace_id.reset(token)
 
 
+class TestResourceContentCache:
+    """Tests for serving gateway resource reads from the resource content cache."""
+
+    @staticmethod
+    def _db(gateway_id="gw-1"):
+        """Return a DB mock whose db.get() yields a fresh gateway resource."""
+        from types import SimpleNamespace
+
+        resource_db = MagicMock(id="res-1", uri="file:///docs/a.txt", enabled=True, gateway_id=gateway_id)
+        resource_db.gateway.name = "docs"
+        resource_db.content = SimpleNamespace(id="res-1", uri="file:///docs/a.txt", text="file:///docs/a.txt")
+        db = MagicMock()
+        db.get.return_value = resource_db
+        return db
+
+    @pytest.fixture
+    def content_cache(self, monkeypatch):
+        """Enable the content cache with a fresh instance."""
+        from mcpgateway.cache.resource_cache import ResourceCache
+        from mcpgateway.config import settings
+
+        cache = ResourceCache(max_size=10, ttl=60, max_bytes=1024)
+        monkeypatch.setattr(settings, "resource_cache_enabled", True)
+        monkeypatch.setattr(settings, "resource_cache_ttl_overrides", {})
+        monkeypatch.setattr("mcpgateway.services.resource_service._get_resource_cache", lambda: cache)
+        return cache
+
+    async def _read(self, resource_service, mock_invoke, db=None, **kwargs):
+        with (
+            patch.object(resource_service, "_check_resource_access", new_callable=AsyncMock, return_value=True),
+            patch.object(resource_service, "invoke_resource", mock_invoke),
+            patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service"),
+        ):
+            return await resource_service.read_resource(db or self._db(), resource_id="res-1", **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_is_served_from_cache(self, resource_service, content_cache):
+        mock_invoke = AsyncMock(return_value="REMOTE")
+
+        first = await self._read(resource_service, mock_invoke, user="a@example.com", token_teams=["t1"])
+        second = await self._read(resource_service, mock_invoke, user="a@example.com", token_teams=["t1"])
+
+        assert first.text == second.text == "REMOTE"
+        mock_invoke.assert_awaited_once()
+        assert content_cache.stats()["hit_count"] == 1
+        assert content_cache.stats()["bytes"] == len("REMOTE")
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_to_caller(self, resource_service, content_cache):
+        mock_invoke = AsyncMock(return_value="REMOTE")
+
+        await self._read(resource_service, mock_invoke, user="a@example.com", token_teams=["t1"])
+        await self._read(resource_service, mock_invoke, user="a@example.com", token_teams=None)
+        await self._read(resource_service, mock_invoke, user="b@example.com", token_teams=["t1"])
+
+        assert mock_invoke.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_forwarded_meta(self, resource_service, content_cache):
+        mock_invoke = AsyncMock(return_value="REMOTE")
+
+        await self._read(resource_service, mock_invoke, meta_data={"locale": "en", "page": 1})
+        await self._read(resource_service, mock_invoke, meta_data={"page": 1, "locale": "en"})
+        await self._read(resource_service, mock_invoke, meta_data={"locale": "fr", "page": 1})
+        await self._read(resource_service, mock_invoke)
+
+        # Same metadata (in any key order) hits the cache; other metadata or none reads upstream
+        assert mock_invoke.await_count == 3
+        assert [call.kwargs["meta_data"] for call in mock_invoke.await_args_list] == [{"locale": "en", "page": 1}, {"locale": "fr", "page": 1}, None]
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_reads_upstream(self, resource_service, content_cache, monkeypatch):
+        from mcpgateway.config import settings
+
+        monkeypatch.setattr(settings, "resource_cache_enabled", False)
+        mock_invoke = AsyncMock(return_value="REMOTE")
+
+        await self._read(resource_service, mock_invoke)
+        await self._read(resource_service, mock_invoke)
+
+        assert mock_invoke.await_count == 2
+        assert len(content_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_ttl_override_zero_disables_caching_for_gateway(self, resource_service, content_cache, monkeypatch):
+        from mcpgateway.config import settings
+
+        monkeypatch.setattr(settings, "resource_cache_ttl_overrides", {"docs": 0})
+        mock_invoke = AsyncMock(return_value="REMOTE")
+
+        await self._read(resource_service, mock_invoke)
+        await self._read(resource_service, mock_invoke)
+
+        assert mock_invoke.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_or_local_reads_are_not_cached(self, resource_service, content_cache):
+        await self._read(resource_service, AsyncMock(return_value=None))
+        await self._read(resource_service, AsyncMock(return_value="LOCAL"), db=self._db(gateway_id=None))
+
+        assert len(content_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_entries_are_invalidated_by_resource_gateway_and_uri(self, resource_service, content_cache):
+        from mcpgateway.cache.resource_cache import content_tag
+
+        mock_invoke = AsyncMock(return_value="REMOTE")
+        for tag in ("res-1", "gw-1", content_tag("gw-1", "file:///docs/a.txt")):
+            await self._read(resource_service, mock_invoke)
+            assert len(content_cache) == 1
+            assert content_cache.invalidate(tag) == 1
+
+
 # --------------------------------------------------------------------------- #
 # Resource management tests                                                   #
 # --------------------------------------------------------------------------- #
@@ -1355,19 +1469,19 @@ class TestResourceTemplates:
             mock_execute_result.scalars.return_value = mock_scalars
             mock_db.execute.return_value = mock_execute_result
 
-            with patch("mcpgateway.services.resource_service.json_contains_tag_expr") as mock_json_contains:
+            with patch("mcpgateway.services.resource_service.entity_tag_expr") as mock_entity_tag_expr:
                 # Return a valid SQLAlchemy text expression
-                mock_json_contains.return_value = text("1=1")
+                mock_entity_tag_expr.return_value = text("1=1")
 
                 result = await resource_service.list_resource_templates(
                     mock_db, tags=["api", "data"]
                 )
 
                 assert len(result) == 1
-                # Verify json_contains_tag_expr was called with the tags
-                mock_json_contains.assert_called_once()
-                call_args = mock_json_contains.call_args
-                assert call_args[0][2] == ["api", "data"]  # tags parameter
+                # Verify entity_tag_expr was called with the tags
+                mock_entity_tag_expr.assert_called_once()
+                call_args = mock_entity_tag_expr.call_args
+                assert call_args[0][1] == ["api", "data"]  # tags parameter
                 assert call_args[1]["match_any"] is True
 
     @pytest.mark.asyncio
@@ -1473,7 +1587,8 @@ class TestResourceTemplates:
         )
 
         # Cache contains ONE template
-        service._template_cache = {"1": template_obj}
+        service._template_index.add("1", template_obj.uri_template, template_obj)
+        service._template_index.loaded = True
 
         # URI that DOES NOT match the template
         uri = "file://searching/hello"
@@ -1504,7 +1619,8 @@ class TestResourceTemplates:
         )
 
         # Pre-load template cache
-        service._template_cache = {"template": template_obj}
+        service._template_index.add("template", template_obj.uri_template, template_obj)
+        service._template_index.loaded = True
 
         # URI that should match
         uri = "test://template/123"
@@ -1540,7 +1656,8 @@ class TestResourceTemplates:
         template.name = "binary_template"
         template.mime_type = "application/octet-stream"
 
-        service._template_cache = {"binary": template}
+        service._template_index.add("binary", template.uri_template, template)
+        service._template_index.loaded = True
 
         with patch.object(service, "_uri_matches_template", return_value=True), patch.object(service, "_extract_template_params", return_value={"id": "123"}):
 
@@ -1622,7 +1739,7 @@ class TestResourceMetrics:
         """Test metrics reset."""
         await resource_service.reset_metrics(mock_db)
 
-        assert mock_db.execute.call_count == 2
+        assert mock_db.execute.call_count == 3
         mock_db.commit.assert_called_once()
 
 
@@ -1916,10 +2033,10 @@ class TestResourceServiceMetricsExtended:
         mock_db.get_bind.return_value = bind
 
         with patch("mcpgateway.services.resource_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.resource_service.json_contains_tag_expr") as mock_json_contains:
+            with patch("mcpgateway.services.resource_service.entity_tag_expr") as mock_entity_tag_expr:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tag_expr.return_value = fake_condition
                 # Patch team name lookup to return a real string, not a MagicMock
                 mock_team = MagicMock()
                 mock_team.name = "test-team"
@@ -1928,11 +2045,11 @@ class TestResourceServiceMetricsExtended:
                 result, _ = await resource_service.list_resources(mock_db, tags=["test", "production"])
 
                 # helper should be called once with the tags list (not once per tag)
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is mock_db  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
-                assert called_args[2] == ["test", "production"]
+                mock_entity_tag_expr.assert_called_once()  # called exactly once
+                called_args = mock_entity_tag_expr.call_args[0]  # positional args tuple
+                assert called_args[0].key == "tags"  # tags column passed through
+                # second positional arg is the tags list (signature: col, values, match_any=True)
+                assert called_args[1] == ["test", "production"]
                 # and the fake condition returned must have been passed to where()
                 mock_query.where.assert_any_call(fake_condition)
                 # finally, your service should return the list produced by mock_db.execute(...)
@@ -1999,7 +2116,8 @@ class TestResourceServiceMetricsExtended:
             _meta={"version": "1.0"},
         )
 
-        service._template_cache = {"1": template_obj}
+        service._template_index.add("1", template_obj.uri_template, template_obj)
+        service._template_index.loaded = True
 
         # URI that does NOT match any template
         uri = "file://searching/hello"
@@ -4259,7 +4377,8 @@ class TestResourceServiceCoverageEdges:
             annotations=None,
             _meta=None,
         )
-        svc._template_cache = {"greet": tmpl}
+        svc._template_index.add("greet", tmpl.uri_template, tmpl)
+        svc._template_index.loaded = True
 
         with patch.object(svc, "_uri_matches_template", return_value=True):
             with pytest.raises(ResourceNotFoundError, match="exists but is inactive"):
@@ -4284,7 +4403,8 @@ class TestResourceServiceCoverageEdges:
             annotations=None,
             _meta=None,
         )
-        svc._template_cache = {"greet": tmpl}
+        svc._template_index.add("greet", tmpl.uri_template, tmpl)
+        svc._template_index.loaded = True
 
         with (
             patch.object(svc, "_uri_matches_template", return_value=True),
@@ -5673,6 +5793,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             content = await resource_service.read_resource(
                 db,
@@ -5717,6 +5838,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             content = await resource_service.read_resource(
                 db,
@@ -5759,6 +5881,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             content = await resource_service.read_resource(
                 db,
@@ -5799,6 +5922,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             content = await resource_service.read_resource(
                 db,
@@ -5823,6 +5947,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             with pytest.raises(ResourceNotFoundError, match="Resource not found"):
                 await resource_service.read_resource(
@@ -5853,6 +5978,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             with pytest.raises(ResourceError, match="Direct proxy resource read failed"):
                 await resource_service.read_resource(
@@ -5893,6 +6019,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             await resource_service.read_resource(
                 db,
@@ -5939,6 +6066,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = True
             mock_settings.mcpgateway_direct_proxy_timeout = 120
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             await resource_service.read_resource(
                 db,
@@ -5962,6 +6090,7 @@ class TestReadResourceDirectProxy:
             mock_settings.mcpgateway_direct_proxy_enabled = False
             mock_settings.mcpgateway_direct_proxy_timeout = 30
             mock_settings.experimental_validate_io = False
+            mock_settings.resource_cache_enabled = False
 
             content = await resource_service.read_resource(
                 db,
@@ -5974,3 +6103,85 @@ class TestReadResourceDirectProxy:
         mock_invoke.assert_awaited_once()
         # The content should come from the DB resource (cache mode), not direct proxy
         assert content.text == "cached-content"
+
+
+class TestResourceTemplateIndexSync:
+    """The template index is loaded once and kept current by resource events."""
+
+    @staticmethod
+    def _template_resource(resource_id="tmpl-1", uri_template="greetme://morning/{name}", enabled=True):
+        resource = MagicMock()
+        resource.id = resource_id
+        resource.uri = uri_template
+        resource.name = "greet"
+        resource.uri_template = uri_template
+        resource.enabled = enabled
+        return resource
+
+    @staticmethod
+    def _template(resource_id="tmpl-1", uri_template="greetme://morning/{name}"):
+        from mcpgateway.common.models import ResourceTemplate
+
+        return ResourceTemplate(id=resource_id, uriTemplate=uri_template, name="greet", mime_type="text/plain")
+
+    @pytest.mark.asyncio
+    async def test_index_loaded_once(self):
+        svc = ResourceService()
+        db = MagicMock()
+        db.execute.return_value.scalar_one_or_none.return_value = None
+
+        with patch.object(svc, "list_resource_templates", new_callable=AsyncMock, return_value=[self._template()]) as mock_list:
+            await svc._read_template_resource(db, "greetme://morning/John")
+            out = await svc._read_template_resource(db, "greetme://morning/Jane")
+
+        mock_list.assert_awaited_once()
+        assert out.text == "greetme://morning/Jane"
+
+    @pytest.mark.asyncio
+    async def test_events_update_loaded_index(self):
+        svc = ResourceService()
+        svc._publish_event = AsyncMock()
+        svc._template_index.loaded = True
+        resource = self._template_resource()
+
+        with patch("mcpgateway.services.resource_service.ResourceTemplate.model_validate", side_effect=lambda r: self._template(r.id, r.uri_template)):
+            await svc._notify_resource_added(resource)
+            assert svc._template_index.match("greetme://morning/John").id == "tmpl-1"
+
+            resource.uri_template = "greetme://evening/{name}"
+            await svc._notify_resource_updated(resource)
+            assert svc._template_index.match("greetme://morning/John") is None
+            assert svc._template_index.match("greetme://evening/John").id == "tmpl-1"
+
+            resource.enabled = False
+            await svc._notify_resource_deactivated(resource)
+            assert len(svc._template_index) == 0
+
+            resource.enabled = True
+            await svc._notify_resource_activated(resource)
+            assert len(svc._template_index) == 1
+
+        await svc._notify_resource_deleted({"id": "tmpl-1", "uri": resource.uri})
+        assert len(svc._template_index) == 0
+
+    @pytest.mark.asyncio
+    async def test_events_ignored_until_index_loaded(self):
+        svc = ResourceService()
+        svc._publish_event = AsyncMock()
+
+        await svc._notify_resource_added(self._template_resource())
+
+        # The first templated read must still load every template from the DB
+        assert len(svc._template_index) == 0
+        assert svc._template_index.loaded is False
+
+    def test_index_failure_forces_reload(self):
+        svc = ResourceService()
+        svc._template_index.add("other", "x://{a}", "other")
+        svc._template_index.loaded = True
+
+        with patch("mcpgateway.services.resource_service.ResourceTemplate.model_validate", side_effect=ValueError("bad")):
+            svc._sync_template_index(self._template_resource())
+
+        assert svc._template_index.loaded is False
+        assert len(svc._template_index) == 0
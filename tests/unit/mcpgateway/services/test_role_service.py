@@ -346,6 +346,18 @@ class TestUpdateRole:
                 mock_db.commit.assert_called_once()
                 mock_db.refresh.assert_called_once_with(sample_role)
 
+    @pytest.mark.asyncio
+    async def test_update_role_invalidates_all_permission_decisions(self, role_service, sample_role):
+        """Changing a role definition drops every cached permission decision."""
+        sample_role.is_system_role = False
+
+        with patch.object(role_service, "get_role_by_id", new=AsyncMock(return_value=sample_role)):
+            with patch("mcpgateway.services.role_service.permission_cache") as perm_cache:
+                perm_cache.invalidate_all = AsyncMock()
+                await role_service.update_role(role_id="role-123", description="Updated description")
+
+        perm_cache.invalidate_all.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_update_role_not_found(self, role_service):
         """Test updating non-existent role."""
@@ -607,6 +619,18 @@ class TestRevokeRoleFromUser:
             assert sample_user_role.is_active is False
             mock_db.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_revoke_role_invalidates_permission_cache(self, role_service, sample_user_role):
+        """Revoking a role drops the user's cached permission decisions."""
+        sample_user_role.is_active = True
+
+        with patch.object(role_service, "get_user_role_assignment", new=AsyncMock(return_value=sample_user_role)):
+            with patch("mcpgateway.services.role_service.permission_cache") as perm_cache:
+                perm_cache.invalidate_user = AsyncMock()
+                await role_service.revoke_role_from_user(user_email="user@example.com", role_id="role-123", scope="team", scope_id="team-789")
+
+        perm_cache.invalidate_user.assert_awaited_once_with("user@example.com")
+
     @pytest.mark.asyncio
     async def test_revoke_role_not_found(self, role_service):
         """Test revoking non-existent role assignment."""
@@ -753,10 +777,14 @@ class TestDeleteAllUserRoles:
         mock_result.rowcount = 3
         mock_db.execute.return_value = mock_result
 
-        result = await role_service.delete_all_user_roles("user@example.com")
+        with patch("mcpgateway.services.role_service.permission_cache") as perm_cache:
+            perm_cache.invalidate_user = AsyncMock()
+            result = await role_service.delete_all_user_roles("user@example.com")
 
         assert result == 3
         mock_db.execute.assert_called_once()
+        # Nothing is committed yet: the caller invalidates after its commit
+        perm_cache.invalidate_user.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_delete_all_user_roles_no_roles(self, role_service, mock_db):
@@ -996,7 +996,7 @@ class TestServerService:
         test_db.execute = Mock()
         test_db.commit = Mock()
         await server_service.reset_metrics(test_db)
-        assert test_db.execute.call_count == 2
+        assert test_db.execute.call_count == 3
         test_db.commit.assert_called_once()
 
     # --------------------------- UUID normalization -------------------- #
@@ -1347,10 +1347,10 @@ class TestServerService:
         session.get_bind.return_value = bind
 
         with patch("mcpgateway.services.server_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.server_service.json_contains_tag_expr") as mock_json_contains:
+            with patch("mcpgateway.services.server_service.entity_tag_expr") as mock_entity_tag_expr:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tag_expr.return_value = fake_condition
                 mock_team = MagicMock()
                 mock_team.name = "test-team"
                 session.query().filter().first.return_value = mock_team
@@ -1358,11 +1358,11 @@ class TestServerService:
                 result = await server_service.list_servers(session, tags=["test", "production"])
 
                 # helper should be called once with the tags list (not once per tag)
-                mock_json_contains.assert_called_once()  # called exactly once
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is session  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
-                assert called_args[2] == ["test", "production"]
+                mock_entity_tag_expr.assert_called_once()  # called exactly once
+                called_args = mock_entity_tag_expr.call_args[0]  # positional args tuple
+                assert called_args[0].key == "tags"  # tags column passed through
+                # second positional arg is the tags list (signature: col, values, match_any=True)
+                assert called_args[1] == ["test", "production"]
                 # and the fake condition returned must have been passed to where()
                 mock_query.where.assert_called_with(fake_condition)
                 # finally, your service should return a tuple (list, cursor)
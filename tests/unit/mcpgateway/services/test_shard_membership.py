@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Tests for consistent-hash sharding of gateway health checks.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.services.shard_membership import HashRing, MEMBERS_KEY, ShardMembership
+
+GATEWAYS = [f"gw-{i}" for i in range(5000)]
+
+
+class TestHashRing:
+    def test_even_spread(self):
+        ring = HashRing([f"w{i}" for i in range(8)])
+        counts = {}
+        for gw in GATEWAYS:
+            counts[ring.owner(gw)] = counts.get(ring.owner(gw), 0) + 1
+        assert len(counts) == 8
+        assert max(counts.values()) < 2 * min(counts.values())
+
+    def test_leaving_member_only_moves_its_own_keys(self):
+        before = HashRing(["a", "b", "c", "d"])
+        after = HashRing(["a", "b", "c"])
+        moved = [gw for gw in GATEWAYS if before.owner(gw) != after.owner(gw)]
+        assert moved and all(before.owner(gw) == "d" for gw in moved)
+
+    def test_owner_is_stable_across_instances(self):
+        assert HashRing(["b", "a"]).owner("gw-1") == HashRing(["a", "b"]).owner("gw-1")
+
+
+class TestFileMembership:
+    async def test_every_gateway_has_exactly_one_owner(self, tmp_path):
+        workers = [ShardMembership(f"w{i}", ttl=30, directory=str(tmp_path)) for i in range(4)]
+        for worker in workers + workers:
+            await worker.heartbeat()
+        for gw in GATEWAYS[:500]:
+            assert sum(worker.owns(gw) for worker in workers) == 1
+
+    async def test_stale_members_expire(self, tmp_path):
+        a = ShardMembership("a", ttl=30, directory=str(tmp_path))
+        b = ShardMembership("b", ttl=30, directory=str(tmp_path))
+        await b.heartbeat()
+        assert await a.heartbeat() is True
+        assert a.members == ("a", "b")
+
+        stale = time.time() - 60
+        os.utime(tmp_path / "b", (stale, stale))  # b stopped heartbeating
+        assert await a.heartbeat() is True
+        assert a.members == ("a",)
+        assert not (tmp_path / "b").exists()
+        assert a.rebalances == 2
+
+    async def test_leave_is_idempotent(self, tmp_path):
+        a = ShardMembership("a", ttl=30, directory=str(tmp_path))
+        await a.leave()  # never joined
+        await a.heartbeat()
+        await a.leave()
+        assert not (tmp_path / "a").exists()
+
+    def test_requires_backend(self):
+        with pytest.raises(ValueError):
+            ShardMembership("a", ttl=30)
+
+
+class TestRedisMembership:
+    @staticmethod
+    def _redis(members):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 0, members])
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        redis.zrem = AsyncMock()
+        return redis, pipe
+
+    async def test_heartbeat_and_prune(self):
+        redis, pipe = self._redis([b"a", b"b"])
+        a = ShardMembership("a", ttl=30, redis_client=redis)
+        assert await a.heartbeat() is True
+        assert a.members == ("a", "b")
+        assert pipe.zadd.call_args.args[0] == MEMBERS_KEY
+        assert "a" in pipe.zadd.call_args.args[1]
+        assert pipe.zremrangebyscore.call_args.args[:2] == (MEMBERS_KEY, "-inf")
+
+        await a.leave()
+        redis.zrem.assert_awaited_once_with(MEMBERS_KEY, "a")
+
+    async def test_failure_keeps_known_members(self):
+        redis, pipe = self._redis([b"a", b"b"])
+        a = ShardMembership("a", ttl=30, redis_client=redis)
+        await a.heartbeat()
+        pipe.execute.side_effect = ConnectionError("down")
+        assert await a.heartbeat() is False
+        assert a.members == ("a", "b")
+
+    async def test_self_is_always_a_member(self):
+        redis, _ = self._redis([b"b"])  # own entry not visible yet
+        a = ShardMembership("a", ttl=30, redis_client=redis)
+        await a.heartbeat()
+        assert a.members == ("a", "b")
+
+
+class TestGatewayServiceSharding:
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        # First-Party
+        from mcpgateway.services.gateway_service import GatewayService
+
+        monkeypatch.setattr("mcpgateway.services.gateway_service.settings.health_check_sharding_enabled", True)
+        monkeypatch.setattr("mcpgateway.services.gateway_service.settings.health_check_scheduler_enabled", False)
+        service = GatewayService()
+        service._event_service = AsyncMock()
+        service._redis_client = None
+        service.redis_url = None
+        service._lock_path = str(tmp_path / "leader.lock")
+        return service
+
+    async def test_initialize_starts_sharded_loops_without_leader_election(self, service):
+        service._run_health_checks = AsyncMock()
+        await service.initialize()
+        await service._health_check_task
+        service._run_health_checks.assert_awaited_once()
+        assert service._shard_membership is not None
+        assert service._shard_heartbeat_task is not None
+
+        await service.shutdown()
+        assert not os.listdir(service._lock_path + ".members")  # left the shards
+
+    async def test_cycle_checks_only_owned_gateways(self, service, tmp_path):
+        other = ShardMembership("other", ttl=30, directory=str(tmp_path / "leader.lock.members"))
+        await other.heartbeat()
+        service._run_health_checks = AsyncMock()
+        await service.initialize()
+        await other.heartbeat()  # sees the service join
+
+        gateways = [SimpleNamespace(id=gw, auth_type=None) for gw in GATEWAYS[:200]]
+        service._get_gateways = lambda: gateways
+        service.check_health_of_gateways = AsyncMock()
+        service._health_check_interval = 0
+        await service._run_health_check_cycle(None)
+
+        checked = service.check_health_of_gateways.await_args.args[0]
+        assert 0 < len(checked) < len(gateways)
+        assert all(service._shard_membership.owns(gw.id) and not other.owns(gw.id) for gw in checked)
+        service._shard_heartbeat_task.cancel()
+
+    async def test_run_health_checks_runs_on_every_worker(self, service):
+        service._shard_membership = MagicMock()
+        calls = 0
+
+        async def cycle(_user_email):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise asyncio.CancelledError
+
+        service._run_health_check_cycle = cycle
+        with pytest.raises(asyncio.CancelledError):
+            await service._run_health_checks("admin@example.com")
+        assert calls == 2
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""Tests for the buffered observability span exporter.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# First-Party
+from mcpgateway.db import Base, ObservabilityEvent, ObservabilityMetric, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.services.observability_service import current_buffered_trace, ObservabilityService
+from mcpgateway.services.span_buffer_service import BufferedTrace, SpanBufferService
+
+
+@pytest.fixture
+def span_buffer():
+    """Fresh buffer wired in as the process singleton."""
+    service = SpanBufferService(max_queue_size=100, flush_interval=60, batch_size=10, enabled=True)
+    token = current_buffered_trace.set(None)
+    with patch("mcpgateway.services.observability_service.get_span_buffer_service", return_value=service):
+        yield service
+    current_buffered_trace.reset(token)
+
+
+@pytest.fixture
+def trace_db(tmp_path):
+    """File-backed SQLite DB with foreign keys enforced, patched into the exporter."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'spans.db'}")
+    event.listen(engine, "connect", lambda conn, _rec: conn.execute("PRAGMA foreign_keys=ON"))
+    Base.metadata.create_all(engine, tables=[ObservabilityTrace.__table__, ObservabilitySpan.__table__, ObservabilityEvent.__table__, ObservabilityMetric.__table__])
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def _session():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with patch("mcpgateway.services.span_buffer_service.fresh_db_session", _session):
+        yield factory
+    engine.dispose()
+
+
+def _record_trace(service: ObservabilityService, name: str = "POST /rpc") -> str:
+    """Build a buffered trace with nested spans, an event and a metric."""
+    trace_id = service.begin_buffered_trace(name, http_method="POST")
+    root = service.start_span(None, trace_id, "http.request", kind="server")
+    child = service.start_span(None, trace_id, "plugin.execute.pii", parent_span_id=root, resource_type="plugin")
+    service.add_event(None, child, "plugin.note", severity="info", message="ok")
+    service.record_metric(None, "plugin.duration", 1.5, unit="ms", trace_id=trace_id)
+    service.end_span(None, child, status="ok", attributes={"plugin.had_violation": False})
+    service.end_span(None, root, status="ok")
+    assert service.finish_buffered_trace(trace_id, status="ok", http_status_code=200)
+    return trace_id
+
+
+class TestBufferedTraceRecording:
+    """Spans for a buffered trace stay in memory until the trace completes."""
+
+    def test_spans_events_and_metrics_collected_in_memory(self, span_buffer):
+        service = ObservabilityService()
+        trace_id = _record_trace(service)
+
+        assert span_buffer.get_stats()["queue_depth"] == 1
+        buffered = span_buffer._queue[0]
+        assert buffered.trace_id == trace_id
+        assert buffered.closed is True
+        assert buffered.trace["http_status_code"] == 200
+        assert buffered.trace["duration_ms"] is not None
+        assert [s["name"] for s in buffered.spans.values()] == ["http.request", "plugin.execute.pii"]
+        assert all(s["status"] == "ok" and s["end_time"] is not None for s in buffered.spans.values())
+        assert len(buffered.events) == 1
+        assert buffered.metrics[0]["trace_id"] == trace_id
+
+    def test_late_span_after_finish_is_dropped(self, span_buffer):
+        service = ObservabilityService()
+        _record_trace(service)
+        trace_id = current_buffered_trace.get().trace_id
+
+        service.start_span(None, trace_id, "late")
+
+        assert span_buffer.get_stats()["dropped_late"] == 1
+        assert span_buffer._queue[0].span_count == 2
+
+    def test_other_trace_uses_database_path(self, span_buffer):
+        service = ObservabilityService()
+        service.begin_buffered_trace("GET /")
+        db = MagicMock()
+
+        service.start_span(db, "some-other-trace", "direct")
+
+        db.add.assert_called_once()
+        assert current_buffered_trace.get().span_count == 0
+
+    def test_finish_unknown_trace_returns_false(self, span_buffer):
+        assert ObservabilityService().finish_buffered_trace("nope") is False
+        assert span_buffer.get_stats()["total_enqueued"] == 0
+
+
+class TestSpanBufferQueue:
+    """Bounded queue behaviour and drop counters."""
+
+    def test_queue_full_drops_new_traces(self):
+        service = SpanBufferService(max_queue_size=2, batch_size=10, enabled=True)
+        results = [service.enqueue(BufferedTrace(trace={"trace_id": str(i)})) for i in range(4)]
+
+        assert results == [True, True, False, False]
+        stats = service.get_stats()
+        assert stats["queue_depth"] == 2
+        assert stats["dropped_queue_full"] == 2
+
+    def test_full_batch_wakes_flush_loop(self):
+        service = SpanBufferService(max_queue_size=100, batch_size=2, enabled=True)
+        service.enqueue(BufferedTrace(trace={"trace_id": "a"}))
+        assert not service._wakeup_event.is_set()
+        service.enqueue(BufferedTrace(trace={"trace_id": "b"}))
+        assert service._wakeup_event.is_set()
+
+    def test_sampled_out_counter(self):
+        service = SpanBufferService(enabled=True)
+        service.record_sampled_out()
+        assert service.get_stats()["sampled_out"] == 1
+
+
+class TestSpanBufferFlush:
+    """Bulk inserts into the observability tables."""
+
+    @pytest.mark.asyncio
+    async def test_flush_bulk_inserts_in_batches(self, span_buffer, trace_db):
+        service = ObservabilityService()
+        trace_ids = [_record_trace(service, name=f"POST /rpc/{i}") for i in range(25)]
+
+        written = await span_buffer.flush()
+
+        assert written == 25
+        stats = span_buffer.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["flush_count"] == 3  # batch_size=10
+        assert stats["total_spans_flushed"] == 50
+
+        db = trace_db()
+        try:
+            assert db.query(ObservabilityTrace).count() == 25
+            assert db.query(ObservabilitySpan).count() == 50
+            assert db.query(ObservabilityEvent).count() == 25
+            assert db.query(ObservabilityMetric).count() == 25
+            trace = service.get_trace(db, trace_ids[0], include_spans=True)
+            assert trace.status == "ok"
+            assert {s.name for s in trace.spans} == {"http.request", "plugin.execute.pii"}
+        finally:
+            db.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_counts_dropped(self, span_buffer):
+        _record_trace(ObservabilityService())
+
+        with patch.object(span_buffer, "_flush_to_db", return_value=False):
+            written = await span_buffer.flush()
+
+        assert written == 0
+        stats = span_buffer.get_stats()
+        assert stats["flush_failures"] == 1
+        assert stats["dropped_flush_error"] == 1
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_to_db_swallows_errors(self, span_buffer):
+        with patch("mcpgateway.services.span_buffer_service.fresh_db_session", side_effect=RuntimeError("db down")):
+            assert span_buffer._flush_to_db([BufferedTrace(trace={"trace_id": "x"})]) is False
+
+    @pytest.mark.asyncio
+    async def test_start_and_shutdown_flushes_queue(self, span_buffer, trace_db):
+        await span_buffer.start()
+        assert span_buffer._flush_task is not None
+        _record_trace(ObservabilityService())
+
+        await span_buffer.shutdown()
+
+        assert span_buffer._flush_task.done()
+        assert span_buffer.get_stats()["total_flushed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_loop_runs_on_wakeup(self, span_buffer):
+        span_buffer.flush = AsyncMock(return_value=0)
+        span_buffer._wakeup_event.set()
+        task = asyncio.create_task(span_buffer._flush_loop())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        span_buffer.flush.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_start_skipped_when_disabled(self):
+        service = SpanBufferService(enabled=False)
+        await service.start()
+        assert service._flush_task is None
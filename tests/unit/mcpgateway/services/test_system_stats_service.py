@@ -228,6 +228,35 @@ def test_metrics_stats(mock_db_metrics_stats):
     assert stats["breakdown"]["token_usage_logs"] == 75
 
 
+@pytest.mark.parametrize("rollups_enabled, expected", [(True, 5), (False, 1)])
+def test_metrics_stats_token_usage_source(rollups_enabled, expected):
+    """Token usage is counted from the rollups when enabled, since raw rows may be sampled."""
+    # Standard
+    from datetime import datetime, timezone
+
+    # Third-Party
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    # First-Party
+    from mcpgateway.db import A2AAgentMetric, Base, PromptMetric, ResourceMetric, ServerMetric, TokenUsageLog, TokenUsageRollup, ToolMetric
+
+    engine = create_engine("sqlite://")
+    tables = [model.__table__ for model in (ToolMetric, ResourceMetric, PromptMetric, ServerMetric, A2AAgentMetric, TokenUsageLog, TokenUsageRollup)]
+    Base.metadata.create_all(engine, tables=tables)
+    minute = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with Session(engine) as db:
+        db.add(TokenUsageLog(token_jti="jti-1", user_email="a@example.com", endpoint="/tools", status_code=200))
+        db.add_all([TokenUsageRollup(token_jti="jti-1", user_email="a@example.com", endpoint="/tools", minute_start=minute, request_count=n) for n in (2, 3)])
+        db.commit()
+        with patch("mcpgateway.services.system_stats_service.settings") as mock_settings:
+            mock_settings.token_usage_rollup_enabled = rollups_enabled
+            stats = SystemStatsService()._get_metrics_stats(db)
+
+    assert stats["breakdown"]["token_usage_logs"] == expected
+    assert stats["total"] == expected
+
+
 def test_security_stats(mock_db_security_stats):
     """Test security stats using UNION ALL (4 queries → 1)"""
     service = SystemStatsService()
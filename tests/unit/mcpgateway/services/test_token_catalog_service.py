@@ -50,6 +50,12 @@ def token_service(mock_db):
     return TokenCatalogService(mock_db)
 
 
+@pytest.fixture(autouse=True)
+def raw_usage_stats(monkeypatch):
+    """Compute usage stats from raw token_usage_logs rows (rollups are covered in test_token_usage_rollup_service)."""
+    monkeypatch.setattr("mcpgateway.services.token_catalog_service.settings.token_usage_rollup_enabled", False)
+
+
 @pytest.fixture
 def mock_user():
     """Create a mock EmailUser."""
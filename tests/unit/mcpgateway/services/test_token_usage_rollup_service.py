@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Tests for per-minute API token usage rollups.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+from contextlib import contextmanager
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# First-Party
+from mcpgateway.db import Base, TokenUsageRollup
+from mcpgateway.middleware.token_usage_middleware import TokenUsageMiddleware
+from mcpgateway.services import token_usage_rollup_service as rollup_module
+from mcpgateway.services.token_catalog_service import TokenCatalogService
+from mcpgateway.services.token_usage_rollup_service import get_token_usage_rollup_service, TokenUsageRollupService
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[TokenUsageRollup.__table__])
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def fresh_db_session():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(rollup_module, "fresh_db_session", fresh_db_session)
+    return factory
+
+
+@pytest.fixture
+def service():
+    svc = TokenUsageRollupService(flush_interval=60, enabled=True, raw_sample_rate=0.0)
+    svc._running = lambda: True
+    return svc
+
+
+class TestRecord:
+    def test_counts_are_grouped_by_token_endpoint_and_minute(self, service):
+        now = 1_700_000_000.0
+        minute = int(now // 60) * 60
+        for status in (200, 201, 302, 404, 500):
+            service.record("jti-1", "a@example.com", "/tools", status, 20, now=now)
+        service.record("jti-1", "a@example.com", "/tools", 200, 20, now=now + 60)
+        service.record("jti-1", "a@example.com", "/servers", 200, 20, now=now)
+        service.record("jti-2", "a@example.com", "/tools", 200, 20, now=now)
+
+        assert len(service._counters) == 4
+        counters = service._counters[("jti-1", "a@example.com", "/tools", minute)]
+        assert counters[:6] == [5, 2, 1, 1, 1, 0]
+        assert service.get_stats()["total_recorded"] == 8
+
+    def test_latency_histogram(self, service):
+        for latency in (0, 5, 10, 11, 300, 6000):
+            service.record("jti-1", "a@example.com", "/tools", 200, latency, now=0.0)
+        counters = service._counters[("jti-1", "a@example.com", "/tools", 0)]
+        assert counters[6:9] == [5, 6326, 6000]  # zero latency is not sampled
+        assert counters[9:] == [2, 1, 0, 0, 1, 0, 0, 1]
+
+    def test_not_running_falls_back_to_raw_rows(self):
+        assert TokenUsageRollupService(enabled=True).record("jti", "a@example.com", "/", 200, 1) is False
+        svc = TokenUsageRollupService(enabled=False)
+        svc._running = lambda: True
+        assert svc.record("jti", "a@example.com", "/", 200, 1) is False
+
+    def test_raw_sampling(self):
+        assert TokenUsageRollupService(raw_sample_rate=1.0).sample_raw() is True
+        assert TokenUsageRollupService(raw_sample_rate=0.0).sample_raw() is False
+
+    def test_singleton(self):
+        assert get_token_usage_rollup_service() is get_token_usage_rollup_service()
+
+
+class TestFlush:
+    async def test_flush_writes_one_row_per_key(self, service, session_factory):
+        for _ in range(1000):
+            service.record("jti-1", "a@example.com", "/tools", 200, 40, now=0.0)
+        service.record("jti-1", "a@example.com", "/tools", 200, 40, now=60.0)
+
+        assert await service.flush() == 2
+        assert await service.flush() == 0
+        with session_factory() as db:
+            rows = db.execute(select(TokenUsageRollup).order_by(TokenUsageRollup.minute_start)).scalars().all()
+        assert [row.request_count for row in rows] == [1000, 1]
+        assert rows[0].latency_le_50ms == 1000
+        assert rows[0].latency_sum_ms == 40000
+        assert service._counters == {}
+
+    async def test_failed_flush_is_retried(self, service, session_factory, monkeypatch):
+        service.record("jti-1", "a@example.com", "/tools", 200, 40, now=0.0)
+        monkeypatch.setattr(TokenUsageRollupService, "_flush_to_db", staticmethod(MagicMock(side_effect=RuntimeError("db down"))))
+        assert await service.flush() == 0
+        service.record("jti-1", "a@example.com", "/tools", 200, 90, now=0.0)
+        assert service._counters[("jti-1", "a@example.com", "/tools", 0)][:9] == [2, 2, 0, 0, 0, 0, 2, 130, 90]
+        assert service.get_stats()["flush_failures"] == 1
+
+    async def test_shutdown_flushes(self, session_factory):
+        svc = TokenUsageRollupService(flush_interval=60, enabled=True)
+        await svc.start()
+        assert svc.record("jti-1", "a@example.com", "/tools", 200, 40)
+        await svc.shutdown()
+        with session_factory() as db:
+            assert db.execute(select(func.count()).select_from(TokenUsageRollup)).scalar() == 1
+
+
+class TestUsageStats:
+    async def test_stats_are_read_from_rollups(self, service, session_factory, monkeypatch):
+        monkeypatch.setattr("mcpgateway.services.token_catalog_service.settings.token_usage_rollup_enabled", True)
+        now = time.time()
+        for i in range(100):
+            service.record("jti-1", "a@example.com", "/tools" if i < 60 else "/servers", 200 if i < 90 else 500, 20 if i < 95 else 800, now=now)
+        service.record("jti-2", "a@example.com", "/tools", 200, 20, now=now)
+        service.record("jti-1", "b@example.com", "/tools", 200, 20, now=now)
+        service.record("jti-1", "a@example.com", "/tools", 200, 20, now=now - 40 * 86400)  # outside the window
+        await service.flush()
+        service.record("jti-1", "a@example.com", "/tools", 200, 20, now=now)  # second flush: same key, another row
+        await service.flush()
+
+        with session_factory() as db:
+            catalog = TokenCatalogService(db)
+            catalog.get_token = AsyncMock(return_value=MagicMock(jti="jti-1"))
+            stats = await catalog.get_token_usage_stats("a@example.com", token_id="token-1", days=30)
+
+        assert stats["total_requests"] == 101
+        assert stats["successful_requests"] == 91
+        assert stats["status_classes"] == {"2xx": 91, "3xx": 0, "4xx": 0, "5xx": 10}
+        assert stats["success_rate"] == pytest.approx(91 / 101)
+        assert stats["average_response_time_ms"] == pytest.approx((96 * 20 + 5 * 800) / 101, abs=0.01)
+        assert stats["p95_response_time_ms"] == 50.0
+        assert stats["top_endpoints"] == [("/tools", 61), ("/servers", 40)]
+
+    async def test_empty_stats(self, session_factory, monkeypatch):
+        monkeypatch.setattr("mcpgateway.services.token_catalog_service.settings.token_usage_rollup_enabled", True)
+        with session_factory() as db:
+            stats = await TokenCatalogService(db).get_token_usage_stats("nobody@example.com")
+        assert (stats["total_requests"], stats["success_rate"], stats["average_response_time_ms"], stats["p95_response_time_ms"]) == (0, 0, 0.0, None)
+        assert stats["top_endpoints"] == []
+
+
+class TestMiddleware:
+    @staticmethod
+    async def _call(rollups):
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 201, "headers": []})
+
+        scope = {"type": "http", "path": "/tools", "method": "POST", "headers": [], "state": {"auth_method": "api_token", "jti": "jti-1", "user_email": "a@example.com"}}
+        token_service = MagicMock()
+        token_service.log_token_usage = AsyncMock()
+        with (
+            patch("mcpgateway.middleware.token_usage_middleware.get_token_usage_rollup_service", return_value=rollups),
+            patch("mcpgateway.middleware.token_usage_middleware.fresh_db_session"),
+            patch("mcpgateway.middleware.token_usage_middleware.TokenCatalogService", return_value=token_service),
+        ):
+            await TokenUsageMiddleware(app)(scope, AsyncMock(), AsyncMock())
+        return token_service.log_token_usage
+
+    async def test_counted_requests_skip_raw_rows(self, service):
+        log_token_usage = await self._call(service)
+        log_token_usage.assert_not_awaited()
+        assert service.get_stats()["total_recorded"] == 1
+        assert next(iter(service._counters))[:3] == ("jti-1", "a@example.com", "/tools")
+
+    async def test_sampled_requests_also_write_raw_rows(self, service):
+        service.raw_sample_rate = 1.0
+        log_token_usage = await self._call(service)
+        log_token_usage.assert_awaited_once()
+        assert service.get_stats()["total_recorded"] == 1
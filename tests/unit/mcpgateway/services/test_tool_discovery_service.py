@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Tests for the tool discovery meta-tool.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import orjson
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# First-Party
+from mcpgateway.config import settings
+from mcpgateway.db import Base, Server, Tool
+from mcpgateway.services import tool_discovery_service as tds
+from mcpgateway.services.tool_discovery_service import get_tool_discovery_service, tokenize, ToolDiscoveryService, ToolSearchIndex
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'discovery.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def service(session_factory, monkeypatch):
+    @contextmanager
+    def fresh_session():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(tds, "fresh_db_session", fresh_session)
+    monkeypatch.setattr(settings, "tool_discovery_enabled", True)
+    monkeypatch.setattr(settings, "tool_discovery_min_tools", 2)
+    return ToolDiscoveryService()
+
+
+def _tool(name: str, description: str = "", properties=None, **kwargs) -> Tool:
+    kwargs.setdefault("visibility", "public")
+    return Tool(original_name=name, url="http://x", description=description, input_schema={"type": "object", "properties": properties or {}}, **kwargs)
+
+
+@pytest.fixture
+def catalog(db):
+    tools = [
+        _tool("get_weather", "Current conditions", {"city": {"type": "string"}}),
+        _tool("get_forecast", "Weather forecast for the week", {"city": {}, "days": {}}),
+        _tool("create_issue", "Open a GitHub issue", {"repo": {}, "title": {}}),
+        _tool("team_weather", "Team-only weather", visibility="team", team_id="team-a"),
+        _tool("my_weather", "Private weather", visibility="private", owner_email="alice@example.com"),
+        _tool("off_weather", "Disabled weather", enabled=False),
+    ]
+    other = _tool("weather_elsewhere", "Weather on another server")
+    server = Server(name="big", tools=tools, visibility="public")
+    db.add_all([server, Server(name="other", tools=[other], visibility="public")])
+    db.commit()
+    return server
+
+
+def _names(tools) -> list:
+    return [t["name"] for t in tools]
+
+
+class TestIndex:
+    def test_tokenize_splits_identifiers(self):
+        assert tokenize("listPullRequests by_repo-name") == ["list", "pull", "requests", "repo", "name"]
+
+    def test_name_terms_outrank_description_terms(self):
+        index = ToolSearchIndex()
+        index.upsert("desc", names=["send_message"], description="Send a message about the weather")
+        index.upsert("name", names=["weather_now"], description="Current conditions")
+        index.upsert("schema", names=["lookup"], schema={"properties": {"weatherStation": {}}})
+        assert [tool_id for tool_id, _ in index.search("weather")] == ["name", "schema", "desc"]
+
+    def test_upsert_replaces_and_remove_cleans_postings(self):
+        index = ToolSearchIndex()
+        index.upsert("t1", names=["alpha"])
+        index.upsert("t1", names=["beta"])
+        assert index.search("alpha") == []
+        assert index.stats() == {"tools": 1, "terms": 1, "postings": 1}
+        index.remove("t1")
+        index.remove("missing")
+        assert index.stats() == {"tools": 0, "terms": 0, "postings": 0}
+
+    def test_top_limits_results(self):
+        index = ToolSearchIndex()
+        for i in range(20):
+            index.upsert(f"t{i:02d}", names=[f"tool_{i}"], description="common")
+        assert len(index.top("common", 5)) == 5
+
+
+class TestSearch:
+    async def test_search_filters_by_server_and_access(self, service, db, catalog):
+        admin = await service.search(db, catalog.id, "weather", 10)
+        assert set(_names(admin)) == {"get-weather", "get-forecast", "team-weather", "my-weather"}  # not other servers' or disabled tools
+
+        public = await service.search(db, catalog.id, "weather", 10, user_email="bob@example.com", token_teams=[])
+        assert set(_names(public)) == {"get-weather", "get-forecast"}
+
+        team = await service.search(db, catalog.id, "weather", 10, user_email="bob@example.com", token_teams=["team-a"])
+        assert "team-weather" in _names(team)
+
+        owner = await service.search(db, catalog.id, "weather", 10, user_email="alice@example.com", token_teams=["team-b"])
+        assert "my-weather" in _names(owner)
+        assert "team-weather" not in _names(owner)
+
+    async def test_team_lookup_when_token_teams_missing(self, service, db, catalog):
+        teams = MagicMock()
+        teams.get_user_teams = AsyncMock(return_value=[MagicMock(id="team-a")])
+        with patch.object(tds, "TeamManagementService", return_value=teams):
+            result = await service.search(db, catalog.id, "weather", 10, user_email="bob@example.com")
+        assert "team-weather" in _names(result)
+        teams.get_user_teams.assert_awaited_once_with("bob@example.com")
+
+    async def test_results_carry_schema_and_respect_k(self, service, db, catalog):
+        result = await service.search(db, catalog.id, "city forecast", 1)
+        assert len(result) == 1
+        assert result[0]["name"] == "get-forecast"
+        assert set(result[0]["inputSchema"]["properties"]) == {"city", "days"}
+
+    async def test_events_update_index_incrementally(self, service, db, catalog):
+        await service.search(db, catalog.id, "weather", 10)
+        tool = Tool(original_name="translate_text", url="http://x", description="", input_schema={}, visibility="public")
+        catalog.tools.append(tool)
+        db.commit()
+        assert await service.search(db, catalog.id, "translate", 10) == []  # not indexed yet
+
+        service.handle_event({"type": "tool_added", "data": {"id": tool.id}})
+        assert _names(await service.search(db, catalog.id, "translate", 10)) == ["translate-text"]
+
+        service.handle_event({"type": "tool_deleted", "data": {"id": tool.id}})
+        assert await service.search(db, catalog.id, "translate", 10) == []
+        assert service.get_stats()["rebuilds"] == 1
+
+    async def test_stale_index_rebuilds_in_background(self, service, db, catalog):
+        await service.search(db, catalog.id, "weather", 10)
+        service.mark_stale()
+        await service.search(db, catalog.id, "weather", 10)
+        await service._rebuild_task
+        stats = service.get_stats()
+        assert stats["rebuilds"] == 2
+        assert stats["stale"] is False
+
+
+class TestMetaTool:
+    async def test_stub_tools_threshold(self, service, db, catalog, monkeypatch):
+        assert _names(await service.stub_tools(db, catalog.id)) == [settings.tool_discovery_tool_name]
+        monkeypatch.setattr(settings, "tool_discovery_min_tools", 100)
+        assert await service.stub_tools(db, catalog.id) is None
+        monkeypatch.setattr(settings, "tool_discovery_min_tools", 0)
+        monkeypatch.setattr(settings, "tool_discovery_enabled", False)
+        assert await service.stub_tools(db, catalog.id) is None
+
+    async def test_invoke_returns_structured_results(self, service, db, catalog, monkeypatch):
+        monkeypatch.setattr(settings, "tool_discovery_max_k", 2)
+        result = await service.invoke(db, catalog.id, {"query": "weather", "k": 50})
+        assert not result.is_error
+        assert len(result.structured_content["tools"]) == 2
+        assert orjson.loads(result.content[0].text) == result.structured_content
+
+    @pytest.mark.parametrize("arguments", [None, {"query": "  "}, {"query": "x", "k": "many"}])
+    async def test_invoke_rejects_bad_arguments(self, service, db, catalog, arguments):
+        result = await service.invoke(db, catalog.id, arguments)
+        assert result.is_error
+
+    async def test_tool_service_routes_meta_tool(self, service, db, catalog, monkeypatch):
+        # First-Party
+        from mcpgateway.services.tool_service import ToolService
+
+        monkeypatch.setattr("mcpgateway.services.tool_service.get_tool_discovery_service", lambda: service)
+        result = await ToolService().invoke_tool(db, settings.tool_discovery_tool_name, {"query": "issue"}, server_id=catalog.id)
+        assert _names(result.structured_content["tools"]) == ["create-issue"]
+
+    def test_singleton(self):
+        assert get_tool_discovery_service() is get_tool_discovery_service()
@@ -1888,6 +1888,214 @@ class TestToolService:
 
         assert result.content[0].text == "Tool error encountered"
 
+    @pytest.mark.asyncio
+    async def test_invoke_tool_result_cache_hit_skips_upstream(self, tool_service, mock_tool, mock_global_config_obj, test_db):
+        """Read-only tools are served from the tool result cache on repeated calls."""
+        # First-Party
+        from mcpgateway.cache.tool_result_cache import ToolResultCache
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "GET"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_value = None
+        mock_tool.annotations = {"readOnlyHint": True}
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"result": "REST tool response"})
+        tool_service._http_client.get = AsyncMock(return_value=mock_response)
+
+        result_cache = ToolResultCache(enabled=True, l2_enabled=False)
+        hits_counter = Mock()
+        with (
+            patch("mcpgateway.services.tool_service._get_tool_result_cache", return_value=result_cache),
+            patch("mcpgateway.services.metrics.tool_result_cache_hits_counter", hits_counter),
+            patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=Mock()),
+        ):
+            first = await tool_service.invoke_tool(test_db, "test_tool", {"q": 1}, request_headers=None, user_email="alice@example.com", token_teams=["t1"])
+            second = await tool_service.invoke_tool(test_db, "test_tool", {"q": 1}, request_headers=None, user_email="alice@example.com", token_teams=["t1"])
+            # Different caller scope misses
+            await tool_service.invoke_tool(test_db, "test_tool", {"q": 1}, request_headers=None, user_email="bob@example.com", token_teams=["t1"])
+
+        assert tool_service._http_client.get.await_count == 2
+        assert second.model_dump(by_alias=True) == first.model_dump(by_alias=True)
+        hits_counter.labels.assert_called_once_with(tool_name="test_tool")
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_result_cache_hit_runs_plugin_hooks_and_ends_span(self, tool_service, mock_tool, mock_global_config_obj, test_db):
+        """Cache hits go through the pre/post-invoke hooks, are keyed on the hooked arguments and end their span."""
+        # First-Party
+        from mcpgateway.cache.tool_result_cache import ToolResultCache
+        from mcpgateway.plugins.framework import PluginResult, PluginViolationError, ToolHookType
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "GET"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_value = None
+        mock_tool.annotations = {"readOnlyHint": True}
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"result": "REST tool response"})
+        tool_service._http_client.get = AsyncMock(return_value=mock_response)
+
+        denied = {"deny": False}
+        post_calls = []
+
+        def invoke_hook_side_effect(hook_type, payload, global_context, local_contexts=None, **kwargs):
+            if hook_type == ToolHookType.TOOL_PRE_INVOKE:
+                if denied["deny"]:
+                    raise PluginViolationError("denied", violation=None)
+                # The plugin drops a per-call nonce, so calls that differ only by it share a cache entry
+                payload.args = {k: v for k, v in payload.args.items() if k != "nonce"}
+                return PluginResult(continue_processing=True, modified_payload=payload), None
+            post_calls.append(payload.result)
+            return PluginResult(continue_processing=True, modified_payload=None), None
+
+        tool_service._plugin_manager = Mock()
+        tool_service._plugin_manager.has_hooks_for = Mock(return_value=True)
+        tool_service._plugin_manager.invoke_hook = AsyncMock(side_effect=invoke_hook_side_effect)
+
+        observability = Mock()
+        observability.start_span.return_value = "span-1"
+        result_cache = ToolResultCache(enabled=True, l2_enabled=False)
+        with (
+            patch("mcpgateway.services.tool_service._get_tool_result_cache", return_value=result_cache),
+            patch("mcpgateway.services.tool_service.current_trace_id") as trace_ctx,
+            patch("mcpgateway.services.tool_service.ObservabilityService", return_value=observability),
+            patch("mcpgateway.services.tool_service.fresh_db_session"),
+            patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=Mock()),
+        ):
+            trace_ctx.get.return_value = "trace-1"
+            await tool_service.invoke_tool(test_db, "test_tool", {"q": 1, "nonce": "a"}, request_headers=None)
+            await tool_service.invoke_tool(test_db, "test_tool", {"q": 1, "nonce": "b"}, request_headers=None)
+            assert tool_service._http_client.get.await_count == 1
+            assert len(post_calls) == 2
+            assert observability.end_span.call_count == 2
+
+            denied["deny"] = True
+            with pytest.raises(PluginViolationError):
+                await tool_service.invoke_tool(test_db, "test_tool", {"q": 1}, request_headers=None)
+
+        assert tool_service._http_client.get.await_count == 1
+        assert observability.end_span.call_count == 3
+        assert result_cache.stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_result_cache_skips_errors_and_unannotated_tools(self, tool_service, mock_tool, mock_global_config_obj, test_db):
+        """Error results and tools without cache hints are never cached."""
+        # First-Party
+        from mcpgateway.cache.tool_result_cache import ToolResultCache
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "GET"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_value = None
+        mock_tool.annotations = {"readOnlyHint": True}
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 205
+        mock_response.json = Mock(return_value={})
+        tool_service._http_client.get = AsyncMock(return_value=mock_response)
+
+        result_cache = ToolResultCache(enabled=True, l2_enabled=False)
+        with (
+            patch("mcpgateway.services.tool_service._get_tool_result_cache", return_value=result_cache),
+            patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=Mock()),
+        ):
+            await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None)
+            assert result_cache.stats()["l1_size"] == 0
+
+            mock_tool.annotations = {}
+            tool_lookup_cache.invalidate_all_local()
+            mock_response.status_code = 200
+            await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None)
+            await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None)
+
+        assert tool_service._http_client.get.await_count == 3
+        assert result_cache.stats()["l1_size"] == 0
+        assert result_cache.stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_rate_limited(self, tool_service, mock_tool, mock_global_config_obj, test_db, monkeypatch):
+        """Calls over the per-caller limit are rejected before the upstream call."""
+        # First-Party
+        from mcpgateway.services.tool_service import ToolRateLimitError
+        from mcpgateway.utils.rate_limiter import RateLimiter
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "GET"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_value = None
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"result": "ok"})
+        tool_service._http_client.get = AsyncMock(return_value=mock_response)
+
+        monkeypatch.setattr("mcpgateway.services.tool_service.settings.tool_rate_limit_enabled", True)
+        monkeypatch.setattr("mcpgateway.services.tool_service.settings.tool_rate_limit", 1)
+        monkeypatch.setattr("mcpgateway.services.tool_service.settings.tool_rate_limit_per_team", 5)
+        limiter = RateLimiter(use_redis=False)
+        with (
+            patch("mcpgateway.services.tool_service.get_rate_limiter", return_value=limiter),
+            patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=Mock()),
+        ):
+            await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None, user_email="alice@example.com", token_teams=["t1"])
+            with pytest.raises(ToolRateLimitError, match="user") as exc_info:
+                await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None, user_email="alice@example.com", token_teams=["t1"])
+            # Other callers have their own bucket
+            await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None, user_email="bob@example.com", token_teams=["t1"])
+
+        assert tool_service._http_client.get.await_count == 2
+        assert exc_info.value.result.headers()["RateLimit-Limit"] == "1"
+        assert int(exc_info.value.result.headers()["Retry-After"]) == 60
+        # The rejected call was not charged to the team bucket
+        assert (await limiter.hit("team:t1", limit=5, period=60)).remaining == 2
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_rate_limited_per_token(self, tool_service, mock_tool, mock_global_config_obj, test_db, monkeypatch):
+        """Each API token of a user has its own caller bucket; calls without a token share the user's."""
+        # First-Party
+        from mcpgateway.services.tool_service import ToolRateLimitError
+        from mcpgateway.utils.rate_limiter import RateLimiter
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "GET"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_value = None
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"result": "ok"})
+        tool_service._http_client.get = AsyncMock(return_value=mock_response)
+
+        monkeypatch.setattr("mcpgateway.services.tool_service.settings.tool_rate_limit_enabled", True)
+        monkeypatch.setattr("mcpgateway.services.tool_service.settings.tool_rate_limit", 1)
+        monkeypatch.setattr("mcpgateway.services.tool_service.settings.tool_rate_limit_per_team", 0)
+        with (
+            patch("mcpgateway.services.tool_service.get_rate_limiter", return_value=RateLimiter(use_redis=False)),
+            patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=Mock()),
+        ):
+            for jti in ("token-a", "token-b", None):
+                await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None, user_email="alice@example.com", token_teams=[], token_jti=jti)
+            with pytest.raises(ToolRateLimitError, match="token"):
+                await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None, user_email="alice@example.com", token_teams=[], token_jti="token-a")
+            with pytest.raises(ToolRateLimitError, match="user"):
+                await tool_service.invoke_tool(test_db, "test_tool", {}, request_headers=None, user_email="alice@example.com", token_teams=[])
+
+        assert tool_service._http_client.get.await_count == 3
+
     @pytest.mark.asyncio
     async def test_invoke_tool_rest_post(self, tool_service, mock_tool, mock_global_config_obj, test_db):
         """Test invoking a REST tool."""
@@ -2558,8 +2766,8 @@ class TestToolService:
         # Reset all metrics
         await tool_service.reset_metrics(test_db)
 
-        # Verify DB operations (raw + hourly rollups)
-        assert test_db.execute.call_count == 2
+        # Verify DB operations (raw + hourly rollups + counters)
+        assert test_db.execute.call_count == 3
         test_db.commit.assert_called_once()
 
         # Reset metrics for specific tool
@@ -2568,8 +2776,8 @@ class TestToolService:
 
         await tool_service.reset_metrics(test_db, tool_id=1)
 
-        # Verify DB operations with tool_id (raw + hourly rollups)
-        assert test_db.execute.call_count == 2
+        # Verify DB operations with tool_id (raw + hourly rollups + counters)
+        assert test_db.execute.call_count == 3
         test_db.commit.assert_called_once()
 
     async def test_record_tool_metric(self, tool_service, mock_tool):
@@ -2886,19 +3094,19 @@ class TestToolService:
         tool_service.convert_tool_to_read = Mock(return_value=MagicMock())
 
         with patch("mcpgateway.services.tool_service.select", return_value=mock_query):
-            with patch("mcpgateway.services.tool_service.json_contains_tag_expr") as mock_json_contains:
+            with patch("mcpgateway.services.tool_service.entity_tag_expr") as mock_entity_tag_expr:
                 # return a fake condition object that query.where will accept
                 fake_condition = MagicMock()
-                mock_json_contains.return_value = fake_condition
+                mock_entity_tag_expr.return_value = fake_condition
 
                 result, _ = await tool_service.list_tools(session, tags=["test", "production"], include_inactive=True)
 
-                # json_contains_expr should be called once with the tags list
-                mock_json_contains.assert_called_once()
-                called_args = mock_json_contains.call_args[0]  # positional args tuple
-                assert called_args[0] is session  # session passed through
-                # third positional arg is the tags list (signature: session, col, values, match_any=True)
-                assert called_args[2] == ["test", "production"]
+                # entity_tag_expr should be called once with the tags list
+                mock_entity_tag_expr.assert_called_once()
+                called_args = mock_entity_tag_expr.call_args[0]  # positional args tuple
+                assert called_args[0].key == "tags"  # tags column passed through
+                # second positional arg is the tags list (signature: col, values, match_any=True)
+                assert called_args[1] == ["test", "production"]
                 # finally, your service should return the list produced by session.execute(...)
                 assert isinstance(result, list)
                 assert len(result) == 1
@@ -6094,6 +6302,7 @@ class TestInvokeToolDirectProxyViaHeader:
             mock_settings.tool_timeout = 60
             mock_settings.mcp_session_pool_enabled = False
             mock_settings.default_passthrough_headers = []
+            mock_settings.tool_rate_limit_enabled = False
 
             request_headers = {"x-context-forge-gateway-id": "gw-dp-1"}
 
@@ -6213,3 +6422,62 @@ class TestInvokeToolDirectProxyViaHeader:
                     {},
                     request_headers=request_headers,
                 )
+
+
+class TestAsyncDbHotPaths:
+    """Tool lookup and listing on the optional async engine (DB_ASYNC_ENABLED)."""
+
+    @staticmethod
+    def _async_session_patch(rows):
+        # Standard
+        from contextlib import asynccontextmanager
+
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = rows
+        async_session = MagicMock()
+        async_session.execute = AsyncMock(return_value=result)
+
+        @asynccontextmanager
+        async def _fresh_async_session():
+            yield async_session
+
+        return async_session, patch("mcpgateway.services.tool_service.fresh_async_db_session", _fresh_async_session)
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_lookup_uses_async_session(self, tool_service, mock_tool, test_db):
+        async_session, session_patch = self._async_session_patch([mock_tool])
+        test_db.execute = Mock(return_value=Mock(first=Mock(return_value=None)))
+
+        with session_patch, patch("mcpgateway.services.tool_service.async_db_available", return_value=True):
+            # Server membership check fails after the async lookup built the payload
+            with pytest.raises(ToolNotFoundError, match="Tool not found"):
+                await tool_service.invoke_tool(test_db, "test-gateway-test-tool", {}, server_id="srv-1")
+
+        async_session.execute.assert_awaited_once()
+        # Only the server-membership query ran on the sync session
+        assert test_db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invoke_tool_async_lookup_inactive(self, tool_service, mock_tool, test_db):
+        mock_tool.enabled = False
+        _, session_patch = self._async_session_patch([mock_tool])
+        test_db.execute = Mock(side_effect=AssertionError("sync session must not be used for the lookup"))
+
+        with session_patch, patch("mcpgateway.services.tool_service.async_db_available", return_value=True):
+            with pytest.raises(ToolNotFoundError, match="inactive"):
+                await tool_service.invoke_tool(test_db, "test-gateway-test-tool", {})
+
+    @pytest.mark.asyncio
+    async def test_list_tools_cursor_page_uses_async_session(self, tool_service, mock_tool, test_db):
+        async_session, session_patch = self._async_session_patch([mock_tool])
+        test_db.execute = Mock(side_effect=AssertionError("sync session must not be used for listing"))
+        test_db.commit = Mock()
+        tool_read = MagicMock()
+        tool_service.convert_tool_to_read = MagicMock(return_value=tool_read)
+
+        with session_patch, patch("mcpgateway.services.tool_service.async_db_available", return_value=True):
+            tools, next_cursor = await tool_service.list_tools(test_db, user_email="user@example.com", token_teams=[])
+
+        assert tools == [tool_read]
+        assert next_cursor is None
+        async_session.execute.assert_awaited_once()
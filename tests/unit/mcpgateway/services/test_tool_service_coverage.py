@@ -21,6 +21,7 @@ import pytest
 from sqlalchemy.exc import IntegrityError, OperationalError
 
 # First-Party
+from mcpgateway.cache.registry_cache import RegistryCache
 from mcpgateway.cache.global_config_cache import global_config_cache
 from mcpgateway.cache.tool_lookup_cache import tool_lookup_cache
 from mcpgateway.common.models import TextContent, ToolResult
@@ -1353,7 +1354,7 @@ class TestResetMetrics:
         """reset_metrics without tool_id should delete all metrics."""
         db = MagicMock()
         await tool_service.reset_metrics(db)
-        assert db.execute.call_count == 2
+        assert db.execute.call_count == 3
         db.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1361,7 +1362,7 @@ class TestResetMetrics:
         """reset_metrics with tool_id should delete only that tool's metrics."""
         db = MagicMock()
         await tool_service.reset_metrics(db, tool_id="tool-1")
-        assert db.execute.call_count == 2
+        assert db.execute.call_count == 3
         db.commit.assert_called_once()
 
 
@@ -3521,9 +3522,7 @@ class TestListToolsBranches:
         db.commit = MagicMock()
 
         with patch("mcpgateway.services.tool_service._get_registry_cache") as mock_cache_fn, patch("mcpgateway.services.tool_service.unified_paginate", AsyncMock(return_value=([], None))):
-            mock_cache = AsyncMock()
-            mock_cache.hash_filters = MagicMock(return_value=None)
-            mock_cache_fn.return_value = mock_cache
+            mock_cache_fn.return_value = RegistryCache()
 
             result = await tool_service.list_tools(db, user_email="user@test.com", token_teams=["team-1"], team_id="team-1", visibility="team")
         tools, _ = result
@@ -3539,10 +3538,7 @@ class TestListToolsBranches:
             patch("mcpgateway.services.tool_service._get_registry_cache") as mock_cache_fn,
             patch("mcpgateway.services.tool_service.unified_paginate", AsyncMock(return_value=([], None))),
         ):
-            mock_cache = AsyncMock()
-            mock_cache.hash_filters = MagicMock(return_value=None)
-            mock_cache.get = AsyncMock(return_value=None)
-            mock_cache_fn.return_value = mock_cache
+            mock_cache_fn.return_value = RegistryCache()
 
             tools, _ = await tool_service.list_tools(
                 db,
@@ -3560,14 +3556,90 @@ class TestListToolsBranches:
         db.commit = MagicMock()
 
         with patch("mcpgateway.services.tool_service._get_registry_cache") as mock_cache_fn, patch("mcpgateway.services.tool_service.unified_paginate", AsyncMock(return_value=([], None))):
-            mock_cache = AsyncMock()
-            mock_cache.hash_filters = MagicMock(return_value=None)
-            mock_cache_fn.return_value = mock_cache
+            mock_cache_fn.return_value = RegistryCache()
 
             result = await tool_service.list_tools(db, user_email=None, token_teams=[])
         tools, _ = result
         assert tools == []
 
+    @pytest.mark.asyncio
+    async def test_scoped_cache_entry_masked_per_requester(self, tool_service):
+        """Shared team-scoped entries hold masked headers; allowed requesters get the values from the database."""
+        tool_dict = {
+            "id": "t1",
+            "name": "test_tool",
+            "original_name": "test",
+            "custom_name": "test",
+            "custom_name_slug": "test",
+            "displayName": "Test",
+            "url": "http://x.com",
+            "description": "d",
+            "original_description": "od",
+            "integration_type": "REST",
+            "request_type": "GET",
+            "headers": {"X-Api-Key": settings.masked_auth_value},
+            "input_schema": {},
+            "annotations": {},
+            "enabled": True,
+            "reachable": True,
+            "gateway_id": None,
+            "gateway_slug": "test-gw",
+            "visibility": "team",
+            "team_id": "team-1",
+            "owner_email": "owner@test.com",
+            "tags": [],
+            "jsonpath_filter": None,
+            "auth": None,
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:00Z",
+        }
+        shared = ToolRead.model_validate(tool_dict)
+
+        with patch("mcpgateway.services.tool_service._get_registry_cache") as mock_cache_fn:
+            mock_cache = MagicMock()
+            mock_cache.list_scoped = AsyncMock(return_value=([shared], None))
+            mock_cache_fn.return_value = mock_cache
+
+            member_db = MagicMock()
+            member_tools, _ = await tool_service.list_tools(
+                member_db, user_email="member@test.com", token_teams=["team-1"], requesting_user_email="member@test.com", requesting_user_team_roles={"team-1": "member"}
+            )
+            owner_db = MagicMock()
+            owner_db.execute.return_value.all.return_value = [("t1", {"X-Api-Key": "secret"})]
+            owner_tools, _ = await tool_service.list_tools(
+                owner_db, user_email="owner@test.com", token_teams=["team-1"], requesting_user_email="owner@test.com", requesting_user_team_roles={"team-1": "member"}
+            )
+
+        assert member_tools[0].headers == {"X-Api-Key": settings.masked_auth_value}
+        member_db.execute.assert_not_called()
+        assert owner_tools[0].headers == {"X-Api-Key": "secret"}
+        assert shared.headers == {"X-Api-Key": settings.masked_auth_value}
+
+    @pytest.mark.asyncio
+    async def test_scoped_cache_parts_never_hold_header_values(self, tool_service):
+        """Tools stored in the shared scoped cache have their header values masked."""
+        db_tool = MagicMock(id="t1", headers={"X-Api-Key": "secret"})
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = []
+        stored = {}
+
+        async def list_scoped(cache_type, model, fetch, team_ids, owner_email=None, limit=None, **filters):
+            stored["items"], _ = await fetch(False)
+            return stored["items"], None
+
+        unmasked = MagicMock(headers={"X-Api-Key": "secret"})
+        unmasked.model_copy = lambda update: MagicMock(headers=update["headers"])
+        with (
+            patch("mcpgateway.services.tool_service._get_registry_cache") as mock_cache_fn,
+            patch("mcpgateway.services.tool_service.unified_paginate", AsyncMock(return_value=([db_tool], None))),
+            patch.object(ToolService, "convert_tool_to_read", lambda self, *args, **kwargs: unmasked),
+            patch.object(tool_service, "_can_view_tool_headers", return_value=False),
+        ):
+            mock_cache_fn.return_value = MagicMock(list_scoped=list_scoped)
+            await tool_service.list_tools(db, user_email="member@test.com", token_teams=["team-1"], requesting_user_email="member@test.com")
+
+        assert stored["items"][0].headers == {"X-Api-Key": settings.masked_auth_value}
+
     @pytest.mark.asyncio
     async def test_cache_set_on_first_page(self, tool_service):
         """First page results are cached for non-user queries."""
@@ -3610,7 +3682,7 @@ class TestListToolsBranches:
             patch("mcpgateway.services.tool_service._get_registry_cache") as mock_cache_fn,
             patch("mcpgateway.services.tool_service.unified_paginate", AsyncMock(return_value=([], None))),
         ):
-            mock_cache_fn.return_value = AsyncMock()
+            mock_cache_fn.return_value = RegistryCache()
             tools, _ = await tool_service.list_tools(db, user_email="")
 
         assert tools == []
@@ -3743,7 +3815,7 @@ class TestListToolsForUserBranches:
         db.execute = MagicMock(return_value=MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))))
         db.commit = MagicMock()
 
-        with patch("mcpgateway.services.tool_service.TeamManagementService") as mock_tms, patch("mcpgateway.services.tool_service.json_contains_tag_expr", return_value=literal(True)):
+        with patch("mcpgateway.services.tool_service.TeamManagementService") as mock_tms, patch("mcpgateway.services.tool_service.entity_tag_expr", return_value=literal(True)):
             mock_svc = MagicMock()
             mock_team = MagicMock()
             mock_team.id = "t1"
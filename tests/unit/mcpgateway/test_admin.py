@@ -198,6 +198,8 @@ from mcpgateway.admin import (  # admin_get_metrics,
     get_observability_query,
     get_observability_stats,
     get_observability_trace_detail,
+    get_permission_cache_stats,
+    get_resource_content_cache_stats,
     get_observability_traces,
     get_overview_partial,
     get_passthrough_headers_cache_stats,
@@ -237,6 +239,8 @@ from mcpgateway.admin import (  # admin_get_metrics,
     get_user_id,
     invalidate_a2a_stats_cache,
     invalidate_passthrough_headers_cache,
+    invalidate_permission_cache,
+    invalidate_resource_content_cache,
     list_catalog_servers,
     list_observability_queries,
     list_plugins,
@@ -7974,7 +7978,7 @@ async def test_admin_servers_partial_html_propagates_search_and_tags_to_paginati
     pagination = make_pagination_meta()
     paginate_mock = AsyncMock(return_value={"data": [], "pagination": pagination, "links": None})
     monkeypatch.setattr("mcpgateway.admin.paginate_query", paginate_mock)
-    monkeypatch.setattr("mcpgateway.admin.json_contains_tag_expr", lambda *_args, **_kwargs: sa.true())
+    monkeypatch.setattr("mcpgateway.admin.entity_tag_expr", lambda *_args, **_kwargs: sa.true())
     setup_team_service(monkeypatch, ["team-1"])
 
     mock_request.headers = {}
@@ -8062,7 +8066,7 @@ async def test_admin_tools_partial_html_propagates_search_and_tags_to_pagination
     pagination = make_pagination_meta()
     paginate_mock = AsyncMock(return_value={"data": [], "pagination": pagination, "links": None})
     monkeypatch.setattr("mcpgateway.admin.paginate_query", paginate_mock)
-    monkeypatch.setattr("mcpgateway.admin.json_contains_tag_expr", lambda *_args, **_kwargs: sa.true())
+    monkeypatch.setattr("mcpgateway.admin.entity_tag_expr", lambda *_args, **_kwargs: sa.true())
     setup_team_service(monkeypatch, ["team-1"])
 
     mock_request.headers = {}
@@ -8311,7 +8315,7 @@ async def test_admin_prompts_partial_html_propagates_search_and_tags_to_paginati
     pagination = make_pagination_meta()
     paginate_mock = AsyncMock(return_value={"data": [], "pagination": pagination, "links": None})
     monkeypatch.setattr("mcpgateway.admin.paginate_query", paginate_mock)
-    monkeypatch.setattr("mcpgateway.admin.json_contains_tag_expr", lambda *_args, **_kwargs: sa.true())
+    monkeypatch.setattr("mcpgateway.admin.entity_tag_expr", lambda *_args, **_kwargs: sa.true())
     setup_team_service(monkeypatch, ["team-1"])
 
     mock_request.headers = {}
@@ -8457,7 +8461,7 @@ async def test_admin_resources_partial_html_propagates_search_and_tags_to_pagina
     pagination = make_pagination_meta()
     paginate_mock = AsyncMock(return_value={"data": [], "pagination": pagination, "links": None})
     monkeypatch.setattr("mcpgateway.admin.paginate_query", paginate_mock)
-    monkeypatch.setattr("mcpgateway.admin.json_contains_tag_expr", lambda *_args, **_kwargs: sa.true())
+    monkeypatch.setattr("mcpgateway.admin.entity_tag_expr", lambda *_args, **_kwargs: sa.true())
     setup_team_service(monkeypatch, ["team-1"])
 
     mock_request.headers = {}
@@ -8517,7 +8521,7 @@ async def test_admin_gateways_partial_html_propagates_search_and_tags_to_paginat
     pagination = make_pagination_meta()
     paginate_mock = AsyncMock(return_value={"data": [], "pagination": pagination, "links": None})
     monkeypatch.setattr("mcpgateway.admin.paginate_query", paginate_mock)
-    monkeypatch.setattr("mcpgateway.admin.json_contains_tag_expr", lambda *_args, **_kwargs: sa.true())
+    monkeypatch.setattr("mcpgateway.admin.entity_tag_expr", lambda *_args, **_kwargs: sa.true())
     setup_team_service(monkeypatch, ["team-1"])
 
     mock_request.headers = {}
@@ -8711,7 +8715,7 @@ async def test_admin_a2a_partial_html_propagates_search_and_tags_to_pagination(m
     pagination = make_pagination_meta()
     paginate_mock = AsyncMock(return_value={"data": [], "pagination": pagination, "links": None})
     monkeypatch.setattr("mcpgateway.admin.paginate_query", paginate_mock)
-    monkeypatch.setattr("mcpgateway.admin.json_contains_tag_expr", lambda *_args, **_kwargs: sa.true())
+    monkeypatch.setattr("mcpgateway.admin.entity_tag_expr", lambda *_args, **_kwargs: sa.true())
     setup_team_service(monkeypatch, ["team-1"])
 
     mock_request.headers = {}
@@ -9303,7 +9307,7 @@ def test_parse_tag_filter_groups_respects_max_terms_per_group():
     assert len(result[0]) == 10
 
 
-def test_apply_tag_filter_groups_builds_where_clauses(monkeypatch, mock_db):
+def test_apply_tag_filter_groups_builds_where_clauses(monkeypatch):
     # Third-Party
     import sqlalchemy as sa
 
@@ -9312,24 +9316,24 @@ def test_apply_tag_filter_groups_builds_where_clauses(monkeypatch, mock_db):
 
     calls: list[dict[str, object]] = []
 
-    def fake_json_contains_tag_expr(_db, _column, group, *, match_any: bool = True):  # noqa: ANN001
+    def fake_entity_tag_expr(_column, group, *, match_any: bool = True):  # noqa: ANN001
         calls.append({"group": list(group), "match_any": match_any})
-        # Use a deterministic boolean expression regardless of session/dialect.
+        # Use a deterministic boolean expression regardless of the tagged model.
         return sa.true() if match_any else sa.false()
 
-    monkeypatch.setattr(admin_module, "json_contains_tag_expr", fake_json_contains_tag_expr)
+    monkeypatch.setattr(admin_module, "entity_tag_expr", fake_entity_tag_expr)
 
     base_query = sa.select(sa.literal(1))
     tags_col = sa.column("tags")
 
-    assert admin_module._apply_tag_filter_groups(base_query, mock_db, tags_col, []) is base_query
+    assert admin_module._apply_tag_filter_groups(base_query, tags_col, []) is base_query
 
-    result_single = admin_module._apply_tag_filter_groups(base_query, mock_db, tags_col, [["alpha"]])
+    result_single = admin_module._apply_tag_filter_groups(base_query, tags_col, [["alpha"]])
     assert result_single is not base_query
     assert calls == [{"group": ["alpha"], "match_any": True}]
 
     calls.clear()
-    result_multi = admin_module._apply_tag_filter_groups(base_query, mock_db, tags_col, [["a"], ["b", "c"]])
+    result_multi = admin_module._apply_tag_filter_groups(base_query, tags_col, [["a"], ["b", "c"]])
     assert result_multi is not base_query
     assert calls == [{"group": ["a"], "match_any": True}, {"group": ["b", "c"], "match_any": False}]
 
@@ -10319,6 +10323,33 @@ async def test_cache_invalidation_endpoints(monkeypatch, mock_db, allow_permissi
     stats = await _unwrap(get_a2a_stats_cache_stats)(_user={"email": "user@example.com", "db": mock_db})
     assert stats["hits"] == 2
 
+    perm_cache = MagicMock()
+    perm_cache.invalidate_all = AsyncMock()
+    perm_cache.stats.return_value = {"l1_hit_count": 3}
+    monkeypatch.setattr("mcpgateway.admin.permission_cache", perm_cache)
+
+    result = await _unwrap(invalidate_permission_cache)(_user={"email": "user@example.com", "db": mock_db})
+    assert result["status"] == "invalidated"
+    assert result["cache_stats"]["l1_hit_count"] == 3
+    perm_cache.invalidate_all.assert_awaited_once()
+
+    stats = await _unwrap(get_permission_cache_stats)(_user={"email": "user@example.com", "db": mock_db})
+    assert stats["l1_hit_count"] == 3
+
+    content_cache = MagicMock()
+    content_cache.invalidate_shared = AsyncMock()
+    content_cache.stats.return_value = {"hit_rate": 0.5, "bytes": 128}
+    monkeypatch.setattr("mcpgateway.admin.resource_cache", content_cache)
+
+    result = await _unwrap(invalidate_resource_content_cache)(_user={"email": "user@example.com", "db": mock_db})
+    assert result["status"] == "invalidated"
+    assert result["cache_stats"]["bytes"] == 128
+    content_cache.invalidate_shared.assert_awaited_once_with()
+
+    stats = await _unwrap(get_resource_content_cache_stats)(_user={"email": "user@example.com", "db": mock_db})
+    assert stats["hit_rate"] == 0.5
+    assert stats["enabled"] is settings.resource_cache_enabled
+
 
 @pytest.mark.asyncio
 async def test_get_mcp_session_pool_metrics_paths(monkeypatch, mock_db, allow_permission):
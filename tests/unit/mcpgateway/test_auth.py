@@ -3008,3 +3008,63 @@ class TestSessionTokenBranches:
 
         assert user.email == "user@example.com"
         mock_cache.set_user_teams.assert_called_once()
+
+
+class TestBatchedAuthContextAsync:
+    """_get_auth_context_batched_async against a real SQLite file via the async engine."""
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_lookup(self, tmp_path, monkeypatch):
+        pytest.importorskip("aiosqlite")
+        # Standard
+        from contextlib import contextmanager
+
+        # Third-Party
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        # First-Party
+        import mcpgateway.db as db_mod
+        from mcpgateway.auth import _get_auth_context_batched_async, _get_auth_context_batched_sync
+
+        db_file = tmp_path / "auth.db"
+        engine = create_engine(f"sqlite:///{db_file}")
+        db_mod.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(db_mod.EmailUser(email="user@example.com", password_hash="h", full_name="U"))
+            session.flush()
+            team = db_mod.EmailTeam(name="Personal", slug="personal-user", created_by="user@example.com", is_personal=True)
+            session.add(team)
+            session.flush()
+            session.add(db_mod.EmailTeamMember(team_id=team.id, user_email="user@example.com", role="owner"))
+            session.add(db_mod.TokenRevocation(jti="revoked-jti", revoked_by="admin@example.com"))
+            session.commit()
+            team_id = team.id
+
+        monkeypatch.setattr(settings, "db_async_enabled", True)
+        monkeypatch.setattr(settings, "db_async_url", f"sqlite+aiosqlite:///{db_file}")
+        monkeypatch.setattr(db_mod, "_async_session_factory", None)
+        monkeypatch.setattr(db_mod, "_async_engine_unavailable", False)
+
+        @contextmanager
+        def _session_ctx():
+            with Session(engine) as session:
+                yield session
+
+        monkeypatch.setattr("mcpgateway.auth.fresh_db_session", _session_ctx)
+
+        try:
+            async_ctx = await _get_auth_context_batched_async("user@example.com", "revoked-jti")
+            missing_ctx = await _get_auth_context_batched_async("nobody@example.com", "other-jti")
+        finally:
+            await db_mod.dispose_async_engine()
+            engine.dispose()
+
+        assert async_ctx["user"]["email"] == "user@example.com"
+        assert async_ctx["personal_team_id"] == team_id
+        assert async_ctx["team_ids"] == [team_id]
+        assert async_ctx["is_token_revoked"] is True
+        assert missing_ctx == {"user": None, "personal_team_id": None, "is_token_revoked": False, "team_ids": []}
+
+        sync_ctx = _get_auth_context_batched_sync("user@example.com", "revoked-jti")
+        assert {k: v for k, v in sync_ctx.items() if k != "user"} == {k: v for k, v in async_ctx.items() if k != "user"}
@@ -1201,7 +1201,7 @@ class TestMain:
                     mock_files.return_value.joinpath.return_value = "alembic.ini"
 
                     with patch("mcpgateway.bootstrap_db.Config", return_value=mock_config):
-                        with patch("mcpgateway.bootstrap_db.Base") as mock_base:
+                        with patch("mcpgateway.bootstrap_db.Base") as mock_base, patch("mcpgateway.bootstrap_db.create_search_index") as mock_search_index:
                             with patch("mcpgateway.bootstrap_db.command") as mock_command:
                                 with patch("mcpgateway.bootstrap_db.normalize_team_visibility", return_value=0):
                                     with patch("mcpgateway.bootstrap_db.bootstrap_admin_user", new=AsyncMock()):
@@ -1212,6 +1212,7 @@ class TestMain:
                                                         await main()
 
                                                         mock_base.metadata.create_all.assert_called_once_with(bind=mock_conn)
+                                                        mock_search_index.assert_called_once_with(mock_conn)
                                                         mock_command.stamp.assert_called_once_with(mock_config, "head")
                                                         mock_command.upgrade.assert_not_called()
                                                         mock_logger.info.assert_any_call("Empty DB detected - creating baseline schema")
@@ -1242,7 +1243,7 @@ class TestMain:
                     mock_files.return_value.joinpath.return_value = "alembic.ini"
 
                     with patch("mcpgateway.bootstrap_db.Config", return_value=mock_config):
-                        with patch("mcpgateway.bootstrap_db.Base") as mock_base:
+                        with patch("mcpgateway.bootstrap_db.Base") as mock_base, patch("mcpgateway.bootstrap_db.create_search_index") as mock_search_index:
                             with patch("mcpgateway.bootstrap_db.command") as mock_command:
                                 with patch("mcpgateway.bootstrap_db.normalize_team_visibility", return_value=0):
                                     with patch("mcpgateway.bootstrap_db.bootstrap_admin_user", new=AsyncMock()):
@@ -1257,6 +1258,7 @@ class TestMain:
                                                                 assert mock_mod.called
                                                                 mock_logger.info.assert_any_call("Applied MariaDB compatibility modifications")
                                                                 mock_base.metadata.create_all.assert_called_once_with(bind=mock_conn)
+                                                                mock_search_index.assert_called_once_with(mock_conn)
                                                                 mock_command.stamp.assert_called_once_with(mock_config, "head")
 
     @pytest.mark.asyncio
@@ -1493,7 +1495,7 @@ class TestMain:
                     mock_files.return_value.joinpath.return_value = "alembic.ini"
 
                     with patch("mcpgateway.bootstrap_db.Config", return_value=mock_config):
-                        with patch("mcpgateway.bootstrap_db.Base"):
+                        with patch("mcpgateway.bootstrap_db.Base"), patch("mcpgateway.bootstrap_db.create_search_index"):
                             with patch("mcpgateway.bootstrap_db.command"):
                                 with patch("mcpgateway.bootstrap_db.normalize_team_visibility", return_value=0):
                                     with patch("mcpgateway.bootstrap_db.bootstrap_admin_user", new=AsyncMock()) as mock_admin:
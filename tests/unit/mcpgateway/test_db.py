@@ -2271,7 +2271,6 @@ def test_db_module_observability_instrumentation_importerror(monkeypatch, caplog
 
 # --- Additional coverage for remaining missing statements in mcpgateway/db.py ---
 def test_set_sqlite_pragma_executes_expected_pragmas(monkeypatch):
-    # Only defined when backend == "sqlite"
     assert db.backend == "sqlite"
 
     monkeypatch.setattr(db.settings, "db_sqlite_busy_timeout", 1234)
@@ -2583,3 +2582,231 @@ def test_slug_listeners_gateway_a2a_agent_email_team(monkeypatch):
     team = Target("Team Name")
     db.set_email_team_slug(None, None, team)
     assert team.slug == "team-name"
+
+
+# --- Optional async engine ---
+@pytest.fixture
+def async_db_file(tmp_path, monkeypatch):
+    """Enable the async engine against a temporary SQLite file with the full schema."""
+    pytest.importorskip("aiosqlite")
+    # Third-Party
+    from sqlalchemy import create_engine
+
+    db_file = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{db_file}")
+    db.Base.metadata.create_all(sync_engine)
+    monkeypatch.setattr(db.settings, "db_async_enabled", True)
+    monkeypatch.setattr(db.settings, "db_async_url", f"sqlite+aiosqlite:///{db_file}")
+    monkeypatch.setattr(db, "_async_engine", None)
+    monkeypatch.setattr(db, "_async_session_factory", None)
+    monkeypatch.setattr(db, "_async_engine_unavailable", False)
+    yield sync_engine
+    sync_engine.dispose()
+
+
+def test_build_async_database_url_variants():
+    assert db.build_async_database_url("sqlite:///./mcp.db") == "sqlite+aiosqlite:///./mcp.db"
+    assert db.build_async_database_url("postgresql://u:p@h/d") == "postgresql+asyncpg://u:p@h/d"
+    assert db.build_async_database_url("sqlite://") is None
+    assert db.build_async_database_url("mariadb+mariadbconnector://u:p@h/d") is None
+
+
+def test_build_async_engine_sqlite_pragmas_follow_async_url(monkeypatch, tmp_path):
+    pytest.importorskip("aiosqlite")
+    # Third-Party
+    from sqlalchemy import event
+
+    # The sync engine may use another database: the pragmas depend on the async URL alone
+    monkeypatch.setattr(db, "backend", "postgresql")
+    async_engine = db.build_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    try:
+        assert event.contains(async_engine.sync_engine, "connect", db.set_sqlite_pragma)
+    finally:
+        async_engine.sync_engine.dispose()
+
+
+def test_get_async_session_factory_missing_driver_falls_back(monkeypatch):
+    monkeypatch.setattr(db.settings, "db_async_enabled", True)
+    monkeypatch.setattr(db.settings, "db_async_url", "postgresql+asyncpg://u:p@h/d")
+    monkeypatch.setattr(db, "_async_session_factory", None)
+    monkeypatch.setattr(db, "_async_engine_unavailable", False)
+    with patch("mcpgateway.db.importlib.util.find_spec", return_value=None):
+        assert db.get_async_session_factory() is None
+    assert db._async_engine_unavailable is True
+    assert db.async_db_available() is False
+
+
+def test_get_async_session_factory_unsupported_backend(monkeypatch):
+    monkeypatch.setattr(db.settings, "db_async_enabled", True)
+    monkeypatch.setattr(db.settings, "db_async_url", None)
+    monkeypatch.setattr(db.settings, "database_url", "sqlite:///:memory:")
+    monkeypatch.setattr(db, "_async_session_factory", None)
+    monkeypatch.setattr(db, "_async_engine_unavailable", False)
+    assert db.get_async_session_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_fresh_async_db_session_reads_sync_writes(async_db_file):
+    # Third-Party
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session
+
+    with Session(async_db_file) as session:
+        session.add(db.Tool(original_name="async_tool", custom_name="async_tool", input_schema={"type": "object"}))
+        session.commit()
+
+    assert db.async_db_available() is True
+    try:
+        async with db.fresh_async_db_session() as session:
+            names = (await session.execute(select(db.Tool._computed_name))).scalars().all()
+        assert names == ["async-tool"]
+
+        with pytest.raises(ValueError):
+            async with db.fresh_async_db_session():
+                raise ValueError("boom")
+    finally:
+        await db.dispose_async_engine()
+    assert db._async_session_factory is None
+
+
+@pytest.mark.asyncio
+async def test_fresh_async_db_session_requires_enabled_engine(monkeypatch):
+    monkeypatch.setattr(db.settings, "db_async_enabled", False)
+    with pytest.raises(RuntimeError):
+        async with db.fresh_async_db_session():
+            pass
+
+
+def test_asyncpg_server_settings_ignores_other_flags():
+    assert db._asyncpg_server_settings("-c search_path=a --other -cfoo") == {"search_path": "a"}
+
+
+# --- Entity metric counters ---
+@pytest.fixture
+def counter_db():
+    # Third-Party
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    engine = create_engine("sqlite://")
+    db.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for tool_id in ("t1", "t2"):
+            session.add(db.Tool(id=tool_id, name=tool_id, original_name=tool_id, custom_name=tool_id, custom_name_slug=tool_id, input_schema={}))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _counter(session, entity_id, entity_type="tools"):
+    return session.get(db.EntityMetricCounter, (entity_type, entity_id), populate_existing=True)
+
+
+def test_metric_counter_follows_orm_inserts(counter_db):
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    counter_db.add_all(
+        [
+            db.ToolMetric(tool_id="t1", timestamp=now, response_time=0.5, is_success=True),
+            db.ToolMetric(tool_id="t1", timestamp=now + timedelta(seconds=5), response_time=0.1, is_success=False),
+            db.ToolMetric(tool_id="t2", timestamp=now, response_time=1.0, is_success=True),
+        ]
+    )
+    counter_db.commit()
+
+    counter = _counter(counter_db, "t1")
+    assert (counter.total_count, counter.success_count, counter.min_response_time, counter.max_response_time) == (2, 1, 0.1, 0.5)
+    assert counter.sum_response_time == pytest.approx(0.6)
+    assert counter.last_execution_time.replace(tzinfo=timezone.utc) == now + timedelta(seconds=5)
+    assert _counter(counter_db, "t2").total_count == 1
+
+
+def test_apply_metric_counter_deltas_update_then_insert_fallback(counter_db):
+    """Dialects without ON CONFLICT update existing counters and insert new ones."""
+    now = datetime(2025, 1, 1)
+    db.apply_metric_counter_deltas(counter_db, db.metric_counter_deltas("tools", [("t1", now, 0.4, True)]))
+
+    class OtherDialect:
+        dialect = MagicMock()
+        dialect.name = "mysql"
+        execute = staticmethod(counter_db.execute)
+
+    db.apply_metric_counter_deltas(OtherDialect(), db.metric_counter_deltas("tools", [("t1", now + timedelta(hours=1), 0.2, False), ("t2", now, 0.3, True)]))
+
+    counter = _counter(counter_db, "t1")
+    assert (counter.total_count, counter.success_count, counter.min_response_time, counter.max_response_time) == (2, 1, 0.2, 0.4)
+    assert counter.last_execution_time == now + timedelta(hours=1)
+    assert _counter(counter_db, "t2").total_count == 1
+
+
+def test_metrics_summary_prefers_loaded_counter(counter_db):
+    # Third-Party
+    from sqlalchemy import select
+    from sqlalchemy.orm import joinedload
+
+    counter_db.add(db.ToolMetric(tool_id="t1", response_time=0.5, is_success=True))
+    counter_db.commit()
+    # Raw rows deleted by retention cleanup: the counter keeps the lifetime totals
+    counter_db.execute(db.ToolMetric.__table__.delete())
+    counter_db.commit()
+    counter_db.expunge_all()
+
+    tools = {t.id: t for t in counter_db.execute(select(db.Tool).options(joinedload(db.Tool.metric_counter))).scalars()}
+    assert tools["t1"].metrics_summary["total_executions"] == 1
+    assert tools["t1"].metrics_summary["avg_response_time"] == 0.5
+    assert tools["t2"].metrics_summary == db.metric_counter_summary(None)
+    assert db.loaded_metrics_summary(MagicMock()) is None
+
+
+def test_metric_counters_removed_with_entities_and_on_reset(counter_db):
+    # Third-Party
+    from sqlalchemy import delete
+
+    counter_db.add_all([db.ToolMetric(tool_id="t1", response_time=0.5, is_success=True), db.ToolMetric(tool_id="t2", response_time=0.5, is_success=True)])
+    counter_db.commit()
+
+    db.reset_metric_counters(counter_db, "tools", "t1")
+    counter_db.commit()
+    assert _counter(counter_db, "t1") is None
+    assert _counter(counter_db, "t2") is not None
+
+    counter_db.execute(delete(db.ToolMetric))
+    counter_db.execute(delete(db.Tool).where(db.Tool.id == "t2"))
+    counter_db.commit()
+    assert _counter(counter_db, "t2") is None
+
+
+def test_bulk_delete_clears_every_index_table_with_one_id_lookup(counter_db):
+    # Third-Party
+    from sqlalchemy import delete, event, func, select
+
+    for tool in counter_db.execute(select(db.Tool)).scalars():
+        tool.tags = ["api"]
+    counter_db.add_all([db.ToolMetric(tool_id=tool_id, response_time=0.5, is_success=True) for tool_id in ("t1", "t2")])
+    counter_db.commit()
+    counter_db.execute(delete(db.ToolMetric))
+
+    statements = []
+    engine = counter_db.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731 - (conn, cursor, statement, ...)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        counter_db.execute(delete(db.Tool).where(db.Tool.id == "t1"))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    counter_db.commit()
+
+    # One ID lookup per bulk delete serves both index tables (counted per registered listener: reloads of the module add more)
+    id_lookups = sum(statement.startswith("SELECT tools.id") for statement in statements)
+    assert id_lookups >= 1
+    assert sum(statement.startswith("DELETE FROM entity_tags") for statement in statements) == id_lookups
+    assert sum(statement.startswith("DELETE FROM entity_metric_counters") for statement in statements) == id_lookups
+    assert _counter(counter_db, "t1") is None
+    assert _counter(counter_db, "t2") is not None
+    tags = counter_db.execute(select(db.EntityTag.entity_id, func.count()).group_by(db.EntityTag.entity_id)).all()
+    assert tags == [("t2", 1)]
+
+    # ORM deletes clear both tables through the mapper event
+    counter_db.delete(counter_db.get(db.Tool, "t2"))
+    counter_db.commit()
+    assert _counter(counter_db, "t2") is None
+    assert counter_db.execute(select(func.count()).select_from(db.EntityTag)).scalar() == 0
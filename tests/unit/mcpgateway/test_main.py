@@ -1551,6 +1551,7 @@ class TestRPCEndpoints:
             plugin_context_table=None,
             plugin_global_context=ANY,
             meta_data=None,
+            token_jti=ANY,
         )
 
     @patch("mcpgateway.main.prompt_service.get_prompt")
@@ -1626,6 +1627,21 @@ class TestRPCEndpoints:
         assert body["result"]["tools"][0]["name"] == "test_tool"
         mock_list_tools.assert_called_once()
 
+    @patch("mcpgateway.main.tool_service.list_server_tools", new_callable=AsyncMock)
+    def test_rpc_list_tools_with_server_id_uses_discovery_stub(self, mock_list_tools, test_client, auth_headers):
+        """Large servers list only the discovery meta-tool when discovery is enabled."""
+        stub = [{"name": "search_tools", "description": "Search", "inputSchema": {"type": "object"}}]
+        discovery = MagicMock()
+        discovery.stub_tools = AsyncMock(return_value=stub)
+
+        req = {"jsonrpc": "2.0", "id": "test-id", "method": "tools/list", "params": {"server_id": "server-1"}}
+        with patch("mcpgateway.main.get_tool_discovery_service", return_value=discovery):
+            response = test_client.post("/rpc/", json=req, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["result"]["tools"] == stub
+        mock_list_tools.assert_not_called()
+
     @patch("mcpgateway.main.tool_service.list_tools")
     def test_rpc_legacy_list_tools_next_cursor(self, mock_list_tools, test_client, auth_headers):
         """Test legacy list_tools JSON-RPC method with nextCursor."""
@@ -1840,6 +1856,104 @@ class TestRPCEndpoints:
         assert "error" in body
         assert body["error"]["code"] == -32601  # Method not found (Tool not found)
 
+    @patch("mcpgateway.main.tool_service.invoke_tool", new_callable=AsyncMock)
+    def test_rpc_tools_call_rate_limited(self, mock_invoke, test_client, auth_headers):
+        """Test tools/call over a rate limit returns 429 with RateLimit headers."""
+        # First-Party
+        from mcpgateway.services.tool_service import ToolRateLimitError
+        from mcpgateway.utils.rate_limiter import RateLimitResult
+
+        mock_invoke.side_effect = ToolRateLimitError("Rate limit exceeded for user", RateLimitResult(allowed=False, limit=10, remaining=0, retry_after=2.5, reset_after=60))
+
+        req = {"jsonrpc": "2.0", "id": "test-id", "method": "tools/call", "params": {"name": "test_tool", "arguments": {}}}
+        response = test_client.post("/rpc/", json=req, headers=auth_headers)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "3"
+        assert response.headers["RateLimit-Limit"] == "10"
+        assert response.headers["RateLimit-Remaining"] == "0"
+        body = response.json()
+        assert body["id"] == "test-id"
+        assert body["error"]["data"] == {"retryAfter": 3}
+
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_dispatch_rpc_message_uses_connection_auth_state(self, mock_invoke_tool, test_client):
+        """Test in-process dispatch runs the /rpc handlers with the auth state of the connection."""
+        # First-Party
+        from mcpgateway.main import dispatch_rpc_message
+
+        mock_invoke_tool.return_value = {"content": [{"type": "text", "text": "Tool response"}], "is_error": False}
+        auth_state = {"token_teams": ["team-1"], "_jwt_verified_payload": ("tok", {"sub": "sse@example.com", "teams": ["team-1"]})}
+        req = {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": {"name": "test_tool", "arguments": {}}}
+
+        response = asyncio.run(dispatch_rpc_message(req, {"email": "sse@example.com"}, auth_state=auth_state, headers={"Authorization": "Bearer tok"}))
+
+        assert response["id"] == 7
+        assert response["result"]["content"][0]["text"] == "Tool response"
+        kwargs = mock_invoke_tool.call_args.kwargs
+        assert kwargs["user_email"] == "sse@example.com"
+        assert kwargs["token_teams"] == ["team-1"]
+        assert kwargs["request_headers"]["authorization"] == "Bearer tok"
+
+    @pytest.mark.parametrize(
+        "payload,client_ip,message",
+        [
+            ({"sub": "sse@example.com", "scopes": {"server_id": "srv-1"}}, "10.0.0.1", "Token not authorized for this server. Required: srv-1"),
+            ({"sub": "sse@example.com", "scopes": {"ip_restrictions": ["192.168.0.0/16"]}}, "10.0.0.1", "Request from IP 10.0.0.1 not allowed by token restrictions"),
+            ({"sub": "sse@example.com", "scopes": {"time_restrictions": {"business_hours_only": True, "weekdays_only": True}}}, "10.0.0.1", "Request not allowed at this time by token restrictions"),
+        ],
+    )
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_dispatch_rpc_message_enforces_token_scopes(self, mock_invoke_tool, payload, client_ip, message, test_client, monkeypatch):
+        """Test in-process dispatch applies the token scopes TokenScopingMiddleware applies on /rpc."""
+        # First-Party
+        from mcpgateway.main import dispatch_rpc_message
+        from mcpgateway.middleware.token_scoping import token_scoping_middleware
+
+        monkeypatch.setattr(settings, "email_auth_enabled", True)
+        # Treat any time window as closed, whatever the current time
+        monkeypatch.setattr(token_scoping_middleware, "_check_time_restrictions", lambda restrictions: not restrictions)
+        auth_state = {"token_teams": [], "_jwt_verified_payload": ("tok", payload), "client_ip": client_ip}
+        req = {"jsonrpc": "2.0", "id": 9, "method": "tools/call", "params": {"name": "test_tool", "arguments": {}, "server_id": "srv-2"}}
+
+        response = asyncio.run(dispatch_rpc_message(req, {"email": "sse@example.com"}, auth_state=auth_state))
+
+        assert response == {"jsonrpc": "2.0", "error": {"code": -32000, "message": message}, "id": 9}
+        mock_invoke_tool.assert_not_called()
+
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_dispatch_rpc_message_rejects_revoked_token(self, mock_invoke_tool, test_client, monkeypatch):
+        """Test a token revoked after the connection was authenticated is rejected on its next message."""
+        # First-Party
+        from mcpgateway.main import dispatch_rpc_message
+
+        monkeypatch.setattr(settings, "email_auth_enabled", True)
+        monkeypatch.setattr(settings, "auth_cache_enabled", False)
+        auth_state = {"token_teams": [], "_jwt_verified_payload": ("tok", {"sub": "sse@example.com", "jti": "jti-1"})}
+        req = {"jsonrpc": "2.0", "id": 3, "method": "tools/list", "params": {}}
+
+        with patch("mcpgateway.middleware.token_scoping._check_token_revoked_sync", return_value=True) as mock_revoked:
+            response = asyncio.run(dispatch_rpc_message([req], {"email": "sse@example.com"}, auth_state=auth_state))
+
+        mock_revoked.assert_called_once_with("jti-1")
+        assert response == {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Token has been revoked"}, "id": None}
+        mock_invoke_tool.assert_not_called()
+
+    @patch("mcpgateway.main.tool_service.invoke_tool")
+    def test_dispatch_rpc_message_converts_http_errors(self, mock_invoke, test_client):
+        """Test in-process dispatch turns HTTP error responses into JSON-RPC errors."""
+        # First-Party
+        from mcpgateway.main import dispatch_rpc_message
+        from mcpgateway.services.tool_service import ToolRateLimitError
+        from mcpgateway.utils.rate_limiter import RateLimitResult
+
+        mock_invoke.side_effect = ToolRateLimitError("Rate limit exceeded for user", RateLimitResult(allowed=False, limit=10, remaining=0, retry_after=2.5, reset_after=60))
+        req = {"jsonrpc": "2.0", "id": "sse-1", "method": "tools/call", "params": {"name": "test_tool", "arguments": {}}}
+
+        response = asyncio.run(dispatch_rpc_message(req, {"email": "sse@example.com"}, auth_state={"token_teams": []}))
+
+        assert response == {"jsonrpc": "2.0", "error": {"code": -32000, "message": "Rate limit exceeded for user", "data": {"retryAfter": 3}}, "id": "sse-1"}
+
     def test_rpc_elicitation_disabled(self, test_client, auth_headers, monkeypatch):
         """Test elicitation/create JSON-RPC when feature disabled."""
         monkeypatch.setattr(settings, "mcpgateway_elicitation_enabled", False)
@@ -2000,30 +2114,15 @@ class TestRealtimeEndpoints:
     """Tests for real-time communication: WebSocket, SSE, message handling, etc."""
 
     @patch("mcpgateway.main.settings")
-    @patch("mcpgateway.main.ResilientHttpClient")  # stub network calls
-    def test_websocket_endpoint(self, mock_client, mock_settings, test_client):
-        # Standard
-        from types import SimpleNamespace
-
+    @patch("mcpgateway.main.get_current_user_with_permissions", new_callable=AsyncMock)
+    @patch("mcpgateway.main.dispatch_rpc_message", new_callable=AsyncMock)
+    def test_websocket_endpoint(self, mock_dispatch, mock_auth, mock_settings, test_client):
         """Test WebSocket connection and message handling."""
         # Configure mock settings for auth disabled
         mock_settings.mcp_client_auth_enabled = False
         mock_settings.auth_required = False
-        mock_settings.federation_timeout = 30
-        mock_settings.skip_ssl_verify = False
-        mock_settings.port = 4444
-
-        # ----- set up async context-manager dummy -----
-        mock_instance = mock_client.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = False
-
-        async def dummy_post(*_args, **_kwargs):
-            # minimal object that looks like an httpx.Response
-            return SimpleNamespace(text='{"jsonrpc":"2.0","id":1,"result":{}}')
-
-        mock_instance.post = dummy_post
-        # ---------------------------------------------
+        mock_auth.return_value = {"email": "anonymous", "is_admin": False}
+        mock_dispatch.return_value = {"jsonrpc": "2.0", "id": 1, "result": {}}
 
         with test_client.websocket_connect("/ws") as websocket:
             websocket.send_text('{"jsonrpc":"2.0","method":"ping","id":1}')
@@ -2031,6 +2130,12 @@ class TestRealtimeEndpoints:
             response = json.loads(data)
             assert response == {"jsonrpc": "2.0", "id": 1, "result": {}}
 
+        # Authenticated once for the connection, message dispatched in process
+        mock_auth.assert_awaited_once()
+        message, user = mock_dispatch.await_args.args
+        assert message == {"jsonrpc": "2.0", "method": "ping", "id": 1}
+        assert user == {"email": "anonymous", "is_admin": False}
+
     @patch("mcpgateway.main.update_url_protocol", new=lambda url: url)
     @patch("mcpgateway.main.session_registry.add_session")
     @patch("mcpgateway.main.session_registry.respond")
@@ -2065,99 +2170,74 @@ class TestRealtimeEndpoints:
 
     @pytest.mark.asyncio
     async def test_websocket_forwards_auth_token_to_rpc(self, monkeypatch):
-        """Test that WebSocket forwards JWT token to /rpc endpoint.
+        """Test that WebSocket authenticates with the JWT token and passes it to the RPC handlers.
 
-        This ensures auth credentials are propagated so /rpc doesn't reject
-        with 401 when AUTH_REQUIRED=true.
+        This ensures auth credentials are propagated so the RPC handlers see
+        the same user and token as a /rpc request when AUTH_REQUIRED=true.
         """
         # First-Party
         from mcpgateway import main as mcpgateway_main
 
-        # Track headers passed to the RPC call
-        captured_headers = {}
-
-        class MockResponse:
-            text = '{"jsonrpc":"2.0","id":1,"result":{}}'
-
-        class MockClient:
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *args):
-                pass
-
-            async def post(self, url, json, headers):
-                captured_headers.update(headers)
-                return MockResponse()
-
         monkeypatch.setattr(mcpgateway_main.settings, "auth_required", True)
         monkeypatch.setattr(mcpgateway_main.settings, "mcp_client_auth_enabled", True)
-        monkeypatch.setattr(mcpgateway_main.settings, "federation_timeout", 30)
-        monkeypatch.setattr(mcpgateway_main.settings, "skip_ssl_verify", False)
-        monkeypatch.setattr(mcpgateway_main.settings, "port", 4444)
-        monkeypatch.setattr(mcpgateway_main.settings, "app_root_path", "")
-        monkeypatch.setattr(mcpgateway_main, "ResilientHttpClient", lambda **kwargs: MockClient())
         monkeypatch.setattr(mcpgateway_main, "verify_jwt_token", AsyncMock(return_value=None))
 
+        async def fake_auth(request, credentials=None, jwt_token=None):
+            request.state.token_teams = ["team-1"]
+            request.state._jwt_verified_payload = (credentials.credentials, {"sub": "user@example.com"})
+            return {"email": "user@example.com", "is_admin": False}
+
+        mock_auth = AsyncMock(side_effect=fake_auth)
+        mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "id": 1, "result": {}})
+        monkeypatch.setattr(mcpgateway_main, "get_current_user_with_permissions", mock_auth)
+        monkeypatch.setattr(mcpgateway_main, "dispatch_rpc_message", mock_dispatch)
+
         # Create mock websocket with token in query params
         websocket = AsyncMock()
+        websocket.scope = {"type": "websocket", "path": "/ws", "headers": []}
         websocket.query_params = {"token": "test-jwt-token"}
         websocket.headers = {}
-
-        # Track messages
-        messages_received = []
         websocket.receive_text = AsyncMock(side_effect=[
             '{"jsonrpc":"2.0","method":"test","id":1}',
+            '{"jsonrpc":"2.0","method":"test","id":2}',
             WebSocketDisconnect(),
         ])
-        websocket.send_text = AsyncMock(side_effect=lambda msg: messages_received.append(msg))
 
         await mcpgateway_main.websocket_endpoint(websocket)
 
-        # Verify auth token was forwarded to /rpc
-        assert "Authorization" in captured_headers, "Authorization header should be forwarded to /rpc"
-        assert captured_headers["Authorization"] == "Bearer test-jwt-token"
+        # Authenticated once, with the token of the connection
+        mock_auth.assert_awaited_once()
+        assert mock_auth.await_args.kwargs["credentials"].credentials == "test-jwt-token"
+
+        # Every message carries the user, auth state and token
+        assert mock_dispatch.await_count == 2
+        kwargs = mock_dispatch.await_args.kwargs
+        assert mock_dispatch.await_args.args[1] == {"email": "user@example.com", "is_admin": False}
+        assert kwargs["auth_state"] == {"token_teams": ["team-1"], "_jwt_verified_payload": ("test-jwt-token", {"sub": "user@example.com"}), "client_ip": "unknown"}
+        assert kwargs["headers"]["authorization"] == "Bearer test-jwt-token"
+        websocket.send_text.assert_awaited_with('{"jsonrpc":"2.0","id":1,"result":{}}')
 
     @pytest.mark.asyncio
     async def test_websocket_forwards_proxy_user_to_rpc(self, monkeypatch):
-        """Test that WebSocket forwards proxy user header to /rpc endpoint."""
+        """Test that WebSocket passes the proxy user header to the RPC handlers."""
         # First-Party
         from mcpgateway import main as mcpgateway_main
 
-        # Track headers passed to the RPC call
-        captured_headers = {}
-
-        class MockResponse:
-            text = '{"jsonrpc":"2.0","id":1,"result":{}}'
-
-        class MockClient:
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, *args):
-                pass
-
-            async def post(self, url, json, headers):
-                captured_headers.update(headers)
-                return MockResponse()
-
         monkeypatch.setattr(mcpgateway_main.settings, "auth_required", True)
         monkeypatch.setattr(mcpgateway_main.settings, "mcp_client_auth_enabled", False)
         monkeypatch.setattr(mcpgateway_main.settings, "trust_proxy_auth", True)
         monkeypatch.setattr(mcpgateway_main.settings, "proxy_user_header", "X-Forwarded-User")
-        monkeypatch.setattr(mcpgateway_main.settings, "federation_timeout", 30)
-        monkeypatch.setattr(mcpgateway_main.settings, "skip_ssl_verify", False)
-        monkeypatch.setattr(mcpgateway_main.settings, "port", 4444)
-        monkeypatch.setattr(mcpgateway_main.settings, "app_root_path", "")
-        monkeypatch.setattr(mcpgateway_main, "ResilientHttpClient", lambda **kwargs: MockClient())
+        mock_auth = AsyncMock(return_value={"email": "proxy-user@example.com", "auth_method": "proxy"})
+        mock_dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "id": 1, "result": {}})
+        monkeypatch.setattr(mcpgateway_main, "get_current_user_with_permissions", mock_auth)
+        monkeypatch.setattr(mcpgateway_main, "dispatch_rpc_message", mock_dispatch)
 
         # Create mock websocket with proxy user header
         # Note: Use exact case matching settings.proxy_user_header since we're using a plain dict
         websocket = AsyncMock()
+        websocket.scope = {"type": "websocket", "path": "/ws", "headers": [(b"x-forwarded-user", b"proxy-user@example.com")]}
         websocket.query_params = {}
         websocket.headers = {"X-Forwarded-User": "proxy-user@example.com"}
-
-        # Track messages
         websocket.receive_text = AsyncMock(side_effect=[
             '{"jsonrpc":"2.0","method":"test","id":1}',
             WebSocketDisconnect(),
@@ -2166,9 +2246,30 @@ class TestRealtimeEndpoints:
 
         await mcpgateway_main.websocket_endpoint(websocket)
 
-        # Verify proxy user header was forwarded to /rpc
-        assert "X-Forwarded-User" in captured_headers, "Proxy user header should be forwarded to /rpc"
-        assert captured_headers["X-Forwarded-User"] == "proxy-user@example.com"
+        # The auth dependency sees the proxy header, the RPC handlers get it too
+        assert mock_auth.await_args.args[0].headers["x-forwarded-user"] == "proxy-user@example.com"
+        assert mock_auth.await_args.kwargs["credentials"] is None
+        assert mock_dispatch.await_args.kwargs["headers"]["X-Forwarded-User"] == "proxy-user@example.com"
+
+    @pytest.mark.asyncio
+    async def test_websocket_auth_rejected_closes(self, monkeypatch):
+        """Test that a connection rejected by the /rpc auth dependency is closed before accept."""
+        # First-Party
+        from mcpgateway import main as mcpgateway_main
+
+        monkeypatch.setattr(mcpgateway_main.settings, "auth_required", False)
+        monkeypatch.setattr(mcpgateway_main.settings, "mcp_client_auth_enabled", False)
+        monkeypatch.setattr(mcpgateway_main, "get_current_user_with_permissions", AsyncMock(side_effect=HTTPException(status_code=401, detail="nope")))
+
+        websocket = AsyncMock()
+        websocket.scope = {"type": "websocket", "path": "/ws", "headers": []}
+        websocket.query_params = {}
+        websocket.headers = {}
+
+        await mcpgateway_main.websocket_endpoint(websocket)
+
+        websocket.close.assert_awaited_once_with(code=1008, reason="Invalid authentication")
+        websocket.accept.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_websocket_disconnect_on_accept(self, monkeypatch):
@@ -2917,6 +3018,141 @@ class TestJsonPathCaching:
         assert info.misses == 2
 
 
+class TestListResponseCache:
+    """Tests for pre-serialized list responses with ETags."""
+
+    @pytest.fixture(autouse=True)
+    def admin_token(self):
+        """Treat requests as coming from an unrestricted admin token (the cacheable case)."""
+        with patch("mcpgateway.main._get_rpc_filter_context", return_value=("admin@example.com", None, True)):
+            yield
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_list_tools_served_from_cache_with_etag(self, mock_list_tools, test_client, auth_headers):
+        mock_list_tools.return_value = ([ToolRead(**MOCK_TOOL_READ_SNAKE)], None)
+
+        first = test_client.get("/tools/", headers=auth_headers)
+        second = test_client.get("/tools/", headers=auth_headers)
+
+        assert first.status_code == second.status_code == 200
+        assert first.headers["etag"] and first.headers["etag"] == second.headers["etag"]
+        assert first.content == second.content
+        assert first.json()[0]["name"] == "test_tool"
+        mock_list_tools.assert_called_once()
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_list_tools_if_none_match_returns_304(self, mock_list_tools, test_client, auth_headers):
+        mock_list_tools.return_value = ([ToolRead(**MOCK_TOOL_READ_SNAKE)], None)
+        etag = test_client.get("/tools/", headers=auth_headers).headers["etag"]
+
+        response = test_client.get("/tools/", headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_list_tools_cache_keyed_by_query(self, mock_list_tools, test_client, auth_headers):
+        mock_list_tools.return_value = ([ToolRead(**MOCK_TOOL_READ_SNAKE)], "next")
+
+        plain = test_client.get("/tools/", headers=auth_headers).json()
+        paginated = test_client.get("/tools/?include_pagination=true", headers=auth_headers).json()
+        test_client.get("/tools/?tags=a,b", headers=auth_headers)
+
+        assert isinstance(plain, list)
+        assert paginated["nextCursor"] == "next" and paginated["tools"] == plain
+        assert mock_list_tools.call_count == 3
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_invalidate_tools_drops_cached_response(self, mock_list_tools, test_client, auth_headers):
+        from mcpgateway.cache.registry_cache import get_registry_cache
+
+        mock_list_tools.return_value = ([ToolRead(**MOCK_TOOL_READ_SNAKE)], None)
+        etag = test_client.get("/tools/", headers=auth_headers).headers["etag"]
+
+        asyncio.run(get_registry_cache().invalidate_tools())
+        mock_list_tools.return_value = ([ToolRead(**{**MOCK_TOOL_READ_SNAKE, "description": "changed"})], None)
+        response = test_client.get("/tools/", headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()[0]["description"] == "changed"
+        assert response.headers["etag"] != etag
+        assert mock_list_tools.call_count == 2
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_list_tools_scoped_token_not_cached(self, mock_list_tools, test_client, auth_headers):
+        mock_list_tools.return_value = ([ToolRead(**MOCK_TOOL_READ_SNAKE)], None)
+
+        with patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", ["team-1"], False)):
+            response = test_client.get("/tools/", headers=auth_headers)
+            test_client.get("/tools/", headers=auth_headers)
+
+        assert "etag" not in response.headers
+        assert mock_list_tools.call_count == 2
+
+    @pytest.mark.parametrize(
+        "path, service_method, item",
+        [
+            ("/tools/", "mcpgateway.main.tool_service.list_tools", MOCK_TOOL_READ_SNAKE),
+            ("/servers/", "mcpgateway.main.server_service.list_servers", MOCK_SERVER_READ),
+            ("/resources/", "mcpgateway.main.resource_service.list_resources", MOCK_RESOURCE_READ),
+            ("/prompts/", "mcpgateway.main.prompt_service.list_prompts", MOCK_PROMPT_READ),
+            ("/gateways/", "mcpgateway.main.gateway_service.list_gateways", MOCK_GATEWAY_READ),
+        ],
+    )
+    def test_search_query_passed_through_and_not_cached(self, path, service_method, item, test_client, auth_headers):
+        with patch(service_method, new_callable=AsyncMock, return_value=([item], None)) as mock_list:
+            first = test_client.get(f"{path}?q=weather", headers=auth_headers)
+            test_client.get(f"{path}?q=weather", headers=auth_headers)
+
+        assert first.status_code == 200 and "etag" not in first.headers
+        assert mock_list.call_count == 2
+        assert mock_list.call_args.kwargs["search"] == "weather"
+
+    @pytest.mark.parametrize(
+        "path, service_method, item",
+        [
+            ("/servers/", "mcpgateway.main.server_service.list_servers", MOCK_SERVER_READ),
+            ("/resources/", "mcpgateway.main.resource_service.list_resources", MOCK_RESOURCE_READ),
+            ("/prompts/", "mcpgateway.main.prompt_service.list_prompts", MOCK_PROMPT_READ),
+            ("/gateways/", "mcpgateway.main.gateway_service.list_gateways", MOCK_GATEWAY_READ),
+        ],
+    )
+    def test_other_list_endpoints_cached(self, path, service_method, item, test_client, auth_headers):
+        with patch(service_method, new_callable=AsyncMock, return_value=([item], None)) as mock_list:
+            first = test_client.get(path, headers=auth_headers)
+            second = test_client.get(path, headers={**auth_headers, "If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200 and first.json()[0]["name"] == item["name"]
+        assert second.status_code == 304
+        mock_list.assert_called_once()
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_rpc_tools_list_splices_cached_result(self, mock_list_tools, test_client, auth_headers):
+        mock_list_tools.return_value = ([ToolRead(**MOCK_TOOL_READ_SNAKE)], None)
+
+        first = test_client.post("/rpc/", json={"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}}, headers=auth_headers).json()
+        second = test_client.post("/rpc/", json={"jsonrpc": "2.0", "id": "two", "method": "tools/list", "params": {}}, headers=auth_headers).json()
+
+        assert first["id"] == 1 and second["id"] == "two"
+        assert first["result"] == second["result"]
+        assert first["result"]["tools"][0]["name"] == "test_tool"
+        mock_list_tools.assert_called_once()
+
+    @patch("mcpgateway.main.tool_service.list_tools")
+    def test_rpc_batch_with_cached_tools_list(self, mock_list_tools, test_client, auth_headers):
+        mock_list_tools.return_value = ([ToolRead(**MOCK_TOOL_READ_SNAKE)], None)
+        batch = [{"jsonrpc": "2.0", "id": i, "method": "tools/list", "params": {}} for i in (1, 2)]
+
+        with patch.object(settings, "mcpgateway_rpc_batch_enabled", True):
+            response = test_client.post("/rpc/", json=batch, headers=auth_headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [entry["id"] for entry in body] == [1, 2]
+        assert body[0]["result"] == body[1]["result"]
+
+
 # ----------------------------------------------------- #
 # Token Teams Helper Function Tests (Issue #1915)       #
 # ----------------------------------------------------- #
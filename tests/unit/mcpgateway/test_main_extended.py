@@ -14,6 +14,7 @@ error handlers, and startup logic.
 import builtins
 import asyncio
 import importlib.util
+from contextlib import contextmanager
 import json
 from pathlib import Path
 from types import SimpleNamespace
@@ -67,6 +68,7 @@ from mcpgateway.main import (
 import mcpgateway.db as db_mod
 from mcpgateway.plugins.framework import PluginError
 from mcpgateway.schemas import PromptCreate, PromptUpdate, ResourceCreate, ResourceUpdate, ToolCreate, ToolUpdate
+from tests.utils.asgi import dispatch
 
 
 def _make_request(
@@ -86,6 +88,21 @@ def _make_request(
     return request
 
 
+def _make_asgi_request(
+    path: str,
+    *,
+    method: str = "GET",
+    headers: dict | None = None,
+    cookies: dict | None = None,
+    root_path: str = "",
+) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    if cookies:
+        raw_headers.append((b"cookie", "; ".join(f"{name}={value}" for name, value in cookies.items()).encode()))
+    scope = {"type": "http", "method": method, "path": path, "root_path": root_path, "query_string": b"", "headers": raw_headers}
+    return Request(scope)
+
+
 def _import_fresh_main_module(
     monkeypatch: pytest.MonkeyPatch,
     *,
@@ -380,21 +397,21 @@ class TestDocsAuthMiddleware:
     @pytest.mark.asyncio
     async def test_docs_auth_rejects_invalid_token(self):
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/docs", headers={"Authorization": "Bearer bad"})
+        request = _make_asgi_request("/docs", headers={"Authorization": "Bearer bad"})
         call_next = AsyncMock(return_value=StarletteResponse("ok"))
 
         with patch("mcpgateway.main.require_docs_auth_override", side_effect=HTTPException(status_code=401, detail="nope")):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 401
 
     @pytest.mark.asyncio
     async def test_docs_auth_options_passthrough(self):
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/docs", method="OPTIONS")
+        request = _make_asgi_request("/docs", method="OPTIONS")
         call_next = AsyncMock(return_value="ok")
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
         assert response == "ok"
         call_next.assert_called_once()
@@ -402,10 +419,10 @@ class TestDocsAuthMiddleware:
     @pytest.mark.asyncio
     async def test_docs_auth_unprotected_path(self):
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/api/tools")
+        request = _make_asgi_request("/api/tools")
         call_next = AsyncMock(return_value="ok")
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
         assert response == "ok"
         call_next.assert_called_once()
@@ -414,11 +431,11 @@ class TestDocsAuthMiddleware:
     async def test_docs_auth_normalizes_prefixed_scope_path(self):
         """When proxy forwards full path, scope_path includes root_path prefix and must be stripped."""
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/qa/gateway/docs", root_path="/qa/gateway")
+        request = _make_asgi_request("/qa/gateway/docs", root_path="/qa/gateway")
         call_next = AsyncMock(return_value=StarletteResponse("ok"))
 
         with patch("mcpgateway.main.require_docs_auth_override", side_effect=HTTPException(status_code=401, detail="nope")):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         # After normalization the path matches /docs, so auth is enforced
         assert response.status_code == 401
@@ -427,10 +444,10 @@ class TestDocsAuthMiddleware:
     async def test_docs_auth_prefixed_unprotected_path_passes_through(self):
         """An unprotected path with root_path prefix must still pass through after normalization."""
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/qa/gateway/health", root_path="/qa/gateway")
+        request = _make_asgi_request("/qa/gateway/health", root_path="/qa/gateway")
         call_next = AsyncMock(return_value="ok")
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
         assert response == "ok"
         call_next.assert_called_once()
@@ -439,11 +456,11 @@ class TestDocsAuthMiddleware:
     async def test_docs_auth_root_path_slash_does_not_break_paths(self):
         """root_path of '/' must be ignored to avoid stripping leading slash from every path."""
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/docs", root_path="/")
+        request = _make_asgi_request("/docs", root_path="/")
         call_next = AsyncMock(return_value=StarletteResponse("ok"))
 
         with patch("mcpgateway.main.require_docs_auth_override", side_effect=HTTPException(status_code=401, detail="nope")):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         # /docs is still recognized as protected (leading slash not stripped)
         assert response.status_code == 401
@@ -452,10 +469,10 @@ class TestDocsAuthMiddleware:
     async def test_docs_auth_partial_prefix_not_stripped(self):
         """root_path='/app' must not strip from '/application/docs' (partial segment match)."""
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/application/docs", root_path="/app")
+        request = _make_asgi_request("/application/docs", root_path="/app")
         call_next = AsyncMock(return_value="ok")
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
         # "/application/docs" is not a protected path, so it passes through
         assert response == "ok"
@@ -465,11 +482,11 @@ class TestDocsAuthMiddleware:
     async def test_docs_auth_trailing_slash_root_path(self):
         """root_path with trailing slash must still strip prefix correctly."""
         middleware = DocsAuthMiddleware(None)
-        request = _make_request("/qa/gateway/docs", root_path="/qa/gateway/")
+        request = _make_asgi_request("/qa/gateway/docs", root_path="/qa/gateway/")
         call_next = AsyncMock(return_value=StarletteResponse("ok"))
 
         with patch("mcpgateway.main.require_docs_auth_override", side_effect=HTTPException(status_code=401, detail="nope")):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 401
 
@@ -480,11 +497,11 @@ class TestAdminAuthMiddleware:
     @pytest.mark.asyncio
     async def test_admin_auth_bypasses_when_auth_disabled(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools")
+        request = _make_asgi_request("/admin/tools")
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", False)
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
 
         assert response == "ok"
         call_next.assert_called_once()
@@ -492,19 +509,19 @@ class TestAdminAuthMiddleware:
     @pytest.mark.asyncio
     async def test_admin_auth_invalid_jwt_returns_401(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", headers={"Authorization": "Bearer token"})
+        request = _make_asgi_request("/admin/tools", headers={"Authorization": "Bearer token"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
         with patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={})):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 401
 
     @pytest.mark.asyncio
     async def test_admin_auth_revoked_token_redirects(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request(
+        request = _make_asgi_request(
             "/admin/tools",
             headers={"Authorization": "Bearer token", "accept": "text/html"},
         )
@@ -515,7 +532,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "user@example.com", "jti": "abc"})),
             patch("mcpgateway.main._check_token_revoked_sync", return_value=True),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 302
         assert "token_revoked" in response.headers.get("location", "")
@@ -524,7 +541,7 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_htmx_request_returns_hx_redirect(self, monkeypatch):
         """HTMX partial requests must receive HX-Redirect header instead of 302 redirect (issue #2874)."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request(
+        request = _make_asgi_request(
             "/admin/tools",
             headers={"Authorization": "Bearer token", "accept": "text/html", "hx-request": "true"},
         )
@@ -535,7 +552,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "user@example.com", "jti": "abc"})),
             patch("mcpgateway.main._check_token_revoked_sync", return_value=True),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 200
         assert "/admin/login" in response.headers.get("hx-redirect", "")
@@ -545,7 +562,7 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_htmx_no_auth_returns_hx_redirect(self, monkeypatch):
         """HTMX requests without valid auth must get HX-Redirect, not 302 (issue #2874)."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request(
+        request = _make_asgi_request(
             "/admin/tools",
             headers={"hx-request": "true"},
         )
@@ -553,7 +570,7 @@ class TestAdminAuthMiddleware:
 
         monkeypatch.setattr(settings, "auth_required", True)
         with patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={})):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 200
         assert "/admin/login" in response.headers.get("hx-redirect", "")
@@ -561,7 +578,7 @@ class TestAdminAuthMiddleware:
     @pytest.mark.asyncio
     async def test_admin_auth_api_token_expired(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", headers={"Authorization": "Bearer token"})
+        request = _make_asgi_request("/admin/tools", headers={"Authorization": "Bearer token"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -569,7 +586,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(side_effect=Exception("bad"))),
             patch("mcpgateway.main._lookup_api_token_sync", return_value={"expired": True}),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 401
 
@@ -577,7 +594,7 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_proxy_user_allows_access(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
         proxy_header = settings.proxy_user_header
-        request = _make_request("/admin/tools", headers={proxy_header: "proxy@example.com"})
+        request = _make_asgi_request("/admin/tools", headers={proxy_header: "proxy@example.com"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -599,7 +616,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.get_db", _db_gen),
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response == "ok"
         call_next.assert_called_once()
@@ -607,7 +624,7 @@ class TestAdminAuthMiddleware:
     @pytest.mark.asyncio
     async def test_admin_auth_platform_admin_bootstrap(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", headers={"Authorization": "Bearer token"})
+        request = _make_asgi_request("/admin/tools", headers={"Authorization": "Bearer token"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -627,7 +644,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.get_db", _db_gen),
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response == "ok"
         call_next.assert_called_once()
@@ -635,7 +652,7 @@ class TestAdminAuthMiddleware:
     @pytest.mark.asyncio
     async def test_admin_auth_non_admin_denied(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", headers={"Authorization": "Bearer token"})
+        request = _make_asgi_request("/admin/tools", headers={"Authorization": "Bearer token"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -659,7 +676,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
             patch("mcpgateway.main.PermissionService", return_value=mock_permission_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 403
 
@@ -677,12 +694,12 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_exempt_paths_call_next_when_auth_required(self, monkeypatch, path):
         """Cover exempt path short-circuit for public admin routes and static assets."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request(path, headers={"accept": "application/json"})
+        request = _make_asgi_request(path, headers={"accept": "application/json"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
         assert response == "ok"
         call_next.assert_called_once()
 
@@ -698,12 +715,12 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_exempt_path_with_prefixed_scope_path(self, monkeypatch, path):
         """When proxy forwards full paths, exempt admin auth routes must remain public."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request(path, root_path="/qa/gateway")
+        request = _make_asgi_request(path, root_path="/qa/gateway")
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
         assert response == "ok"
         call_next.assert_called_once()
 
@@ -711,12 +728,12 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_root_path_slash_does_not_break_paths(self, monkeypatch):
         """root_path of '/' must be ignored so /admin routes are still detected."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/login", root_path="/")
+        request = _make_asgi_request("/admin/login", root_path="/")
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
         # /admin/login is exempt; leading slash must not be stripped
         assert response == "ok"
         call_next.assert_called_once()
@@ -725,12 +742,12 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_prefixed_non_exempt_path_enforces_auth(self, monkeypatch):
         """A non-exempt prefixed admin path must be detected as admin and require auth."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/qa/gateway/admin/tools", root_path="/qa/gateway", headers={"accept": "text/html"})
+        request = _make_asgi_request("/qa/gateway/admin/tools", root_path="/qa/gateway", headers={"accept": "text/html"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
         # No credentials: should redirect to login (302), not pass through
         assert response.status_code == 302
         assert "/admin/login" in response.headers.get("location", "")
@@ -740,12 +757,12 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_trailing_slash_root_path(self, monkeypatch):
         """root_path with trailing slash must still normalize correctly."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/qa/gateway/admin/tools", root_path="/qa/gateway/", headers={"accept": "text/html"})
+        request = _make_asgi_request("/qa/gateway/admin/tools", root_path="/qa/gateway/", headers={"accept": "text/html"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
 
-        response = await middleware.dispatch(request, call_next)
+        response = await dispatch(middleware, request, call_next)
         assert response.status_code == 302
         assert "/admin/login" in response.headers.get("location", "")
         call_next.assert_not_called()
@@ -754,7 +771,7 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_cookie_token_revocation_check_failure_still_allows(self, monkeypatch):
         """Cover cookie token extraction + revocation check failure path."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
+        request = _make_asgi_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -777,7 +794,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
             patch("mcpgateway.main.PermissionService", return_value=mock_permission_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response == "ok"
         call_next.assert_called_once()
@@ -786,7 +803,7 @@ class TestAdminAuthMiddleware:
     async def test_admin_auth_api_token_revoked_and_success(self, monkeypatch):
         """Cover API token revoked and valid branches (when JWT validation fails)."""
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
+        request = _make_asgi_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -795,7 +812,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(side_effect=Exception("bad"))),
             patch("mcpgateway.main._lookup_api_token_sync", return_value={"revoked": True}),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
             assert response.status_code == 401
 
         mock_db = MagicMock()
@@ -816,13 +833,13 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
             patch("mcpgateway.main.PermissionService", return_value=mock_permission_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
             assert response == "ok"
 
     @pytest.mark.asyncio
     async def test_admin_auth_user_not_found_returns_401(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
+        request = _make_asgi_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -841,14 +858,14 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "user@example.com"})),
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 401
 
     @pytest.mark.asyncio
     async def test_admin_auth_user_not_found_browser_redirects_to_login(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "text/html"})
+        request = _make_asgi_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "text/html"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -867,7 +884,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "user@example.com"})),
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 302
         assert "/admin/login" in response.headers.get("location", "")
@@ -875,7 +892,7 @@ class TestAdminAuthMiddleware:
     @pytest.mark.asyncio
     async def test_admin_auth_disabled_user_returns_403(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
+        request = _make_asgi_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -894,14 +911,14 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "user@example.com"})),
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
 
         assert response.status_code == 403
 
     @pytest.mark.asyncio
     async def test_admin_auth_http_exception_and_general_exception_paths(self, monkeypatch):
         middleware = AdminAuthMiddleware(None)
-        request = _make_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
+        request = _make_asgi_request("/admin/tools", cookies={"jwt_token": "token"}, headers={"accept": "application/json"})
         call_next = AsyncMock(return_value="ok")
 
         monkeypatch.setattr(settings, "auth_required", True)
@@ -919,7 +936,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "user@example.com"})),
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
             assert response.status_code == 401
 
         # Generic exception (e.g., permission check failure) -> 500 Authentication error
@@ -934,7 +951,7 @@ class TestAdminAuthMiddleware:
             patch("mcpgateway.main.EmailAuthService", return_value=mock_auth_service),
             patch("mcpgateway.main.PermissionService", return_value=mock_permission_service),
         ):
-            response = await middleware.dispatch(request, call_next)
+            response = await dispatch(middleware, request, call_next)
             assert response.status_code == 500
 
 
@@ -2309,6 +2326,14 @@ class TestLifespanAdvanced:
             MagicMock(return_value=metrics_buffer_service),
         )
 
+        log_write_buffer_service = MagicMock()
+        log_write_buffer_service.start = AsyncMock()
+        log_write_buffer_service.shutdown = AsyncMock()
+        monkeypatch.setattr(
+            "mcpgateway.services.log_write_buffer_service.get_log_write_buffer_service",
+            MagicMock(return_value=log_write_buffer_service),
+        )
+
         metrics_cleanup_service = MagicMock()
         metrics_cleanup_service.start = AsyncMock()
         metrics_cleanup_service.shutdown = AsyncMock()
@@ -2531,23 +2556,12 @@ class TestUtilityFunctions:
         # Configure mock settings for auth disabled
         mock_settings.mcp_client_auth_enabled = False
         mock_settings.auth_required = False
-        mock_settings.federation_timeout = 30
-        mock_settings.skip_ssl_verify = False
-        mock_settings.port = 4444
-
-        with patch("mcpgateway.main.ResilientHttpClient") as mock_client:
-            # Standard
-
-            mock_instance = mock_client.return_value
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = False
-
-            # Mock a failing post operation
-            async def failing_post(*_args, **_kwargs):
-                raise Exception("Network error")
-
-            mock_instance.post = failing_post
 
+        # Mock a failing dispatch
+        with (
+            patch("mcpgateway.main.get_current_user_with_permissions", AsyncMock(return_value={"email": "anonymous"})),
+            patch("mcpgateway.main.dispatch_rpc_message", AsyncMock(side_effect=Exception("Network error"))),
+        ):
             client = TestClient(app)
             with client.websocket_connect("/ws") as websocket:
                 websocket.send_text('{"jsonrpc":"2.0","method":"ping","id":1}')
@@ -2610,26 +2624,13 @@ class TestUtilityFunctions:
 
         monkeypatch.setattr(main_mod.settings, "mcp_client_auth_enabled", False)
         monkeypatch.setattr(main_mod.settings, "auth_required", False)
-        monkeypatch.setattr(main_mod.settings, "federation_timeout", 1)
-        monkeypatch.setattr(main_mod.settings, "skip_ssl_verify", False)
-        monkeypatch.setattr(main_mod.settings, "port", 4444)
-        monkeypatch.setattr(main_mod.settings, "app_root_path", "")
 
         err = main_mod.JSONRPCError(-32000, "boom", {})
-
-        class DummyClient:
-            async def __aenter__(self):  # noqa: D401
-                return self
-
-            async def __aexit__(self, *_args):  # noqa: D401, ANN001
-                return False
-
-            async def post(self, *_args, **_kwargs):  # noqa: ANN001
-                raise err
-
-        monkeypatch.setattr(main_mod, "ResilientHttpClient", lambda *_a, **_k: DummyClient())
+        monkeypatch.setattr(main_mod, "get_current_user_with_permissions", AsyncMock(return_value={"email": "anonymous"}))
+        monkeypatch.setattr(main_mod, "dispatch_rpc_message", AsyncMock(side_effect=err))
 
         websocket = MagicMock()
+        websocket.scope = {"type": "websocket", "path": "/ws", "headers": []}
         websocket.query_params = {}
         websocket.headers = {}
         websocket.accept = AsyncMock()
@@ -2648,8 +2649,10 @@ class TestUtilityFunctions:
 
         monkeypatch.setattr(main_mod.settings, "mcp_client_auth_enabled", False)
         monkeypatch.setattr(main_mod.settings, "auth_required", False)
+        monkeypatch.setattr(main_mod, "get_current_user_with_permissions", AsyncMock(return_value={"email": "anonymous"}))
 
         websocket = MagicMock()
+        websocket.scope = {"type": "websocket", "path": "/ws", "headers": []}
         websocket.query_params = {}
         websocket.headers = {}
         websocket.accept = AsyncMock()
@@ -3989,6 +3992,143 @@ class TestRpcHandling:
             result = await rpc_task
             assert result["error"]["code"] == -32800
 
+    @staticmethod
+    def _batch_db_patch():
+        @contextmanager
+        def _fresh_db_session():
+            yield MagicMock()
+
+        return patch("mcpgateway.main.fresh_db_session", _fresh_db_session)
+
+    @classmethod
+    def _make_batch_request(cls, payload, state: dict | None = None) -> MagicMock:
+        request = cls._make_request(payload)
+        request.scope = {"type": "http", "method": "POST", "path": "/rpc", "headers": [], "state": state or {}}
+        return request
+
+    async def test_handle_rpc_batch_concurrent_ordered_and_notifications(self, monkeypatch):
+        monkeypatch.setattr(settings, "mcpgateway_tool_cancellation_enabled", False)
+        monkeypatch.setattr(settings, "mcpgateway_rpc_batch_concurrency", 2)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _invoke(*_args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later requests finish first to prove responses keep request order
+            await asyncio.sleep(0.01 * (5 - kwargs["arguments"]["n"]))
+            in_flight -= 1
+            return {"n": kwargs["arguments"]["n"]}
+
+        payload = [{"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"name": "echo", "arguments": {"n": i}}} for i in range(4)]
+        payload.insert(2, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        request = self._make_batch_request(payload)
+
+        with (
+            self._batch_db_patch(),
+            patch("mcpgateway.main.tool_service.invoke_tool", new=AsyncMock(side_effect=_invoke)) as invoke,
+            patch("mcpgateway.main.logging_service.notify", new=AsyncMock()),
+            patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, False)),
+        ):
+            result = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+
+        assert [r["id"] for r in result] == [0, 1, 2, 3]
+        assert [r["result"]["n"] for r in result] == [0, 1, 2, 3]
+        assert invoke.await_count == 4
+        assert max_in_flight == 2
+
+    async def test_handle_rpc_batch_invalid_entries_and_limits(self, monkeypatch):
+        request = self._make_batch_request([])
+        response = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+        assert response.status_code == 400
+        assert json.loads(response.body)["error"]["code"] == -32600
+
+        monkeypatch.setattr(settings, "mcpgateway_rpc_batch_max_size", 2)
+        request = self._make_batch_request([{"jsonrpc": "2.0", "id": i, "method": "ping"} for i in range(3)])
+        response = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+        assert response.status_code == 400
+
+        monkeypatch.setattr(settings, "mcpgateway_rpc_batch_enabled", False)
+        request = self._make_batch_request([{"jsonrpc": "2.0", "id": 1, "method": "ping"}])
+        response = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+        assert response.status_code == 400
+        monkeypatch.setattr(settings, "mcpgateway_rpc_batch_enabled", True)
+        monkeypatch.setattr(settings, "mcpgateway_rpc_batch_max_size", 10)
+
+        request = self._make_batch_request([1, {"jsonrpc": "2.0", "id": "p", "method": "ping"}, {"jsonrpc": "2.0", "id": "x"}])
+        with self._batch_db_patch():
+            result = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+        assert result[0] == {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": None}
+        assert result[1] == {"jsonrpc": "2.0", "result": {}, "id": "p"}
+        assert result[2]["error"]["code"] == -32600
+        assert result[2]["id"] == "x"
+
+    async def test_handle_rpc_batch_only_notifications_returns_202(self):
+        request = self._make_batch_request([{"jsonrpc": "2.0", "method": "notifications/initialized"}])
+        with self._batch_db_patch(), patch("mcpgateway.main.logging_service.notify", new=AsyncMock()):
+            response = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+        assert response.status_code == 202
+
+    async def test_handle_rpc_batch_plugin_error_becomes_entry_error(self, monkeypatch):
+        from mcpgateway.plugins.framework.models import PluginErrorModel
+
+        monkeypatch.setattr(settings, "mcpgateway_tool_cancellation_enabled", False)
+        payload = [
+            {"jsonrpc": "2.0", "id": "a", "method": "tools/call", "params": {"name": "bad", "arguments": {}}},
+            {"jsonrpc": "2.0", "id": "b", "method": "ping"},
+        ]
+        request = self._make_batch_request(payload)
+        with (
+            self._batch_db_patch(),
+            patch("mcpgateway.main.tool_service.invoke_tool", new=AsyncMock(side_effect=PluginError(PluginErrorModel(message="nope", plugin_name="test-plugin")))),
+            patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, False)),
+        ):
+            result = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+
+        assert result[0]["id"] == "a"
+        assert result[0]["error"]["message"] == "Plugin Error: nope"
+        assert result[1] == {"jsonrpc": "2.0", "result": {}, "id": "b"}
+
+    async def test_handle_rpc_batch_entries_get_own_plugin_context(self, monkeypatch):
+        from mcpgateway.plugins.framework import GlobalContext
+
+        monkeypatch.setattr(settings, "mcpgateway_tool_cancellation_enabled", False)
+        gateways = {"tool-a": "gateway-a", "tool-b": "gateway-b"}
+        recorded = {}
+
+        async def record_plugin(global_context, context_table):
+            # A plugin hook that records what it sees and keeps local state per request
+            await asyncio.sleep(0)
+            recorded[global_context.request_id] = (global_context.server_id, dict(context_table))
+            context_table[global_context.request_id] = global_context.server_id
+
+        async def _invoke(*_args, **kwargs):
+            # Like ToolService.invoke_tool: set the tool's gateway on the global context in place, then run hooks
+            global_context = kwargs["plugin_global_context"]
+            context_table = kwargs["plugin_context_table"] if kwargs["plugin_context_table"] is not None else {}
+            global_context.server_id = gateways[kwargs["name"]]
+            await asyncio.sleep(0.01 if kwargs["name"] == "tool-a" else 0)
+            await record_plugin(global_context, context_table)
+            return {"server_id": global_context.server_id}
+
+        batch_context = GlobalContext(request_id="req-1", user="user@example.com")
+        payload = [{"jsonrpc": "2.0", "id": name, "method": "tools/call", "params": {"name": name, "arguments": {}}} for name in gateways]
+        request = self._make_batch_request(payload, state={"plugin_global_context": batch_context, "plugin_context_table": {"shared": "ctx"}})
+
+        with (
+            self._batch_db_patch(),
+            patch("mcpgateway.main.tool_service.invoke_tool", new=AsyncMock(side_effect=_invoke)),
+            patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, False)),
+        ):
+            result = await handle_rpc(request, db=MagicMock(), user={"email": "user@example.com"})
+
+        assert [r["result"]["server_id"] for r in result] == ["gateway-a", "gateway-b"]
+        assert recorded == {"req-1-0": ("gateway-a", {}), "req-1-1": ("gateway-b", {})}
+        assert batch_context.server_id is None
+        assert request.scope["state"]["plugin_context_table"] == {"shared": "ctx"}
+
 
 class TestA2AListAndGet:
     """Cover list/get A2A agent endpoints in main."""
@@ -5226,6 +5366,8 @@ class TestRemainingCoverageGaps:
         monkeypatch.setattr(main_mod.settings, "mcpgateway_tool_cancellation_enabled", False)
         monkeypatch.setattr(main_mod.settings, "mcpgateway_elicitation_enabled", False)
         monkeypatch.setattr(main_mod.settings, "metrics_buffer_enabled", False)
+        monkeypatch.setattr(main_mod.settings, "log_write_buffer_enabled", False)
+        monkeypatch.setattr(main_mod.settings, "token_usage_rollup_enabled", False)
         monkeypatch.setattr(main_mod.settings, "metrics_cleanup_enabled", False)
         monkeypatch.setattr(main_mod.settings, "metrics_rollup_enabled", False)
         monkeypatch.setattr(main_mod.settings, "sso_enabled", False)
@@ -5313,6 +5455,8 @@ class TestRemainingCoverageGaps:
         monkeypatch.setattr(main_mod.settings, "mcpgateway_tool_cancellation_enabled", False)
         monkeypatch.setattr(main_mod.settings, "mcpgateway_elicitation_enabled", False)
         monkeypatch.setattr(main_mod.settings, "metrics_buffer_enabled", False)
+        monkeypatch.setattr(main_mod.settings, "log_write_buffer_enabled", False)
+        monkeypatch.setattr(main_mod.settings, "token_usage_rollup_enabled", False)
         monkeypatch.setattr(main_mod.settings, "metrics_cleanup_enabled", False)
         monkeypatch.setattr(main_mod.settings, "metrics_rollup_enabled", False)
         monkeypatch.setattr(main_mod.settings, "sso_enabled", False)
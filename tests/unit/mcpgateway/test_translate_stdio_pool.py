@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the pooled stdio mode of mcpgateway.translate.
+
+Location: ./tests/unit/mcpgateway/test_translate_stdio_pool.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for StdIOWorkerPool (``--stdio-workers N``): load balancing, JSON-RPC id
+mapping, per-session delivery, handshake replay and crash restarts.
+"""
+
+# Standard
+import asyncio
+import json
+import sys
+from unittest.mock import AsyncMock
+
+# Third-Party
+from fastapi.testclient import TestClient
+import pytest
+
+# First-Party
+from mcpgateway.translate import _build_fastapi, _PubSub, StdIOWorkerPool, WORKER_EXITED_ERROR_CODE
+
+SERVER_SCRIPT = r"""
+import json, os, sys, time
+
+initialized = False
+
+
+def handle(msg):
+    global initialized
+    method = msg.get("method")
+    if method == "notifications/initialized":
+        initialized = True
+        return None
+    if "id" not in msg:
+        return None
+    if method == "crash":
+        sys.exit(3)
+    if method == "slow":
+        time.sleep(0.5)
+    if method != "initialize" and not initialized:
+        return {"jsonrpc": "2.0", "id": msg["id"], "error": {"code": -32002, "message": "not initialized"}}
+    return {"jsonrpc": "2.0", "id": msg["id"], "result": {"pid": os.getpid(), "method": method}}
+
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    reply = [r for r in map(handle, msg) if r] if isinstance(msg, list) else handle(msg)
+    if reply:
+        print(json.dumps(reply), flush=True)
+"""
+
+
+@pytest.fixture
+def server_cmd(tmp_path):
+    """Command line for a tiny MCP-like stdio server that reports its pid."""
+    script = tmp_path / "pool_server.py"
+    script.write_text(SERVER_SCRIPT)
+    return f"{sys.executable} {script}"
+
+
+@pytest.fixture
+async def pool(server_cmd):
+    """Started two-worker pool with two registered sessions."""
+    pubsub = _PubSub()
+    workers = StdIOWorkerPool(server_cmd, pubsub, workers=2, restart_delay=0.05)
+    await workers.start()
+    workers.register_session("a", asyncio.Queue())
+    workers.register_session("b", asyncio.Queue())
+    yield workers
+    await workers.stop()
+
+
+async def _handshake(pool: StdIOWorkerPool, session_id: str) -> None:
+    await pool.send(json.dumps({"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {"protocolVersion": "2025-03-26"}}), session_id=session_id)
+    reply = json.loads(await asyncio.wait_for(pool._sessions[session_id].get(), 5))
+    assert reply["id"] == 0 and "result" in reply
+    await pool.send(json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}), session_id=session_id)
+
+
+async def _call(pool: StdIOWorkerPool, session_id: str, request_id, method: str = "ping") -> dict:
+    await pool.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method}), session_id=session_id)
+    return json.loads(await asyncio.wait_for(pool._sessions[session_id].get(), 5))
+
+
+class TestStdIOWorkerPoolRouting:
+    """Requests are load-balanced and responses delivered to their session only."""
+
+    async def test_responses_go_to_sending_session_with_original_id(self, pool):
+        await _handshake(pool, "a")
+
+        # Both sessions use the same client-side id; neither sees the other's response
+        await pool.send(json.dumps({"jsonrpc": "2.0", "id": 7, "method": "from-a"}), session_id="a")
+        await pool.send(json.dumps({"jsonrpc": "2.0", "id": 7, "method": "from-b"}), session_id="b")
+        reply_a = json.loads(await asyncio.wait_for(pool._sessions["a"].get(), 5))
+        reply_b = json.loads(await asyncio.wait_for(pool._sessions["b"].get(), 5))
+
+        assert (reply_a["id"], reply_a["result"]["method"]) == (7, "from-a")
+        assert (reply_b["id"], reply_b["result"]["method"]) == (7, "from-b")
+        assert pool._sessions["a"].empty() and pool._sessions["b"].empty()
+        assert pool._pending == {}
+
+    async def test_requests_spread_across_workers_with_handshake_replay(self, pool):
+        await _handshake(pool, "a")
+
+        replies = [await _call(pool, "a", f"req-{i}") for i in range(4)]
+
+        assert all("result" in r for r in replies), replies  # replayed initialize reached the second worker
+        assert {r["id"] for r in replies} == {"req-0", "req-1", "req-2", "req-3"}
+        assert len({r["result"]["pid"] for r in replies}) == 2
+        assert pool._sessions["a"].empty()  # replayed handshake response is swallowed
+        assert all(w.initialized for w in pool._workers)
+
+    async def test_least_loaded_worker_is_chosen(self, pool):
+        await _handshake(pool, "a")
+        busy = pool._workers[0]
+        busy.in_flight = 5
+
+        reply = await _call(pool, "a", 1)
+
+        assert reply["result"]["pid"] == pool._workers[1].endpoint._proc.pid
+
+    async def test_response_without_session_is_broadcast(self, pool):
+        queue = pool._pubsub.subscribe()
+        await pool.send(json.dumps({"jsonrpc": "2.0", "id": 3, "method": "initialize", "params": {}}))
+
+        reply = json.loads(await asyncio.wait_for(queue.get(), 5))
+        assert reply["id"] == 3
+
+    async def test_batch_request_routed_to_one_worker(self, pool):
+        await _handshake(pool, "b")
+        batch = [{"jsonrpc": "2.0", "id": 1, "method": "one"}, {"jsonrpc": "2.0", "id": 2, "method": "two"}]
+
+        await pool.send(json.dumps(batch), session_id="b")
+        replies = json.loads(await asyncio.wait_for(pool._sessions["b"].get(), 5))
+
+        assert sorted(r["id"] for r in replies) == [1, 2]
+        assert len({r["result"]["pid"] for r in replies}) == 1
+
+
+class TestStdIOWorkerPoolHealth:
+    """Per-worker queue depth and crash recovery."""
+
+    async def test_health_reports_queue_depth(self, pool):
+        await _handshake(pool, "a")
+        for i in range(2):  # initialize both workers
+            await _call(pool, "a", i)
+        await pool.send(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "slow"}), session_id="a")
+
+        report = pool.health()
+        assert report["status"] == "ok"
+        assert sorted(w["queue_depth"] for w in report["workers"]) == [0, 1]
+        assert all(w["running"] and w["pid"] for w in report["workers"])
+
+        await asyncio.wait_for(pool._sessions["a"].get(), 5)
+        assert [w["queue_depth"] for w in pool.health()["workers"]] == [0, 0]
+
+    async def test_crashed_worker_fails_in_flight_and_restarts(self, pool):
+        await _handshake(pool, "a")
+
+        reply = await _call(pool, "a", "boom", method="crash")
+
+        assert reply["id"] == "boom"
+        assert reply["error"]["code"] == WORKER_EXITED_ERROR_CODE
+        crashed = next(w for w in pool._workers if w.in_flight == 0 and not w.initialized)
+        for _ in range(100):
+            if crashed.restarts and crashed.is_alive():
+                break
+            await asyncio.sleep(0.05)
+        assert crashed.restarts == 1 and crashed.is_alive()
+
+        # The restarted worker is re-initialized before serving requests again
+        replies = [await _call(pool, "a", i) for i in range(4)]
+        assert all("result" in r for r in replies), replies
+
+    async def test_healthz_endpoint_reports_workers(self, server_cmd):
+        pubsub = _PubSub()
+        workers = StdIOWorkerPool(server_cmd, pubsub, workers=3)
+        client = TestClient(_build_fastapi(pubsub, workers))
+
+        response = client.get("/healthz")
+
+        assert response.status_code == 503
+        body = response.json()
+        assert body["status"] == "unavailable"
+        assert [w["index"] for w in body["workers"]] == [0, 1, 2]
+        assert all(w["queue_depth"] == 0 for w in body["workers"])
+
+
+class TestStdIOWorkerPoolServerRequests:
+    """Server-initiated requests and client notifications."""
+
+    async def test_server_request_ids_are_mapped_back_to_worker(self):
+        pubsub = _PubSub()
+        pool = StdIOWorkerPool("cat", pubsub, workers=2)
+        for worker in pool._workers:
+            worker.endpoint.send = AsyncMock()
+            worker.endpoint._proc = type("P", (), {"returncode": None, "pid": 1})()
+        queue = pubsub.subscribe()
+
+        await pool._dispatch(1, json.dumps({"jsonrpc": "2.0", "id": 99, "method": "sampling/createMessage"}))
+        forwarded = json.loads(await queue.get())
+        await pool.send(json.dumps({"jsonrpc": "2.0", "id": forwarded["id"], "result": {}}))
+
+        pool._workers[0].endpoint.send.assert_not_awaited()
+        sent = json.loads(pool._workers[1].endpoint.send.await_args.args[0])
+        assert sent["id"] == 99
+
+    async def test_cancel_notification_targets_owning_worker(self):
+        pool = StdIOWorkerPool("cat", _PubSub(), workers=2)
+        for worker in pool._workers:
+            worker.endpoint.send = AsyncMock()
+            worker.endpoint._proc = type("P", (), {"returncode": None, "pid": 1})()
+        pool._pending[41] = (1, "a", "orig")
+
+        await pool.send(json.dumps({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": "orig"}}), session_id="a")
+
+        pool._workers[0].endpoint.send.assert_not_awaited()
+        sent = json.loads(pool._workers[1].endpoint.send.await_args.args[0])
+        assert sent["params"]["requestId"] == 41
+
+    async def test_send_without_live_workers_raises(self):
+        pool = StdIOWorkerPool("cat", _PubSub(), workers=2)
+        with pytest.raises(RuntimeError, match="no stdio workers available"):
+            await pool.send(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "ping"}))
@@ -324,6 +324,32 @@ async def test_list_tools_with_server_id(monkeypatch):
     assert result[0].description == "desc"
 
 
+@pytest.mark.asyncio
+async def test_list_tools_with_server_id_discovery_stub(monkeypatch):
+    """Test list_tools returns only the discovery meta-tool for large servers."""
+    # First-Party
+    from mcpgateway.transports.streamablehttp_transport import list_tools, server_id_var, tool_service
+
+    mock_db = MagicMock()
+    discovery = MagicMock()
+    discovery.stub_tools = AsyncMock(return_value=[{"name": "search_tools", "description": "Search", "inputSchema": {"type": "object"}}])
+
+    @asynccontextmanager
+    async def fake_get_db():
+        yield mock_db
+
+    monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.get_db", fake_get_db)
+    monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.get_tool_discovery_service", lambda: discovery)
+    list_server_tools = AsyncMock()
+    monkeypatch.setattr(tool_service, "list_server_tools", list_server_tools)
+
+    token = server_id_var.set("123")
+    result = await list_tools()
+    server_id_var.reset(token)
+    assert [tool.name for tool in result] == ["search_tools"]
+    list_server_tools.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_list_tools_no_server_id(monkeypatch):
     """Test list_tools returns tools when no server_id is set."""
@@ -8007,7 +8033,7 @@ def test_normalize_jwt_payload_api_token(monkeypatch):
 
     raw = {"sub": "user@example.com", "token_use": "api", "teams": ["team-a"]}
     result = _normalize_jwt_payload(raw)
-    assert result == {"email": "user@example.com", "teams": ["team-a"], "is_admin": False, "is_authenticated": True}
+    assert result == {"email": "user@example.com", "teams": ["team-a"], "is_admin": False, "is_authenticated": True, "jti": None}
 
 
 def test_normalize_jwt_payload_session_token_admin(monkeypatch):
@@ -8017,7 +8043,7 @@ def test_normalize_jwt_payload_session_token_admin(monkeypatch):
 
     raw = {"sub": "admin@apollosai.dev", "token_use": "session", "is_admin": True}
     result = _normalize_jwt_payload(raw)
-    assert result == {"email": "admin@apollosai.dev", "teams": None, "is_admin": True, "is_authenticated": True}
+    assert result == {"email": "admin@apollosai.dev", "teams": None, "is_admin": True, "is_authenticated": True, "jti": None}
 
 
 def test_normalize_jwt_payload_session_token_non_admin(monkeypatch):
@@ -8029,7 +8055,7 @@ def test_normalize_jwt_payload_session_token_non_admin(monkeypatch):
 
     raw = {"sub": "dev@example.com", "token_use": "session"}
     result = _normalize_jwt_payload(raw)
-    assert result == {"email": "dev@example.com", "teams": ["team-x"], "is_admin": False, "is_authenticated": True}
+    assert result == {"email": "dev@example.com", "teams": ["team-x"], "is_admin": False, "is_authenticated": True, "jti": None}
 
 
 def test_normalize_jwt_payload_nested_is_admin():
@@ -8060,7 +8086,7 @@ def test_normalize_jwt_payload_session_no_email():
 
     raw = {"token_use": "session"}
     result = _normalize_jwt_payload(raw)
-    assert result == {"email": None, "teams": [], "is_admin": False, "is_authenticated": True}
+    assert result == {"email": None, "teams": [], "is_admin": False, "is_authenticated": True, "jti": None}
 
 
 # ---------------------------------------------------------------------------
@@ -8256,3 +8282,57 @@ async def test_local_affinity_post_no_injection_without_server_url(monkeypatch):
                     assert "server_id" not in posted_json.get("params", {})
 
     await wrapper.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_handle_streamable_http_rate_limited_tool_call_returns_429(monkeypatch):
+    """A rate limited tools/call gets the 429, RateLimit-* headers and JSON-RPC error that /rpc returns."""
+    # Third-Party
+    import orjson
+
+    # First-Party
+    from mcpgateway.services.tool_service import ToolRateLimitError
+    from mcpgateway.utils.rate_limiter import RateLimitResult
+
+    error = ToolRateLimitError("Rate limit exceeded for user", RateLimitResult(allowed=False, limit=10, remaining=0, retry_after=3, reset_after=6))
+
+    @asynccontextmanager
+    async def fake_get_db():
+        yield MagicMock()
+
+    monkeypatch.setattr(tr, "get_db", fake_get_db)
+    monkeypatch.setattr(tr.tool_service, "invoke_tool", AsyncMock(side_effect=error))
+
+    class DummySessionManager:
+        @asynccontextmanager
+        async def run(self):
+            yield self
+
+        async def handle_request(self, scope, receive, send_func):
+            # Like the SDK in JSON response mode: run the tool, then answer with a tool error result
+            with pytest.raises(ToolRateLimitError):
+                await tr.call_tool("mytool", {})
+            body = b'{"jsonrpc":"2.0","id":5,"result":{"content":[{"type":"text","text":"Rate limit exceeded for user"}],"isError":true}}'
+            await send_func({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]})
+            await send_func({"type": "http.response.body", "body": body})
+
+    monkeypatch.setattr(tr, "StreamableHTTPSessionManager", lambda **kwargs: DummySessionManager())
+    monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.settings.mcpgateway_session_affinity_enabled", False)
+
+    wrapper = SessionManagerWrapper()
+    await wrapper.initialize()
+    send, messages = _make_send_collector()
+    await wrapper.handle_streamable_http(_make_scope("/mcp", method="POST", headers=[]), _make_receive(b""), send)
+    await wrapper.shutdown()
+
+    start, body = messages
+    headers = dict(start["headers"])
+    assert start["status"] == 429
+    assert headers[b"retry-after"] == b"3"
+    assert headers[b"ratelimit-limit"] == b"10"
+    assert headers[b"content-length"] == str(len(body["body"])).encode()
+    assert orjson.loads(body["body"]) == {"jsonrpc": "2.0", "error": error.rpc_error(), "id": 5}
+
+
+def test_rate_limit_headers_passed_on_from_rpc_response():
+    assert tr._rate_limit_headers({"RateLimit-Remaining": "0", "X-Other": "1"}) == [(b"ratelimit-remaining", b"0")]
@@ -36,6 +36,7 @@ from mcpgateway.utils.pagination import (
     decode_cursor,
     encode_cursor,
     generate_pagination_links,
+    merge_keyset_pages,
     offset_paginate,
     paginate_query,
     parse_pagination_params,
@@ -1093,6 +1094,45 @@ class TestUnifiedPaginate:
         assert decoded["created_at"] is None
 
 
+class TestMergeKeysetPages:
+    """Tests for merging first pages of several keyset-paginated queries."""
+
+    @staticmethod
+    def _item(item_id, day):
+        return SimpleNamespace(id=item_id, created_at=datetime(2025, 1, day, tzinfo=timezone.utc))
+
+    def test_merge_orders_and_dedupes(self):
+        shared = self._item("s", 2)
+        items, cursor = merge_keyset_pages([([self._item("a", 3), shared], None), ([shared, self._item("b", 1)], None)], limit=0)
+
+        assert [i.id for i in items] == ["a", "s", "b"]
+        assert cursor is None
+
+    def test_truncates_to_limit_and_sets_cursor(self):
+        items, cursor = merge_keyset_pages([([self._item("a", 4), self._item("b", 2)], None), ([self._item("c", 3)], None)], limit=2)
+
+        assert [i.id for i in items] == ["a", "c"]
+        assert decode_cursor(cursor) == {"created_at": "2025-01-03T00:00:00+00:00", "id": "c"}
+
+    def test_source_cursor_keeps_has_more(self):
+        items, cursor = merge_keyset_pages([([self._item("a", 2)], "more"), ([], None)], limit=1)
+
+        assert [i.id for i in items] == ["a"]
+        assert decode_cursor(cursor)["id"] == "a"
+
+    def test_ties_on_created_at_break_by_id(self):
+        items, _ = merge_keyset_pages([([self._item("a", 1)], None), ([self._item("b", 1)], None)], limit=0)
+
+        assert [i.id for i in items] == ["b", "a"]
+
+    def test_missing_created_at_sorts_last(self):
+        undated = [SimpleNamespace(id="u2", created_at=None), SimpleNamespace(id="u1", created_at=None)]
+        items, cursor = merge_keyset_pages([(undated, None), ([self._item("a", 1), self._item("b", 2)], None)], limit=3)
+
+        assert [i.id for i in items] == ["b", "a", "u2"]
+        assert decode_cursor(cursor) == {"created_at": None, "id": "u2"}
+
+
 class TestParsePaginationParams:
     """Test pagination parameter parsing from requests."""
 
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests for the multi-pattern dangerous input matcher.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+import random
+import re
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils import pattern_matcher
+from mcpgateway.utils.pattern_matcher import collect_json_strings, DangerousPatternMatcher
+
+DEFAULT_PATTERNS = [r"[;&|`$(){}\[\]<>]", r"\.\.[\\/]", r"[\x00-\x1f\x7f-\x9f]"]
+
+
+def _naive(patterns, values):
+    compiled = [re.compile(p) for p in patterns]
+    return [i for i, v in enumerate(values) if any(p.search(v) for p in compiled)]
+
+
+class TestDangerousPatternMatcher:
+    @pytest.mark.parametrize(
+        "patterns",
+        [DEFAULT_PATTERNS, [r"<script", r"javascript:", r"a.b"], [r"\bdrop\b", r"^rm "], [r"(?i)select .* from"]],
+    )
+    def test_matches_per_value_semantics(self, patterns):
+        rng = random.Random(7)
+        alphabet = "abcdrm ./\\<>;$(){}\n\x00scriptjavaDROPselect from:"
+        values = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(2000)]
+        matcher = DangerousPatternMatcher(patterns, use_rust=False)
+        expected = _naive(patterns, values)
+        assert matcher.matching(values) == expected
+        assert matcher.matching(values, first_only=True) == expected[:1]
+
+    def test_backends(self):
+        assert DangerousPatternMatcher(DEFAULT_PATTERNS, use_rust=False).backend == "joined"
+        assert DangerousPatternMatcher([r"(?<=a)b"], use_rust=False).backend == "sequential"
+        assert DangerousPatternMatcher([r"x*"], use_rust=False).backend == "sequential"  # matches every separator
+
+    def test_separator_avoids_patterns(self):
+        matcher = DangerousPatternMatcher(DEFAULT_PATTERNS, use_rust=False)
+        assert matcher._separator == "\xff"
+        assert DangerousPatternMatcher([r"[\x80-\xff]"], use_rust=False)._separator == "\uffff"
+        assert matcher.matching(["a", "b", "c"]) == []
+
+    def test_cross_boundary_match_is_ignored(self):
+        matcher = DangerousPatternMatcher([r"\.\.[\\/]", r"1.2"], use_rust=False)
+        assert matcher.matching(["..", "/etc", "v1", "2"]) == []
+        assert matcher.matching(["v1", "2", "1x2"]) == [2]
+
+    def test_first_only_returns_earliest_across_patterns(self):
+        matcher = DangerousPatternMatcher([r"<", r"\.\./"], use_rust=False)
+        assert matcher.matching(["ok", "../x", "<b>"], first_only=True) == [1]
+
+    def test_rust_backend_is_used_when_available(self, monkeypatch):
+        class FakeRust:
+            def __init__(self, patterns):
+                if any("(?<" in p for p in patterns):
+                    raise ValueError("look-around not supported")
+                self.regex = re.compile("|".join(f"(?:{p})" for p in patterns))
+
+            def is_match(self, value):
+                return bool(self.regex.search(value))
+
+            def matching_indices(self, values, first_only):
+                hits = [i for i, v in enumerate(values) if self.regex.search(v)]
+                return hits[:1] if first_only else hits
+
+        fake_module = type("FakeModule", (), {"PatternMatcher": FakeRust})
+        monkeypatch.setattr(pattern_matcher, "_RUST_AVAILABLE", True)
+        monkeypatch.setattr(pattern_matcher, "_rust_matcher", fake_module)
+
+        matcher = DangerousPatternMatcher(DEFAULT_PATTERNS)
+        assert matcher.backend == "rust"
+        assert matcher.search("$(id)") and not matcher.search("ok")
+        assert matcher.matching(["ok", "$(id)", "../x"]) == [1, 2]
+
+        assert DangerousPatternMatcher([r"(?<=a)b"]).backend == "sequential"  # unsupported by the regex crate
+        assert DangerousPatternMatcher([r"rm$"]).backend == "sequential"  # "$" differs before a trailing newline
+
+
+class TestCollectJsonStrings:
+    def test_document_order_and_list_strings(self):
+        data = {"a": "1", "b": [{"c": "2"}, "not-collected", [{"d": "3"}]], "e": {"f": "4"}, "g": None}
+        assert collect_json_strings(data, max_depth=10) == (["a", "c", "d", "f"], ["1", "2", "3", "4"], False)
+
+    def test_depth_budget(self):
+        data = current = {}
+        for _ in range(100):
+            current["x"] = {}
+            current = current["x"]
+        assert collect_json_strings(data, max_depth=64)[2] is True
+        assert collect_json_strings(data, max_depth=101)[2] is False
+
+    def test_deep_documents_stop_at_budget(self):
+        data = current = {"a": "1"}
+        for _ in range(5000):
+            current["x"] = [{"b": "2"}]
+            current = current["x"][0]
+        assert collect_json_strings(data, max_depth=100) == (["a"] + ["b"] * 49, ["1"] + ["2"] * 49, True)  # dicts at depths 3, 5, ..., 99
+
+    def test_scalars(self):
+        assert collect_json_strings("text", max_depth=1) == ([], [], False)
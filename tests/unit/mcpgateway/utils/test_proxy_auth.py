@@ -400,6 +400,7 @@ class TestWebSocketAuthentication:
         # Create mock WebSocket
         websocket = AsyncMock(spec=WebSocket)
         token = jwt.encode({"sub": "test-user"}, TEST_JWT_SECRET, algorithm="HS256")
+        websocket.scope = {"type": "websocket", "path": "/ws", "headers": []}
         websocket.query_params = {"token": token}
         websocket.headers = {}
         websocket.accept = AsyncMock()
@@ -411,8 +412,11 @@ class TestWebSocketAuthentication:
             mock_settings.auth_required = True
             mock_settings.port = 8000
 
-            # Mock verify_jwt_token to succeed
-            with patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "test-user"})):
+            # Mock verify_jwt_token and the /rpc auth dependency to succeed
+            with (
+                patch("mcpgateway.main.verify_jwt_token", new=AsyncMock(return_value={"sub": "test-user"})),
+                patch("mcpgateway.main.get_current_user_with_permissions", new=AsyncMock(return_value={"email": "test-user"})),
+            ):
                 # First-Party
                 from mcpgateway.main import websocket_endpoint
 
@@ -436,13 +440,17 @@ class TestWebSocketAuthentication:
 
         # Create mock WebSocket
         websocket = AsyncMock(spec=WebSocket)
+        websocket.scope = {"type": "websocket", "path": "/ws", "headers": [(b"x-authenticated-user", b"proxy-user")]}
         websocket.query_params = {}
         websocket.headers = {"X-Authenticated-User": "proxy-user"}
         websocket.accept = AsyncMock()
         websocket.receive_text = AsyncMock(side_effect=Exception("Test complete"))
 
-        # Mock settings for proxy auth
-        with patch("mcpgateway.main.settings") as mock_settings:
+        # Mock settings for proxy auth and the /rpc auth dependency resolving the proxy user
+        with (
+            patch("mcpgateway.main.settings") as mock_settings,
+            patch("mcpgateway.main.get_current_user_with_permissions", new=AsyncMock(return_value={"email": "proxy-user"})),
+        ):
             mock_settings.mcp_client_auth_enabled = False
             mock_settings.trust_proxy_auth = True
             mock_settings.proxy_user_header = "X-Authenticated-User"
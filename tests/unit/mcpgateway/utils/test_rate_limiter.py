@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/utils/test_rate_limiter.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for the GCRA rate limiter.
+"""
+
+# Standard
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.rate_limiter import gcra, GCRA_SCRIPT, RateLimiter
+
+
+class RedisStandIn:
+    """Local stand-in for Redis that runs GCRA_SCRIPT's logic on its own clock.
+
+    Like Redis, it serializes script executions and keeps one value per key,
+    so several RateLimiter instances (one per worker) share its buckets.
+    """
+
+    def __init__(self):
+        self.now_ms = 1_000_000.0
+        self.store = {}
+        self.calls = []
+        self.registered = 0
+
+    def register_script(self, script):
+        assert script == GCRA_SCRIPT
+        self.registered += 1
+        return self.run_script
+
+    async def run_script(self, keys, args):
+        self.calls.append(keys)
+        cost = args[0]
+        steps = [gcra(self.store.get(key), self.now_ms, args[1 + 2 * i], args[2 + 2 * i], cost) for i, key in enumerate(keys)]
+        if all(step[0] for step in steps):
+            for key, step in zip(keys, steps):
+                self.store[key] = step[1]
+        # Redis returns integers from Lua scripts
+        return [[int(allowed), remaining, int(-(-retry_after // 1)), int(-(-reset_after // 1))] for allowed, _, remaining, retry_after, reset_after in steps]
+
+
+def _worker(redis):
+    limiter = RateLimiter(prefix="test:")
+    limiter._get_redis_client = AsyncMock(return_value=redis)
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_redis_buckets_are_shared_across_workers():
+    redis = RedisStandIn()
+    workers = [_worker(redis) for _ in range(4)]
+
+    results = [await workers[i % 4].hit("user:alice", limit=10, period=60) for i in range(12)]
+
+    assert [r.allowed for r in results] == [True] * 10 + [False] * 2
+    assert results[9].remaining == 0
+    assert results[10].retry_after == pytest.approx(6.0)
+    assert redis.calls[0] == ["test:user:alice"]
+    # Each worker sends the script once, then runs it by SHA
+    assert redis.registered == 4
+
+
+@pytest.mark.asyncio
+async def test_redis_refills_evenly():
+    redis = RedisStandIn()
+    limiter = _worker(redis)
+    for _ in range(10):
+        assert (await limiter.hit("k", limit=10, period=60)).allowed
+
+    redis.now_ms += 6_000  # one emission interval
+    assert (await limiter.hit("k", limit=10, period=60)).allowed
+    assert not (await limiter.hit("k", limit=10, period=60)).allowed
+
+
+@pytest.mark.asyncio
+async def test_no_double_burst_at_window_boundary():
+    """A fixed window would allow 2x the limit across a boundary; GCRA does not."""
+    limiter = RateLimiter(use_redis=False)
+    with patch("mcpgateway.utils.rate_limiter.time.time", return_value=59.9):
+        first = [(await limiter.hit("k", limit=10, period=60)).allowed for _ in range(10)]
+    with patch("mcpgateway.utils.rate_limiter.time.time", return_value=60.1):
+        second = [(await limiter.hit("k", limit=10, period=60)).allowed for _ in range(10)]
+
+    assert all(first)
+    assert sum(second) == 0
+
+
+@pytest.mark.asyncio
+async def test_burst_smaller_than_limit():
+    limiter = RateLimiter(use_redis=False)
+    results = [(await limiter.hit("k", limit=60, period=60, burst=2)).allowed for _ in range(3)]
+    assert results == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_redis_error_falls_back_to_local_bucket():
+    script = AsyncMock(side_effect=ConnectionError("down"))
+    redis = Mock()
+    redis.register_script.return_value = script
+    limiter = _worker(redis)
+
+    results = [(await limiter.hit("k", limit=2, period=1)).allowed for _ in range(3)]
+
+    assert results == [True, True, False]
+    assert script.await_count == 3
+    redis.register_script.assert_called_once_with(GCRA_SCRIPT)
+
+
+@pytest.mark.parametrize("use_redis", [True, False])
+@pytest.mark.asyncio
+async def test_rejected_request_charges_no_bucket(use_redis):
+    limiter = _worker(RedisStandIn()) if use_redis else RateLimiter(use_redis=False)
+    buckets = [("user:alice", 10, 60), ("team:t1", 20, 60), ("tool:search", 2, 60)]
+
+    results = [await limiter.hit_many(buckets) for _ in range(5)]
+
+    assert [all(r.allowed for r in result) for result in results] == [True, True, False, False, False]
+    assert [r.allowed for r in results[2]] == [True, True, False]
+    # Only the two allowed calls were counted by the user and team buckets
+    assert (await limiter.hit("user:alice", limit=10, period=60)).remaining == 7
+    assert (await limiter.hit("team:t1", limit=20, period=60)).remaining == 17
+
+
+@pytest.fixture
+def lua_redis():
+    """Async fake Redis that runs Lua scripts, so GCRA_SCRIPT itself is exercised."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.mark.asyncio
+async def test_gcra_script_runs_by_sha_and_matches_gcra(lua_redis):
+    limiter = _worker(lua_redis)
+
+    results = [await limiter.hit("user:alice", limit=3, period=60) for _ in range(4)]
+
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert [r.remaining for r in results] == [2, 1, 0, 0]
+    assert results[3].retry_after == pytest.approx(20.0, abs=0.01)
+    assert results[3].reset_after == pytest.approx(60.0, abs=0.01)
+    # The script is cached on the server and the bucket expires once it is full again
+    assert await lua_redis.script_exists(limiter._script.sha) == [True]
+    assert 59_000 < await lua_redis.pttl("test:user:alice") <= 60_000
+
+
+@pytest.mark.asyncio
+async def test_gcra_script_hit_many_is_all_or_nothing(lua_redis):
+    limiter = _worker(lua_redis)
+    buckets = [("user:alice", 10, 60), ("team:t1", 20, 60), ("tool:search", 2, 60)]
+
+    results = [await limiter.hit_many(buckets) for _ in range(4)]
+
+    assert [[r.allowed for r in result] for result in results] == [[True, True, True]] * 2 + [[True, True, False]] * 2
+    # Rejected calls left every bucket untouched
+    assert [r.remaining for r in await limiter.hit_many(buckets[:2])] == [7, 17]
+
+
+@pytest.mark.asyncio
+async def test_gcra_script_reloads_after_script_flush(lua_redis):
+    limiter = _worker(lua_redis)
+    await limiter.hit("k", limit=5, period=60)
+
+    await lua_redis.script_flush()
+
+    assert (await limiter.hit("k", limit=5, period=60)).remaining == 3
+
+
+@pytest.mark.asyncio
+async def test_local_buckets_are_pruned():
+    limiter = RateLimiter(use_redis=False, max_local_keys=2)
+    with patch("mcpgateway.utils.rate_limiter.time.time", return_value=0):
+        await limiter.hit("a", limit=1, period=1)
+        await limiter.hit("b", limit=1, period=1)
+    with patch("mcpgateway.utils.rate_limiter.time.time", return_value=10):
+        await limiter.hit("c", limit=1, period=1)
+
+    assert set(limiter._local) == {"c"}
+
+
+def test_concurrent_local_hits_do_not_oversubscribe():
+    limiter = RateLimiter(use_redis=False)
+
+    async def run():
+        return await asyncio.gather(*(limiter.hit("k", limit=5, period=60) for _ in range(20)))
+
+    assert sum(r.allowed for r in asyncio.run(run())) == 5
+
+
+def _shared_worker_hits(path, count):
+    limiter = RateLimiter(use_redis=False, shared_path=path)
+
+    async def run():
+        return [(await limiter.hit("user:alice", limit=10, period=60)).allowed for _ in range(count)]
+
+    return sum(asyncio.run(run()))
+
+
+def test_shared_file_buckets_are_shared_across_processes(tmp_path):
+    # Standard
+    import multiprocessing
+
+    path = str(tmp_path / "buckets")
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        allowed = pool.starmap(_shared_worker_hits, [(path, 5)] * 4)
+
+    # 4 workers x 5 calls against one 10/min bucket: only 10 get through in total
+    assert sum(allowed) == 10
+
+
+@pytest.mark.asyncio
+async def test_shared_file_rejected_request_charges_no_bucket(tmp_path):
+    limiter = RateLimiter(use_redis=False, shared_path=str(tmp_path / "buckets"))
+    buckets = [("user:alice", 10, 60), ("tool:search", 1, 60)]
+
+    assert all(r.allowed for r in await limiter.hit_many(buckets))
+    assert [r.allowed for r in await limiter.hit_many(buckets)] == [True, False]
+    assert (await limiter.hit("user:alice", limit=10, period=60)).remaining == 8
+    assert limiter._local == {}
+
+
+def test_shared_file_reuses_expired_slots(tmp_path):
+    # Standard
+    from mcpgateway.utils.rate_limiter import SharedBuckets
+
+    buckets = SharedBuckets(str(tmp_path / "buckets"), slots=4)
+    try:
+        # More keys than slots: buckets that have expired make room for new ones
+        for i in range(10):
+            assert buckets.hit([(f"k{i}", 1000.0, 1000.0)], 1, now=i * 2000.0)[0][0]
+        # A live bucket keeps its state
+        assert buckets.hit([("k9", 1000.0, 1000.0)], 1, now=18_000.0)[0][0] is False
+    finally:
+        buckets.close()
+
+
+def test_shared_file_new_keys_on_one_slot_keep_separate_buckets(tmp_path):
+    # Standard
+    from mcpgateway.utils.rate_limiter import SharedBuckets
+
+    buckets = SharedBuckets(str(tmp_path / "buckets"), slots=64)
+    try:
+        # Two new keys whose probes start at the same (empty) slot, charged in one call
+        first = "user:k0"
+        start = buckets._key_hash(first) % 64
+        second = next(f"tool:k{i}" for i in range(10_000) if buckets._key_hash(f"tool:k{i}") % 64 == start)
+        assert all(step[0] for step in buckets.hit([(first, 1000.0, 1000.0), (second, 1000.0, 1000.0)], 1, now=0))
+
+        # Neither write replaced the other: both buckets are full
+        assert buckets.hit([(first, 1000.0, 1000.0)], 1, now=0)[0][0] is False
+        assert buckets.hit([(second, 1000.0, 1000.0)], 1, now=0)[0][0] is False
+    finally:
+        buckets.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_file_lock_wait_yields_to_event_loop(tmp_path):
+    # Standard
+    import fcntl
+    import os
+    import threading
+
+    path = str(tmp_path / "buckets")
+    limiter = RateLimiter(use_redis=False, shared_path=path)
+    order = []
+
+    # Another worker holds the file lock (released by a timer as well, so a blocking wait cannot hang the test)
+    fd = os.open(path, os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    timer = threading.Timer(2, fcntl.flock, (fd, fcntl.LOCK_UN))
+    timer.start()
+
+    async def check():
+        result = await limiter.hit("k", limit=1, period=60)
+        order.append("hit")
+        return result
+
+    async def release():
+        await asyncio.sleep(0.05)
+        order.append("released")
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+    try:
+        result, _ = await asyncio.gather(check(), release())
+    finally:
+        timer.cancel()
+        os.close(fd)
+
+    assert result.allowed
+    assert order == ["released", "hit"]
+
+
+def test_shared_file_unavailable_falls_back_to_process_buckets(tmp_path):
+    limiter = RateLimiter(use_redis=False, shared_path=str(tmp_path / "missing" / "buckets"))
+
+    assert limiter._shared is None
+    assert [asyncio.run(limiter.hit("k", limit=1, period=60)).allowed for _ in range(2)] == [True, False]
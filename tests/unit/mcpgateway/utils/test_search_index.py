@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Tests for the full-text search index.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Standard
+from unittest.mock import MagicMock
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+# First-Party
+from mcpgateway.admin import _apply_entity_search, _like_contains
+from mcpgateway.db import Base, Gateway, Server, Tool
+from mcpgateway.services.server_service import ServerService
+from mcpgateway.utils import search_index
+from mcpgateway.utils.search_index import apply_search_filter, create_search_index, drop_search_index, indexed_tables, rebuild_search_index, search_match
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite database with the full schema and search index."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        create_search_index(conn)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+def _server(name: str, description: str = "", tags=None) -> Server:
+    return Server(name=name, description=description, tags=tags or [], visibility="public")
+
+
+def _names(db, model, q: str) -> set:
+    return set(db.execute(apply_search_filter(db, select(model.name), model, q)).scalars())
+
+
+class TestQueryParsing:
+    def test_terms_ignore_punctuation_and_wildcards(self):
+        assert search_index.match_terms('get_weather "OR" %_*') == ["get", "weather", "or"]
+        assert search_index.sqlite_match_expression("weather OR") == '"weather"* "or"*'
+        assert search_index.postgres_tsquery("a & b | !c") == "a:* & b:* & c:*"
+
+    def test_terms_are_capped(self):
+        assert len(search_index.match_terms(" ".join(f"t{i}" for i in range(40)))) == 16
+
+
+class TestSqliteIndex:
+    def test_index_is_detected(self, db):
+        assert indexed_tables(db) == frozenset(search_index.SEARCH_INDEX_SPECS)
+
+    def test_prefix_match_on_name_description_and_tags(self, db):
+        db.add_all([_server("weather-hub", "forecast data"), _server("stocks", "market quotes", tags=["finance", {"id": "x", "label": "Trading"}]), _server("misc")])
+        db.commit()
+
+        assert _names(db, Server, "weath") == {"weather-hub"}
+        assert _names(db, Server, "FORE") == {"weather-hub"}
+        assert _names(db, Server, "trad fin") == {"stocks"}
+        assert _names(db, Server, "weather stocks") == set()  # every term must match
+
+    def test_index_follows_update_and_delete(self, db):
+        server = _server("alpha", "first")
+        db.add(server)
+        db.commit()
+
+        server.description = "renamed"
+        db.commit()
+        assert _names(db, Server, "first") == set()
+        assert _names(db, Server, "renamed") == {"alpha"}
+
+        db.delete(server)
+        db.commit()
+        assert db.execute(select(func.count()).select_from(search_match(db, "servers", "alpha"))).scalar() == 0
+
+    def test_invalid_tags_do_not_fail_writes(self, db, engine):
+        db.add(_server("bad-tags"))
+        db.commit()
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE servers SET tags = 'not json' WHERE name = 'bad-tags'")
+        assert _names(db, Server, "bad") == {"bad-tags"}
+
+    def test_create_backfills_existing_rows(self, engine, db):
+        db.add(Gateway(name="remote", slug="remote", url="http://weather.example.com/mcp", capabilities={}, transport="SSE"))
+        db.commit()
+        with engine.begin() as conn:
+            drop_search_index(conn)
+        assert "gateways" not in indexed_tables(db)
+
+        with engine.begin() as conn:
+            create_search_index(conn)
+        assert _names(db, Gateway, "weather") == {"remote"}
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM gateways_fts")
+            rebuild_search_index(conn, "gateways")
+        assert _names(db, Gateway, "remote") == {"remote"}
+
+    def test_bm25_ranks_name_matches_first(self, db):
+        db.add_all([_server("other", "mentions weather in passing"), _server("weather")])
+        db.commit()
+        match = search_match(db, "servers", "weather")
+        ranked = db.execute(select(Server.name).join(match, match.c.id == Server.id).order_by(match.c.rank)).scalars().all()
+        assert ranked == ["weather", "other"]
+
+
+class TestFallback:
+    def test_like_fallback_without_index(self, engine, db):
+        with engine.begin() as conn:
+            drop_search_index(conn)
+        db.add(_server("get_weather", "50% off"))
+        db.commit()
+
+        assert search_match(db, "servers", "weather") is None
+        assert _names(db, Server, "t_wea") == {"get_weather"}  # substring, wildcards escaped
+        assert _names(db, Server, "%") == {"get_weather"}
+        assert _names(db, Server, "x%") == set()
+
+    def test_unsupported_dialect_has_no_index(self):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "mysql"
+        assert indexed_tables(db) == frozenset()
+        db.execute.assert_not_called()
+
+    def test_blank_query_is_noop(self, db):
+        query = select(Server.id)
+        assert apply_search_filter(db, query, Server, "  ") is query
+
+
+class TestCallers:
+    def test_admin_search_ranks_exact_id_then_relevance(self, db):
+        servers = [_server("weather"), _server("misc", "weather tools"), _server("zzz")]
+        db.add_all(servers)
+        db.commit()
+        target = servers[2].id
+
+        def run(q):
+            query = select(Server.name)
+            query = _apply_entity_search(
+                query,
+                db,
+                Server,
+                q,
+                like_conditions=[_like_contains(func.lower(Server.name), q)],
+                prefix_columns=[func.lower(Server.name)],
+                name_column=func.lower(Server.name),
+            )
+            return db.execute(query).scalars().all()
+
+        assert run("weather") == ["weather", "misc"]
+        assert run(target.lower()) == ["zzz"]
+
+    def test_admin_search_uses_tool_index(self, db):
+        db.add(Tool(original_name="get_forecast", display_name="Get Forecast", url="http://x", description="weather", input_schema={}, visibility="public"))
+        db.commit()
+        query = _apply_entity_search(select(Tool.original_name), db, Tool, "forec", like_conditions=[], prefix_columns=[], name_column=func.lower(Tool.original_name))
+        assert db.execute(query).scalars().all() == ["get_forecast"]
+
+    async def test_list_servers_search_bypasses_cache(self, db, monkeypatch):
+        db.add_all([_server("weather-hub"), _server("stocks")])
+        db.commit()
+
+        class NoCache:
+            def hash_filters(self, **kwargs):
+                raise AssertionError("search results must not be cached")
+
+        monkeypatch.setattr("mcpgateway.services.server_service._get_registry_cache", NoCache)
+        servers, _ = await ServerService().list_servers(db, search="weath", token_teams=[])
+        assert [s.name for s in servers] == ["weather-hub"]
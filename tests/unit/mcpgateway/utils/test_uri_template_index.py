@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Tests for the URI template trie used by ResourceService.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.services.resource_service import ResourceService
+from mcpgateway.utils.uri_template_index import UriTemplateIndex
+
+TEMPLATES = [
+    "file:///logs/{date}",
+    "file:///logs/{date}/{level}",
+    "file:///{path*}",
+    "files://root/{path*}/meta/{id}{?expand,debug}",
+    "db://users/{id}",
+    "db://users/{id}/orders/{order}",
+    "db://users/{id}.json",
+    "db://{table}/{id}",
+    "weather://{city}/current",
+    "{scheme}://static/page",
+    "mem://{a}-{b}/x",
+]
+
+URIS = [
+    "file:///logs/2025-01-01",
+    "file:///logs/2025-01-01/error",
+    "file:///logs/",
+    "file:///etc/hosts",
+    "files://root/a/b/meta/7?expand=1",
+    "files://root/meta/7",
+    "db://users/42",
+    "db://users/42/orders/9",
+    "db://users/42.json",
+    "db://orders/1",
+    "db://users/",
+    "weather://paris/current",
+    "weather://paris/forecast",
+    "https://static/page",
+    "mem://1-2/x",
+    "mem://12/x",
+    "nothing://here",
+]
+
+
+class TestUriTemplateIndex:
+    """Matching, specificity and incremental maintenance."""
+
+    @pytest.mark.parametrize("uri", URIS)
+    def test_matches_same_uris_as_regex(self, uri):
+        index = UriTemplateIndex()
+        for template in TEMPLATES:
+            index.add(template, template, template)
+
+        found = index.match(uri)
+        regex_matches = {t for t in TEMPLATES if ResourceService._build_regex(t).match(uri.partition("?")[0])}
+
+        if regex_matches:
+            assert found in regex_matches
+        else:
+            assert found is None
+
+    def test_literal_beats_parameter_beats_wildcard(self):
+        index = UriTemplateIndex()
+        index.add("wild", "db://{rest*}", "wild")
+        index.add("param", "db://{table}/{id}", "param")
+        index.add("literal", "db://users/{id}", "literal")
+
+        assert index.match("db://users/1") == "literal"
+        assert index.match("db://orders/1") == "param"
+        assert index.match("db://orders/1/2") == "wild"
+
+    def test_backtracks_when_literal_branch_dead_ends(self):
+        index = UriTemplateIndex()
+        index.add("deep", "db://users/{id}/orders", "deep")
+        index.add("generic", "db://{table}/{id}/items", "generic")
+
+        assert index.match("db://users/1/items") == "generic"
+
+    def test_ties_keep_insertion_order(self):
+        index = UriTemplateIndex()
+        index.add("first", "x://{a}", "first")
+        index.add("second", "x://{b}", "second")
+
+        assert index.match("x://v") == "first"
+        index.remove("first")
+        assert index.match("x://v") == "second"
+
+    def test_add_replaces_and_remove_prunes(self):
+        index = UriTemplateIndex()
+        index.add("k", "a://one/{x}", "v1")
+        index.add("k", "a://two/{x}", "v2")
+
+        assert len(index) == 1
+        assert index.match("a://one/1") is None
+        assert index.match("a://two/1") == "v2"
+
+        assert index.remove("k") is True
+        assert index.remove("k") is False
+        assert index._root.is_empty()
+
+    def test_remove_wildcard_prunes(self):
+        index = UriTemplateIndex()
+        index.add("w", "a://b/{rest*}", "w")
+        index.remove("w")
+        assert index._root.is_empty()
+
+    def test_clear_resets_loaded(self):
+        index = UriTemplateIndex()
+        index.add("k", "a://{x}", "v")
+        index.loaded = True
+
+        index.clear()
+
+        assert len(index) == 0
+        assert index.loaded is False
+        assert index.match("a://1") is None
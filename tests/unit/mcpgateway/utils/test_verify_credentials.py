@@ -716,6 +716,68 @@ async def test_verify_jwt_token_cached_different_tokens(monkeypatch):
     assert request.state._jwt_verified_payload[0] == token2
 
 
+@pytest.mark.asyncio
+async def test_verify_jwt_token_cached_reuses_payload_across_requests(monkeypatch):
+    """A second request with the same token skips signature verification."""
+    # First-Party
+    from mcpgateway.cache.jwt_verify_cache import JWTVerifyCache
+
+    monkeypatch.setattr(vc, "jwt_verify_cache", JWTVerifyCache(ttl=60, max_size=100, enabled=True))
+    verify = AsyncMock(return_value={"sub": "cross_request", "jti": "jti-1"})
+    monkeypatch.setattr(vc, "verify_jwt_token", verify)
+
+    first = await vc.verify_jwt_token_cached("tok", None)
+    second = await vc.verify_jwt_token_cached("tok", None)
+
+    assert first == second == {"sub": "cross_request", "jti": "jti-1"}
+    verify.assert_awaited_once()
+    # Callers get copies, so mutating one cannot poison the cache
+    second["sub"] = "mutated"
+    assert (await vc.verify_jwt_token_cached("tok", None))["sub"] == "cross_request"
+
+
+@pytest.mark.asyncio
+async def test_verify_jwt_token_cached_rechecks_after_revocation(monkeypatch):
+    """Revoking the JTI evicts the cached payload."""
+    # First-Party
+    from mcpgateway.cache.auth_cache import AuthCache
+    from mcpgateway.cache.jwt_verify_cache import JWTVerifyCache
+
+    cache = JWTVerifyCache(ttl=60, max_size=100, enabled=True)
+    monkeypatch.setattr(vc, "jwt_verify_cache", cache)
+    monkeypatch.setattr("mcpgateway.cache.auth_cache.jwt_verify_cache", cache)
+    verify = AsyncMock(return_value={"sub": "revoked_user", "jti": "jti-revoked"})
+    monkeypatch.setattr(vc, "verify_jwt_token", verify)
+
+    await vc.verify_jwt_token_cached("tok", None)
+    auth_cache = AuthCache(enabled=True)
+    auth_cache._redis_checked = True
+    auth_cache._redis_available = False
+    await auth_cache.invalidate_revocation("jti-revoked")
+    await vc.verify_jwt_token_cached("tok", None)
+
+    assert verify.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_jwt_token_cached_does_not_cache_failures(monkeypatch):
+    """Rejected tokens are verified again on every call."""
+    # First-Party
+    from mcpgateway.cache.jwt_verify_cache import JWTVerifyCache
+
+    cache = JWTVerifyCache(ttl=60, max_size=100, enabled=True)
+    monkeypatch.setattr(vc, "jwt_verify_cache", cache)
+    verify = AsyncMock(side_effect=HTTPException(status_code=401, detail="Invalid token"))
+    monkeypatch.setattr(vc, "verify_jwt_token", verify)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await vc.verify_jwt_token_cached("bad", None)
+
+    assert verify.await_count == 2
+    assert cache.stats()["size"] == 0
+
+
 # ---------------------------------------------------------------------------
 # JTI (JWT ID) validation tests
 # ---------------------------------------------------------------------------
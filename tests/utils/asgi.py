@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/utils/asgi.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Helpers for testing raw ASGI middleware.
+
+``dispatch`` drives a raw ASGI middleware the way tests used to drive
+``BaseHTTPMiddleware.dispatch(request, call_next)``: the downstream app awaits
+``call_next`` and streams the response it returns, and everything the
+middleware sends is collected back into a ``Response``.
+"""
+
+# Standard
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Third-Party
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+async def dispatch(middleware: Any, request: Request, call_next: Callable[[Request], Awaitable[Any]]) -> Any:
+    """Run ``middleware`` for ``request`` with ``call_next`` as the downstream app.
+
+    ``call_next`` receives ``request`` itself when the middleware forwards the
+    original scope and receive callable, otherwise a new ``Request`` built from
+    what the middleware passed on.
+
+    Args:
+        middleware: Raw ASGI middleware instance (its ``app`` is replaced).
+        request: Incoming request.
+        call_next: Downstream handler returning a response.
+
+    Returns:
+        Any: The response sent by the middleware, rebuilt as a ``Response``; or
+        whatever ``call_next`` returned when it is not a ``Response`` and the
+        middleware sent nothing itself.
+    """
+    returned: Dict[str, Any] = {}
+
+    async def app(scope, receive, send):
+        downstream = request if scope is request.scope and receive is request.receive else Request(scope, receive)
+        response = await call_next(downstream)
+        returned["response"] = response
+        if isinstance(response, Response):
+            await response(scope, receive, send)
+
+    messages: List[dict] = []
+
+    async def send(message):
+        messages.append(message)
+
+    middleware.app = app
+    await middleware(request.scope, request.receive, send)
+
+    start = next((message for message in messages if message["type"] == "http.response.start"), None)
+    if start is None:
+        return returned.get("response")
+    response = Response(status_code=start["status"])
+    response.raw_headers = list(start.get("headers", []))
+    response.body = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+    return response